@@ -96,4 +96,8 @@ def main() -> None:
 
 
 if __name__ == "__main__":
+    import multiprocessing
+
+    # Frozen builds re-run this entry point in GML transpile worker processes.
+    multiprocessing.freeze_support()
     main()
@@ -11,12 +11,11 @@ import threading
 from contextlib import redirect_stdout
 from dataclasses import dataclass, replace
 from types import FrameType
-from typing import Sequence, TypedDict, cast
+from typing import TYPE_CHECKING, Sequence, TypedDict, cast
 
 from src.conversion.anchored_artifacts import ArtifactSpec, ByteArtifactTransaction
 from src.conversion.conversion_outcome import ConversionOutcome
-from src.conversion.converter import CONVERSION_CATEGORIES, Converter
-from src.conversion.conversion_manifest import CONVERSION_MANIFEST_RELATIVE_PATH
+from src.conversion.conversion_plan import CONVERSION_CATEGORIES
 from src.conversion.diagnostics import (
     ConversionDiagnosticReportPublicationReceipt,
     ConversionDiagnosticReportSnapshot,
@@ -26,24 +25,31 @@ from src.conversion.diagnostics import (
     capture_conversion_diagnostic_reports,
     restore_conversion_diagnostic_reports,
 )
-from src.conversion.gml_transpiler import (
+from src.conversion.gml_runtime_parts.manifest import RUNTIME_PROFILES
+from src.conversion.gml_transpiler_parts.gml_api_manifest import (
     generate_gml_api_compatibility_report,
-    render_gml_manual_scope_markdown,
 )
-from src.conversion.godot_validation import (
-    validate_generated_godot_project,
-    write_godot_validation_report,
+from src.conversion.gml_transpiler_parts.gml_manual_scope import (
+    render_gml_manual_scope_markdown,
 )
 from src.conversion.platform_capabilities import (
     generate_platform_capability_report,
     render_platform_capability_markdown,
 )
-from src.conversion.project_godot import (
-    MANAGED_OUTPUT_DIRECTORIES,
-    ConversionPreflightError,
-)
 from src.version import get_version
 
+if TYPE_CHECKING:
+    from src.conversion.conversion_manifest import CONVERSION_MANIFEST_RELATIVE_PATH
+    from src.conversion.converter import Converter
+    from src.conversion.godot_validation import (
+        validate_generated_godot_project,
+        write_godot_validation_report,
+    )
+    from src.conversion.project_godot import (
+        MANAGED_OUTPUT_DIRECTORIES,
+        ConversionPreflightError,
+    )
+
 
 DEFAULT_CONVERSION_GROUPS = ("assets", "project", "wip")
 _NON_CONVERTER_SETTING_KEYS = frozenset({"sound_group_folders"})
@@ -63,6 +69,38 @@ class ConverterInventory(TypedDict):
     converter_keys: list[str]
 
 
+# Converters, the transpiler, the runtime, and Godot validation are imported by
+# the subcommands that use them, so list-converters, report, and analyze start
+# without loading them. tests/test_cli_import_budget.py enforces the split.
+_LAZY_IMPORTS: dict[str, str] = {
+    "CONVERSION_MANIFEST_RELATIVE_PATH": "src.conversion.conversion_manifest",
+    "ConversionPreflightError": "src.conversion.project_godot",
+    "Converter": "src.conversion.converter",
+    "MANAGED_OUTPUT_DIRECTORIES": "src.conversion.project_godot",
+    "validate_generated_godot_project": "src.conversion.godot_validation",
+    "write_godot_validation_report": "src.conversion.godot_validation",
+}
+
+
+def __getattr__(name: str) -> object:
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    # ``__import__`` rather than importlib.import_module so -X importtime
+    # attributes the load to the subcommand.
+    value = getattr(__import__(module_name, fromlist=(name,)), name)
+    globals()[name] = value
+    return value
+
+
+def _import_lazy(*names: str) -> None:
+    """Bind lazily imported names, keeping any binding already present."""
+    module_globals = globals()
+    for name in names:
+        if name not in module_globals:
+            __getattr__(name)
+
+
 @dataclass(frozen=True)
 class CLISetting:
     value: bool
@@ -190,6 +228,61 @@ def _build_parser() -> argparse.ArgumentParser:
         action="store_true",
         help="Group converted sounds by GameMaker audio group folders.",
     )
+    convert_parser.add_argument(
+        "--transpile-cache-dir",
+        default=None,
+        help=(
+            "Directory for a persistent GML transpile cache reused by later "
+            "conversions. Default: no cache."
+        ),
+    )
+    convert_parser.add_argument(
+        "--system-font-index",
+        default=None,
+        help=(
+            "File to save the system font index to and reuse in later "
+            "conversions while the font folders are unchanged. Default: the "
+            "index is rebuilt in memory."
+        ),
+    )
+    convert_parser.add_argument(
+        "--reuse-file-digests",
+        action="store_true",
+        help=(
+            "Reuse the digest of a generated file whose size, timestamps, and "
+            "inode are unchanged instead of rereading it when recording the "
+            "output inventory. A file rewritten within the filesystem "
+            "timestamp granularity can then go unnoticed. Default: every file "
+            "is reread."
+        ),
+    )
+    convert_parser.add_argument(
+        "--incremental",
+        action="store_true",
+        help=(
+            "Skip converter steps whose GameMaker sources are unchanged since "
+            "the previous incremental conversion and keep their output. A "
+            "step with any changed source reconverts all of its resources."
+        ),
+    )
+    convert_parser.add_argument(
+        "--runtime-profile",
+        choices=RUNTIME_PROFILES,
+        default="full",
+        help=(
+            "GML runtime to emit: 'full' writes every runtime helper, "
+            "'minimal' keeps only helpers the generated project references. "
+            "Default: full."
+        ),
+    )
+    convert_parser.add_argument(
+        "--normalize-sprite-png",
+        action="store_true",
+        help=(
+            "Re-encode every sprite frame through Pillow instead of copying "
+            "single-layer PNG frames unchanged."
+        ),
+    )
     convert_parser.add_argument(
         "--allow-partial",
         action="store_true",
@@ -267,6 +360,7 @@ def _add_threshold_args(parser: argparse.ArgumentParser) -> None:
 
 
 def _run_convert(args: argparse.Namespace) -> int:
+    _import_lazy("Converter", "ConversionPreflightError")
     logs: list[str] = []
     running = threading.Event()
     running.set()
@@ -358,6 +452,12 @@ def _run_convert(args: argparse.Namespace) -> int:
                 if managed_report_relative is not None
                 else None
             ),
+            transpile_cache_dir=args.transpile_cache_dir,
+            system_font_index_path=args.system_font_index,
+            reuse_file_digests=args.reuse_file_digests,
+            incremental=args.incremental,
+            normalize_sprite_png=args.normalize_sprite_png,
+            runtime_profile=args.runtime_profile,
         )
         transactional_conversion = bool(
             getattr(converter, "managed_output_transactional", False)
@@ -941,6 +1041,7 @@ def _managed_report_relative_path(
     report_dir: str | None,
     godot_project_path: str,
 ) -> str | None:
+    _import_lazy("MANAGED_OUTPUT_DIRECTORIES")
     if report_dir is None:
         return None
     project_root = os.path.realpath(os.path.abspath(godot_project_path))
@@ -1005,6 +1106,7 @@ def _resolved_path_key(path: str) -> str:
 
 
 def _regular_conversion_manifest_exists(godot_project_path: str) -> bool:
+    _import_lazy("CONVERSION_MANIFEST_RELATIVE_PATH")
     manifest_path = os.path.join(
         godot_project_path,
         CONVERSION_MANIFEST_RELATIVE_PATH,
@@ -1141,6 +1243,7 @@ def _add_godot_validation_diagnostic(
     *,
     boot_frames: int = 0,
 ) -> None:
+    _import_lazy("validate_generated_godot_project", "write_godot_validation_report")
     report = validate_generated_godot_project(
         godot_project_path,
         godot_binary=godot_binary,
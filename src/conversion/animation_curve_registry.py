@@ -2,7 +2,6 @@ from __future__ import annotations
 
 import json
 import os
-import re
 from dataclasses import dataclass
 from typing import Iterable, Protocol, cast
 
@@ -11,6 +10,7 @@ from src.conversion.project_source_paths import (
     resolve_project_source_path,
 )
 from src.conversion.type_defs import JsonDict
+from src.conversion.yy_documents import read_yy_json
 
 ANIMATION_CURVE_REGISTRY_RELATIVE_PATH = os.path.join(
     "gm2godot", "gml_animation_curve_registry.gd"
@@ -176,16 +176,7 @@ def _animation_curve_channel_from_yy(channel: JsonDict) -> AnimationCurveChannel
 
 
 def _read_json_lenient(path: str) -> JsonDict | None:
-    try:
-        with open(path, "r", encoding="utf-8") as f:
-            content = f.read()
-    except OSError:
-        return None
-    try:
-        data = json.loads(re.sub(r",\s*([}\]])", r"\1", content))
-    except json.JSONDecodeError:
-        return None
-    return cast(JsonDict, data) if isinstance(data, dict) else None
+    return read_yy_json(path)
 
 
 def _number(value: object, default: float) -> float:
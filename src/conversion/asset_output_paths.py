@@ -1,8 +1,12 @@
 from __future__ import annotations
 
 import os
+from collections.abc import Mapping
+from types import MappingProxyType
 
 from src.conversion.asset_registry import AssetRegistryConverter
+from src.conversion.conversion_scope import active_conversion_scope
+from src.conversion.project_snapshot import project_root_key
 from src.conversion.type_defs import ConversionRunning, StrPath
 
 
@@ -12,8 +16,12 @@ def build_asset_output_paths(
     *,
     conversion_running: ConversionRunning | None = None,
     organize_sounds_by_audio_group: bool = False,
-) -> dict[str, dict[str, str]]:
-    """Return the registry's collision-safe res:// path for every source asset."""
+) -> Mapping[str, Mapping[str, str]]:
+    """Return the registry's collision-safe res:// path for every source asset.
+
+    The map is read-only; during a conversion it is built once and shared
+    through the active project snapshot.
+    """
     converter = AssetRegistryConverter(
         gm_project_path,
         godot_project_path,
@@ -22,12 +30,33 @@ def build_asset_output_paths(
         conversion_running=conversion_running,
         organize_sounds_by_audio_group=organize_sounds_by_audio_group,
     )
+    snapshot = active_conversion_scope().project_snapshot
+    if snapshot is None:
+        return _asset_output_paths(converter)
+    return snapshot.get(
+        (
+            "asset_output_paths",
+            project_root_key(gm_project_path),
+            project_root_key(godot_project_path),
+            organize_sounds_by_audio_group,
+        ),
+        gm_project_path,
+        lambda: _asset_output_paths(converter),
+        complete=converter.conversion_running,
+    )
+
+
+def _asset_output_paths(
+    converter: AssetRegistryConverter,
+) -> Mapping[str, Mapping[str, str]]:
     paths: dict[str, dict[str, str]] = {}
     for entry in converter.build_entries():
         # Modern-script function aliases share the script kind. The actual
         # resource entry appears first and wins this deterministic name map.
         paths.setdefault(entry.kind, {}).setdefault(entry.name, entry.godot_path)
-    return paths
+    return MappingProxyType(
+        {kind: MappingProxyType(names) for kind, names in paths.items()}
+    )
 
 
 def resource_sibling_path(resource_path: str, extension: str) -> str:
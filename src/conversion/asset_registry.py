@@ -41,6 +41,7 @@ from src.conversion.included_file_paths import (
     plan_included_file_paths,
 )
 from src.conversion.generation_inventory import (
+    GenerationDigestCache,
     GenerationInventory,
     capture_generation_inventory,
 )
@@ -49,6 +50,8 @@ from src.conversion.managed_resource_outputs import (
     managed_resource_outputs,
     reconcile_timeline_action_outputs,
 )
+from src.conversion.conversion_scope import active_conversion_scope
+from src.conversion.project_snapshot import project_root_key
 from src.conversion.project_source_paths import (
     ProjectSourcePathError,
     is_safe_project_source_component,
@@ -81,6 +84,7 @@ from src.conversion.extension_registry import (
     extension_stub_resource_path,
     write_extension_compatibility_outputs,
 )
+from src.conversion.yy_documents import freeze_json
 
 ASSET_REGISTRY_RELATIVE_PATH = os.path.join("gm2godot", "gml_asset_registry.gd")
 ASSET_REGISTRY_RESOURCE_PATH = "res://gm2godot/gml_asset_registry.gd"
@@ -606,6 +610,7 @@ class AssetRegistryConverter(BaseConverter):
         macro_configuration: str | None = None,
         diagnostics: DiagnosticCollector | None = None,
         enforce_managed_resource_outputs: bool = False,
+        generation_digests: GenerationDigestCache | None = None,
     ) -> None:
         super().__init__(
             gm_project_path,
@@ -623,18 +628,49 @@ class AssetRegistryConverter(BaseConverter):
         self.enforce_managed_resource_outputs = bool(
             enforce_managed_resource_outputs
         )
+        self.generation_digests = generation_digests
         self.project_manifest: GameMakerProjectManifest = load_gamemaker_project_manifest(
             self.gm_project_path
         )
-        self._system_font_paths: dict[str, str | None] = {}
         self._timeline_action_source_failures: set[tuple[str, str]] = set()
         self._sequence_incomplete_resources: set[tuple[str, str]] = set()
 
     def build_entries(self) -> tuple[AssetRegistryEntry, ...]:
+        """Return the deterministic registry entries for every source asset.
+
+        Planning callers without a diagnostics collector share one set of
+        entries per conversion through the active project snapshot; entry
+        metadata is frozen so the shared views cannot be edited.
+        """
+        snapshot = active_conversion_scope().project_snapshot
+        if snapshot is None or self.diagnostics is not None:
+            return self._build_entries()
+        return snapshot.get(
+            (
+                "asset_registry_entries",
+                project_root_key(self.gm_project_path),
+                project_root_key(self.godot_project_path),
+                self.organize_sounds_by_audio_group,
+                self.macro_configuration,
+            ),
+            self.gm_project_path,
+            self._build_frozen_entries,
+            complete=self.conversion_running,
+        )
+
+    def _build_entries(self) -> tuple[AssetRegistryEntry, ...]:
         resources = self._ordered_project_resources()
         entries, _processed_count = self._build_entries_from_resources(resources)
         return entries
 
+    def _build_frozen_entries(self) -> tuple[AssetRegistryEntry, ...]:
+        return tuple(
+            replace(entry, metadata=cast(JsonDict, freeze_json(entry.metadata)))
+            if entry.metadata is not None
+            else entry
+            for entry in self._build_entries()
+        )
+
     def build_published_entries(self) -> tuple[AssetRegistryEntry, ...]:
         """Return entries whose Included File outputs match current sources.
 
@@ -2420,7 +2456,11 @@ class AssetRegistryConverter(BaseConverter):
             if self.enforce_managed_resource_outputs:
                 reconciliation = self._reconcile_managed_resource_entries(
                     entries,
-                    capture_generation_inventory(self.godot_project_path),
+                    capture_generation_inventory(
+                        self.godot_project_path,
+                        digest_cache=self.generation_digests,
+                        hash_workers=self.max_workers,
+                    ),
                 )
                 entries = reconciliation.entries
                 for entry in reconciliation.unavailable_entries:
@@ -3974,7 +4014,7 @@ class AssetRegistryConverter(BaseConverter):
 
         system_font_name = resource.raw_data.get("fontName")
         if isinstance(system_font_name, str) and system_font_name:
-            system_path = self._system_font_path(system_font_name)
+            system_path = resolve_system_font_source(system_font_name)
             if system_path is not None:
                 extension = os.path.splitext(system_path)[1].lower()
                 return self._flat_resource_path(
@@ -3986,12 +4026,6 @@ class AssetRegistryConverter(BaseConverter):
                 )
         return self._flat_resource_path("fonts", subfolder, resource.name, ".tres", suffix=suffix)
 
-    def _system_font_path(self, font_name: str) -> str | None:
-        cache_key = font_name.casefold()
-        if cache_key not in self._system_font_paths:
-            self._system_font_paths[cache_key] = resolve_system_font_source(font_name)
-        return self._system_font_paths[cache_key]
-
     def _get_subfolder_from_resource(self, resource: _ProjectResource) -> str:
         if not resource.yy_path:
             return ""
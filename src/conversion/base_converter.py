@@ -1,13 +1,12 @@
 from __future__ import annotations
 
-import json
 import os
-import re
 import threading
 from abc import ABC, abstractmethod
+from collections.abc import Callable, Collection
 from typing import Any, Literal, cast
 
-from src.localization import get_localized
+from src.localization import format_localized
 from src.conversion.conversion_outcome import (
     ConversionStepResult,
     ResourceOutcomeTracker,
@@ -23,6 +22,8 @@ from src.conversion.project_source_paths import (
     resolve_project_source_path,
 )
 from src.conversion.type_defs import ConversionRunning, JsonDict, LogCallback, ProgressCallback, StrPath
+from src.conversion.work_queue import BoundedWorkQueue, WorkQueueStats
+from src.conversion.yy_documents import read_yy_json, read_yy_json_keys
 
 
 class BaseConverter(ABC):
@@ -45,6 +46,7 @@ class BaseConverter(ABC):
         self.diagnostics = diagnostics
         self._lock = threading.Lock()
         self._resource_outcomes = ResourceOutcomeTracker()
+        self._work_queue_stats: dict[str, WorkQueueStats] = {}
 
     def _reset_resource_outcomes(self) -> None:
         """Start a fresh resource-outcome run for a reusable converter."""
@@ -104,6 +106,27 @@ class BaseConverter(ABC):
             finalize_unfinished_as=finalize_unfinished_as,
         )
 
+    def _work_queue(self, name: str, *, window: int | None = None) -> BoundedWorkQueue:
+        """Return a bounded worker pool whose metrics are recorded under ``name``."""
+        return BoundedWorkQueue(
+            max_workers=self.max_workers,
+            conversion_running=self.conversion_running,
+            window=window,
+            on_close=self._work_queue_stats_recorder(name),
+        )
+
+    def _work_queue_stats_recorder(self, name: str) -> Callable[[WorkQueueStats], None]:
+        def record(stats: WorkQueueStats) -> None:
+            with self._lock:
+                self._work_queue_stats[name] = stats
+
+        return record
+
+    def work_queue_stats(self) -> dict[str, WorkQueueStats]:
+        """Return queue-depth metrics from the latest run of each worker phase."""
+        with self._lock:
+            return dict(self._work_queue_stats)
+
     def _safe_log(self, message: str) -> None:
         """Thread-safe wrapper for log_callback. Use in multi-threaded converters."""
         with self._lock:
@@ -348,8 +371,8 @@ class BaseConverter(ABC):
 
     def _log_progress(self, item_name: str, current: int, total: int) -> None:
         """Log compact progress. First item appends a line; subsequent items update it in place."""
-        msg = get_localized("Console_Compact_Progress").format(
-            name=item_name, current=current, total=total)
+        msg = format_localized(
+            "Console_Compact_Progress", name=item_name, current=current, total=total)
         if current == 1:
             self.log_callback(msg)
         else:
@@ -360,27 +383,26 @@ class BaseConverter(ABC):
         with self._lock:
             self._log_progress(item_name, current, total)
 
-    def _read_yy_file(self, yy_path: StrPath) -> JsonDict | None:
-        """Read and parse a GameMaker .yy file, cleaning trailing commas."""
+    def _read_yy_file(
+        self,
+        yy_path: StrPath,
+        keys: Collection[str] | None = None,
+    ) -> JsonDict | None:
+        """Read a GameMaker .yy file through the shared document store.
+
+        The returned mapping is a read-only view shared with other readers.
+        Passing ``keys`` decodes only those top-level members.
+        """
         try:
             resolved = resolve_project_filesystem_source_path(
                 self.gm_project_path,
                 yy_path,
             )
-            with open(resolved.filesystem_path, 'r', encoding='utf-8') as f:
-                content = f.read()
-            cleaned = re.sub(r',\s*([}\]])', r'\1', content)
-            data = json.loads(cleaned)
-            return cast(JsonDict, data) if isinstance(data, dict) else None
-        except (
-            OSError,
-            ProjectSourcePathError,
-            json.JSONDecodeError,
-            KeyError,
-            TypeError,
-            ValueError,
-        ):
+        except (OSError, ProjectSourcePathError, ValueError):
             return None
+        if keys is not None:
+            return read_yy_json_keys(resolved.filesystem_path, keys)
+        return read_yy_json(resolved.filesystem_path)
 
     def _get_subfolder_from_yy(self, yy_path: StrPath) -> str:
         """Extract the IDE subfolder path from a resource's .yy file.
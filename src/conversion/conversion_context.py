@@ -1,11 +1,18 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import Mapping, Protocol
 
 from src.conversion.conversion_plan import CONVERSION_STEPS
+from src.conversion.conversion_scope import ConversionScope
 from src.conversion.diagnostics import DiagnosticCollector
+from src.conversion.generation_inventory import GenerationDigestCache
+from src.conversion.gml_runtime import GMLRuntimeWrites
+from src.conversion.gml_transpile_cache import GMLTranspileCache
+from src.conversion.project_gml_analysis import ProjectGMLAnalysisStore
+from src.conversion.project_snapshot import ProjectSnapshot
 from src.conversion.type_defs import BoolSetting, ConversionRunning, LogCallback, ProgressCallback
+from src.conversion.yy_documents import YYDocumentStore
 
 
 _CONVERSION_STEP_KEYS = frozenset(step.key for step in CONVERSION_STEPS)
@@ -32,10 +39,27 @@ class ConversionContext:
     diagnostics: DiagnosticCollector
     enabled_converters: tuple[str, ...]
     group_sounds_by_audio_group: bool = False
+    yy_documents: YYDocumentStore = field(default_factory=YYDocumentStore)
+    transpile_cache: GMLTranspileCache | None = None
+    gml_analysis: ProjectGMLAnalysisStore = field(default_factory=ProjectGMLAnalysisStore)
+    gml_runtime_writes: GMLRuntimeWrites = field(default_factory=GMLRuntimeWrites)
+    generation_digests: GenerationDigestCache | None = None
+    project_snapshot: ProjectSnapshot = field(default_factory=ProjectSnapshot)
 
     def is_running(self) -> bool:
         return self.conversion_running()
 
+    @property
+    def scope(self) -> ConversionScope:
+        """The stores module-level helpers share during this conversion."""
+        return ConversionScope(
+            yy_documents=self.yy_documents,
+            transpile_cache=self.transpile_cache,
+            gml_analysis=self.gml_analysis,
+            gml_runtime_writes=self.gml_runtime_writes,
+            project_snapshot=self.project_snapshot,
+        )
+
 
 def enabled_converter_keys(settings: Mapping[str, BoolSetting]) -> tuple[str, ...]:
     """Return enabled conversion step keys, excluding non-step UI settings."""
@@ -38,6 +38,7 @@ from src.conversion.generation_inventory import (
     migrate_generation_inventory,
     validate_generation_inventory,
 )
+from src.conversion.gml_runtime import load_gml_runtime_profile
 from src.conversion.included_file_paths import (
     canonical_included_file_lookup_path,
     plan_included_file_paths,
@@ -160,6 +161,7 @@ def write_conversion_artifacts(
             conversion_outcome=manifest_outcome,
             asset_entries=manifest_asset_publication.entries,
             generation_inventory=frozen_inventory,
+            runtime_profile=_runtime_profile_record(inventory_root),
         )
         manifest_content = _serialize_json(manifest_payload)
         manifest_digest = artifact_sha256(manifest_content)
@@ -330,6 +332,7 @@ def build_conversion_manifest(
         conversion_outcome=conversion_outcome,
         asset_entries=asset_entries,
         generation_inventory=frozen_inventory,
+        runtime_profile=_runtime_profile_record(inventory_root),
     )
 
 
@@ -343,6 +346,7 @@ def _build_conversion_manifest(
     conversion_outcome: ConversionOutcome,
     asset_entries: tuple[AssetRegistryEntry, ...],
     generation_inventory: GenerationInventory,
+    runtime_profile: JsonDict,
 ) -> JsonDict:
     project_manifest = load_gamemaker_project_manifest(gm_project_path, target_platform=target_platform)
     generated_files = [
@@ -378,7 +382,7 @@ def _build_conversion_manifest(
         "source_maps": [
             entry.to_generated_file_dict()
             for entry in generation_inventory.entries
-            if entry.path.endswith(".gmlmap.json")
+            if entry.kind == "source_map"
         ],
         "architecture_policies": build_architecture_policy_report(
             gm_project_path,
@@ -386,9 +390,15 @@ def _build_conversion_manifest(
             enabled_converters=enabled_converter_keys,
         ),
         "path_diagnostics": _path_diagnostics(asset_entries),
+        "runtime_profile": runtime_profile,
     }
 
 
+def _runtime_profile_record(generation_root: str) -> JsonDict:
+    report = load_gml_runtime_profile(generation_root)
+    return report if report is not None else {"profile": "full"}
+
+
 def _conversion_record(outcome: ConversionOutcome) -> JsonDict:
     return {
         **outcome.to_dict(),
@@ -50,6 +50,14 @@ CONVERSION_STEPS: tuple[ConversionStep, ...] = (
     ),
 )
 
+# Settings keys by group as offered in the GUI and CLI; ``sound_group_folders``
+# is a modifier of the sounds step rather than a step of its own.
+CONVERSION_CATEGORIES: dict[str, list[str]] = {
+    "assets": ["sprites", "fonts", "sounds", "sound_group_folders", "included_files", "scripts", "objects", "rooms", "asset_registry"],
+    "project": ["game_icon", "project_name", "project_settings", "audio_buses", "notes"],
+    "wip": ["shaders", "tilesets"],
+}
+
 
 def conversion_step_map(
     steps: Sequence[ConversionStep] = CONVERSION_STEPS,
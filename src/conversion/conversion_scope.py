@@ -0,0 +1,69 @@
+from __future__ import annotations
+
+import threading
+from collections.abc import Generator
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from src.conversion.gml_runtime_parts.writer import GMLRuntimeWrites
+    from src.conversion.gml_transpile_cache import GMLTranspileCache
+    from src.conversion.project_gml_analysis import ProjectGMLAnalysisStore
+    from src.conversion.project_snapshot import ProjectSnapshot
+    from src.conversion.yy_documents import YYDocumentStore
+
+
+@dataclass(frozen=True)
+class ConversionScope:
+    """Stores shared by every step of one conversion.
+
+    Module-level helpers such as ``read_yy_document`` and
+    ``load_gamemaker_project_manifest`` consult the active scope, so
+    converters share these stores without threading them through every
+    call. A store left as None is not shared; its helpers work uncached.
+    """
+
+    yy_documents: YYDocumentStore | None = None
+    transpile_cache: GMLTranspileCache | None = None
+    gml_analysis: ProjectGMLAnalysisStore | None = None
+    gml_runtime_writes: GMLRuntimeWrites | None = None
+    project_snapshot: ProjectSnapshot | None = None
+
+
+_NO_SCOPE = ConversionScope()
+_active_scope_lock = threading.Lock()
+_active_scope = _NO_SCOPE
+
+
+def active_conversion_scope() -> ConversionScope:
+    """Return the scope of the running conversion, or an empty scope."""
+    return _active_scope
+
+
+@contextmanager
+def using_conversion_scope(scope: ConversionScope) -> Generator[ConversionScope, None, None]:
+    """Make ``scope`` the active conversion scope for the block.
+
+    Converter worker threads do not inherit context variables, so the active
+    scope is process-wide and restored on exit. The transpile cache is
+    pruned to its budget once the block ends.
+    """
+    global _active_scope
+    with _active_scope_lock:
+        previous = _active_scope
+        _active_scope = scope
+    try:
+        yield scope
+    finally:
+        with _active_scope_lock:
+            _active_scope = previous
+        if scope.transpile_cache is not None:
+            scope.transpile_cache.prune()
+
+
+__all__ = [
+    "ConversionScope",
+    "active_conversion_scope",
+    "using_conversion_scope",
+]
@@ -15,7 +15,10 @@ from src.conversion.conversion_outcome import (
 )
 from src.conversion.sprites import SpriteConverter
 from src.conversion.sounds import SoundConverter
-from src.conversion.fonts import FontConverter
+from src.conversion.fonts import (
+    FontConverter,
+    prefetch_system_font_index,
+)
 from src.conversion.asset_registry import AssetRegistryConverter
 from src.conversion.notes import NoteConverter
 from src.conversion.tilesets import TileSetConverter
@@ -45,6 +48,7 @@ from src.conversion.conversion_context import (
     enabled_converter_keys,
     sound_group_folders_enabled,
 )
+from src.conversion.conversion_scope import using_conversion_scope
 from src.conversion.conversion_manifest import (
     CONVERSION_ATTEMPT_RELATIVE_PATH,
     CONVERSION_EVIDENCE_MAX_BYTES,
@@ -55,11 +59,24 @@ from src.conversion.conversion_manifest import (
     write_conversion_artifacts,
 )
 from src.conversion.generation_inventory import (
+    GenerationDigestCache,
     GenerationInventory,
     capture_generation_inventory,
     stage_inventory_carry_forward,
     validate_staged_generation_inventory,
 )
+from src.conversion.incremental_conversion import (
+    load_incremental_state,
+    remove_incremental_state,
+    step_source_fingerprints,
+    up_to_date_steps,
+    write_incremental_state,
+)
+from src.conversion.gml_runtime import (
+    RuntimeProfile,
+    apply_gml_runtime_profile,
+)
+from src.conversion.gml_transpile_cache import GMLTranspileCache
 from src.conversion.managed_output_publisher import (
     MANAGED_OUTPUT_POINTER_NAME,
     publish_managed_output_attempt,
@@ -75,6 +92,9 @@ from src.conversion.managed_output_workspace import (
 from src.conversion.managed_resource_outputs import (
     STALE_INVALIDATION_CONVERTER_KEYS,
 )
+# CONVERSION_CATEGORIES lives in conversion_plan so the CLI can list groups
+# without importing the converters; it stays importable from here.
+from src.conversion.conversion_plan import CONVERSION_CATEGORIES as CONVERSION_CATEGORIES
 from src.conversion.conversion_plan import build_conversion_plan
 from src.conversion.diagnostics import (
     ConversionDiagnosticReportPublicationReceipt,
@@ -86,14 +106,7 @@ from src.conversion.diagnostics import (
 )
 from src.conversion.type_defs import BoolSetting, LogCallback, ProgressCallback
 
-from src.localization import get_localized
-
-
-CONVERSION_CATEGORIES: dict[str, list[str]] = {
-    "assets": ["sprites", "fonts", "sounds", "sound_group_folders", "included_files", "scripts", "objects", "rooms", "asset_registry"],
-    "project": ["game_icon", "project_name", "project_settings", "audio_buses", "notes"],
-    "wip": ["shaders", "tilesets"],
-}
+from src.localization import format_localized, get_localized
 
 
 ConverterFn: TypeAlias = Callable[[], object]
@@ -122,7 +135,13 @@ class Converter:
                  status_callback: LogCallback, conversion_running: RunningFlag,
                  update_log_callback: LogCallback | None = None, compact_logging: bool = False,
                  max_workers: int | None = None,
-                 staged_output_finalizer: StagedOutputFinalizer | None = None) -> None:
+                 staged_output_finalizer: StagedOutputFinalizer | None = None,
+                 transpile_cache_dir: str | None = None,
+                 system_font_index_path: str | None = None,
+                 reuse_file_digests: bool = False,
+                 incremental: bool = False,
+                 normalize_sprite_png: bool = False,
+                 runtime_profile: RuntimeProfile = "full") -> None:
         self.log_callback: LogCallback = log_callback
         self.progress_callback: ProgressCallback = progress_callback
         self.status_callback: LogCallback = status_callback
@@ -133,6 +152,12 @@ class Converter:
         self.compact_logging = compact_logging
         self.max_workers = max_workers
         self.staged_output_finalizer = staged_output_finalizer
+        self.transpile_cache_dir = transpile_cache_dir
+        self.system_font_index_path = system_font_index_path
+        self.reuse_file_digests = reuse_file_digests
+        self.incremental = incremental
+        self.normalize_sprite_png = normalize_sprite_png
+        self.runtime_profile: RuntimeProfile = runtime_profile
         self.diagnostics = DiagnosticCollector()
         self.last_outcome: ConversionOutcome | None = None
         self._step_exception_resources = ConversionCounts()
@@ -164,6 +189,9 @@ class Converter:
         steps = ConversionStepLedger.from_requested(step.key for step in plan)
         public_path = self._public_godot_path
         previous_inventory: GenerationInventory | None = None
+        source_fingerprints: dict[str, str] = {}
+        recorded_fingerprints: dict[str, str] = {}
+        up_to_date: frozenset[str] = frozenset()
         workspace: ManagedOutputWorkspace | None = None
         preflight_error: Exception | None = None
         work_error: Exception | None = None
@@ -206,6 +234,28 @@ class Converter:
                     if output_snapshot.generation_inventory is not None
                     else GenerationInventory()
                 )
+                if self.incremental:
+                    source_fingerprints = step_source_fingerprints(
+                        gm_path,
+                        target_platform=gm_platform,
+                        enabled_converters=enabled_converters,
+                        options={
+                            "group_sounds_by_audio_group": (
+                                sound_group_folders_enabled(settings)
+                            ),
+                            "normalize_sprite_png": self.normalize_sprite_png,
+                        },
+                    )
+                    recorded_fingerprints = load_incremental_state(
+                        public_path,
+                        previous_inventory,
+                    )
+                    up_to_date = up_to_date_steps(
+                        (step.key for step in plan),
+                        recorded_fingerprints,
+                        source_fingerprints,
+                    )
+                # Unchanged steps keep their outputs exactly like disabled ones.
                 stage_inventory_carry_forward(
                     workspace,
                     previous_inventory,
@@ -213,6 +263,7 @@ class Converter:
                         key
                         for key in enabled_converters
                         if key in STALE_INVALIDATION_CONVERTER_KEYS
+                        and key not in up_to_date
                     ),
                 )
                 prepare_godot_project_destination(
@@ -246,37 +297,60 @@ class Converter:
                 self._conversion_context = context
                 self._output_snapshot = output_snapshot
                 resources = ConversionCounts()
+                # Steps without skipped or failed resources; only these are
+                # recorded, so incomplete steps report their problems again.
+                clean_steps: set[str] = set()
                 runtime_error: Exception | None = None
 
                 try:
+                    if any(step.key in ("fonts", "asset_registry") for step in plan):
+                        # Font lookups by the asset registry and font converter
+                        # wait for this index instead of walking the font folders.
+                        prefetch_system_font_index(self.system_font_index_path)
                     runners = self._build_step_runners(context)
-                    for step in plan:
-                        if not context.is_running():
-                            break
-                        steps = steps.start(step.key)
-                        self._step_exception_resources = ConversionCounts()
-                        converter_fn = runners.get(step.key)
-                        if converter_fn is None:
-                            raise RuntimeError(
-                                "No converter runner registered for step "
-                                f"{step.key!r}."
+                    with using_conversion_scope(context.scope):
+                        for step in plan:
+                            if not context.is_running():
+                                break
+                            steps = steps.start(step.key)
+                            if step.key in up_to_date:
+                                context.log_callback(
+                                    format_localized(
+                                        "Console_Convertor_StepUpToDate",
+                                        step=step.key,
+                                    )
+                                )
+                                steps = steps.complete(step.key)
+                                clean_steps.add(step.key)
+                                continue
+                            self._step_exception_resources = ConversionCounts()
+                            converter_fn = runners.get(step.key)
+                            if converter_fn is None:
+                                raise RuntimeError(
+                                    "No converter runner registered for step "
+                                    f"{step.key!r}."
+                                )
+                            log_message = get_localized(step.log_key)
+                            context.log_callback(log_message)
+                            context.status_callback(log_message)
+                            raw_result = converter_fn()
+                            step_result = (
+                                raw_result
+                                if isinstance(raw_result, ConversionStepResult)
+                                else ConversionStepResult()
                             )
-                        log_message = get_localized(step.log_key)
-                        context.log_callback(log_message)
-                        context.status_callback(log_message)
-                        raw_result = converter_fn()
-                        step_result = (
-                            raw_result
-                            if isinstance(raw_result, ConversionStepResult)
-                            else ConversionStepResult()
-                        )
-                        resources += step_result.resources
-                        context.progress_callback(0)
-                        if step_result.cancelled:
-                            break
-                        steps = steps.complete(step.key)
-                        if not context.is_running():
-                            break
+                            resources += step_result.resources
+                            context.progress_callback(0)
+                            if step_result.cancelled:
+                                break
+                            steps = steps.complete(step.key)
+                            if (
+                                step_result.resources.skipped == 0
+                                and step_result.resources.failed == 0
+                            ):
+                                clean_steps.add(step.key)
+                            if not context.is_running():
+                                break
 
                     if steps.active_step is not None or not context.is_running():
                         outcome = self._outcome(
@@ -295,6 +369,17 @@ class Converter:
                             steps=steps,
                             resources=resources,
                         )
+                        apply_gml_runtime_profile(
+                            context.godot_project_path,
+                            self.runtime_profile,
+                        )
+                        self._record_incremental_state(
+                            context,
+                            steps,
+                            clean_steps,
+                            recorded_fingerprints,
+                            source_fingerprints,
+                        )
                         self._canonical_outcome = outcome
                     self._set_outcome(outcome)
                 except Exception as error:
@@ -599,6 +684,35 @@ class Converter:
         self._set_outcome(outcome)
         return os.path.join(public_path, CONVERSION_ATTEMPT_RELATIVE_PATH)
 
+    def _record_incremental_state(
+        self,
+        context: ConversionContext,
+        steps: ConversionStepLedger,
+        clean_steps: set[str],
+        recorded_fingerprints: Mapping[str, str],
+        source_fingerprints: Mapping[str, str],
+    ) -> None:
+        """Stage the fingerprints that describe the staged outputs.
+
+        Steps that were not requested keep their recorded fingerprint because
+        their outputs were carried forward unchanged. Full conversions drop
+        the record, since their outputs may no longer match it.
+        """
+        if not self.incremental:
+            remove_incremental_state(context.godot_project_path)
+            return
+        fingerprints = {
+            key: value
+            for key, value in recorded_fingerprints.items()
+            if key not in steps.requested
+        }
+        fingerprints.update(
+            (key, source_fingerprints[key])
+            for key in steps.completed
+            if key in clean_steps and key in source_fingerprints
+        )
+        write_incremental_state(context.godot_project_path, fingerprints)
+
     def _run_base_converter(self, converter: BaseConverter) -> ConversionStepResult:
         try:
             converter.convert_all()
@@ -728,6 +842,8 @@ class Converter:
                 context.godot_project_path,
                 previous_inventory=previous_inventory,
                 enabled_converters=context.enabled_converters,
+                digest_cache=context.generation_digests,
+                hash_workers=context.max_workers,
             )
             self._desired_inventory = frozen_inventory
         paths = write_conversion_artifacts(
@@ -1269,6 +1385,16 @@ class Converter:
                 else enabled_converter_keys(settings)
             ),
             group_sounds_by_audio_group=sound_group_folders_enabled(settings),
+            transpile_cache=(
+                GMLTranspileCache(self.transpile_cache_dir)
+                if self.transpile_cache_dir
+                else None
+            ),
+            generation_digests=(
+                GenerationDigestCache()
+                if self.reuse_file_digests
+                else None
+            ),
         )
 
     def _build_step_runners(self, context: ConversionContext) -> dict[str, ConverterFn]:
@@ -1311,6 +1437,7 @@ class Converter:
                     compact_logging=context.compact_logging,
                     max_workers=context.max_workers,
                     diagnostics=context.diagnostics,
+                    normalize_png=self.normalize_sprite_png,
                 )
             ),
             "fonts": lambda: self._run_base_converter(
@@ -1447,6 +1574,7 @@ class Converter:
                     macro_configuration=context.target_platform,
                     diagnostics=context.diagnostics,
                     enforce_managed_resource_outputs=True,
+                    generation_digests=context.generation_digests,
                 )
             ),
         }
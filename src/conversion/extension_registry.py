@@ -22,6 +22,7 @@ from src.conversion.project_source_paths import (
     validate_project_resource_source_path,
 )
 from src.conversion.type_defs import JsonDict, LogCallback
+from src.conversion.yy_documents import read_yy_json
 
 EXTENSION_COMPATIBILITY_REPORT_RELATIVE_PATH = os.path.join(
     "gm2godot", "extension_compatibility_report.json"
@@ -1344,15 +1345,7 @@ def _read_json_lenient(
     )
     if refreshed is None:
         return None
-    try:
-        with open(refreshed.filesystem_path, "r", encoding="utf-8") as source_file:
-            content = source_file.read()
-        data = json.loads(re.sub(r",\s*([}\]])", r"\1", content))
-    except OSError:
-        return None
-    except json.JSONDecodeError:
-        return None
-    return cast(JsonDict, data) if isinstance(data, dict) else None
+    return read_yy_json(refreshed.filesystem_path)
 
 
 def _report_source_path_rejection(
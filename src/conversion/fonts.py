@@ -6,7 +6,9 @@ import platform
 import re
 import shutil
 import tempfile
-from concurrent.futures import Future, ThreadPoolExecutor, as_completed
+import threading
+from collections.abc import Mapping, Sequence
+from contextlib import suppress
 from dataclasses import dataclass
 from typing import Literal, TypedDict, cast
 
@@ -26,7 +28,8 @@ from src.conversion.project_source_paths import (
     ProjectSourcePathError,
     validate_project_resource_source_path,
 )
-from src.conversion.type_defs import ConversionRunning, JsonDict, LogCallback, ProgressCallback, StrPath
+from src.conversion.type_defs import ConversionRunning, LogCallback, ProgressCallback, StrPath
+from src.conversion.yy_documents import load_yy_json
 
 FONT_EXTENSIONS = ('.ttf', '.otf', '.ttc', '.otc', '.woff', '.woff2')
 
@@ -114,27 +117,216 @@ def _get_system_font_dirs() -> list[str]:
     return [d for d in dirs if os.path.isdir(d)]
 
 
-def _find_system_font(font_name: str) -> str | None:
-    """Search system font directories for a font file matching the given name.
+_SYSTEM_FONT_NAME_SUFFIXES = ('-regular', '-normal', '_regular', '_normal')
+SYSTEM_FONT_INDEX_FORMAT_VERSION = 1
 
-    Returns the path to the font file if found, None otherwise.
+
+def _normalized_font_name(name: str) -> str:
+    return name.lower().replace(' ', '')
+
+
+@dataclass(frozen=True)
+class SystemFontIndex:
+    """Font files in the system font directories by normalized name.
+
+    A file is indexed under its lowercased stem without spaces and, for names
+    such as ``Arial-Regular``, under the stem with the common suffix stripped.
+    The first file in walk order wins, as with a directory search.
     """
-    font_name_lower = font_name.lower().replace(' ', '')
-    for font_dir in _get_system_font_dirs():
+
+    font_dirs: tuple[str, ...]
+    # Every walked directory with its ``st_mtime_ns``; adding, removing or
+    # renaming a font changes the mtime of the directory holding it.
+    directory_mtimes: tuple[tuple[str, int], ...]
+    paths_by_name: Mapping[str, str]
+
+    def find(self, font_name: str) -> str | None:
+        return self.paths_by_name.get(_normalized_font_name(font_name))
+
+    def is_current(self) -> bool:
+        """Return whether no indexed directory has changed since the build."""
+        for directory, mtime_ns in self.directory_mtimes:
+            try:
+                if os.stat(directory).st_mtime_ns != mtime_ns:
+                    return False
+            except OSError:
+                return False
+        return True
+
+
+def build_system_font_index(font_dirs: Sequence[str]) -> SystemFontIndex:
+    """Walk ``font_dirs`` once and index every font file by name."""
+    directory_mtimes: list[tuple[str, int]] = []
+    paths_by_name: dict[str, str] = {}
+    for font_dir in font_dirs:
         for root, _, files in os.walk(font_dir):
+            try:
+                directory_mtimes.append((root, os.stat(root).st_mtime_ns))
+            except OSError:
+                continue
             for filename in files:
                 if not filename.lower().endswith(FONT_EXTENSIONS):
                     continue
-                name_without_ext = os.path.splitext(filename)[0].lower().replace(' ', '')
-                if name_without_ext == font_name_lower:
-                    return os.path.join(root, filename)
+                path = os.path.join(root, filename)
+                name = _normalized_font_name(os.path.splitext(filename)[0])
+                paths_by_name.setdefault(name, path)
                 # Also match with common suffixes stripped (e.g. "Arial-Regular" -> "Arial")
-                for suffix in ('-regular', '-normal', '_regular', '_normal'):
-                    if name_without_ext.endswith(suffix):
-                        base = name_without_ext[:-len(suffix)]
-                        if base == font_name_lower:
-                            return os.path.join(root, filename)
-    return None
+                for suffix in _SYSTEM_FONT_NAME_SUFFIXES:
+                    if name.endswith(suffix):
+                        paths_by_name.setdefault(name[:-len(suffix)], path)
+    return SystemFontIndex(
+        font_dirs=tuple(font_dirs),
+        directory_mtimes=tuple(directory_mtimes),
+        paths_by_name=paths_by_name,
+    )
+
+
+def load_system_font_index(
+    path: StrPath,
+    font_dirs: Sequence[str],
+) -> SystemFontIndex | None:
+    """Return the index persisted at ``path``, or None when missing or stale.
+
+    The index is only reused for the same font directories and when none of
+    the directories it walked has changed since it was written.
+    """
+    try:
+        with open(path, encoding='utf-8') as index_file:
+            payload: object = json.load(index_file)
+    except (OSError, ValueError):
+        return None
+    if not isinstance(payload, dict):
+        return None
+    document = cast(dict[str, object], payload)
+    if (
+        document.get('format') != SYSTEM_FONT_INDEX_FORMAT_VERSION
+        or document.get('font_dirs') != list(font_dirs)
+    ):
+        return None
+    directories = document.get('directories')
+    fonts = document.get('fonts')
+    if not isinstance(directories, list) or not isinstance(fonts, dict):
+        return None
+    directory_mtimes: list[tuple[str, int]] = []
+    for row in cast(list[object], directories):
+        if not isinstance(row, list) or len(cast(list[object], row)) != 2:
+            return None
+        directory, mtime_ns = cast(list[object], row)
+        if not isinstance(directory, str) or not isinstance(mtime_ns, int):
+            return None
+        directory_mtimes.append((directory, mtime_ns))
+    paths_by_name: dict[str, str] = {}
+    for name, font_path in cast(dict[object, object], fonts).items():
+        if not isinstance(name, str) or not isinstance(font_path, str):
+            return None
+        paths_by_name[name] = font_path
+    index = SystemFontIndex(
+        font_dirs=tuple(font_dirs),
+        directory_mtimes=tuple(directory_mtimes),
+        paths_by_name=paths_by_name,
+    )
+    return index if index.is_current() else None
+
+
+def write_system_font_index(index: SystemFontIndex, path: StrPath) -> None:
+    """Persist ``index`` at ``path``, replacing any previous index atomically."""
+    destination = os.fspath(path)
+    os.makedirs(os.path.dirname(destination) or '.', exist_ok=True)
+    temporary_path = os.path.join(
+        os.path.dirname(destination),
+        f".{os.path.basename(destination)}.{os.getpid()}.tmp",
+    )
+    payload = {
+        'format': SYSTEM_FONT_INDEX_FORMAT_VERSION,
+        'font_dirs': list(index.font_dirs),
+        'directories': [list(row) for row in index.directory_mtimes],
+        'fonts': dict(index.paths_by_name),
+    }
+    try:
+        with open(temporary_path, 'w', encoding='utf-8') as index_file:
+            json.dump(payload, index_file, ensure_ascii=False)
+        os.replace(temporary_path, destination)
+    except OSError:
+        with suppress(OSError):
+            os.remove(temporary_path)
+        raise
+
+
+_system_font_index_lock = threading.Lock()
+_system_font_index: SystemFontIndex | None = None
+
+
+def _load_or_build_system_font_index(
+    font_dirs: tuple[str, ...],
+    persist_path: StrPath | None = None,
+) -> SystemFontIndex:
+    if persist_path is not None:
+        index = load_system_font_index(persist_path, font_dirs)
+        if index is not None:
+            return index
+    index = build_system_font_index(font_dirs)
+    if persist_path is not None:
+        # The persisted index is only an accelerator; an unwritable home
+        # directory must not fail font lookups.
+        with suppress(OSError):
+            write_system_font_index(index, persist_path)
+    return index
+
+
+def system_font_index() -> SystemFontIndex:
+    """Return the process-wide system font index, building it on first use.
+
+    Lookups reuse the index until the set of font directories changes; call
+    ``refresh_system_font_index`` to pick up fonts installed since.
+    """
+    global _system_font_index
+    font_dirs = tuple(_get_system_font_dirs())
+    with _system_font_index_lock:
+        index = _system_font_index
+        if index is None or index.font_dirs != font_dirs:
+            index = _load_or_build_system_font_index(font_dirs)
+            _system_font_index = index
+        return index
+
+
+def refresh_system_font_index(persist_path: StrPath | None = None) -> SystemFontIndex:
+    """Return the process-wide index, rebuilding it if a font directory changed.
+
+    With ``persist_path`` a rebuild first tries the index saved in that file
+    and saves the result back, so later processes skip the directory walk
+    while the font directories are unchanged.
+    """
+    global _system_font_index
+    font_dirs = tuple(_get_system_font_dirs())
+    with _system_font_index_lock:
+        index = _system_font_index
+        if index is None or index.font_dirs != font_dirs or not index.is_current():
+            index = _load_or_build_system_font_index(font_dirs, persist_path)
+            _system_font_index = index
+        return index
+
+
+def prefetch_system_font_index(persist_path: StrPath | None = None) -> threading.Thread:
+    """Run ``refresh_system_font_index`` on a background thread.
+
+    Lookups made before the thread finishes wait for it.
+    """
+    thread = threading.Thread(
+        target=refresh_system_font_index,
+        args=(persist_path,),
+        name="system-font-index",
+        daemon=True,
+    )
+    thread.start()
+    return thread
+
+
+def _find_system_font(font_name: str) -> str | None:
+    """Search system font directories for a font file matching the given name.
+
+    Returns the path to the font file if found, None otherwise.
+    """
+    return system_font_index().find(font_name)
 
 
 def resolve_system_font_source(font_name: str) -> str | None:
@@ -175,7 +367,7 @@ class FontConverter(BaseConverter):
                          update_log_callback, compact_logging, max_workers=max_workers,
                          diagnostics=diagnostics)
         self.godot_fonts_path = os.path.join(self.godot_project_path, 'fonts')
-        self._font_output_paths: dict[str, str] = {}
+        self._font_output_paths: Mapping[str, str] = {}
 
     def find_font_files(self) -> list[str]:
         """Return available font metadata selected by the project plan."""
@@ -499,10 +691,7 @@ class FontConverter(BaseConverter):
 
     def _parse_font_yy(self, yy_path: str) -> FontData | None:
         try:
-            with open(yy_path, 'r', encoding='utf-8') as f:
-                content = f.read()
-            cleaned = re.sub(r',\s*([}\]])', r'\1', content)
-            data = cast(JsonDict, json.loads(cleaned))
+            data = load_yy_json(yy_path)
             return {
                 'fontName': str(data['fontName']),
                 'name': str(data['name']),
@@ -513,7 +702,7 @@ class FontConverter(BaseConverter):
                 'includeTTF': bool(data.get('includeTTF', False)),
                 'TTFName': str(data.get('TTFName', '')),
             }
-        except (OSError, json.JSONDecodeError, KeyError, TypeError):
+        except (OSError, KeyError, TypeError, ValueError):
             self._safe_log(get_localized("Console_Convertor_Fonts_ParseError").format(yy_path=yy_path))
             return None
 
@@ -761,20 +950,12 @@ class FontConverter(BaseConverter):
         failed_font_keys: set[str] = set()
         first_error: Exception | None = None
 
-        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
-            futures_map: dict[
-                Future[str | Literal[False] | None],
-                str,
-            ] = {
-                executor.submit(
-                    self._process_requested_font,
-                    resource_key,
-                    font_file,
-                ): resource_key
-                for resource_key, font_file in font_files
-            }
-            for future in as_completed(futures_map):
-                resource_key = futures_map[future]
+        def process(work: tuple[str, str]) -> str | Literal[False] | None:
+            resource_key, font_file = work
+            return self._process_requested_font(resource_key, font_file)
+
+        with self._work_queue("fonts") as queue:
+            for (resource_key, _font_file), future in queue.map(process, font_files):
                 try:
                     result = future.result()
                 except Exception as error:
@@ -793,6 +974,7 @@ class FontConverter(BaseConverter):
                 else:
                     failed_font_keys.add(resource_key)
                 self._safe_progress(int(processed_fonts / total_fonts * 100))
+            cancelled = cancelled or queue.stopped
 
         for resource_key in sorted(completed_font_keys):
             self._resource_completed(resource_key)
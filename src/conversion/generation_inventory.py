@@ -9,7 +9,11 @@ import posixpath
 import re
 import stat
 import sys
+import threading
 import unicodedata
+from collections.abc import Generator
+from concurrent.futures import Executor, ThreadPoolExecutor, wait
+from contextlib import contextmanager
 from dataclasses import dataclass
 from typing import Any, Iterable, Literal, Mapping, cast
 
@@ -72,6 +76,7 @@ _AUDIO_EXTENSIONS = frozenset(
 _FONT_EXTENSIONS = frozenset({".otf", ".ttf", ".woff", ".woff2"})
 
 InventoryOwnerClass = Literal["converter_step", "shared_owner"]
+ContentFingerprint = tuple[int, int, int, int, int]
 
 
 @dataclass(frozen=True, slots=True)
@@ -293,6 +298,64 @@ class GenerationInventory:
         return inventory
 
 
+class GenerationDigestCache:
+    """Digests of managed files keyed by their full stat fingerprint.
+
+    Captures that are given the cache reuse a recorded digest instead of
+    rereading a file whose (dev, ino, size, mtime_ns, ctime_ns) fingerprint
+    is unchanged, and record the digests they compute. A file rewritten in
+    place within the filesystem timestamp granularity keeps its fingerprint,
+    so only captures that may trust stat metadata should pass a cache;
+    ``validate_generation_inventory`` always rereads.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._digests: dict[str, tuple[ContentFingerprint, int, str]] = {}
+
+    def lookup(
+        self,
+        relative_path: str,
+        fingerprint: ContentFingerprint,
+    ) -> tuple[int, str] | None:
+        with self._lock:
+            recorded = self._digests.get(relative_path)
+        if recorded is None or recorded[0] != fingerprint:
+            return None
+        return recorded[1], recorded[2]
+
+    def record(
+        self,
+        relative_path: str,
+        fingerprint: ContentFingerprint,
+        byte_count: int,
+        sha256: str,
+    ) -> None:
+        with self._lock:
+            self._digests[relative_path] = (fingerprint, byte_count, sha256)
+
+
+@dataclass(frozen=True, slots=True)
+class _FileHashing:
+    digest_cache: GenerationDigestCache | None
+    executor: Executor | None
+
+
+@contextmanager
+def _file_hashing(
+    digest_cache: GenerationDigestCache | None,
+    hash_workers: int | None,
+) -> Generator[_FileHashing, None, None]:
+    if hash_workers == 1:
+        yield _FileHashing(digest_cache, None)
+        return
+    with ThreadPoolExecutor(
+        max_workers=hash_workers,
+        thread_name_prefix="generation-inventory",
+    ) as executor:
+        yield _FileHashing(digest_cache, executor)
+
+
 def normalize_generation_inventory_path(path: str | os.PathLike[str]) -> str:
     """Return one NFC, slash-separated, destination-relative path."""
 
@@ -336,7 +399,7 @@ def generation_output_kind(path: str | os.PathLike[str]) -> str:
     normalized = normalize_generation_inventory_path(path)
     if normalized == GODOT_PROJECT_FILENAME:
         return "project"
-    if normalized.endswith(".gmlmap.json"):
+    if normalized.endswith((".gdmap", ".gmlmap.json")):
         return "source_map"
     if normalized.endswith(".gdshader"):
         return "shader"
@@ -434,8 +497,17 @@ def capture_generation_inventory(
     *,
     previous_inventory: GenerationInventory | None = None,
     enabled_converters: Iterable[str] | None = None,
+    digest_cache: GenerationDigestCache | None = None,
+    hash_workers: int | None = 1,
 ) -> GenerationInventory:
-    """Capture every documented managed file through verified bindings."""
+    """Capture every documented managed file through verified bindings.
+
+    With ``digest_cache``, files whose full stat fingerprint matches a
+    recorded digest are not reread; the identity, link-count, mount, and
+    unchanged-while-captured checks still run for every file. Files in one
+    directory are hashed on ``hash_workers`` threads (None for the executor
+    default).
+    """
 
     root_value = os.fspath(root_path)
     try:
@@ -458,10 +530,13 @@ def capture_generation_inventory(
 
     entries: list[GenerationInventoryEntry] = []
     directory_counter = [0]
-    with VerifiedDirectory.open(
-        root_value,
-        description="generation inventory root",
-    ) as root:
+    with (
+        _file_hashing(digest_cache, hash_workers) as hashing,
+        VerifiedDirectory.open(
+            root_value,
+            description="generation inventory root",
+        ) as root,
+    ):
         root_stat = _binding_stat(root)
         root_device = root_stat.st_dev
         root_mount_id = _linux_mount_id(root)
@@ -472,6 +547,7 @@ def capture_generation_inventory(
             entries,
             root_device=root_device,
             root_mount_id=root_mount_id,
+            hashing=hashing,
         )
         for relative_path in MANAGED_OUTPUT_FILES:
             normalized = normalize_generation_inventory_path(relative_path)
@@ -482,6 +558,7 @@ def capture_generation_inventory(
                 entries,
                 root_device=root_device,
                 root_mount_id=root_mount_id,
+                hashing=hashing,
             )
         for managed_root in MANAGED_OUTPUT_DIRECTORIES:
             components = tuple(
@@ -494,6 +571,7 @@ def capture_generation_inventory(
                 directory_counter=directory_counter,
                 root_device=root_device,
                 root_mount_id=root_mount_id,
+                hashing=hashing,
             )
         root.verify_path()
 
@@ -744,6 +822,7 @@ def _capture_managed_root(
     directory_counter: list[int],
     root_device: int,
     root_mount_id: int | None,
+    hashing: _FileHashing,
 ) -> None:
     opened: list[VerifiedDirectory] = []
     current = root
@@ -784,6 +863,7 @@ def _capture_managed_root(
             depth=len(relative_components),
             root_device=root_device,
             root_mount_id=root_mount_id,
+            hashing=hashing,
         )
     finally:
         for binding in reversed(opened):
@@ -799,12 +879,14 @@ def _walk_managed_directory(
     depth: int,
     root_device: int,
     root_mount_id: int | None,
+    hashing: _FileHashing,
 ) -> None:
     if depth > _MAX_DIRECTORY_DEPTH:
         raise OSError("Managed generation exceeds the directory-depth limit")
     directory_counter[0] += 1
     if directory_counter[0] > _MAX_DIRECTORY_COUNT:
         raise OSError("Managed generation contains too many directories")
+    files: list[tuple[str, str, os.stat_result]] = []
     for name in directory.list_names():
         raw_relative_path = f"{relative_directory}/{name}"
         relative_path = normalize_generation_inventory_path(raw_relative_path)
@@ -845,6 +927,7 @@ def _walk_managed_directory(
                     depth=depth + 1,
                     root_device=root_device,
                     root_mount_id=root_mount_id,
+                    hashing=hashing,
                 )
             finally:
                 child.close()
@@ -854,18 +937,18 @@ def _walk_managed_directory(
                 "Refusing non-regular or multiply-linked managed generation "
                 f"entry: {path}"
             )
-        entries.append(
-            _capture_regular_file(
-                directory,
-                name,
-                relative_path,
-                path_stat,
-                root_device=root_device,
-                root_mount_id=root_mount_id,
-            )
-        )
-        if len(entries) > GENERATION_INVENTORY_MAX_ENTRIES:
+        files.append((name, relative_path, path_stat))
+        if len(entries) + len(files) > GENERATION_INVENTORY_MAX_ENTRIES:
             raise OSError("Managed generation contains too many files")
+    entries.extend(
+        _capture_regular_files(
+            directory,
+            files,
+            root_device=root_device,
+            root_mount_id=root_mount_id,
+            hashing=hashing,
+        )
+    )
     directory.verify_path()
 
 
@@ -877,6 +960,7 @@ def _capture_named_file_if_present(
     *,
     root_device: int,
     root_mount_id: int | None,
+    hashing: _FileHashing,
 ) -> None:
     try:
         path_stat = root.stat(name)
@@ -899,10 +983,40 @@ def _capture_named_file_if_present(
             path_stat,
             root_device=root_device,
             root_mount_id=root_mount_id,
+            digest_cache=hashing.digest_cache,
         )
     )
 
 
+def _capture_regular_files(
+    parent: VerifiedDirectory,
+    files: list[tuple[str, str, os.stat_result]],
+    *,
+    root_device: int,
+    root_mount_id: int | None,
+    hashing: _FileHashing,
+) -> list[GenerationInventoryEntry]:
+    def capture(file: tuple[str, str, os.stat_result]) -> GenerationInventoryEntry:
+        name, relative_path, path_stat = file
+        return _capture_regular_file(
+            parent,
+            name,
+            relative_path,
+            path_stat,
+            root_device=root_device,
+            root_mount_id=root_mount_id,
+            digest_cache=hashing.digest_cache,
+        )
+
+    if hashing.executor is None or len(files) < 2:
+        return [capture(file) for file in files]
+    futures = [hashing.executor.submit(capture, file) for file in files]
+    # Every read is relative to ``parent``; it must stay open until all of
+    # them have finished, including after the first failure.
+    wait(futures)
+    return [future.result() for future in futures]
+
+
 def _capture_regular_file(
     parent: VerifiedDirectory,
     name: str,
@@ -911,6 +1025,7 @@ def _capture_regular_file(
     *,
     root_device: int,
     root_mount_id: int | None,
+    digest_cache: GenerationDigestCache | None = None,
 ) -> GenerationInventoryEntry:
     path = parent.child_path(name)
     descriptor = parent.open_file(
@@ -933,14 +1048,24 @@ def _capture_regular_file(
             file_mount_id = _linux_file_mount_id(descriptor)
             if file_mount_id is not None and file_mount_id != root_mount_id:
                 raise OSError(f"Refusing mounted managed generation file: {path}")
-        digest = hashlib.sha256()
-        byte_count = 0
-        while True:
-            chunk = os.read(descriptor, _READ_CHUNK_BYTES)
-            if not chunk:
-                break
-            byte_count += len(chunk)
-            digest.update(chunk)
+        fingerprint = _content_fingerprint(opened_stat)
+        recorded = (
+            None
+            if digest_cache is None
+            else digest_cache.lookup(relative_path, fingerprint)
+        )
+        if recorded is not None:
+            byte_count, sha256 = recorded
+        else:
+            digest = hashlib.sha256()
+            byte_count = 0
+            while True:
+                chunk = os.read(descriptor, _READ_CHUNK_BYTES)
+                if not chunk:
+                    break
+                byte_count += len(chunk)
+                digest.update(chunk)
+            sha256 = "sha256:" + digest.hexdigest()
         final_opened_stat = os.fstat(descriptor)
         final_path_stat = parent.stat(name)
         if (
@@ -957,12 +1082,14 @@ def _capture_regular_file(
             raise OSError(
                 f"Managed generation file changed while hashing: {path}"
             )
+        if digest_cache is not None and recorded is None:
+            digest_cache.record(relative_path, fingerprint, byte_count, sha256)
         return GenerationInventoryEntry(
             path=relative_path,
             kind=generation_output_kind(relative_path),
             owner=generation_output_owner(relative_path),
             byte_count=byte_count,
-            sha256="sha256:" + digest.hexdigest(),
+            sha256=sha256,
             mode=stat.S_IMODE(opened_stat.st_mode),
         )
     finally:
@@ -989,7 +1116,7 @@ def _linux_file_mount_id(file_descriptor: int) -> int | None:
     return int(values[0])
 
 
-def _content_fingerprint(path_stat: os.stat_result) -> tuple[int, int, int, int, int]:
+def _content_fingerprint(path_stat: os.stat_result) -> ContentFingerprint:
     return (
         path_stat.st_dev,
         path_stat.st_ino,
@@ -1000,8 +1127,8 @@ def _content_fingerprint(path_stat: os.stat_result) -> tuple[int, int, int, int,
 
 
 def _content_fingerprints_match(
-    actual: tuple[int, int, int, int, int],
-    expected: tuple[int, int, int, int, int],
+    actual: ContentFingerprint,
+    expected: ContentFingerprint,
 ) -> bool:
     # Native Windows path and handle stat can expose different ctime values
     # for the same file. Identity, size, mtime, bytes, and SHA remain exact.
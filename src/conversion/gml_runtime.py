@@ -11,10 +11,23 @@ from src.conversion.gml_runtime_parts.manifest import (
     runtime_symbol_index,
     validate_runtime_segments,
 )
-from src.conversion.gml_runtime_parts.script import GML_RUNTIME_SCRIPT
+from src.conversion.gml_runtime_parts.profile import (
+    GML_RUNTIME_PROFILE_RELATIVE_PATH,
+    RUNTIME_PROFILES,
+    RuntimeProfile,
+    RuntimeProfileReport,
+    apply_gml_runtime_profile,
+    load_gml_runtime_profile,
+)
+from src.conversion.gml_runtime_parts.script import (
+    GMLRuntimeArtifact,
+    gml_runtime_artifact,
+    gml_runtime_script,
+)
 from src.conversion.gml_runtime_parts.writer import (
     GML_RUNTIME_RELATIVE_PATH,
     GML_RUNTIME_RESOURCE_PATH,
+    GMLRuntimeWrites,
     write_gml_runtime,
 )
 from src.conversion.runtime_managers import (
@@ -28,18 +41,39 @@ from src.conversion.runtime_managers import (
     write_runtime_managers,
 )
 
+# Declared without a value so ``__getattr__`` builds it on first use and
+# importing the facade does not read the segments.
+GML_RUNTIME_SCRIPT: str
+
+
+def __getattr__(name: str) -> str:
+    if name == "GML_RUNTIME_SCRIPT":
+        return gml_runtime_script()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
 __all__ = [
+    "GML_RUNTIME_PROFILE_RELATIVE_PATH",
     "GML_RUNTIME_RELATIVE_PATH",
     "GML_RUNTIME_RESOURCE_PATH",
     "GML_RUNTIME_SCRIPT",
+    "GMLRuntimeArtifact",
+    "GMLRuntimeWrites",
     "RUNTIME_MANAGER_DEFINITIONS",
     "RUNTIME_MANAGER_RELATIVE_DIR",
+    "RUNTIME_PROFILES",
     "RUNTIME_SEGMENTS",
     "RuntimeManagerDefinition",
     "RuntimeAPIIndexEntry",
+    "RuntimeProfile",
+    "RuntimeProfileReport",
     "RuntimeProvidedSymbol",
     "RuntimeSegmentDefinition",
+    "apply_gml_runtime_profile",
     "duplicate_runtime_symbols",
+    "gml_runtime_artifact",
+    "gml_runtime_script",
+    "load_gml_runtime_profile",
     "register_runtime_manager_autoloads",
     "render_runtime_manager_script",
     "runtime_api_index",
@@ -6,6 +6,10 @@ from pathlib import Path
 from typing import Literal, Pattern, TypeAlias
 
 RuntimeSymbolKind: TypeAlias = Literal["class", "const", "static_func", "static_var"]
+# Runtime variants a conversion can emit; see ``profile.py``. Kept here so the
+# CLI can offer them without importing the runtime writer.
+RuntimeProfile: TypeAlias = Literal["full", "minimal"]
+RUNTIME_PROFILES: tuple[RuntimeProfile, ...] = ("full", "minimal")
 
 RUNTIME_SEGMENT_DIR = Path(__file__).with_name("segments")
 RUNTIME_SEGMENT_MODULE_PREFIX = "src.conversion.gml_runtime_parts.segments."
@@ -0,0 +1,304 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import re
+from collections.abc import Iterable
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import cast
+
+from src.conversion.atomic_generated_text import atomic_write_confined_generated_text
+from src.conversion.type_defs import JsonDict
+
+from .manifest import (
+    RUNTIME_PROFILES,
+    RUNTIME_SEGMENTS,
+    RuntimeProfile,
+    assert_runtime_segments_valid,
+)
+from .script import gml_runtime_artifact
+from .writer import GML_RUNTIME_RELATIVE_PATH
+
+GML_RUNTIME_PROFILE_RELATIVE_PATH = os.path.join("gm2godot", "gml_runtime_profile.json")
+GML_RUNTIME_PROFILE_FORMAT_VERSION = 1
+GML_RUNTIME_PROFILE_MAX_BYTES = 4 * 1024 * 1024
+
+# Files whose text can name runtime declarations, including through
+# ``Callable(GMRuntime, "name")`` strings.
+_REFERENCING_EXTENSIONS = (".gd", ".tscn", ".tres")
+_IDENTIFIER_RE = re.compile(r"[A-Za-z_][A-Za-z0-9_]*")
+_DECLARATION_RE = re.compile(
+    r"^(?:static\s+func|static\s+var|const|class)\s+([A-Za-z_][A-Za-z0-9_]*)"
+)
+# Column-zero lines that continue the previous declaration: closing brackets
+# of multi-line signatures or literals and section comments.
+_CONTINUATION_PREFIXES = ("#", ")", "]", "}")
+
+
+@dataclass(frozen=True)
+class RuntimeDeclaration:
+    """One top-level runtime declaration and the runtime names it uses.
+
+    ``name`` is None for lines that are always emitted, such as ``extends``.
+    """
+
+    name: str | None
+    segment_name: str
+    text: str
+    references: frozenset[str]
+
+
+@dataclass(frozen=True)
+class RuntimeProfileReport:
+    profile: RuntimeProfile
+    kept_segments: tuple[str, ...]
+    pruned_segments: tuple[str, ...]
+    kept_declaration_count: int
+    pruned_declarations: tuple[str, ...]
+    full_bytes: int
+    emitted_bytes: int
+
+    def to_dict(self) -> JsonDict:
+        return {
+            "format_version": GML_RUNTIME_PROFILE_FORMAT_VERSION,
+            "profile": self.profile,
+            "kept_segments": list(self.kept_segments),
+            "pruned_segments": list(self.pruned_segments),
+            "kept_declaration_count": self.kept_declaration_count,
+            "pruned_declaration_count": len(self.pruned_declarations),
+            "pruned_declarations": list(self.pruned_declarations),
+            "full_bytes": self.full_bytes,
+            "emitted_bytes": self.emitted_bytes,
+        }
+
+
+@lru_cache(maxsize=1)
+def runtime_declarations() -> tuple[RuntimeDeclaration, ...]:
+    """Split the runtime segments into top-level declarations, in emit order."""
+    assert_runtime_segments_valid()
+    chunks: list[tuple[str | None, str, list[str]]] = []
+    for segment in RUNTIME_SEGMENTS:
+        current: list[str] | None = None
+        for line in segment.path.read_text(encoding="utf-8").splitlines(keepends=True):
+            match = _DECLARATION_RE.match(line)
+            starts_chunk = match is not None or not (
+                line[:1] in ("", " ", "\t", "\r", "\n")
+                or line.startswith(_CONTINUATION_PREFIXES)
+            )
+            if starts_chunk or current is None:
+                current = []
+                chunks.append(
+                    (match.group(1) if match is not None else None, segment.file_name, current)
+                )
+            current.append(line)
+
+    names = {name for name, _segment_name, _lines in chunks if name is not None}
+    declarations: list[RuntimeDeclaration] = []
+    for name, segment_name, lines in chunks:
+        text = "".join(lines)
+        declarations.append(
+            RuntimeDeclaration(
+                name=name,
+                segment_name=segment_name,
+                text=text,
+                references=frozenset(
+                    identifier
+                    for identifier in set(_IDENTIFIER_RE.findall(text))
+                    if identifier in names and identifier != name
+                ),
+            )
+        )
+    return tuple(declarations)
+
+
+def runtime_references(texts: Iterable[str]) -> frozenset[str]:
+    """Return the runtime declaration names that appear in ``texts``."""
+    names = {
+        declaration.name
+        for declaration in runtime_declarations()
+        if declaration.name is not None
+    }
+    referenced: set[str] = set()
+    for text in texts:
+        referenced.update(
+            identifier
+            for identifier in set(_IDENTIFIER_RE.findall(text))
+            if identifier in names
+        )
+    return frozenset(referenced)
+
+
+def render_minimal_runtime_script(
+    referenced_names: Iterable[str],
+) -> tuple[str, RuntimeProfileReport]:
+    """Return the runtime restricted to what ``referenced_names`` reach.
+
+    Declarations are kept when a referenced name or a kept declaration uses
+    them, so the result is the transitive closure over runtime symbols. The
+    declared segment dependencies only order segments; they are not followed.
+    """
+    declarations = runtime_declarations()
+    indices_by_name: dict[str, list[int]] = {}
+    for index, declaration in enumerate(declarations):
+        if declaration.name is not None:
+            indices_by_name.setdefault(declaration.name, []).append(index)
+
+    kept: set[int] = set()
+    pending = [
+        index
+        for index, declaration in enumerate(declarations)
+        if declaration.name is None
+    ]
+    pending.extend(
+        index
+        for name in referenced_names
+        for index in indices_by_name.get(name, ())
+    )
+    while pending:
+        index = pending.pop()
+        if index in kept:
+            continue
+        kept.add(index)
+        pending.extend(
+            dependency
+            for name in declarations[index].references
+            for dependency in indices_by_name[name]
+        )
+
+    script = "".join(
+        declaration.text
+        for index, declaration in enumerate(declarations)
+        if index in kept
+    )
+    kept_segments = {
+        declarations[index].segment_name
+        for index in kept
+        if declarations[index].name is not None
+    }
+    return script, RuntimeProfileReport(
+        profile="minimal",
+        kept_segments=tuple(
+            segment.file_name for segment in RUNTIME_SEGMENTS if segment.file_name in kept_segments
+        ),
+        pruned_segments=tuple(
+            segment.file_name for segment in RUNTIME_SEGMENTS if segment.file_name not in kept_segments
+        ),
+        kept_declaration_count=sum(
+            1 for index in kept if declarations[index].name is not None
+        ),
+        pruned_declarations=tuple(
+            sorted(
+                declaration.name
+                for index, declaration in enumerate(declarations)
+                if declaration.name is not None and index not in kept
+            )
+        ),
+        full_bytes=len(gml_runtime_artifact().script.encode("utf-8")),
+        emitted_bytes=len(script.encode("utf-8")),
+    )
+
+
+def project_runtime_references(godot_project_path: str) -> frozenset[str]:
+    """Return the runtime names used by the generated project's scripts and scenes."""
+    runtime_path = os.path.normcase(
+        os.path.join(godot_project_path, GML_RUNTIME_RELATIVE_PATH)
+    )
+    texts: list[str] = []
+    for directory, directory_names, file_names in os.walk(godot_project_path):
+        directory_names[:] = sorted(
+            name for name in directory_names if not name.startswith(".")
+        )
+        for file_name in sorted(file_names):
+            if not file_name.endswith(_REFERENCING_EXTENSIONS):
+                continue
+            path = os.path.join(directory, file_name)
+            if os.path.normcase(path) == runtime_path:
+                continue
+            with open(path, "r", encoding="utf-8", errors="replace") as source_file:
+                texts.append(source_file.read())
+    return runtime_references(texts)
+
+
+def apply_gml_runtime_profile(
+    godot_project_path: str,
+    profile: RuntimeProfile,
+) -> RuntimeProfileReport | None:
+    """Rewrite the staged runtime for ``profile`` once every step has run.
+
+    The ``minimal`` profile keeps only declarations reachable from generated
+    scripts, scenes and resources and records what was pruned in
+    ``gm2godot/gml_runtime_profile.json``. The ``full`` profile restores a
+    runtime carried forward from an earlier minimal conversion. Nothing is
+    written when the conversion emitted no runtime.
+    """
+    runtime_path = os.path.join(godot_project_path, GML_RUNTIME_RELATIVE_PATH)
+    profile_path = os.path.join(godot_project_path, GML_RUNTIME_PROFILE_RELATIVE_PATH)
+    if not os.path.isfile(runtime_path):
+        _remove_file(profile_path)
+        return None
+    if profile == "full":
+        artifact = gml_runtime_artifact()
+        with open(runtime_path, "rb") as runtime_file:
+            if hashlib.sha256(runtime_file.read()).hexdigest() != artifact.sha256:
+                atomic_write_confined_generated_text(
+                    runtime_path,
+                    artifact.script,
+                    confinement_root=godot_project_path,
+                )
+        _remove_file(profile_path)
+        return None
+
+    script, report = render_minimal_runtime_script(
+        project_runtime_references(godot_project_path)
+    )
+    atomic_write_confined_generated_text(
+        runtime_path,
+        script,
+        confinement_root=godot_project_path,
+    )
+    atomic_write_confined_generated_text(
+        profile_path,
+        json.dumps(report.to_dict(), ensure_ascii=True, indent=2, sort_keys=True) + "\n",
+        confinement_root=godot_project_path,
+    )
+    return report
+
+
+def load_gml_runtime_profile(godot_project_path: str) -> JsonDict | None:
+    """Return the recorded runtime profile report, or None for the full runtime."""
+    profile_path = os.path.join(godot_project_path, GML_RUNTIME_PROFILE_RELATIVE_PATH)
+    try:
+        if os.path.getsize(profile_path) > GML_RUNTIME_PROFILE_MAX_BYTES:
+            raise ValueError(f"GML runtime profile report is too large: {profile_path}")
+        with open(profile_path, "r", encoding="utf-8") as profile_file:
+            payload = json.load(profile_file)
+    except FileNotFoundError:
+        return None
+    if not isinstance(payload, dict):
+        raise ValueError(f"GML runtime profile report is not a JSON object: {profile_path}")
+    return cast(JsonDict, payload)
+
+
+def _remove_file(path: str) -> None:
+    try:
+        os.remove(path)
+    except FileNotFoundError:
+        pass
+
+
+__all__ = [
+    "GML_RUNTIME_PROFILE_FORMAT_VERSION",
+    "GML_RUNTIME_PROFILE_RELATIVE_PATH",
+    "RUNTIME_PROFILES",
+    "RuntimeDeclaration",
+    "RuntimeProfile",
+    "RuntimeProfileReport",
+    "apply_gml_runtime_profile",
+    "load_gml_runtime_profile",
+    "project_runtime_references",
+    "render_minimal_runtime_script",
+    "runtime_declarations",
+    "runtime_references",
+]
@@ -1,20 +1,49 @@
 from __future__ import annotations
 
+import hashlib
+import threading
+from dataclasses import dataclass
+
 from .manifest import (
     RUNTIME_SEGMENT_DIR,
     assert_runtime_segments_valid,
     runtime_segment_names,
 )
 
-_RUNTIME_SEGMENT_NAMES = runtime_segment_names()
 
+@dataclass(frozen=True)
+class GMLRuntimeArtifact:
+    """The concatenated runtime script and its SHA-256 digest."""
+
+    script: str
+    sha256: str
+
+
+_artifact_lock = threading.Lock()
+_artifact: GMLRuntimeArtifact | None = None
+
+
+def gml_runtime_artifact() -> GMLRuntimeArtifact:
+    """Return the runtime script, validating and reading the segments once.
+
+    Importing the runtime package stays cheap for commands that never emit
+    the runtime; the first caller pays for segment validation and reads.
+    """
+    global _artifact
+    with _artifact_lock:
+        if _artifact is None:
+            assert_runtime_segments_valid()
+            script = "".join(
+                (RUNTIME_SEGMENT_DIR / segment_name).read_text(encoding="utf-8")
+                for segment_name in runtime_segment_names()
+            )
+            _artifact = GMLRuntimeArtifact(
+                script=script,
+                sha256=hashlib.sha256(script.encode("utf-8")).hexdigest(),
+            )
+        return _artifact
 
-def _read_runtime_script() -> str:
-    assert_runtime_segments_valid()
-    return "".join(
-        (RUNTIME_SEGMENT_DIR / segment_name).read_text(encoding="utf-8")
-        for segment_name in _RUNTIME_SEGMENT_NAMES
-    )
 
+def gml_runtime_script() -> str:
+    return gml_runtime_artifact().script
 
-GML_RUNTIME_SCRIPT = _read_runtime_script()
@@ -1,23 +1,85 @@
 from __future__ import annotations
 
+import hashlib
 import os
+import threading
 
+from src.conversion.atomic_generated_text import atomic_write_confined_generated_text
+from src.conversion.conversion_scope import active_conversion_scope
 from src.conversion.runtime_managers import (
     register_runtime_manager_autoloads,
-    write_runtime_managers,
+    render_runtime_manager_script,
+    runtime_manager_definitions,
 )
 
-from .script import GML_RUNTIME_SCRIPT
+from .script import gml_runtime_artifact
 
 GML_RUNTIME_RELATIVE_PATH = os.path.join("gm2godot", "gml_runtime.gd")
 GML_RUNTIME_RESOURCE_PATH = "res://gm2godot/gml_runtime.gd"
 
 
+class GMLRuntimeWrites:
+    """Output roots that already received the runtime during one conversion.
+
+    Scripts and objects both need the runtime; the first step to ask writes
+    it together with the runtime managers and autoloads, later steps reuse it.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._roots: set[str] = set()
+
+    def write(self, godot_project_path: str) -> str:
+        root = os.path.normcase(os.path.abspath(godot_project_path))
+        with self._lock:
+            if root not in self._roots:
+                _write_gml_runtime_files(godot_project_path)
+                self._roots.add(root)
+        return os.path.join(godot_project_path, GML_RUNTIME_RELATIVE_PATH)
+
+
 def write_gml_runtime(godot_project_path: str) -> str:
-    runtime_path = os.path.join(godot_project_path, GML_RUNTIME_RELATIVE_PATH)
-    os.makedirs(os.path.dirname(runtime_path), exist_ok=True)
-    with open(runtime_path, "w", encoding="utf-8") as f:
-        f.write(GML_RUNTIME_SCRIPT)
-    write_runtime_managers(godot_project_path)
+    writes = active_conversion_scope().gml_runtime_writes
+    if writes is not None:
+        return writes.write(godot_project_path)
+    _write_gml_runtime_files(godot_project_path)
+    return os.path.join(godot_project_path, GML_RUNTIME_RELATIVE_PATH)
+
+
+def _write_gml_runtime_files(godot_project_path: str) -> None:
+    artifact = gml_runtime_artifact()
+    _write_if_changed(
+        godot_project_path,
+        GML_RUNTIME_RELATIVE_PATH,
+        artifact.script,
+        artifact.sha256,
+    )
+    for definition in runtime_manager_definitions():
+        content = render_runtime_manager_script(definition)
+        _write_if_changed(
+            godot_project_path,
+            definition.relative_path,
+            content,
+            hashlib.sha256(content.encode("utf-8")).hexdigest(),
+        )
     register_runtime_manager_autoloads(godot_project_path)
-    return runtime_path
+
+
+def _write_if_changed(
+    godot_project_path: str,
+    relative_path: str,
+    content: str,
+    sha256: str,
+) -> None:
+    output_path = os.path.join(godot_project_path, relative_path)
+    try:
+        with open(output_path, "rb") as existing_file:
+            if hashlib.sha256(existing_file.read()).hexdigest() == sha256:
+                return
+    except (FileNotFoundError, IsADirectoryError, NotADirectoryError):
+        pass
+    atomic_write_confined_generated_text(
+        output_path,
+        content,
+        confinement_root=godot_project_path,
+    )
@@ -0,0 +1,278 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import pickle
+import sys
+import tempfile
+import threading
+from collections.abc import Callable, Mapping, Sequence, Set
+from dataclasses import dataclass, fields, is_dataclass
+from functools import lru_cache
+from types import ModuleType
+from typing import cast
+
+from src.conversion.type_defs import StrPath
+from src.version import VERSION
+
+
+DEFAULT_TRANSPILE_CACHE_BUDGET_BYTES = 512 * 1024 * 1024
+
+# Bump when the entry layout or key derivation changes.
+_CACHE_FORMAT = 1
+_ENTRY_SUFFIX = ".pickle"
+_TRANSPILER_MODULE_PREFIXES = (
+    "src.conversion.gml_transpiler",
+    "src.conversion.gml_transpile_engine",
+)
+
+
+class UncacheableValue(TypeError):
+    """A job or table value has no stable content encoding."""
+
+
+def default_transpile_cache_dir() -> str:
+    """Return the per-user transpile cache directory used by the GUI."""
+    return os.path.join(os.path.expanduser("~"), ".gm2godot", "transpile-cache")
+
+
+def _canonical(value: object) -> object:
+    """Return a JSON-encodable form of ``value`` independent of hash order."""
+    if value is None or isinstance(value, bool | int | float | str):
+        return value
+    if is_dataclass(value) and not isinstance(value, type):
+        return [
+            type(value).__qualname__,
+            {field.name: _canonical(getattr(value, field.name)) for field in fields(value)},
+        ]
+    if isinstance(value, Mapping):
+        items = [
+            (_canonical(key), _canonical(item))
+            for key, item in cast(Mapping[object, object], value).items()
+        ]
+        return ["map", sorted(items, key=lambda item: json.dumps(item[0]))]
+    if isinstance(value, Set):
+        members = [_canonical(member) for member in cast(Set[object], value)]
+        return ["set", sorted(members, key=json.dumps)]
+    if isinstance(value, list | tuple):
+        return [_canonical(item) for item in cast(Sequence[object], value)]
+    raise UncacheableValue(f"Cannot derive a transpile cache key from {type(value).__name__}.")
+
+
+def content_digest(value: object) -> str:
+    """Return the SHA-256 hex digest of the canonical encoding of ``value``."""
+    encoded = json.dumps(_canonical(value), separators=(",", ":"), ensure_ascii=False)
+    return hashlib.sha256(encoded.encode("utf-8")).hexdigest()
+
+
+def _module_source_paths(module: ModuleType) -> set[str]:
+    """Return the source files of ``module`` and of the project modules it uses."""
+    module_names = {module.__name__}
+    for value in vars(module).values():
+        owner = value.__name__ if isinstance(value, ModuleType) else getattr(value, "__module__", None)
+        if isinstance(owner, str) and owner.startswith("src."):
+            module_names.add(owner)
+    module_names.update(
+        name
+        for name in sys.modules
+        if name.startswith(_TRANSPILER_MODULE_PREFIXES)
+    )
+    paths: set[str] = set()
+    for name in module_names:
+        source_path = getattr(sys.modules.get(name), "__file__", None)
+        if isinstance(source_path, str):
+            paths.add(source_path)
+    return paths
+
+
+@lru_cache(maxsize=None)
+def transpiler_code_digest(module_name: str) -> str:
+    """Return a digest of the code that produces cached results.
+
+    Covers the transpiler package and the modules used by ``module_name``, so
+    editing the transpiler invalidates old entries. Frozen builds without
+    source files fall back to the application version.
+    """
+    digest = hashlib.sha256(f"{_CACHE_FORMAT}:{VERSION}".encode("utf-8"))
+    module = sys.modules.get(module_name)
+    if module is None:
+        return digest.hexdigest()
+    for path in sorted(_module_source_paths(module)):
+        try:
+            with open(path, "rb") as source_file:
+                digest.update(os.path.basename(path).encode("utf-8"))
+                digest.update(source_file.read())
+        except OSError:
+            continue
+    return digest.hexdigest()
+
+
+def transpile_cache_key(
+    function: Callable[..., object],
+    tables_digest: str,
+    job: object,
+) -> str:
+    """Return the cache key of ``function(tables, job)``.
+
+    Raises :class:`UncacheableValue` when ``job`` holds values without a
+    stable encoding.
+    """
+    return content_digest(
+        [
+            f"{function.__module__}.{function.__qualname__}",
+            transpiler_code_digest(function.__module__),
+            tables_digest,
+            job,
+        ]
+    )
+
+
+@dataclass(frozen=True)
+class GMLTranspileCacheStats:
+    hits: int
+    misses: int
+    writes: int
+    evictions: int
+
+
+class GMLTranspileCache:
+    """Content-addressed on-disk cache of transpile results.
+
+    Entries are pickled results keyed by :func:`transpile_cache_key`, so an
+    unchanged GML source transpiled with the same options, project tables and
+    transpiler code is never tokenized or parsed again, across conversions.
+    Reads refresh an entry's modification time and :meth:`prune` removes the
+    least recently used entries once the directory exceeds ``budget_bytes``.
+    Unreadable or corrupt entries count as misses.
+    """
+
+    def __init__(
+        self,
+        directory: StrPath,
+        *,
+        budget_bytes: int = DEFAULT_TRANSPILE_CACHE_BUDGET_BYTES,
+    ) -> None:
+        directory_path: str = os.fspath(directory)
+        self.directory = os.path.abspath(directory_path)
+        self.budget_bytes = max(0, budget_bytes)
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._writes = 0
+        self._evictions = 0
+
+    def _entry_path(self, key: str) -> str:
+        return os.path.join(self.directory, key[:2], key + _ENTRY_SUFFIX)
+
+    def get(self, key: str) -> object | None:
+        """Return the cached value for ``key``, or ``None`` on a miss."""
+        path = self._entry_path(key)
+        try:
+            with open(path, "rb") as entry_file:
+                entry_format, entry_key, value = pickle.load(entry_file)
+        except (OSError, EOFError, ValueError, TypeError, AttributeError, ImportError, pickle.UnpicklingError):
+            value = None
+        else:
+            if entry_format != _CACHE_FORMAT or entry_key != key:
+                value = None
+        with self._lock:
+            if value is None:
+                self._misses += 1
+                return None
+            self._hits += 1
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+        return value
+
+    def put(self, key: str, value: object) -> None:
+        """Store ``value`` for ``key``; write failures leave the cache unchanged."""
+        path = self._entry_path(key)
+        try:
+            payload = pickle.dumps((_CACHE_FORMAT, key, value), protocol=pickle.HIGHEST_PROTOCOL)
+        except (pickle.PicklingError, TypeError, AttributeError):
+            return
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            descriptor, temporary_path = tempfile.mkstemp(
+                dir=os.path.dirname(path),
+                prefix=".",
+                suffix=".tmp",
+            )
+            try:
+                with os.fdopen(descriptor, "wb") as entry_file:
+                    entry_file.write(payload)
+                os.replace(temporary_path, path)
+            except BaseException:
+                try:
+                    os.unlink(temporary_path)
+                except OSError:
+                    pass
+                raise
+        except OSError:
+            return
+        with self._lock:
+            self._writes += 1
+
+    def prune(self) -> None:
+        """Delete least recently used entries until the budget is met."""
+        entries: list[tuple[int, int, str]] = []
+        total_bytes = 0
+        try:
+            shards = list(os.scandir(self.directory))
+        except OSError:
+            return
+        for shard in shards:
+            if not shard.is_dir(follow_symlinks=False):
+                continue
+            try:
+                shard_entries = list(os.scandir(shard.path))
+            except OSError:
+                continue
+            for entry in shard_entries:
+                if not entry.name.endswith(_ENTRY_SUFFIX):
+                    continue
+                try:
+                    stat_result = entry.stat(follow_symlinks=False)
+                except OSError:
+                    continue
+                entries.append((stat_result.st_mtime_ns, stat_result.st_size, entry.path))
+                total_bytes += stat_result.st_size
+        if total_bytes <= self.budget_bytes:
+            return
+        entries.sort()
+        evicted = 0
+        for _mtime_ns, size, path in entries:
+            if total_bytes <= self.budget_bytes:
+                break
+            try:
+                os.unlink(path)
+            except OSError:
+                continue
+            total_bytes -= size
+            evicted += 1
+        with self._lock:
+            self._evictions += evicted
+
+    def stats(self) -> GMLTranspileCacheStats:
+        with self._lock:
+            return GMLTranspileCacheStats(
+                hits=self._hits,
+                misses=self._misses,
+                writes=self._writes,
+                evictions=self._evictions,
+            )
+
+
+__all__ = [
+    "DEFAULT_TRANSPILE_CACHE_BUDGET_BYTES",
+    "GMLTranspileCache",
+    "GMLTranspileCacheStats",
+    "UncacheableValue",
+    "content_digest",
+    "default_transpile_cache_dir",
+    "transpile_cache_key",
+    "transpiler_code_digest",
+]
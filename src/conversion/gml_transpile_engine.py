@@ -0,0 +1,371 @@
+from __future__ import annotations
+
+import multiprocessing
+import threading
+from collections import deque
+from collections.abc import Callable, Iterable, Iterator, Mapping
+from concurrent.futures import CancelledError, Future, ProcessPoolExecutor, wait
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import dataclass, field
+from typing import Protocol, TypedDict, TypeVar, cast
+
+from src.conversion.conversion_scope import active_conversion_scope
+from src.conversion.gml_transpile_cache import (
+    GMLTranspileCache,
+    UncacheableValue,
+    content_digest,
+    transpile_cache_key,
+)
+from src.conversion.gml_transpiler import (
+    GMLExtensionFunction,
+    GMLExtensionFunctionMapping,
+    GMLTranspileError,
+    GMLTranspileResult,
+    transpile_gml_code_with_source_map,
+)
+from src.conversion.type_defs import ConversionRunning
+
+
+# Below this much submitted GML the worker start-up cost outweighs the
+# parallel speed-up, so small projects keep transpiling in-process.
+DEFAULT_PARALLEL_SOURCE_BYTES = 64 * 1024
+
+_JOBS_IN_FLIGHT_PER_WORKER = 4
+_CANCEL_POLL_SECONDS = 0.1
+
+
+class GMLSourceJob(Protocol):
+    @property
+    def source(self) -> str | None: ...
+
+
+_Job = TypeVar("_Job", bound=GMLSourceJob)
+_Result = TypeVar("_Result")
+
+
+@dataclass(frozen=True)
+class GMLTranspileTables:
+    """Project-wide lookup tables shared by every job of one conversion step.
+
+    The tables are pickled once per worker process by the pool initializer
+    instead of once per job.
+    """
+
+    asset_names: frozenset[str] | None = None
+    enum_values: Mapping[str, Mapping[str, int]] | None = None
+    macro_values: Mapping[str, str] | None = None
+    macro_configuration: str | None = None
+    extension_functions: Mapping[str, GMLExtensionFunction] | None = None
+    extension_function_mappings: Mapping[str, GMLExtensionFunctionMapping] | None = None
+
+
+class GMLTranspileOptions(TypedDict, total=False):
+    """Per-source keyword arguments of ``transpile_gml_code_with_source_map``."""
+
+    indent: str
+    local_names: Iterable[str] | None
+    inherited_event_call: str | None
+    active_preprocessor_symbols: Iterable[str] | None
+    top_level_global_scope: bool
+    legacy_global_builtins: bool
+    static_scope_prefix: str | None
+    return_depth: int
+    source_path: str | None
+    event: str | None
+    preserve_source_comments: bool
+    generated_line_offset: int
+    self_expression: str
+    other_expression: str
+    instance_target: str | None
+    direct_instance_names: Iterable[str] | None
+    dynamic_instance_names: Iterable[str] | None
+
+
+@dataclass(frozen=True)
+class GMLTranspileJob:
+    """One GML source and the transpiler options that vary per source.
+
+    ``collect_instance_variables`` reports the instance variables the source
+    assigns, which the in-process API records by mutating a caller set.
+    """
+
+    source: str
+    options: GMLTranspileOptions = field(default_factory=GMLTranspileOptions)
+    collect_instance_variables: bool = False
+
+
+@dataclass(frozen=True)
+class GMLTranspileOutcome:
+    result: GMLTranspileResult | None
+    error: GMLTranspileError | None = None
+    instance_variables: frozenset[str] = frozenset()
+
+
+def transpile_job(tables: GMLTranspileTables, job: GMLTranspileJob) -> GMLTranspileOutcome:
+    """Transpile one job against ``tables``; transpile errors become outcomes."""
+    instance_variables: set[str] | None = (
+        set() if job.collect_instance_variables else None
+    )
+    try:
+        result = transpile_gml_code_with_source_map(
+            job.source,
+            instance_variables=instance_variables,
+            asset_names=tables.asset_names,
+            enum_values=tables.enum_values,
+            macro_values=tables.macro_values,
+            macro_configuration=tables.macro_configuration,
+            extension_functions=tables.extension_functions,
+            extension_function_mappings=tables.extension_function_mappings,
+            **job.options,
+        )
+    except GMLTranspileError as error:
+        return GMLTranspileOutcome(
+            result=None,
+            error=error,
+            instance_variables=frozenset(instance_variables or ()),
+        )
+    return GMLTranspileOutcome(
+        result=result,
+        instance_variables=frozenset(instance_variables or ()),
+    )
+
+
+_worker_tables: GMLTranspileTables | None = None
+
+
+def _initialize_worker(tables: GMLTranspileTables) -> None:
+    global _worker_tables
+    _worker_tables = tables
+
+
+def _run_in_worker(
+    function: Callable[[GMLTranspileTables, _Job], _Result],
+    job: _Job,
+) -> _Result:
+    assert _worker_tables is not None
+    return function(_worker_tables, job)
+
+
+class _Cancelled:
+    pass
+
+
+_CANCELLED = _Cancelled()
+
+
+class GMLTranspileEngine:
+    """Run GML transpilation in worker processes for one conversion step.
+
+    Transpiling is pure-Python CPU work, so converter threads serialize on the
+    GIL; this engine moves it to a spawn-based process pool of ``max_workers``
+    processes. Results are always yielded in job order, so generated output
+    does not depend on scheduling. The pool starts lazily once
+    ``parallel_source_bytes`` of GML has been submitted, and jobs run
+    in-process when ``max_workers`` is one or worker processes are
+    unavailable. With a ``cache`` (by default the active transpile cache),
+    previously transpiled jobs are answered from disk without running
+    ``function``. The engine is safe to share between converter threads.
+    """
+
+    def __init__(
+        self,
+        tables: GMLTranspileTables,
+        *,
+        max_workers: int = 1,
+        conversion_running: ConversionRunning | None = None,
+        parallel_source_bytes: int | None = None,
+        cache: GMLTranspileCache | None = None,
+    ) -> None:
+        self.tables = tables
+        self.max_workers = max(1, max_workers)
+        self.conversion_running: ConversionRunning = conversion_running or (lambda: True)
+        self.parallel_source_bytes = (
+            DEFAULT_PARALLEL_SOURCE_BYTES
+            if parallel_source_bytes is None
+            else parallel_source_bytes
+        )
+        self._lock = threading.Lock()
+        self._executor: ProcessPoolExecutor | None = None
+        self._submitted_source_bytes = 0
+        self._in_process_only = self.max_workers < 2
+        self.cache = cache if cache is not None else active_conversion_scope().transpile_cache
+        self._tables_digest: str | None = None
+
+    def __enter__(self) -> GMLTranspileEngine:
+        return self
+
+    def __exit__(self, *_exc_info: object) -> None:
+        self.close()
+
+    @property
+    def uses_worker_processes(self) -> bool:
+        with self._lock:
+            return self._executor is not None
+
+    def close(self) -> None:
+        """Stop the worker processes; later jobs run in-process."""
+        with self._lock:
+            executor = self._executor
+            self._executor = None
+            self._in_process_only = True
+        if executor is not None:
+            executor.shutdown(wait=True, cancel_futures=True)
+
+    def transpile(self, jobs: Iterable[GMLTranspileJob]) -> Iterator[GMLTranspileOutcome]:
+        """Yield one outcome per job, in order, until conversion is stopped."""
+        for _job, outcome in self.map(transpile_job, jobs):
+            yield outcome
+
+    def map(
+        self,
+        function: Callable[[GMLTranspileTables, _Job], _Result],
+        jobs: Iterable[_Job],
+    ) -> Iterator[tuple[_Job, _Result]]:
+        """Yield ``(job, function(tables, job))`` for each job in input order.
+
+        ``function`` must be a module-level callable so worker processes can
+        import it. Jobs are pulled lazily with a bounded look-ahead. Iteration
+        ends early, leaving results missing, once ``conversion_running``
+        reports that conversion was stopped; exceptions raised by
+        ``function`` propagate when the failing job is reached.
+        """
+        job_iterator = iter(jobs)
+        window = self.max_workers * _JOBS_IN_FLIGHT_PER_WORKER
+        # (job, key to store the result under, future or None for in-process)
+        pending: deque[tuple[_Job, str | None, Future[_Result] | None]] = deque()
+        exhausted = False
+        try:
+            while True:
+                while not exhausted and len(pending) < window:
+                    if not self.conversion_running():
+                        return
+                    try:
+                        job = next(job_iterator)
+                    except StopIteration:
+                        exhausted = True
+                        break
+                    pending.append(self._schedule(function, job))
+                if not pending:
+                    return
+                job, cache_key, future = pending.popleft()
+                if future is None:
+                    if not self.conversion_running():
+                        return
+                    result = function(self.tables, job)
+                else:
+                    waited = self._result(function, job, future)
+                    if isinstance(waited, _Cancelled):
+                        return
+                    result = waited
+                if cache_key is not None and self.cache is not None:
+                    self.cache.put(cache_key, result)
+                yield job, result
+        finally:
+            for _job, _cache_key, future in pending:
+                if future is not None:
+                    future.cancel()
+
+    def _schedule(
+        self,
+        function: Callable[[GMLTranspileTables, _Job], _Result],
+        job: _Job,
+    ) -> tuple[_Job, str | None, Future[_Result] | None]:
+        cache_key = self._cache_key(function, job)
+        if cache_key is not None and self.cache is not None:
+            cached = self.cache.get(cache_key)
+            if cached is not None:
+                hit: Future[_Result] = Future()
+                hit.set_result(cast(_Result, cached))
+                return job, None, hit
+        return job, cache_key, self._submit(function, job)
+
+    def _cache_key(
+        self,
+        function: Callable[[GMLTranspileTables, _Job], _Result],
+        job: _Job,
+    ) -> str | None:
+        with self._lock:
+            if self.cache is None:
+                return None
+            if self._tables_digest is None:
+                try:
+                    self._tables_digest = content_digest(self.tables)
+                except UncacheableValue:
+                    self.cache = None
+                    return None
+            tables_digest = self._tables_digest
+        try:
+            return transpile_cache_key(function, tables_digest, job)
+        except UncacheableValue:
+            return None
+
+    def _submit(
+        self,
+        function: Callable[[GMLTranspileTables, _Job], _Result],
+        job: _Job,
+    ) -> Future[_Result] | None:
+        executor = self._worker_pool(len(job.source or ""))
+        if executor is None:
+            return None
+        try:
+            return executor.submit(_run_in_worker, function, job)
+        except (BrokenProcessPool, RuntimeError):
+            self._fall_back_to_in_process()
+            return None
+
+    def _worker_pool(self, source_bytes: int) -> ProcessPoolExecutor | None:
+        with self._lock:
+            self._submitted_source_bytes += source_bytes
+            if self._executor is not None or self._in_process_only:
+                return self._executor
+            if self._submitted_source_bytes < self.parallel_source_bytes:
+                return None
+            try:
+                self._executor = ProcessPoolExecutor(
+                    max_workers=self.max_workers,
+                    # Forking a process that runs converter threads can copy
+                    # held locks into the child; spawn matches Windows/macOS.
+                    mp_context=multiprocessing.get_context("spawn"),
+                    initializer=_initialize_worker,
+                    initargs=(self.tables,),
+                )
+            except (ImportError, NotImplementedError, OSError):
+                self._in_process_only = True
+            return self._executor
+
+    def _result(
+        self,
+        function: Callable[[GMLTranspileTables, _Job], _Result],
+        job: _Job,
+        future: Future[_Result],
+    ) -> _Result | _Cancelled:
+        while not wait((future,), timeout=_CANCEL_POLL_SECONDS).done:
+            if not self.conversion_running():
+                return _CANCELLED
+        try:
+            return future.result()
+        except (BrokenProcessPool, CancelledError):
+            # A worker died or could not start, and the pool was abandoned;
+            # finish this job here.
+            self._fall_back_to_in_process()
+            return function(self.tables, job)
+
+    def _fall_back_to_in_process(self) -> None:
+        with self._lock:
+            executor = self._executor
+            self._executor = None
+            self._in_process_only = True
+        if executor is not None:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+
+__all__ = [
+    "DEFAULT_PARALLEL_SOURCE_BYTES",
+    "GMLSourceJob",
+    "GMLTranspileEngine",
+    "GMLTranspileJob",
+    "GMLTranspileOptions",
+    "GMLTranspileOutcome",
+    "GMLTranspileTables",
+    "transpile_job",
+]
@@ -90,6 +90,7 @@ from src.conversion.gml_transpiler_parts.source_map import (
     analyze_gml_source_identifiers,
     gml_source_map_path,
     merge_gml_source_maps,
+    read_gml_source_map,
     render_gml_source_header,
     write_gml_source_map,
 )
@@ -161,6 +162,7 @@ __all__ = [
     "gml_source_map_path",
     "merge_gml_source_maps",
     "preprocess_gml_source",
+    "read_gml_source_map",
     "render_gml_manual_scope_markdown",
     "render_gml_source_header",
     "transpile_gml_code",
@@ -5,12 +5,8 @@ import hashlib
 from typing import Iterable, Mapping, MutableSet
 
 from .constants import _LEGACY_GLOBAL_BUILTINS
-from .extension_functions import (
-    normalize_extension_function_mappings,
-    normalize_extension_functions,
-)
 from .function_helpers import _emit_static_initialization_lines
-from .preprocessor import preprocess_gml_source
+from .preprocessor import preprocess_gml_source_with_layout
 from .result_models import GMLTranspileResult
 from .shared_models import ScopeContext as _ScopeContext
 from .source_map import (
@@ -19,6 +15,7 @@ from .source_map import (
 )
 from .statement_parser import _StatementParser
 from .static_declarations import _collect_static_declarations, _static_scope_id
+from .symbol_table import project_symbol_table
 from .tokens import _tokenize
 from .utils import _prefix_multiline
 
@@ -108,12 +105,17 @@ def transpile_gml_code_with_source_map(
     macro_values: Mapping[str, str] | None = None,
 ) -> GMLTranspileResult:
     """Transpile supported GML statements and return trace metadata."""
-    preprocessed = preprocess_gml_source(
+    preprocessed, layout = preprocess_gml_source_with_layout(
         source,
         macro_configuration=macro_configuration,
         active_symbols=active_preprocessor_symbols,
     )
     tokens = _tokenize(preprocessed.source)
+    symbols = project_symbol_table(
+        asset_names,
+        extension_functions,
+        extension_function_mappings,
+    )
     known_enum_values = {
         name: dict(members)
         for name, members in (enum_values or {}).items()
@@ -150,7 +152,7 @@ def transpile_gml_code_with_source_map(
         # resolved. Keep source declarations from undoing that selected view
         # when each resource is parsed independently.
         macro_priorities={name: 2 for name in known_macro_values},
-        asset_names=asset_names,
+        asset_names=symbols.asset_names,
         static_scope_prefix=parser_static_prefix,
         scope_context=_ScopeContext(
             self_expression=self_expression,
@@ -164,8 +166,9 @@ def transpile_gml_code_with_source_map(
             ),
             static_prefix=parser_static_prefix or "gml_static",
         ),
-        extension_functions=normalize_extension_functions(extension_functions),
-        extension_function_mappings=normalize_extension_function_mappings(extension_function_mappings),
+        extension_functions=symbols.extension_functions,
+        extension_function_mappings=symbols.extension_function_mappings,
+        track_source_origins=True,
     )
     lines = parser.parse()
     if static_declarations:
@@ -188,18 +191,22 @@ def transpile_gml_code_with_source_map(
     else:
         code = "\n".join(_prefix_multiline(line, indent) if line else "" for line in lines)
 
+    header_line_count = 0
     if preserve_source_comments:
         header = render_gml_source_header(source_path=None, event=None, source=source)
         if header:
-            comment_block = "".join(f"{indent}{line}\n" for line in header.rstrip().splitlines())
+            header_lines = header.rstrip().splitlines()
+            header_line_count = len(header_lines)
+            comment_block = "".join(f"{indent}{line}\n" for line in header_lines)
             code = f"{comment_block}{code}"
 
     source_map = build_gml_source_map(
-        source,
-        code,
+        preprocessed.source,
+        lines,
         source_path=source_path,
         event=event,
-        generated_line_offset=generated_line_offset,
+        generated_line_offset=generated_line_offset + header_line_count,
+        layout=layout,
     )
     return GMLTranspileResult(
         code=code,
@@ -1081,9 +1081,20 @@ def _emit_binary(
 
     if expr.operator in ("&&", "and", "||", "or"):
         operator = "and" if expr.operator in ("&&", "and") else "or"
-        left = _emit_truthy_expression(expr.left, local_names, scope_context=scope_context)
-        right = _emit_truthy_expression(expr.right, local_names, scope_context=scope_context)
-        return f"{left} {operator} {right}", _BINARY_PRECEDENCE[expr.operator]
+        chain_operators = ("&&", "and") if operator == "and" else ("||", "or")
+        # Long left-associative chains are flattened instead of recursing
+        # once per term.
+        operands = [expr.right]
+        leftmost = expr.left
+        while isinstance(leftmost, _Binary) and leftmost.operator in chain_operators:
+            operands.append(leftmost.right)
+            leftmost = leftmost.left
+        operands.append(leftmost)
+        terms = [
+            _emit_truthy_expression(operand, local_names, scope_context=scope_context)
+            for operand in reversed(operands)
+        ]
+        return f" {operator} ".join(terms), _BINARY_PRECEDENCE[expr.operator]
 
     if expr.operator == "^^":
         left = _emit_truthy_expression(expr.left, local_names, scope_context=scope_context)
@@ -1106,16 +1117,7 @@ def _emit_binary(
         return f"{left} if not GMRuntime.gml_is_nullish({left}) else {right}", _TERNARY_PRECEDENCE
 
     if expr.operator in ("=", "==", "!=") and (
-        _contains_gml_undefined(expr.left)
-        or _contains_gml_undefined(expr.right)
-        or _contains_gml_nan(expr.left)
-        or _contains_gml_nan(expr.right)
-        or _contains_gml_pointer(expr.left)
-        or _contains_gml_pointer(expr.right)
-        or _contains_gml_handle(expr.left)
-        or _contains_gml_handle(expr.right)
-        or _may_need_gml_reference_equality(expr.left)
-        or _may_need_gml_reference_equality(expr.right)
+        _equality_flags(expr.left) or _equality_flags(expr.right)
     ):
         left = _emit_expression(expr.left, local_names, scope_context=scope_context)[0]
         right = _emit_expression(expr.right, local_names, scope_context=scope_context)[0]
@@ -1160,191 +1162,123 @@ def _emit_binary(
     return f"{left} {operator} {right}", precedence
 
 
-def _contains_gml_undefined(expr: _Expression) -> bool:
-    if isinstance(expr, _Name):
-        return expr.value == "GMRuntime.gml_undefined()"
-    if isinstance(expr, _Grouped):
-        return _contains_gml_undefined(expr.expr)
-    if isinstance(expr, _Unary):
-        return _contains_gml_undefined(expr.operand)
-    if isinstance(expr, _Binary):
-        return _contains_gml_undefined(expr.left) or _contains_gml_undefined(expr.right)
-    if isinstance(expr, _Ternary):
-        return (
-            _contains_gml_undefined(expr.condition)
-            or _contains_gml_undefined(expr.true_expr)
-            or _contains_gml_undefined(expr.false_expr)
-        )
-    if isinstance(expr, _Call):
-        return _contains_gml_undefined(expr.callee) or any(
-            _contains_gml_undefined(arg) for arg in expr.args
-        )
-    if isinstance(expr, _ArrayLiteral):
-        return any(_contains_gml_undefined(element) for element in expr.elements)
-    if isinstance(expr, _FunctionLiteral):
-        return False
-    if isinstance(expr, _NewCall):
-        return _contains_gml_undefined(expr.constructor) or any(
-            _contains_gml_undefined(arg) for arg in expr.args
-        )
-    if isinstance(expr, _StructLiteral):
-        return any(_contains_gml_undefined(field_value) for _field_name, field_value in expr.fields)
-    if isinstance(expr, _Index):
-        return _contains_gml_undefined(expr.target) or _contains_gml_undefined(expr.index)
-    if isinstance(expr, _StructAccess):
-        return _contains_gml_undefined(expr.target) or _contains_gml_undefined(expr.key)
-    if isinstance(expr, _DSMapAccess):
-        return _contains_gml_undefined(expr.target) or _contains_gml_undefined(expr.key)
-    if isinstance(expr, _DSListAccess):
-        return _contains_gml_undefined(expr.target) or _contains_gml_undefined(expr.index)
-    if isinstance(expr, _Member):
-        return _contains_gml_undefined(expr.target)
-    return False
+# Equality semantics flags of an expression subtree. Any set flag routes
+# ``==``/``!=`` through the GameMaker equality helpers.
+_CONTAINS_UNDEFINED = 1
+_CONTAINS_NAN = 2
+_CONTAINS_POINTER = 4
+_CONTAINS_HANDLE = 8
+_MAY_NEED_REFERENCE_EQUALITY = 16
+_CONTAINED_VALUE_FLAGS = (
+    _CONTAINS_UNDEFINED | _CONTAINS_NAN | _CONTAINS_POINTER | _CONTAINS_HANDLE
+)
+_EQUALITY_FLAGS_ATTRIBUTE = "_gml_equality_flags"
+_NON_REFERENCE_NAMES = frozenset({"true", "false", "INF", "NAN"})
+_POINTER_NAMES = frozenset({"GMRuntime.gml_pointer_null()", "GMRuntime.gml_pointer_invalid()"})
+_REFERENCE_VALUE_TYPES = (
+    _ArrayLiteral,
+    _StructLiteral,
+    _FunctionLiteral,
+    _Call,
+    _NewCall,
+    _Index,
+    _StructAccess,
+    _DSMapAccess,
+    _DSListAccess,
+    _Member,
+)
 
 
-def _contains_gml_nan(expr: _Expression) -> bool:
-    if isinstance(expr, _Name):
-        return expr.value == "NAN"
-    if isinstance(expr, _Grouped):
-        return _contains_gml_nan(expr.expr)
-    if isinstance(expr, _Unary):
-        return _contains_gml_nan(expr.operand)
-    if isinstance(expr, _Binary):
-        return _contains_gml_nan(expr.left) or _contains_gml_nan(expr.right)
-    if isinstance(expr, _Ternary):
-        return (
-            _contains_gml_nan(expr.condition)
-            or _contains_gml_nan(expr.true_expr)
-            or _contains_gml_nan(expr.false_expr)
-        )
-    if isinstance(expr, _Call):
-        return _contains_gml_nan(expr.callee) or any(_contains_gml_nan(arg) for arg in expr.args)
-    if isinstance(expr, _ArrayLiteral):
-        return any(_contains_gml_nan(element) for element in expr.elements)
-    if isinstance(expr, _FunctionLiteral):
-        return False
-    if isinstance(expr, _NewCall):
-        return _contains_gml_nan(expr.constructor) or any(
-            _contains_gml_nan(arg) for arg in expr.args
-        )
-    if isinstance(expr, _StructLiteral):
-        return any(_contains_gml_nan(field_value) for _field_name, field_value in expr.fields)
-    if isinstance(expr, _Index):
-        return _contains_gml_nan(expr.target) or _contains_gml_nan(expr.index)
-    if isinstance(expr, _StructAccess):
-        return _contains_gml_nan(expr.target) or _contains_gml_nan(expr.key)
-    if isinstance(expr, _DSMapAccess):
-        return _contains_gml_nan(expr.target) or _contains_gml_nan(expr.key)
-    if isinstance(expr, _DSListAccess):
-        return _contains_gml_nan(expr.target) or _contains_gml_nan(expr.index)
-    if isinstance(expr, _Member):
-        return _contains_gml_nan(expr.target)
-    return False
+def _name_equality_flags(value: str) -> int:
+    flags = 0 if value in _NON_REFERENCE_NAMES else _MAY_NEED_REFERENCE_EQUALITY
+    if value == "GMRuntime.gml_undefined()":
+        flags |= _CONTAINS_UNDEFINED
+    elif value == "NAN":
+        flags |= _CONTAINS_NAN
+    elif value in _POINTER_NAMES:
+        flags |= _CONTAINS_POINTER
+    elif value == "GMRuntime.gml_instance_noone()":
+        flags |= _CONTAINS_HANDLE
+    return flags
 
 
-def _contains_gml_pointer(expr: _Expression) -> bool:
-    if isinstance(expr, _Name):
-        return expr.value in ("GMRuntime.gml_pointer_null()", "GMRuntime.gml_pointer_invalid()")
+def _equality_children(expr: _Expression) -> tuple[tuple[_Expression, int], ...]:
+    """Return each child with the flags it contributes to ``expr``."""
     if isinstance(expr, _Grouped):
-        return _contains_gml_pointer(expr.expr)
+        return ((expr.expr, -1),)
     if isinstance(expr, _Unary):
-        return _contains_gml_pointer(expr.operand)
+        return ((expr.operand, -1),)
     if isinstance(expr, _Binary):
-        return _contains_gml_pointer(expr.left) or _contains_gml_pointer(expr.right)
+        return ((expr.left, -1), (expr.right, -1))
     if isinstance(expr, _Ternary):
-        return (
-            _contains_gml_pointer(expr.condition)
-            or _contains_gml_pointer(expr.true_expr)
-            or _contains_gml_pointer(expr.false_expr)
-        )
+        return ((expr.condition, -1), (expr.true_expr, -1), (expr.false_expr, -1))
     if isinstance(expr, _Call):
+        # Only undefined and NaN are looked for in the callee.
         return (
-            isinstance(expr.callee, _Name)
-            and expr.callee.value == "ptr"
-        ) or any(_contains_gml_pointer(arg) for arg in expr.args)
+            (expr.callee, _CONTAINS_UNDEFINED | _CONTAINS_NAN),
+            *((arg, _CONTAINED_VALUE_FLAGS) for arg in expr.args),
+        )
     if isinstance(expr, _ArrayLiteral):
-        return any(_contains_gml_pointer(element) for element in expr.elements)
-    if isinstance(expr, _FunctionLiteral):
-        return False
+        return tuple((element, _CONTAINED_VALUE_FLAGS) for element in expr.elements)
     if isinstance(expr, _NewCall):
-        return _contains_gml_pointer(expr.constructor) or any(
-            _contains_gml_pointer(arg) for arg in expr.args
+        return (
+            (expr.constructor, _CONTAINED_VALUE_FLAGS),
+            *((arg, _CONTAINED_VALUE_FLAGS) for arg in expr.args),
         )
     if isinstance(expr, _StructLiteral):
-        return any(_contains_gml_pointer(field_value) for _field_name, field_value in expr.fields)
-    if isinstance(expr, _Index):
-        return _contains_gml_pointer(expr.target) or _contains_gml_pointer(expr.index)
-    if isinstance(expr, _StructAccess):
-        return _contains_gml_pointer(expr.target) or _contains_gml_pointer(expr.key)
-    if isinstance(expr, _DSMapAccess):
-        return _contains_gml_pointer(expr.target) or _contains_gml_pointer(expr.key)
-    if isinstance(expr, _DSListAccess):
-        return _contains_gml_pointer(expr.target) or _contains_gml_pointer(expr.index)
+        return tuple((value, _CONTAINED_VALUE_FLAGS) for _field_name, value in expr.fields)
+    if isinstance(expr, (_Index, _DSListAccess)):
+        return ((expr.target, _CONTAINED_VALUE_FLAGS), (expr.index, _CONTAINED_VALUE_FLAGS))
+    if isinstance(expr, (_StructAccess, _DSMapAccess)):
+        return ((expr.target, _CONTAINED_VALUE_FLAGS), (expr.key, _CONTAINED_VALUE_FLAGS))
     if isinstance(expr, _Member):
-        return _contains_gml_pointer(expr.target)
-    return False
+        return ((expr.target, _CONTAINED_VALUE_FLAGS),)
+    return ()
 
 
-def _contains_gml_handle(expr: _Expression) -> bool:
-    if isinstance(expr, _Name):
-        return expr.value == "GMRuntime.gml_instance_noone()"
-    if isinstance(expr, _Grouped):
-        return _contains_gml_handle(expr.expr)
-    if isinstance(expr, _Unary):
-        return _contains_gml_handle(expr.operand)
-    if isinstance(expr, _Binary):
-        return _contains_gml_handle(expr.left) or _contains_gml_handle(expr.right)
-    if isinstance(expr, _Ternary):
-        return (
-            _contains_gml_handle(expr.condition)
-            or _contains_gml_handle(expr.true_expr)
-            or _contains_gml_handle(expr.false_expr)
-        )
-    if isinstance(expr, _Call):
-        return any(_contains_gml_handle(arg) for arg in expr.args)
-    if isinstance(expr, _ArrayLiteral):
-        return any(_contains_gml_handle(element) for element in expr.elements)
-    if isinstance(expr, _FunctionLiteral):
-        return False
-    if isinstance(expr, _NewCall):
-        return _contains_gml_handle(expr.constructor) or any(
-            _contains_gml_handle(arg) for arg in expr.args
-        )
-    if isinstance(expr, _StructLiteral):
-        return any(_contains_gml_handle(field_value) for _field_name, field_value in expr.fields)
-    if isinstance(expr, _Index):
-        return _contains_gml_handle(expr.target) or _contains_gml_handle(expr.index)
-    if isinstance(expr, _StructAccess):
-        return _contains_gml_handle(expr.target) or _contains_gml_handle(expr.key)
-    if isinstance(expr, _DSMapAccess):
-        return _contains_gml_handle(expr.target) or _contains_gml_handle(expr.key)
-    if isinstance(expr, _DSListAccess):
-        return _contains_gml_handle(expr.target) or _contains_gml_handle(expr.index)
-    if isinstance(expr, _Member):
-        return _contains_gml_handle(expr.target)
-    return False
+def _cached_equality_flags(expr: _Expression) -> int | None:
+    flags = vars(expr).get(_EQUALITY_FLAGS_ATTRIBUTE)
+    return flags if isinstance(flags, int) else None
 
 
-def _may_need_gml_reference_equality(expr: _Expression) -> bool:
-    if isinstance(expr, _Name):
-        return expr.value not in {"true", "false", "INF", "NAN"}
-    if isinstance(expr, (_ArrayLiteral, _StructLiteral, _FunctionLiteral)):
-        return True
-    if isinstance(expr, (_Call, _NewCall, _Index, _StructAccess, _DSMapAccess, _DSListAccess, _Member)):
-        return True
-    if isinstance(expr, _Grouped):
-        return _may_need_gml_reference_equality(expr.expr)
-    if isinstance(expr, _Unary):
-        return _may_need_gml_reference_equality(expr.operand)
-    if isinstance(expr, _Binary):
-        return _may_need_gml_reference_equality(expr.left) or _may_need_gml_reference_equality(expr.right)
-    if isinstance(expr, _Ternary):
-        return (
-            _may_need_gml_reference_equality(expr.condition)
-            or _may_need_gml_reference_equality(expr.true_expr)
-            or _may_need_gml_reference_equality(expr.false_expr)
-        )
-    return False
+def _equality_flags(expr: _Expression) -> int:
+    """Return the equality flags of ``expr``, annotating each node once.
+
+    Flags are computed bottom-up with an explicit stack and stored on the
+    frozen nodes, so repeated queries over nested comparisons and very long
+    boolean chains stay linear instead of re-walking every subtree.
+    """
+    cached = _cached_equality_flags(expr)
+    if cached is not None:
+        return cached
+    pending: list[tuple[_Expression, bool]] = [(expr, False)]
+    while pending:
+        node, children_done = pending.pop()
+        if _cached_equality_flags(node) is not None:
+            continue
+        children = _equality_children(node)
+        if not children_done and children:
+            pending.append((node, True))
+            pending.extend(
+                (child, False)
+                for child, _mask in children
+                if _cached_equality_flags(child) is None
+            )
+            continue
+        if isinstance(node, _Name):
+            flags = _name_equality_flags(node.value)
+        elif isinstance(node, _FunctionLiteral):
+            flags = _MAY_NEED_REFERENCE_EQUALITY
+        else:
+            flags = 0
+            for child, mask in children:
+                flags |= vars(child)[_EQUALITY_FLAGS_ATTRIBUTE] & mask
+            if isinstance(node, _Call) and isinstance(node.callee, _Name) and node.callee.value == "ptr":
+                flags |= _CONTAINS_POINTER
+            if isinstance(node, _REFERENCE_VALUE_TYPES):
+                flags |= _MAY_NEED_REFERENCE_EQUALITY
+        object.__setattr__(node, _EQUALITY_FLAGS_ATTRIBUTE, flags)
+    return vars(expr)[_EQUALITY_FLAGS_ATTRIBUTE]
 
 
 def _emit_truthy_expression(
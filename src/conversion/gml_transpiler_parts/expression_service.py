@@ -5,12 +5,9 @@ from typing import Iterable, Mapping, MutableMapping
 
 from .emitter import _emit_expression, _emit_truthy_expression
 from .enum_helpers import _reject_enum_mutation_expression
-from .extension_functions import (
-    normalize_extension_function_mappings,
-    normalize_extension_functions,
-)
 from .expression_parser import _parse_gml_expression
 from .shared_models import ScopeContext as _ScopeContext
+from .symbol_table import project_symbol_table
 from .utils import _normalize_local_names, _normalize_scope_context, _scope_context_with_global_names
 
 
@@ -27,12 +24,13 @@ def transpile_gml_expression(
     extension_function_mappings: object = None,
 ) -> str:
     """Transpile a single GML expression to a GDScript expression."""
+    symbols = project_symbol_table(asset_names, extension_functions, extension_function_mappings)
     scope_context = _scope_context_with_global_names(
         _normalize_scope_context(scope_context),
         global_names,
-        asset_names=asset_names,
-        extension_functions=normalize_extension_functions(extension_functions),
-        extension_function_mappings=normalize_extension_function_mappings(extension_function_mappings),
+        asset_names=symbols.asset_names,
+        extension_functions=symbols.extension_functions,
+        extension_function_mappings=symbols.extension_function_mappings,
     )
     expr = _parse_gml_expression(
         source,
@@ -62,12 +60,13 @@ def transpile_gml_condition(
     extension_function_mappings: object = None,
 ) -> str:
     """Transpile a GML condition using GameMaker truthiness semantics."""
+    symbols = project_symbol_table(asset_names, extension_functions, extension_function_mappings)
     scope_context = _scope_context_with_global_names(
         _normalize_scope_context(scope_context),
         global_names,
-        asset_names=asset_names,
-        extension_functions=normalize_extension_functions(extension_functions),
-        extension_function_mappings=normalize_extension_function_mappings(extension_function_mappings),
+        asset_names=symbols.asset_names,
+        extension_functions=symbols.extension_functions,
+        extension_function_mappings=symbols.extension_function_mappings,
     )
     expr = _parse_gml_expression(
         source,
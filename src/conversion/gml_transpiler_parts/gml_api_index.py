@@ -0,0 +1,144 @@
+# pyright: reportPrivateUsage=false
+from __future__ import annotations
+
+import hashlib
+import pickle
+import sys
+from collections.abc import Mapping, Sequence
+from dataclasses import dataclass
+from functools import cache
+from pathlib import Path
+from typing import TYPE_CHECKING, Literal, cast
+
+if TYPE_CHECKING:
+    from .gml_api_manifest import GMLAPIEntry
+    from .gml_function_dispatch import GMLFunctionDescriptor
+
+GML_API_INDEX_FORMAT_VERSION = 1
+GML_API_INDEX_PATH = Path(__file__).with_name("gml_api_index.pickle")
+_PICKLE_PROTOCOL = 5
+
+_PACKAGE_DIR = Path(__file__).resolve().parent
+# Every module whose definitions shape the index; editing any of them makes a
+# previously written index stale.
+_INDEX_SOURCE_MODULES = (
+    "constants.py",
+    "gml_api_index.py",
+    "gml_api_manifest.py",
+    "gml_api_manifest_entries.py",
+    "gml_function_dispatch.py",
+    "gml_function_dispatch_table.py",
+)
+
+_IndexPayload = tuple[
+    "tuple[GMLAPIEntry, ...]",
+    tuple[tuple[str, int], ...],
+    "tuple[GMLFunctionDescriptor, ...]",
+]
+
+
+@dataclass(frozen=True)
+class GMLAPIIndex:
+    """GML API manifest entries and function-dispatch descriptors by name."""
+
+    api_entries: tuple[GMLAPIEntry, ...]
+    api_entry_by_name: Mapping[str, GMLAPIEntry]
+    category_issue_numbers: Mapping[str, int]
+    function_descriptors: Mapping[str, GMLFunctionDescriptor]
+    source: Literal["precompiled", "python"]
+
+
+@cache
+def gml_api_index() -> GMLAPIIndex:
+    """Return the API index, loading it on first lookup.
+
+    The precompiled index is used when its digest matches the current source
+    modules; otherwise the Python definitions are imported and evaluated.
+    """
+    index = load_precompiled_gml_api_index()
+    return index if index is not None else build_gml_api_index()
+
+
+def gml_api_index_digest() -> str | None:
+    digest = hashlib.sha256(
+        f"{GML_API_INDEX_FORMAT_VERSION}:{_PICKLE_PROTOCOL}\0".encode("ascii")
+    )
+    for module_name in _INDEX_SOURCE_MODULES:
+        try:
+            source = (_PACKAGE_DIR / module_name).read_bytes()
+        except OSError:
+            return None
+        digest.update(module_name.encode("ascii") + b"\0")
+        digest.update(hashlib.sha256(source).digest())
+    return digest.hexdigest()
+
+
+def build_gml_api_index() -> GMLAPIIndex:
+    """Evaluate the Python definitions of the manifest and dispatch tables."""
+    from .gml_api_manifest_entries import _CATEGORY_ISSUE_NUMBERS, _GML_API_ENTRIES
+    from .gml_function_dispatch_table import _build_function_descriptors
+
+    return GMLAPIIndex(
+        api_entries=_GML_API_ENTRIES,
+        api_entry_by_name={entry.name: entry for entry in _GML_API_ENTRIES},
+        category_issue_numbers=dict(_CATEGORY_ISSUE_NUMBERS),
+        function_descriptors=_build_function_descriptors(),
+        source="python",
+    )
+
+
+def load_precompiled_gml_api_index(
+    path: Path = GML_API_INDEX_PATH,
+) -> GMLAPIIndex | None:
+    """Return the index stored at ``path``, or None when missing or stale.
+
+    The file starts with the source digest on its own line, so a stale index
+    is rejected before its body is unpickled.
+    """
+    try:
+        with open(path, "rb") as index_file:
+            digest = index_file.readline().rstrip(b"\n").decode("ascii")
+            current_digest = gml_api_index_digest()
+            if current_digest is None or digest != current_digest:
+                return None
+            payload = cast(_IndexPayload, pickle.loads(index_file.read()))
+    except (OSError, EOFError, ValueError, pickle.UnpicklingError):
+        return None
+    entries, category_rows, descriptors = payload
+    return GMLAPIIndex(
+        api_entries=entries,
+        api_entry_by_name={entry.name: entry for entry in entries},
+        category_issue_numbers=dict(category_rows),
+        function_descriptors={descriptor.name: descriptor for descriptor in descriptors},
+        source="precompiled",
+    )
+
+
+def write_gml_api_index(path: Path = GML_API_INDEX_PATH) -> Path:
+    """Freeze the Python definitions into the precompiled index at ``path``."""
+    digest = gml_api_index_digest()
+    if digest is None:
+        raise OSError(f"GML API index sources are not readable in {_PACKAGE_DIR}")
+    index = build_gml_api_index()
+    payload: _IndexPayload = (
+        index.api_entries,
+        tuple(index.category_issue_numbers.items()),
+        tuple(index.function_descriptors.values()),
+    )
+    temporary_path = path.with_name(f".{path.name}.tmp")
+    with open(temporary_path, "wb") as index_file:
+        index_file.write(digest.encode("ascii") + b"\n")
+        pickle.dump(payload, index_file, protocol=_PICKLE_PROTOCOL)
+    temporary_path.replace(path)
+    return path
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    arguments = list(sys.argv[1:] if argv is None else argv)
+    path = write_gml_api_index(Path(arguments[0]) if arguments else GML_API_INDEX_PATH)
+    print(f"Wrote GML API index to {path}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,7983 @@
+# pyright: reportPrivateUsage=false
+from __future__ import annotations
+
+from .gml_api_manifest import GMLAPIEntry, GMLAPISupportFlag, GMLAPISupportStatus
+
+_GM_DOCS = "https://manual.gamemaker.io/monthly/en"
+
+_CATEGORY_ISSUE_NUMBERS = {
+    "Foundation": 482,
+    "Runtime Function Dispatch": 483,
+    "Asset Management": 484,
+    "Instances": 485,
+    "Cross-Instance Addressing": 486,
+    "Movement and Collisions": 487,
+    "Motion Helpers": 488,
+    "Paths and Motion Planning": 489,
+    "Drawing Basic Forms": 490,
+    "Drawing Sprites Text Fonts": 491,
+    "Drawing Surfaces": 492,
+    "Cameras and Display": 493,
+    "Game Input": 494,
+    "Audio": 495,
+    "General Game Control": 496,
+    "Rooms and Layers": 566,
+    "Sequences and Timelines": 567,
+    "Time": 497,
+    "Data Structures Sequential": 498,
+    "Data Structures Sequential": 498,
+    "Data Structures Maps": 499,
+    "Data Structures Grids": 500,
+    "Accessors": 501,
+    "Arrays": 502,
+    "Strings": 503,
+    "Maths and Numbers": 504,
+    "Files INI JSON": 505,
+    "Buffers": 506,
+    "Asynchronous Functions": 507,
+    "Networking": 508,
+    "Particles GPU Effects": 509,
+    "Shaders": 510,
+    "Physics": 511,
+    "Script Functions": 512,
+    "Preprocessor": 513,
+    "Sprites and Textures": 568,
+    "Flex Panels": 514,
+    "OS Compiler Debug GC": 515,
+    "OS and Device Media": 569,
+    "Platform Services": 570,
+    "Extensions": 517,
+    "Full-Game Fixtures": 518,
+}
+
+
+def _entry(
+    name: str,
+    category: str,
+    status: GMLAPISupportStatus,
+    owner_module: str,
+    parser_support: GMLAPISupportFlag,
+    emitter_support: GMLAPISupportFlag,
+    runtime_support: GMLAPISupportFlag,
+    smoke_coverage: GMLAPISupportFlag,
+    docs_path: str,
+    notes: str,
+    issue_number: int | None = None,
+) -> GMLAPIEntry:
+    return GMLAPIEntry(
+        name=name,
+        category=category,
+        status=status,
+        issue_number=issue_number or _CATEGORY_ISSUE_NUMBERS[category],
+        owner_module=owner_module,
+        parser_support=parser_support,
+        emitter_support=emitter_support,
+        runtime_support=runtime_support,
+        smoke_coverage=smoke_coverage,
+        docs_url=f"{_GM_DOCS}/{docs_path}",
+        notes=notes,
+    )
+
+
+_LAYER_DOCS_PATH = (
+    "GameMaker_Language/GML_Reference/Asset_Management/Rooms/"
+    "General_Layer_Functions/General_Layer_Functions.htm"
+)
+_LAYER_OWNER_MODULE = "src.conversion.gml_runtime_parts.segments.11_layers"
+_TILEMAP_DOCS_PATH = (
+    "GameMaker_Language/GML_Reference/Asset_Management/Rooms/"
+    "Tile_Map_Layers/Tile_Map_Layers.htm"
+)
+_LAYER_IMPLEMENTED_APIS = frozenset(
+    {
+        "layer_exists",
+        "layer_get_id",
+        "layer_get_id_at_depth",
+        "layer_get_name",
+        "layer_get_all",
+        "layer_get_depth",
+        "layer_get_x",
+        "layer_get_y",
+        "layer_get_hspeed",
+        "layer_get_vspeed",
+        "layer_depth",
+        "layer_x",
+        "layer_y",
+        "layer_hspeed",
+        "layer_vspeed",
+        "layer_create",
+        "layer_destroy",
+        "layer_add_instance",
+        "layer_get_all_elements",
+        "layer_element_move",
+        "layer_get_element_type",
+        "layer_set_visible",
+        "layer_get_visible",
+        "layer_background_get_id",
+        "layer_background_alpha",
+        "layer_background_blend",
+    }
+)
+_TILEMAP_IMPLEMENTED_APIS = frozenset(
+    {
+        "layer_tilemap_get_id",
+        "layer_tilemap_create",
+        "tilemap_set",
+        "tilemap_get",
+        "tilemap_get_width",
+        "tilemap_get_height",
+    }
+)
+_LAYER_UNSUPPORTED_ELEMENT_APIS = (
+    (
+        "layer_background_create",
+        "Runtime background elements are not created until background asset conversion has a mutable runtime representation.",
+    ),
+    (
+        "layer_sprite_get_id",
+        "Sprite asset layer elements need the texture/skeletal API surface tracked by #568.",
+    ),
+    (
+        "layer_sprite_create",
+        "Runtime sprite layer elements are deferred to texture/sprite element compatibility tracked by #568.",
+    ),
+    (
+        "layer_particle_get_instance",
+        "Particle layer elements are resolved by particle system handles; direct layer element particle instances remain tracked by #564/#566.",
+    ),
+    (
+        "layer_particle_create",
+        "Runtime particle layer element creation remains delegated to the particle system compatibility surface from #564.",
+    ),
+)
+
+
+def _layer_entries() -> tuple[GMLAPIEntry, ...]:
+    implemented_entries = tuple(
+        _entry(
+            name,
+            "Rooms and Layers",
+            "implemented",
+            _LAYER_OWNER_MODULE,
+            "yes",
+            "yes",
+            "yes",
+            "yes"
+            if name
+            in {
+                "layer_get_id",
+                "layer_get_all",
+                "layer_create",
+                "layer_add_instance",
+                "layer_get_all_elements",
+                "layer_get_element_type",
+                "layer_background_get_id",
+                "layer_background_alpha",
+                "layer_background_blend",
+            }
+            else "no",
+            _LAYER_DOCS_PATH,
+            "Implemented through a GMRuntime layer registry that maps converted room layer metadata and runtime-created Node2D layers to stable handles.",
+        )
+        for name in sorted(_LAYER_IMPLEMENTED_APIS)
+    )
+    tilemap_entries = tuple(
+        _entry(
+            name,
+            "Rooms and Layers",
+            "implemented",
+            _LAYER_OWNER_MODULE,
+            "yes",
+            "yes",
+            "yes",
+            "yes",
+            _TILEMAP_DOCS_PATH,
+            "Creates and edits TileMapLayer elements through stable GMRuntime layer-element handles while preserving GameMaker cell bounds and tile-data transform flags.",
+            issue_number=566,
+        )
+        for name in sorted(_TILEMAP_IMPLEMENTED_APIS)
+    )
+    unsupported_entries = tuple(
+        _entry(
+            name,
+            "Rooms and Layers",
+            "unsupported",
+            _LAYER_OWNER_MODULE,
+            "yes",
+            "n/a",
+            "n/a",
+            "no",
+            _LAYER_DOCS_PATH,
+            notes,
+        )
+        for name, notes in _LAYER_UNSUPPORTED_ELEMENT_APIS
+    )
+    return implemented_entries + tilemap_entries + unsupported_entries
+
+
+_SEQUENCE_DOCS_PATH = "GameMaker_Language/GML_Reference/Asset_Management/Sequences/Sequences.htm"
+_TIMELINE_DOCS_PATH = "GameMaker_Language/GML_Reference/Asset_Management/Timelines/Timelines.htm"
+_SEQUENCE_TIMELINE_OWNER_MODULE = "src.conversion.gml_runtime_parts.segments.61_sequences_timelines"
+_TIMELINE_PARTIAL_APIS = frozenset(
+    {
+        "timeline_exists",
+        "timeline_get_name",
+        "timeline_moment_add_script",
+        "timeline_moment_clear",
+        "timeline_clear",
+        "timeline_size",
+        "timeline_max_moment",
+        "timeline_step",
+    }
+)
+_SEQUENCE_PARTIAL_APIS = frozenset(
+    {
+        "sequence_exists",
+        "sequence_get",
+        "sequence_create",
+        "sequence_destroy",
+        "layer_sequence_create",
+        "layer_sequence_destroy",
+        "layer_sequence_get_instance",
+        "layer_sequence_headpos",
+        "layer_sequence_get_headpos",
+        "layer_sequence_speedscale",
+        "layer_sequence_get_speedscale",
+        "layer_sequence_headdir",
+        "layer_sequence_get_headdir",
+        "layer_sequence_pause",
+        "layer_sequence_play",
+        "layer_sequence_is_paused",
+        "layer_sequence_is_finished",
+        "layer_sequence_step",
+    }
+)
+_SEQUENCE_UNSUPPORTED_APIS = (
+    (
+        "sequence_track_new",
+        "Runtime track authoring is rejected until GameMaker sequence track structs can be converted to Godot AnimationPlayer/Animation resources.",
+    ),
+    (
+        "sequence_keyframe_new",
+        "Runtime keyframe authoring is rejected until authored sequence tracks are mapped to AnimationPlayer tracks.",
+    ),
+    (
+        "sequence_keyframedata_new",
+        "Runtime keyframe data structs are rejected until sequence track evaluation has a Godot AnimationPlayer-backed representation.",
+    ),
+    (
+        "sequence_get_objects",
+        "Object-track introspection is unsupported until converted sequence tracks preserve object bindings.",
+    ),
+    (
+        "sequence_instance_override_object",
+        "Sequence object-track overrides are unsupported until object tracks are converted rather than stored as metadata only.",
+    ),
+)
+
+
+def _sequence_timeline_entries() -> tuple[GMLAPIEntry, ...]:
+    timeline_entries = tuple(
+        _entry(
+            name,
+            "Sequences and Timelines",
+            "partial",
+            _SEQUENCE_TIMELINE_OWNER_MODULE,
+            "yes",
+            "yes",
+            "partial",
+            "yes" if name in {"timeline_moment_add_script", "timeline_step"} else "no",
+            _TIMELINE_DOCS_PATH,
+            "Timeline asset lookup, deterministic authored GML moment conversion, and frame-ordered runtime scheduling are supported; dynamic timeline creation/deletion remains outside this authored-asset slice.",
+            issue_number=567,
+        )
+        for name in sorted(_TIMELINE_PARTIAL_APIS)
+    )
+    sequence_entries = tuple(
+        _entry(
+            name,
+            "Sequences and Timelines",
+            "partial",
+            _SEQUENCE_TIMELINE_OWNER_MODULE,
+            "yes",
+            "yes",
+            "partial",
+            "yes"
+            if name
+            in {
+                "layer_sequence_create",
+                "layer_sequence_get_instance",
+                "layer_sequence_headpos",
+                "layer_sequence_speedscale",
+                "layer_sequence_pause",
+                "layer_sequence_step",
+            }
+            else "no",
+            _SEQUENCE_DOCS_PATH,
+            "Sequence object/instance state and supported authored sprite, instance, audio, text, nested-sequence, effect, moment, and broadcast tracks use deterministic generated descriptors and runtime evaluation; unsupported track/key types are diagnosed.",
+            issue_number=567,
+        )
+        for name in sorted(_SEQUENCE_PARTIAL_APIS)
+    )
+    unsupported_entries = tuple(
+        _entry(
+            name,
+            "Sequences and Timelines",
+            "unsupported",
+            _SEQUENCE_TIMELINE_OWNER_MODULE,
+            "yes",
+            "n/a",
+            "n/a",
+            "no",
+            _SEQUENCE_DOCS_PATH,
+            notes,
+            issue_number=567,
+        )
+        for name, notes in _SEQUENCE_UNSUPPORTED_APIS
+    )
+    return timeline_entries + sequence_entries + unsupported_entries
+
+
+_TEXTURE_DOCS_PATH = "GameMaker_Language/GML_Reference/Drawing/Textures/Textures.htm"
+_SKELETAL_DOCS_PATH = (
+    "GameMaker_Language/GML_Reference/Asset_Management/Sprites/"
+    "Skeletal_Animation/Skeletal_Animation.htm"
+)
+_SPRITES_TEXTURES_OWNER_MODULE = "src.conversion.gml_runtime_parts.segments.48_drawing_basic_forms"
+_TEXTURE_PARTIAL_APIS = frozenset(
+    {
+        "sprite_get_uvs",
+        "texture_get_texel_width",
+        "texture_get_texel_height",
+        "texture_get_uvs",
+        "texture_is_ready",
+        "texture_prefetch",
+        "texture_flush",
+        "sprite_prefetch",
+        "sprite_flush",
+        "sprite_prefetch_multi",
+        "sprite_flush_multi",
+        "draw_texture_flush",
+        "draw_flush",
+        "texture_global_scale",
+        "texture_debug_messages",
+        "texturegroup_set_mode",
+        "texturegroup_load",
+        "texturegroup_unload",
+        "texturegroup_get_status",
+        "texturegroup_get_names",
+        "texturegroup_get_textures",
+        "texturegroup_get_sprites",
+        "texturegroup_get_fonts",
+        "texturegroup_get_tilesets",
+    }
+)
+_SKELETAL_UNSUPPORTED_APIS = (
+    "skeleton_animation_get",
+    "skeleton_animation_set",
+    "skeleton_animation_get_ext",
+    "skeleton_animation_set_ext",
+    "skeleton_animation_get_duration",
+    "skeleton_animation_mix",
+    "skeleton_animation_list",
+    "skeleton_animation_clear",
+    "skeleton_animation_get_frames",
+    "skeleton_animation_get_frame",
+    "skeleton_animation_set_frame",
+    "skeleton_animation_get_position",
+    "skeleton_animation_set_position",
+    "skeleton_animation_get_event_frames",
+    "skeleton_animation_is_looping",
+    "skeleton_animation_is_finished",
+    "skeleton_skin_get",
+    "skeleton_skin_set",
+    "skeleton_skin_list",
+    "skeleton_attachment_get",
+    "skeleton_attachment_set",
+    "skeleton_bone_data_get",
+    "skeleton_bone_data_set",
+    "skeleton_bone_state_get",
+    "skeleton_bone_state_set",
+    "skeleton_slot_data",
+    "skeleton_slot_colour_set",
+    "skeleton_slot_colour_get",
+    "skeleton_collision_draw_set",
+)
+
+
+def _sprites_textures_entries() -> tuple[GMLAPIEntry, ...]:
+    texture_entries = tuple(
+        _entry(
+            name,
+            "Sprites and Textures",
+            "partial",
+            _SPRITES_TEXTURES_OWNER_MODULE,
+            "n/a",
+            "yes",
+            "partial",
+            "yes"
+            if name
+            in {
+                "sprite_get_uvs",
+                "texture_get_texel_width",
+                "texture_get_texel_height",
+                "texture_get_uvs",
+                "texturegroup_get_names",
+                "texturegroup_get_sprites",
+            }
+            else "no",
+            _TEXTURE_DOCS_PATH,
+            "Exposes stable texture-page compatibility metadata over Godot Texture2D resources; texture group load/unload APIs are deterministic no-ops over imported resources.",
+            issue_number=568,
+        )
+        for name in sorted(_TEXTURE_PARTIAL_APIS)
+    )
+    skeletal_entries = tuple(
+        _entry(
+            name,
+            "Sprites and Textures",
+            "unsupported",
+            _SPRITES_TEXTURES_OWNER_MODULE,
+            "yes",
+            "n/a",
+            "n/a",
+            "no",
+            _SKELETAL_DOCS_PATH,
+            "Spine/skeletal sprite APIs require source skeleton data conversion to Godot Skeleton2D/AnimationPlayer; GM2Godot emits an explicit diagnostic instead of generating invalid GDScript.",
+            issue_number=568,
+        )
+        for name in _SKELETAL_UNSUPPORTED_APIS
+    )
+    return texture_entries + skeletal_entries
+
+
+_FLEXPANEL_DOCS_PATH = "GameMaker_Language/GML_Reference/Flex_Panels/Flex_Panels.htm"
+_FLEXPANEL_OWNER_MODULE = "src.conversion.gml_runtime_parts.segments.71_flex_panels"
+_FLEXPANEL_IMPLEMENTED_APIS = frozenset(
+    {
+        "flexpanel_create_node",
+        "flexpanel_delete_node",
+        "flexpanel_node_insert_child",
+        "flexpanel_node_remove_child",
+        "flexpanel_node_remove_all_children",
+        "flexpanel_node_set_name",
+        "flexpanel_node_layout_get_position",
+        "flexpanel_node_get_num_children",
+        "flexpanel_node_get_child",
+        "flexpanel_node_get_child_hash",
+        "flexpanel_node_get_parent",
+        "flexpanel_node_get_name",
+        "flexpanel_node_get_data",
+        "flexpanel_node_get_struct",
+        "flexpanel_node_get_measure_function",
+    }
+)
+_FLEXPANEL_UNSUPPORTED_APIS = frozenset({"flexpanel_node_set_measure_function"})
+_FLEXPANEL_PARTIAL_APIS = (
+    "flexpanel_calculate_layout",
+    "flexpanel_node_style_set_width",
+    "flexpanel_node_style_set_height",
+    "flexpanel_node_style_set_min_width",
+    "flexpanel_node_style_set_max_width",
+    "flexpanel_node_style_set_min_height",
+    "flexpanel_node_style_set_max_height",
+    "flexpanel_node_style_set_aspect_ratio",
+    "flexpanel_node_style_set_position",
+    "flexpanel_node_style_set_position_type",
+    "flexpanel_node_style_set_margin",
+    "flexpanel_node_style_set_padding",
+    "flexpanel_node_style_set_border",
+    "flexpanel_node_style_set_gap",
+    "flexpanel_node_style_set_direction",
+    "flexpanel_node_style_set_flex_direction",
+    "flexpanel_node_style_set_flex_wrap",
+    "flexpanel_node_style_set_flex_basis",
+    "flexpanel_node_style_set_flex_grow",
+    "flexpanel_node_style_set_flex_shrink",
+    "flexpanel_node_style_set_flex",
+    "flexpanel_node_style_set_justify_content",
+    "flexpanel_node_style_set_align_items",
+    "flexpanel_node_style_set_align_self",
+    "flexpanel_node_style_set_align_content",
+    "flexpanel_node_style_set_display",
+    "flexpanel_node_style_get_width",
+    "flexpanel_node_style_get_height",
+    "flexpanel_node_style_get_min_width",
+    "flexpanel_node_style_get_max_width",
+    "flexpanel_node_style_get_min_height",
+    "flexpanel_node_style_get_max_height",
+    "flexpanel_node_style_get_aspect_ratio",
+    "flexpanel_node_style_get_position",
+    "flexpanel_node_style_get_position_type",
+    "flexpanel_node_style_get_margin",
+    "flexpanel_node_style_get_padding",
+    "flexpanel_node_style_get_border",
+    "flexpanel_node_style_get_gap",
+    "flexpanel_node_style_get_direction",
+    "flexpanel_node_style_get_flex_direction",
+    "flexpanel_node_style_get_flex_wrap",
+    "flexpanel_node_style_get_flex_basis",
+    "flexpanel_node_style_get_flex_grow",
+    "flexpanel_node_style_get_flex_shrink",
+    "flexpanel_node_style_get_flex",
+    "flexpanel_node_style_get_justify_content",
+    "flexpanel_node_style_get_align_items",
+    "flexpanel_node_style_get_align_self",
+    "flexpanel_node_style_get_align_content",
+    "flexpanel_node_style_get_display",
+)
+
+
+def _flexpanel_entries() -> tuple[GMLAPIEntry, ...]:
+    implemented_entries = tuple(
+        _entry(
+            name,
+            "Flex Panels",
+            "implemented",
+            _FLEXPANEL_OWNER_MODULE,
+            "n/a",
+            "yes",
+            "yes",
+            "yes" if name in {"flexpanel_create_node", "flexpanel_node_insert_child", "flexpanel_node_layout_get_position"} else "no",
+            _FLEXPANEL_DOCS_PATH,
+            "Implemented through the GMRuntime Flex Panel node tree compatibility layer.",
+        )
+        for name in sorted(_FLEXPANEL_IMPLEMENTED_APIS)
+    )
+    partial_entries = tuple(
+        _entry(
+            name,
+            "Flex Panels",
+            "partial",
+            _FLEXPANEL_OWNER_MODULE,
+            "n/a",
+            "yes",
+            "partial",
+            "yes" if name in {"flexpanel_calculate_layout", "flexpanel_node_style_set_width", "flexpanel_node_style_set_height", "flexpanel_node_style_set_gap"} else "no",
+            _FLEXPANEL_DOCS_PATH,
+            "Lowered to a deterministic custom single-line Flex Panel layout pass; full Yoga semantics remain outside this compatibility subset.",
+        )
+        for name in _FLEXPANEL_PARTIAL_APIS
+    )
+    unsupported_entries = tuple(
+        _entry(
+            name,
+            "Flex Panels",
+            "unsupported",
+            _FLEXPANEL_OWNER_MODULE,
+            "n/a",
+            "yes",
+            "yes",
+            "no",
+            _FLEXPANEL_DOCS_PATH,
+            "Lowered to an explicit runtime diagnostic because custom measure callbacks require a full Yoga-compatible solver.",
+        )
+        for name in sorted(_FLEXPANEL_UNSUPPORTED_APIS)
+    )
+    return implemented_entries + partial_entries + unsupported_entries
+
+
+_OS_DEBUG_GC_OWNER_MODULE = "src.conversion.gml_runtime_parts.segments.72_os_debug_gc"
+_OS_DEBUG_DOCS_PATH = "GameMaker_Language/GML_Reference/Debugging/Debugging.htm"
+_OS_COMPILER_DOCS_PATH = "GameMaker_Language/GML_Reference/OS_And_Compiler/OS_And_Compiler.htm"
+_GC_DOCS_PATH = "GameMaker_Language/GML_Reference/Garbage_Collection/Garbage_Collection.htm"
+_OS_DEBUG_GC_IMPLEMENTED_APIS = (
+    ("show_debug_message", _OS_DEBUG_DOCS_PATH, _OS_DEBUG_GC_OWNER_MODULE, "Formats values with GameMaker string semantics and prints to the Godot output log."),
+    ("debug_mode", _OS_DEBUG_DOCS_PATH, _OS_DEBUG_GC_OWNER_MODULE, "Reads Godot's debug-build flag through GMRuntime built-in globals."),
+    ("fps", _OS_DEBUG_DOCS_PATH, _OS_DEBUG_GC_OWNER_MODULE, "Reads Engine frames-per-second through GMRuntime built-in globals."),
+    ("fps_real", _OS_DEBUG_DOCS_PATH, _OS_DEBUG_GC_OWNER_MODULE, "Reads Engine frames-per-second through GMRuntime built-in globals."),
+    ("os_browser", _OS_COMPILER_DOCS_PATH, _OS_DEBUG_GC_OWNER_MODULE, "Returns browser_not_a_browser outside web exports and a deterministic web fallback."),
+    ("os_device", _OS_COMPILER_DOCS_PATH, _OS_DEBUG_GC_OWNER_MODULE, "Provides the deprecated device variable with a deterministic unknown fallback."),
+    ("os_type", _OS_COMPILER_DOCS_PATH, _OS_DEBUG_GC_OWNER_MODULE, "Maps Godot OS.get_name values to GameMaker OS compatibility constants."),
+    ("os_version", _OS_COMPILER_DOCS_PATH, _OS_DEBUG_GC_OWNER_MODULE, "Maps Godot OS.get_version into a GameMaker-style numeric version where possible."),
+    ("os_is_paused", _OS_COMPILER_DOCS_PATH, _OS_DEBUG_GC_OWNER_MODULE, "Returns a deterministic false value because Godot pause/focus state is event-driven."),
+    ("os_is_network_connected", _OS_COMPILER_DOCS_PATH, _OS_DEBUG_GC_OWNER_MODULE, "Returns a deterministic true value; active OS connection prompts are not attempted."),
+    ("os_get_config", _OS_COMPILER_DOCS_PATH, _OS_DEBUG_GC_OWNER_MODULE, "Reads an optional project setting for converted configuration names."),
+    ("os_get_language", _OS_COMPILER_DOCS_PATH, _OS_DEBUG_GC_OWNER_MODULE, "Maps TranslationServer locale to a two-letter language code."),
+    ("os_get_region", _OS_COMPILER_DOCS_PATH, _OS_DEBUG_GC_OWNER_MODULE, "Maps TranslationServer locale to a region code when available."),
+    ("os_get_info", _OS_COMPILER_DOCS_PATH, _OS_DEBUG_GC_OWNER_MODULE, "Returns a struct with Godot-backed OS, version, locale, and processor metadata."),
+    ("parameter_count", _OS_COMPILER_DOCS_PATH, _OS_DEBUG_GC_OWNER_MODULE, "Reads Godot command-line arguments."),
+    ("parameter_string", _OS_COMPILER_DOCS_PATH, _OS_DEBUG_GC_OWNER_MODULE, "Reads Godot command-line arguments by index."),
+    ("environment_get_variable", _OS_COMPILER_DOCS_PATH, _OS_DEBUG_GC_OWNER_MODULE, "Uses OS.get_environment with GameMaker's empty-string fallback behavior."),
+    ("show_debug_message_ext", _OS_DEBUG_DOCS_PATH, _OS_DEBUG_GC_OWNER_MODULE, "Formats placeholder values and prints to the Godot output log."),
+    ("code_is_compiled", _OS_DEBUG_DOCS_PATH, _OS_DEBUG_GC_OWNER_MODULE, "Returns whether the project is running outside the Godot editor feature set."),
+    ("gc_enable", _GC_DOCS_PATH, _OS_DEBUG_GC_OWNER_MODULE, "Tracks the requested GameMaker GC enabled state for compatibility checks."),
+    ("gc_is_enabled", _GC_DOCS_PATH, _OS_DEBUG_GC_OWNER_MODULE, "Returns the tracked compatibility GC enabled state."),
+    ("gc_collect", _GC_DOCS_PATH, _OS_DEBUG_GC_OWNER_MODULE, "Records an explicit compatibility collection request without forcing Godot memory reclamation."),
+    ("gc_target_frame_time", _GC_DOCS_PATH, _OS_DEBUG_GC_OWNER_MODULE, "Tracks the requested GameMaker GC target frame time."),
+    ("gc_get_target_frame_time", _GC_DOCS_PATH, _OS_DEBUG_GC_OWNER_MODULE, "Returns the tracked compatibility GC target frame time."),
+    ("gc_get_stats", _GC_DOCS_PATH, _OS_DEBUG_GC_OWNER_MODULE, "Returns deterministic Godot compatibility GC stats."),
+)
+_OS_DEBUG_GC_PARTIAL_APIS = (
+    ("debug_get_callstack", _OS_DEBUG_DOCS_PATH, "Uses Godot stack frames where available and appends GameMaker's trailing 0 sentinel."),
+    ("exception_unhandled_handler", _OS_DEBUG_DOCS_PATH, "Stores and returns the requested handler, but Godot fatal exception interception is not equivalent."),
+    ("show_message", _OS_DEBUG_DOCS_PATH, "Prints the message to Godot output instead of opening a blocking native modal dialog."),
+    ("show_error", _OS_DEBUG_DOCS_PATH, "Reports through push_error and warns for abort requests instead of terminating automatically."),
+    ("weak_ref_create", _GC_DOCS_PATH, "Uses Godot WeakRef for Objects and a compatibility wrapper for dictionary-backed GML structs."),
+    ("weak_ref_alive", _GC_DOCS_PATH, "Checks compatibility weak references; dictionary-backed GML structs cannot be weakly referenced by Godot."),
+    ("weak_ref_any_alive", _GC_DOCS_PATH, "Checks compatibility weak references; dictionary-backed GML structs cannot be weakly referenced by Godot."),
+)
+_OS_DEBUG_GC_PLANNED_APIS = (
+    ("GM_build_date", _OS_COMPILER_DOCS_PATH, "Requires generated build metadata from the converted project/export pipeline."),
+    ("GM_build_type", _OS_COMPILER_DOCS_PATH, "Requires generated build metadata from the converted project/export pipeline."),
+    ("GM_version", _OS_COMPILER_DOCS_PATH, "Requires generated GameMaker project version metadata."),
+    ("GM_runtime_version", _OS_COMPILER_DOCS_PATH, "Requires an explicit compatibility policy for reporting GameMaker runtime versions under Godot."),
+    ("GM_project_filename", _OS_COMPILER_DOCS_PATH, "Requires generated source project metadata."),
+    ("GM_is_sandboxed", _OS_COMPILER_DOCS_PATH, "Requires an explicit export-target sandbox policy."),
+    ("gml_release_mode", _OS_COMPILER_DOCS_PATH, "Requires generated compile/export mode metadata."),
+)
+_OS_DEBUG_GC_UNSUPPORTED_APIS = (
+    ("gml_pragma", _OS_COMPILER_DOCS_PATH, "GameMaker compile-time pragmas have no runtime equivalent after conversion."),
+    ("os_powersave_enable", _OS_COMPILER_DOCS_PATH, "Godot does not expose GameMaker's platform power-save toggle in portable GDScript."),
+    ("os_lock_orientation", _OS_COMPILER_DOCS_PATH, "Orientation locking requires platform/export-specific project settings rather than a portable runtime call."),
+    ("os_set_orientation_lock", _OS_COMPILER_DOCS_PATH, "Orientation locking requires platform/export-specific project settings rather than a portable runtime call."),
+    ("scheduler_resolution_get", _OS_COMPILER_DOCS_PATH, "Windows scheduler resolution control has no portable Godot equivalent."),
+    ("scheduler_resolution_set", _OS_COMPILER_DOCS_PATH, "Windows scheduler resolution control has no portable Godot equivalent."),
+    ("debug_event", _OS_DEBUG_DOCS_PATH, "GameMaker debugger event injection has no Godot runtime equivalent."),
+    ("get_integer", _OS_DEBUG_DOCS_PATH, "Blocking debug input dialogs are unsupported in converted runtime code."),
+    ("get_string", _OS_DEBUG_DOCS_PATH, "Blocking debug input dialogs are unsupported in converted runtime code."),
+    ("show_question", _OS_DEBUG_DOCS_PATH, "Blocking debug question dialogs are unsupported in converted runtime code."),
+    ("show_debug_overlay", _OS_DEBUG_DOCS_PATH, "GameMaker's debug overlay is runner-specific."),
+    ("debug_input_record", _OS_DEBUG_DOCS_PATH, "GameMaker debug input recording is runner-specific."),
+    ("debug_input_save", _OS_DEBUG_DOCS_PATH, "GameMaker debug input recording is runner-specific."),
+    ("debug_input_playback", _OS_DEBUG_DOCS_PATH, "GameMaker debug input playback is runner-specific."),
+)
+
+
+def _os_debug_gc_entries() -> tuple[GMLAPIEntry, ...]:
+    implemented_entries = tuple(
+        _entry(
+            name,
+            "OS Compiler Debug GC",
+            "implemented",
+            owner_module,
+            "n/a",
+            "yes",
+            "yes" if owner_module == _OS_DEBUG_GC_OWNER_MODULE else "n/a",
+            "yes" if name in {"os_type", "os_get_info", "show_debug_message_ext", "gc_collect", "weak_ref_alive"} else "no",
+            docs_path,
+            notes,
+        )
+        for name, docs_path, owner_module, notes in _OS_DEBUG_GC_IMPLEMENTED_APIS
+    )
+    partial_entries = tuple(
+        _entry(
+            name,
+            "OS Compiler Debug GC",
+            "partial",
+            _OS_DEBUG_GC_OWNER_MODULE,
+            "n/a",
+            "yes",
+            "partial",
+            "yes" if name in {"show_message", "show_error", "weak_ref_create"} else "no",
+            docs_path,
+            notes,
+        )
+        for name, docs_path, notes in _OS_DEBUG_GC_PARTIAL_APIS
+    )
+    planned_entries = tuple(
+        _entry(
+            name,
+            "OS Compiler Debug GC",
+            "planned",
+            "src.conversion.gml_runtime_parts",
+            "n/a",
+            "no",
+            "no",
+            "no",
+            docs_path,
+            notes,
+        )
+        for name, docs_path, notes in _OS_DEBUG_GC_PLANNED_APIS
+    )
+    unsupported_entries = tuple(
+        _entry(
+            name,
+            "OS Compiler Debug GC",
+            "unsupported",
+            "src.conversion.gml_runtime_parts",
+            "n/a",
+            "no",
+            "no",
+            "no",
+            docs_path,
+            notes,
+        )
+        for name, docs_path, notes in _OS_DEBUG_GC_UNSUPPORTED_APIS
+    )
+    return implemented_entries + partial_entries + planned_entries + unsupported_entries
+
+
+_OS_DEVICE_MEDIA_OWNER_MODULE = "src.conversion.gml_runtime_parts.segments.72_os_debug_gc"
+_OS_DEVICE_MEDIA_PLATFORM_OWNER_MODULE = "src.conversion.gml_runtime_parts.segments.73_platform_services"
+_OS_DEVICE_MEDIA_CLIPBOARD_DOCS_PATH = "GameMaker_Language/GML_Reference/Strings/clipboard_set_text.htm"
+_OS_DEVICE_MEDIA_WEB_DOCS_PATH = "GameMaker_Language/GML_Reference/Web_And_HTML5/Web_And_HTML5.htm"
+_OS_DEVICE_MEDIA_VIDEO_DOCS_PATH = "GameMaker_Language/GML_Reference/Drawing/Videos/Videos.htm"
+_OS_DEVICE_MEDIA_INPUT_DOCS_PATH = "GameMaker_Language/GML_Reference/Game_Input/Device_Input/Device_Input.htm"
+_OS_DEVICE_MEDIA_IMPLEMENTED_APIS = (
+    ("clipboard_has_text", "Uses DisplayServer clipboard support and emits a one-time fallback warning when native clipboard support is unavailable."),
+    ("clipboard_get_text", "Reads DisplayServer clipboard text and emits a one-time fallback warning when native clipboard support is unavailable."),
+    ("clipboard_set_text", "Writes DisplayServer clipboard text and records a deterministic fallback value for targets without clipboard support."),
+)
+_OS_DEVICE_MEDIA_PARTIAL_APIS: tuple[tuple[str, str, GMLAPISupportFlag, str], ...] = (
+    ("url_open", _OS_DEVICE_MEDIA_WEB_DOCS_PATH, "no", "Uses OS.shell_open outside web exports and allows a web hook to provide target-specific window behavior."),
+    ("url_open_ext", _OS_DEVICE_MEDIA_WEB_DOCS_PATH, "no", "Uses OS.shell_open outside web exports and allows a web hook to honor the HTML5 target parameter."),
+    ("url_open_full", _OS_DEVICE_MEDIA_WEB_DOCS_PATH, "no", "Uses OS.shell_open outside web exports and allows a web hook to honor the HTML5 target/options parameters."),
+    ("url_get_domain", _OS_DEVICE_MEDIA_WEB_DOCS_PATH, "yes", "Returns an empty string without a web hook; hook implementations can report the hosting domain."),
+    ("browser_height", _OS_DEVICE_MEDIA_WEB_DOCS_PATH, "yes", "Falls back to the Godot window height when no browser/web hook is registered."),
+    ("browser_width", _OS_DEVICE_MEDIA_WEB_DOCS_PATH, "yes", "Falls back to the Godot window width when no browser/web hook is registered."),
+    ("browser_input_capture", _OS_DEVICE_MEDIA_WEB_DOCS_PATH, "yes", "No-ops unless a web hook implements browser input capture policy."),
+    ("webgl_enabled", _OS_DEVICE_MEDIA_WEB_DOCS_PATH, "yes", "Matches GameMaker's non-browser true fallback unless a web hook reports otherwise."),
+)
+_OS_DEVICE_MEDIA_VIDEO_PARTIAL_APIS: tuple[tuple[str, str], ...] = (
+    (
+        "video_open",
+        "Creates a hidden Godot VideoStreamPlayer for Ogg Theora/GDExtension-backed streams; camera constraints and unsupported formats emit diagnostics.",
+    ),
+    ("video_close", "Stops and releases the generated VideoStreamPlayer and invalidates the compatibility surface."),
+    ("video_draw", "Returns GameMaker-style status/surface data backed by the current Godot video texture or a deterministic placeholder surface."),
+    ("video_set_volume", "Maps linear video volume to VideoStreamPlayer.volume."),
+    ("video_pause", "Maps to VideoStreamPlayer.paused."),
+    ("video_resume", "Unpauses the generated VideoStreamPlayer and restarts playback if necessary."),
+    ("video_enable_loop", "Maps loop state to VideoStreamPlayer.loop."),
+    ("video_seek_to", "Maps to VideoStreamPlayer.stream_position."),
+    ("video_is_looping", "Returns generated video loop state."),
+    ("video_get_volume", "Returns generated VideoStreamPlayer linear volume state."),
+    ("video_get_duration", "Returns VideoStreamPlayer stream length when available."),
+    ("video_get_position", "Returns VideoStreamPlayer stream position when available."),
+    ("video_get_status", "Returns GameMaker-compatible closed/preparing/playing/paused status constants."),
+    ("video_get_format", "Returns RGBA format for Godot video texture playback; YUV platform paths remain diagnostic-only."),
+)
+_OS_DEVICE_MEDIA_UNSUPPORTED_GROUPS = (
+    (
+        (
+            "device_get_tilt_x",
+            "device_get_tilt_y",
+            "device_get_tilt_z",
+            "device_is_keypad_open",
+        ),
+        _OS_DEVICE_MEDIA_INPUT_DOCS_PATH,
+        "Device sensor/orientation APIs require per-target permission and sensor bridges; GM2Godot rejects them instead of emitting unresolved calls.",
+    ),
+    (
+        (
+            "os_check_permission",
+            "os_request_permission",
+        ),
+        _OS_COMPILER_DOCS_PATH,
+        "Runtime permission APIs require platform plugins or export-template integration for clipboard, sensors, microphone, camera, and browser APIs.",
+    ),
+)
+
+
+def _os_device_media_entries() -> tuple[GMLAPIEntry, ...]:
+    implemented_entries = tuple(
+        _entry(
+            name,
+            "OS and Device Media",
+            "implemented",
+            _OS_DEVICE_MEDIA_OWNER_MODULE,
+            "n/a",
+            "yes",
+            "yes",
+            "yes",
+            _OS_DEVICE_MEDIA_CLIPBOARD_DOCS_PATH,
+            notes,
+        )
+        for name, notes in _OS_DEVICE_MEDIA_IMPLEMENTED_APIS
+    )
+    partial_entries = tuple(
+        _entry(
+            name,
+            "OS and Device Media",
+            "partial",
+            _OS_DEVICE_MEDIA_PLATFORM_OWNER_MODULE,
+            "n/a",
+            "yes",
+            runtime_support,
+            "yes" if name in {"browser_width", "browser_height", "browser_input_capture", "url_get_domain"} else "no",
+            docs_path,
+            notes,
+        )
+        for name, docs_path, runtime_support, notes in _OS_DEVICE_MEDIA_PARTIAL_APIS
+    )
+    video_entries = tuple(
+        _entry(
+            name,
+            "OS and Device Media",
+            "partial",
+            "src.conversion.gml_runtime_parts.segments.48_drawing_basic_forms",
+            "n/a",
+            "yes",
+            "partial",
+            "yes",
+            _OS_DEVICE_MEDIA_VIDEO_DOCS_PATH,
+            notes,
+        )
+        for name, notes in _OS_DEVICE_MEDIA_VIDEO_PARTIAL_APIS
+    )
+    unsupported_entries = tuple(
+        _entry(
+            name,
+            "OS and Device Media",
+            "unsupported",
+            "src.conversion.gml_runtime_parts",
+            "n/a",
+            "no",
+            "no",
+            "no",
+            docs_path,
+            notes,
+        )
+        for names, docs_path, notes in _OS_DEVICE_MEDIA_UNSUPPORTED_GROUPS
+        for name in names
+    )
+    return implemented_entries + partial_entries + video_entries + unsupported_entries
+
+
+_PLATFORM_SERVICE_OWNER_MODULE = "src.conversion.gml_runtime_parts.segments.73_platform_services"
+_PLATFORM_STEAM_DOCS_PATH = "GameMaker_Language/GML_Reference/Steam/Steam.htm"
+_PLATFORM_IAP_DOCS_PATH = "GameMaker_Language/GML_Reference/In_App_Purchases/In_App_Purchases.htm"
+_PLATFORM_WEB_DOCS_PATH = "GameMaker_Language/GML_Reference/Web_And_HTML5/Web_And_HTML5.htm"
+_PLATFORM_XBOX_DOCS_PATH = "GameMaker_Language/GML_Reference/UWP_And_XBox_Live/UWP_And_XBox_Live.htm"
+_PLATFORM_WALLPAPER_DOCS_PATH = "GameMaker_Language/GML_Reference/Live_Wallpapers/Live_Wallpapers.htm"
+_PLATFORM_ASYNC_DOCS_PATH = "GameMaker_Language/GML_Reference/Asynchronous_Functions/Asynchronous_Functions.htm"
+_PLATFORM_RUNTIME_HOOK_APIS: tuple[tuple[str, str, GMLAPISupportFlag, str], ...] = (
+    ("steam_is_initialized", _PLATFORM_STEAM_DOCS_PATH, "yes", "Returns false without a registered Steam hook; registered Steam addons can override the value."),
+    ("xboxlive_user_is_signed_in", _PLATFORM_XBOX_DOCS_PATH, "yes", "Returns false without a registered Xbox Live hook; platform addons can provide real account state."),
+    ("xboxlive_user_is_signing_in", _PLATFORM_XBOX_DOCS_PATH, "yes", "Returns false without a registered Xbox Live hook; platform addons can provide real sign-in state."),
+    ("xboxlive_gamertag_for_user", _PLATFORM_XBOX_DOCS_PATH, "yes", "Returns an empty string without a registered Xbox Live hook."),
+    ("xboxlive_show_account_picker", _PLATFORM_XBOX_DOCS_PATH, "no", "Routes through a required Xbox Live hook and reports an explicit diagnostic when unavailable."),
+    ("wallpaper_set_config", _PLATFORM_WALLPAPER_DOCS_PATH, "no", "Routes through a required live wallpaper hook and reports an explicit diagnostic when unavailable."),
+    ("wallpaper_set_subscriptions", _PLATFORM_WALLPAPER_DOCS_PATH, "no", "Routes through a required live wallpaper hook and reports an explicit diagnostic when unavailable."),
+    ("cloud_synchronise", _PLATFORM_ASYNC_DOCS_PATH, "no", "Routes through a required cloud-save hook because the built-in Android cloud API is obsolete."),
+    ("cloud_string_save", _PLATFORM_ASYNC_DOCS_PATH, "no", "Routes through a required cloud-save hook because the built-in Android cloud API is obsolete."),
+    ("cloud_file_save", _PLATFORM_ASYNC_DOCS_PATH, "no", "Routes through a required cloud-save hook because the built-in Android cloud API is obsolete."),
+)
+_PLATFORM_UNSUPPORTED_GROUPS = (
+    (
+        (
+            "steam_activate_overlay",
+            "steam_get_persona_name",
+            "steam_set_achievement",
+            "steam_get_achievement",
+            "steam_user_owns_dlc",
+            "steam_download_scores",
+            "steam_upload_score",
+            "steam_ugc_create_item",
+            "steam_ugc_publish",
+        ),
+        _PLATFORM_STEAM_DOCS_PATH,
+        "Steam APIs now live in the Steam extension and need an optional Godot Steam addon hook; GM2Godot rejects unhooked calls with this diagnostic.",
+    ),
+    (
+        (
+            "iap_data",
+            "iap_activate",
+            "iap_status",
+            "iap_enumerate_products",
+            "iap_restore_all",
+            "iap_acquire",
+            "iap_consume",
+            "iap_product_details",
+            "iap_purchase_details",
+            "mac_refresh_receipt_validation",
+        ),
+        _PLATFORM_IAP_DOCS_PATH,
+        "Store purchase APIs are deprecated or extension-backed and require a platform store addon/plugin integration.",
+    ),
+    (
+        (
+            "clickable_exists",
+            "clickable_add",
+            "clickable_add_ext",
+            "clickable_change",
+            "clickable_change_ext",
+            "clickable_set_style",
+            "clickable_delete",
+            "analytics_event",
+            "analytics_event_ext",
+            "http_get_request_crossorigin",
+            "http_set_request_crossorigin",
+        ),
+        _PLATFORM_WEB_DOCS_PATH,
+        "HTML5 DOM/CORS helpers require a web export policy and JavaScript bridge hook instead of a portable Godot runtime call.",
+    ),
+    (
+        (
+            "uwp_suspend",
+            "uwp_is_suspending",
+            "uwp_is_constrained",
+            "uwp_was_terminated",
+            "uwp_was_closed_by_user",
+            "uwp_show_help",
+            "uwp_license_trial_version",
+            "uwp_license_trial_user",
+            "uwp_license_trial_time_remaining",
+            "uwp_check_privilege",
+            "xboxlive_get_user_count",
+            "xboxlive_get_user",
+            "xboxlive_get_activating_user",
+            "xboxlive_user_is_guest",
+            "xboxlive_user_is_active",
+            "xboxlive_user_is_remote",
+            "xboxlive_user_id_for_user",
+            "xboxlive_sponsor_for_user",
+            "xboxlive_set_rich_presence",
+            "xboxlive_gamedisplayname_for_user",
+            "xboxlive_user_for_pad",
+            "xboxlive_pad_for_user",
+            "xboxlive_pad_count_for_user",
+            "xboxlive_agegroup_for_user",
+            "xboxlive_gamerscore_for_user",
+            "xboxlive_show_profile_card_for_user",
+            "xboxlive_reputation_for_user",
+            "xboxlive_sprite_add_from_gamerpicture",
+            "xboxlive_generate_player_session_id",
+            "xboxlive_set_savedata_user",
+            "xboxlive_get_savedata_user",
+            "xboxlive_get_file_error",
+            "xboxlive_stats_setup",
+            "xboxlive_stats_add_user",
+            "xboxlive_stats_remove_user",
+            "xboxlive_stats_flush_user",
+            "xboxlive_stats_set_stat_real",
+            "xboxlive_stats_set_stat_int",
+            "xboxlive_stats_set_stat_string",
+            "xboxlive_stats_delete_stat",
+            "xboxlive_stats_get_stat_names",
+            "xboxlive_stats_get_stat",
+            "xboxlive_stats_get_leaderboard",
+            "xboxlive_stats_get_social_leaderboard",
+            "xboxlive_achievement_show_achievements",
+            "xboxlive_achievement_load_friends",
+            "xboxlive_achievement_load_leaderboard",
+            "xboxlive_achievements_set_progress",
+            "xboxlive_get_stats_for_user",
+            "xboxlive_read_player_leaderboard",
+            "xboxlive_fire_event",
+            "xboxlive_matchmaking_start",
+            "xboxlive_matchmaking_stop",
+            "xboxlive_matchmaking_create",
+            "xboxlive_matchmaking_find",
+            "xboxlive_matchmaking_session_get_users",
+            "xboxlive_matchmaking_join_session",
+            "xboxlive_matchmaking_session_leave",
+            "xboxlive_matchmaking_send_invites",
+            "xboxlive_matchmaking_set_joinable_session",
+            "xboxlive_matchmaking_join_invite",
+        ),
+        _PLATFORM_XBOX_DOCS_PATH,
+        "UWP/Xbox Live APIs require a closed platform SDK/export runner or a registered platform addon hook.",
+    ),
+)
+_PLATFORM_EVENT_APIS = (
+    ("async_steam_event", _PLATFORM_STEAM_DOCS_PATH, "src.conversion.events.mappings.other_async_steam", "Async Steam event mapping is generated; payload production depends on a Steam addon hook."),
+    ("async_cloud_save_event", _PLATFORM_ASYNC_DOCS_PATH, "src.conversion.events.mappings.other_async_platform", "Async Cloud Save event mapping is generated; payload production depends on a cloud-save addon hook."),
+    ("async_social_event", _PLATFORM_XBOX_DOCS_PATH, "src.conversion.events.mappings.other_async_platform", "Async Social/platform event mapping is generated; payload production depends on the platform addon."),
+    ("async_push_notification_event", _PLATFORM_ASYNC_DOCS_PATH, "src.conversion.events.mappings.other_async_platform", "Async Push Notification event mapping is generated; notification delivery depends on a mobile notification extension."),
+    ("wallpaper_config_event", _PLATFORM_WALLPAPER_DOCS_PATH, "src.conversion.events.mappings.other_wallpaper", "Wallpaper Config event mapping is generated; payload production depends on the live wallpaper companion hook."),
+    ("wallpaper_subscription_data_event", _PLATFORM_WALLPAPER_DOCS_PATH, "src.conversion.events.mappings.other_wallpaper", "Wallpaper Subscription Data event mapping is generated; payload production depends on the live wallpaper companion hook."),
+    ("push_notifications_extension", _PLATFORM_ASYNC_DOCS_PATH, "src.conversion.gml_transpiler_parts.gml_api_manifest", "Current GameMaker push notification behavior is extension-backed; converted projects need an explicit mobile notification addon."),
+)
+
+
+def _platform_service_entries() -> tuple[GMLAPIEntry, ...]:
+    partial_entries = tuple(
+        _entry(
+            name,
+            "Platform Services",
+            "partial",
+            _PLATFORM_SERVICE_OWNER_MODULE,
+            "n/a",
+            "yes",
+            "partial",
+            smoke_coverage,
+            docs_path,
+            notes,
+        )
+        for name, docs_path, smoke_coverage, notes in _PLATFORM_RUNTIME_HOOK_APIS
+    )
+    hook_contract_entries = tuple(
+        _entry(
+            name,
+            "Platform Services",
+            "partial",
+            _PLATFORM_SERVICE_OWNER_MODULE,
+            "n/a",
+            "yes",
+            "partial",
+            "no",
+            docs_path,
+            notes + " Calls lower to GMRuntime.gml_platform_service_call(service, api, args) and emit a deterministic runtime diagnostic when the service hook is missing.",
+        )
+        for names, docs_path, notes in _PLATFORM_UNSUPPORTED_GROUPS
+        for name in names
+    )
+    event_entries = tuple(
+        _entry(
+            name,
+            "Platform Services",
+            "partial",
+            owner_module,
+            "n/a",
+            "n/a",
+            "n/a",
+            "yes",
+            docs_path,
+            notes,
+        )
+        for name, docs_path, owner_module, notes in _PLATFORM_EVENT_APIS
+    )
+    return partial_entries + hook_contract_entries + event_entries
+
+
+_AUDIO_RUNTIME_OWNER_MODULE = "src.conversion.gml_runtime_parts.segments.54_audio_runtime"
+_AUDIO_DOCS_PATH = "GameMaker_Language/GML_Reference/Asset_Management/Audio/Audio.htm"
+_AUDIO_EMITTER_DOCS_PATH = "GameMaker_Language/GML_Reference/Asset_Management/Audio/Audio_Emitters/Audio_Emitters.htm"
+_AUDIO_BUFFER_DOCS_PATH = "GameMaker_Language/GML_Reference/Asset_Management/Audio/Audio_Buffers/Audio_Buffers.htm"
+_AUDIO_GROUP_DOCS_PATH = "GameMaker_Language/GML_Reference/Asset_Management/Audio/Audio_Synchronisation/Audio_Synchronisation.htm"
+_AUDIO_ADVANCED_RUNTIME_APIS: tuple[
+    tuple[str, GMLAPISupportStatus, GMLAPISupportFlag, GMLAPISupportFlag, str, str],
+    ...,
+] = (
+    ("audio_play_sound_at", "partial", "partial", "yes", _AUDIO_EMITTER_DOCS_PATH, "Creates a positional AudioStreamPlayer2D with GameMaker falloff/listener metadata mapped to Godot attenuation fields."),
+    ("audio_play_sound_on", "partial", "partial", "yes", _AUDIO_EMITTER_DOCS_PATH, "Plays from a tracked emitter; emitter position, gain, pitch, falloff, and listener mask update active sounds."),
+    ("audio_stop_all", "implemented", "yes", "yes", _AUDIO_DOCS_PATH, "Stops and invalidates all active GM2Godot audio handles."),
+    ("audio_pause_all", "implemented", "yes", "yes", _AUDIO_DOCS_PATH, "Pauses all active GM2Godot audio handles."),
+    ("audio_resume_all", "implemented", "yes", "yes", _AUDIO_DOCS_PATH, "Resumes all paused GM2Godot audio handles."),
+    ("audio_is_paused", "implemented", "yes", "yes", _AUDIO_DOCS_PATH, "Checks individual sound handles or active sound asset instances for paused playback."),
+    ("audio_sound_get_gain", "implemented", "yes", "yes", _AUDIO_DOCS_PATH, "Returns active instance gain or generated asset gain state."),
+    ("audio_sound_get_pitch", "implemented", "yes", "yes", _AUDIO_DOCS_PATH, "Returns active instance pitch or generated asset pitch state."),
+    ("audio_sound_loop", "partial", "partial", "yes", _AUDIO_DOCS_PATH, "Updates runtime loop state for active handles; generated players restart from the finished signal."),
+    ("audio_sound_get_loop", "implemented", "yes", "yes", _AUDIO_DOCS_PATH, "Reads loop state for active handles or any active asset instance."),
+    ("audio_sound_set_listener_mask", "partial", "partial", "yes", _AUDIO_DOCS_PATH, "Stores listener masks for active handles; Godot area masks are updated for positional players."),
+    ("audio_sound_get_listener_mask", "implemented", "yes", "yes", _AUDIO_DOCS_PATH, "Reads listener mask state for active handles."),
+    ("audio_sound_get_asset", "implemented", "yes", "yes", _AUDIO_DOCS_PATH, "Returns the generated asset ID associated with a sound handle or sound asset."),
+    ("audio_channel_num", "partial", "partial", "yes", _AUDIO_DOCS_PATH, "Caps active compatibility channels and stops lowest-priority runtime handles when the cap is exceeded."),
+    ("audio_master_gain", "implemented", "yes", "yes", _AUDIO_DOCS_PATH, "Legacy/global master gain setter routed to the generated runtime master multiplier."),
+    ("audio_set_master_gain", "implemented", "yes", "yes", _AUDIO_DOCS_PATH, "Sets the generated runtime master gain multiplier."),
+    ("audio_get_master_gain", "implemented", "yes", "yes", _AUDIO_DOCS_PATH, "Returns the generated runtime master gain multiplier."),
+    ("audio_throw_on_error", "partial", "partial", "yes", _AUDIO_DOCS_PATH, "Toggles whether compatibility diagnostics are also pushed as Godot errors."),
+    ("audio_emitter_create", "implemented", "yes", "yes", _AUDIO_EMITTER_DOCS_PATH, "Creates a tracked emitter handle with position, velocity, falloff, gain, pitch, and listener mask state."),
+    ("audio_emitter_exists", "implemented", "yes", "yes", _AUDIO_EMITTER_DOCS_PATH, "Checks whether a generated emitter handle is still valid."),
+    ("audio_emitter_free", "implemented", "yes", "yes", _AUDIO_EMITTER_DOCS_PATH, "Invalidates a generated emitter handle."),
+    ("audio_emitter_position", "partial", "partial", "yes", _AUDIO_EMITTER_DOCS_PATH, "Updates emitter position and active positional players using Godot 2D coordinates."),
+    ("audio_emitter_velocity", "partial", "partial", "yes", _AUDIO_EMITTER_DOCS_PATH, "Stores emitter velocity for compatibility state and future Doppler integration."),
+    ("audio_emitter_falloff", "partial", "partial", "yes", _AUDIO_EMITTER_DOCS_PATH, "Maps emitter falloff to Godot positional attenuation/max-distance fields."),
+    ("audio_emitter_gain", "implemented", "yes", "yes", _AUDIO_EMITTER_DOCS_PATH, "Applies emitter gain to active sounds played on the emitter."),
+    ("audio_emitter_get_gain", "implemented", "yes", "yes", _AUDIO_EMITTER_DOCS_PATH, "Returns generated emitter gain state."),
+    ("audio_emitter_pitch", "implemented", "yes", "yes", _AUDIO_EMITTER_DOCS_PATH, "Applies emitter pitch to active sounds played on the emitter."),
+    ("audio_emitter_get_pitch", "implemented", "yes", "yes", _AUDIO_EMITTER_DOCS_PATH, "Returns generated emitter pitch state."),
+    ("audio_emitter_set_listener_mask", "partial", "partial", "yes", _AUDIO_EMITTER_DOCS_PATH, "Stores emitter listener masks and applies them to active positional players."),
+    ("audio_emitter_get_listener_mask", "implemented", "yes", "yes", _AUDIO_EMITTER_DOCS_PATH, "Returns generated emitter listener-mask state."),
+    ("audio_emitter_get_x", "implemented", "yes", "yes", _AUDIO_EMITTER_DOCS_PATH, "Returns generated emitter X position."),
+    ("audio_emitter_get_y", "implemented", "yes", "yes", _AUDIO_EMITTER_DOCS_PATH, "Returns generated emitter Y position."),
+    ("audio_emitter_get_z", "implemented", "yes", "yes", _AUDIO_EMITTER_DOCS_PATH, "Returns generated emitter Z position."),
+    ("audio_listener_position", "partial", "partial", "yes", _AUDIO_DOCS_PATH, "Stores default listener position compatibility state."),
+    ("audio_listener_velocity", "partial", "partial", "yes", _AUDIO_DOCS_PATH, "Stores default listener velocity compatibility state."),
+    ("audio_listener_orientation", "partial", "partial", "yes", _AUDIO_DOCS_PATH, "Stores default listener orientation compatibility state."),
+    ("audio_listener_set_position", "partial", "partial", "yes", _AUDIO_DOCS_PATH, "Stores indexed listener position compatibility state."),
+    ("audio_listener_set_velocity", "partial", "partial", "yes", _AUDIO_DOCS_PATH, "Stores indexed listener velocity compatibility state."),
+    ("audio_listener_set_orientation", "partial", "partial", "yes", _AUDIO_DOCS_PATH, "Stores indexed listener orientation compatibility state."),
+    ("audio_get_listener_count", "partial", "partial", "yes", _AUDIO_DOCS_PATH, "Reports one compatibility listener while preserving indexed listener state calls."),
+    ("audio_get_listener_info", "partial", "partial", "yes", _AUDIO_DOCS_PATH, "Returns deterministic listener metadata for generated runtime listener slots."),
+    ("audio_get_listener_mask", "implemented", "yes", "yes", _AUDIO_DOCS_PATH, "Returns the generated runtime global listener mask."),
+    ("audio_set_listener_mask", "implemented", "yes", "yes", _AUDIO_DOCS_PATH, "Sets the generated runtime global listener mask."),
+    ("audio_create_play_queue", "partial", "partial", "yes", _AUDIO_BUFFER_DOCS_PATH, "Creates a handle backed by AudioStreamGenerator and tracks queued buffers."),
+    ("audio_queue_sound", "partial", "partial", "yes", _AUDIO_BUFFER_DOCS_PATH, "Tracks queued buffer lifecycle and dispatches audio playback async payloads; PCM synthesis remains diagnostic-only."),
+    ("audio_free_play_queue", "partial", "partial", "yes", _AUDIO_BUFFER_DOCS_PATH, "Invalidates a play queue and dispatches a queue-shutdown async payload."),
+    ("audio_get_recorder_count", "partial", "partial", "yes", _AUDIO_BUFFER_DOCS_PATH, "Returns zero and records a deterministic diagnostic for unsupported microphone capture."),
+    ("audio_get_recorder_info", "partial", "partial", "yes", _AUDIO_BUFFER_DOCS_PATH, "Returns deterministic unavailable-recorder metadata."),
+    ("audio_start_recording", "partial", "partial", "yes", _AUDIO_BUFFER_DOCS_PATH, "Dispatches a failed audio recording async payload with a platform-permission diagnostic."),
+    ("audio_stop_recording", "partial", "partial", "yes", _AUDIO_BUFFER_DOCS_PATH, "Returns false and records a diagnostic when no generated recording channel exists."),
+    ("audio_create_stream", "partial", "partial", "yes", _AUDIO_DOCS_PATH, "Registers a dynamic sound asset from an existing Godot AudioStream resource path."),
+    ("audio_destroy_stream", "implemented", "yes", "yes", _AUDIO_DOCS_PATH, "Releases a generated dynamic audio stream asset."),
+    ("audio_create_sync_group", "partial", "partial", "yes", _AUDIO_GROUP_DOCS_PATH, "Creates a sync-group compatibility handle for grouped playback."),
+    ("audio_play_in_sync_group", "partial", "partial", "yes", _AUDIO_GROUP_DOCS_PATH, "Adds generated sound assets to a sync group."),
+    ("audio_start_sync_group", "partial", "partial", "yes", _AUDIO_GROUP_DOCS_PATH, "Starts all sync-group tracks in one runtime tick and emits a sample-sync diagnostic."),
+    ("audio_stop_sync_group", "partial", "partial", "yes", _AUDIO_GROUP_DOCS_PATH, "Stops all active handles tracked by a sync group."),
+    ("audio_pause_sync_group", "partial", "partial", "yes", _AUDIO_GROUP_DOCS_PATH, "Pauses all active handles tracked by a sync group."),
+    ("audio_resume_sync_group", "partial", "partial", "yes", _AUDIO_GROUP_DOCS_PATH, "Resumes all active handles tracked by a sync group."),
+    ("audio_sync_group_is_playing", "partial", "partial", "yes", _AUDIO_GROUP_DOCS_PATH, "Checks whether any handle in a sync group is still playing."),
+    ("audio_sync_group_get_track_pos", "partial", "partial", "yes", _AUDIO_GROUP_DOCS_PATH, "Returns the first active sync-group track playback position."),
+    ("audio_destroy_sync_group", "partial", "partial", "yes", _AUDIO_GROUP_DOCS_PATH, "Stops and invalidates a generated sync-group handle."),
+)
+
+
+def _advanced_audio_entries() -> tuple[GMLAPIEntry, ...]:
+    return tuple(
+        _entry(
+            name,
+            "Audio",
+            status,
+            _AUDIO_RUNTIME_OWNER_MODULE,
+            "yes",
+            "yes",
+            runtime_support,
+            smoke_coverage,
+            docs_path,
+            notes,
+        )
+        for name, status, runtime_support, smoke_coverage, docs_path, notes in _AUDIO_ADVANCED_RUNTIME_APIS
+    )
+
+
+_GML_API_ENTRIES: tuple[GMLAPIEntry, ...] = (
+    _entry(
+        "gml_api_compatibility_report",
+        "Foundation",
+        "implemented",
+        "src.conversion.gml_transpiler_parts.gml_api_manifest",
+        "n/a",
+        "n/a",
+        "n/a",
+        "no",
+        "GameMaker_Language/GML_Reference/GML_Reference.htm",
+        "Python-side manifest/reporting surface for tracking GML Reference coverage.",
+    ),
+    _entry(
+        "unsupported_gml_api_diagnostic",
+        "Runtime Function Dispatch",
+        "implemented",
+        "src.conversion.gml_transpiler_parts.emitter",
+        "n/a",
+        "yes",
+        "n/a",
+        "no",
+        "GameMaker_Language/GML_Reference/GML_Reference.htm",
+        "Known but unimplemented GML built-ins fail before they are emitted as raw GDScript calls.",
+    ),
+    _entry(
+        "asset_get_index",
+        "Asset Management",
+        "implemented",
+        "src.conversion.asset_registry",
+        "n/a",
+        "yes",
+        "yes",
+        "no",
+        "GameMaker_Language/GML_Reference/Asset_Management/Asset_Management.htm",
+        "Implemented through the generated GMRuntime asset registry.",
+    ),
+    _entry(
+        "asset_get_type",
+        "Asset Management",
+        "implemented",
+        "src.conversion.asset_registry",
+        "n/a",
+        "yes",
+        "yes",
+        "no",
+        "GameMaker_Language/GML_Reference/Asset_Management/Asset_Management.htm",
+        "Implemented through stable registry ids and type metadata.",
+    ),
+    _entry(
+        "asset_get_ids",
+        "Asset Management",
+        "implemented",
+        "src.conversion.asset_registry",
+        "n/a",
+        "yes",
+        "yes",
+        "no",
+        "GameMaker_Language/GML_Reference/Asset_Management/Asset_Management.htm",
+        "Returns generated legacy ids from the runtime asset registry.",
+    ),
+    _entry(
+        "asset_get_type_name",
+        "Asset Management",
+        "implemented",
+        "src.conversion.asset_registry",
+        "n/a",
+        "yes",
+        "yes",
+        "no",
+        "GameMaker_Language/GML_Reference/Asset_Management/Asset_Management.htm",
+        "Maps registry asset types to stable display names.",
+    ),
+    _entry(
+        "asset_get_index_from_id",
+        "Asset Management",
+        "implemented",
+        "src.conversion.asset_registry",
+        "n/a",
+        "yes",
+        "yes",
+        "no",
+        "GameMaker_Language/GML_Reference/Asset_Management/Asset_Management.htm",
+        "Resolves generated legacy ids back to stable runtime asset indices.",
+    ),
+    _entry(
+        "asset_has_any_tag",
+        "Asset Management",
+        "implemented",
+        "src.conversion.asset_registry",
+        "n/a",
+        "yes",
+        "yes",
+        "no",
+        "GameMaker_Language/GML_Reference/Asset_Management/Asset_Management.htm",
+        "Uses generated tag metadata when GameMaker resources include it.",
+    ),
+    _entry(
+        "instance_create_layer",
+        "Instances",
+        "implemented",
+        "src.conversion.gml_runtime_parts",
+        "n/a",
+        "yes",
+        "yes",
+        "no",
+        "GameMaker_Language/GML_Reference/Asset_Management/Instances/Instances.htm",
+        "Instantiates generated object scenes and registers live instances through GMRuntime.",
+    ),
+    _entry(
+        "instance_create_depth",
+        "Instances",
+        "implemented",
+        "src.conversion.gml_runtime_parts",
+        "n/a",
+        "yes",
+        "yes",
+        "no",
+        "GameMaker_Language/GML_Reference/Asset_Management/Instances/Instances.htm",
+        "Instantiates generated object scenes with depth metadata and registry handles.",
+    ),
+    _entry(
+        "instance_destroy",
+        "Instances",
+        "implemented",
+        "src.conversion.gml_runtime_parts",
+        "n/a",
+        "yes",
+        "yes",
+        "no",
+        "GameMaker_Language/GML_Reference/Asset_Management/Instances/Instances.htm",
+        "Runs destroy callbacks, unregisters instances, and queues Godot nodes for deletion.",
+    ),
+    _entry(
+        "instance_exists",
+        "Instances",
+        "implemented",
+        "src.conversion.gml_runtime_parts",
+        "n/a",
+        "yes",
+        "yes",
+        "no",
+        "GameMaker_Language/GML_Reference/Asset_Management/Instances/Instances.htm",
+        "Queries live instance registry entries by instance id, object selector, or keyword.",
+    ),
+    _entry(
+        "instance_find",
+        "Instances",
+        "implemented",
+        "src.conversion.gml_runtime_parts",
+        "n/a",
+        "yes",
+        "yes",
+        "no",
+        "GameMaker_Language/GML_Reference/Asset_Management/Instances/Instances.htm",
+        "Returns stable handles from creation-ordered object selector matches.",
+    ),
+    _entry(
+        "instance_number",
+        "Instances",
+        "implemented",
+        "src.conversion.gml_runtime_parts",
+        "n/a",
+        "yes",
+        "yes",
+        "no",
+        "GameMaker_Language/GML_Reference/Asset_Management/Instances/Instances.htm",
+        "Counts live registry matches including inherited object selectors.",
+    ),
+    _entry(
+        "instance_nearest",
+        "Instances",
+        "implemented",
+        "src.conversion.gml_runtime_parts",
+        "n/a",
+        "yes",
+        "yes",
+        "no",
+        "GameMaker_Language/GML_Reference/Asset_Management/Instances/Instances.htm",
+        "Selects the nearest live instance using Godot Node2D positions.",
+    ),
+    _entry(
+        "instance_furthest",
+        "Instances",
+        "implemented",
+        "src.conversion.gml_runtime_parts",
+        "n/a",
+        "yes",
+        "yes",
+        "no",
+        "GameMaker_Language/GML_Reference/Asset_Management/Instances/Instances.htm",
+        "Selects the furthest live instance using Godot Node2D positions.",
+    ),
+    _entry(
+        "instance_id_get",
+        "Instances",
+        "implemented",
+        "src.conversion.gml_runtime_parts",
+        "n/a",
+        "yes",
+        "yes",
+        "no",
+        "GameMaker_Language/GML_Reference/Asset_Management/Instances/Instances.htm",
+        "Returns creation-ordered live instance handles from the runtime registry.",
+    ),
+    _entry(
+        "with",
+        "Cross-Instance Addressing",
+        "partial",
+        "src.conversion.gml_transpiler_parts.statement_parser",
+        "yes",
+        "partial",
+        "partial",
+        "no",
+        "GameMaker_Language/GML_Overview/Language_Features.htm",
+        "Basic with-target execution exists; object selector and parent-chain dispatch is planned.",
+    ),
+    _entry(
+        "variable_instance_get",
+        "Cross-Instance Addressing",
+        "implemented",
+        "src.conversion.gml_runtime_parts.segments.40_arrays_structs_variables",
+        "n/a",
+        "yes",
+        "yes",
+        "no",
+        "GameMaker_Language/GML_Reference/Variable_Functions/Variable_Functions.htm",
+        "Implemented through instance keyword and runtime variable helpers.",
+    ),
+    _entry(
+        "variable_instance_exists",
+        "Cross-Instance Addressing",
+        "implemented",
+        "src.conversion.gml_runtime_parts.segments.40_arrays_structs_variables",
+        "n/a",
+        "yes",
+        "yes",
+        "no",
+        "GameMaker_Language/GML_Reference/Variable_Functions/Variable_Functions.htm",
+        "Checks dynamic instance/global-scope members through selector helpers.",
+    ),
+    _entry(
+        "variable_instance_set",
+        "Cross-Instance Addressing",
+        "implemented",
+        "src.conversion.gml_runtime_parts.segments.40_arrays_structs_variables",
+        "n/a",
+        "yes",
+        "yes",
+        "no",
+        "GameMaker_Language/GML_Reference/Variable_Functions/Variable_Functions.htm",
+        "Creates or updates dynamic instance/global-scope members through selector helpers.",
+    ),
+    _entry(
+        "variable_instance_get_names",
+        "Cross-Instance Addressing",
+        "implemented",
+        "src.conversion.gml_runtime_parts.segments.40_arrays_structs_variables",
+        "n/a",
+        "yes",
+        "yes",
+        "no",
+        "GameMaker_Language/GML_Reference/Variable_Functions/Variable_Functions.htm",
+        "Enumerates visible dynamic member names on the resolved instance/global target.",
+    ),
+    _entry(
+        "variable_instance_names_count",
+        "Cross-Instance Addressing",
+        "implemented",
+        "src.conversion.gml_runtime_parts.segments.40_arrays_structs_variables",
+        "n/a",
+        "yes",
+        "yes",
+        "no",
+        "GameMaker_Language/GML_Reference/Variable_Functions/Variable_Functions.htm",
+        "Counts visible dynamic member names on the resolved instance/global target.",
+    ),
+    _entry(
+        "variable_global_exists",
+        "Cross-Instance Addressing",
+        "implemented",
+        "src.conversion.gml_runtime_parts.segments.40_arrays_structs_variables",
+        "n/a",
+        "yes",
+        "yes",
+        "no",
+        "GameMaker_Language/GML_Reference/Variable_Functions/Variable_Functions.htm",
+        "Checks members in the shared generated global scope.",
+    ),
+    _entry(
+        "variable_global_get",
+        "Cross-Instance Addressing",
+        "implemented",
+        "src.conversion.gml_runtime_parts.segments.40_arrays_structs_variables",
+        "n/a",
+        "yes",
+        "yes",
+        "no",
+        "GameMaker_Language/GML_Reference/Variable_Functions/Variable_Functions.htm",
+        "Reads members from the shared generated global scope.",
+    ),
+    _entry(
+        "variable_global_set",
+        "Cross-Instance Addressing",
+        "implemented",
+        "src.conversion.gml_runtime_parts.segments.40_arrays_structs_variables",
+        "n/a",
+        "yes",
+        "yes",
+        "no",
+        "GameMaker_Language/GML_Reference/Variable_Functions/Variable_Functions.htm",
+        "Creates or updates members in the shared generated global scope.",
+    ),
+    _entry(
+        "struct_exists",
+        "Foundation",
+        "implemented",
+        "src.conversion.gml_runtime_parts.segments.40_arrays_structs_variables",
+        "n/a",
+        "yes",
+        "yes",
+        "no",
+        "GameMaker_Language/GML_Reference/Variable_Functions/Variable_Functions.htm",
+        "Checks dictionary-backed struct and Godot object properties by name.",
+    ),
+    _entry(
+        "struct_get",
+        "Foundation",
+        "implemented",
+        "src.conversion.gml_runtime_parts.segments.40_arrays_structs_variables",
+        "n/a",
+        "yes",
+        "yes",
+        "no",
+        "GameMaker_Language/GML_Reference/Variable_Functions/Variable_Functions.htm",
+        "Returns undefined for missing struct/object members.",
+    ),
+    _entry(
+        "struct_set",
+        "Foundation",
+        "implemented",
+        "src.conversion.gml_runtime_parts.segments.40_arrays_structs_variables",
+        "n/a",
+        "yes",
+        "yes",
+        "no",
+        "GameMaker_Language/GML_Reference/Variable_Functions/Variable_Functions.htm",
+        "Creates or updates dictionary-backed struct and Godot object members.",
+    ),
+    _entry(
+        "struct_remove",
+        "Foundation",
+        "implemented",
+        "src.conversion.gml_runtime_parts.segments.40_arrays_structs_variables",
+        "n/a",
+        "yes",
+        "yes",
+        "no",
+        "GameMaker_Language/GML_Reference/Variable_Functions/Variable_Functions.htm",
+        "Removes mutable dictionary-backed struct members.",
+    ),
+    _entry(
+        "struct_get_names",
+        "Foundation",
+        "implemented",
+        "src.conversion.gml_runtime_parts.segments.40_arrays_structs_variables",
+        "n/a",
+        "yes",
+        "yes",
+        "no",
+        "GameMaker_Language/GML_Reference/Variable_Functions/Variable_Functions.htm",
+        "Enumerates dictionary-backed struct and Godot object member names.",
+    ),
+    _entry(
+        "struct_names_count",
+        "Foundation",
+        "implemented",
+        "src.conversion.gml_runtime_parts.segments.40_arrays_structs_variables",
+        "n/a",
+        "yes",
+        "yes",
+        "no",
+        "GameMaker_Language/GML_Reference/Variable_Functions/Variable_Functions.htm",
+        "Counts dictionary-backed struct and Godot object member names.",
+    ),
+    _entry(
+        "variable_struct_exists",
+        "Foundation",
+        "implemented",
+        "src.conversion.gml_runtime_parts.segments.40_arrays_structs_variables",
+        "n/a",
+        "yes",
+        "yes",
+        "no",
+        "GameMaker_Language/GML_Reference/Variable_Functions/Variable_Functions.htm",
+        "Alias wrapper for struct_exists on dynamic struct members.",
+    ),
+    _entry(
+        "variable_struct_get",
+        "Foundation",
+        "implemented",
+        "src.conversion.gml_runtime_parts.segments.40_arrays_structs_variables",
+        "n/a",
+        "yes",
+        "yes",
+        "no",
+        "GameMaker_Language/GML_Reference/Variable_Functions/Variable_Functions.htm",
+        "Alias wrapper for struct_get on dynamic struct members.",
+    ),
+    _entry(
+        "variable_struct_set",
+        "Foundation",
+        "implemented",
+        "src.conversion.gml_runtime_parts.segments.40_arrays_structs_variables",
+        "n/a",
+        "yes",
+        "yes",
+        "no",
+        "GameMaker_Language/GML_Reference/Variable_Functions/Variable_Functions.htm",
+        "Alias wrapper for struct_set on dynamic struct members.",
+    ),
+    _entry(
+        "variable_struct_remove",
+        "Foundation",
+        "implemented",
+        "src.conversion.gml_runtime_parts.segments.40_arrays_structs_variables",
+        "n/a",
+        "yes",
+        "yes",
+        "no",
+        "GameMaker_Language/GML_Reference/Variable_Functions/Variable_Functions.htm",
+        "Alias wrapper for struct_remove on dynamic struct members.",
+    ),
+    _entry(
+        "variable_struct_get_names",
+        "Foundation",
+        "implemented",
+        "src.conversion.gml_runtime_parts.segments.40_arrays_structs_variables",
+        "n/a",
+        "yes",
+        "yes",
+        "no",
+        "GameMaker_Language/GML_Reference/Variable_Functions/Variable_Functions.htm",
+        "Alias wrapper for struct_get_names on dynamic struct members.",
+    ),
+    _entry(
+        "variable_struct_names_count",
+        "Foundation",
+        "implemented",
+        "src.conversion.gml_runtime_parts.segments.40_arrays_structs_variables",
+        "n/a",
+        "yes",
+        "yes",
+        "no",
+        "GameMaker_Language/GML_Reference/Variable_Functions/Variable_Functions.htm",
+        "Alias wrapper for struct_names_count on dynamic struct members.",
+    ),
+    _entry(
+        "distance_to_object",
+        "Movement and Collisions",
+        "implemented",
+        "src.conversion.gml_runtime_parts.segments.45_collision_queries",
+        "yes",
+        "yes",
+        "yes",
+        "yes",
+        "GameMaker_Language/GML_Reference/Movement_And_Collisions/Movement_And_Collisions.htm",
+        "Returns the nearest origin-to-origin distance from the current instance to matching selector targets.",
+    ),
+    _entry(
+        "place_meeting",
+        "Movement and Collisions",
+        "partial",
+        "src.conversion.gml_runtime_parts.segments.45_collision_queries",
+        "yes",
+        "yes",
+        "partial",
+        "yes",
+        "GameMaker_Language/GML_Reference/Movement_And_Collisions/Movement_And_Collisions.htm",
+        "Uses each instance's active imported mask, including transformed static and per-frame precise geometry.",
+    ),
+    _entry(
+        "position_meeting",
+        "Movement and Collisions",
+        "partial",
+        "src.conversion.gml_runtime_parts.segments.45_collision_queries",
+        "yes",
+        "yes",
+        "partial",
+        "yes",
+        "GameMaker_Language/GML_Reference/Movement_And_Collisions/Movement_And_Collisions.htm",
+        "Uses the target's active imported mask, including transformed static and per-frame precise geometry.",
+    ),
+    _entry(
+        "instance_place",
+        "Movement and Collisions",
+        "partial",
+        "src.conversion.gml_runtime_parts.segments.45_collision_queries",
+        "yes",
+        "yes",
+        "partial",
+        "yes",
+        "GameMaker_Language/GML_Reference/Movement_And_Collisions/Movement_And_Collisions.htm",
+        "Returns matching registered instance handles using both instances' active imported masks.",
+    ),
+    _entry(
+        "instance_position",
+        "Movement and Collisions",
+        "partial",
+        "src.conversion.gml_runtime_parts.segments.45_collision_queries",
+        "yes",
+        "yes",
+        "partial",
+        "yes",
+        "GameMaker_Language/GML_Reference/Movement_And_Collisions/Movement_And_Collisions.htm",
+        "Returns matching registered instance handles using the target's active imported mask.",
+    ),
+    _entry(
+        "collision_point",
+        "Movement and Collisions",
+        "partial",
+        "src.conversion.gml_runtime_parts.segments.45_collision_queries",
+        "yes",
+        "yes",
+        "partial",
+        "yes",
+        "GameMaker_Language/GML_Reference/Movement_And_Collisions/Movement_And_Collisions.htm",
+        "Supports selectors and notme; prec=true uses imported precise pixels and prec=false uses transformed bounds.",
+    ),
+    _entry(
+        "collision_rectangle",
+        "Movement and Collisions",
+        "partial",
+        "src.conversion.gml_runtime_parts.segments.45_collision_queries",
+        "yes",
+        "yes",
+        "partial",
+        "yes",
+        "GameMaker_Language/GML_Reference/Movement_And_Collisions/Movement_And_Collisions.htm",
+        "Supports selectors and notme; prec=true intersects imported precise pixels and prec=false uses transformed bounds.",
+    ),
+    _entry(
+        "collision_line",
+        "Movement and Collisions",
+        "partial",
+        "src.conversion.gml_runtime_parts.segments.45_collision_queries",
+        "yes",
+        "yes",
+        "partial",
+        "yes",
+        "GameMaker_Language/GML_Reference/Movement_And_Collisions/Movement_And_Collisions.htm",
+        "Supports selectors and notme; prec=true intersects imported precise pixels and prec=false uses transformed bounds.",
+    ),
+    _entry(
+        "collision_circle",
+        "Movement and Collisions",
+        "partial",
+        "src.conversion.gml_runtime_parts.segments.45_collision_queries",
+        "yes",
+        "yes",
+        "partial",
+        "yes",
+        "GameMaker_Language/GML_Reference/Movement_And_Collisions/Movement_And_Collisions.htm",
+        "Supports selectors and notme; prec=true intersects imported precise pixels and prec=false uses transformed bounds.",
+    ),
+    _entry(
+        "collision_point_list",
+        "Movement and Collisions",
+        "partial",
+        "src.conversion.gml_runtime_parts.segments.45_collision_queries",
+        "yes",
+        "yes",
+        "partial",
+        "yes",
+        "GameMaker_Language/GML_Reference/Movement_And_Collisions/Movement_And_Collisions.htm",
+        "Appends active-mask point matches to a DS list with precise/bounds selection and optional distance ordering.",
+    ),
+    _entry(
+        "collision_rectangle_list",
+        "Movement and Collisions",
+        "partial",
+        "src.conversion.gml_runtime_parts.segments.45_collision_queries",
+        "yes",
+        "yes",
+        "partial",
+        "yes",
+        "GameMaker_Language/GML_Reference/Movement_And_Collisions/Movement_And_Collisions.htm",
+        "Appends active-mask rectangle matches to a DS list with precise/bounds selection and optional distance ordering.",
+    ),
+    _entry(
+        "collision_line_list",
+        "Movement and Collisions",
+        "partial",
+        "src.conversion.gml_runtime_parts.segments.45_collision_queries",
+        "yes",
+        "yes",
+        "partial",
+        "yes",
+        "GameMaker_Language/GML_Reference/Movement_And_Collisions/Movement_And_Collisions.htm",
+        "Appends active-mask line matches to a DS list with precise/bounds selection and optional start-distance ordering.",
+    ),
+    _entry(
+        "collision_circle_list",
+        "Movement and Collisions",
+        "partial",
+        "src.conversion.gml_runtime_parts.segments.45_collision_queries",
+        "yes",
+        "yes",
+        "partial",
+        "yes",
+        "GameMaker_Language/GML_Reference/Movement_And_Collisions/Movement_And_Collisions.htm",
+        "Appends active-mask circle matches to a DS list with precise/bounds selection and optional distance ordering.",
+    ),
+    _entry(
+        "motion_set",
+        "Motion Helpers",
+        "implemented",
+        "src.conversion.gml_runtime_parts.segments.46_motion_helpers",
+        "yes",
+        "yes",
+        "yes",
+        "yes",
+        "GameMaker_Language/GML_Reference/Movement_And_Collisions/Movement_And_Collisions.htm",
+        "Synchronizes speed/direction/hspeed/vspeed using GameMaker angle conventions.",
+    ),
+    _entry(
+        "motion_add",
+        "Motion Helpers",
+        "implemented",
+        "src.conversion.gml_runtime_parts.segments.46_motion_helpers",
+        "yes",
+        "yes",
+        "yes",
+        "yes",
+        "GameMaker_Language/GML_Reference/Movement_And_Collisions/Movement_And_Collisions.htm",
+        "Adds a polar vector to the current motion vector and resynchronizes motion built-ins.",
+    ),
+    _entry(
+        "move_towards_point",
+        "Motion Helpers",
+        "implemented",
+        "src.conversion.gml_runtime_parts.segments.46_motion_helpers",
+        "yes",
+        "yes",
+        "yes",
+        "yes",
+        "GameMaker_Language/GML_Reference/Movement_And_Collisions/Movement_And_Collisions.htm",
+        "Sets direction/speed toward the target point without requiring CharacterBody2D.",
+    ),
+    _entry(
+        "move_contact_solid",
+        "Motion Helpers",
+        "partial",
+        "src.conversion.gml_runtime_parts.segments.46_motion_helpers",
+        "yes",
+        "yes",
+        "yes",
+        "yes",
+        "GameMaker_Language/GML_Reference/Movement_And_Collisions/Movement_And_Collisions.htm",
+        "Uses active imported masks and generated object solid metadata.",
+    ),
+    _entry(
+        "move_contact_all",
+        "Motion Helpers",
+        "partial",
+        "src.conversion.gml_runtime_parts.segments.46_motion_helpers",
+        "yes",
+        "yes",
+        "yes",
+        "yes",
+        "GameMaker_Language/GML_Reference/Movement_And_Collisions/Movement_And_Collisions.htm",
+        "Uses active imported masks for all registered instances.",
+    ),
+    _entry(
+        "move_bounce_solid",
+        "Motion Helpers",
+        "partial",
+        "src.conversion.gml_runtime_parts.segments.46_motion_helpers",
+        "yes",
+        "yes",
+        "yes",
+        "yes",
+        "GameMaker_Language/GML_Reference/Movement_And_Collisions/Movement_And_Collisions.htm",
+        "Reflects hspeed/vspeed against active solid masks; advanced mode is approximated.",
+    ),
+    _entry(
+        "move_bounce_all",
+        "Motion Helpers",
+        "partial",
+        "src.conversion.gml_runtime_parts.segments.46_motion_helpers",
+        "yes",
+        "yes",
+        "yes",
+        "yes",
+        "GameMaker_Language/GML_Reference/Movement_And_Collisions/Movement_And_Collisions.htm",
+        "Reflects hspeed/vspeed against active masks; advanced mode is approximated.",
+    ),
+    _entry(
+        "move_random",
+        "Motion Helpers",
+        "partial",
+        "src.conversion.gml_runtime_parts.segments.46_motion_helpers",
+        "yes",
+        "yes",
+        "yes",
+        "yes",
+        "GameMaker_Language/GML_Reference/Movement_And_Collisions/Movement_And_Collisions.htm",
+        "Chooses a room-bounded snapped position using Godot RNG.",
+    ),
+    _entry(
+        "move_snap",
+        "Motion Helpers",
+        "implemented",
+        "src.conversion.gml_runtime_parts.segments.46_motion_helpers",
+        "yes",
+        "yes",
+        "yes",
+        "yes",
+        "GameMaker_Language/GML_Reference/Movement_And_Collisions/Movement_And_Collisions.htm",
+        "Snaps the instance position to a horizontal/vertical grid.",
+    ),
+    _entry(
+        "place_snapped",
+        "Motion Helpers",
+        "implemented",
+        "src.conversion.gml_runtime_parts.segments.46_motion_helpers",
+        "yes",
+        "yes",
+        "yes",
+        "yes",
+        "GameMaker_Language/GML_Reference/Movement_And_Collisions/Movement_And_Collisions.htm",
+        "Checks whether the instance is on a horizontal/vertical snap grid.",
+    ),
+    _entry(
+        "path_start",
+        "Paths and Motion Planning",
+        "partial",
+        "src.conversion.gml_runtime_parts.segments.47_paths_motion_planning",
+        "yes",
+        "yes",
+        "partial",
+        "yes",
+        "GameMaker_Language/GML_Reference/Movement_And_Collisions/Movement_And_Collisions.htm",
+        "Uses generated path registry points and dispatches _on_path_ended for stop/restart end actions.",
+    ),
+    _entry(
+        "path_end",
+        "Paths and Motion Planning",
+        "implemented",
+        "src.conversion.gml_runtime_parts.segments.47_paths_motion_planning",
+        "yes",
+        "yes",
+        "yes",
+        "yes",
+        "GameMaker_Language/GML_Reference/Movement_And_Collisions/Movement_And_Collisions.htm",
+        "Stops generated runtime path-following state.",
+    ),
+    _entry(
+        "path_get_length",
+        "Paths and Motion Planning",
+        "implemented",
+        "src.conversion.gml_runtime_parts.segments.47_paths_motion_planning",
+        "yes",
+        "yes",
+        "yes",
+        "yes",
+        "GameMaker_Language/GML_Reference/Movement_And_Collisions/Movement_And_Collisions.htm",
+        "Measures generated straight-line path point length.",
+    ),
+    _entry(
+        "mp_grid_create",
+        "Paths and Motion Planning",
+        "partial",
+        "src.conversion.gml_runtime_parts.segments.47_paths_motion_planning",
+        "yes",
+        "yes",
+        "partial",
+        "yes",
+        "GameMaker_Language/GML_Reference/Movement_And_Collisions/Movement_And_Collisions.htm",
+        "Creates handle-backed 2D occupancy grids for deterministic path search.",
+    ),
+    _entry(
+        "mp_grid_destroy",
+        "Paths and Motion Planning",
+        "partial",
+        "src.conversion.gml_runtime_parts.segments.47_paths_motion_planning",
+        "yes",
+        "yes",
+        "partial",
+        "yes",
+        "GameMaker_Language/GML_Reference/Movement_And_Collisions/Movement_And_Collisions.htm",
+        "Invalidates handle-backed mp_grid data.",
+    ),
+    _entry(
+        "mp_grid_clear_all",
+        "Paths and Motion Planning",
+        "partial",
+        "src.conversion.gml_runtime_parts.segments.47_paths_motion_planning",
+        "yes",
+        "yes",
+        "partial",
+        "yes",
+        "GameMaker_Language/GML_Reference/Movement_And_Collisions/Movement_And_Collisions.htm",
+        "Clears all blocked cells from handle-backed mp_grid data.",
+    ),
+    _entry(
+        "mp_grid_add_cell",
+        "Paths and Motion Planning",
+        "partial",
+        "src.conversion.gml_runtime_parts.segments.47_paths_motion_planning",
+        "yes",
+        "yes",
+        "partial",
+        "yes",
+        "GameMaker_Language/GML_Reference/Movement_And_Collisions/Movement_And_Collisions.htm",
+        "Marks a single mp_grid cell as blocked.",
+    ),
+    _entry(
+        "mp_grid_clear_cell",
+        "Paths and Motion Planning",
+        "partial",
+        "src.conversion.gml_runtime_parts.segments.47_paths_motion_planning",
+        "yes",
+        "yes",
+        "partial",
+        "yes",
+        "GameMaker_Language/GML_Reference/Movement_And_Collisions/Movement_And_Collisions.htm",
+        "Clears a single mp_grid cell.",
+    ),
+    _entry(
+        "mp_grid_add_rectangle",
+        "Paths and Motion Planning",
+        "partial",
+        "src.conversion.gml_runtime_parts.segments.47_paths_motion_planning",
+        "yes",
+        "yes",
+        "partial",
+        "yes",
+        "GameMaker_Language/GML_Reference/Movement_And_Collisions/Movement_And_Collisions.htm",
+        "Marks cells covered by an axis-aligned rectangle as blocked.",
+    ),
+    _entry(
+        "mp_grid_path",
+        "Paths and Motion Planning",
+        "partial",
+        "src.conversion.gml_runtime_parts.segments.47_paths_motion_planning",
+        "yes",
+        "yes",
+        "partial",
+        "yes",
+        "GameMaker_Language/GML_Reference/Movement_And_Collisions/Movement_And_Collisions.htm",
+        "Finds deterministic 4/8-way routes and writes points into generated runtime path data.",
+    ),
+    _entry(
+        "draw_set_color",
+        "Drawing Basic Forms",
+        "implemented",
+        "src.conversion.gml_runtime_parts.segments.48_drawing_basic_forms",
+        "yes",
+        "yes",
+        "yes",
+        "yes",
+        "GameMaker_Language/GML_Reference/Drawing/Colour_And_Alpha/Colour_And_Alpha.htm",
+        "Stores draw color in the active CanvasItem draw context.",
+    ),
+    _entry(
+        "draw_get_color",
+        "Drawing Basic Forms",
+        "implemented",
+        "src.conversion.gml_runtime_parts.segments.48_drawing_basic_forms",
+        "yes",
+        "yes",
+        "yes",
+        "yes",
+        "GameMaker_Language/GML_Reference/Drawing/Colour_And_Alpha/Colour_And_Alpha.htm",
+        "Returns the active draw context color value.",
+    ),
+    _entry(
+        "draw_set_alpha",
+        "Drawing Basic Forms",
+        "implemented",
+        "src.conversion.gml_runtime_parts.segments.48_drawing_basic_forms",
+        "yes",
+        "yes",
+        "yes",
+        "yes",
+        "GameMaker_Language/GML_Reference/Drawing/Colour_And_Alpha/Colour_And_Alpha.htm",
+        "Stores alpha for subsequent basic draw helper calls.",
+    ),
+    _entry(
+        "draw_get_alpha",
+        "Drawing Basic Forms",
+        "implemented",
+        "src.conversion.gml_runtime_parts.segments.48_drawing_basic_forms",
+        "yes",
+        "yes",
+        "yes",
+        "yes",
+        "GameMaker_Language/GML_Reference/Drawing/Colour_And_Alpha/Colour_And_Alpha.htm",
+        "Returns the active draw context alpha value.",
+    ),
+    _entry(
+        "draw_clear",
+        "Drawing Basic Forms",
+        "partial",
+        "src.conversion.gml_runtime_parts.segments.48_drawing_basic_forms",
+        "yes",
+        "yes",
+        "partial",
+        "yes",
+        "GameMaker_Language/GML_Reference/Drawing/Basic_Forms/Basic_Forms.htm",
+        "Fills a large CanvasItem rect in the active draw context.",
+    ),
+    _entry(
+        "draw_set_line_width",
+        "Drawing Basic Forms",
+        "implemented",
+        "src.conversion.gml_runtime_parts.segments.48_drawing_basic_forms",
+        "yes",
+        "yes",
+        "yes",
+        "yes",
+        "GameMaker_Language/GML_Reference/Drawing/Basic_Forms/Basic_Forms.htm",
+        "Stores line width for subsequent outline and line draw helper calls.",
+    ),
+    _entry(
+        "draw_get_line_width",
+        "Drawing Basic Forms",
+        "implemented",
+        "src.conversion.gml_runtime_parts.segments.48_drawing_basic_forms",
+        "yes",
+        "yes",
+        "yes",
+        "yes",
+        "GameMaker_Language/GML_Reference/Drawing/Basic_Forms/Basic_Forms.htm",
+        "Returns the active draw context line width.",
+    ),
+    _entry(
+        "draw_line",
+        "Drawing Basic Forms",
+        "implemented",
+        "src.conversion.gml_runtime_parts.segments.48_drawing_basic_forms",
+        "yes",
+        "yes",
+        "yes",
+        "yes",
+        "GameMaker_Language/GML_Reference/Drawing/Basic_Forms/Basic_Forms.htm",
+        "Draws through the active CanvasItem draw context using current color/alpha/line width.",
+    ),
+    _entry(
+        "draw_line_width",
+        "Drawing Basic Forms",
+        "implemented",
+        "src.conversion.gml_runtime_parts.segments.48_drawing_basic_forms",
+        "yes",
+        "yes",
+        "yes",
+        "yes",
+        "GameMaker_Language/GML_Reference/Drawing/Basic_Forms/Basic_Forms.htm",
+        "Draws a line through the active CanvasItem draw context using an explicit width.",
+    ),
+    _entry(
+        "draw_rectangle",
+        "Drawing Basic Forms",
+        "implemented",
+        "src.conversion.gml_runtime_parts.segments.48_drawing_basic_forms",
+        "yes",
+        "yes",
+        "yes",
+        "yes",
+        "GameMaker_Language/GML_Reference/Drawing/Basic_Forms/Basic_Forms.htm",
+        "Supports filled and outlined axis-aligned rectangles in the active draw context.",
+    ),
+    _entry(
+        "draw_rectangle_color",
+        "Drawing Basic Forms",
+        "partial",
+        "src.conversion.gml_runtime_parts.segments.48_drawing_basic_forms",
+        "yes",
+        "yes",
+        "partial",
+        "yes",
+        "GameMaker_Language/GML_Reference/Drawing/Basic_Forms/Basic_Forms.htm",
+        "Draws a color-averaged rectangle for validation-clean compatibility; exact corner gradients are approximated.",
+    ),
+    _entry(
+        "draw_circle",
+        "Drawing Basic Forms",
+        "implemented",
+        "src.conversion.gml_runtime_parts.segments.48_drawing_basic_forms",
+        "yes",
+        "yes",
+        "yes",
+        "yes",
+        "GameMaker_Language/GML_Reference/Drawing/Basic_Forms/Basic_Forms.htm",
+        "Supports filled circles and arc-based outlines in the active draw context.",
+    ),
+    _entry(
+        "draw_triangle",
+        "Drawing Basic Forms",
+        "implemented",
+        "src.conversion.gml_runtime_parts.segments.48_drawing_basic_forms",
+        "yes",
+        "yes",
+        "yes",
+        "yes",
+        "GameMaker_Language/GML_Reference/Drawing/Basic_Forms/Basic_Forms.htm",
+        "Supports filled and outlined triangles in the active draw context.",
+    ),
+    _entry(
+        "draw_point",
+        "Drawing Basic Forms",
+        "implemented",
+        "src.conversion.gml_runtime_parts.segments.48_drawing_basic_forms",
+        "yes",
+        "yes",
+        "yes",
+        "yes",
+        "GameMaker_Language/GML_Reference/Drawing/Basic_Forms/Basic_Forms.htm",
+        "Draws a minimum-size point using the active draw color.",
+    ),
+    _entry(
+        "draw_self",
+        "Drawing Sprites Text Fonts",
+        "implemented",
+        "src.conversion.gml_runtime_parts.segments.48_drawing_basic_forms",
+        "yes",
+        "yes",
+        "yes",
+        "yes",
+        "GameMaker_Language/GML_Reference/Drawing/Sprites_And_Tiles/draw_self.htm",
+        "Draws the current instance sprite through draw runtime state and converted sprite assets.",
+    ),
+    _entry(
+        "draw_sprite",
+        "Drawing Sprites Text Fonts",
+        "implemented",
+        "src.conversion.gml_runtime_parts.segments.48_drawing_basic_forms",
+        "yes",
+        "yes",
+        "yes",
+        "yes",
+        "GameMaker_Language/GML_Reference/Drawing/Sprites_And_Tiles/draw_sprite.htm",
+        "Draws converted sprite frames through the runtime asset registry.",
+    ),
+    _entry(
+        "draw_sprite_ext",
+        "Drawing Sprites Text Fonts",
+        "implemented",
+        "src.conversion.gml_runtime_parts.segments.48_drawing_basic_forms",
+        "yes",
+        "yes",
+        "yes",
+        "yes",
+        "GameMaker_Language/GML_Reference/Drawing/Sprites_And_Tiles/draw_sprite_ext.htm",
+        "Supports scale, rotation, blend, alpha, origin, and subimage selection.",
+    ),
+    _entry(
+        "draw_sprite_part",
+        "Drawing Sprites Text Fonts",
+        "implemented",
+        "src.conversion.gml_runtime_parts.segments.48_drawing_basic_forms",
+        "yes",
+        "yes",
+        "yes",
+        "yes",
+        "GameMaker_Language/GML_Reference/Drawing/Sprites_And_Tiles/draw_sprite_part.htm",
+        "Draws source regions without applying the sprite origin.",
+    ),
+    _entry(
+        "draw_sprite_part_ext",
+        "Drawing Sprites Text Fonts",
+        "implemented",
+        "src.conversion.gml_runtime_parts.segments.48_drawing_basic_forms",
+        "yes",
+        "yes",
+        "yes",
+        "no",
+        "GameMaker_Language/GML_Reference/Drawing/Sprites_And_Tiles/draw_sprite_part_ext.htm",
+        "Adds scale, colour, and alpha to sprite part drawing.",
+    ),
+    _entry(
+        "draw_sprite_general",
+        "Drawing Sprites Text Fonts",
+        "partial",
+        "src.conversion.gml_runtime_parts.segments.48_drawing_basic_forms",
+        "yes",
+        "yes",
+        "partial",
+        "no",
+        "GameMaker_Language/GML_Reference/Drawing/Sprites_And_Tiles/draw_sprite_general.htm",
+        "Preserves the signature and transform; per-corner colour gradients are approximated.",
+    ),
+    _entry(
+        "draw_sprite_pos",
+        "Drawing Sprites Text Fonts",
+        "implemented",
+        "src.conversion.gml_runtime_parts.segments.48_drawing_basic_forms",
+        "yes",
+        "yes",
+        "yes",
+        "yes",
+        "GameMaker_Language/GML_Reference/Drawing/Sprites_And_Tiles/draw_sprite_pos.htm",
+        "Draws the selected sprite frame into a four-corner textured polygon.",
+    ),
+    _entry(
+        "draw_sprite_tiled",
+        "Drawing Sprites Text Fonts",
+        "implemented",
+        "src.conversion.gml_runtime_parts.segments.48_drawing_basic_forms",
+        "yes",
+        "yes",
+        "yes",
+        "yes",
+        "GameMaker_Language/GML_Reference/Drawing/Sprites_And_Tiles/draw_sprite_tiled.htm",
+        "Tiles converted sprite frames across the room or viewport.",
+    ),
+    _entry(
+        "draw_sprite_tiled_ext",
+        "Drawing Sprites Text Fonts",
+        "implemented",
+        "src.conversion.gml_runtime_parts.segments.48_drawing_basic_forms",
+        "yes",
+        "yes",
+        "yes",
+        "no",
+        "GameMaker_Language/GML_Reference/Drawing/Sprites_And_Tiles/draw_sprite_tiled_ext.htm",
+        "Adds scale, colour, and alpha to sprite tiling.",
+    ),
+    _entry(
+        "draw_tile",
+        "Drawing Sprites Text Fonts",
+        "partial",
+        "src.conversion.gml_runtime_parts.segments.48_drawing_basic_forms",
+        "yes",
+        "yes",
+        "partial",
+        "no",
+        "GameMaker_Language/GML_Reference/Drawing/Sprites_And_Tiles/draw_tile.htm",
+        "Draws atlas-backed converted TileSet tiles for the common static tile case.",
+    ),
+    _entry(
+        "draw_tilemap",
+        "Drawing Sprites Text Fonts",
+        "partial",
+        "src.conversion.gml_runtime_parts.segments.48_drawing_basic_forms",
+        "yes",
+        "yes",
+        "partial",
+        "no",
+        "GameMaker_Language/GML_Reference/Drawing/Sprites_And_Tiles/draw_tilemap.htm",
+        "Compiles tilemap draw calls and draws CanvasItem tilemap nodes when available.",
+    ),
+    _entry(
+        "draw_text",
+        "Drawing Sprites Text Fonts",
+        "implemented",
+        "src.conversion.gml_runtime_parts.segments.48_drawing_basic_forms",
+        "yes",
+        "yes",
+        "yes",
+        "yes",
+        "GameMaker_Language/GML_Reference/Drawing/Text/draw_text.htm",
+        "Draws strings using draw colour, alpha, font, and text alignment state.",
+    ),
+    _entry(
+        "draw_text_ext",
+        "Drawing Sprites Text Fonts",
+        "implemented",
+        "src.conversion.gml_runtime_parts.segments.48_drawing_basic_forms",
+        "yes",
+        "yes",
+        "yes",
+        "yes",
+        "GameMaker_Language/GML_Reference/Drawing/Text/draw_text_ext.htm",
+        "Supports explicit line separation and width wrapping for draw text.",
+    ),
+    _entry(
+        "draw_text_transformed",
+        "Drawing Sprites Text Fonts",
+        "implemented",
+        "src.conversion.gml_runtime_parts.segments.48_drawing_basic_forms",
+        "yes",
+        "yes",
+        "yes",
+        "yes",
+        "GameMaker_Language/GML_Reference/Drawing/Text/draw_text_transformed.htm",
+        "Applies local scale and angle transforms while preserving alignment state.",
+    ),
+    _entry(
+        "draw_set_font",
+        "Drawing Sprites Text Fonts",
+        "implemented",
+        "src.conversion.gml_runtime_parts.segments.48_drawing_basic_forms",
+        "yes",
+        "yes",
+        "yes",
+        "yes",
+        "GameMaker_Language/GML_Reference/Drawing/Text/draw_set_font.htm",
+        "Stores converted font asset ids with fallback to ThemeDB default font.",
+    ),
+    _entry(
+        "draw_get_font",
+        "Drawing Sprites Text Fonts",
+        "implemented",
+        "src.conversion.gml_runtime_parts.segments.48_drawing_basic_forms",
+        "yes",
+        "yes",
+        "yes",
+        "no",
+        "GameMaker_Language/GML_Reference/Drawing/Text/draw_get_font.htm",
+        "Returns the active font asset id or -1 for the default font.",
+    ),
+    _entry(
+        "draw_set_halign",
+        "Drawing Sprites Text Fonts",
+        "implemented",
+        "src.conversion.gml_runtime_parts.segments.48_drawing_basic_forms",
+        "yes",
+        "yes",
+        "yes",
+        "yes",
+        "GameMaker_Language/GML_Reference/Drawing/Text/draw_set_halign.htm",
+        "Tracks fa_left, fa_center, and fa_right text alignment state.",
+    ),
+    _entry(
+        "draw_get_halign",
+        "Drawing Sprites Text Fonts",
+        "implemented",
+        "src.conversion.gml_runtime_parts.segments.48_drawing_basic_forms",
+        "yes",
+        "yes",
+        "yes",
+        "no",
+        "GameMaker_Language/GML_Reference/Drawing/Text/draw_get_halign.htm",
+        "Returns the active horizontal text alignment constant.",
+    ),
+    _entry(
+        "draw_set_valign",
+        "Drawing Sprites Text Fonts",
+        "implemented",
+        "src.conversion.gml_runtime_parts.segments.48_drawing_basic_forms",
+        "yes",
+        "yes",
+        "yes",
+        "yes",
+        "GameMaker_Language/GML_Reference/Drawing/Text/draw_set_valign.htm",
+        "Tracks fa_top, fa_middle, and fa_bottom text alignment state.",
+    ),
+    _entry(
+        "draw_get_valign",
+        "Drawing Sprites Text Fonts",
+        "implemented",
+        "src.conversion.gml_runtime_parts.segments.48_drawing_basic_forms",
+        "yes",
+        "yes",
+        "yes",
+        "no",
+        "GameMaker_Language/GML_Reference/Drawing/Text/draw_get_valign.htm",
+        "Returns the active vertical text alignment constant.",
+    ),
+    _entry(
+        "string_width",
+        "Drawing Sprites Text Fonts",
+        "implemented",
+        "src.conversion.gml_runtime_parts.segments.48_drawing_basic_forms",
+        "yes",
+        "yes",
+        "yes",
+        "yes",
+        "GameMaker_Language/GML_Reference/Strings/string_width.htm",
+        "Measures text using the current draw font.",
+    ),
+    _entry(
+        "string_height",
+        "Drawing Sprites Text Fonts",
+        "implemented",
+        "src.conversion.gml_runtime_parts.segments.48_drawing_basic_forms",
+        "yes",
+        "yes",
+        "yes",
+        "yes",
+        "GameMaker_Language/GML_Reference/Strings/string_height.htm",
+        "Measures text height using the current draw font.",
+    ),
+    _entry(
+        "string_width_ext",
+        "Drawing Sprites Text Fonts",
+        "implemented",
+        "src.conversion.gml_runtime_parts.segments.48_drawing_basic_forms",
+        "yes",
+        "yes",
+        "yes",
+        "yes",
+        "GameMaker_Language/GML_Reference/Strings/string_width_ext.htm",
+        "Measures wrapped text using the current draw font.",
+    ),
+    _entry(
+        "string_height_ext",
+        "Drawing Sprites Text Fonts",
+        "implemented",
+        "src.conversion.gml_runtime_parts.segments.48_drawing_basic_forms",
+        "yes",
+        "yes",
+        "yes",
+        "yes",
+        "GameMaker_Language/GML_Reference/Strings/string_height_ext.htm",
+        "Measures wrapped text height using the current draw font.",
+    ),
+    _entry(
+        "surface_create",
+        "Drawing Surfaces",
+        "partial",
+        "src.conversion.gml_runtime_parts.segments.49_drawing_surfaces",
+        "yes",
+        "yes",
+        "partial",
+        "yes",
+        "GameMaker_Language/GML_Reference/Drawing/Surfaces/surface_create.htm",
+        "Creates handle-backed RGBA image/texture surfaces; depth/stencil and alternate formats are recorded but not rendered.",
+    ),
+    _entry(
+        "surface_exists",
+        "Drawing Surfaces",
+        "implemented",
+        "src.conversion.gml_runtime_parts.segments.49_drawing_surfaces",
+        "yes",
+        "yes",
+        "yes",
+        "yes",
+        "GameMaker_Language/GML_Reference/Drawing/Surfaces/surface_exists.htm",
+        "Checks handle validity and freed/volatile surface state.",
+    ),
+    _entry(
+        "surface_free",
+        "Drawing Surfaces",
+        "implemented",
+        "src.conversion.gml_runtime_parts.segments.49_drawing_surfaces",
+        "yes",
+        "yes",
+        "yes",
+        "yes",
+        "GameMaker_Language/GML_Reference/Drawing/Surfaces/surface_free.htm",
+        "Invalidates user-created surface handles and removes active target-stack entries.",
+    ),
+    _entry(
+        "surface_set_target",
+        "Drawing Surfaces",
+        "partial",
+        "src.conversion.gml_runtime_parts.segments.49_drawing_surfaces",
+        "yes",
+        "yes",
+        "partial",
+        "yes",
+        "GameMaker_Language/GML_Reference/Drawing/Surfaces/surface_set_target.htm",
+        "Maintains a render target stack and redirects clear/copy/surface draw operations to active surfaces.",
+    ),
+    _entry(
+        "surface_reset_target",
+        "Drawing Surfaces",
+        "implemented",
+        "src.conversion.gml_runtime_parts.segments.49_drawing_surfaces",
+        "yes",
+        "yes",
+        "yes",
+        "yes",
+        "GameMaker_Language/GML_Reference/Drawing/Surfaces/surface_reset_target.htm",
+        "Pops the active surface target stack.",
+    ),
+    _entry(
+        "surface_get_width",
+        "Drawing Surfaces",
+        "implemented",
+        "src.conversion.gml_runtime_parts.segments.49_drawing_surfaces",
+        "yes",
+        "yes",
+        "yes",
+        "yes",
+        "GameMaker_Language/GML_Reference/Drawing/Surfaces/surface_get_width.htm",
+        "Returns stored surface width or 0 for invalid surfaces.",
+    ),
+    _entry(
+        "surface_get_height",
+        "Drawing Surfaces",
+        "implemented",
+        "src.conversion.gml_runtime_parts.segments.49_drawing_surfaces",
+        "yes",
+        "yes",
+        "yes",
+        "yes",
+        "GameMaker_Language/GML_Reference/Drawing/Surfaces/surface_get_height.htm",
+        "Returns stored surface height or 0 for invalid surfaces.",
+    ),
+    _entry(
+        "draw_surface",
+        "Drawing Surfaces",
+        "partial",
+        "src.conversion.gml_runtime_parts.segments.49_drawing_surfaces",
+        "yes",
+        "yes",
+        "partial",
+        "yes",
+        "GameMaker_Language/GML_Reference/Drawing/Surfaces/draw_surface.htm",
+        "Draws or blits surface textures while preventing self-draws.",
+    ),
+    _entry(
+        "draw_surface_ext",
+        "Drawing Surfaces",
+        "partial",
+        "src.conversion.gml_runtime_parts.segments.49_drawing_surfaces",
+        "yes",
+        "yes",
+        "partial",
+        "yes",
+        "GameMaker_Language/GML_Reference/Drawing/Surfaces/draw_surface_ext.htm",
+        "Preserves scale, rotation, blend, and alpha arguments for screen draws.",
+    ),
+    _entry(
+        "surface_copy",
+        "Drawing Surfaces",
+        "partial",
+        "src.conversion.gml_runtime_parts.segments.49_drawing_surfaces",
+        "yes",
+        "yes",
+        "partial",
+        "yes",
+        "GameMaker_Language/GML_Reference/Drawing/Surfaces/surface_copy.htm",
+        "Copies the source surface image into a destination surface at local coordinates.",
+    ),
+    _entry(
+        "surface_save",
+        "Drawing Surfaces",
+        "partial",
+        "src.conversion.gml_runtime_parts.segments.49_drawing_surfaces",
+        "yes",
+        "yes",
+        "partial",
+        "no",
+        "GameMaker_Language/GML_Reference/Drawing/Surfaces/surface_save.htm",
+        "Saves RGBA surfaces to PNG; relative paths map to user:// in Godot.",
+    ),
+    _entry(
+        "application_surface_enable",
+        "Drawing Surfaces",
+        "partial",
+        "src.conversion.gml_runtime_parts.segments.49_drawing_surfaces",
+        "yes",
+        "yes",
+        "partial",
+        "yes",
+        "GameMaker_Language/GML_Reference/Drawing/Surfaces/application_surface_enable.htm",
+        "Tracks application-surface enabled state without taking over the full Godot frame pipeline.",
+    ),
+    _entry(
+        "application_surface_is_enabled",
+        "Drawing Surfaces",
+        "implemented",
+        "src.conversion.gml_runtime_parts.segments.49_drawing_surfaces",
+        "yes",
+        "yes",
+        "yes",
+        "yes",
+        "GameMaker_Language/GML_Reference/Drawing/Surfaces/application_surface_is_enabled.htm",
+        "Returns runtime application-surface enabled state.",
+    ),
+    _entry(
+        "application_surface_draw_enable",
+        "Drawing Surfaces",
+        "partial",
+        "src.conversion.gml_runtime_parts.segments.49_drawing_surfaces",
+        "yes",
+        "yes",
+        "partial",
+        "yes",
+        "GameMaker_Language/GML_Reference/Drawing/Surfaces/application_surface_draw_enable.htm",
+        "Tracks automatic application-surface draw state for converted post-processing code.",
+    ),
+    _entry(
+        "application_surface_is_draw_enabled",
+        "Drawing Surfaces",
+        "implemented",
+        "src.conversion.gml_runtime_parts.segments.49_drawing_surfaces",
+        "yes",
+        "yes",
+        "yes",
+        "yes",
+        "GameMaker_Language/GML_Reference/Drawing/Surfaces/application_surface_is_draw_enabled.htm",
+        "Returns runtime application-surface draw-enabled state.",
+    ),
+    _entry(
+        "application_get_position",
+        "Drawing Surfaces",
+        "partial",
+        "src.conversion.gml_runtime_parts.segments.49_drawing_surfaces",
+        "yes",
+        "yes",
+        "partial",
+        "yes",
+        "GameMaker_Language/GML_Reference/Drawing/Surfaces/application_get_position.htm",
+        "Returns the current application-surface rectangle as [left, top, right, bottom].",
+    ),
+    _entry(
+        "camera_create",
+        "Cameras and Display",
+        "partial",
+        "src.conversion.gml_runtime_parts.segments.52_cameras_display",
+        "yes",
+        "yes",
+        "partial",
+        "yes",
+        "GameMaker_Language/GML_Reference/Cameras_And_Display/Cameras_And_Viewports/camera_create.htm",
+        "Creates handle-backed camera state using the current application-surface size as a deterministic default view.",
+    ),
+    _entry(
+        "camera_create_view",
+        "Cameras and Display",
+        "partial",
+        "src.conversion.gml_runtime_parts.segments.52_cameras_display",
+        "yes",
+        "yes",
+        "partial",
+        "yes",
+        "GameMaker_Language/GML_Reference/Cameras_And_Display/Cameras_And_Display.htm",
+        "Creates handle-backed camera view state; object following is stored but not automatically tracked.",
+    ),
+    _entry(
+        "camera_destroy",
+        "Cameras and Display",
+        "partial",
+        "src.conversion.gml_runtime_parts.segments.52_cameras_display",
+        "yes",
+        "yes",
+        "partial",
+        "yes",
+        "GameMaker_Language/GML_Reference/Cameras_And_Display/Cameras_And_Viewports/camera_destroy.htm",
+        "Invalidates handle-backed camera state and unassigns matching runtime view slots without deleting generated room Camera2D nodes.",
+    ),
+    _entry(
+        "camera_apply",
+        "Cameras and Display",
+        "partial",
+        "src.conversion.gml_runtime_parts.segments.52_cameras_display",
+        "yes",
+        "yes",
+        "partial",
+        "yes",
+        "GameMaker_Language/GML_Reference/Cameras_And_Display/Cameras_And_Viewports/camera_apply.htm",
+        "Applies stored camera state immediately and marks a bound Godot Camera2D current when available.",
+    ),
+    _entry(
+        "camera_get_active",
+        "Cameras and Display",
+        "partial",
+        "src.conversion.gml_runtime_parts.segments.52_cameras_display",
+        "yes",
+        "yes",
+        "partial",
+        "yes",
+        "GameMaker_Language/GML_Reference/Cameras_And_Display/Cameras_And_Viewports/camera_get_active.htm",
+        "Returns the camera most recently applied through the compatibility runtime, falling back to the current view slot.",
+    ),
+    _entry(
+        "camera_get_default",
+        "Cameras and Display",
+        "partial",
+        "src.conversion.gml_runtime_parts.segments.52_cameras_display",
+        "yes",
+        "yes",
+        "partial",
+        "yes",
+        "GameMaker_Language/GML_Reference/Cameras_And_Display/Cameras_And_Viewports/camera_get_default.htm",
+        "Returns a persistent handle-backed default camera used when no active view camera is available.",
+    ),
+    _entry(
+        "camera_set_default",
+        "Cameras and Display",
+        "partial",
+        "src.conversion.gml_runtime_parts.segments.52_cameras_display",
+        "yes",
+        "yes",
+        "partial",
+        "yes",
+        "GameMaker_Language/GML_Reference/Cameras_And_Display/Cameras_And_Viewports/camera_set_default.htm",
+        "Assigns an existing camera handle as the runtime default camera.",
+    ),
+    _entry(
+        "camera_set_view_mat",
+        "Cameras and Display",
+        "partial",
+        "src.conversion.gml_runtime_parts.segments.52_cameras_display",
+        "yes",
+        "yes",
+        "partial",
+        "yes",
+        "GameMaker_Language/GML_Reference/Cameras_And_Display/Cameras_And_Viewports/camera_set_view_mat.htm",
+        "Stores a custom camera view matrix for compatibility round-trips; bound Camera2D rendering still uses view rectangle state.",
+    ),
+    _entry(
+        "camera_get_view_mat",
+        "Cameras and Display",
+        "partial",
+        "src.conversion.gml_runtime_parts.segments.52_cameras_display",
+        "yes",
+        "yes",
+        "partial",
+        "yes",
+        "GameMaker_Language/GML_Reference/Cameras_And_Display/Cameras_And_Viewports/camera_get_view_mat.htm",
+        "Returns the stored view matrix, or a deterministic generated 2D view matrix for rectangle-backed cameras.",
+    ),
+    _entry(
+        "camera_set_proj_mat",
+        "Cameras and Display",
+        "partial",
+        "src.conversion.gml_runtime_parts.segments.52_cameras_display",
+        "yes",
+        "yes",
+        "partial",
+        "yes",
+        "GameMaker_Language/GML_Reference/Cameras_And_Display/Cameras_And_Viewports/camera_set_proj_mat.htm",
+        "Stores a custom camera projection matrix for compatibility round-trips; perspective rendering parity remains backend-limited.",
+    ),
+    _entry(
+        "camera_get_proj_mat",
+        "Cameras and Display",
+        "partial",
+        "src.conversion.gml_runtime_parts.segments.52_cameras_display",
+        "yes",
+        "yes",
+        "partial",
+        "yes",
+        "GameMaker_Language/GML_Reference/Cameras_And_Display/Cameras_And_Viewports/camera_get_proj_mat.htm",
+        "Returns the stored projection matrix, or a deterministic generated orthographic matrix for rectangle-backed cameras.",
+    ),
+    _entry(
+        "camera_set_view_target",
+        "Cameras and Display",
+        "partial",
+        "src.conversion.gml_runtime_parts.segments.52_cameras_display",
+        "yes",
+        "yes",
+        "partial",
+        "yes",
+        "GameMaker_Language/GML_Reference/Cameras_And_Display/Cameras_And_Viewports/camera_set_view_target.htm",
+        "Sets the object or instance selector used by the runtime follow-object camera updater.",
+    ),
+    _entry(
+        "camera_get_view_target",
+        "Cameras and Display",
+        "implemented",
+        "src.conversion.gml_runtime_parts.segments.52_cameras_display",
+        "yes",
+        "yes",
+        "yes",
+        "yes",
+        "GameMaker_Language/GML_Reference/Cameras_And_Display/Cameras_And_Viewports/camera_get_view_target.htm",
+        "Returns the stored object or instance selector used by the follow-object camera updater.",
+    ),
+    _entry(
+        "camera_set_view_speed",
+        "Cameras and Display",
+        "partial",
+        "src.conversion.gml_runtime_parts.segments.52_cameras_display",
+        "yes",
+        "yes",
+        "partial",
+        "yes",
+        "GameMaker_Language/GML_Reference/Cameras_And_Display/Cameras_And_Viewports/camera_set_view_speed.htm",
+        "Sets per-frame follow speed limits for the runtime follow-object camera updater.",
+    ),
+    _entry(
+        "camera_get_view_speed_x",
+        "Cameras and Display",
+        "implemented",
+        "src.conversion.gml_runtime_parts.segments.52_cameras_display",
+        "yes",
+        "yes",
+        "yes",
+        "yes",
+        "GameMaker_Language/GML_Reference/Cameras_And_Display/Cameras_And_Viewports/camera_get_view_speed_x.htm",
+        "Returns stored horizontal follow speed for a camera.",
+    ),
+    _entry(
+        "camera_get_view_speed_y",
+        "Cameras and Display",
+        "implemented",
+        "src.conversion.gml_runtime_parts.segments.52_cameras_display",
+        "yes",
+        "yes",
+        "yes",
+        "yes",
+        "GameMaker_Language/GML_Reference/Cameras_And_Display/Cameras_And_Viewports/camera_get_view_speed_y.htm",
+        "Returns stored vertical follow speed for a camera.",
+    ),
+    _entry(
+        "camera_set_view_border",
+        "Cameras and Display",
+        "partial",
+        "src.conversion.gml_runtime_parts.segments.52_cameras_display",
+        "yes",
+        "yes",
+        "partial",
+        "yes",
+        "GameMaker_Language/GML_Reference/Cameras_And_Display/Cameras_And_Viewports/camera_set_view_border.htm",
+        "Sets follow border distances used before the runtime moves a target-tracking view.",
+    ),
+    _entry(
+        "camera_get_view_border_x",
+        "Cameras and Display",
+        "implemented",
+        "src.conversion.gml_runtime_parts.segments.52_cameras_display",
+        "yes",
+        "yes",
+        "yes",
+        "yes",
+        "GameMaker_Language/GML_Reference/Cameras_And_Display/Cameras_And_Viewports/camera_get_view_border_x.htm",
+        "Returns stored horizontal follow border for a camera.",
+    ),
+    _entry(
+        "camera_get_view_border_y",
+        "Cameras and Display",
+        "implemented",
+        "src.conversion.gml_runtime_parts.segments.52_cameras_display",
+        "yes",
+        "yes",
+        "yes",
+        "yes",
+        "GameMaker_Language/GML_Reference/Cameras_And_Display/Cameras_And_Viewports/camera_get_view_border_y.htm",
+        "Returns stored vertical follow border for a camera.",
+    ),
+    _entry(
+        "camera_set_view_pos",
+        "Cameras and Display",
+        "partial",
+        "src.conversion.gml_runtime_parts.segments.52_cameras_display",
+        "yes",
+        "yes",
+        "partial",
+        "yes",
+        "GameMaker_Language/GML_Reference/Cameras_And_Display/Cameras_And_Display.htm",
+        "Updates camera state, synchronized legacy view arrays, and bound Camera2D metadata when available.",
+    ),
+    _entry(
+        "camera_set_view_size",
+        "Cameras and Display",
+        "partial",
+        "src.conversion.gml_runtime_parts.segments.52_cameras_display",
+        "yes",
+        "yes",
+        "partial",
+        "yes",
+        "GameMaker_Language/GML_Reference/Cameras_And_Display/Cameras_And_Display.htm",
+        "Updates camera dimensions and synchronized view arrays.",
+    ),
+    _entry(
+        "camera_get_view_x",
+        "Cameras and Display",
+        "implemented",
+        "src.conversion.gml_runtime_parts.segments.52_cameras_display",
+        "yes",
+        "yes",
+        "yes",
+        "yes",
+        "GameMaker_Language/GML_Reference/Cameras_And_Display/Cameras_And_Display.htm",
+        "Reads camera x state, including legacy view_xview synchronization.",
+    ),
+    _entry(
+        "camera_get_view_y",
+        "Cameras and Display",
+        "implemented",
+        "src.conversion.gml_runtime_parts.segments.52_cameras_display",
+        "yes",
+        "yes",
+        "yes",
+        "yes",
+        "GameMaker_Language/GML_Reference/Cameras_And_Display/Cameras_And_Display.htm",
+        "Reads camera y state, including legacy view_yview synchronization.",
+    ),
+    _entry(
+        "camera_get_view_width",
+        "Cameras and Display",
+        "implemented",
+        "src.conversion.gml_runtime_parts.segments.52_cameras_display",
+        "yes",
+        "yes",
+        "yes",
+        "yes",
+        "GameMaker_Language/GML_Reference/Cameras_And_Display/Cameras_And_Display.htm",
+        "Reads camera view width state.",
+    ),
+    _entry(
+        "camera_get_view_height",
+        "Cameras and Display",
+        "implemented",
+        "src.conversion.gml_runtime_parts.segments.52_cameras_display",
+        "yes",
+        "yes",
+        "yes",
+        "yes",
+        "GameMaker_Language/GML_Reference/Cameras_And_Display/Cameras_And_Display.htm",
+        "Reads camera view height state.",
+    ),
+    _entry(
+        "camera_set_view_angle",
+        "Cameras and Display",
+        "partial",
+        "src.conversion.gml_runtime_parts.segments.52_cameras_display",
+        "yes",
+        "yes",
+        "partial",
+        "yes",
+        "GameMaker_Language/GML_Reference/Cameras_And_Display/Cameras_And_Display.htm",
+        "Updates camera angle state and bound Camera2D rotation when available.",
+    ),
+    _entry(
+        "camera_get_view_angle",
+        "Cameras and Display",
+        "implemented",
+        "src.conversion.gml_runtime_parts.segments.52_cameras_display",
+        "yes",
+        "yes",
+        "yes",
+        "yes",
+        "GameMaker_Language/GML_Reference/Cameras_And_Display/Cameras_And_Display.htm",
+        "Reads camera angle state.",
+    ),
+    _entry(
+        "view_get_camera",
+        "Cameras and Display",
+        "partial",
+        "src.conversion.gml_runtime_parts.segments.52_cameras_display",
+        "yes",
+        "yes",
+        "partial",
+        "yes",
+        "GameMaker_Language/GML_Reference/Cameras_And_Display/Cameras_And_Viewports/view_get_camera.htm",
+        "Returns the handle assigned to a runtime view slot or -1 for empty/invalid slots.",
+    ),
+    _entry(
+        "view_set_camera",
+        "Cameras and Display",
+        "partial",
+        "src.conversion.gml_runtime_parts.segments.52_cameras_display",
+        "yes",
+        "yes",
+        "partial",
+        "yes",
+        "GameMaker_Language/GML_Reference/Cameras_And_Display/Cameras_And_Viewports/view_set_camera.htm",
+        "Assigns or clears a handle-backed camera for a runtime view slot and syncs legacy view_camera state.",
+    ),
+    _entry(
+        "view_get_surface_id",
+        "Cameras and Display",
+        "partial",
+        "src.conversion.gml_runtime_parts.segments.52_cameras_display",
+        "yes",
+        "yes",
+        "partial",
+        "yes",
+        "GameMaker_Language/GML_Reference/Cameras_And_Display/Cameras_And_Viewports/view_get_surface_id.htm",
+        "Returns the surface assigned to a runtime view slot or -1 when no valid surface is assigned.",
+    ),
+    _entry(
+        "view_set_surface_id",
+        "Cameras and Display",
+        "partial",
+        "src.conversion.gml_runtime_parts.segments.52_cameras_display",
+        "yes",
+        "yes",
+        "partial",
+        "yes",
+        "GameMaker_Language/GML_Reference/Cameras_And_Display/Cameras_And_Viewports/view_set_surface_id.htm",
+        "Stores a view-surface assignment in legacy view_surface_id state; actual multi-viewport render-to-surface remains backend-limited.",
+    ),
+    _entry(
+        "view_get_visible",
+        "Cameras and Display",
+        "implemented",
+        "src.conversion.gml_runtime_parts.segments.52_cameras_display",
+        "yes",
+        "yes",
+        "yes",
+        "yes",
+        "GameMaker_Language/GML_Reference/Cameras_And_Display/Cameras_And_Viewports/view_get_visible.htm",
+        "Reads runtime view visibility state initialized from converted room view metadata.",
+    ),
+    _entry(
+        "view_set_visible",
+        "Cameras and Display",
+        "implemented",
+        "src.conversion.gml_runtime_parts.segments.52_cameras_display",
+        "yes",
+        "yes",
+        "yes",
+        "yes",
+        "GameMaker_Language/GML_Reference/Cameras_And_Display/Cameras_And_Viewports/view_set_visible.htm",
+        "Stores runtime view visibility and records deterministic diagnostics for multiple active views without a SubViewport backend.",
+    ),
+    _entry(
+        "view_get_xport",
+        "Cameras and Display",
+        "implemented",
+        "src.conversion.gml_runtime_parts.segments.52_cameras_display",
+        "yes",
+        "yes",
+        "yes",
+        "yes",
+        "GameMaker_Language/GML_Reference/Cameras_And_Display/Cameras_And_Viewports/view_get_xport.htm",
+        "Reads the runtime view viewport x offset.",
+    ),
+    _entry(
+        "view_get_yport",
+        "Cameras and Display",
+        "implemented",
+        "src.conversion.gml_runtime_parts.segments.52_cameras_display",
+        "yes",
+        "yes",
+        "yes",
+        "yes",
+        "GameMaker_Language/GML_Reference/Cameras_And_Display/Cameras_And_Viewports/view_get_yport.htm",
+        "Reads the runtime view viewport y offset.",
+    ),
+    _entry(
+        "view_get_wport",
+        "Cameras and Display",
+        "implemented",
+        "src.conversion.gml_runtime_parts.segments.52_cameras_display",
+        "yes",
+        "yes",
+        "yes",
+        "yes",
+        "GameMaker_Language/GML_Reference/Cameras_And_Display/Cameras_And_Viewports/view_get_wport.htm",
+        "Reads the runtime view viewport width.",
+    ),
+    _entry(
+        "view_get_hport",
+        "Cameras and Display",
+        "implemented",
+        "src.conversion.gml_runtime_parts.segments.52_cameras_display",
+        "yes",
+        "yes",
+        "yes",
+        "yes",
+        "GameMaker_Language/GML_Reference/Cameras_And_Display/Cameras_And_Viewports/view_get_hport.htm",
+        "Reads the runtime view viewport height.",
+    ),
+    _entry(
+        "view_set_xport",
+        "Cameras and Display",
+        "implemented",
+        "src.conversion.gml_runtime_parts.segments.52_cameras_display",
+        "yes",
+        "yes",
+        "yes",
+        "yes",
+        "GameMaker_Language/GML_Reference/Cameras_And_Display/Cameras_And_Viewports/view_set_xport.htm",
+        "Stores the runtime view viewport x offset and mirrors it back to converted Camera2D metadata.",
+    ),
+    _entry(
+        "view_set_yport",
+        "Cameras and Display",
+        "implemented",
+        "src.conversion.gml_runtime_parts.segments.52_cameras_display",
+        "yes",
+        "yes",
+        "yes",
+        "yes",
+        "GameMaker_Language/GML_Reference/Cameras_And_Display/Cameras_And_Viewports/view_set_yport.htm",
+        "Stores the runtime view viewport y offset and mirrors it back to converted Camera2D metadata.",
+    ),
+    _entry(
+        "view_set_wport",
+        "Cameras and Display",
+        "implemented",
+        "src.conversion.gml_runtime_parts.segments.52_cameras_display",
+        "yes",
+        "yes",
+        "yes",
+        "yes",
+        "GameMaker_Language/GML_Reference/Cameras_And_Display/Cameras_And_Viewports/view_set_wport.htm",
+        "Stores the runtime view viewport width and mirrors it back to converted Camera2D metadata.",
+    ),
+    _entry(
+        "view_set_hport",
+        "Cameras and Display",
+        "implemented",
+        "src.conversion.gml_runtime_parts.segments.52_cameras_display",
+        "yes",
+        "yes",
+        "yes",
+        "yes",
+        "GameMaker_Language/GML_Reference/Cameras_And_Display/Cameras_And_Viewports/view_set_hport.htm",
+        "Stores the runtime view viewport height and mirrors it back to converted Camera2D metadata.",
+    ),
+    _entry(
+        "display_get_gui_width",
+        "Cameras and Display",
+        "implemented",
+        "src.conversion.gml_runtime_parts.segments.52_cameras_display",
+        "yes",
+        "yes",
+        "yes",
+        "yes",
+        "GameMaker_Language/GML_Reference/Cameras_And_Display/Cameras_And_Display.htm",
+        "Returns explicit GUI width or the application-surface width fallback.",
+    ),
+    _entry(
+        "display_get_gui_height",
+        "Cameras and Display",
+        "implemented",
+        "src.conversion.gml_runtime_parts.segments.52_cameras_display",
+        "yes",
+        "yes",
+        "yes",
+        "yes",
+        "GameMaker_Language/GML_Reference/Cameras_And_Display/Cameras_And_Display.htm",
+        "Returns explicit GUI height or the application-surface height fallback.",
+    ),
+    _entry(
+        "display_set_gui_size",
+        "Cameras and Display",
+        "implemented",
+        "src.conversion.gml_runtime_parts.segments.52_cameras_display",
+        "yes",
+        "yes",
+        "yes",
+        "yes",
+        "GameMaker_Language/GML_Reference/Cameras_And_Display/Cameras_And_Display.htm",
+        "Stores converted GUI coordinate-space dimensions.",
+    ),
+    _entry(
+        "display_set_gui_maximise",
+        "Cameras and Display",
+        "implemented",
+        "src.conversion.gml_runtime_parts.segments.52_cameras_display",
+        "yes",
+        "yes",
+        "yes",
+        "yes",
+        "GameMaker_Language/GML_Reference/Cameras_And_Display/display_set_gui_maximise.htm",
+        "Stores GUI maximise scale/offset state and feeds GUI coordinate conversion.",
+    ),
+    _entry(
+        "display_get_width",
+        "Cameras and Display",
+        "implemented",
+        "src.conversion.gml_runtime_parts.segments.52_cameras_display",
+        "yes",
+        "yes",
+        "yes",
+        "no",
+        "GameMaker_Language/GML_Reference/Cameras_And_Display/display_get_width.htm",
+        "Returns the current screen width in pixels via DisplayServer screen size.",
+    ),
+    _entry(
+        "display_get_height",
+        "Cameras and Display",
+        "implemented",
+        "src.conversion.gml_runtime_parts.segments.52_cameras_display",
+        "yes",
+        "yes",
+        "yes",
+        "no",
+        "GameMaker_Language/GML_Reference/Cameras_And_Display/display_get_height.htm",
+        "Returns the current screen height in pixels via DisplayServer screen size.",
+    ),
+    _entry(
+        "display_get_dpi_x",
+        "Cameras and Display",
+        "implemented",
+        "src.conversion.gml_runtime_parts.segments.52_cameras_display",
+        "yes",
+        "yes",
+        "yes",
+        "no",
+        "GameMaker_Language/GML_Reference/Cameras_And_Display/display_get_dpi_x.htm",
+        "Returns horizontal display DPI via DisplayServer screen_get_dpi.",
+    ),
+    _entry(
+        "display_get_dpi_y",
+        "Cameras and Display",
+        "implemented",
+        "src.conversion.gml_runtime_parts.segments.52_cameras_display",
+        "yes",
+        "yes",
+        "yes",
+        "no",
+        "GameMaker_Language/GML_Reference/Cameras_And_Display/display_get_dpi_y.htm",
+        "Returns vertical display DPI via DisplayServer screen_get_dpi.",
+    ),
+    _entry(
+        "display_get_orientation",
+        "Cameras and Display",
+        "implemented",
+        "src.conversion.gml_runtime_parts.segments.52_cameras_display",
+        "yes",
+        "yes",
+        "yes",
+        "no",
+        "GameMaker_Language/GML_Reference/Cameras_And_Display/display_get_orientation.htm",
+        "Returns the current screen orientation via DisplayServer screen_get_orientation.",
+    ),
+    _entry(
+        "display_set_orientation",
+        "Cameras and Display",
+        "implemented",
+        "src.conversion.gml_runtime_parts.segments.52_cameras_display",
+        "yes",
+        "yes",
+        "yes",
+        "no",
+        "GameMaker_Language/GML_Reference/Cameras_And_Display/display_set_orientation.htm",
+        "Sets screen orientation via DisplayServer screen_set_orientation.",
+    ),
+    _entry(
+        "display_get_frequency",
+        "Cameras and Display",
+        "implemented",
+        "src.conversion.gml_runtime_parts.segments.52_cameras_display",
+        "yes",
+        "yes",
+        "yes",
+        "no",
+        "GameMaker_Language/GML_Reference/Cameras_And_Display/display_get_frequency.htm",
+        "Returns display refresh rate via DisplayServer screen_get_refresh_rate.",
+    ),
+    _entry(
+        "display_reset",
+        "Cameras and Display",
+        "partial",
+        "src.conversion.gml_runtime_parts.segments.52_cameras_display",
+        "yes",
+        "yes",
+        "partial",
+        "yes",
+        "GameMaker_Language/GML_Reference/Cameras_And_Display/display_reset.htm",
+        "Stores AA state and maps v-sync when DisplayServer supports it; target-specific AA reconfiguration remains backend-limited.",
+    ),
+    _entry(
+        "display_get_timing_method",
+        "Cameras and Display",
+        "partial",
+        "src.conversion.gml_runtime_parts.segments.52_cameras_display",
+        "yes",
+        "yes",
+        "partial",
+        "yes",
+        "GameMaker_Language/GML_Reference/Cameras_And_Display/display_get_timing_method.htm",
+        "Returns deterministic compatibility timing-method state.",
+    ),
+    _entry(
+        "display_get_sleep_margin",
+        "Cameras and Display",
+        "partial",
+        "src.conversion.gml_runtime_parts.segments.52_cameras_display",
+        "yes",
+        "yes",
+        "partial",
+        "yes",
+        "GameMaker_Language/GML_Reference/Cameras_And_Display/display_get_sleep_margin.htm",
+        "Returns deterministic compatibility sleep-margin state.",
+    ),
+    _entry(
+        "display_mouse_set",
+        "Cameras and Display",
+        "partial",
+        "src.conversion.gml_runtime_parts.segments.52_cameras_display",
+        "yes",
+        "yes",
+        "partial",
+        "yes",
+        "GameMaker_Language/GML_Reference/Cameras_And_Display/display_mouse_set.htm",
+        "Updates runtime mouse state and warps the native mouse when available outside headless runs.",
+    ),
+    _entry(
+        "display_set_ui_visibility",
+        "Cameras and Display",
+        "partial",
+        "src.conversion.gml_runtime_parts.segments.52_cameras_display",
+        "yes",
+        "yes",
+        "partial",
+        "yes",
+        "GameMaker_Language/GML_Reference/Cameras_And_Display/display_set_ui_visibility.htm",
+        "Stores mobile system-UI visibility flags; export-template-specific UI hooks remain target work.",
+    ),
+    _entry(
+        "display_set_timing_method",
+        "Cameras and Display",
+        "partial",
+        "src.conversion.gml_runtime_parts.segments.52_cameras_display",
+        "yes",
+        "yes",
+        "partial",
+        "yes",
+        "GameMaker_Language/GML_Reference/Cameras_And_Display/display_set_timing_method.htm",
+        "Stores deterministic compatibility timing-method state.",
+    ),
+    _entry(
+        "display_set_sleep_margin",
+        "Cameras and Display",
+        "partial",
+        "src.conversion.gml_runtime_parts.segments.52_cameras_display",
+        "yes",
+        "yes",
+        "partial",
+        "yes",
+        "GameMaker_Language/GML_Reference/Cameras_And_Display/display_set_sleep_margin.htm",
+        "Stores deterministic compatibility sleep-margin state.",
+    ),
+    _entry(
+        "window_center",
+        "Cameras and Display",
+        "implemented",
+        "src.conversion.gml_runtime_parts.segments.52_cameras_display",
+        "yes",
+        "yes",
+        "yes",
+        "no",
+        "GameMaker_Language/GML_Reference/Cameras_And_Display/The_Game_Window/window_center.htm",
+        "Centers the game window on the primary screen via DisplayServer.",
+    ),
+    _entry(
+        "window_get_fullscreen",
+        "Cameras and Display",
+        "implemented",
+        "src.conversion.gml_runtime_parts.segments.52_cameras_display",
+        "yes",
+        "yes",
+        "yes",
+        "no",
+        "GameMaker_Language/GML_Reference/Cameras_And_Display/The_Game_Window/window_get_fullscreen.htm",
+        "Returns true if the game window is in fullscreen mode.",
+    ),
+    _entry(
+        "window_get_width",
+        "Cameras and Display",
+        "implemented",
+        "src.conversion.gml_runtime_parts.segments.52_cameras_display",
+        "yes",
+        "yes",
+        "yes",
+        "no",
+        "GameMaker_Language/GML_Reference/Cameras_And_Display/The_Game_Window/window_get_width.htm",
+        "Returns the game window width in pixels.",
+    ),
+    _entry(
+        "window_get_height",
+        "Cameras and Display",
+        "implemented",
+        "src.conversion.gml_runtime_parts.segments.52_cameras_display",
+        "yes",
+        "yes",
+        "yes",
+        "no",
+        "GameMaker_Language/GML_Reference/Cameras_And_Display/The_Game_Window/window_get_height.htm",
+        "Returns the game window height in pixels.",
+    ),
+    _entry(
+        "window_get_x",
+        "Cameras and Display",
+        "implemented",
+        "src.conversion.gml_runtime_parts.segments.52_cameras_display",
+        "yes",
+        "yes",
+        "yes",
+        "no",
+        "GameMaker_Language/GML_Reference/Cameras_And_Display/The_Game_Window/window_get_x.htm",
+        "Returns the game window x position on screen.",
+    ),
+    _entry(
+        "window_get_y",
+        "Cameras and Display",
+        "implemented",
+        "src.conversion.gml_runtime_parts.segments.52_cameras_display",
+        "yes",
+        "yes",
+        "yes",
+        "no",
+        "GameMaker_Language/GML_Reference/Cameras_And_Display/The_Game_Window/window_get_y.htm",
+        "Returns the game window y position on screen.",
+    ),
+    _entry(
+        "window_get_visible_rects",
+        "Cameras and Display",
+        "implemented",
+        "src.conversion.gml_runtime_parts.segments.52_cameras_display",
+        "yes",
+        "yes",
+        "yes",
+        "no",
+        "GameMaker_Language/GML_Reference/Cameras_And_Display/The_Game_Window/window_get_visible_rects.htm",
+        "Returns an array of visible monitor rectangles as [x, y, w, h] lists.",
+    ),
+    _entry(
+        "window_mouse_get_x",
+        "Cameras and Display",
+        "implemented",
+        "src.conversion.gml_runtime_parts.segments.52_cameras_display",
+        "yes",
+        "yes",
+        "yes",
+        "yes",
+        "GameMaker_Language/GML_Reference/Cameras_And_Display/The_Game_Window/window_mouse_get_x.htm",
+        "Returns the runtime mouse x coordinate in window space.",
+    ),
+    _entry(
+        "window_mouse_get_y",
+        "Cameras and Display",
+        "implemented",
+        "src.conversion.gml_runtime_parts.segments.52_cameras_display",
+        "yes",
+        "yes",
+        "yes",
+        "yes",
+        "GameMaker_Language/GML_Reference/Cameras_And_Display/The_Game_Window/window_mouse_get_y.htm",
+        "Returns the runtime mouse y coordinate in window space.",
+    ),
+    _entry(
+        "window_mouse_set",
+        "Cameras and Display",
+        "partial",
+        "src.conversion.gml_runtime_parts.segments.52_cameras_display",
+        "yes",
+        "yes",
+        "partial",
+        "yes",
+        "GameMaker_Language/GML_Reference/Cameras_And_Display/The_Game_Window/window_mouse_set.htm",
+        "Updates runtime mouse state and warps the native mouse when available outside headless runs.",
+    ),
+    _entry(
+        "window_view_mouse_get_x",
+        "Cameras and Display",
+        "implemented",
+        "src.conversion.gml_runtime_parts.segments.52_cameras_display",
+        "yes",
+        "yes",
+        "yes",
+        "yes",
+        "GameMaker_Language/GML_Reference/Cameras_And_Display/The_Game_Window/window_view_mouse_get_x.htm",
+        "Converts the window mouse x coordinate into the requested view's room coordinate using view_xport/wport and view_xview/wview.",
+    ),
+    _entry(
+        "window_view_mouse_get_y",
+        "Cameras and Display",
+        "implemented",
+        "src.conversion.gml_runtime_parts.segments.52_cameras_display",
+        "yes",
+        "yes",
+        "yes",
+        "yes",
+        "GameMaker_Language/GML_Reference/Cameras_And_Display/The_Game_Window/window_view_mouse_get_y.htm",
+        "Converts the window mouse y coordinate into the requested view's room coordinate using view_yport/hport and view_yview/hview.",
+    ),
+    _entry(
+        "window_views_mouse_get_x",
+        "Cameras and Display",
+        "implemented",
+        "src.conversion.gml_runtime_parts.segments.52_cameras_display",
+        "yes",
+        "yes",
+        "yes",
+        "yes",
+        "GameMaker_Language/GML_Reference/Cameras_And_Display/The_Game_Window/window_views_mouse_get_x.htm",
+        "Returns the runtime mouse x coordinate shared by active view compatibility state.",
+    ),
+    _entry(
+        "window_views_mouse_get_y",
+        "Cameras and Display",
+        "implemented",
+        "src.conversion.gml_runtime_parts.segments.52_cameras_display",
+        "yes",
+        "yes",
+        "yes",
+        "yes",
+        "GameMaker_Language/GML_Reference/Cameras_And_Display/The_Game_Window/window_views_mouse_get_y.htm",
+        "Returns the runtime mouse y coordinate shared by active view compatibility state.",
+    ),
+    _entry(
+        "window_set_fullscreen",
+        "Cameras and Display",
+        "implemented",
+        "src.conversion.gml_runtime_parts.segments.52_cameras_display",
+        "yes",
+        "yes",
+        "yes",
+        "no",
+        "GameMaker_Language/GML_Reference/Cameras_And_Display/The_Game_Window/window_set_fullscreen.htm",
+        "Toggles fullscreen or windowed mode via DisplayServer window mode.",
+    ),
+    _entry(
+        "window_set_position",
+        "Cameras and Display",
+        "implemented",
+        "src.conversion.gml_runtime_parts.segments.52_cameras_display",
+        "yes",
+        "yes",
+        "yes",
+        "no",
+        "GameMaker_Language/GML_Reference/Cameras_And_Display/The_Game_Window/window_set_position.htm",
+        "Sets the game window position on screen.",
+    ),
+    _entry(
+        "window_set_size",
+        "Cameras and Display",
+        "implemented",
+        "src.conversion.gml_runtime_parts.segments.52_cameras_display",
+        "yes",
+        "yes",
+        "yes",
+        "no",
+        "GameMaker_Language/GML_Reference/Cameras_And_Display/The_Game_Window/window_set_size.htm",
+        "Sets the game window dimensions in pixels.",
+    ),
+    _entry(
+        "window_set_rectangle",
+        "Cameras and Display",
+        "implemented",
+        "src.conversion.gml_runtime_parts.segments.52_cameras_display",
+        "yes",
+        "yes",
+        "yes",
+        "no",
+        "GameMaker_Language/GML_Reference/Cameras_And_Display/The_Game_Window/window_set_rectangle.htm",
+        "Sets the game window position and size in one call.",
+    ),
+    _entry(
+        "window_set_min_width",
+        "Cameras and Display",
+        "implemented",
+        "src.conversion.gml_runtime_parts.segments.52_cameras_display",
+        "yes",
+        "yes",
+        "yes",
+        "no",
+        "GameMaker_Language/GML_Reference/Cameras_And_Display/The_Game_Window/window_set_min_width.htm",
+        "Sets the minimum window width limit via DisplayServer min size.",
+    ),
+    _entry(
+        "window_set_max_width",
+        "Cameras and Display",
+        "implemented",
+        "src.conversion.gml_runtime_parts.segments.52_cameras_display",
+        "yes",
+        "yes",
+        "yes",
+        "no",
+        "GameMaker_Language/GML_Reference/Cameras_And_Display/The_Game_Window/window_set_max_width.htm",
+        "Sets the maximum window width limit via DisplayServer max size.",
+    ),
+    _entry(
+        "window_set_min_height",
+        "Cameras and Display",
+        "implemented",
+        "src.conversion.gml_runtime_parts.segments.52_cameras_display",
+        "yes",
+        "yes",
+        "yes",
+        "no",
+        "GameMaker_Language/GML_Reference/Cameras_And_Display/The_Game_Window/window_set_min_height.htm",
+        "Sets the minimum window height limit via DisplayServer min size.",
+    ),
+    _entry(
+        "window_set_max_height",
+        "Cameras and Display",
+        "implemented",
+        "src.conversion.gml_runtime_parts.segments.52_cameras_display",
+        "yes",
+        "yes",
+        "yes",
+        "no",
+        "GameMaker_Language/GML_Reference/Cameras_And_Display/The_Game_Window/window_set_max_height.htm",
+        "Sets the maximum window height limit via DisplayServer max size.",
+    ),
+    _entry(
+        "window_minimise",
+        "Cameras and Display",
+        "implemented",
+        "src.conversion.gml_runtime_parts.segments.52_cameras_display",
+        "yes",
+        "yes",
+        "yes",
+        "no",
+        "GameMaker_Language/GML_Reference/Cameras_And_Display/The_Game_Window/window_minimise.htm",
+        "Minimises the game window via DisplayServer window mode.",
+    ),
+    _entry(
+        "window_restore",
+        "Cameras and Display",
+        "implemented",
+        "src.conversion.gml_runtime_parts.segments.52_cameras_display",
+        "yes",
+        "yes",
+        "yes",
+        "no",
+        "GameMaker_Language/GML_Reference/Cameras_And_Display/The_Game_Window/window_restore.htm",
+        "Restores the game window from minimised state.",
+    ),
+    _entry(
+        "screen_save",
+        "Cameras and Display",
+        "implemented",
+        "src.conversion.gml_runtime_parts.segments.52_cameras_display",
+        "yes",
+        "yes",
+        "yes",
+        "no",
+        "GameMaker_Language/GML_Reference/Cameras_And_Display/screen_save.htm",
+        "Saves a screenshot of the full display to a PNG file.",
+    ),
+    _entry(
+        "screen_save_part",
+        "Cameras and Display",
+        "implemented",
+        "src.conversion.gml_runtime_parts.segments.52_cameras_display",
+        "yes",
+        "yes",
+        "yes",
+        "no",
+        "GameMaker_Language/GML_Reference/Cameras_And_Display/screen_save_part.htm",
+        "Saves a screenshot of a display region to a PNG file.",
+    ),
+    _entry(
+        "gif_open",
+        "Cameras and Display",
+        "unsupported",
+        "src.conversion.gml_runtime_parts",
+        "yes",
+        "n/a",
+        "n/a",
+        "no",
+        "GameMaker_Language/GML_Reference/Cameras_And_Display/gif_open.htm",
+        "Animated GIF capture requires a palette encoder and multi-frame surface capture pipeline that GM2Godot does not provide.",
+    ),
+    _entry(
+        "gif_add_surface",
+        "Cameras and Display",
+        "unsupported",
+        "src.conversion.gml_runtime_parts",
+        "yes",
+        "n/a",
+        "n/a",
+        "no",
+        "GameMaker_Language/GML_Reference/Cameras_And_Display/gif_add_surface.htm",
+        "Animated GIF capture requires a palette encoder and multi-frame surface capture pipeline that GM2Godot does not provide.",
+    ),
+    _entry(
+        "gif_save",
+        "Cameras and Display",
+        "unsupported",
+        "src.conversion.gml_runtime_parts",
+        "yes",
+        "n/a",
+        "n/a",
+        "no",
+        "GameMaker_Language/GML_Reference/Cameras_And_Display/gif_save.htm",
+        "Animated GIF capture requires a palette encoder and multi-frame surface capture pipeline that GM2Godot does not provide.",
+    ),
+    _entry(
+        "gif_save_buffer",
+        "Cameras and Display",
+        "unsupported",
+        "src.conversion.gml_runtime_parts",
+        "yes",
+        "n/a",
+        "n/a",
+        "no",
+        "GameMaker_Language/GML_Reference/Cameras_And_Display/gif_save_buffer.htm",
+        "Animated GIF capture requires a palette encoder and multi-frame surface capture pipeline that GM2Godot does not provide.",
+    ),
+    _entry(
+        "keyboard_check",
+        "Game Input",
+        "implemented",
+        "src.conversion.gml_runtime_parts.segments.53_game_input",
+        "yes",
+        "yes",
+        "yes",
+        "yes",
+        "GameMaker_Language/GML_Reference/Game_Input/Game_Input.htm",
+        "Polls keyboard state through the GMRuntime input bridge.",
+    ),
+    _entry(
+        "keyboard_check_pressed",
+        "Game Input",
+        "implemented",
+        "src.conversion.gml_runtime_parts.segments.53_game_input",
+        "yes",
+        "yes",
+        "yes",
+        "yes",
+        "GameMaker_Language/GML_Reference/Game_Input/Game_Input.htm",
+        "Uses bridge-maintained frame-edge key state.",
+    ),
+    _entry(
+        "keyboard_check_released",
+        "Game Input",
+        "implemented",
+        "src.conversion.gml_runtime_parts.segments.53_game_input",
+        "yes",
+        "yes",
+        "yes",
+        "yes",
+        "GameMaker_Language/GML_Reference/Game_Input/Game_Input.htm",
+        "Uses bridge-maintained frame-edge key release state.",
+    ),
+    _entry(
+        "keyboard_clear",
+        "Game Input",
+        "implemented",
+        "src.conversion.gml_runtime_parts.segments.53_game_input",
+        "yes",
+        "yes",
+        "yes",
+        "no",
+        "GameMaker_Language/GML_Reference/Game_Input/Game_Input.htm",
+        "Clears bridge key state and keyboard_string for a key or all keys.",
+    ),
+    _entry(
+        "keyboard_key_press",
+        "Game Input",
+        "implemented",
+        "src.conversion.gml_runtime_parts.segments.53_game_input",
+        "yes",
+        "yes",
+        "yes",
+        "yes",
+        "GameMaker_Language/GML_Reference/Game_Input/Game_Input.htm",
+        "Injects key-down state into the runtime bridge.",
+    ),
+    _entry(
+        "keyboard_key_release",
+        "Game Input",
+        "implemented",
+        "src.conversion.gml_runtime_parts.segments.53_game_input",
+        "yes",
+        "yes",
+        "yes",
+        "yes",
+        "GameMaker_Language/GML_Reference/Game_Input/Game_Input.htm",
+        "Injects key-up state into the runtime bridge.",
+    ),
+    _entry(
+        "mouse_check_button",
+        "Game Input",
+        "implemented",
+        "src.conversion.gml_runtime_parts.segments.53_game_input",
+        "yes",
+        "yes",
+        "yes",
+        "yes",
+        "GameMaker_Language/GML_Reference/Game_Input/Game_Input.htm",
+        "Polls bridge/Godot mouse button state.",
+    ),
+    _entry(
+        "mouse_check_button_pressed",
+        "Game Input",
+        "implemented",
+        "src.conversion.gml_runtime_parts.segments.53_game_input",
+        "yes",
+        "yes",
+        "yes",
+        "yes",
+        "GameMaker_Language/GML_Reference/Game_Input/Game_Input.htm",
+        "Uses bridge-maintained mouse button press edges.",
+    ),
+    _entry(
+        "mouse_check_button_released",
+        "Game Input",
+        "implemented",
+        "src.conversion.gml_runtime_parts.segments.53_game_input",
+        "yes",
+        "yes",
+        "yes",
+        "yes",
+        "GameMaker_Language/GML_Reference/Game_Input/Game_Input.htm",
+        "Uses bridge-maintained mouse button release edges.",
+    ),
+    _entry(
+        "display_mouse_get_x",
+        "Game Input",
+        "implemented",
+        "src.conversion.gml_runtime_parts.segments.53_game_input",
+        "yes",
+        "yes",
+        "yes",
+        "yes",
+        "GameMaker_Language/GML_Reference/Game_Input/Game_Input.htm",
+        "Returns bridge mouse x in room/display coordinates.",
+    ),
+    _entry(
+        "display_mouse_get_y",
+        "Game Input",
+        "implemented",
+        "src.conversion.gml_runtime_parts.segments.53_game_input",
+        "yes",
+        "yes",
+        "yes",
+        "yes",
+        "GameMaker_Language/GML_Reference/Game_Input/Game_Input.htm",
+        "Returns bridge mouse y in room/display coordinates.",
+    ),
+    _entry(
+        "device_mouse_x_to_gui",
+        "Game Input",
+        "partial",
+        "src.conversion.gml_runtime_parts.segments.53_game_input",
+        "yes",
+        "yes",
+        "partial",
+        "yes",
+        "GameMaker_Language/GML_Reference/Game_Input/Game_Input.htm",
+        "Maps bridge mouse x to GUI space using display GUI/application-surface scaling.",
+    ),
+    _entry(
+        "device_mouse_y_to_gui",
+        "Game Input",
+        "partial",
+        "src.conversion.gml_runtime_parts.segments.53_game_input",
+        "yes",
+        "yes",
+        "partial",
+        "yes",
+        "GameMaker_Language/GML_Reference/Game_Input/Game_Input.htm",
+        "Maps bridge mouse y to GUI space using display GUI/application-surface scaling.",
+    ),
+    _entry(
+        "gamepad_button_check",
+        "Game Input",
+        "implemented",
+        "src.conversion.gml_runtime_parts.segments.53_game_input",
+        "yes",
+        "yes",
+        "yes",
+        "yes",
+        "GameMaker_Language/GML_Reference/Game_Input/Game_Input.htm",
+        "Polls bridge/Godot gamepad button state.",
+    ),
+    _entry(
+        "gamepad_button_check_pressed",
+        "Game Input",
+        "implemented",
+        "src.conversion.gml_runtime_parts.segments.53_game_input",
+        "yes",
+        "yes",
+        "yes",
+        "yes",
+        "GameMaker_Language/GML_Reference/Game_Input/Game_Input.htm",
+        "Uses bridge-maintained gamepad button press edges.",
+    ),
+    _entry(
+        "gamepad_button_check_released",
+        "Game Input",
+        "implemented",
+        "src.conversion.gml_runtime_parts.segments.53_game_input",
+        "yes",
+        "yes",
+        "yes",
+        "yes",
+        "GameMaker_Language/GML_Reference/Game_Input/Game_Input.htm",
+        "Uses bridge-maintained gamepad button release edges.",
+    ),
+    _entry(
+        "gamepad_is_connected",
+        "Game Input",
+        "partial",
+        "src.conversion.gml_runtime_parts.segments.53_game_input",
+        "yes",
+        "yes",
+        "partial",
+        "no",
+        "GameMaker_Language/GML_Reference/Game_Input/Game_Input.htm",
+        "Uses Godot joy-device knowledge for connected gamepad checks.",
+    ),
+    _entry(
+        "gamepad_axis_value",
+        "Game Input",
+        "implemented",
+        "src.conversion.gml_runtime_parts.segments.53_game_input",
+        "yes",
+        "yes",
+        "yes",
+        "yes",
+        "GameMaker_Language/GML_Reference/Game_Input/Game_Input.htm",
+        "Reads bridge/Godot axis values with runtime deadzone filtering.",
+    ),
+    _entry(
+        "gamepad_set_axis_deadzone",
+        "Game Input",
+        "implemented",
+        "src.conversion.gml_runtime_parts.segments.53_game_input",
+        "yes",
+        "yes",
+        "yes",
+        "yes",
+        "GameMaker_Language/GML_Reference/Game_Input/Game_Input.htm",
+        "Stores per-device axis deadzones.",
+    ),
+    _entry(
+        "gamepad_get_axis_deadzone",
+        "Game Input",
+        "implemented",
+        "src.conversion.gml_runtime_parts.segments.53_game_input",
+        "yes",
+        "yes",
+        "yes",
+        "yes",
+        "GameMaker_Language/GML_Reference/Game_Input/Game_Input.htm",
+        "Returns per-device axis deadzones.",
+    ),
+    _entry(
+        "gamepad_set_vibration",
+        "Game Input",
+        "partial",
+        "src.conversion.gml_runtime_parts.segments.53_game_input",
+        "yes",
+        "yes",
+        "partial",
+        "no",
+        "GameMaker_Language/GML_Reference/Game_Input/Game_Input.htm",
+        "Provides a warning stub; platform-specific vibration is not wired yet.",
+    ),
+    _entry(
+        "audio_play_sound",
+        "Audio",
+        "implemented",
+        "src.conversion.gml_runtime_parts.segments.54_audio_runtime",
+        "yes",
+        "yes",
+        "yes",
+        "yes",
+        "GameMaker_Language/GML_Reference/Asset_Management/Audio/audio_play_sound.htm",
+        "Creates per-playback AudioStreamPlayer nodes and returns distinct sound instance handles.",
+    ),
+    _entry(
+        "audio_stop_sound",
+        "Audio",
+        "implemented",
+        "src.conversion.gml_runtime_parts.segments.54_audio_runtime",
+        "yes",
+        "yes",
+        "yes",
+        "yes",
+        "GameMaker_Language/GML_Reference/Asset_Management/Audio/audio_stop_sound.htm",
+        "Stops individual sound handles or all active instances of a sound asset.",
+    ),
+    _entry(
+        "audio_pause_sound",
+        "Audio",
+        "implemented",
+        "src.conversion.gml_runtime_parts.segments.54_audio_runtime",
+        "yes",
+        "yes",
+        "yes",
+        "yes",
+        "GameMaker_Language/GML_Reference/Asset_Management/Audio/audio_pause_sound.htm",
+        "Pauses individual sound handles or all active instances of a sound asset.",
+    ),
+    _entry(
+        "audio_resume_sound",
+        "Audio",
+        "implemented",
+        "src.conversion.gml_runtime_parts.segments.54_audio_runtime",
+        "yes",
+        "yes",
+        "yes",
+        "yes",
+        "GameMaker_Language/GML_Reference/Asset_Management/Audio/audio_resume_sound.htm",
+        "Resumes individual sound handles or all active instances of a sound asset.",
+    ),
+    _entry(
+        "audio_is_playing",
+        "Audio",
+        "implemented",
+        "src.conversion.gml_runtime_parts.segments.54_audio_runtime",
+        "yes",
+        "yes",
+        "yes",
+        "yes",
+        "GameMaker_Language/GML_Reference/Asset_Management/Audio/audio_is_playing.htm",
+        "Checks individual sound handles or any active instance for a sound asset, including paused instances.",
+    ),
+    _entry(
+        "audio_sound_gain",
+        "Audio",
+        "implemented",
+        "src.conversion.gml_runtime_parts.segments.54_audio_runtime",
+        "yes",
+        "yes",
+        "yes",
+        "yes",
+        "GameMaker_Language/GML_Reference/Asset_Management/Audio/audio_sound_gain.htm",
+        "Applies immediate asset-level or sound-instance gain changes; timed fades are accepted but not interpolated.",
+    ),
+    _entry(
+        "audio_sound_pitch",
+        "Audio",
+        "implemented",
+        "src.conversion.gml_runtime_parts.segments.54_audio_runtime",
+        "yes",
+        "yes",
+        "yes",
+        "yes",
+        "GameMaker_Language/GML_Reference/Asset_Management/Audio/audio_sound_pitch.htm",
+        "Applies immediate asset-level or sound-instance pitch changes.",
+    ),
+    _entry(
+        "audio_group_load",
+        "Audio",
+        "partial",
+        "src.conversion.gml_runtime_parts.segments.54_audio_runtime",
+        "yes",
+        "yes",
+        "partial",
+        "yes",
+        "GameMaker_Language/GML_Reference/Asset_Management/Audio/Audio_Groups/audio_group_load.htm",
+        "Updates generated audio-group compatibility state synchronously; Godot may still cache imported streams.",
+    ),
+    _entry(
+        "audio_group_unload",
+        "Audio",
+        "partial",
+        "src.conversion.gml_runtime_parts.segments.54_audio_runtime",
+        "yes",
+        "yes",
+        "partial",
+        "yes",
+        "GameMaker_Language/GML_Reference/Asset_Management/Audio/Audio_Groups/audio_group_unload.htm",
+        "Stops active group sounds and marks generated audio-group state unloaded; exact packaged-memory eviction is not available in Godot.",
+    ),
+    _entry(
+        "audio_group_is_loaded",
+        "Audio",
+        "partial",
+        "src.conversion.gml_runtime_parts.segments.54_audio_runtime",
+        "yes",
+        "yes",
+        "partial",
+        "yes",
+        "GameMaker_Language/GML_Reference/Asset_Management/Audio/Audio_Groups/audio_group_is_loaded.htm",
+        "Reads generated audio-group compatibility load state.",
+    ),
+    _entry(
+        "audio_group_load_progress",
+        "Audio",
+        "partial",
+        "src.conversion.gml_runtime_parts.segments.54_audio_runtime",
+        "yes",
+        "yes",
+        "partial",
+        "yes",
+        "GameMaker_Language/GML_Reference/Asset_Management/Audio/Audio_Groups/audio_group_load_progress.htm",
+        "Returns deterministic compatibility progress: 1.0 when loaded, 0.0 when unloaded.",
+    ),
+    _entry(
+        "audio_group_name",
+        "Audio",
+        "partial",
+        "src.conversion.gml_runtime_parts.segments.54_audio_runtime",
+        "yes",
+        "yes",
+        "partial",
+        "yes",
+        "GameMaker_Language/GML_Reference/Asset_Management/Audio/Audio_Groups/audio_group_name.htm",
+        "Resolves generated audio-group constants and string IDs to group names.",
+    ),
+    _entry(
+        "audio_group_stop_all",
+        "Audio",
+        "partial",
+        "src.conversion.gml_runtime_parts.segments.54_audio_runtime",
+        "yes",
+        "yes",
+        "partial",
+        "yes",
+        "GameMaker_Language/GML_Reference/Asset_Management/Audio/Audio_Groups/audio_group_stop_all.htm",
+        "Stops all active GM2Godot sound handles whose metadata belongs to the requested group.",
+    ),
+    _entry(
+        "audio_group_set_gain",
+        "Audio",
+        "partial",
+        "src.conversion.gml_runtime_parts.segments.54_audio_runtime",
+        "yes",
+        "yes",
+        "partial",
+        "yes",
+        "GameMaker_Language/GML_Reference/Asset_Management/Audio/Audio_Groups/audio_group_set_gain.htm",
+        "Applies immediate generated group gain to active players; timed gain interpolation is accepted but not scheduled.",
+    ),
+    _entry(
+        "audio_group_get_gain",
+        "Audio",
+        "partial",
+        "src.conversion.gml_runtime_parts.segments.54_audio_runtime",
+        "yes",
+        "yes",
+        "partial",
+        "yes",
+        "GameMaker_Language/GML_Reference/Asset_Management/Audio/Audio_Groups/audio_group_get_gain.htm",
+        "Returns generated audio-group gain state.",
+    ),
+    _entry(
+        "sound_play",
+        "Audio",
+        "implemented",
+        "src.conversion.gml_runtime_parts.segments.54_audio_runtime",
+        "yes",
+        "yes",
+        "yes",
+        "yes",
+        "GameMaker_Language/GML_Reference/Asset_Management/Audio/audio_play_sound.htm",
+        "Legacy alias routed to audio_play_sound with default priority and no looping.",
+    ),
+    _entry(
+        "sound_loop",
+        "Audio",
+        "implemented",
+        "src.conversion.gml_runtime_parts.segments.54_audio_runtime",
+        "yes",
+        "yes",
+        "yes",
+        "yes",
+        "GameMaker_Language/GML_Reference/Asset_Management/Audio/audio_play_sound.htm",
+        "Legacy alias routed to looping audio_play_sound.",
+    ),
+    _entry(
+        "sound_stop",
+        "Audio",
+        "implemented",
+        "src.conversion.gml_runtime_parts.segments.54_audio_runtime",
+        "yes",
+        "yes",
+        "yes",
+        "yes",
+        "GameMaker_Language/GML_Reference/Asset_Management/Audio/audio_stop_sound.htm",
+        "Legacy alias routed to audio_stop_sound.",
+    ),
+    _entry(
+        "sound_pause",
+        "Audio",
+        "implemented",
+        "src.conversion.gml_runtime_parts.segments.54_audio_runtime",
+        "yes",
+        "yes",
+        "yes",
+        "no",
+        "GameMaker_Language/GML_Reference/Asset_Management/Audio/audio_pause_sound.htm",
+        "Legacy alias routed to audio_pause_sound.",
+    ),
+    _entry(
+        "sound_resume",
+        "Audio",
+        "implemented",
+        "src.conversion.gml_runtime_parts.segments.54_audio_runtime",
+        "yes",
+        "yes",
+        "yes",
+        "no",
+        "GameMaker_Language/GML_Reference/Asset_Management/Audio/audio_resume_sound.htm",
+        "Legacy alias routed to audio_resume_sound.",
+    ),
+    _entry(
+        "sound_isplaying",
+        "Audio",
+        "implemented",
+        "src.conversion.gml_runtime_parts.segments.54_audio_runtime",
+        "yes",
+        "yes",
+        "yes",
+        "yes",
+        "GameMaker_Language/GML_Reference/Asset_Management/Audio/audio_is_playing.htm",
+        "Legacy alias routed to audio_is_playing.",
+    ),
+    _entry(
+        "sound_volume",
+        "Audio",
+        "implemented",
+        "src.conversion.gml_runtime_parts.segments.54_audio_runtime",
+        "yes",
+        "yes",
+        "yes",
+        "no",
+        "GameMaker_Language/GML_Reference/Asset_Management/Audio/audio_sound_gain.htm",
+        "Legacy alias routed to immediate audio_sound_gain.",
+    ),
+    _entry(
+        "sound_pitch",
+        "Audio",
+        "implemented",
+        "src.conversion.gml_runtime_parts.segments.54_audio_runtime",
+        "yes",
+        "yes",
+        "yes",
+        "no",
+        "GameMaker_Language/GML_Reference/Asset_Management/Audio/audio_sound_pitch.htm",
+        "Legacy alias routed to audio_sound_pitch.",
+    ),
+    _entry(
+        "sound_global_volume",
+        "Audio",
+        "implemented",
+        "src.conversion.gml_runtime_parts.segments.54_audio_runtime",
+        "yes",
+        "yes",
+        "yes",
+        "no",
+        "GameMaker_Language/GML_Reference/Asset_Management/Audio/Audio_Properties.htm",
+        "Legacy global gain alias applies an immediate multiplier to active runtime audio players.",
+    ),
+    *_advanced_audio_entries(),
+    _entry(
+        "room_goto",
+        "General Game Control",
+        "implemented",
+        "src.conversion.gml_runtime_parts.segments.55_room_game_flow",
+        "yes",
+        "yes",
+        "yes",
+        "yes",
+        "GameMaker_Language/GML_Reference/General_Game_Control/General_Game_Control.htm",
+        "Uses generated room registry order and the room runtime node to change scenes with lifecycle dispatch.",
+    ),
+    _entry(
+        "room_goto_next",
+        "General Game Control",
+        "implemented",
+        "src.conversion.gml_runtime_parts.segments.55_room_game_flow",
+        "yes",
+        "yes",
+        "yes",
+        "yes",
+        "GameMaker_Language/GML_Reference/General_Game_Control/General_Game_Control.htm",
+        "Uses generated room order metadata to move to the next room.",
+    ),
+    _entry(
+        "room_goto_previous",
+        "General Game Control",
+        "implemented",
+        "src.conversion.gml_runtime_parts.segments.55_room_game_flow",
+        "yes",
+        "yes",
+        "yes",
+        "yes",
+        "GameMaker_Language/GML_Reference/General_Game_Control/General_Game_Control.htm",
+        "Uses generated room order metadata to move to the previous room.",
+    ),
+    _entry(
+        "room_restart",
+        "General Game Control",
+        "implemented",
+        "src.conversion.gml_runtime_parts.segments.55_room_game_flow",
+        "yes",
+        "yes",
+        "yes",
+        "yes",
+        "GameMaker_Language/GML_Reference/General_Game_Control/General_Game_Control.htm",
+        "Reloads the current room through the same runtime scene transition manager.",
+    ),
+    _entry(
+        "game_restart",
+        "General Game Control",
+        "implemented",
+        "src.conversion.gml_runtime_parts.segments.55_room_game_flow",
+        "yes",
+        "yes",
+        "yes",
+        "yes",
+        "GameMaker_Language/GML_Reference/General_Game_Control/General_Game_Control.htm",
+        "Dispatches game end, resets runtime game-start state, and returns to the first generated room.",
+    ),
+    _entry(
+        "game_end",
+        "General Game Control",
+        "partial",
+        "src.conversion.gml_runtime_parts.segments.55_room_game_flow",
+        "yes",
+        "yes",
+        "partial",
+        "no",
+        "GameMaker_Language/GML_Reference/General_Game_Control/General_Game_Control.htm",
+        "Dispatches room/game end then calls SceneTree.quit; platform-specific close prompts are warned as unsupported.",
+    ),
+    _entry(
+        "room_exists",
+        "General Game Control",
+        "implemented",
+        "src.conversion.gml_runtime_parts.segments.55_room_game_flow",
+        "yes",
+        "yes",
+        "yes",
+        "yes",
+        "GameMaker_Language/GML_Reference/Asset_Management/Rooms/Rooms.htm",
+        "Resolves room ids through the generated asset registry.",
+    ),
+    _entry(
+        "room_get_name",
+        "General Game Control",
+        "implemented",
+        "src.conversion.gml_runtime_parts.segments.55_room_game_flow",
+        "yes",
+        "yes",
+        "yes",
+        "yes",
+        "GameMaker_Language/GML_Reference/Asset_Management/Rooms/Rooms.htm",
+        "Returns the generated room asset name for a room id.",
+    ),
+    _entry(
+        "room_get_info",
+        "General Game Control",
+        "implemented",
+        "src.conversion.gml_runtime_parts.segments.55_room_game_flow",
+        "yes",
+        "yes",
+        "yes",
+        "yes",
+        "GameMaker_Language/GML_Reference/Asset_Management/Rooms/Rooms.htm",
+        "Returns generated room path, order, size, persistence, and volume metadata.",
+    ),
+    _entry(
+        "alarm_set",
+        "Time",
+        "implemented",
+        "src.conversion.gml_runtime_parts.segments.56_time_alarms",
+        "yes",
+        "yes",
+        "yes",
+        "yes",
+        "GameMaker_Language/GML_Reference/Time_Sources/Time_Sources.htm",
+        "Sets per-instance alarm countdown values; dispatches _on_alarm_N when countdown reaches zero.",
+    ),
+    _entry(
+        "alarm_get",
+        "Time",
+        "implemented",
+        "src.conversion.gml_runtime_parts.segments.56_time_alarms",
+        "yes",
+        "yes",
+        "yes",
+        "yes",
+        "GameMaker_Language/GML_Reference/Time_Sources/Time_Sources.htm",
+        "Reads per-instance alarm countdown values from the runtime alarm array.",
+    ),
+    _entry(
+        "time_source_create",
+        "Time",
+        "implemented",
+        "src.conversion.gml_runtime_parts.segments.56_time_alarms",
+        "yes",
+        "yes",
+        "yes",
+        "yes",
+        "GameMaker_Language/GML_Reference/Time_Sources/Time_Sources.htm",
+        "Creates handle-backed time sources with frame or seconds mode, repeat counts, and callback dispatch.",
+    ),
+    _entry(
+        "time_source_start",
+        "Time",
+        "implemented",
+        "src.conversion.gml_runtime_parts.segments.56_time_alarms",
+        "yes",
+        "yes",
+        "yes",
+        "yes",
+        "GameMaker_Language/GML_Reference/Time_Sources/Time_Sources.htm",
+        "Activates a time source and resets its elapsed time and repetition counter.",
+    ),
+    _entry(
+        "time_source_stop",
+        "Time",
+        "implemented",
+        "src.conversion.gml_runtime_parts.segments.56_time_alarms",
+        "yes",
+        "yes",
+        "yes",
+        "yes",
+        "GameMaker_Language/GML_Reference/Time_Sources/Time_Sources.htm",
+        "Stops a time source and propagates to child time sources.",
+    ),
+    _entry(
+        "time_source_pause",
+        "Time",
+        "implemented",
+        "src.conversion.gml_runtime_parts.segments.56_time_alarms",
+        "yes",
+        "yes",
+        "yes",
+        "yes",
+        "GameMaker_Language/GML_Reference/Time_Sources/Time_Sources.htm",
+        "Pauses an active time source and propagates to child time sources.",
+    ),
+    _entry(
+        "time_source_resume",
+        "Time",
+        "implemented",
+        "src.conversion.gml_runtime_parts.segments.56_time_alarms",
+        "yes",
+        "yes",
+        "yes",
+        "yes",
+        "GameMaker_Language/GML_Reference/Time_Sources/Time_Sources.htm",
+        "Resumes a paused time source and propagates to child time sources.",
+    ),
+    _entry(
+        "time_source_destroy",
+        "Time",
+        "implemented",
+        "src.conversion.gml_runtime_parts.segments.56_time_alarms",
+        "yes",
+        "yes",
+        "yes",
+        "yes",
+        "GameMaker_Language/GML_Reference/Time_Sources/Time_Sources.htm",
+        "Destroys a time source handle and removes child time sources.",
+    ),
+    _entry(
+        "time_source_get_state",
+        "Time",
+        "implemented",
+        "src.conversion.gml_runtime_parts.segments.56_time_alarms",
+        "yes",
+        "yes",
+        "yes",
+        "yes",
+        "GameMaker_Language/GML_Reference/Time_Sources/Time_Sources.htm",
+        "Returns the current state of a time source handle.",
+    ),
+    _entry(
+        "time_source_get_period",
+        "Time",
+        "implemented",
+        "src.conversion.gml_runtime_parts.segments.56_time_alarms",
+        "yes",
+        "yes",
+        "yes",
+        "yes",
+        "GameMaker_Language/GML_Reference/Time_Sources/Time_Sources.htm",
+        "Returns the period of a time source handle.",
+    ),
+    _entry(
+        "time_source_get_reps_completed",
+        "Time",
+        "implemented",
+        "src.conversion.gml_runtime_parts.segments.56_time_alarms",
+        "yes",
+        "yes",
+        "yes",
+        "yes",
+        "GameMaker_Language/GML_Reference/Time_Sources/Time_Sources.htm",
+        "Returns the number of completed repetitions for a time source handle.",
+    ),
+    _entry(
+        "time_source_get_reps_remaining",
+        "Time",
+        "implemented",
+        "src.conversion.gml_runtime_parts.segments.56_time_alarms",
+        "yes",
+        "yes",
+        "yes",
+        "yes",
+        "GameMaker_Language/GML_Reference/Time_Sources/Time_Sources.htm",
+        "Returns the number of remaining repetitions for a time source handle.",
+    ),
+    _entry(
+        "time_source_get_time_remaining",
+        "Time",
+        "implemented",
+        "src.conversion.gml_runtime_parts.segments.56_time_alarms",
+        "yes",
+        "yes",
+        "yes",
+        "yes",
+        "GameMaker_Language/GML_Reference/Time_Sources/Time_Sources.htm",
+        "Returns the time remaining until the next firing for a time source handle.",
+    ),
+    _entry(
+        "call_later",
+        "Time",
+        "implemented",
+        "src.conversion.gml_runtime_parts.segments.56_time_alarms",
+        "yes",
+        "yes",
+        "yes",
+        "yes",
+        "GameMaker_Language/GML_Reference/Time_Sources/Time_Sources.htm",
+        "Creates and starts a one-shot or repeating time source with a callback.",
+    ),
+    _entry(
+        "call_cancel",
+        "Time",
+        "implemented",
+        "src.conversion.gml_runtime_parts.segments.56_time_alarms",
+        "yes",
+        "yes",
+        "yes",
+        "yes",
+        "GameMaker_Language/GML_Reference/Time_Sources/Time_Sources.htm",
+        "Stops and destroys a time source created by call_later.",
+    ),
+    _entry(
+        "ds_exists",
+        "Data Structures Sequential",
+        "implemented",
+        "src.conversion.gml_runtime_parts.segments.57_ds_lists_stacks_queues",
+        "yes",
+        "yes",
+        "yes",
+        "yes",
+        "GameMaker_Language/GML_Reference/Data_Structures/ds_exists.htm",
+        "Checks handle-backed DS references against explicit GameMaker DS type constants.",
+    ),
+    _entry(
+        "ds_list_create",
+        "Data Structures Sequential",
+        "implemented",
+        "src.conversion.gml_runtime_parts.segments.57_ds_lists_stacks_queues",
+        "yes",
+        "yes",
+        "yes",
+        "no",
+        "GameMaker_Language/GML_Reference/Data_Structures/DS_Lists/DS_Lists.htm",
+        "Creates handle-backed DS list through GMRuntime.",
+    ),
+    _entry(
+        "ds_list_destroy",
+        "Data Structures Sequential",
+        "implemented",
+        "src.conversion.gml_runtime_parts.segments.57_ds_lists_stacks_queues",
+        "yes",
+        "yes",
+        "yes",
+        "no",
+        "GameMaker_Language/GML_Reference/Data_Structures/DS_Lists/DS_Lists.htm",
+        "Invalidates handle-backed DS list.",
+    ),
+    _entry(
+        "ds_list_clear",
+        "Data Structures Sequential",
+        "implemented",
+        "src.conversion.gml_runtime_parts.segments.57_ds_lists_stacks_queues",
+        "yes",
+        "yes",
+        "yes",
+        "no",
+        "GameMaker_Language/GML_Reference/Data_Structures/DS_Lists/DS_Lists.htm",
+        "Clears all elements from handle-backed DS list.",
+    ),
+    _entry(
+        "ds_list_empty",
+        "Data Structures Sequential",
+        "implemented",
+        "src.conversion.gml_runtime_parts.segments.57_ds_lists_stacks_queues",
+        "yes",
+        "yes",
+        "yes",
+        "no",
+        "GameMaker_Language/GML_Reference/Data_Structures/DS_Lists/DS_Lists.htm",
+        "Returns true if handle-backed DS list has zero elements.",
+    ),
+    _entry(
+        "ds_list_size",
+        "Data Structures Sequential",
+        "implemented",
+        "src.conversion.gml_runtime_parts.segments.57_ds_lists_stacks_queues",
+        "yes",
+        "yes",
+        "yes",
+        "no",
+        "GameMaker_Language/GML_Reference/Data_Structures/DS_Lists/DS_Lists.htm",
+        "Returns the number of elements in handle-backed DS list.",
+    ),
+    _entry(
+        "ds_list_add",
+        "Data Structures Sequential",
+        "implemented",
+        "src.conversion.gml_runtime_parts.segments.57_ds_lists_stacks_queues",
+        "yes",
+        "yes",
+        "yes",
+        "no",
+        "GameMaker_Language/GML_Reference/Data_Structures/DS_Lists/DS_Lists.htm",
+        "Appends one or more values to a handle-backed DS list.",
+    ),
+    _entry(
+        "ds_list_set",
+        "Data Structures Sequential",
+        "implemented",
+        "src.conversion.gml_runtime_parts.segments.57_ds_lists_stacks_queues",
+        "yes",
+        "yes",
+        "yes",
+        "no",
+        "GameMaker_Language/GML_Reference/Data_Structures/DS_Lists/DS_Lists.htm",
+        "Sets an element at a given position in a handle-backed DS list.",
+    ),
+    _entry(
+        "ds_list_delete",
+        "Data Structures Sequential",
+        "implemented",
+        "src.conversion.gml_runtime_parts.segments.57_ds_lists_stacks_queues",
+        "yes",
+        "yes",
+        "yes",
+        "no",
+        "GameMaker_Language/GML_Reference/Data_Structures/DS_Lists/DS_Lists.htm",
+        "Removes an element at a given position from a handle-backed DS list.",
+    ),
+    _entry(
+        "ds_list_find_index",
+        "Data Structures Sequential",
+        "implemented",
+        "src.conversion.gml_runtime_parts.segments.57_ds_lists_stacks_queues",
+        "yes",
+        "yes",
+        "yes",
+        "no",
+        "GameMaker_Language/GML_Reference/Data_Structures/DS_Lists/DS_Lists.htm",
+        "Finds the index of a value in a handle-backed DS list using GML equality.",
+    ),
+    _entry(
+        "ds_list_find_value",
+        "Data Structures Sequential",
+        "implemented",
+        "src.conversion.gml_runtime_parts.segments.57_ds_lists_stacks_queues",
+        "yes",
+        "yes",
+        "yes",
+        "no",
+        "GameMaker_Language/GML_Reference/Data_Structures/DS_Lists/DS_Lists.htm",
+        "Returns the value at a given position in a handle-backed DS list.",
+    ),
+    _entry(
+        "ds_list_insert",
+        "Data Structures Sequential",
+        "implemented",
+        "src.conversion.gml_runtime_parts.segments.57_ds_lists_stacks_queues",
+        "yes",
+        "yes",
+        "yes",
+        "no",
+        "GameMaker_Language/GML_Reference/Data_Structures/DS_Lists/DS_Lists.htm",
+        "Inserts a value at a given position in a handle-backed DS list.",
+    ),
+    _entry(
+        "ds_list_replace",
+        "Data Structures Sequential",
+        "implemented",
+        "src.conversion.gml_runtime_parts.segments.57_ds_lists_stacks_queues",
+        "yes",
+        "yes",
+        "yes",
+        "no",
+        "GameMaker_Language/GML_Reference/Data_Structures/DS_Lists/DS_Lists.htm",
+        "Replaces the value at a given index in a handle-backed DS list.",
+    ),
+    _entry(
+        "ds_list_shuffle",
+        "Data Structures Sequential",
+        "implemented",
+        "src.conversion.gml_runtime_parts.segments.57_ds_lists_stacks_queues",
+        "yes",
+        "yes",
+        "yes",
+        "no",
+        "GameMaker_Language/GML_Reference/Data_Structures/DS_Lists/DS_Lists.htm",
+        "Randomly shuffles elements and clears JSON marks in a handle-backed DS list.",
+    ),
+    _entry(
+        "ds_list_sort",
+        "Data Structures Sequential",
+        "implemented",
+        "src.conversion.gml_runtime_parts.segments.57_ds_lists_stacks_queues",
+        "yes",
+        "yes",
+        "yes",
+        "no",
+        "GameMaker_Language/GML_Reference/Data_Structures/DS_Lists/DS_Lists.htm",
+        "Sorts a handle-backed DS list ascending or descending using GML comparison.",
+    ),
+    _entry(
+        "ds_list_copy",
+        "Data Structures Sequential",
+        "implemented",
+        "src.conversion.gml_runtime_parts.segments.57_ds_lists_stacks_queues",
+        "yes",
+        "yes",
+        "yes",
+        "no",
+        "GameMaker_Language/GML_Reference/Data_Structures/DS_Lists/DS_Lists.htm",
+        "Copies elements and JSON marks from source to destination handle-backed DS list.",
+    ),
+    _entry(
+        "ds_list_read",
+        "Data Structures Sequential",
+        "partial",
+        "src.conversion.gml_runtime_parts.segments.57_ds_lists_stacks_queues",
+        "yes",
+        "yes",
+        "yes",
+        "yes",
+        "GameMaker_Language/GML_Reference/Data_Structures/DS_Lists/DS_Lists.htm",
+        "Round-trips GM2Godot canonical JSON-backed DS snapshots; legacy GameMaker dump strings are not parsed.",
+    ),
+    _entry(
+        "ds_list_write",
+        "Data Structures Sequential",
+        "partial",
+        "src.conversion.gml_runtime_parts.segments.57_ds_lists_stacks_queues",
+        "yes",
+        "yes",
+        "yes",
+        "yes",
+        "GameMaker_Language/GML_Reference/Data_Structures/DS_Lists/DS_Lists.htm",
+        "Emits GM2Godot canonical JSON-backed DS snapshots for later ds_list_read; not byte-compatible with GameMaker dumps.",
+    ),
+    _entry(
+        "ds_list_mark_as_list",
+        "Data Structures Sequential",
+        "implemented",
+        "src.conversion.gml_runtime_parts.segments.57_ds_lists_stacks_queues",
+        "yes",
+        "yes",
+        "yes",
+        "no",
+        "GameMaker_Language/GML_Reference/Data_Structures/DS_Lists/DS_Lists.htm",
+        "Marks a DS list element for JSON list serialization.",
+    ),
+    _entry(
+        "ds_list_mark_as_map",
+        "Data Structures Sequential",
+        "implemented",
+        "src.conversion.gml_runtime_parts.segments.57_ds_lists_stacks_queues",
+        "yes",
+        "yes",
+        "yes",
+        "no",
+        "GameMaker_Language/GML_Reference/Data_Structures/DS_Lists/DS_Lists.htm",
+        "Marks a DS list element for JSON map serialization.",
+    ),
+    _entry(
+        "ds_list_is_list",
+        "Data Structures Sequential",
+        "implemented",
+        "src.conversion.gml_runtime_parts.segments.57_ds_lists_stacks_queues",
+        "yes",
+        "yes",
+        "yes",
+        "no",
+        "GameMaker_Language/GML_Reference/Data_Structures/DS_Lists/DS_Lists.htm",
+        "Returns true if a DS list element is marked as a list.",
+    ),
+    _entry(
+        "ds_list_is_map",
+        "Data Structures Sequential",
+        "implemented",
+        "src.conversion.gml_runtime_parts.segments.57_ds_lists_stacks_queues",
+        "yes",
+        "yes",
+        "yes",
+        "no",
+        "GameMaker_Language/GML_Reference/Data_Structures/DS_Lists/DS_Lists.htm",
+        "Returns true if a DS list element is marked as a map.",
+    ),
+    _entry(
+        "ds_stack_create",
+        "Data Structures Sequential",
+        "implemented",
+        "src.conversion.gml_runtime_parts.segments.57_ds_lists_stacks_queues",
+        "yes",
+        "yes",
+        "yes",
+        "no",
+        "GameMaker_Language/GML_Reference/Data_Structures/DS_Stacks/DS_Stacks.htm",
+        "Creates a handle-backed DS stack.",
+    ),
+    _entry(
+        "ds_stack_destroy",
+        "Data Structures Sequential",
+        "implemented",
+        "src.conversion.gml_runtime_parts.segments.57_ds_lists_stacks_queues",
+        "yes",
+        "yes",
+        "yes",
+        "no",
+        "GameMaker_Language/GML_Reference/Data_Structures/DS_Stacks/DS_Stacks.htm",
+        "Invalidates a handle-backed DS stack.",
+    ),
+    _entry(
+        "ds_stack_clear",
+        "Data Structures Sequential",
+        "implemented",
+        "src.conversion.gml_runtime_parts.segments.57_ds_lists_stacks_queues",
+        "yes",
+        "yes",
+        "yes",
+        "no",
+        "GameMaker_Language/GML_Reference/Data_Structures/DS_Stacks/DS_Stacks.htm",
+        "Clears all elements from a handle-backed DS stack.",
+    ),
+    _entry(
+        "ds_stack_empty",
+        "Data Structures Sequential",
+        "implemented",
+        "src.conversion.gml_runtime_parts.segments.57_ds_lists_stacks_queues",
+        "yes",
+        "yes",
+        "yes",
+        "no",
+        "GameMaker_Language/GML_Reference/Data_Structures/DS_Stacks/DS_Stacks.htm",
+        "Returns true if a handle-backed DS stack has zero elements.",
+    ),
+    _entry(
+        "ds_stack_size",
+        "Data Structures Sequential",
+        "implemented",
+        "src.conversion.gml_runtime_parts.segments.57_ds_lists_stacks_queues",
+        "yes",
+        "yes",
+        "yes",
+        "no",
+        "GameMaker_Language/GML_Reference/Data_Structures/DS_Stacks/DS_Stacks.htm",
+        "Returns the number of elements in a handle-backed DS stack.",
+    ),
+    _entry(
+        "ds_stack_push",
+        "Data Structures Sequential",
+        "implemented",
+        "src.conversion.gml_runtime_parts.segments.57_ds_lists_stacks_queues",
+        "yes",
+        "yes",
+        "yes",
+        "no",
+        "GameMaker_Language/GML_Reference/Data_Structures/DS_Stacks/DS_Stacks.htm",
+        "Pushes one or more values onto a handle-backed DS stack.",
+    ),
+    _entry(
+        "ds_stack_pop",
+        "Data Structures Sequential",
+        "implemented",
+        "src.conversion.gml_runtime_parts.segments.57_ds_lists_stacks_queues",
+        "yes",
+        "yes",
+        "yes",
+        "no",
+        "GameMaker_Language/GML_Reference/Data_Structures/DS_Stacks/DS_Stacks.htm",
+        "Pops the top value from a handle-backed DS stack.",
+    ),
+    _entry(
+        "ds_stack_top",
+        "Data Structures Sequential",
+        "implemented",
+        "src.conversion.gml_runtime_parts.segments.57_ds_lists_stacks_queues",
+        "yes",
+        "yes",
+        "yes",
+        "no",
+        "GameMaker_Language/GML_Reference/Data_Structures/DS_Stacks/DS_Stacks.htm",
+        "Returns the top value of a handle-backed DS stack without removing it.",
+    ),
+    _entry(
+        "ds_stack_copy",
+        "Data Structures Sequential",
+        "implemented",
+        "src.conversion.gml_runtime_parts.segments.57_ds_lists_stacks_queues",
+        "yes",
+        "yes",
+        "yes",
+        "no",
+        "GameMaker_Language/GML_Reference/Data_Structures/DS_Stacks/DS_Stacks.htm",
+        "Copies elements from source to destination handle-backed DS stack.",
+    ),
+    _entry(
+        "ds_stack_read",
+        "Data Structures Sequential",
+        "partial",
+        "src.conversion.gml_runtime_parts.segments.57_ds_lists_stacks_queues",
+        "yes",
+        "yes",
+        "yes",
+        "yes",
+        "GameMaker_Language/GML_Reference/Data_Structures/DS_Stacks/DS_Stacks.htm",
+        "Round-trips GM2Godot canonical JSON-backed DS snapshots; legacy GameMaker dump strings are not parsed.",
+    ),
+    _entry(
+        "ds_stack_write",
+        "Data Structures Sequential",
+        "partial",
+        "src.conversion.gml_runtime_parts.segments.57_ds_lists_stacks_queues",
+        "yes",
+        "yes",
+        "yes",
+        "yes",
+        "GameMaker_Language/GML_Reference/Data_Structures/DS_Stacks/DS_Stacks.htm",
+        "Emits GM2Godot canonical JSON-backed DS snapshots for later ds_stack_read; not byte-compatible with GameMaker dumps.",
+    ),
+    _entry(
+        "ds_queue_create",
+        "Data Structures Sequential",
+        "implemented",
+        "src.conversion.gml_runtime_parts.segments.57_ds_lists_stacks_queues",
+        "yes",
+        "yes",
+        "yes",
+        "no",
+        "GameMaker_Language/GML_Reference/Data_Structures/DS_Queues/DS_Queues.htm",
+        "Creates a handle-backed DS queue.",
+    ),
+    _entry(
+        "ds_queue_destroy",
+        "Data Structures Sequential",
+        "implemented",
+        "src.conversion.gml_runtime_parts.segments.57_ds_lists_stacks_queues",
+        "yes",
+        "yes",
+        "yes",
+        "no",
+        "GameMaker_Language/GML_Reference/Data_Structures/DS_Queues/DS_Queues.htm",
+        "Invalidates a handle-backed DS queue.",
+    ),
+    _entry(
+        "ds_queue_clear",
+        "Data Structures Sequential",
+        "implemented",
+        "src.conversion.gml_runtime_parts.segments.57_ds_lists_stacks_queues",
+        "yes",
+        "yes",
+        "yes",
+        "no",
+        "GameMaker_Language/GML_Reference/Data_Structures/DS_Queues/DS_Queues.htm",
+        "Clears all elements from a handle-backed DS queue.",
+    ),
+    _entry(
+        "ds_queue_empty",
+        "Data Structures Sequential",
+        "implemented",
+        "src.conversion.gml_runtime_parts.segments.57_ds_lists_stacks_queues",
+        "yes",
+        "yes",
+        "yes",
+        "no",
+        "GameMaker_Language/GML_Reference/Data_Structures/DS_Queues/DS_Queues.htm",
+        "Returns true if a handle-backed DS queue has zero elements.",
+    ),
+    _entry(
+        "ds_queue_size",
+        "Data Structures Sequential",
+        "implemented",
+        "src.conversion.gml_runtime_parts.segments.57_ds_lists_stacks_queues",
+        "yes",
+        "yes",
+        "yes",
+        "no",
+        "GameMaker_Language/GML_Reference/Data_Structures/DS_Queues/DS_Queues.htm",
+        "Returns the number of elements in a handle-backed DS queue.",
+    ),
+    _entry(
+        "ds_queue_enqueue",
+        "Data Structures Sequential",
+        "implemented",
+        "src.conversion.gml_runtime_parts.segments.57_ds_lists_stacks_queues",
+        "yes",
+        "yes",
+        "yes",
+        "no",
+        "GameMaker_Language/GML_Reference/Data_Structures/DS_Queues/DS_Queues.htm",
+        "Enqueues one or more values into a handle-backed DS queue.",
+    ),
+    _entry(
+        "ds_queue_dequeue",
+        "Data Structures Sequential",
+        "implemented",
+        "src.conversion.gml_runtime_parts.segments.57_ds_lists_stacks_queues",
+        "yes",
+        "yes",
+        "yes",
+        "no",
+        "GameMaker_Language/GML_Reference/Data_Structures/DS_Queues/DS_Queues.htm",
+        "Removes and returns the front element of a handle-backed DS queue.",
+    ),
+    _entry(
+        "ds_queue_head",
+        "Data Structures Sequential",
+        "implemented",
+        "src.conversion.gml_runtime_parts.segments.57_ds_lists_stacks_queues",
+        "yes",
+        "yes",
+        "yes",
+        "no",
+        "GameMaker_Language/GML_Reference/Data_Structures/DS_Queues/DS_Queues.htm",
+        "Returns the front element of a handle-backed DS queue without removing it.",
+    ),
+    _entry(
+        "ds_queue_tail",
+        "Data Structures Sequential",
+        "implemented",
+        "src.conversion.gml_runtime_parts.segments.57_ds_lists_stacks_queues",
+        "yes",
+        "yes",
+        "yes",
+        "no",
+        "GameMaker_Language/GML_Reference/Data_Structures/DS_Queues/DS_Queues.htm",
+        "Returns the back element of a handle-backed DS queue without removing it.",
+    ),
+    _entry(
+        "ds_queue_copy",
+        "Data Structures Sequential",
+        "implemented",
+        "src.conversion.gml_runtime_parts.segments.57_ds_lists_stacks_queues",
+        "yes",
+        "yes",
+        "yes",
+        "no",
+        "GameMaker_Language/GML_Reference/Data_Structures/DS_Queues/DS_Queues.htm",
+        "Copies elements from source to destination handle-backed DS queue.",
+    ),
+    _entry(
+        "ds_queue_read",
+        "Data Structures Sequential",
+        "partial",
+        "src.conversion.gml_runtime_parts.segments.57_ds_lists_stacks_queues",
+        "yes",
+        "yes",
+        "yes",
+        "yes",
+        "GameMaker_Language/GML_Reference/Data_Structures/DS_Queues/DS_Queues.htm",
+        "Round-trips GM2Godot canonical JSON-backed DS snapshots; legacy GameMaker dump strings are not parsed.",
+    ),
+    _entry(
+        "ds_queue_write",
+        "Data Structures Sequential",
+        "partial",
+        "src.conversion.gml_runtime_parts.segments.57_ds_lists_stacks_queues",
+        "yes",
+        "yes",
+        "yes",
+        "yes",
+        "GameMaker_Language/GML_Reference/Data_Structures/DS_Queues/DS_Queues.htm",
+        "Emits GM2Godot canonical JSON-backed DS snapshots for later ds_queue_read; not byte-compatible with GameMaker dumps.",
+    ),
+    _entry(
+        "ds_priority_create",
+        "Data Structures Sequential",
+        "implemented",
+        "src.conversion.gml_runtime_parts.segments.57_ds_lists_stacks_queues",
+        "yes",
+        "yes",
+        "yes",
+        "no",
+        "GameMaker_Language/GML_Reference/Data_Structures/DS_Priority_Queues/DS_Priority_Queues.htm",
+        "Creates a handle-backed DS priority queue.",
+    ),
+    _entry(
+        "ds_priority_destroy",
+        "Data Structures Sequential",
+        "implemented",
+        "src.conversion.gml_runtime_parts.segments.57_ds_lists_stacks_queues",
+        "yes",
+        "yes",
+        "yes",
+        "no",
+        "GameMaker_Language/GML_Reference/Data_Structures/DS_Priority_Queues/DS_Priority_Queues.htm",
+        "Invalidates a handle-backed DS priority queue.",
+    ),
+    _entry(
+        "ds_priority_clear",
+        "Data Structures Sequential",
+        "implemented",
+        "src.conversion.gml_runtime_parts.segments.57_ds_lists_stacks_queues",
+        "yes",
+        "yes",
+        "yes",
+        "no",
+        "GameMaker_Language/GML_Reference/Data_Structures/DS_Priority_Queues/DS_Priority_Queues.htm",
+        "Clears all elements from a handle-backed DS priority queue.",
+    ),
+    _entry(
+        "ds_priority_empty",
+        "Data Structures Sequential",
+        "implemented",
+        "src.conversion.gml_runtime_parts.segments.57_ds_lists_stacks_queues",
+        "yes",
+        "yes",
+        "yes",
+        "no",
+        "GameMaker_Language/GML_Reference/Data_Structures/DS_Priority_Queues/DS_Priority_Queues.htm",
+        "Returns true if a handle-backed DS priority queue has zero elements.",
+    ),
+    _entry(
+        "ds_priority_size",
+        "Data Structures Sequential",
+        "implemented",
+        "src.conversion.gml_runtime_parts.segments.57_ds_lists_stacks_queues",
+        "yes",
+        "yes",
+        "yes",
+        "no",
+        "GameMaker_Language/GML_Reference/Data_Structures/DS_Priority_Queues/DS_Priority_Queues.htm",
+        "Returns the number of elements in a handle-backed DS priority queue.",
+    ),
+    _entry(
+        "ds_priority_add",
+        "Data Structures Sequential",
+        "implemented",
+        "src.conversion.gml_runtime_parts.segments.57_ds_lists_stacks_queues",
+        "yes",
+        "yes",
+        "yes",
+        "no",
+        "GameMaker_Language/GML_Reference/Data_Structures/DS_Priority_Queues/DS_Priority_Queues.htm",
+        "Adds a value with a priority to a handle-backed DS priority queue.",
+    ),
+    _entry(
+        "ds_priority_change_priority",
+        "Data Structures Sequential",
+        "implemented",
+        "src.conversion.gml_runtime_parts.segments.57_ds_lists_stacks_queues",
+        "yes",
+        "yes",
+        "yes",
+        "no",
+        "GameMaker_Language/GML_Reference/Data_Structures/DS_Priority_Queues/DS_Priority_Queues.htm",
+        "Changes the priority of the first matching value in a handle-backed DS priority queue.",
+    ),
+    _entry(
+        "ds_priority_delete_max",
+        "Data Structures Sequential",
+        "implemented",
+        "src.conversion.gml_runtime_parts.segments.57_ds_lists_stacks_queues",
+        "yes",
+        "yes",
+        "yes",
+        "no",
+        "GameMaker_Language/GML_Reference/Data_Structures/DS_Priority_Queues/DS_Priority_Queues.htm",
+        "Removes and returns the highest-priority value from a handle-backed DS priority queue.",
+    ),
+    _entry(
+        "ds_priority_delete_min",
+        "Data Structures Sequential",
+        "implemented",
+        "src.conversion.gml_runtime_parts.segments.57_ds_lists_stacks_queues",
+        "yes",
+        "yes",
+        "yes",
+        "no",
+        "GameMaker_Language/GML_Reference/Data_Structures/DS_Priority_Queues/DS_Priority_Queues.htm",
+        "Removes and returns the lowest-priority value from a handle-backed DS priority queue.",
+    ),
+    _entry(
+        "ds_priority_delete_value",
+        "Data Structures Sequential",
+        "implemented",
+        "src.conversion.gml_runtime_parts.segments.57_ds_lists_stacks_queues",
+        "yes",
+        "yes",
+        "yes",
+        "no",
+        "GameMaker_Language/GML_Reference/Data_Structures/DS_Priority_Queues/DS_Priority_Queues.htm",
+        "Removes all occurrences of a value from a handle-backed DS priority queue.",
+    ),
+    _entry(
+        "ds_priority_find_max",
+        "Data Structures Sequential",
+        "implemented",
+        "src.conversion.gml_runtime_parts.segments.57_ds_lists_stacks_queues",
+        "yes",
+        "yes",
+        "yes",
+        "no",
+        "GameMaker_Language/GML_Reference/Data_Structures/DS_Priority_Queues/DS_Priority_Queues.htm",
+        "Returns the highest-priority value from a handle-backed DS priority queue without removing it.",
+    ),
+    _entry(
+        "ds_priority_find_min",
+        "Data Structures Sequential",
+        "implemented",
+        "src.conversion.gml_runtime_parts.segments.57_ds_lists_stacks_queues",
+        "yes",
+        "yes",
+        "yes",
+        "no",
+        "GameMaker_Language/GML_Reference/Data_Structures/DS_Priority_Queues/DS_Priority_Queues.htm",
+        "Returns the lowest-priority value from a handle-backed DS priority queue without removing it.",
+    ),
+    _entry(
+        "ds_priority_find_priority",
+        "Data Structures Sequential",
+        "implemented",
+        "src.conversion.gml_runtime_parts.segments.57_ds_lists_stacks_queues",
+        "yes",
+        "yes",
+        "yes",
+        "no",
+        "GameMaker_Language/GML_Reference/Data_Structures/DS_Priority_Queues/DS_Priority_Queues.htm",
+        "Returns the priority of the first matching value in a handle-backed DS priority queue.",
+    ),
+    _entry(
+        "ds_priority_copy",
+        "Data Structures Sequential",
+        "implemented",
+        "src.conversion.gml_runtime_parts.segments.57_ds_lists_stacks_queues",
+        "yes",
+        "yes",
+        "yes",
+        "no",
+        "GameMaker_Language/GML_Reference/Data_Structures/DS_Priority_Queues/DS_Priority_Queues.htm",
+        "Copies elements from source to destination handle-backed DS priority queue.",
+    ),
+    _entry(
+        "ds_priority_read",
+        "Data Structures Sequential",
+        "partial",
+        "src.conversion.gml_runtime_parts.segments.57_ds_lists_stacks_queues",
+        "yes",
+        "yes",
+        "yes",
+        "yes",
+        "GameMaker_Language/GML_Reference/Data_Structures/DS_Priority_Queues/DS_Priority_Queues.htm",
+        "Round-trips GM2Godot canonical JSON-backed DS snapshots; legacy GameMaker dump strings are not parsed.",
+    ),
+    _entry(
+        "ds_priority_write",
+        "Data Structures Sequential",
+        "partial",
+        "src.conversion.gml_runtime_parts.segments.57_ds_lists_stacks_queues",
+        "yes",
+        "yes",
+        "yes",
+        "yes",
+        "GameMaker_Language/GML_Reference/Data_Structures/DS_Priority_Queues/DS_Priority_Queues.htm",
+        "Emits GM2Godot canonical JSON-backed DS snapshots for later ds_priority_read; not byte-compatible with GameMaker dumps.",
+    ),
+    _entry(
+        "ds_map_create",
+        "Data Structures Maps",
+        "implemented",
+        "src.conversion.gml_runtime_parts.segments.58_ds_maps",
+        "yes",
+        "yes",
+        "yes",
+        "no",
+        "GameMaker_Language/GML_Reference/Data_Structures/DS_Maps/DS_Maps.htm",
+        "Handle-backed DS map creation through GMRuntime lifecycle.",
+    ),
+    _entry(
+        "ds_map_destroy",
+        "Data Structures Maps",
+        "implemented",
+        "src.conversion.gml_runtime_parts.segments.58_ds_maps",
+        "yes",
+        "yes",
+        "yes",
+        "no",
+        "GameMaker_Language/GML_Reference/Data_Structures/DS_Maps/DS_Maps.htm",
+        "Invalidates the DS map handle and releases resources.",
+    ),
+    _entry(
+        "ds_map_clear",
+        "Data Structures Maps",
+        "implemented",
+        "src.conversion.gml_runtime_parts.segments.58_ds_maps",
+        "yes",
+        "yes",
+        "yes",
+        "no",
+        "GameMaker_Language/GML_Reference/Data_Structures/DS_Maps/DS_Maps.htm",
+        "Removes all key-value pairs from a handle-backed DS map.",
+    ),
+    _entry(
+        "ds_map_empty",
+        "Data Structures Maps",
+        "implemented",
+        "src.conversion.gml_runtime_parts.segments.58_ds_maps",
+        "yes",
+        "yes",
+        "yes",
+        "no",
+        "GameMaker_Language/GML_Reference/Data_Structures/DS_Maps/DS_Maps.htm",
+        "Returns true if the DS map has no key-value pairs.",
+    ),
+    _entry(
+        "ds_map_size",
+        "Data Structures Maps",
+        "implemented",
+        "src.conversion.gml_runtime_parts.segments.58_ds_maps",
+        "yes",
+        "yes",
+        "yes",
+        "no",
+        "GameMaker_Language/GML_Reference/Data_Structures/DS_Maps/DS_Maps.htm",
+        "Returns the number of key-value pairs in a handle-backed DS map.",
+    ),
+    _entry(
+        "ds_map_add",
+        "Data Structures Maps",
+        "implemented",
+        "src.conversion.gml_runtime_parts.segments.58_ds_maps",
+        "yes",
+        "yes",
+        "yes",
+        "no",
+        "GameMaker_Language/GML_Reference/Data_Structures/DS_Maps/DS_Maps.htm",
+        "Adds a new key-value pair; returns false if the key already exists.",
+    ),
+    _entry(
+        "ds_map_set",
+        "Data Structures Maps",
+        "implemented",
+        "src.conversion.gml_runtime_parts.segments.58_ds_maps",
+        "yes",
+        "yes",
+        "yes",
+        "no",
+        "GameMaker_Language/GML_Reference/Data_Structures/DS_Maps/DS_Maps.htm",
+        "Sets a key-value pair, overwriting any existing value for the key.",
+    ),
+    _entry(
+        "ds_map_replace",
+        "Data Structures Maps",
+        "implemented",
+        "src.conversion.gml_runtime_parts.segments.58_ds_maps",
+        "yes",
+        "yes",
+        "yes",
+        "no",
+        "GameMaker_Language/GML_Reference/Data_Structures/DS_Maps/DS_Maps.htm",
+        "Replaces the value for an existing key; returns undefined if key does not exist.",
+    ),
+    _entry(
+        "ds_map_delete",
+        "Data Structures Maps",
+        "implemented",
+        "src.conversion.gml_runtime_parts.segments.58_ds_maps",
+        "yes",
+        "yes",
+        "yes",
+        "no",
+        "GameMaker_Language/GML_Reference/Data_Structures/DS_Maps/DS_Maps.htm",
+        "Removes the specified key-value pair from a handle-backed DS map.",
+    ),
+    _entry(
+        "ds_map_exists",
+        "Data Structures Maps",
+        "implemented",
+        "src.conversion.gml_runtime_parts.segments.58_ds_maps",
+        "yes",
+        "yes",
+        "yes",
+        "no",
+        "GameMaker_Language/GML_Reference/Data_Structures/DS_Maps/DS_Maps.htm",
+        "Returns true if the specified key exists in the DS map.",
+    ),
+    _entry(
+        "ds_map_find_value",
+        "Data Structures Maps",
+        "implemented",
+        "src.conversion.gml_runtime_parts.segments.58_ds_maps",
+        "n/a",
+        "yes",
+        "yes",
+        "no",
+        "GameMaker_Language/GML_Reference/Data_Structures/DS_Maps/DS_Maps.htm",
+        "Returns the value for a key or undefined if key does not exist.",
+    ),
+    _entry(
+        "ds_map_find_first",
+        "Data Structures Maps",
+        "implemented",
+        "src.conversion.gml_runtime_parts.segments.58_ds_maps",
+        "yes",
+        "yes",
+        "yes",
+        "no",
+        "GameMaker_Language/GML_Reference/Data_Structures/DS_Maps/DS_Maps.htm",
+        "Returns the first key in insertion order; undefined if empty.",
+    ),
+    _entry(
+        "ds_map_find_last",
+        "Data Structures Maps",
+        "implemented",
+        "src.conversion.gml_runtime_parts.segments.58_ds_maps",
+        "yes",
+        "yes",
+        "yes",
+        "no",
+        "GameMaker_Language/GML_Reference/Data_Structures/DS_Maps/DS_Maps.htm",
+        "Returns the last key in insertion order; undefined if empty.",
+    ),
+    _entry(
+        "ds_map_find_next",
+        "Data Structures Maps",
+        "implemented",
+        "src.conversion.gml_runtime_parts.segments.58_ds_maps",
+        "yes",
+        "yes",
+        "yes",
+        "no",
+        "GameMaker_Language/GML_Reference/Data_Structures/DS_Maps/DS_Maps.htm",
+        "Returns the next key after the specified key; undefined if none.",
+    ),
+    _entry(
+        "ds_map_find_previous",
+        "Data Structures Maps",
+        "implemented",
+        "src.conversion.gml_runtime_parts.segments.58_ds_maps",
+        "yes",
+        "yes",
+        "yes",
+        "no",
+        "GameMaker_Language/GML_Reference/Data_Structures/DS_Maps/DS_Maps.htm",
+        "Returns the previous key before the specified key; undefined if none.",
+    ),
+    _entry(
+        "ds_map_keys",
+        "Data Structures Maps",
+        "implemented",
+        "src.conversion.gml_runtime_parts.segments.58_ds_maps",
+        "yes",
+        "yes",
+        "yes",
+        "no",
+        "GameMaker_Language/GML_Reference/Data_Structures/DS_Maps/DS_Maps.htm",
+        "Returns an array of all keys in the DS map.",
+    ),
+    _entry(
+        "ds_map_values",
+        "Data Structures Maps",
+        "implemented",
+        "src.conversion.gml_runtime_parts.segments.58_ds_maps",
+        "yes",
+        "yes",
+        "yes",
+        "no",
+        "GameMaker_Language/GML_Reference/Data_Structures/DS_Maps/DS_Maps.htm",
+        "Returns an array of all values in the DS map.",
+    ),
+    _entry(
+        "ds_map_copy",
+        "Data Structures Maps",
+        "implemented",
+        "src.conversion.gml_runtime_parts.segments.58_ds_maps",
+        "yes",
+        "yes",
+        "yes",
+        "no",
+        "GameMaker_Language/GML_Reference/Data_Structures/DS_Maps/DS_Maps.htm",
+        "Copies all key-value pairs from source to destination DS map.",
+    ),
+    _entry(
+        "ds_map_merge",
+        "Data Structures Maps",
+        "implemented",
+        "src.conversion.gml_runtime_parts.segments.58_ds_maps",
+        "yes",
+        "yes",
+        "yes",
+        "no",
+        "GameMaker_Language/GML_Reference/Data_Structures/DS_Maps/DS_Maps.htm",
+        "Merges source map into destination, overwriting existing keys.",
+    ),
+    _entry(
+        "ds_map_read",
+        "Data Structures Maps",
+        "partial",
+        "src.conversion.gml_runtime_parts.segments.58_ds_maps",
+        "yes",
+        "yes",
+        "yes",
+        "yes",
+        "GameMaker_Language/GML_Reference/Data_Structures/DS_Maps/DS_Maps.htm",
+        "Round-trips GM2Godot canonical JSON-backed DS snapshots, including nested list/map handles; legacy GameMaker dump strings are not parsed.",
+    ),
+    _entry(
+        "ds_map_write",
+        "Data Structures Maps",
+        "partial",
+        "src.conversion.gml_runtime_parts.segments.58_ds_maps",
+        "yes",
+        "yes",
+        "yes",
+        "yes",
+        "GameMaker_Language/GML_Reference/Data_Structures/DS_Maps/DS_Maps.htm",
+        "Emits GM2Godot canonical JSON-backed DS snapshots for later ds_map_read; not byte-compatible with GameMaker dumps.",
+    ),
+    _entry(
+        "ds_map_add_list",
+        "Data Structures Maps",
+        "implemented",
+        "src.conversion.gml_runtime_parts.segments.58_ds_maps",
+        "yes",
+        "yes",
+        "yes",
+        "no",
+        "GameMaker_Language/GML_Reference/Data_Structures/DS_Maps/DS_Maps.htm",
+        "Stores a DS list handle under the given key in the map.",
+    ),
+    _entry(
+        "ds_map_add_map",
+        "Data Structures Maps",
+        "implemented",
+        "src.conversion.gml_runtime_parts.segments.58_ds_maps",
+        "yes",
+        "yes",
+        "yes",
+        "no",
+        "GameMaker_Language/GML_Reference/Data_Structures/DS_Maps/DS_Maps.htm",
+        "Stores a DS map handle under the given key in the map.",
+    ),
+    _entry(
+        "ds_map_replace_list",
+        "Data Structures Maps",
+        "implemented",
+        "src.conversion.gml_runtime_parts.segments.58_ds_maps",
+        "yes",
+        "yes",
+        "yes",
+        "no",
+        "GameMaker_Language/GML_Reference/Data_Structures/DS_Maps/DS_Maps.htm",
+        "Replaces the value at key with a DS list handle; no-op if key missing.",
+    ),
+    _entry(
+        "ds_map_replace_map",
+        "Data Structures Maps",
+        "implemented",
+        "src.conversion.gml_runtime_parts.segments.58_ds_maps",
+        "yes",
+        "yes",
+        "yes",
+        "no",
+        "GameMaker_Language/GML_Reference/Data_Structures/DS_Maps/DS_Maps.htm",
+        "Replaces the value at key with a DS map handle; no-op if key missing.",
+    ),
+    _entry(
+        "ds_map_is_list",
+        "Data Structures Maps",
+        "implemented",
+        "src.conversion.gml_runtime_parts.segments.58_ds_maps",
+        "yes",
+        "yes",
+        "yes",
+        "no",
+        "GameMaker_Language/GML_Reference/Data_Structures/DS_Maps/DS_Maps.htm",
+        "Returns true if the value at key is a DS list handle.",
+    ),
+    _entry(
+        "ds_map_is_map",
+        "Data Structures Maps",
+        "implemented",
+        "src.conversion.gml_runtime_parts.segments.58_ds_maps",
+        "yes",
+        "yes",
+        "yes",
+        "no",
+        "GameMaker_Language/GML_Reference/Data_Structures/DS_Maps/DS_Maps.htm",
+        "Returns true if the value at key is a DS map handle.",
+    ),
+    _entry(
+        "ds_grid_create",
+        "Data Structures Grids",
+        "implemented",
+        "src.conversion.gml_runtime_parts.segments.59_ds_grids",
+        "yes",
+        "yes",
+        "yes",
+        "no",
+        "GameMaker_Language/GML_Reference/Data_Structures/DS_Grids/DS_Grids.htm",
+        "Handle-backed DS grid creation through GMRuntime lifecycle.",
+    ),
+    _entry(
+        "ds_grid_destroy",
+        "Data Structures Grids",
+        "implemented",
+        "src.conversion.gml_runtime_parts.segments.59_ds_grids",
+        "yes",
+        "yes",
+        "yes",
+        "no",
+        "GameMaker_Language/GML_Reference/Data_Structures/DS_Grids/DS_Grids.htm",
+        "Invalidates the DS grid handle and releases resources.",
+    ),
+    _entry(
+        "ds_grid_width",
+        "Data Structures Grids",
+        "implemented",
+        "src.conversion.gml_runtime_parts.segments.59_ds_grids",
+        "yes",
+        "yes",
+        "yes",
+        "no",
+        "GameMaker_Language/GML_Reference/Data_Structures/DS_Grids/DS_Grids.htm",
+        "Returns the width (number of columns) of a handle-backed DS grid.",
+    ),
+    _entry(
+        "ds_grid_height",
+        "Data Structures Grids",
+        "implemented",
+        "src.conversion.gml_runtime_parts.segments.59_ds_grids",
+        "yes",
+        "yes",
+        "yes",
+        "no",
+        "GameMaker_Language/GML_Reference/Data_Structures/DS_Grids/DS_Grids.htm",
+        "Returns the height (number of rows) of a handle-backed DS grid.",
+    ),
+    _entry(
+        "ds_grid_clear",
+        "Data Structures Grids",
+        "implemented",
+        "src.conversion.gml_runtime_parts.segments.59_ds_grids",
+        "yes",
+        "yes",
+        "yes",
+        "no",
+        "GameMaker_Language/GML_Reference/Data_Structures/DS_Grids/DS_Grids.htm",
+        "Clears all cells to a specified value (default 0).",
+    ),
+    _entry(
+        "ds_grid_resize",
+        "Data Structures Grids",
+        "implemented",
+        "src.conversion.gml_runtime_parts.segments.59_ds_grids",
+        "yes",
+        "yes",
+        "yes",
+        "no",
+        "GameMaker_Language/GML_Reference/Data_Structures/DS_Grids/DS_Grids.htm",
+        "Resizes a handle-backed DS grid preserving existing data where possible.",
+    ),
+    _entry(
+        "ds_grid_set",
+        "Data Structures Grids",
+        "implemented",
+        "src.conversion.gml_runtime_parts.segments.59_ds_grids",
+        "yes",
+        "yes",
+        "yes",
+        "no",
+        "GameMaker_Language/GML_Reference/Data_Structures/DS_Grids/DS_Grids.htm",
+        "Sets a cell value in a handle-backed DS grid with bounds checking.",
+    ),
+    _entry(
+        "ds_grid_get",
+        "Data Structures Grids",
+        "implemented",
+        "src.conversion.gml_runtime_parts.segments.59_ds_grids",
+        "yes",
+        "yes",
+        "yes",
+        "no",
+        "GameMaker_Language/GML_Reference/Data_Structures/DS_Grids/DS_Grids.htm",
+        "Gets a cell value from a handle-backed DS grid; undefined if out of bounds.",
+    ),
+    _entry(
+        "ds_grid_add",
+        "Data Structures Grids",
+        "implemented",
+        "src.conversion.gml_runtime_parts.segments.59_ds_grids",
+        "yes",
+        "yes",
+        "yes",
+        "no",
+        "GameMaker_Language/GML_Reference/Data_Structures/DS_Grids/DS_Grids.htm",
+        "Adds a value to a cell in a handle-backed DS grid.",
+    ),
+    _entry(
+        "ds_grid_multiply",
+        "Data Structures Grids",
+        "implemented",
+        "src.conversion.gml_runtime_parts.segments.59_ds_grids",
+        "yes",
+        "yes",
+        "yes",
+        "no",
+        "GameMaker_Language/GML_Reference/Data_Structures/DS_Grids/DS_Grids.htm",
+        "Multiplies a cell value in a handle-backed DS grid.",
+    ),
+    _entry(
+        "ds_grid_set_region",
+        "Data Structures Grids",
+        "implemented",
+        "src.conversion.gml_runtime_parts.segments.59_ds_grids",
+        "yes",
+        "yes",
+        "yes",
+        "no",
+        "GameMaker_Language/GML_Reference/Data_Structures/DS_Grids/DS_Grids.htm",
+        "Sets all cells in a rectangular region to a uniform value.",
+    ),
+    _entry(
+        "ds_grid_get_region",
+        "Data Structures Grids",
+        "implemented",
+        "src.conversion.gml_runtime_parts.segments.59_ds_grids",
+        "yes",
+        "yes",
+        "yes",
+        "no",
+        "GameMaker_Language/GML_Reference/Data_Structures/DS_Grids/DS_Grids.htm",
+        "Extracts a rectangular region as a new handle-backed DS grid.",
+    ),
+    _entry(
+        "ds_grid_clear_region",
+        "Data Structures Grids",
+        "implemented",
+        "src.conversion.gml_runtime_parts.segments.59_ds_grids",
+        "yes",
+        "yes",
+        "yes",
+        "no",
+        "GameMaker_Language/GML_Reference/Data_Structures/DS_Grids/DS_Grids.htm",
+        "Clears a rectangular region to a specified value.",
+    ),
+    _entry(
+        "ds_grid_add_region",
+        "Data Structures Grids",
+        "implemented",
+        "src.conversion.gml_runtime_parts.segments.59_ds_grids",
+        "yes",
+        "yes",
+        "yes",
+        "no",
+        "GameMaker_Language/GML_Reference/Data_Structures/DS_Grids/DS_Grids.htm",
+        "Adds a value to all cells in a rectangular region.",
+    ),
+    _entry(
+        "ds_grid_multiply_region",
+        "Data Structures Grids",
+        "implemented",
+        "src.conversion.gml_runtime_parts.segments.59_ds_grids",
+        "yes",
+        "yes",
+        "yes",
+        "no",
+        "GameMaker_Language/GML_Reference/Data_Structures/DS_Grids/DS_Grids.htm",
+        "Multiplies all cells in a rectangular region by a value.",
+    ),
+    _entry(
+        "ds_grid_value_exists",
+        "Data Structures Grids",
+        "implemented",
+        "src.conversion.gml_runtime_parts.segments.59_ds_grids",
+        "yes",
+        "yes",
+        "yes",
+        "no",
+        "GameMaker_Language/GML_Reference/Data_Structures/DS_Grids/DS_Grids.htm",
+        "Returns true if a specific value exists within a rectangular region.",
+    ),
+    _entry(
+        "ds_grid_value_x",
+        "Data Structures Grids",
+        "implemented",
+        "src.conversion.gml_runtime_parts.segments.59_ds_grids",
+        "yes",
+        "yes",
+        "yes",
+        "no",
+        "GameMaker_Language/GML_Reference/Data_Structures/DS_Grids/DS_Grids.htm",
+        "Returns the x-coordinate of the first occurrence of a value in a region.",
+    ),
+    _entry(
+        "ds_grid_value_y",
+        "Data Structures Grids",
+        "implemented",
+        "src.conversion.gml_runtime_parts.segments.59_ds_grids",
+        "yes",
+        "yes",
+        "yes",
+        "no",
+        "GameMaker_Language/GML_Reference/Data_Structures/DS_Grids/DS_Grids.htm",
+        "Returns the y-coordinate of the first occurrence of a value in a region.",
+    ),
+    _entry(
+        "ds_grid_copy",
+        "Data Structures Grids",
+        "implemented",
+        "src.conversion.gml_runtime_parts.segments.59_ds_grids",
+        "yes",
+        "yes",
+        "yes",
+        "no",
+        "GameMaker_Language/GML_Reference/Data_Structures/DS_Grids/DS_Grids.htm",
+        "Copies data from source to destination handle-backed DS grid.",
+    ),
+    _entry(
+        "ds_grid_read",
+        "Data Structures Grids",
+        "partial",
+        "src.conversion.gml_runtime_parts.segments.59_ds_grids",
+        "yes",
+        "yes",
+        "yes",
+        "yes",
+        "GameMaker_Language/GML_Reference/Data_Structures/DS_Grids/DS_Grids.htm",
+        "Round-trips GM2Godot canonical JSON-backed DS snapshots; legacy GameMaker dump strings are not parsed.",
+    ),
+    _entry(
+        "ds_grid_write",
+        "Data Structures Grids",
+        "partial",
+        "src.conversion.gml_runtime_parts.segments.59_ds_grids",
+        "yes",
+        "yes",
+        "yes",
+        "yes",
+        "GameMaker_Language/GML_Reference/Data_Structures/DS_Grids/DS_Grids.htm",
+        "Emits GM2Godot canonical JSON-backed DS snapshots for later ds_grid_read; not byte-compatible with GameMaker dumps.",
+    ),
+    _entry(
+        "array_accessor",
+        "Accessors",
+        "implemented",
+        "src.conversion.gml_transpiler_parts.expression_parser",
+        "yes",
+        "yes",
+        "partial",
+        "no",
+        "GameMaker_Language/GML_Overview/Accessors.htm",
+        "Normal array indexing lowers through GMRuntime array get/set helpers.",
+    ),
+    _entry(
+        "ds_list_accessor",
+        "Accessors",
+        "implemented",
+        "src.conversion.gml_transpiler_parts",
+        "n/a",
+        "yes",
+        "yes",
+        "yes",
+        "GameMaker_Language/GML_Overview/Accessors.htm",
+        "The [|] accessor is parsed and lowered to ds_list runtime helpers.",
+    ),
+    _entry(
+        "ds_grid_accessor",
+        "Accessors",
+        "implemented",
+        "src.conversion.gml_transpiler_parts.expression_parser",
+        "yes",
+        "yes",
+        "yes",
+        "no",
+        "GameMaker_Language/GML_Overview/Accessors.htm",
+        "The [#] accessor is parsed, emitted, and lowered to ds_grid runtime helpers.",
+    ),
+    _entry(
+        "array_reference_accessor",
+        "Accessors",
+        "implemented",
+        "src.conversion.gml_transpiler_parts.expression_parser",
+        "yes",
+        "yes",
+        "yes",
+        "no",
+        "GameMaker_Language/GML_Overview/Accessors.htm",
+        "The [@] accessor is parsed and lowered to array get/set helpers.",
+    ),
+    _entry(
+        "ds_map_accessor",
+        "Accessors",
+        "implemented",
+        "src.conversion.gml_transpiler_parts.expression_parser",
+        "yes",
+        "yes",
+        "yes",
+        "no",
+        "GameMaker_Language/GML_Overview/Accessors.htm",
+        "The [?] accessor is parsed and lowered to ds_map runtime helpers.",
+    ),
+    _entry(
+        "struct_accessor",
+        "Accessors",
+        "implemented",
+        "src.conversion.gml_transpiler_parts.expression_parser",
+        "yes",
+        "yes",
+        "yes",
+        "no",
+        "GameMaker_Language/GML_Overview/Accessors.htm",
+        "The [$] accessor is parsed and lowered to struct get/set helpers.",
+    ),
+    _entry(
+        "array_push",
+        "Arrays",
+        "implemented",
+        "src.conversion.gml_runtime_parts.segments.40_arrays_structs_variables",
+        "n/a",
+        "yes",
+        "yes",
+        "no",
+        "GameMaker_Language/GML_Reference/Array_Functions/Array_Functions.htm",
+        "Implemented as a runtime helper with GML mutation behavior.",
+    ),
+    _entry(
+        "array_create",
+        "Arrays",
+        "implemented",
+        "src.conversion.gml_runtime_parts.segments.40_arrays_structs_variables",
+        "n/a",
+        "yes",
+        "yes",
+        "no",
+        "GameMaker_Language/GML_Reference/Array_Functions/Array_Functions.htm",
+        "Implemented with optional default value and GML index coercion.",
+    ),
+    _entry(
+        "array_length_1d",
+        "Arrays",
+        "implemented",
+        "src.conversion.gml_runtime_parts.segments.40_arrays_structs_variables",
+        "n/a",
+        "yes",
+        "yes",
+        "no",
+        "GameMaker_Language/GML_Reference/Array_Functions/Array_Functions.htm",
+        "Returns size of 1D array via GDScript .size().",
+    ),
+    _entry(
+        "array_length",
+        "Arrays",
+        "implemented",
+        "src.conversion.gml_runtime_parts.segments.40_arrays_structs_variables",
+        "n/a",
+        "yes",
+        "yes",
+        "no",
+        "GameMaker_Language/GML_Reference/Variable_Functions/array_length.htm",
+        "Returns the current array dimension size and zero for non-array values.",
+    ),
+    _entry(
+        "array_resize",
+        "Arrays",
+        "implemented",
+        "src.conversion.gml_runtime_parts.segments.40_arrays_structs_variables",
+        "n/a",
+        "yes",
+        "yes",
+        "no",
+        "GameMaker_Language/GML_Reference/Array_Functions/Array_Functions.htm",
+        "Resizes array via GDScript .resize().",
+    ),
+    _entry(
+        "array_pop",
+        "Arrays",
+        "implemented",
+        "src.conversion.gml_runtime_parts.segments.40_arrays_structs_variables",
+        "n/a",
+        "yes",
+        "yes",
+        "no",
+        "GameMaker_Language/GML_Reference/Array_Functions/Array_Functions.htm",
+        "Removes and returns the last element via .pop_back().",
+    ),
+    _entry(
+        "array_push_back",
+        "Arrays",
+        "implemented",
+        "src.conversion.gml_runtime_parts.segments.40_arrays_structs_variables",
+        "n/a",
+        "yes",
+        "yes",
+        "no",
+        "GameMaker_Language/GML_Reference/Array_Functions/Array_Functions.htm",
+        "Alias for array_push with a single value.",
+    ),
+    _entry(
+        "array_insert",
+        "Arrays",
+        "implemented",
+        "src.conversion.gml_runtime_parts.segments.40_arrays_structs_variables",
+        "n/a",
+        "yes",
+        "yes",
+        "no",
+        "GameMaker_Language/GML_Reference/Array_Functions/Array_Functions.htm",
+        "Inserts value at index via GDScript .insert().",
+    ),
+    _entry(
+        "array_delete",
+        "Arrays",
+        "implemented",
+        "src.conversion.gml_runtime_parts.segments.40_arrays_structs_variables",
+        "n/a",
+        "yes",
+        "yes",
+        "no",
+        "GameMaker_Language/GML_Reference/Array_Functions/Array_Functions.htm",
+        "Removes element at index via GDScript .remove_at().",
+    ),
+    _entry(
+        "array_sort",
+        "Arrays",
+        "implemented",
+        "src.conversion.gml_runtime_parts.segments.40_arrays_structs_variables",
+        "n/a",
+        "yes",
+        "yes",
+        "yes",
+        "GameMaker_Language/GML_Reference/Variable_Functions/array_sort.htm",
+        "Mutates in place for Boolean direction or a three-way method comparator and returns undefined.",
+    ),
+    _entry(
+        "array_shuffle",
+        "Arrays",
+        "implemented",
+        "src.conversion.gml_runtime_parts.segments.40_arrays_structs_variables",
+        "n/a",
+        "yes",
+        "yes",
+        "no",
+        "GameMaker_Language/GML_Reference/Array_Functions/Array_Functions.htm",
+        "Shuffles array in-place via GDScript .shuffle().",
+    ),
+    _entry(
+        "array_copy",
+        "Arrays",
+        "implemented",
+        "src.conversion.gml_runtime_parts.segments.40_arrays_structs_variables",
+        "n/a",
+        "yes",
+        "yes",
+        "no",
+        "GameMaker_Language/GML_Reference/Array_Functions/Array_Functions.htm",
+        "Copies a portion of an array with GML index semantics.",
+    ),
+    _entry(
+        "array_concat",
+        "Arrays",
+        "implemented",
+        "src.conversion.gml_runtime_parts.segments.40_arrays_structs_variables",
+        "n/a",
+        "yes",
+        "yes",
+        "no",
+        "GameMaker_Language/GML_Reference/Array_Functions/Array_Functions.htm",
+        "Concatenates two arrays into a new array.",
+    ),
+    _entry(
+        "array_contains",
+        "Arrays",
+        "implemented",
+        "src.conversion.gml_runtime_parts.segments.40_arrays_structs_variables",
+        "n/a",
+        "yes",
+        "yes",
+        "no",
+        "GameMaker_Language/GML_Reference/Array_Functions/Array_Functions.htm",
+        "Checks if array contains a value via GDScript .has().",
+    ),
+    _entry(
+        "array_find_index",
+        "Arrays",
+        "implemented",
+        "src.conversion.gml_runtime_parts.segments.40_arrays_structs_variables",
+        "n/a",
+        "yes",
+        "yes",
+        "no",
+        "GameMaker_Language/GML_Reference/Array_Functions/Array_Functions.htm",
+        "Returns index of value or -1 via GDScript .find().",
+    ),
+    _entry(
+        "array_foreach",
+        "Arrays",
+        "implemented",
+        "src.conversion.gml_runtime_parts.segments.40_arrays_structs_variables",
+        "n/a",
+        "yes",
+        "yes",
+        "yes",
+        "GameMaker_Language/GML_Reference/Variable_Functions/array_foreach.htm",
+        "Runs a bound callback with (element, index) over the requested forward or reverse range and returns undefined.",
+    ),
+    _entry(
+        "array_map",
+        "Arrays",
+        "implemented",
+        "src.conversion.gml_runtime_parts.segments.40_arrays_structs_variables",
+        "n/a",
+        "yes",
+        "yes",
+        "no",
+        "GameMaker_Language/GML_Reference/Array_Functions/Array_Functions.htm",
+        "Maps elements through GML method callback (element, index, array).",
+    ),
+    _entry(
+        "array_filter",
+        "Arrays",
+        "implemented",
+        "src.conversion.gml_runtime_parts.segments.40_arrays_structs_variables",
+        "n/a",
+        "yes",
+        "yes",
+        "no",
+        "GameMaker_Language/GML_Reference/Array_Functions/Array_Functions.htm",
+        "Filters elements through GML method callback (element, index, array).",
+    ),
+    _entry(
+        "array_reduce",
+        "Arrays",
+        "implemented",
+        "src.conversion.gml_runtime_parts.segments.40_arrays_structs_variables",
+        "n/a",
+        "yes",
+        "yes",
+        "no",
+        "GameMaker_Language/GML_Reference/Array_Functions/Array_Functions.htm",
+        "Reduces array through GML method callback (accumulator, element, index, array).",
+    ),
+    _entry(
+        "string",
+        "Strings",
+        "implemented",
+        "src.conversion.gml_runtime_parts.segments.50_static_types_and_clone",
+        "n/a",
+        "yes",
+        "yes",
+        "no",
+        "GameMaker_Language/GML_Reference/Strings/Strings.htm",
+        "Basic GML string conversion exists.",
+    ),
+    _entry(
+        "string_length",
+        "Strings",
+        "implemented",
+        "src.conversion.gml_runtime_parts.segments.70_handle_string_helpers",
+        "n/a",
+        "yes",
+        "yes",
+        "no",
+        "GameMaker_Language/GML_Reference/Strings/Strings.htm",
+        "Returns character count via GDScript .length().",
+    ),
+    _entry(
+        "string_byte_length",
+        "Strings",
+        "implemented",
+        "src.conversion.gml_runtime_parts.segments.70_handle_string_helpers",
+        "n/a",
+        "yes",
+        "yes",
+        "no",
+        "GameMaker_Language/GML_Reference/Strings/string_byte_length.htm",
+        "Returns the UTF-8 encoded byte count.",
+    ),
+    _entry(
+        "string_char_at",
+        "Strings",
+        "implemented",
+        "src.conversion.gml_runtime_parts.segments.70_handle_string_helpers",
+        "n/a",
+        "yes",
+        "yes",
+        "no",
+        "GameMaker_Language/GML_Reference/Strings/Strings.htm",
+        "One-based index returns character or empty string.",
+    ),
+    _entry(
+        "string_ord_at",
+        "Strings",
+        "implemented",
+        "src.conversion.gml_runtime_parts.segments.70_handle_string_helpers",
+        "n/a",
+        "yes",
+        "yes",
+        "no",
+        "GameMaker_Language/GML_Reference/Strings/Strings.htm",
+        "One-based index returns Unicode codepoint via .unicode_at().",
+    ),
+    _entry(
+        "string_copy",
+        "Strings",
+        "implemented",
+        "src.conversion.gml_runtime_parts.segments.70_handle_string_helpers",
+        "n/a",
+        "yes",
+        "yes",
+        "no",
+        "GameMaker_Language/GML_Reference/Strings/Strings.htm",
+        "Copies substring with one-based index and one-based count.",
+    ),
+    _entry(
+        "string_pos",
+        "Strings",
+        "implemented",
+        "src.conversion.gml_runtime_parts.segments.70_handle_string_helpers",
+        "n/a",
+        "yes",
+        "yes",
+        "no",
+        "GameMaker_Language/GML_Reference/Strings/Strings.htm",
+        "Returns one-based position of substring or 0 if not found.",
+    ),
+    _entry(
+        "string_replace",
+        "Strings",
+        "implemented",
+        "src.conversion.gml_runtime_parts.segments.70_handle_string_helpers",
+        "n/a",
+        "yes",
+        "yes",
+        "no",
+        "GameMaker_Language/GML_Reference/Strings/Strings.htm",
+        "Replaces first occurrence of substring.",
+    ),
+    _entry(
+        "string_replace_all",
+        "Strings",
+        "implemented",
+        "src.conversion.gml_runtime_parts.segments.70_handle_string_helpers",
+        "n/a",
+        "yes",
+        "yes",
+        "no",
+        "GameMaker_Language/GML_Reference/Strings/Strings.htm",
+        "Replaces all occurrences of substring.",
+    ),
+    _entry(
+        "string_delete",
+        "Strings",
+        "implemented",
+        "src.conversion.gml_runtime_parts.segments.70_handle_string_helpers",
+        "n/a",
+        "yes",
+        "yes",
+        "no",
+        "GameMaker_Language/GML_Reference/Strings/Strings.htm",
+        "Deletes substring with one-based index and count.",
+    ),
+    _entry(
+        "string_insert",
+        "Strings",
+        "implemented",
+        "src.conversion.gml_runtime_parts.segments.70_handle_string_helpers",
+        "n/a",
+        "yes",
+        "yes",
+        "no",
+        "GameMaker_Language/GML_Reference/Strings/Strings.htm",
+        "Inserts substring at one-based index.",
+    ),
+    _entry(
+        "string_lower",
+        "Strings",
+        "implemented",
+        "src.conversion.gml_runtime_parts.segments.70_handle_string_helpers",
+        "n/a",
+        "yes",
+        "yes",
+        "no",
+        "GameMaker_Language/GML_Reference/Strings/Strings.htm",
+        "Converts to lowercase via GDScript .to_lower().",
+    ),
+    _entry(
+        "string_upper",
+        "Strings",
+        "implemented",
+        "src.conversion.gml_runtime_parts.segments.70_handle_string_helpers",
+        "n/a",
+        "yes",
+        "yes",
+        "no",
+        "GameMaker_Language/GML_Reference/Strings/Strings.htm",
+        "Converts to uppercase via GDScript .to_upper().",
+    ),
+    _entry(
+        "string_trim",
+        "Strings",
+        "implemented",
+        "src.conversion.gml_runtime_parts.segments.70_handle_string_helpers",
+        "n/a",
+        "yes",
+        "yes",
+        "no",
+        "GameMaker_Language/GML_Reference/Strings/Strings.htm",
+        "Strips leading and trailing whitespace via .strip_edges().",
+    ),
+    _entry(
+        "string_repeat",
+        "Strings",
+        "implemented",
+        "src.conversion.gml_runtime_parts.segments.70_handle_string_helpers",
+        "n/a",
+        "yes",
+        "yes",
+        "no",
+        "GameMaker_Language/GML_Reference/Strings/Strings.htm",
+        "Repeats string a given number of times.",
+    ),
+    _entry(
+        "string_digits",
+        "Strings",
+        "implemented",
+        "src.conversion.gml_runtime_parts.segments.70_handle_string_helpers",
+        "n/a",
+        "yes",
+        "yes",
+        "no",
+        "GameMaker_Language/GML_Reference/Strings/Strings.htm",
+        "Extracts only digit characters from the string.",
+    ),
+    _entry(
+        "string_letters",
+        "Strings",
+        "implemented",
+        "src.conversion.gml_runtime_parts.segments.70_handle_string_helpers",
+        "n/a",
+        "yes",
+        "yes",
+        "no",
+        "GameMaker_Language/GML_Reference/Strings/Strings.htm",
+        "Extracts only letter characters from the string.",
+    ),
+    _entry(
+        "string_lettersdigits",
+        "Strings",
+        "implemented",
+        "src.conversion.gml_runtime_parts.segments.70_handle_string_helpers",
+        "n/a",
+        "yes",
+        "yes",
+        "no",
+        "GameMaker_Language/GML_Reference/Strings/Strings.htm",
+        "Extracts only letter and digit characters from the string.",
+    ),
+    _entry(
+        "string_split",
+        "Strings",
+        "implemented",
+        "src.conversion.gml_runtime_parts.segments.70_handle_string_helpers",
+        "n/a",
+        "yes",
+        "yes",
+        "no",
+        "GameMaker_Language/GML_Reference/Strings/Strings.htm",
+        "Splits string on delimiter into an array.",
+    ),
+    _entry(
+        "string_join",
+        "Strings",
+        "implemented",
+        "src.conversion.gml_runtime_parts.segments.70_handle_string_helpers",
+        "n/a",
+        "yes",
+        "yes",
+        "no",
+        "GameMaker_Language/GML_Reference/Strings/Strings.htm",
+        "Joins array elements with delimiter into a string.",
+    ),
+    _entry(
+        "chr",
+        "Strings",
+        "implemented",
+        "src.conversion.gml_runtime_parts.segments.70_handle_string_helpers",
+        "n/a",
+        "yes",
+        "yes",
+        "no",
+        "GameMaker_Language/GML_Reference/Strings/Strings.htm",
+        "Returns character from Unicode codepoint via GDScript char().",
+    ),
+    _entry(
+        "ord",
+        "Strings",
+        "implemented",
+        "src.conversion.gml_runtime_parts.segments.70_handle_string_helpers",
+        "n/a",
+        "yes",
+        "yes",
+        "no",
+        "GameMaker_Language/GML_Reference/Strings/Strings.htm",
+        "Returns Unicode codepoint of first character via .unicode_at().",
+    ),
+    _entry(
+        "ansi_char",
+        "Strings",
+        "implemented",
+        "src.conversion.gml_runtime_parts.segments.70_handle_string_helpers",
+        "n/a",
+        "yes",
+        "yes",
+        "no",
+        "GameMaker_Language/GML_Reference/Strings/Strings.htm",
+        "Returns character from ANSI codepoint (0-255).",
+    ),
+    _entry(
+        "sqrt",
+        "Maths and Numbers",
+        "implemented",
+        "src.conversion.gml_runtime_parts.segments.30_numeric_arithmetic",
+        "n/a",
+        "yes",
+        "yes",
+        "no",
+        "GameMaker_Language/GML_Reference/Maths_And_Numbers/Maths_And_Numbers.htm",
+        "Implemented through runtime numeric helper to preserve NaN behavior.",
+    ),
+    _entry(
+        "abs",
+        "Maths and Numbers",
+        "implemented",
+        "src.conversion.gml_runtime_parts.segments.35_maths_numbers",
+        "n/a",
+        "yes",
+        "yes",
+        "no",
+        "GameMaker_Language/GML_Reference/Maths_And_Numbers/Maths_And_Numbers.htm",
+        "Numeric helper lowered through GMRuntime to preserve GML conversions.",
+    ),
+    _entry(
+        "sign",
+        "Maths and Numbers",
+        "implemented",
+        "src.conversion.gml_runtime_parts.segments.35_maths_numbers",
+        "n/a",
+        "yes",
+        "yes",
+        "no",
+        "GameMaker_Language/GML_Reference/Maths_And_Numbers/Maths_And_Numbers.htm",
+        "Returns -1, 0, or 1 from runtime numeric conversion.",
+    ),
+    _entry(
+        "floor",
+        "Maths and Numbers",
+        "implemented",
+        "src.conversion.gml_runtime_parts.segments.35_maths_numbers",
+        "n/a",
+        "yes",
+        "yes",
+        "no",
+        "GameMaker_Language/GML_Reference/Maths_And_Numbers/Maths_And_Numbers.htm",
+        "Runtime wrapper around floor with GML numeric conversion.",
+    ),
+    _entry(
+        "ceil",
+        "Maths and Numbers",
+        "implemented",
+        "src.conversion.gml_runtime_parts.segments.35_maths_numbers",
+        "n/a",
+        "yes",
+        "yes",
+        "no",
+        "GameMaker_Language/GML_Reference/Maths_And_Numbers/Maths_And_Numbers.htm",
+        "Runtime wrapper around ceil with GML numeric conversion.",
+    ),
+    _entry(
+        "round",
+        "Maths and Numbers",
+        "implemented",
+        "src.conversion.gml_runtime_parts.segments.35_maths_numbers",
+        "n/a",
+        "yes",
+        "yes",
+        "no",
+        "GameMaker_Language/GML_Reference/Maths_And_Numbers/Maths_And_Numbers.htm",
+        "Runtime wrapper around round with GML numeric conversion.",
+    ),
+    _entry(
+        "frac",
+        "Maths and Numbers",
+        "implemented",
+        "src.conversion.gml_runtime_parts.segments.35_maths_numbers",
+        "n/a",
+        "yes",
+        "yes",
+        "no",
+        "GameMaker_Language/GML_Reference/Maths_And_Numbers/Maths_And_Numbers.htm",
+        "Returns the fractional portion after GML numeric conversion.",
+    ),
+    _entry(
+        "sqr",
+        "Maths and Numbers",
+        "implemented",
+        "src.conversion.gml_runtime_parts.segments.35_maths_numbers",
+        "n/a",
+        "yes",
+        "yes",
+        "no",
+        "GameMaker_Language/GML_Reference/Maths_And_Numbers/Maths_And_Numbers.htm",
+        "Squares numeric values through the compatibility runtime.",
+    ),
+    _entry(
+        "power",
+        "Maths and Numbers",
+        "implemented",
+        "src.conversion.gml_runtime_parts.segments.35_maths_numbers",
+        "n/a",
+        "yes",
+        "yes",
+        "no",
+        "GameMaker_Language/GML_Reference/Maths_And_Numbers/Maths_And_Numbers.htm",
+        "Wraps Godot pow with GML numeric conversion.",
+    ),
+    _entry(
+        "exp",
+        "Maths and Numbers",
+        "implemented",
+        "src.conversion.gml_runtime_parts.segments.35_maths_numbers",
+        "n/a",
+        "yes",
+        "yes",
+        "no",
+        "GameMaker_Language/GML_Reference/Maths_And_Numbers/Maths_And_Numbers.htm",
+        "Exponential helper exposed through GMRuntime.",
+    ),
+    _entry(
+        "ln",
+        "Maths and Numbers",
+        "implemented",
+        "src.conversion.gml_runtime_parts.segments.35_maths_numbers",
+        "n/a",
+        "yes",
+        "yes",
+        "no",
+        "GameMaker_Language/GML_Reference/Maths_And_Numbers/Maths_And_Numbers.htm",
+        "Natural logarithm helper exposed through GMRuntime.",
+    ),
+    _entry(
+        "log2",
+        "Maths and Numbers",
+        "implemented",
+        "src.conversion.gml_runtime_parts.segments.35_maths_numbers",
+        "n/a",
+        "yes",
+        "yes",
+        "no",
+        "GameMaker_Language/GML_Reference/Maths_And_Numbers/Maths_And_Numbers.htm",
+        "Base-2 logarithm helper exposed through GMRuntime.",
+    ),
+    _entry(
+        "log10",
+        "Maths and Numbers",
+        "implemented",
+        "src.conversion.gml_runtime_parts.segments.35_maths_numbers",
+        "n/a",
+        "yes",
+        "yes",
+        "no",
+        "GameMaker_Language/GML_Reference/Maths_And_Numbers/Maths_And_Numbers.htm",
+        "Base-10 logarithm helper exposed through GMRuntime.",
+    ),
+    _entry(
+        "clamp",
+        "Maths and Numbers",
+        "implemented",
+        "src.conversion.gml_runtime_parts.segments.35_maths_numbers",
+        "n/a",
+        "yes",
+        "yes",
+        "no",
+        "GameMaker_Language/GML_Reference/Maths_And_Numbers/Maths_And_Numbers.htm",
+        "Clamps numeric values after resolving the bound order.",
+    ),
+    _entry(
+        "lerp",
+        "Maths and Numbers",
+        "implemented",
+        "src.conversion.gml_runtime_parts.segments.35_maths_numbers",
+        "n/a",
+        "yes",
+        "yes",
+        "no",
+        "GameMaker_Language/GML_Reference/Maths_And_Numbers/Maths_And_Numbers.htm",
+        "Linear interpolation helper with GML numeric conversion.",
+    ),
+    _entry(
+        "min",
+        "Maths and Numbers",
+        "implemented",
+        "src.conversion.gml_runtime_parts.segments.35_maths_numbers",
+        "n/a",
+        "yes",
+        "yes",
+        "no",
+        "GameMaker_Language/GML_Reference/Maths_And_Numbers/Maths_And_Numbers.htm",
+        "Variadic numeric minimum helper.",
+    ),
+    _entry(
+        "max",
+        "Maths and Numbers",
+        "implemented",
+        "src.conversion.gml_runtime_parts.segments.35_maths_numbers",
+        "n/a",
+        "yes",
+        "yes",
+        "no",
+        "GameMaker_Language/GML_Reference/Maths_And_Numbers/Maths_And_Numbers.htm",
+        "Variadic numeric maximum helper.",
+    ),
+    _entry(
+        "sin",
+        "Maths and Numbers",
+        "implemented",
+        "src.conversion.gml_runtime_parts.segments.35_maths_numbers",
+        "n/a",
+        "yes",
+        "yes",
+        "no",
+        "GameMaker_Language/GML_Reference/Maths_And_Numbers/Maths_And_Numbers.htm",
+        "Radian trigonometry helper.",
+    ),
+    _entry(
+        "cos",
+        "Maths and Numbers",
+        "implemented",
+        "src.conversion.gml_runtime_parts.segments.35_maths_numbers",
+        "n/a",
+        "yes",
+        "yes",
+        "no",
+        "GameMaker_Language/GML_Reference/Maths_And_Numbers/Maths_And_Numbers.htm",
+        "Radian trigonometry helper.",
+    ),
+    _entry(
+        "tan",
+        "Maths and Numbers",
+        "implemented",
+        "src.conversion.gml_runtime_parts.segments.35_maths_numbers",
+        "n/a",
+        "yes",
+        "yes",
+        "no",
+        "GameMaker_Language/GML_Reference/Maths_And_Numbers/Maths_And_Numbers.htm",
+        "Radian trigonometry helper.",
+    ),
+    _entry(
+        "arcsin",
+        "Maths and Numbers",
+        "implemented",
+        "src.conversion.gml_runtime_parts.segments.35_maths_numbers",
+        "n/a",
+        "yes",
+        "yes",
+        "no",
+        "GameMaker_Language/GML_Reference/Maths_And_Numbers/Maths_And_Numbers.htm",
+        "Inverse sine returning radians.",
+    ),
+    _entry(
+        "arccos",
+        "Maths and Numbers",
+        "implemented",
+        "src.conversion.gml_runtime_parts.segments.35_maths_numbers",
+        "n/a",
+        "yes",
+        "yes",
+        "no",
+        "GameMaker_Language/GML_Reference/Maths_And_Numbers/Maths_And_Numbers.htm",
+        "Inverse cosine returning radians.",
+    ),
+    _entry(
+        "arctan",
+        "Maths and Numbers",
+        "implemented",
+        "src.conversion.gml_runtime_parts.segments.35_maths_numbers",
+        "n/a",
+        "yes",
+        "yes",
+        "no",
+        "GameMaker_Language/GML_Reference/Maths_And_Numbers/Maths_And_Numbers.htm",
+        "Inverse tangent returning radians.",
+    ),
+    _entry(
+        "arctan2",
+        "Maths and Numbers",
+        "implemented",
+        "src.conversion.gml_runtime_parts.segments.35_maths_numbers",
+        "n/a",
+        "yes",
+        "yes",
+        "no",
+        "GameMaker_Language/GML_Reference/Maths_And_Numbers/Maths_And_Numbers.htm",
+        "Two-argument inverse tangent returning radians.",
+    ),
+    _entry(
+        "dsin",
+        "Maths and Numbers",
+        "implemented",
+        "src.conversion.gml_runtime_parts.segments.35_maths_numbers",
+        "n/a",
+        "yes",
+        "yes",
+        "no",
+        "GameMaker_Language/GML_Reference/Maths_And_Numbers/Maths_And_Numbers.htm",
+        "Degree-based sine helper.",
+    ),
+    _entry(
+        "dcos",
+        "Maths and Numbers",
+        "implemented",
+        "src.conversion.gml_runtime_parts.segments.35_maths_numbers",
+        "n/a",
+        "yes",
+        "yes",
+        "no",
+        "GameMaker_Language/GML_Reference/Maths_And_Numbers/Maths_And_Numbers.htm",
+        "Degree-based cosine helper.",
+    ),
+    _entry(
+        "dtan",
+        "Maths and Numbers",
+        "implemented",
+        "src.conversion.gml_runtime_parts.segments.35_maths_numbers",
+        "n/a",
+        "yes",
+        "yes",
+        "no",
+        "GameMaker_Language/GML_Reference/Maths_And_Numbers/Maths_And_Numbers.htm",
+        "Degree-based tangent helper.",
+    ),
+    _entry(
+        "darcsin",
+        "Maths and Numbers",
+        "implemented",
+        "src.conversion.gml_runtime_parts.segments.35_maths_numbers",
+        "n/a",
+        "yes",
+        "yes",
+        "no",
+        "GameMaker_Language/GML_Reference/Maths_And_Numbers/Maths_And_Numbers.htm",
+        "Inverse sine returning degrees.",
+    ),
+    _entry(
+        "darccos",
+        "Maths and Numbers",
+        "implemented",
+        "src.conversion.gml_runtime_parts.segments.35_maths_numbers",
+        "n/a",
+        "yes",
+        "yes",
+        "no",
+        "GameMaker_Language/GML_Reference/Maths_And_Numbers/Maths_And_Numbers.htm",
+        "Inverse cosine returning degrees.",
+    ),
+    _entry(
+        "darctan",
+        "Maths and Numbers",
+        "implemented",
+        "src.conversion.gml_runtime_parts.segments.35_maths_numbers",
+        "n/a",
+        "yes",
+        "yes",
+        "no",
+        "GameMaker_Language/GML_Reference/Maths_And_Numbers/Maths_And_Numbers.htm",
+        "Inverse tangent returning degrees.",
+    ),
+    _entry(
+        "darctan2",
+        "Maths and Numbers",
+        "implemented",
+        "src.conversion.gml_runtime_parts.segments.35_maths_numbers",
+        "n/a",
+        "yes",
+        "yes",
+        "no",
+        "GameMaker_Language/GML_Reference/Maths_And_Numbers/Maths_And_Numbers.htm",
+        "Two-argument inverse tangent returning degrees.",
+    ),
+    _entry(
+        "degtorad",
+        "Maths and Numbers",
+        "implemented",
+        "src.conversion.gml_runtime_parts.segments.35_maths_numbers",
+        "n/a",
+        "yes",
+        "yes",
+        "no",
+        "GameMaker_Language/GML_Reference/Maths_And_Numbers/Maths_And_Numbers.htm",
+        "Converts degrees to radians through GMRuntime.",
+    ),
+    _entry(
+        "radtodeg",
+        "Maths and Numbers",
+        "implemented",
+        "src.conversion.gml_runtime_parts.segments.35_maths_numbers",
+        "n/a",
+        "yes",
+        "yes",
+        "no",
+        "GameMaker_Language/GML_Reference/Maths_And_Numbers/Maths_And_Numbers.htm",
+        "Converts radians to degrees through GMRuntime.",
+    ),
+    _entry(
+        "point_distance",
+        "Maths and Numbers",
+        "implemented",
+        "src.conversion.gml_runtime_parts.segments.35_maths_numbers",
+        "n/a",
+        "yes",
+        "yes",
+        "yes",
+        "GameMaker_Language/GML_Reference/Maths_And_Numbers/Maths_And_Numbers.htm",
+        "Distance helper using GameMaker coordinate values.",
+    ),
+    _entry(
+        "make_color_rgb",
+        "Maths and Numbers",
+        "implemented",
+        "src.conversion.gml_runtime_parts.segments.35_maths_numbers",
+        "n/a",
+        "yes",
+        "yes",
+        "yes",
+        "GameMaker_Language/GML_Reference/Maths_And_Numbers/Maths_And_Numbers.htm",
+        "Packs 8-bit RGB channels into GameMaker's integer colour layout.",
+    ),
+    _entry(
+        "matrix_build_lookat",
+        "Maths and Numbers",
+        "partial",
+        "src.conversion.gml_runtime_parts.segments.35_maths_numbers",
+        "n/a",
+        "yes",
+        "partial",
+        "yes",
+        "GameMaker_Language/GML_Reference/Maths_And_Numbers/Matrix_Functions/Matrix_Functions.htm",
+        "Builds a 16-value look-at matrix for camera/shader APIs; low-level renderer parity remains approximate.",
+    ),
+    _entry(
+        "matrix_build_projection_ortho",
+        "Maths and Numbers",
+        "partial",
+        "src.conversion.gml_runtime_parts.segments.35_maths_numbers",
+        "n/a",
+        "yes",
+        "partial",
+        "yes",
+        "GameMaker_Language/GML_Reference/Maths_And_Numbers/Matrix_Functions/Matrix_Functions.htm",
+        "Builds a 16-value orthographic projection matrix for camera/shader APIs.",
+    ),
+    _entry(
+        "point_direction",
+        "Maths and Numbers",
+        "implemented",
+        "src.conversion.gml_runtime_parts.segments.35_maths_numbers",
+        "n/a",
+        "yes",
+        "yes",
+        "yes",
+        "GameMaker_Language/GML_Reference/Maths_And_Numbers/Maths_And_Numbers.htm",
+        "Preserves GameMaker degree direction convention over Godot coordinates.",
+    ),
+    _entry(
+        "lengthdir_x",
+        "Maths and Numbers",
+        "implemented",
+        "src.conversion.gml_runtime_parts.segments.35_maths_numbers",
+        "n/a",
+        "yes",
+        "yes",
+        "yes",
+        "GameMaker_Language/GML_Reference/Maths_And_Numbers/Maths_And_Numbers.htm",
+        "Converts GameMaker degree direction to X displacement.",
+    ),
+    _entry(
+        "lengthdir_y",
+        "Maths and Numbers",
+        "implemented",
+        "src.conversion.gml_runtime_parts.segments.35_maths_numbers",
+        "n/a",
+        "yes",
+        "yes",
+        "yes",
+        "GameMaker_Language/GML_Reference/Maths_And_Numbers/Maths_And_Numbers.htm",
+        "Converts GameMaker degree direction to Y displacement with downward screen coordinates.",
+    ),
+    _entry(
+        "angle_difference",
+        "Maths and Numbers",
+        "implemented",
+        "src.conversion.gml_runtime_parts.segments.35_maths_numbers",
+        "n/a",
+        "yes",
+        "yes",
+        "yes",
+        "GameMaker_Language/GML_Reference/Maths_And_Numbers/Maths_And_Numbers.htm",
+        "Normalizes angle differences to the GameMaker -180..180 range.",
+    ),
+    _entry(
+        "dot_product",
+        "Maths and Numbers",
+        "implemented",
+        "src.conversion.gml_runtime_parts.segments.35_maths_numbers",
+        "n/a",
+        "yes",
+        "yes",
+        "no",
+        "GameMaker_Language/GML_Reference/Maths_And_Numbers/Maths_And_Numbers.htm",
+        "2D vector dot product helper.",
+    ),
+    _entry(
+        "dot_product_3d",
+        "Maths and Numbers",
+        "implemented",
+        "src.conversion.gml_runtime_parts.segments.35_maths_numbers",
+        "n/a",
+        "yes",
+        "yes",
+        "no",
+        "GameMaker_Language/GML_Reference/Maths_And_Numbers/Maths_And_Numbers.htm",
+        "3D vector dot product helper.",
+    ),
+    _entry(
+        "dot_product_normalised",
+        "Maths and Numbers",
+        "implemented",
+        "src.conversion.gml_runtime_parts.segments.35_maths_numbers",
+        "n/a",
+        "yes",
+        "yes",
+        "no",
+        "GameMaker_Language/GML_Reference/Maths_And_Numbers/Maths_And_Numbers.htm",
+        "Normalized 2D vector dot product helper.",
+    ),
+    _entry(
+        "dot_product_3d_normalised",
+        "Maths and Numbers",
+        "implemented",
+        "src.conversion.gml_runtime_parts.segments.35_maths_numbers",
+        "n/a",
+        "yes",
+        "yes",
+        "no",
+        "GameMaker_Language/GML_Reference/Maths_And_Numbers/Maths_And_Numbers.htm",
+        "Normalized 3D vector dot product helper.",
+    ),
+    _entry(
+        "random",
+        "Maths and Numbers",
+        "implemented",
+        "src.conversion.gml_runtime_parts.segments.35_maths_numbers",
+        "n/a",
+        "yes",
+        "yes",
+        "yes",
+        "GameMaker_Language/GML_Reference/Maths_And_Numbers/Maths_And_Numbers.htm",
+        "Uses the GMRuntime deterministic compatibility RNG.",
+    ),
+    _entry(
+        "irandom",
+        "Maths and Numbers",
+        "implemented",
+        "src.conversion.gml_runtime_parts.segments.35_maths_numbers",
+        "n/a",
+        "yes",
+        "yes",
+        "yes",
+        "GameMaker_Language/GML_Reference/Maths_And_Numbers/Maths_And_Numbers.htm",
+        "Inclusive integer random helper backed by compatibility RNG state.",
+    ),
+    _entry(
+        "random_range",
+        "Maths and Numbers",
+        "implemented",
+        "src.conversion.gml_runtime_parts.segments.35_maths_numbers",
+        "n/a",
+        "yes",
+        "yes",
+        "yes",
+        "GameMaker_Language/GML_Reference/Maths_And_Numbers/Maths_And_Numbers.htm",
+        "Range random helper backed by compatibility RNG state.",
+    ),
+    _entry(
+        "irandom_range",
+        "Maths and Numbers",
+        "implemented",
+        "src.conversion.gml_runtime_parts.segments.35_maths_numbers",
+        "n/a",
+        "yes",
+        "yes",
+        "yes",
+        "GameMaker_Language/GML_Reference/Maths_And_Numbers/Maths_And_Numbers.htm",
+        "Inclusive range integer random helper backed by compatibility RNG state.",
+    ),
+    _entry(
+        "choose",
+        "Maths and Numbers",
+        "implemented",
+        "src.conversion.gml_runtime_parts.segments.35_maths_numbers",
+        "n/a",
+        "yes",
+        "yes",
+        "yes",
+        "GameMaker_Language/GML_Reference/Maths_And_Numbers/Maths_And_Numbers.htm",
+        "Variadic random selection helper backed by compatibility RNG state.",
+    ),
+    _entry(
+        "randomize",
+        "Maths and Numbers",
+        "implemented",
+        "src.conversion.gml_runtime_parts.segments.35_maths_numbers",
+        "n/a",
+        "yes",
+        "yes",
+        "no",
+        "GameMaker_Language/GML_Reference/Maths_And_Numbers/Maths_And_Numbers.htm",
+        "Reseeds the compatibility RNG from the current monotonic timestamp.",
+    ),
+    _entry(
+        "randomise",
+        "Maths and Numbers",
+        "implemented",
+        "src.conversion.gml_runtime_parts.segments.35_maths_numbers",
+        "n/a",
+        "yes",
+        "yes",
+        "no",
+        "GameMaker_Language/GML_Reference/Maths_And_Numbers/Maths_And_Numbers.htm",
+        "Alias for randomize.",
+    ),
+    _entry(
+        "random_set_seed",
+        "Maths and Numbers",
+        "implemented",
+        "src.conversion.gml_runtime_parts.segments.35_maths_numbers",
+        "n/a",
+        "yes",
+        "yes",
+        "yes",
+        "GameMaker_Language/GML_Reference/Maths_And_Numbers/Maths_And_Numbers.htm",
+        "Sets deterministic compatibility RNG state.",
+    ),
+    _entry(
+        "random_get_seed",
+        "Maths and Numbers",
+        "implemented",
+        "src.conversion.gml_runtime_parts.segments.35_maths_numbers",
+        "n/a",
+        "yes",
+        "yes",
+        "yes",
+        "GameMaker_Language/GML_Reference/Maths_And_Numbers/Maths_And_Numbers.htm",
+        "Returns current deterministic compatibility RNG state.",
+    ),
+    *(
+        _entry(
+            name,
+            "Files INI JSON",
+            "implemented",
+            "src.conversion.gml_runtime_parts.segments.65_files_ini_json",
+            "n/a",
+            "yes",
+            "yes",
+            "yes" if name in {
+                "file_exists",
+                "file_delete",
+                "directory_exists",
+                "directory_create",
+                "directory_destroy",
+                "file_text_open_read",
+                "file_text_open_write",
+                "file_text_close",
+                "file_text_eof",
+                "file_text_read_string",
+                "file_text_read_real",
+                "file_text_write_string",
+                "file_text_write_real",
+                "file_text_writeln",
+                "file_bin_open",
+                "file_bin_rewrite",
+                "file_bin_close",
+                "file_bin_size",
+                "file_bin_position",
+                "file_bin_seek",
+                "file_bin_read_byte",
+                "file_bin_write_byte",
+                "filename_name",
+                "filename_ext",
+                "filename_dir",
+                "filename_path",
+                "filename_change_ext",
+            } else "no",
+            "GameMaker_Language/GML_Reference/File_Handling/File_Handling.htm",
+            "Implemented through GMRuntime sandbox path resolution and text file handles.",
+        )
+        for name in (
+            "file_exists",
+            "file_delete",
+            "directory_exists",
+            "directory_create",
+            "directory_destroy",
+            "file_text_open_read",
+            "file_text_open_write",
+            "file_text_open_append",
+            "file_text_close",
+            "file_text_eof",
+            "file_text_read_string",
+            "file_text_readln",
+            "file_text_read_real",
+            "file_text_write_string",
+            "file_text_write_real",
+            "file_text_writeln",
+            "file_bin_open",
+            "file_bin_rewrite",
+            "file_bin_close",
+            "file_bin_size",
+            "file_bin_position",
+            "file_bin_seek",
+            "file_bin_read_byte",
+            "file_bin_write_byte",
+            "filename_name",
+            "filename_ext",
+            "filename_dir",
+            "filename_path",
+            "filename_change_ext",
+            "working_directory",
+            "program_directory",
+            "temp_directory",
+        )
+    ),
+    *(
+        _entry(
+            name,
+            "Files INI JSON",
+            "implemented",
+            "src.conversion.gml_runtime_parts.segments.65_files_ini_json",
+            "n/a",
+            "yes",
+            "yes",
+            "yes",
+            "GameMaker_Language/GML_Reference/File_Handling/File_Handling.htm",
+            "Implemented through a GMRuntime-owned ConfigFile-backed INI compatibility layer.",
+        )
+        for name in (
+            "ini_open",
+            "ini_close",
+            "ini_read_string",
+            "ini_read_real",
+            "ini_write_string",
+            "ini_write_real",
+            "ini_section_exists",
+            "ini_key_exists",
+            "ini_key_delete",
+            "ini_section_delete",
+        )
+    ),
+    *(
+        _entry(
+            name,
+            "Files INI JSON",
+            "implemented",
+            "src.conversion.gml_runtime_parts.segments.65_files_ini_json",
+            "n/a",
+            "yes",
+            "yes",
+            "yes",
+            "GameMaker_Language/GML_Reference/File_Handling/File_Handling.htm",
+            "JSON encoding sanitizes GML-only values and expands marked DS map/list handles.",
+        )
+        for name in (
+            "json_encode",
+            "json_decode",
+            "json_stringify",
+            "json_parse",
+        )
+    ),
+    *(
+        _entry(
+            name,
+            "Buffers",
+            "implemented" if name not in {"buffer_save_async", "buffer_load_async"} else "partial",
+            "src.conversion.gml_runtime_parts.segments.66_buffers",
+            "n/a",
+            "yes",
+            "yes",
+            "yes" if name in {
+                "buffer_create",
+                "buffer_delete",
+                "buffer_exists",
+                "buffer_read",
+                "buffer_write",
+                "buffer_seek",
+                "buffer_tell",
+                "buffer_peek",
+                "buffer_poke",
+                "buffer_get_size",
+                "buffer_get_used_size",
+                "buffer_resize",
+                "buffer_sizeof",
+                "buffer_copy",
+                "buffer_fill",
+                "buffer_save",
+                "buffer_load",
+                "buffer_save_ext",
+                "buffer_load_ext",
+                "buffer_compress",
+                "buffer_decompress",
+                "buffer_base64_encode",
+                "buffer_base64_decode",
+                "buffer_md5",
+                "buffer_sha1",
+                "buffer_sha256",
+                "buffer_crc32",
+            } else "partial",
+            "GameMaker_Language/GML_Reference/Buffers/Buffers.htm",
+            "Handle-backed PackedByteArray compatibility wrapper with cursor, alignment, path-resolved save/load, and hash helpers.",
+        )
+        for name in (
+            "buffer_create",
+            "buffer_delete",
+            "buffer_exists",
+            "buffer_read",
+            "buffer_write",
+            "buffer_seek",
+            "buffer_tell",
+            "buffer_peek",
+            "buffer_poke",
+            "buffer_get_size",
+            "buffer_get_used_size",
+            "buffer_resize",
+            "buffer_sizeof",
+            "buffer_copy",
+            "buffer_fill",
+            "buffer_save",
+            "buffer_load",
+            "buffer_save_ext",
+            "buffer_load_ext",
+            "buffer_save_async",
+            "buffer_load_async",
+            "buffer_compress",
+            "buffer_decompress",
+            "buffer_base64_encode",
+            "buffer_base64_decode",
+            "buffer_md5",
+            "buffer_sha1",
+            "buffer_sha256",
+            "buffer_crc32",
+        )
+    ),
+    *(
+        _entry(
+            name,
+            "Asynchronous Functions",
+            "implemented",
+            "src.conversion.gml_runtime_parts.segments.67_async_runtime",
+            "n/a",
+            "yes",
+            "yes",
+            "yes",
+            "GameMaker_Language/GML_Reference/Asynchronous_Functions/Asynchronous_Functions.htm",
+            "Uses a GMRuntime HTTPRequest bridge with request ids, async_load payloads, and generated Async HTTP handler dispatch.",
+        )
+        for name in (
+            "http_get",
+            "http_post_string",
+            "http_request",
+        )
+    ),
+    *(
+        _entry(
+            name,
+            "Asynchronous Functions",
+            "unsupported",
+            "src.conversion.gml_transpiler_parts.gml_api_manifest",
+            "n/a",
+            "no",
+            "no",
+            "n/a",
+            "GameMaker_Language/GML_Reference/Asynchronous_Functions/Asynchronous_Functions.htm",
+            "Dialog async APIs require platform UI integration and intentionally emit diagnostics instead of no-op success.",
+        )
+        for name in (
+            "get_open_filename",
+            "get_save_filename",
+            "show_message_async",
+            "show_question_async",
+        )
+    ),
+    *(
+        _entry(
+            name,
+            "Networking",
+            "implemented",
+            "src.conversion.gml_runtime_parts.segments.68_networking",
+            "n/a",
+            "yes",
+            "yes",
+            "partial",
+            "GameMaker_Language/GML_Reference/Networking/Networking.htm",
+            "Uses GMRuntime socket handles backed by Godot TCPServer, StreamPeerTCP, or PacketPeerUDP with Async Networking event dispatch.",
+        )
+        for name in (
+            "network_create_socket",
+            "network_create_socket_ext",
+            "network_create_server",
+            "network_create_server_raw",
+            "network_connect",
+            "network_connect_async",
+            "network_connect_raw",
+            "network_connect_raw_async",
+            "network_send_raw",
+            "network_send_udp",
+            "network_send_udp_raw",
+            "network_destroy",
+        )
+    ),
+    _entry(
+        "network_send_packet",
+        "Networking",
+        "partial",
+        "src.conversion.gml_runtime_parts.segments.68_networking",
+        "n/a",
+        "yes",
+        "partial",
+        "partial",
+        "GameMaker_Language/GML_Reference/Networking/Networking.htm",
+        "Sends buffer payload bytes through the socket runtime; GameMaker packet framing compatibility remains intentionally unclaimed.",
+    ),
+    _entry(
+        "network_send_broadcast",
+        "Networking",
+        "implemented",
+        "src.conversion.gml_runtime_parts.segments.68_networking",
+        "n/a",
+        "yes",
+        "yes",
+        "partial",
+        "GameMaker_Language/GML_Reference/Networking/Networking.htm",
+        "Sends UDP broadcast payload bytes through PacketPeerUDP when the socket is UDP; non-UDP sockets return -1.",
+    ),
+    *(
+        _entry(
+            name,
+            "Particles GPU Effects",
+            "implemented",
+            "src.conversion.gml_runtime_parts.segments.48_drawing_basic_forms",
+            "n/a",
+            "yes",
+            "yes",
+            "partial",
+            "GameMaker_Language/GML_Reference/Drawing/GPU_Control/GPU_Control.htm",
+            "Stores GameMaker GPU state in the draw runtime and applies supported blend/filter/repeat state to CanvasItem draw targets.",
+        )
+        for name in (
+            "gpu_set_blendmode",
+            "gpu_get_blendmode",
+            "draw_set_blend_mode",
+            "draw_get_blend_mode",
+            "gpu_set_texfilter",
+            "gpu_get_texfilter",
+            "texture_set_interpolation",
+            "texture_get_interpolation",
+            "gpu_set_texrepeat",
+            "gpu_get_texrepeat",
+            "texture_set_repeat",
+            "texture_get_repeat",
+            "gpu_set_colorwriteenable",
+            "gpu_get_colorwriteenable",
+            "gpu_set_cullmode",
+            "gpu_get_cullmode",
+            "gpu_set_alphatestenable",
+            "gpu_get_alphatestenable",
+            "gpu_set_alphatestref",
+            "gpu_get_alphatestref",
+        )
+    ),
+    *(
+        _entry(
+            name,
+            "Particles GPU Effects",
+            "implemented",
+            "src.conversion.gml_runtime_parts.segments.48_drawing_basic_forms",
+            "n/a",
+            "yes",
+            "yes",
+            "partial",
+            "GameMaker_Language/GML_Reference/Drawing/Textures/Textures.htm",
+            "Returns GMRuntime texture handles for sprite/surface textures and exposes texture dimensions for draw/surface/shader code.",
+        )
+        for name in (
+            "sprite_get_texture",
+            "surface_get_texture",
+            "texture_exists",
+            "texture_get_width",
+            "texture_get_height",
+        )
+    ),
+    *(
+        _entry(
+            name,
+            "Particles GPU Effects",
+            "partial",
+            "src.conversion.gml_runtime_parts.segments.51_particles",
+            "n/a",
+            "yes",
+            "partial",
+            "yes",
+            "GameMaker_Language/GML_Reference/Drawing/Particles/Particle_Systems/Particle_Systems.htm",
+            "Provides handle-backed particle system lifecycle, layer/depth/position state, counts, clears, and direct creation with generated Godot particle nodes.",
+        )
+        for name in (
+            "part_system_exists",
+            "part_system_create",
+            "part_system_create_layer",
+            "part_system_get_layer",
+            "part_system_layer",
+            "part_system_depth",
+            "part_system_position",
+            "part_system_destroy",
+            "part_system_clear",
+            "part_particles_clear",
+            "part_particles_count",
+            "part_particles_create",
+        )
+    ),
+    *(
+        _entry(
+            name,
+            "Particles GPU Effects",
+            "partial",
+            "src.conversion.gml_runtime_parts.segments.51_particles",
+            "n/a",
+            "yes",
+            "partial",
+            "yes",
+            "GameMaker_Language/GML_Reference/Drawing/Particles/Particle_Types/Particle_Types.htm",
+            "Provides handle-backed particle type lifecycle and stores common visual/motion properties; GPUParticles2D visual output is approximate.",
+        )
+        for name in (
+            "part_type_exists",
+            "part_type_create",
+            "part_type_destroy",
+            "part_type_shape",
+            "part_type_size",
+            "part_type_scale",
+            "part_type_life",
+            "part_type_speed",
+            "part_type_direction",
+            "part_type_gravity",
+            "part_type_orientation",
+            "part_type_colour1",
+            "part_type_colour2",
+            "part_type_colour3",
+            "part_type_alpha1",
+            "part_type_alpha2",
+            "part_type_alpha3",
+            "part_type_blend",
+            "part_type_sprite",
+        )
+    ),
+    *(
+        _entry(
+            name,
+            "Particles GPU Effects",
+            "partial",
+            "src.conversion.gml_runtime_parts.segments.51_particles",
+            "n/a",
+            "yes",
+            "partial",
+            "yes",
+            "GameMaker_Language/GML_Reference/Drawing/Particles/Particle_Emitters/Particle_Emitters.htm",
+            "Provides handle-backed emitter lifecycle, region/relative metadata, generated GPUParticles2D nodes, and deterministic burst/stream state.",
+        )
+        for name in (
+            "part_emitter_exists",
+            "part_emitter_create",
+            "part_emitter_region",
+            "part_emitter_relative",
+            "part_emitter_destroy",
+            "part_emitter_destroy_all",
+            "part_emitter_clear",
+            "part_emitter_enable",
+            "part_emitter_burst",
+            "part_emitter_stream",
+        )
+    ),
+    *(
+        _entry(
+            name,
+            "Particles GPU Effects",
+            "unsupported",
+            "src.conversion.gml_transpiler_parts.gml_api_manifest",
+            "n/a",
+            "no",
+            "no",
+            "n/a",
+            "GameMaker_Language/GML_Reference/Drawing/Drawing.htm",
+            "GameMaker effects and legacy lighting do not have safe immediate-mode Godot equivalents and produce explicit diagnostics.",
+        )
+        for name in (
+            "effect_create_above",
+            "effect_create_below",
+            "effect_clear",
+            "d3d_set_lighting",
+            "d3d_light_define_direction",
+        )
+    ),
+    *(
+        _entry(
+            name,
+            "Shaders",
+            "implemented",
+            "src.conversion.gml_runtime_parts.segments.48_drawing_basic_forms",
+            "n/a",
+            "yes",
+            "yes",
+            "partial",
+            "GameMaker_Language/GML_Reference/Drawing/Shaders/Shaders.htm",
+            "Resolves converted shader assets through the registry and applies ShaderMaterial state/uniforms through the draw runtime.",
+        )
+        for name in (
+            "shader_set",
+            "shader_reset",
+            "shader_get_name",
+            "shader_is_compiled",
+            "shader_get_uniform",
+            "shader_get_sampler_index",
+            "shader_set_uniform_f",
+            "shader_set_uniform_i",
+            "shader_set_uniform_f_array",
+            "shader_set_uniform_i_array",
+            "texture_set_stage",
+        )
+    ),
+    _entry(
+        "shader_set_uniform_matrix",
+        "Shaders",
+        "partial",
+        "src.conversion.gml_runtime_parts.segments.48_drawing_basic_forms",
+        "n/a",
+        "yes",
+        "partial",
+        "yes",
+        "GameMaker_Language/GML_Reference/Drawing/Shaders/Shaders.htm",
+        "Sets a Godot mat4 uniform to the current compatibility matrix; exact GameMaker matrix-stack parity remains pending matrix-function support.",
+    ),
+    _entry(
+        "shader_enable_corner_id",
+        "Shaders",
+        "unsupported",
+        "src.conversion.gml_transpiler_parts.gml_api_manifest",
+        "n/a",
+        "no",
+        "no",
+        "no",
+        "GameMaker_Language/GML_Reference/Drawing/Shaders/Shaders.htm",
+        "GameMaker corner-ID color-bit injection requires a custom vertex emission path that the current CanvasItem draw runtime cannot safely emulate.",
+    ),
+    *(
+        _entry(
+            name,
+            "Physics",
+            "implemented",
+            "src.conversion.gml_runtime_parts.segments.69_physics",
+            "n/a",
+            "yes",
+            "yes",
+            "partial",
+            "GameMaker_Language/GML_Reference/Physics/Physics.htm",
+            "Provides scoped Godot 2D physics wrappers for world gravity state, fixture CollisionShape2D binding, and RigidBody2D force/impulse helpers.",
+        )
+        for name in (
+            "physics_world_create",
+            "physics_world_gravity",
+            "physics_world_gravity_get",
+            "physics_world_update_speed",
+            "physics_pause_enable",
+            "physics_fixture_create",
+            "physics_fixture_delete",
+            "physics_fixture_set_box_shape",
+            "physics_fixture_set_circle_shape",
+            "physics_fixture_set_density",
+            "physics_fixture_set_friction",
+            "physics_fixture_set_restitution",
+            "physics_fixture_set_linear_damping",
+            "physics_fixture_set_angular_damping",
+            "physics_fixture_set_sensor",
+            "physics_fixture_bind",
+            "physics_apply_force",
+            "physics_apply_impulse",
+            "physics_apply_local_force",
+            "physics_apply_local_impulse",
+            "physics_apply_angular_impulse",
+            "physics_apply_torque",
+            "physics_joint_distance_create",
+            "physics_joint_revolute_create",
+            "physics_joint_delete",
+            "physics_joint_get_value",
+            "physics_joint_set_value",
+            "physics_joint_enable_motor",
+            "physics_mass_properties",
+        )
+    ),
+    *(
+        _entry(
+            name,
+            "Physics",
+            "unsupported",
+            "src.conversion.gml_transpiler_parts.gml_api_manifest",
+            "n/a",
+            "no",
+            "no",
+            "partial",
+            "GameMaker_Language/GML_Reference/Physics/Physics.htm",
+            "This Box2D-specific joint or physics particle API has no safe portable Godot 2D runtime mapping yet and produces an explicit diagnostic.",
+        )
+        for name in (
+            "physics_joint_prismatic_create",
+            "physics_joint_pulley_create",
+            "physics_joint_gear_create",
+            "physics_joint_weld_create",
+            "physics_joint_rope_create",
+            "physics_joint_wheel_create",
+            "physics_joint_friction_create",
+            "physics_particle_create",
+        )
+    ),
+    *(
+        _entry(
+            name,
+            "Script Functions",
+            "implemented",
+            "src.conversion.gml_runtime_parts.segments.20_methods_and_exceptions",
+            "n/a",
+            "yes",
+            "yes",
+            "partial",
+            "GameMaker_Language/GML_Overview/Script_Functions.htm",
+            "Provides method/script call helpers, script registry lookup, script_execute, and scoped legacy argument variables.",
+        )
+        for name in (
+            "method_call",
+            "script_execute",
+            "script_exists",
+            "script_get_name",
+            "script_get_callable",
+            "global_function",
+            "argument_count",
+        )
+    ),
+    _entry(
+        "external_call",
+        "Script Functions",
+        "unsupported",
+        "src.conversion.gml_transpiler_parts.gml_api_manifest",
+        "n/a",
+        "no",
+        "no",
+        "n/a",
+        "GameMaker_Language/GML_Overview/Script_Functions.htm",
+        "Native extension calls require an explicit plugin hook surface and are rejected instead of emitted as invalid GDScript.",
+    ),
+    _entry(
+        "#macro",
+        "Preprocessor",
+        "implemented",
+        "src.conversion.gml_transpiler_parts.statement_parser",
+        "yes",
+        "yes",
+        "n/a",
+        "no",
+        "GameMaker_Language/GML_Overview/GML_Overview.htm",
+        "Macro declarations and configuration overrides are supported.",
+    ),
+    _entry(
+        "#region",
+        "Preprocessor",
+        "implemented",
+        "src.conversion.gml_transpiler_parts.preprocessor",
+        "yes",
+        "yes",
+        "n/a",
+        "no",
+        "GameMaker_Language/GML_Overview/Commenting_Code.htm",
+        "Editor-only region directives are stripped before tokenization.",
+    ),
+    _entry(
+        "#endregion",
+        "Preprocessor",
+        "implemented",
+        "src.conversion.gml_transpiler_parts.preprocessor",
+        "yes",
+        "yes",
+        "n/a",
+        "no",
+        "GameMaker_Language/GML_Overview/Commenting_Code.htm",
+        "Editor-only region directives are stripped before tokenization.",
+    ),
+    _entry(
+        "#define",
+        "Preprocessor",
+        "implemented",
+        "src.conversion.gml_transpiler_parts.preprocessor",
+        "yes",
+        "yes",
+        "n/a",
+        "no",
+        "GameMaker_Language/GML_Overview/GML_Overview.htm",
+        "Defines conditional symbols and lowers value defines through the existing macro expansion path.",
+    ),
+    _entry(
+        "#if",
+        "Preprocessor",
+        "implemented",
+        "src.conversion.gml_transpiler_parts.preprocessor",
+        "yes",
+        "yes",
+        "n/a",
+        "no",
+        "GameMaker_Language/GML_Overview/GML_Overview.htm",
+        "Configuration and defined-symbol conditionals skip inactive source before tokenization.",
+    ),
+    _entry(
+        "#ifdef",
+        "Preprocessor",
+        "implemented",
+        "src.conversion.gml_transpiler_parts.preprocessor",
+        "yes",
+        "yes",
+        "n/a",
+        "no",
+        "GameMaker_Language/GML_Overview/GML_Overview.htm",
+        "Defined-symbol conditionals skip inactive source before tokenization.",
+    ),
+    _entry(
+        "#ifndef",
+        "Preprocessor",
+        "implemented",
+        "src.conversion.gml_transpiler_parts.preprocessor",
+        "yes",
+        "yes",
+        "n/a",
+        "no",
+        "GameMaker_Language/GML_Overview/GML_Overview.htm",
+        "Defined-symbol conditionals skip inactive source before tokenization.",
+    ),
+    _entry(
+        "#elif",
+        "Preprocessor",
+        "implemented",
+        "src.conversion.gml_transpiler_parts.preprocessor",
+        "yes",
+        "yes",
+        "n/a",
+        "no",
+        "GameMaker_Language/GML_Overview/GML_Overview.htm",
+        "Configuration and defined-symbol conditionals skip inactive source before tokenization.",
+    ),
+    _entry(
+        "#else",
+        "Preprocessor",
+        "implemented",
+        "src.conversion.gml_transpiler_parts.preprocessor",
+        "yes",
+        "yes",
+        "n/a",
+        "no",
+        "GameMaker_Language/GML_Overview/GML_Overview.htm",
+        "Configuration and defined-symbol conditionals skip inactive source before tokenization.",
+    ),
+    _entry(
+        "#endif",
+        "Preprocessor",
+        "implemented",
+        "src.conversion.gml_transpiler_parts.preprocessor",
+        "yes",
+        "yes",
+        "n/a",
+        "no",
+        "GameMaker_Language/GML_Overview/GML_Overview.htm",
+        "Configuration and defined-symbol conditionals skip inactive source before tokenization.",
+    ),
+    _entry(
+        "#import",
+        "Preprocessor",
+        "unsupported",
+        "src.conversion.gml_transpiler_parts.preprocessor",
+        "yes",
+        "n/a",
+        "n/a",
+        "no",
+        "GameMaker_Language/GML_Overview/GML_Overview.htm",
+        "Import/include-style directives are rejected with source-line diagnostics until multi-file include policy is explicit.",
+    ),
+    _entry(
+        "#include",
+        "Preprocessor",
+        "unsupported",
+        "src.conversion.gml_transpiler_parts.preprocessor",
+        "yes",
+        "n/a",
+        "n/a",
+        "no",
+        "GameMaker_Language/GML_Overview/GML_Overview.htm",
+        "Import/include-style directives are rejected with source-line diagnostics until multi-file include policy is explicit.",
+    ),
+    *_layer_entries(),
+    *_sequence_timeline_entries(),
+    *_sprites_textures_entries(),
+    *_flexpanel_entries(),
+    *_os_debug_gc_entries(),
+    *_os_device_media_entries(),
+    *_platform_service_entries(),
+    _entry(
+        "external_define",
+        "Extensions",
+        "unsupported",
+        "src.conversion.resource_index",
+        "n/a",
+        "no",
+        "no",
+        "no",
+        "GameMaker_Language/GML_Reference/GML_Reference.htm",
+        "Native extension calls require explicit project mapping or GDExtension hooks.",
+    ),
+    _entry(
+        "extension_function_discovery",
+        "Extensions",
+        "partial",
+        "src.conversion.resource_index",
+        "n/a",
+        "n/a",
+        "n/a",
+        "yes",
+        "GameMaker_Language/GML_Reference/GML_Reference.htm",
+        "Indexes GameMaker extension function metadata from .yy files so calls can be classified separately from user scripts.",
+    ),
+    _entry(
+        "extension_function_mapping",
+        "Extensions",
+        "partial",
+        "src.conversion.gml_transpiler_parts.extension_functions",
+        "n/a",
+        "yes",
+        "yes",
+        "yes",
+        "GameMaker_Language/GML_Reference/GML_Reference.htm",
+        "Project-local gm2godot_extension_functions.json mappings lower extension calls to explicit Godot addon/GDExtension hook targets.",
+    ),
+    _entry(
+        "extension_unmapped_diagnostic",
+        "Extensions",
+        "implemented",
+        "src.conversion.gml_transpiler_parts.emitter",
+        "n/a",
+        "yes",
+        "no",
+        "yes",
+        "GameMaker_Language/GML_Reference/GML_Reference.htm",
+        "Unmapped extension functions produce actionable diagnostics naming the extension function and mapping file.",
+    ),
+    _entry(
+        "extension_native_security_policy",
+        "Extensions",
+        "implemented",
+        "src.conversion.extension_compatibility",
+        "n/a",
+        "n/a",
+        "n/a",
+        "no",
+        "GameMaker_Language/GML_Reference/GML_Reference.htm",
+        "Documents why native extension calls require explicit local mappings and target-specific Godot plugin or GDExtension review.",
+    ),
+    _entry(
+        "compatibility_fixture_suite",
+        "Full-Game Fixtures",
+        "implemented",
+        "tests.fixtures.part2",
+        "n/a",
+        "n/a",
+        "n/a",
+        "yes",
+        "GameMaker_Language/GML_Reference/GML_Reference.htm",
+        "Part 2 fixture catalog maps GameMaker source expectations to headless generated Godot assertion paths.",
+    ),
+    _entry(
+        "part2_fixture_top_down_movement_collision",
+        "Full-Game Fixtures",
+        "implemented",
+        "tests.fixtures.part2",
+        "n/a",
+        "n/a",
+        "n/a",
+        "yes",
+        "GameMaker_Language/GML_Reference/GML_Reference.htm",
+        "Fixture covers top-down movement, object selector collision checks, and blocking wall behavior.",
+    ),
+    _entry(
+        "part2_fixture_multi_room_transition",
+        "Full-Game Fixtures",
+        "implemented",
+        "tests.fixtures.part2",
+        "n/a",
+        "n/a",
+        "n/a",
+        "yes",
+        "GameMaker_Language/GML_Reference/GML_Reference.htm",
+        "Fixture covers room order transitions, restart/previous navigation, metadata, and persistent lifecycle callbacks.",
+    ),
+    _entry(
+        "part2_fixture_draw_text_surface",
+        "Full-Game Fixtures",
+        "implemented",
+        "tests.fixtures.part2",
+        "n/a",
+        "n/a",
+        "n/a",
+        "yes",
+        "GameMaker_Language/GML_Reference/GML_Reference.htm",
+        "Fixture covers generated Draw event context, text drawing, and surface target assertions.",
+    ),
+    _entry(
+        "part2_fixture_audio_playback",
+        "Full-Game Fixtures",
+        "implemented",
+        "tests.fixtures.part2",
+        "n/a",
+        "n/a",
+        "n/a",
+        "yes",
+        "GameMaker_Language/GML_Reference/GML_Reference.htm",
+        "Fixture covers imported sound playback handles, audio group routing, gain/pitch changes, and legacy aliases.",
+    ),
+    _entry(
+        "part2_fixture_ds_collections_save_files",
+        "Full-Game Fixtures",
+        "implemented",
+        "tests.fixtures.part2",
+        "n/a",
+        "n/a",
+        "n/a",
+        "yes",
+        "GameMaker_Language/GML_Reference/GML_Reference.htm",
+        "Fixture covers DS lists/maps/grids with save-file, INI, included file, and JSON assertions.",
+    ),
+    _entry(
+        "part2_fixture_async_http_bridge",
+        "Full-Game Fixtures",
+        "implemented",
+        "tests.fixtures.part2",
+        "n/a",
+        "n/a",
+        "n/a",
+        "yes",
+        "GameMaker_Language/GML_Reference/GML_Reference.htm",
+        "Fixture covers HTTP GET/POST/custom requests and async_load dispatch through generated handlers.",
+    ),
+    _entry(
+        "part2_fixture_camera_view_behavior",
+        "Full-Game Fixtures",
+        "implemented",
+        "tests.fixtures.part2",
+        "n/a",
+        "n/a",
+        "n/a",
+        "yes",
+        "GameMaker_Language/GML_Reference/GML_Reference.htm",
+        "Fixture covers camera helper state, legacy view array synchronization, Camera2D transforms, and GUI sizing.",
+    ),
+    _entry(
+        "part2_fixture_multiview_viewport_backend",
+        "Full-Game Fixtures",
+        "implemented",
+        "tests.fixtures.part2",
+        "n/a",
+        "n/a",
+        "n/a",
+        "yes",
+        "GameMaker_Language/GML_Reference/GML_Reference.htm",
+        "Fixture covers multi-view viewport rectangles, mouse-to-view coordinate conversion, view-surface state, and backend diagnostics.",
+    ),
+)
@@ -2,7 +2,9 @@
 from __future__ import annotations
 
 import re
+from bisect import bisect_right
 from dataclasses import dataclass
+from functools import cached_property
 from typing import Iterable, TypeAlias
 
 from .identifiers import _validate_gml_identifier
@@ -171,6 +173,66 @@ def _logical_macro_line(
     return logical_line, last_line_index
 
 
+@dataclass(frozen=True)
+class PreprocessedSourceLayout:
+    """Where each line of ``preprocess_gml_source`` output came from.
+
+    Comments are removed and continued ``#macro`` lines joined before
+    directives are handled, so a preprocessed line can sit several lines
+    above the original line it was read from. ``removed_spans`` holds the
+    original offsets of the removed comments and ``line_starts`` the offset,
+    in the comment-free text, at which each preprocessed line starts.
+    """
+
+    source: str
+    removed_spans: tuple[tuple[int, int], ...]
+    line_starts: tuple[int, ...]
+
+    def original_position(self, line: int, column: int) -> tuple[int, int]:
+        """Return the original ``(line, column)`` of a preprocessed position."""
+        if not 1 <= line <= len(self.line_starts):
+            return line, column
+        stripped_offset = self.line_starts[line - 1] + column - 1
+        removed_before = self._removed_lengths[bisect_right(self._removed_starts, stripped_offset)]
+        offset = stripped_offset + removed_before
+        line_index = bisect_right(self._original_line_starts, offset) - 1
+        return line_index + 1, offset - self._original_line_starts[line_index] + 1
+
+    def original_line(self, line: int) -> str:
+        """Return the text of original source line ``line``."""
+        lines = self._original_lines
+        return lines[line - 1] if 1 <= line <= len(lines) else ""
+
+    @cached_property
+    def _removed_starts(self) -> tuple[int, ...]:
+        # Where each removed comment starts in the comment-free text.
+        starts: list[int] = []
+        removed = 0
+        for start, end in self.removed_spans:
+            starts.append(start - removed)
+            removed += end - start
+        return tuple(starts)
+
+    @cached_property
+    def _removed_lengths(self) -> tuple[int, ...]:
+        # Comment characters removed before each entry of _removed_starts.
+        lengths = [0]
+        for start, end in self.removed_spans:
+            lengths.append(lengths[-1] + end - start)
+        return tuple(lengths)
+
+    @cached_property
+    def _original_lines(self) -> tuple[str, ...]:
+        return tuple(self.source.splitlines())
+
+    @cached_property
+    def _original_line_starts(self) -> tuple[int, ...]:
+        starts = [0]
+        for line in self.source.splitlines(keepends=True):
+            starts.append(starts[-1] + len(line))
+        return tuple(starts)
+
+
 def preprocess_gml_source(
     source: str,
     *,
@@ -178,12 +240,32 @@ def preprocess_gml_source(
     active_symbols: Iterable[str] | None = None,
 ) -> GMLPreprocessResult:
     """Apply compile-time directive handling before tokenization."""
+    result, _layout = preprocess_gml_source_with_layout(
+        source,
+        macro_configuration=macro_configuration,
+        active_symbols=active_symbols,
+    )
+    return result
+
+
+def preprocess_gml_source_with_layout(
+    source: str,
+    *,
+    macro_configuration: str | None = None,
+    active_symbols: Iterable[str] | None = None,
+) -> tuple[GMLPreprocessResult, PreprocessedSourceLayout]:
+    """Like ``preprocess_gml_source``, also returning the output's source layout."""
     symbols = {symbol.casefold() for symbol in (active_symbols or ())}
     symbol_values: dict[str, str] = {}
     if macro_configuration:
         symbols.add(macro_configuration.casefold())
 
-    clean_source = _join_macro_continuation_lines(_strip_comments(source))
+    removed_spans: list[tuple[int, int]] = []
+    line_starts: list[int] = []
+    clean_source = _join_macro_continuation_lines(
+        _strip_comments(source, removed_spans),
+        line_starts,
+    )
     output_lines: list[str] = []
     diagnostics: list[GMLPreprocessorDiagnostic] = []
     conditionals: list[_ConditionalFrame] = []
@@ -321,7 +403,10 @@ def preprocess_gml_source(
     if diagnostics:
         raise GMLTranspileError(diagnostics[0].format())
 
-    return GMLPreprocessResult("\n".join(output_lines), tuple(diagnostics))
+    return (
+        GMLPreprocessResult("\n".join(output_lines), tuple(diagnostics)),
+        PreprocessedSourceLayout(source, tuple(removed_spans), tuple(line_starts)),
+    )
 
 
 def preprocess_gml_source_preserving_layout(
@@ -885,6 +970,8 @@ def _add_diagnostic(
 __all__ = [
     "GMLPreprocessResult",
     "GMLPreprocessorDiagnostic",
+    "PreprocessedSourceLayout",
     "preprocess_gml_source",
     "preprocess_gml_source_preserving_layout",
+    "preprocess_gml_source_with_layout",
 ]
@@ -50,7 +50,7 @@ class GMLTranspileError(ValueError):
         return f"{self.message} at line {self.line}, column {self.column}"
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Token:
     kind: str
     value: str
@@ -92,6 +92,23 @@ def _empty_extension_function_mappings() -> Mapping[str, GMLExtensionFunctionMap
     return {}
 
 
+@dataclass(frozen=True)
+class ProjectSymbolTable:
+    """Project-wide names every parser of one conversion resolves against.
+
+    Tables are interned by content, and scope contexts reference their
+    collections instead of copying them.
+    """
+
+    asset_names: frozenset[str] = frozenset()
+    extension_functions: Mapping[str, GMLExtensionFunction] = field(
+        default_factory=_empty_extension_functions
+    )
+    extension_function_mappings: Mapping[str, GMLExtensionFunctionMapping] = field(
+        default_factory=_empty_extension_function_mappings
+    )
+
+
 @dataclass(frozen=True)
 class ScopeContext:
     self_expression: str = "self"
@@ -131,6 +148,7 @@ __all__ = [
     "GMLTranspileError",
     "IncrementDelta",
     "IncrementMode",
+    "ProjectSymbolTable",
     "ScopeContext",
     "StaticDeclaration",
     "Token",
@@ -5,7 +5,7 @@ import json
 import os
 import re
 from dataclasses import dataclass
-from typing import Iterable
+from typing import Iterable, cast
 
 from .constants import _GDSCRIPT_RESERVED_IDENTIFIERS
 from .identifiers import _sanitize_gdscript_identifier
@@ -14,13 +14,19 @@ from .lexical import (
     _read_ordinary_string,
     _read_verbatim_string,
 )
+from .preprocessor import PreprocessedSourceLayout
 from .result_models import (
     GMLSourceDiagnostic,
     GMLSourceMap,
     GMLSourceMapEntry,
 )
 from .tokens import _read_template_string
+from .utils import _line_origin
 
+_VLQ_BASE64 = "ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789+/"
+_VLQ_BASE_SHIFT = 5
+_VLQ_BASE_MASK = (1 << _VLQ_BASE_SHIFT) - 1
+_VLQ_CONTINUATION_BIT = 1 << _VLQ_BASE_SHIFT
 _IDENTIFIER_RE = re.compile(r"\b[A-Za-z_][A-Za-z0-9_]*\b")
 _DECLARATION_RE = re.compile(r"\b(?:var|globalvar|static)\s+([^;\n]+)")
 _FUNCTION_RE = re.compile(r"\bfunction\s+([A-Za-z_][A-Za-z0-9_]*)?\s*\(([^)]*)\)")
@@ -72,63 +78,51 @@ class _SourceLine:
 
 def build_gml_source_map(
     source: str,
-    generated_code: str,
+    emitted_lines: Iterable[str],
     *,
     source_path: str | None = None,
     event: str | None = None,
     generated_line_offset: int = 0,
+    layout: PreprocessedSourceLayout | None = None,
 ) -> GMLSourceMap:
-    source_lines = _significant_source_lines(source)
-    generated_lines = [
-        (index + 1 + generated_line_offset, line)
-        for index, line in enumerate(generated_code.splitlines())
-        if line.strip() and not line.lstrip().startswith("#")
-    ]
-    if not source_lines or not generated_lines:
-        return GMLSourceMap(source_path=source_path, event=event, entries=())
+    """Map each emitted GDScript line to the GML statement it was parsed from.
 
+    ``source`` is the text the parser tokenized and ``emitted_lines`` are the
+    parser's lines before indentation. When that text came from the
+    preprocessor, ``layout`` maps its token positions and source text back to
+    the original GML. Lines the parser emitted without an origin token, such
+    as hoisted declarations, stay unmapped.
+    """
+    source_lines = source.split("\n")
     entries: list[GMLSourceMapEntry] = []
-    source_cursor = 0
-    for index, (generated_line, generated_text) in enumerate(generated_lines):
-        source_line, source_cursor = _source_line_for_generated_text(
-            generated_text,
-            source_lines,
-            source_cursor,
-            index,
-        )
-        entries.append(
-            GMLSourceMapEntry(
-                generated_line=generated_line,
-                source_line=source_line.line,
-                source_column=source_line.column,
-                generated_text=generated_text.strip(),
-                source_text=source_line.text,
-                source_path=source_path,
-                event=event,
+    generated_line = generated_line_offset
+    for emitted in emitted_lines:
+        origin = _line_origin(emitted)
+        for generated_text in emitted.split("\n"):
+            generated_line += 1
+            generated_text = generated_text.strip()
+            if origin is None or not generated_text or generated_text.startswith("#"):
+                continue
+            if layout is None:
+                source_line, source_column = origin.line, origin.column
+                source_text = source_lines[origin.line - 1]
+            else:
+                source_line, source_column = layout.original_position(origin.line, origin.column)
+                source_text = layout.original_line(source_line)
+            entries.append(
+                GMLSourceMapEntry(
+                    generated_line=generated_line,
+                    source_line=source_line,
+                    source_column=source_column,
+                    generated_text=generated_text,
+                    source_text=source_text.strip(),
+                    source_path=source_path,
+                    event=event,
+                )
             )
-        )
     return GMLSourceMap(source_path=source_path, event=event, entries=tuple(entries))
 
 
-def _source_line_for_generated_text(
-    generated_text: str,
-    source_lines: tuple[_SourceLine, ...],
-    source_cursor: int,
-    generated_index: int,
-) -> tuple[_SourceLine, int]:
-    identifiers = [
-        identifier
-        for identifier in _IDENTIFIER_RE.findall(generated_text)
-        if not identifier.startswith("GMRuntime") and not identifier.startswith("gml_")
-    ]
-    for index in range(source_cursor, len(source_lines)):
-        source_text = source_lines[index].text
-        if any(identifier in source_text for identifier in identifiers):
-            return source_lines[index], index + 1
-    fallback_index = min(max(source_cursor, generated_index), len(source_lines) - 1)
-    return source_lines[fallback_index], min(fallback_index + 1, len(source_lines))
-
-
 def merge_gml_source_maps(
     maps: Iterable[GMLSourceMap],
     *,
@@ -149,13 +143,133 @@ def write_gml_source_map(gdscript_path: str, source_map: GMLSourceMap) -> str:
     map_path = gml_source_map_path(gdscript_path)
     os.makedirs(os.path.dirname(map_path), exist_ok=True)
     with open(map_path, "w", encoding="utf-8") as map_file:
-        json.dump(source_map.to_dict(), map_file, indent=2, sort_keys=True)
+        json.dump(
+            _source_map_document(os.path.basename(gdscript_path), source_map),
+            map_file,
+            separators=(",", ":"),
+            sort_keys=True,
+        )
         map_file.write("\n")
     return map_path
 
 
+def read_gml_source_map(map_path: str) -> GMLSourceMap:
+    """Read a ``.gdmap`` file written by :func:`write_gml_source_map`.
+
+    The file keeps locations only, so the entries come back with empty
+    ``generated_text`` and ``source_text``.
+    """
+    with open(map_path, "r", encoding="utf-8") as map_file:
+        document = json.load(map_file)
+    if not isinstance(document, dict):
+        raise ValueError(f"GML source map is not a JSON object: {map_path}")
+    return _source_map_from_document(cast(dict[str, object], document))
+
+
 def gml_source_map_path(gdscript_path: str) -> str:
-    return f"{gdscript_path}.gmlmap.json"
+    return f"{gdscript_path}.gdmap"
+
+
+def _source_map_document(file_name: str, source_map: GMLSourceMap) -> dict[str, object]:
+    """Encode ``source_map`` as a revision 3 source map.
+
+    Every generated line holds at most one segment per entry, at column 0,
+    pointing at the zero-based source line and column of the statement. The
+    sources list holds one item per distinct source path and event pair;
+    the events themselves live in the ``x_gm2godot_events`` extension field.
+    """
+    sources: dict[tuple[str | None, str | None], int] = {}
+    groups: list[list[str]] = []
+    previous_source = previous_line = previous_column = 0
+    for entry in sorted(source_map.entries, key=lambda item: item.generated_line):
+        source_index = sources.setdefault((entry.source_path, entry.event), len(sources))
+        while len(groups) < entry.generated_line:
+            groups.append([])
+        source_line = entry.source_line - 1
+        source_column = entry.source_column - 1
+        groups[entry.generated_line - 1].append(
+            _encode_vlq(0)
+            + _encode_vlq(source_index - previous_source)
+            + _encode_vlq(source_line - previous_line)
+            + _encode_vlq(source_column - previous_column)
+        )
+        previous_source, previous_line, previous_column = source_index, source_line, source_column
+    return {
+        "version": 3,
+        "file": file_name,
+        "sources": [source_path for source_path, _event in sources],
+        "names": [],
+        "mappings": ";".join(",".join(group) for group in groups),
+        "x_gm2godot_events": [event for _source_path, event in sources],
+        "x_gm2godot_source_path": source_map.source_path,
+        "x_gm2godot_event": source_map.event,
+    }
+
+
+def _source_map_from_document(document: dict[str, object]) -> GMLSourceMap:
+    sources = cast(list[str | None], document.get("sources") or [])
+    events = cast(list[str | None], document.get("x_gm2godot_events") or [])
+    mappings = document.get("mappings")
+    if document.get("version") != 3 or not isinstance(mappings, str) or len(events) != len(sources):
+        raise ValueError("Unsupported GML source map document")
+
+    entries: list[GMLSourceMapEntry] = []
+    source_index = source_line = source_column = 0
+    for generated_index, group in enumerate(mappings.split(";")):
+        for segment in filter(None, group.split(",")):
+            fields = _decode_vlq_fields(segment)
+            if len(fields) < 4:
+                raise ValueError(f"Unsupported GML source map segment: {segment}")
+            source_index += fields[1]
+            source_line += fields[2]
+            source_column += fields[3]
+            entries.append(
+                GMLSourceMapEntry(
+                    generated_line=generated_index + 1,
+                    source_line=source_line + 1,
+                    source_column=source_column + 1,
+                    generated_text="",
+                    source_text="",
+                    source_path=sources[source_index],
+                    event=events[source_index],
+                )
+            )
+    return GMLSourceMap(
+        source_path=cast(str | None, document.get("x_gm2godot_source_path")),
+        event=cast(str | None, document.get("x_gm2godot_event")),
+        entries=tuple(entries),
+    )
+
+
+def _encode_vlq(value: int) -> str:
+    remaining = (-value << 1) | 1 if value < 0 else value << 1
+    encoded: list[str] = []
+    while True:
+        digit = remaining & _VLQ_BASE_MASK
+        remaining >>= _VLQ_BASE_SHIFT
+        if remaining:
+            digit |= _VLQ_CONTINUATION_BIT
+        encoded.append(_VLQ_BASE64[digit])
+        if not remaining:
+            return "".join(encoded)
+
+
+def _decode_vlq_fields(segment: str) -> list[int]:
+    fields: list[int] = []
+    value = shift = 0
+    for char in segment:
+        digit = _VLQ_BASE64.find(char)
+        if digit == -1:
+            raise ValueError(f"Invalid base64 VLQ digit: {char!r}")
+        value |= (digit & _VLQ_BASE_MASK) << shift
+        if digit & _VLQ_CONTINUATION_BIT:
+            shift += _VLQ_BASE_SHIFT
+            continue
+        fields.append(-(value >> 1) if value & 1 else value >> 1)
+        value = shift = 0
+    if shift:
+        raise ValueError(f"Truncated base64 VLQ segment: {segment}")
+    return fields
 
 
 def render_gml_source_header(
@@ -300,24 +414,6 @@ def _source_lexical_views(source: str) -> tuple[str, str, str]:
     )
 
 
-def _significant_source_lines(source: str) -> tuple[_SourceLine, ...]:
-    lines: list[_SourceLine] = []
-    comments_stripped, code_only, _strings_masked = _source_lexical_views(source)
-    for line_number, (clean_line, code_line) in enumerate(
-        zip(comments_stripped.splitlines(), code_only.splitlines(), strict=True),
-        start=1,
-    ):
-        if not code_line.strip():
-            continue
-        if code_line.lstrip().startswith("#"):
-            continue
-        column = len(code_line) - len(code_line.lstrip()) + 1
-        lines.append(
-            _SourceLine(line=line_number, column=column, text=clean_line.strip())
-        )
-    return tuple(lines)
-
-
 def _source_comments(source: str) -> tuple[_SourceLine, ...]:
     comments: list[_SourceLine] = []
     _comments_stripped, _code_only, source = _source_lexical_views(source)
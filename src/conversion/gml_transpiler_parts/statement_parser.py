@@ -2,7 +2,7 @@
 from __future__ import annotations
 
 import json
-from typing import Iterable, MutableMapping, MutableSet
+from typing import Iterable, Mapping, MutableMapping, MutableSet
 
 from .constants import _BINARY_PRECEDENCE, _EOF
 from .emitter import _emit_instance_keyword_argument
@@ -28,14 +28,17 @@ from .statements import (
 )
 from .static_declarations import _read_static_declaration_tokens
 from .utils import (
+    _OriginLine,
     _indent_lines,
     _insert_lines_before_continue,
     _insert_until_check_before_continue,
+    _line_origin,
     _macro_configuration_matches,
     _normalize_scope_context,
     _scope_context_with_global_names,
     _split_top_level_tokens,
     _tokens_to_source,
+    _with_origin,
 )
 
 class _StatementParser:
@@ -61,11 +64,15 @@ class _StatementParser:
         global_names: Iterable[str] | None = None,
         asset_names: Iterable[str] | None = None,
         static_scope_prefix: str | None = None,
-        extension_functions: dict[str, GMLExtensionFunction] | None = None,
-        extension_function_mappings: dict[str, GMLExtensionFunctionMapping] | None = None,
+        extension_functions: Mapping[str, GMLExtensionFunction] | None = None,
+        extension_function_mappings: Mapping[str, GMLExtensionFunctionMapping] | None = None,
         control_flow_capture: _ControlFlowCapture | None = None,
+        track_source_origins: bool = False,
     ) -> None:
         self.tokens = tokens
+        # Only parsers reading the original token stream know source lines;
+        # re-tokenized snippets leave their lines to the enclosing statement.
+        self.track_source_origins = track_source_origins
         self.position = 0
         initial_local_names = set(local_names or [])
         self.local_names = set(initial_local_names)
@@ -122,9 +129,16 @@ class _StatementParser:
         while not self._at_end() and not self._check(terminator):
             if self._match(";") or self._match("\n"):
                 continue
-            lines.extend(self._parse_statement())
+            lines.extend(self._parse_tracked_statement())
         return lines
 
+    def _parse_tracked_statement(self) -> list[str]:
+        origin = self._peek()
+        lines = self._parse_statement()
+        if not self.track_source_origins:
+            return lines
+        return _with_origin(lines, origin)
+
     def _parse_statement(self) -> list[str]:
         if self._check_directive("#macro"):
             return self._parse_macro_statement()
@@ -284,14 +298,21 @@ class _StatementParser:
         lines.extend(_indent_lines(body_lines or ["pass"]))
 
         self._skip_newlines()
+        else_token = self._peek()
         if self._match_identifier("else"):
             if self._check_identifier("if"):
-                else_lines = self._parse_if_statement()
-                lines.append(f"elif {else_lines[0][3:]}")
+                else_lines = self._parse_tracked_statement()
+                elif_line = f"elif {else_lines[0][3:]}"
+                else_if_origin = _line_origin(else_lines[0])
+                lines.append(
+                    elif_line
+                    if else_if_origin is None
+                    else _OriginLine(elif_line, else_if_origin)
+                )
                 lines.extend(else_lines[1:])
             else:
                 else_body_lines = self._parse_body()
-                lines.append("else:")
+                lines.append(_OriginLine("else:", else_token) if self.track_source_origins else "else:")
                 lines.extend(_indent_lines(else_body_lines or ["pass"]))
 
         return lines
@@ -668,6 +689,7 @@ class _StatementParser:
             macro_configuration=self.macro_configuration,
             global_names=self.global_names,
             control_flow_capture=control_flow_capture,
+            track_source_origins=self.track_source_origins,
         )
         lines = parser.parse()
         self.local_names.update(parser.local_names)
@@ -840,7 +862,7 @@ class _StatementParser:
         return lines
 
     def _parse_nested_single_statement_body(self) -> list[str]:
-        return self._parse_statement()
+        return self._parse_tracked_statement()
 
     def _read_condition_tokens(self) -> list[_Token]:
         if self._check("("):
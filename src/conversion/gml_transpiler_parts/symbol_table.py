@@ -0,0 +1,73 @@
+from __future__ import annotations
+
+import threading
+import weakref
+from types import MappingProxyType
+from typing import Iterable
+
+from .extension_functions import (
+    normalize_extension_function_mappings,
+    normalize_extension_functions,
+)
+from .shared_models import (
+    GMLExtensionFunction,
+    GMLExtensionFunctionMapping,
+    ProjectSymbolTable,
+)
+
+
+_SymbolTableKey = tuple[
+    frozenset[str],
+    frozenset[tuple[str, GMLExtensionFunction]],
+    frozenset[tuple[str, GMLExtensionFunctionMapping]],
+]
+
+EMPTY_PROJECT_SYMBOL_TABLE = ProjectSymbolTable(
+    extension_functions=MappingProxyType({}),
+    extension_function_mappings=MappingProxyType({}),
+)
+
+_interned_tables: weakref.WeakValueDictionary[_SymbolTableKey, ProjectSymbolTable] = (
+    weakref.WeakValueDictionary()
+)
+_interned_tables_lock = threading.Lock()
+
+
+def project_symbol_table(
+    asset_names: Iterable[str] | None = None,
+    extension_functions: object = None,
+    extension_function_mappings: object = None,
+) -> ProjectSymbolTable:
+    """Return the interned symbol table holding the given project names.
+
+    Equal inputs yield the same table while any caller holds it, so the
+    thousands of parsers of one conversion share a single set of collections.
+    A frozenset of asset names caches its hash, which keeps repeat lookups
+    with the same project set cheap.
+    """
+    assets = asset_names if isinstance(asset_names, frozenset) else frozenset(asset_names or ())
+    functions = normalize_extension_functions(extension_functions)
+    mappings = normalize_extension_function_mappings(extension_function_mappings)
+    if not assets and not functions and not mappings:
+        return EMPTY_PROJECT_SYMBOL_TABLE
+    key: _SymbolTableKey = (
+        assets,
+        frozenset(functions.items()),
+        frozenset(mappings.items()),
+    )
+    with _interned_tables_lock:
+        table = _interned_tables.get(key)
+        if table is None:
+            table = ProjectSymbolTable(
+                asset_names=assets,
+                extension_functions=MappingProxyType(functions),
+                extension_function_mappings=MappingProxyType(mappings),
+            )
+            _interned_tables[key] = table
+        return table
+
+
+__all__ = [
+    "EMPTY_PROJECT_SYMBOL_TABLE",
+    "project_symbol_table",
+]
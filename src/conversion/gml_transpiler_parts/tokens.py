@@ -1,10 +1,15 @@
 # pyright: reportPrivateUsage=false, reportUnusedFunction=false, reportUnusedClass=false
 from __future__ import annotations
 
+import re
 from bisect import bisect_left
-from collections.abc import Sequence
+from collections.abc import Callable, Sequence
 
-from .constants import _BLOCK_DELIMITER_REPLACEMENTS, _MULTI_CHAR_OPERATORS
+from .constants import (
+    _BLOCK_DELIMITER_REPLACEMENTS,
+    _GML_IDENTIFIER_MAX_LENGTH,
+    _MULTI_CHAR_OPERATORS,
+)
 from .identifiers import _validate_gml_identifier
 from .lexical import (
     _is_verbatim_string_start,
@@ -31,154 +36,227 @@ _HEX_DIGITS = frozenset("0123456789abcdefABCDEF")
 _OCTAL_DIGITS = frozenset("01234567")
 
 
+# Matches the common ASCII tokens in one step: a newline, an identifier, a
+# plain decimal number or an operator, each with the inline whitespace that
+# follows it, or a run of inline whitespace on its own. Multi-character
+# operators keep the priority order of _MULTI_CHAR_OPERATORS. Anything the
+# pattern declines (strings, separated or prefixed numbers, directives,
+# non-ASCII text) is read by _read_token.
+_FAST_TOKEN_PATTERN = re.compile(
+    r"(?:(\r\n?|\n)"
+    r"|([A-Za-z_][A-Za-z0-9_]*)(?![A-Za-z0-9_]|[^\x00-\x7f])"
+    r"|((?!0[xXbB])[0-9]+(?:\.[0-9]+)?)(?![0-9_.])"
+    r"|("
+    + "|".join(re.escape(operator) for operator in _MULTI_CHAR_OPERATORS)
+    + r"|[-+*/%&|^~!=<>()\[\]{}?:,;]|\.(?![0-9])|@(?![\"']))"
+    r")[ \t\f\v]*"
+    r"|[ \t\f\v]+"
+)
+_NEWLINE_GROUP = 1
+_IDENTIFIER_GROUP = 2
+_NUMBER_GROUP = 3
+
+
+def _token_field_setter(name: str) -> Callable[[_Token, object], None]:
+    return _Token.__dict__[name].__set__
+
+
+# Token is a frozen dataclass, so its generated __init__ assigns every field
+# through object.__setattr__. The fast path builds one token per match and
+# fills the slots directly instead, which is about twice as fast.
+_allocate_token = object.__new__
+_set_token_kind = _token_field_setter("kind")
+_set_token_value = _token_field_setter("value")
+_set_token_line = _token_field_setter("line")
+_set_token_column = _token_field_setter("column")
+_set_token_index = _token_field_setter("index")
+
+
+def _new_token(kind: str, value: str, line: int, column: int, index: int) -> _Token:
+    token = _allocate_token(_Token)
+    _set_token_kind(token, kind)
+    _set_token_value(token, value)
+    _set_token_line(token, line)
+    _set_token_column(token, column)
+    _set_token_index(token, index)
+    return token
+
+
 def _tokenize(source: str) -> list[_Token]:
     tokens: list[_Token] = []
-    newline_positions = [
-        position for position, char in enumerate(source) if char == "\n"
-    ]
+    append = tokens.append
+    match_fast_token = _FAST_TOKEN_PATTERN.match
+    block_delimiters = _BLOCK_DELIMITER_REPLACEMENTS
+    length = len(source)
     index = 0
-    while index < len(source):
-        char = source[index]
-        line, column = _line_column_from_newline_positions(
-            newline_positions,
-            index,
-        )
-
-        if char in "\r\n":
-            if char == "\r" and index + 1 < len(source) and source[index + 1] == "\n":
-                index += 1
-            tokens.append(_Token("NEWLINE", "\n", line=line, column=column, index=index))
-            index += 1
+    line = 1
+    line_start = -1
+    while index < length:
+        match = match_fast_token(source, index)
+        if match is None:
+            end = _read_token(source, index, line, index - line_start, tokens)
+            newline_count = source.count("\n", index, end)
+            if newline_count:
+                line += newline_count
+                line_start = source.rfind("\n", index, end)
+            index = end
             continue
 
-        if char.isspace():
-            index += 1
-            continue
+        group = match.lastindex
+        if group is not None:
+            value = match.group(group)
+            column = index - line_start
+            if group == _NEWLINE_GROUP:
+                newline_index = index + len(value) - 1
+                append(_new_token("NEWLINE", "\n", line, column, newline_index))
+                if value[-1] == "\n":
+                    line += 1
+                    line_start = newline_index
+            elif group == _IDENTIFIER_GROUP:
+                if len(value) > _GML_IDENTIFIER_MAX_LENGTH:
+                    try:
+                        _validate_gml_identifier(value)
+                    except GMLTranspileError as exc:
+                        raise exc.with_location(line, column) from exc
+                block_delimiter = block_delimiters.get(value)
+                if block_delimiter is not None:
+                    append(_new_token("OP", block_delimiter, line, column, index))
+                else:
+                    append(_new_token("IDENT", value, line, column, index))
+            elif group == _NUMBER_GROUP:
+                append(_new_token("NUMBER", value, line, column, index))
+            else:
+                append(_new_token("OP", value, line, column, index))
+        index = match.end()
 
-        if _is_verbatim_string_start(source, index):
+    append(_new_token("EOF", "", line, length - line_start, length))
+    return tokens
+
+
+def _read_token(
+    source: str,
+    index: int,
+    line: int,
+    column: int,
+    tokens: list[_Token],
+) -> int:
+    """Read the token at ``index`` one character at a time.
+
+    Appends the token, if any, to ``tokens`` and returns the index after it.
+    """
+    char = source[index]
+
+    if char in "\r\n":
+        if char == "\r" and index + 1 < len(source) and source[index + 1] == "\n":
+            index += 1
+        tokens.append(_Token("NEWLINE", "\n", line=line, column=column, index=index))
+        return index + 1
+
+    if char.isspace():
+        return index + 1
+
+    if _is_verbatim_string_start(source, index):
+        try:
+            verbatim = _read_verbatim_string(source, index)
+        except GMLTranspileError as exc:
+            raise exc.with_location(line, column) from exc
+        tokens.append(
+            _Token(
+                "VERBATIM_STRING",
+                verbatim,
+                line=line,
+                column=column,
+                index=index,
+            )
+        )
+        return index + len(verbatim)
+
+    if char.isdigit() or (char == "." and index + 1 < len(source) and source[index + 1].isdigit()):
+        try:
+            number_end = _read_number(source, index)
+        except GMLTranspileError as exc:
+            raise exc.with_location(line, column) from exc
+        tokens.append(_Token("NUMBER", source[index:number_end].replace("_", ""), line=line, column=column, index=index))
+        return number_end
+
+    if char == '"' or char == "'":
+        try:
+            tokens.append(_Token("STRING", _read_string(source, index), line=line, column=column, index=index))
+        except GMLTranspileError as exc:
+            raise exc.with_location(line, column) from exc
+        return index + len(tokens[-1].value)
+
+    if char == "$":
+        if source.startswith('$"', index):
             try:
-                verbatim = _read_verbatim_string(source, index)
+                template = _read_template_string(source, index)
             except GMLTranspileError as exc:
                 raise exc.with_location(line, column) from exc
             tokens.append(
                 _Token(
-                    "VERBATIM_STRING",
-                    verbatim,
+                    "TEMPLATE_STRING",
+                    template,
                     line=line,
                     column=column,
                     index=index,
                 )
             )
-            index += len(verbatim)
-            continue
-
-        if char.isdigit() or (char == "." and index + 1 < len(source) and source[index + 1].isdigit()):
+            return index + len(template)
+        next_char = source[index + 1] if index + 1 < len(source) else ""
+        if next_char.lower() in "0123456789abcdef" or next_char == "_":
             try:
-                number_end = _read_number(source, index)
+                hex_end = _read_hex_number(source, index + 1)
             except GMLTranspileError as exc:
                 raise exc.with_location(line, column) from exc
-            tokens.append(_Token("NUMBER", source[index:number_end].replace("_", ""), line=line, column=column, index=index))
-            index = number_end
-            continue
-
-        if char == '"' or char == "'":
-            try:
-                tokens.append(_Token("STRING", _read_string(source, index), line=line, column=column, index=index))
-            except GMLTranspileError as exc:
-                raise exc.with_location(line, column) from exc
-            index += len(tokens[-1].value)
-            continue
-
-        if char == "$":
-            if source.startswith('$"', index):
-                try:
-                    template = _read_template_string(source, index)
-                except GMLTranspileError as exc:
-                    raise exc.with_location(line, column) from exc
-                tokens.append(
-                    _Token(
-                        "TEMPLATE_STRING",
-                        template,
-                        line=line,
-                        column=column,
-                        index=index,
-                    )
-                )
-                index += len(template)
-                continue
-            next_char = source[index + 1] if index + 1 < len(source) else ""
-            if next_char.lower() in "0123456789abcdef" or next_char == "_":
-                try:
-                    hex_end = _read_hex_number(source, index + 1)
-                except GMLTranspileError as exc:
-                    raise exc.with_location(line, column) from exc
-                tokens.append(_Token("NUMBER", f"0x{source[index + 1:hex_end].replace('_', '')}", line=line, column=column, index=index))
-                index = hex_end
-            else:
-                tokens.append(_Token("OP", char, line=line, column=column, index=index))
-                index += 1
-            continue
-
-        if char == "#":
-            if _source_startswith_directive(source, index, "#macro"):
-                tokens.append(_Token("DIRECTIVE", "#macro", line=line, column=column, index=index))
-                index += len("#macro")
-                continue
-            previous_index = index - 1
-            while previous_index >= 0 and source[previous_index].isspace():
-                previous_index -= 1
-            if previous_index >= 0 and source[previous_index] == "[":
-                tokens.append(_Token("OP", char, line=line, column=column, index=index))
-                index += 1
-                continue
-            try:
-                color_literal, color_end = _read_hash_color_literal(source, index)
-            except GMLTranspileError as exc:
-                raise exc.with_location(line, column) from exc
-            tokens.append(_Token("NUMBER", color_literal, line=line, column=column, index=index))
-            index = color_end
-            continue
-
-        if char.isalpha() or char == "_":
-            start = index
-            index += 1
-            while index < len(source) and (source[index].isalnum() or source[index] == "_"):
-                index += 1
-            identifier = source[start:index]
-            try:
-                _validate_gml_identifier(identifier)
-            except GMLTranspileError as exc:
-                raise exc.with_location(line, column) from exc
-            block_delimiter = _BLOCK_DELIMITER_REPLACEMENTS.get(identifier)
-            if block_delimiter is not None:
-                tokens.append(_Token("OP", block_delimiter, line=line, column=column, index=start))
-            else:
-                tokens.append(_Token("IDENT", identifier, line=line, column=column, index=start))
-            continue
-
-        matched_operator = None
-        for operator in _MULTI_CHAR_OPERATORS:
-            if source.startswith(operator, index):
-                matched_operator = operator
-                break
-        if matched_operator is not None:
-            tokens.append(_Token("OP", matched_operator, line=line, column=column, index=index))
-            index += len(matched_operator)
-            continue
-
-        if char in "+-*/%&|^~!=<>()[]{}?:,.;.@":
+            tokens.append(_Token("NUMBER", f"0x{source[index + 1:hex_end].replace('_', '')}", line=line, column=column, index=index))
+            return hex_end
+        tokens.append(_Token("OP", char, line=line, column=column, index=index))
+        return index + 1
+
+    if char == "#":
+        if _source_startswith_directive(source, index, "#macro"):
+            tokens.append(_Token("DIRECTIVE", "#macro", line=line, column=column, index=index))
+            return index + len("#macro")
+        previous_index = index - 1
+        while previous_index >= 0 and source[previous_index].isspace():
+            previous_index -= 1
+        if previous_index >= 0 and source[previous_index] == "[":
             tokens.append(_Token("OP", char, line=line, column=column, index=index))
+            return index + 1
+        try:
+            color_literal, color_end = _read_hash_color_literal(source, index)
+        except GMLTranspileError as exc:
+            raise exc.with_location(line, column) from exc
+        tokens.append(_Token("NUMBER", color_literal, line=line, column=column, index=index))
+        return color_end
+
+    if char.isalpha() or char == "_":
+        start = index
+        index += 1
+        while index < len(source) and (source[index].isalnum() or source[index] == "_"):
             index += 1
-            continue
+        identifier = source[start:index]
+        try:
+            _validate_gml_identifier(identifier)
+        except GMLTranspileError as exc:
+            raise exc.with_location(line, column) from exc
+        block_delimiter = _BLOCK_DELIMITER_REPLACEMENTS.get(identifier)
+        if block_delimiter is not None:
+            tokens.append(_Token("OP", block_delimiter, line=line, column=column, index=start))
+        else:
+            tokens.append(_Token("IDENT", identifier, line=line, column=column, index=start))
+        return index
 
-        raise GMLTranspileError(f"Unexpected character: {char}", line=line, column=column)
+    for operator in _MULTI_CHAR_OPERATORS:
+        if source.startswith(operator, index):
+            tokens.append(_Token("OP", operator, line=line, column=column, index=index))
+            return index + len(operator)
 
-    eof_line, eof_column = _line_column_from_newline_positions(
-        newline_positions,
-        len(source),
-    )
-    tokens.append(_Token("EOF", "", line=eof_line, column=eof_column, index=len(source)))
-    return tokens
+    if char in "+-*/%&|^~!=<>()[]{}?:,.;.@":
+        tokens.append(_Token("OP", char, line=line, column=column, index=index))
+        return index + 1
+
+    raise GMLTranspileError(f"Unexpected character: {char}", line=line, column=column)
 
 
 def _line_column(source: str, index: int) -> tuple[int, int]:
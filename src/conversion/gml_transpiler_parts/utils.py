@@ -1,7 +1,8 @@
 # pyright: reportPrivateUsage=false, reportUnusedFunction=false, reportUnusedClass=false
 from __future__ import annotations
 
-from typing import Iterable, Mapping
+from types import MappingProxyType
+from typing import AbstractSet, Iterable, Mapping, TypeVar
 
 from .constants import _ASSIGNMENT_OPERATORS
 from .expression_models import (
@@ -35,6 +36,11 @@ from .shared_models import (
 )
 from .tokens import _line_column, _read_template_string
 
+_V = TypeVar("_V")
+_MISSING = object()
+# Every line boundary str.splitlines() recognizes.
+_LINE_BREAK_CHARACTERS = "\n\r\x0b\x0c\x1c\x1d\x1e\x85\u2028\u2029"
+
 def _normalize_local_names(local_names: Iterable[str] | None) -> frozenset[str]:
     return frozenset(local_names or [])
 
@@ -63,8 +69,42 @@ def _split_top_level_tokens(tokens: Iterable[_Token], separator: str) -> list[li
     return parts
 
 
+class _OriginLine(str):
+    """Emitted GDScript text that remembers the GML token it was parsed from."""
+
+    origin: _Token
+
+    def __new__(cls, text: str, origin: _Token) -> _OriginLine:
+        line = super().__new__(cls, text)
+        line.origin = origin
+        return line
+
+
+def _line_origin(line: str) -> _Token | None:
+    return line.origin if isinstance(line, _OriginLine) else None
+
+
+def _with_origin(lines: Iterable[str], origin: _Token) -> list[str]:
+    """Tag emitted lines that do not carry an origin yet with ``origin``.
+
+    Lines tagged by a nested block keep their more precise origin.
+    """
+    return [
+        line if not line or isinstance(line, _OriginLine) else _OriginLine(line, origin)
+        for line in lines
+    ]
+
+
 def _indent_lines(lines: Iterable[str]) -> list[str]:
-    return [_prefix_multiline(line, "\t") if line else "" for line in lines]
+    indented: list[str] = []
+    for line in lines:
+        if not line:
+            indented.append("")
+        elif isinstance(line, _OriginLine):
+            indented.append(_OriginLine(_prefix_multiline(line, "\t"), line.origin))
+        else:
+            indented.append(_prefix_multiline(line, "\t"))
+    return indented
 
 
 def _prefix_multiline(text: str, prefix: str) -> str:
@@ -180,6 +220,34 @@ def _normalize_scope_context(scope_context: _ScopeContext | None) -> _ScopeConte
     return scope_context if scope_context is not None else _DEFAULT_SCOPE_CONTEXT
 
 
+def _layered_names(base: frozenset[str], additions: Iterable[str] | None) -> frozenset[str]:
+    """Return ``base`` plus ``additions``, sharing ``base`` when nothing is new.
+
+    Project-wide name sets are referenced by every nested scope, so they are
+    only copied when a parser genuinely adds names to them.
+    """
+    if additions is None or additions is base:
+        return base
+    if not base and isinstance(additions, frozenset):
+        return additions
+    if isinstance(additions, AbstractSet):
+        if additions <= base:
+            return base
+        return base | additions
+    extra = frozenset(additions).difference(base)
+    return base | extra if extra else base
+
+
+def _layered_mapping(base: Mapping[str, _V], additions: Mapping[str, _V] | None) -> Mapping[str, _V]:
+    if not additions or additions is base:
+        return base
+    if not base and isinstance(additions, MappingProxyType):
+        return additions
+    if all(base.get(name, _MISSING) is value for name, value in additions.items()):
+        return base
+    return {**base, **additions}
+
+
 def _scope_context_with_global_names(
     scope_context: _ScopeContext,
     global_names: Iterable[str] | None,
@@ -189,28 +257,23 @@ def _scope_context_with_global_names(
     extension_functions: Mapping[str, GMLExtensionFunction] | None = None,
     extension_function_mappings: Mapping[str, GMLExtensionFunctionMapping] | None = None,
 ) -> _ScopeContext:
-    names = set(scope_context.global_names)
-    names.update(global_names or [])
-    assets = set(scope_context.asset_names)
-    assets.update(asset_names or [])
-    extensions = dict(scope_context.extension_functions)
-    extensions.update(extension_functions or {})
-    extension_mappings = dict(scope_context.extension_function_mappings)
-    extension_mappings.update(extension_function_mappings or {})
     return _ScopeContext(
         self_expression=scope_context.self_expression,
         other_expression=scope_context.other_expression,
         instance_target=scope_context.instance_target,
         global_scope=scope_context.global_scope if top_level_global_scope is None else top_level_global_scope,
-        global_names=frozenset(names),
-        asset_names=frozenset(assets),
+        global_names=_layered_names(scope_context.global_names, global_names),
+        asset_names=_layered_names(scope_context.asset_names, asset_names),
         direct_instance_names=scope_context.direct_instance_names,
         dynamic_instance_names=scope_context.dynamic_instance_names,
         static_scope=scope_context.static_scope,
         static_names=scope_context.static_names,
         static_prefix=scope_context.static_prefix if static_prefix is None else static_prefix,
-        extension_functions=extensions,
-        extension_function_mappings=extension_mappings,
+        extension_functions=_layered_mapping(scope_context.extension_functions, extension_functions),
+        extension_function_mappings=_layered_mapping(
+            scope_context.extension_function_mappings,
+            extension_function_mappings,
+        ),
     )
 
 
@@ -219,7 +282,12 @@ def _macro_configuration_matches(configuration: str, active_configuration: str |
         return False
     return configuration.casefold() == active_configuration.casefold()
 
-def _strip_comments(source: str) -> str:
+def _strip_comments(source: str, removed_spans: list[tuple[int, int]] | None = None) -> str:
+    """Remove ``//`` and ``/* */`` comments outside string literals.
+
+    When ``removed_spans`` is given, the ``(start, end)`` source offsets of
+    every removed comment are appended to it in order.
+    """
     result: list[str] = []
     index = 0
     in_string: str | None = None
@@ -265,14 +333,21 @@ def _strip_comments(source: str) -> str:
             continue
 
         if source.startswith("//", index):
+            start = index
             while index < len(source) and source[index] not in "\r\n":
                 index += 1
+            if removed_spans is not None:
+                removed_spans.append((start, index))
             continue
 
         if source.startswith("/*", index):
             end = source.find("*/", index + 2)
             if end == -1:
+                if removed_spans is not None:
+                    removed_spans.append((index, len(source)))
                 break
+            if removed_spans is not None:
+                removed_spans.append((index, end + 2))
             index = end + 2
             continue
 
@@ -282,19 +357,37 @@ def _strip_comments(source: str) -> str:
     return "".join(result)
 
 
-def _join_macro_continuation_lines(source: str) -> str:
+def _join_macro_continuation_lines(source: str, line_starts: list[int] | None = None) -> str:
+    """Join ``#macro`` lines continued with a trailing backslash.
+
+    When ``line_starts`` is given, the ``source`` offset each returned line
+    starts at is appended to it, one entry per returned line.
+    """
     lines: list[str] = []
     pending_macro: str | None = None
-    for line in source.splitlines():
-        current = line if pending_macro is None else f"{pending_macro} {line.lstrip()}"
+    pending_start = 0
+    offset = 0
+    for line in source.splitlines(keepends=True):
+        line_start = offset
+        offset += len(line)
+        line = line.rstrip(_LINE_BREAK_CHARACTERS)
+        if pending_macro is None:
+            current = line
+            pending_start = line_start
+        else:
+            current = f"{pending_macro} {line.lstrip()}"
         if current.lstrip().startswith("#macro") and current.rstrip().endswith("\\"):
             pending_macro = current.rstrip()[:-1].rstrip()
             continue
         lines.append(current)
+        if line_starts is not None:
+            line_starts.append(pending_start)
         pending_macro = None
 
     if pending_macro is not None:
         lines.append(pending_macro)
+        if line_starts is not None:
+            line_starts.append(pending_start)
 
     return "\n".join(lines)
 
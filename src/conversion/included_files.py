@@ -11,7 +11,7 @@ import secrets
 import stat
 import sys
 import tempfile
-from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from concurrent.futures import Future, ThreadPoolExecutor
 from dataclasses import dataclass, field, replace
 from functools import lru_cache
 from typing import Any, BinaryIO, Callable, Iterable, TypeVar, cast
@@ -41,6 +41,7 @@ from src.conversion.project_source_paths import (
     ResolvedProjectSourcePath,
 )
 from src.conversion.type_defs import ConversionRunning, LogCallback, ProgressCallback, StrPath
+from src.conversion.work_queue import BoundedWorkQueue, WorkQueueStats
 
 
 @dataclass(frozen=True)
@@ -128,58 +129,24 @@ def _run_bounded_included_worker_phase(
         [_IncludedWorkerItem, Future[_IncludedWorkerResult]],
         bool,
     ],
+    on_close: Callable[[WorkQueueStats], None] | None = None,
 ) -> bool:
     """Run an Included Files phase with concurrency-proportional bookkeeping."""
     if max_workers < 1:
         raise ValueError("Included Files max_workers must be at least one")
 
-    window_size = max_workers * _INCLUDED_FILES_WORKER_WINDOW_MULTIPLIER
-    item_iterator = iter(items)
-    pending: dict[Future[_IncludedWorkerResult], _IncludedWorkerItem] = {}
-    input_exhausted = False
-    accepting_work = conversion_running()
-    executor = ThreadPoolExecutor(max_workers=max_workers)
-    try:
-        while accepting_work:
-            while not input_exhausted and len(pending) < window_size:
-                if not conversion_running():
-                    accepting_work = False
-                    break
-                try:
-                    item = next(item_iterator)
-                except StopIteration:
-                    input_exhausted = True
-                    break
-                pending[submit(executor, item)] = item
-
-            if not accepting_work or not pending:
-                break
-
-            done, _not_done = wait(
-                tuple(pending),
-                return_when=FIRST_COMPLETED,
-            )
-            completed = tuple(
-                (future, pending[future])
-                for future in tuple(pending)
-                if future in done
-            )
-            for future, _item in completed:
-                del pending[future]
-
-            for future, item in completed:
-                if not consume(item, future):
-                    accepting_work = False
-                    break
-                if not conversion_running():
-                    accepting_work = False
-                    break
-
-        return accepting_work and input_exhausted and not pending
-    finally:
-        for future in pending:
-            future.cancel()
-        executor.shutdown(wait=True, cancel_futures=True)
+    with BoundedWorkQueue(
+        max_workers=max_workers,
+        conversion_running=conversion_running,
+        window=max_workers * _INCLUDED_FILES_WORKER_WINDOW_MULTIPLIER,
+        on_close=on_close,
+    ) as queue:
+        for item, future in queue.submit_each(items, submit):
+            if queue.stopped:
+                return False
+            if not consume(item, future) or not conversion_running():
+                return False
+        return queue.finished
 
 
 @dataclass(frozen=True)
@@ -9979,6 +9946,7 @@ class IncludedFilesConverter(BaseConverter):
             conversion_running=self.conversion_running,
             submit=submit_receipt,
             consume=consume_receipt,
+            on_close=self._work_queue_stats_recorder("included_files_unchanged"),
         )
         if not phase_completed:
             raise _IncludedOutputSetCancelled()
@@ -10901,6 +10869,7 @@ class IncludedFilesConverter(BaseConverter):
                     conversion_running=self.conversion_running,
                     submit=submit_copy,
                     consume=consume_copy,
+                    on_close=self._work_queue_stats_recorder("included_files"),
                 )
                 if not phase_completed and not worker_failed:
                     worker_cancelled = True
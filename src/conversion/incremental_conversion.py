@@ -0,0 +1,312 @@
+"""Source fingerprints that let incremental conversions skip unchanged steps.
+
+A step fingerprint digests the size and modification time of every GameMaker
+source file the step reads, the project-wide inputs every step shares (the
+project file, options and conversion settings), the fingerprints of the steps
+it depends on and the converter code itself. Steps whose fingerprint matches
+the one recorded with the committed generation are not run; the managed-output
+transaction carries their outputs forward exactly like a disabled step.
+
+Invalidation is per step, not per resource: one edited sprite reconverts every
+sprite, and its dependent steps run again. Converters rebuild their whole
+output tree and the generation inventory attributes outputs to steps, so the
+transaction has no per-resource outputs to carry forward. The code steps also
+pre-analyse every GML resource of the project, which ties them to the whole
+code source set anyway.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import stat
+from collections.abc import Iterable, Mapping
+from functools import lru_cache
+from typing import cast
+
+from src.conversion.atomic_generated_text import (
+    atomic_write_confined_generated_text,
+)
+from src.conversion.conversion_plan import (
+    CONVERSION_STEPS,
+    ConversionStep,
+    build_conversion_plan,
+)
+from src.conversion.generation_inventory import GenerationInventory
+from src.version import VERSION
+
+
+INCREMENTAL_STATE_FORMAT_VERSION = 1
+INCREMENTAL_STATE_MAX_BYTES = 1024 * 1024
+INCREMENTAL_STATE_RELATIVE_PATH = os.path.join("gm2godot", "incremental_state.json")
+_INVENTORY_STATE_PATH = INCREMENTAL_STATE_RELATIVE_PATH.replace(os.sep, "/")
+
+# Project steps are cheap and rewrite the shared project.godot, so they always
+# run.
+INCREMENTAL_STEP_KEYS = frozenset(
+    step.key for step in CONVERSION_STEPS if step.group != "project"
+)
+
+# GML-consuming steps pre-analyse every code resource of the project (asset
+# names, enums, macros, instance variables), so they share one source set.
+_CODE_DIRECTORIES = (
+    "animcurves",
+    "extensions",
+    "objects",
+    "paths",
+    "rooms",
+    "scripts",
+    "sequences",
+    "timelines",
+)
+# Directories each step reads besides the project file and options. Inputs
+# of dependency steps are covered by chaining their fingerprints; steps
+# without an entry (the asset registry) fingerprint the whole project.
+_STEP_SOURCE_DIRECTORIES: dict[str, tuple[str, ...]] = {
+    "sprites": ("sprites",),
+    "fonts": ("fonts",),
+    "tilesets": ("tilesets",),
+    "sounds": ("sounds",),
+    "notes": ("notes",),
+    "shaders": ("shaders",),
+    "included_files": ("datafiles",),
+    "scripts": _CODE_DIRECTORIES,
+    "objects": _CODE_DIRECTORIES,
+    "rooms": _CODE_DIRECTORIES,
+}
+_PROJECT_WIDE_DIRECTORIES = ("options",)
+
+
+def _directory_fingerprint(root: str, relative_root: str) -> list[list[object]]:
+    """Return sorted ``[path, size, mtime_ns]`` records below ``root``.
+
+    Hidden entries such as ``.git`` are not project sources and are skipped.
+    """
+    records: list[list[object]] = []
+    pending = [(root, relative_root)]
+    while pending:
+        directory, relative_directory = pending.pop()
+        try:
+            entries = list(os.scandir(directory))
+        except FileNotFoundError:
+            continue
+        for entry in entries:
+            if entry.name.startswith("."):
+                continue
+            relative_path = f"{relative_directory}/{entry.name}"
+            if entry.is_dir(follow_symlinks=False):
+                pending.append((entry.path, relative_path))
+                continue
+            try:
+                entry_stat = entry.stat()
+            except OSError:
+                records.append([relative_path, -1, -1])
+                continue
+            records.append([relative_path, entry_stat.st_size, entry_stat.st_mtime_ns])
+    records.sort(key=lambda record: cast(str, record[0]))
+    return records
+
+
+def _project_file_fingerprint(gm_project_path: str) -> list[list[object]]:
+    """Return records for the regular files at the top of the project."""
+    records: list[list[object]] = []
+    try:
+        entries = list(os.scandir(gm_project_path))
+    except FileNotFoundError:
+        return records
+    for entry in entries:
+        try:
+            entry_stat = entry.stat()
+        except OSError:
+            continue
+        if stat.S_ISREG(entry_stat.st_mode):
+            records.append([entry.name, entry_stat.st_size, entry_stat.st_mtime_ns])
+    records.sort(key=lambda record: cast(str, record[0]))
+    return records
+
+
+@lru_cache(maxsize=1)
+def _converter_code_digest() -> str:
+    """Return a digest of the conversion package so code changes invalidate."""
+    digest = hashlib.sha256(VERSION.encode("utf-8"))
+    package_root = os.path.dirname(os.path.abspath(__file__))
+    for directory, directory_names, file_names in os.walk(package_root):
+        directory_names.sort()
+        for file_name in sorted(file_names):
+            if not file_name.endswith(".py"):
+                continue
+            path = os.path.join(directory, file_name)
+            try:
+                with open(path, "rb") as source_file:
+                    content = source_file.read()
+            except OSError:
+                continue
+            digest.update(os.path.relpath(path, package_root).encode("utf-8"))
+            digest.update(content)
+    return digest.hexdigest()
+
+
+def _digest(payload: object) -> str:
+    encoded = json.dumps(payload, ensure_ascii=True, separators=(",", ":"))
+    return "sha256:" + hashlib.sha256(encoded.encode("utf-8")).hexdigest()
+
+
+def step_source_fingerprints(
+    gm_project_path: str,
+    *,
+    target_platform: str,
+    enabled_converters: Iterable[str],
+    options: Mapping[str, object],
+    steps: Iterable[ConversionStep] = CONVERSION_STEPS,
+) -> dict[str, str]:
+    """Return the source fingerprint of every incremental step.
+
+    ``options`` holds the conversion settings that change generated output;
+    it must be JSON-encodable. The fingerprint of a step also records which of
+    its dependencies are enabled, since a dependency's output can shape it.
+    """
+    root = os.path.abspath(gm_project_path)
+    enabled = frozenset(enabled_converters)
+    directory_records: dict[str, list[list[object]]] = {}
+
+    def records_for(directory_name: str) -> list[list[object]]:
+        records = directory_records.get(directory_name)
+        if records is None:
+            records = _directory_fingerprint(
+                os.path.join(root, directory_name),
+                directory_name,
+            )
+            directory_records[directory_name] = records
+        return records
+
+    project_wide = _digest(
+        [
+            _converter_code_digest(),
+            target_platform,
+            sorted(options.items()),
+            _project_file_fingerprint(root),
+            [records_for(name) for name in _PROJECT_WIDE_DIRECTORIES],
+        ]
+    )
+    step_list = tuple(steps)
+    fingerprints: dict[str, str] = {}
+    for step in build_conversion_plan(
+        (step.key for step in step_list),
+        steps=step_list,
+    ):
+        if step.key not in INCREMENTAL_STEP_KEYS:
+            continue
+        directories = _STEP_SOURCE_DIRECTORIES.get(step.key)
+        if directories is None:
+            sources: object = _directory_fingerprint(root, ".")
+        else:
+            sources = [records_for(name) for name in directories]
+        fingerprints[step.key] = _digest(
+            [
+                step.key,
+                project_wide,
+                sources,
+                [
+                    [dependency, dependency in enabled, fingerprints.get(dependency)]
+                    for dependency in step.dependencies
+                ],
+            ]
+        )
+    return fingerprints
+
+
+def load_incremental_state(
+    generation_root: str,
+    inventory: GenerationInventory,
+) -> dict[str, str]:
+    """Return the step fingerprints recorded with the committed generation.
+
+    The record is trusted only when its bytes match ``inventory``; a missing,
+    altered or malformed record yields no fingerprints, so every step runs.
+    """
+    entry = inventory.by_path().get(_INVENTORY_STATE_PATH)
+    if entry is None or entry.byte_count > INCREMENTAL_STATE_MAX_BYTES:
+        return {}
+    path = os.path.join(generation_root, INCREMENTAL_STATE_RELATIVE_PATH)
+    try:
+        with open(path, "rb") as state_file:
+            content = state_file.read(INCREMENTAL_STATE_MAX_BYTES + 1)
+    except OSError:
+        return {}
+    if "sha256:" + hashlib.sha256(content).hexdigest() != entry.sha256:
+        return {}
+    try:
+        payload = json.loads(content.decode("utf-8"))
+    except (UnicodeDecodeError, ValueError):
+        return {}
+    if not isinstance(payload, dict):
+        return {}
+    state = cast(dict[str, object], payload)
+    if state.get("format_version") != INCREMENTAL_STATE_FORMAT_VERSION:
+        return {}
+    raw_steps = state.get("steps")
+    if not isinstance(raw_steps, dict):
+        return {}
+    return {
+        key: value
+        for key, value in cast(dict[object, object], raw_steps).items()
+        if isinstance(key, str)
+        and key in INCREMENTAL_STEP_KEYS
+        and isinstance(value, str)
+    }
+
+
+def write_incremental_state(
+    generation_root: str,
+    fingerprints: Mapping[str, str],
+) -> None:
+    """Record ``fingerprints`` with the staged generation."""
+    content = json.dumps(
+        {
+            "format_version": INCREMENTAL_STATE_FORMAT_VERSION,
+            "steps": dict(sorted(fingerprints.items())),
+        },
+        ensure_ascii=True,
+        indent=2,
+        sort_keys=True,
+    ) + "\n"
+    atomic_write_confined_generated_text(
+        os.path.join(generation_root, INCREMENTAL_STATE_RELATIVE_PATH),
+        content,
+        confinement_root=generation_root,
+    )
+
+
+def remove_incremental_state(generation_root: str) -> None:
+    """Drop a carried-forward record that no longer describes the outputs."""
+    try:
+        os.remove(os.path.join(generation_root, INCREMENTAL_STATE_RELATIVE_PATH))
+    except FileNotFoundError:
+        pass
+
+
+def up_to_date_steps(
+    requested: Iterable[str],
+    recorded: Mapping[str, str],
+    current: Mapping[str, str],
+) -> frozenset[str]:
+    """Return requested steps whose recorded fingerprint is still current."""
+    return frozenset(
+        key
+        for key in requested
+        if key in current and recorded.get(key) == current[key]
+    )
+
+
+__all__ = [
+    "INCREMENTAL_STATE_FORMAT_VERSION",
+    "INCREMENTAL_STATE_MAX_BYTES",
+    "INCREMENTAL_STATE_RELATIVE_PATH",
+    "INCREMENTAL_STEP_KEYS",
+    "load_incremental_state",
+    "remove_incremental_state",
+    "step_source_fingerprints",
+    "up_to_date_steps",
+    "write_incremental_state",
+]
@@ -2,7 +2,6 @@ from __future__ import annotations
 
 import os
 import shutil
-from concurrent.futures import Future, ThreadPoolExecutor, as_completed
 from dataclasses import dataclass
 
 from src.conversion.base_converter import BaseConverter
@@ -480,33 +479,30 @@ class NoteConverter(BaseConverter):
         total_notes = len(note_assets)
         processed_notes = 0
 
-        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
-            futures_map: dict[Future[_NoteCopyResult | None], str] = {}
-            for asset in note_assets:
-                if asset.subfolder:
-                    dst_file = os.path.join(
-                        godot_notes_path,
-                        asset.subfolder,
-                        asset.name,
-                        os.path.basename(asset.filesystem_path),
-                    )
-                else:
-                    dst_file = os.path.join(
-                        godot_notes_path,
-                        asset.name,
-                        os.path.basename(asset.filesystem_path),
-                    )
-                future = executor.submit(
-                    self._process_note,
-                    asset.filesystem_path,
-                    dst_file,
+        def process(asset: _NoteAsset) -> _NoteCopyResult | None:
+            if asset.subfolder:
+                dst_file = os.path.join(
+                    godot_notes_path,
+                    asset.subfolder,
+                    asset.name,
+                    os.path.basename(asset.filesystem_path),
+                )
+            else:
+                dst_file = os.path.join(
+                    godot_notes_path,
                     asset.name,
-                    asset.owner_source_path,
-                    asset.outcome_key,
+                    os.path.basename(asset.filesystem_path),
                 )
-                futures_map[future] = asset.name
+            return self._process_note(
+                asset.filesystem_path,
+                dst_file,
+                asset.name,
+                asset.owner_source_path,
+                asset.outcome_key,
+            )
 
-            for future in as_completed(futures_map):
+        with self._work_queue("notes") as queue:
+            for _asset, future in queue.map(process, note_assets):
                 result = future.result()
                 if result is None:
                     self.log_callback(get_localized("Console_Convertor_Notes_Stopped"))
@@ -527,6 +523,8 @@ class NoteConverter(BaseConverter):
                             )
                         )
                 self._safe_progress(int((processed_notes / total_notes) * 100))
+            if queue.stopped:
+                self.log_callback(get_localized("Console_Convertor_Notes_Stopped"))
 
     def convert_all(self) -> None:
         self._reset_resource_outcomes()
@@ -3,8 +3,7 @@ import os
 import posixpath
 import re
 import json
-from concurrent.futures import ThreadPoolExecutor, as_completed
-from collections.abc import Mapping, Sequence
+from collections.abc import Mapping
 from dataclasses import dataclass
 from typing import Literal, TypedDict, cast
 
@@ -23,29 +22,24 @@ from src.conversion.generated_paths import (
     generated_nested_resource_path,
 )
 from src.conversion.gml_runtime import write_gml_runtime
+from src.conversion.gml_transpile_engine import (
+    GMLTranspileEngine,
+    GMLTranspileJob,
+    GMLTranspileTables,
+)
 from src.conversion.gml_transpiler import (
     GMLSourceMap,
-    GMLTranspileError,
     analyze_gml_source_identifiers,
     merge_gml_source_maps,
-    transpile_gml_code_with_source_map,
     write_gml_source_map,
 )
 from src.conversion.gml_transpiler_parts.constants import (
-    _ASSIGNMENT_OPERATORS,
-    _BUILTIN_GLOBAL_VARIABLES,
-    _BUILTIN_INSTANCE_VARIABLES,
     _GDSCRIPT_NATIVE_INSTANCE_MEMBER_IDENTIFIERS,
-    _GML_LITERAL_IDENTIFIERS,
 )
-from src.conversion.gml_transpiler_parts.preprocessor import preprocess_gml_source
-from src.conversion.gml_transpiler_parts.shared_models import Token
-from src.conversion.gml_transpiler_parts.tokens import _tokenize
 from src.conversion.project_source_paths import (
     is_safe_project_source_component,
     ProjectSourcePathError,
     ResolvedProjectSourcePath,
-    project_gml_source_paths,
     resolve_project_source_path,
     validate_project_resource_source_path,
 )
@@ -53,8 +47,11 @@ from src.conversion.project_manifest import (
     ProjectManifestDiagnostic,
     load_gamemaker_project_manifest,
 )
-from src.conversion.project_enums import collect_project_enum_values
-from src.conversion.project_macros import collect_project_macro_values
+from src.conversion.project_gml_analysis import (
+    ProjectGMLAnalysis,
+    analyze_project_gml,
+    source_assigned_instance_variable_names,
+)
 from src.conversion.script_generator import (
     ObjectRuntimeConfig,
     SpriteRuntimeConfig,
@@ -62,49 +59,12 @@ from src.conversion.script_generator import (
     generate_script_content,
 )
 from src.conversion.type_defs import ConversionRunning, JsonDict, LogCallback, ProgressCallback, StrPath
+from src.conversion.yy_documents import load_yy_json
 
 _SPRITE_RUNTIME_IDENTIFIER_RE = re.compile(
     r"\b(?:sprite_index|image_(?:alpha|angle|blend|index|number|speed|xscale|yscale))\b"
 )
-_SCRIPT_ASSIGNMENT_OPERATORS = frozenset(_ASSIGNMENT_OPERATORS) | frozenset({"++", "--"})
-_SCRIPT_ASSIGNMENT_SKIP_IDENTIFIERS = (
-    _BUILTIN_GLOBAL_VARIABLES
-    | _BUILTIN_INSTANCE_VARIABLES
-    | _GML_LITERAL_IDENTIFIERS
-    | frozenset(
-        {
-            "break",
-            "case",
-            "catch",
-            "continue",
-            "default",
-            "delete",
-            "do",
-            "else",
-            "enum",
-            "exit",
-            "finally",
-            "for",
-            "function",
-            "global",
-            "globalvar",
-            "if",
-            "new",
-            "repeat",
-            "return",
-            "self",
-            "static",
-            "switch",
-            "then",
-            "throw",
-            "try",
-            "until",
-            "var",
-            "while",
-            "with",
-        }
-    )
-)
+
 
 
 class ParsedObject(TypedDict):
@@ -171,130 +131,6 @@ def _line_offset_for_block(script_content: str, block: str) -> int:
     return 0
 
 
-def _script_assigned_instance_variable_names(
-    source: str,
-    *,
-    asset_names: set[str],
-    macro_configuration: str | None = None,
-) -> set[str]:
-    try:
-        tokens = _tokenize(
-            preprocess_gml_source(
-                source,
-                macro_configuration=macro_configuration,
-            ).source
-        )
-    except GMLTranspileError:
-        return set()
-
-    assigned_names: set[str] = set()
-    local_names = _script_function_parameter_names(tokens)
-    index = 0
-    while index < len(tokens):
-        token = tokens[index]
-        if token.kind == "EOF":
-            break
-        if token.kind == "IDENT" and token.value == "var":
-            local_names.update(_script_var_declaration_names(tokens, index + 1))
-        if token.kind == "IDENT":
-            name = token.value
-            previous_token = tokens[index - 1] if index > 0 else None
-            next_token = tokens[index + 1] if index + 1 < len(tokens) else None
-            if (
-                name not in local_names
-                and name not in asset_names
-                and name not in _SCRIPT_ASSIGNMENT_SKIP_IDENTIFIERS
-                and (previous_token is None or previous_token.value != ".")
-                and _script_identifier_is_assigned(previous_token, next_token)
-            ):
-                assigned_names.add(name)
-        index += 1
-    return assigned_names
-
-
-def _script_identifier_is_assigned(previous_token: Token | None, next_token: Token | None) -> bool:
-    previous_value = previous_token.value if previous_token is not None else None
-    next_value = next_token.value if next_token is not None else None
-    return (
-        next_value in _SCRIPT_ASSIGNMENT_OPERATORS
-        or previous_value in {"++", "--"}
-    )
-
-
-def _script_var_declaration_names(tokens: Sequence[Token], start: int) -> set[str]:
-    names: set[str] = set()
-    index = start
-    depth = 0
-    expect_name = True
-    while index < len(tokens):
-        token = tokens[index]
-        value = token.value
-        kind = token.kind
-        if kind == "EOF":
-            break
-        if depth == 0 and value in {";", "\n"}:
-            break
-        if expect_name:
-            if kind == "IDENT":
-                names.add(str(value))
-                expect_name = False
-            index += 1
-            continue
-        if value in {"(", "[", "{"}:
-            depth += 1
-        elif value in {")", "]", "}"}:
-            if depth <= 0:
-                break
-            depth -= 1
-        elif depth == 0 and value == ",":
-            expect_name = True
-        index += 1
-    return names
-
-
-def _script_function_parameter_names(tokens: Sequence[Token]) -> set[str]:
-    names: set[str] = set()
-    index = 0
-    while index < len(tokens):
-        token = tokens[index]
-        if token.kind == "EOF":
-            break
-        if token.kind == "IDENT" and token.value == "function":
-            open_index = _next_token_value_index(tokens, index + 1, "(")
-            if open_index is not None:
-                close_index = _matching_token_index(tokens, open_index, "(", ")")
-                for parameter_index in range(open_index + 1, close_index):
-                    parameter = tokens[parameter_index]
-                    if parameter.kind == "IDENT":
-                        names.add(parameter.value)
-                index = close_index
-        index += 1
-    return names
-
-
-def _next_token_value_index(tokens: Sequence[Token], start: int, value: str) -> int | None:
-    for index in range(start, len(tokens)):
-        token = tokens[index]
-        if token.kind == "EOF":
-            return None
-        if token.value == value:
-            return index
-    return None
-
-
-def _matching_token_index(tokens: Sequence[Token], open_index: int, open_value: str, close_value: str) -> int:
-    depth = 0
-    for index in range(open_index, len(tokens)):
-        value = tokens[index].value
-        if value == open_value:
-            depth += 1
-        elif value == close_value:
-            depth -= 1
-            if depth == 0:
-                return index
-    return max(open_index, len(tokens) - 1)
-
-
 class ObjectConverter(BaseConverter):
     def __init__(self, gm_project_path: StrPath, godot_project_path: StrPath,
                  log_callback: LogCallback = print, progress_callback: ProgressCallback | None = None,
@@ -309,12 +145,12 @@ class ObjectConverter(BaseConverter):
         self.godot_objects_path = os.path.join(self.godot_project_path, 'objects')
         self.macro_configuration = macro_configuration
         self._project_asset_names_cache: set[str] | None = None
-        self._project_script_instance_variables_cache: set[str] | None = None
-        self._project_enum_values_cache: dict[str, dict[str, int]] | None = None
-        self._project_macro_values_cache: dict[str, str] | None = None
-        self._asset_output_paths: dict[str, dict[str, str]] = {}
+        self._project_gml_analysis_cache: ProjectGMLAnalysis | None = None
+        self._asset_output_paths: Mapping[str, Mapping[str, str]] = {}
         self._object_source_paths: dict[str, str] = {}
         self._project_resource_names_by_path: dict[tuple[str, str], str] | None = None
+        # Shared by the object worker threads while convert_objects() runs.
+        self._transpile_engine: GMLTranspileEngine | None = None
 
     def _get_valid_object_names(self) -> dict[str, str] | None:
         """Parse the .yyp project file and return a dict of object name -> subfolder.
@@ -549,11 +385,7 @@ class ObjectConverter(BaseConverter):
                 )
                 if yyp_source is None or not os.path.isfile(yyp_source.filesystem_path):
                     continue
-                with open(yyp_source.filesystem_path, 'r', encoding='utf-8') as f:
-                    content = f.read()
-
-                cleaned = re.sub(r',\s*([}\]])', r'\1', content)
-                data = cast(JsonDict, json.loads(cleaned))
+                data = load_yy_json(yyp_source.filesystem_path)
 
                 asset_names: set[str] = set()
                 for resource in cast(list[JsonDict], data.get('resources', [])):
@@ -594,52 +426,25 @@ class ObjectConverter(BaseConverter):
         self._project_asset_names_cache = asset_names
         return set(asset_names)
 
-    def _get_project_script_instance_variables(self, asset_names: set[str]) -> set[str]:
-        """Return bare script-assigned names that execute in caller instance scope."""
-        if self._project_script_instance_variables_cache is not None:
-            return set(self._project_script_instance_variables_cache)
-
-        script_instance_variables: set[str] = set()
-        for source_path in project_gml_source_paths(self.gm_project_path):
-            if not source_path.source_path.casefold().startswith("scripts/"):
-                continue
-            try:
-                with open(
-                    source_path.filesystem_path,
-                    "r",
-                    encoding="utf-8",
-                ) as source_file:
-                    source = source_file.read()
-            except OSError:
-                continue
-            script_instance_variables.update(
-                _script_assigned_instance_variable_names(
-                    source,
-                    asset_names=asset_names,
-                    macro_configuration=self.macro_configuration,
-                )
-            )
-        self._project_script_instance_variables_cache = script_instance_variables
-        return set(script_instance_variables)
-
-    def _get_project_enum_values(self) -> dict[str, dict[str, int]]:
-        if self._project_enum_values_cache is None:
-            self._project_enum_values_cache = collect_project_enum_values(
+    def _project_gml_analysis(self) -> ProjectGMLAnalysis:
+        if self._project_gml_analysis_cache is None:
+            self._project_gml_analysis_cache = analyze_project_gml(
                 self.gm_project_path,
                 macro_configuration=self.macro_configuration,
+                max_workers=self.max_workers,
+                conversion_running=self.conversion_running,
             )
-        return {
-            name: dict(members)
-            for name, members in self._project_enum_values_cache.items()
-        }
+        return self._project_gml_analysis_cache
 
-    def _get_project_macro_values(self) -> dict[str, str]:
-        if self._project_macro_values_cache is None:
-            self._project_macro_values_cache = collect_project_macro_values(
-                self.gm_project_path,
-                macro_configuration=self.macro_configuration,
-            )
-        return dict(self._project_macro_values_cache)
+    def _get_project_script_instance_variables(self, asset_names: set[str]) -> set[str]:
+        """Return bare script-assigned names that execute in caller instance scope."""
+        return set(self._project_gml_analysis().script_instance_variables(asset_names))
+
+    def _get_project_enum_values(self) -> Mapping[str, Mapping[str, int]]:
+        return self._project_gml_analysis().enum_values
+
+    def _get_project_macro_values(self) -> Mapping[str, str]:
+        return self._project_gml_analysis().macro_values
 
     def _resolve_object_yy_source(
         self,
@@ -949,10 +754,7 @@ class ObjectConverter(BaseConverter):
             return None
         yy_path = resolved_object.filesystem_path
         try:
-            with open(yy_path, 'r', encoding='utf-8') as f:
-                content = f.read()
-            cleaned = re.sub(r',\s*([}\]])', r'\1', content)
-            data = cast(JsonDict, json.loads(cleaned))
+            data = load_yy_json(yy_path)
 
             sprite_reference = self._resolve_resource_reference(
                 data.get("spriteId"),
@@ -1208,13 +1010,13 @@ class ObjectConverter(BaseConverter):
                     "inherited_event_call": inherited_event_call,
                 }
             )
-            instance_variables.update(
-                _script_assigned_instance_variable_names(
+            assigned_names = self._project_gml_analysis().source_assigned_names(source_path)
+            if assigned_names is None:
+                assigned_names = source_assigned_instance_variable_names(
                     source,
-                    asset_names=asset_name_set,
                     macro_configuration=self.macro_configuration,
                 )
-            )
+            instance_variables.update(assigned_names - asset_name_set)
 
         direct_names = (
             set(_valid_instance_variables(instance_variables))
@@ -1227,56 +1029,77 @@ class ObjectConverter(BaseConverter):
             | _GDSCRIPT_NATIVE_INSTANCE_MEMBER_IDENTIFIERS
         ) - direct_names
 
+        jobs: list[GMLTranspileJob] = []
         for entry in source_entries:
             mapping = entry["mapping"]
-            source_path = entry["source_path"]
-            source = entry["source"]
-            try:
-                self._record_event_source_diagnostics(
-                    source,
-                    source_path,
-                    object_name,
-                    mapping.godot_func,
+            self._record_event_source_diagnostics(
+                entry["source"],
+                entry["source_path"],
+                object_name,
+                mapping.godot_func,
+            )
+            jobs.append(
+                GMLTranspileJob(
+                    entry["source"],
+                    options={
+                        "inherited_event_call": entry["inherited_event_call"],
+                        "static_scope_prefix": f"{object_name}.{mapping.godot_func}",
+                        "source_path": entry["source_path"],
+                        "event": mapping.godot_func,
+                        "preserve_source_comments": True,
+                        "instance_target": "self",
+                        "direct_instance_names": frozenset(direct_names),
+                        "dynamic_instance_names": frozenset(dynamic_names),
+                    },
+                    collect_instance_variables=True,
                 )
-                result = transpile_gml_code_with_source_map(
-                    source,
-                    instance_variables=instance_variables,
-                    inherited_event_call=entry["inherited_event_call"],
-                    macro_configuration=self.macro_configuration,
-                    asset_names=asset_names,
-                    static_scope_prefix=f"{object_name}.{mapping.godot_func}",
-                    source_path=source_path,
+            )
+
+        engine = self._transpile_engine or GMLTranspileEngine(
+            self._transpile_tables(asset_names, enum_values, macro_values)
+        )
+        for entry, outcome in zip(source_entries, engine.transpile(jobs)):
+            mapping = entry["mapping"]
+            instance_variables.update(outcome.instance_variables)
+            if outcome.result is not None:
+                code_bodies[mapping.godot_func] = outcome.result.code
+                source_maps[mapping.godot_func] = outcome.result.source_map
+                continue
+            exc = outcome.error
+            assert exc is not None
+            has_event_blocker = True
+            message = (
+                "Warning: Could not transpile GameMaker event code for "
+                f"{object_name}/{mapping.gml_filename}: {exc}"
+            )
+            if self.diagnostics is not None:
+                self.diagnostics.add_transpile_failure(
+                    message,
+                    source_path=entry["source_path"],
+                    line=exc.line,
+                    column=exc.column,
+                    resource=object_name,
+                    resource_type="object",
                     event=mapping.godot_func,
-                    preserve_source_comments=True,
-                    instance_target="self",
-                    direct_instance_names=direct_names,
-                    dynamic_instance_names=dynamic_names,
-                    enum_values=enum_values,
-                    macro_values=macro_values,
+                    workaround="Split or rewrite unsupported GML for this event, or add the missing runtime/API support tracked by the linked issue.",
                 )
-                code_bodies[mapping.godot_func] = result.code
-                source_maps[mapping.godot_func] = result.source_map
-            except GMLTranspileError as exc:
-                has_event_blocker = True
-                message = (
-                    "Warning: Could not transpile GameMaker event code for "
-                    f"{object_name}/{mapping.gml_filename}: {exc}"
-                )
-                if self.diagnostics is not None:
-                    self.diagnostics.add_transpile_failure(
-                        message,
-                        source_path=source_path,
-                        line=exc.line,
-                        column=exc.column,
-                        resource=object_name,
-                        resource_type="object",
-                        event=mapping.godot_func,
-                        workaround="Split or rewrite unsupported GML for this event, or add the missing runtime/API support tracked by the linked issue.",
-                    )
-                self._safe_log(message)
+            self._safe_log(message)
 
         return code_bodies, instance_variables, source_maps, has_event_blocker
 
+    def _transpile_tables(
+        self,
+        asset_names: set[str] | None,
+        enum_values: Mapping[str, Mapping[str, int]] | None,
+        macro_values: Mapping[str, str] | None,
+    ) -> GMLTranspileTables:
+        return GMLTranspileTables(
+            asset_names=frozenset(asset_names) if asset_names is not None else None,
+            enum_values=enum_values,
+            macro_values=macro_values,
+            macro_configuration=self.macro_configuration,
+        )
+
     def _event_source_path(
         self,
         object_source_path: str,
@@ -1641,6 +1464,8 @@ class ObjectConverter(BaseConverter):
             enum_values=enum_values,
             macro_values=macro_values,
         )
+        if not self.conversion_running():
+            return None
         if has_event_blocker:
             # An object is one logical resource. Publishing a script with only
             # the events with available, readable, supported GML would make the
@@ -1843,54 +1668,62 @@ class ObjectConverter(BaseConverter):
         failed_objects: set[str] = set()
         first_error: Exception | None = None
 
-        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
-            futures_map = {
-                executor.submit(
-                    self._process_requested_object,
-                    name,
-                    object_subfolders.get(name, ""),
-                    sprite_scene_paths,
-                    asset_names,
-                    project_script_instance_variables,
-                    enum_values,
-                    macro_values,
-                    self._object_source_paths.get(name),
-                ): name
-                for name in object_names
-            }
-            for future in as_completed(futures_map):
-                object_name = futures_map[future]
-                try:
-                    result = future.result()
-                except Exception as error:
-                    failed_objects.add(object_name)
-                    if first_error is None:
-                        first_error = error
-                    continue
-                if result is None:
-                    cancelled = True
-                    continue
-
-                processed += 1
-
-                if result["status"] == "completed":
-                    completed_objects.add(object_name)
-                    if self.compact_logging:
-                        self._safe_log_progress(result["name"], processed, total)
-                    else:
-                        if result["has_sprite"]:
-                            self._safe_log(get_localized("Console_Convertor_Objects_ConvertedWithSprite").format(
-                                object_name=result["name"], sprite_name=result["sprite_name"],
-                                event_count=result["event_count"]))
+        transpile_engine = GMLTranspileEngine(
+            self._transpile_tables(asset_names, enum_values, macro_values),
+            max_workers=self.max_workers,
+            conversion_running=self.conversion_running,
+        )
+        self._transpile_engine = transpile_engine
+        try:
+            with self._work_queue("objects") as queue:
+                for object_name, future in queue.map(
+                    lambda name: self._process_requested_object(
+                        name,
+                        object_subfolders.get(name, ""),
+                        sprite_scene_paths,
+                        asset_names,
+                        project_script_instance_variables,
+                        enum_values,
+                        macro_values,
+                        self._object_source_paths.get(name),
+                    ),
+                    object_names,
+                ):
+                    try:
+                        result = future.result()
+                    except Exception as error:
+                        failed_objects.add(object_name)
+                        if first_error is None:
+                            first_error = error
+                        continue
+                    if result is None:
+                        cancelled = True
+                        continue
+
+                    processed += 1
+
+                    if result["status"] == "completed":
+                        completed_objects.add(object_name)
+                        if self.compact_logging:
+                            self._safe_log_progress(result["name"], processed, total)
                         else:
-                            self._safe_log(get_localized("Console_Convertor_Objects_Converted").format(
-                                object_name=result["name"], event_count=result["event_count"]))
-                elif result["status"] == "skipped":
-                    skipped_objects.add(object_name)
-                else:
-                    failed_objects.add(object_name)
-
-                self._safe_progress(int(processed / total * 100))
+                            if result["has_sprite"]:
+                                self._safe_log(get_localized("Console_Convertor_Objects_ConvertedWithSprite").format(
+                                    object_name=result["name"], sprite_name=result["sprite_name"],
+                                    event_count=result["event_count"]))
+                            else:
+                                self._safe_log(get_localized("Console_Convertor_Objects_Converted").format(
+                                    object_name=result["name"], event_count=result["event_count"]))
+                    elif result["status"] == "skipped":
+                        skipped_objects.add(object_name)
+                    else:
+                        failed_objects.add(object_name)
+
+                    self._safe_progress(int(processed / total * 100))
+                cancelled = cancelled or queue.stopped
+        finally:
+            self._transpile_engine = None
+            transpile_engine.close()
 
         for object_name in sorted(completed_objects):
             self._resource_completed(object_name)
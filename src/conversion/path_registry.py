@@ -10,6 +10,7 @@ from src.conversion.project_source_paths import (
     resolve_project_source_path,
 )
 from src.conversion.type_defs import JsonDict
+from src.conversion.yy_documents import read_yy_json
 
 PATH_REGISTRY_RELATIVE_PATH = os.path.join("gm2godot", "gml_path_registry.gd")
 PATH_REGISTRY_RESOURCE_PATH = "res://gm2godot/gml_path_registry.gd"
@@ -178,21 +179,7 @@ def _write_path_scene(godot_project_path: str, entry: PathRegistryEntry) -> None
 
 
 def _read_json_lenient(path: str) -> JsonDict | None:
-    try:
-        with open(path, "r", encoding="utf-8") as f:
-            content = f.read()
-    except OSError:
-        return None
-    try:
-        return cast(JsonDict, json.loads(_strip_trailing_commas(content)))
-    except json.JSONDecodeError:
-        return None
-
-
-def _strip_trailing_commas(content: str) -> str:
-    import re
-
-    return re.sub(r",\s*([}\]])", r"\1", content)
+    return read_yy_json(path)
 
 
 def _number(value: object, default: float) -> float:
@@ -1,4 +1,4 @@
-# pyright: reportPrivateUsage=false
+# pyright: reportPrivateUsage=false, reportUnusedFunction=false
 from __future__ import annotations
 
 from dataclasses import dataclass
@@ -7,11 +7,7 @@ from typing import Mapping, Sequence
 from src.conversion.gml_transpiler_parts.enum_helpers import (
     _evaluate_enum_value_tokens,
 )
-from src.conversion.gml_transpiler_parts.preprocessor import preprocess_gml_source
 from src.conversion.gml_transpiler_parts.shared_models import GMLTranspileError, Token
-from src.conversion.gml_transpiler_parts.tokens import _tokenize
-from src.conversion.project_macros import collect_project_macro_values
-from src.conversion.project_source_paths import project_gml_source_paths
 from src.conversion.type_defs import StrPath
 
 
@@ -33,32 +29,18 @@ def collect_project_enum_values(
     macro_configuration: str | None = None,
 ) -> dict[str, dict[str, int]]:
     """Collect GameMaker's project-global enum constants from GML sources."""
-    token_streams: list[list[Token]] = []
-    for source_path in project_gml_source_paths(gm_project_path):
-        try:
-            with open(source_path.filesystem_path, "r", encoding="utf-8") as source_file:
-                source = source_file.read()
-            preprocessed = preprocess_gml_source(
-                source,
-                macro_configuration=macro_configuration,
-            )
-            token_streams.append(_tokenize(preprocessed.source))
-        except (OSError, GMLTranspileError):
-            # The owning converter will report malformed/unsupported source with
-            # its normal resource-level diagnostic. Enum discovery must not make
-            # unrelated resources unconvertible.
-            continue
+    from src.conversion.project_gml_analysis import analyze_project_gml
 
-    macro_values = collect_project_macro_values(
+    analysis = analyze_project_gml(
         gm_project_path,
         macro_configuration=macro_configuration,
     )
-    declarations = [
-        declaration
-        for tokens in token_streams
-        for declaration in _enum_declarations(tokens)
-    ]
-    return _evaluate_project_enums(declarations, macro_values)
+    return {
+        name: dict(members)
+        for name, members in analysis.enum_values.items()
+    }
+
+
 def _enum_declarations(tokens: Sequence[Token]) -> tuple[_ProjectEnumDeclaration, ...]:
     declarations: list[_ProjectEnumDeclaration] = []
     index = 0
@@ -0,0 +1,400 @@
+# pyright: reportPrivateUsage=false
+from __future__ import annotations
+
+import os
+import threading
+from collections.abc import Iterator, Mapping, Sequence, Set
+from dataclasses import dataclass
+
+from src.conversion.conversion_scope import active_conversion_scope
+from src.conversion.gml_transpile_engine import GMLTranspileEngine, GMLTranspileTables
+from src.conversion.gml_transpiler_parts.constants import (
+    _ASSIGNMENT_OPERATORS,
+    _BUILTIN_GLOBAL_VARIABLES,
+    _BUILTIN_INSTANCE_VARIABLES,
+    _GML_LITERAL_IDENTIFIERS,
+)
+from src.conversion.gml_transpiler_parts.preprocessor import preprocess_gml_source
+from src.conversion.gml_transpiler_parts.shared_models import GMLTranspileError, Token
+from src.conversion.gml_transpiler_parts.tokens import _tokenize
+from src.conversion.project_enums import (
+    _enum_declarations,
+    _evaluate_project_enums,
+    _ProjectEnumDeclaration,
+)
+from src.conversion.project_macros import (
+    _MacroDeclaration,
+    _macro_declarations,
+    _merge_macro_declarations,
+)
+from src.conversion.project_source_paths import project_gml_source_paths
+from src.conversion.type_defs import ConversionRunning, StrPath
+
+
+_SCRIPT_ASSIGNMENT_OPERATORS = frozenset(_ASSIGNMENT_OPERATORS) | frozenset({"++", "--"})
+_SCRIPT_ASSIGNMENT_SKIP_IDENTIFIERS = (
+    _BUILTIN_GLOBAL_VARIABLES
+    | _BUILTIN_INSTANCE_VARIABLES
+    | _GML_LITERAL_IDENTIFIERS
+    | frozenset(
+        {
+            "break",
+            "case",
+            "catch",
+            "continue",
+            "default",
+            "delete",
+            "do",
+            "else",
+            "enum",
+            "exit",
+            "finally",
+            "for",
+            "function",
+            "global",
+            "globalvar",
+            "if",
+            "new",
+            "repeat",
+            "return",
+            "self",
+            "static",
+            "switch",
+            "then",
+            "throw",
+            "try",
+            "until",
+            "var",
+            "while",
+            "with",
+        }
+    )
+)
+
+
+def _assigned_instance_variable_names(tokens: Sequence[Token]) -> frozenset[str]:
+    """Return bare names a source assigns outside its locals and parameters."""
+    assigned_names: set[str] = set()
+    local_names = _script_function_parameter_names(tokens)
+    index = 0
+    while index < len(tokens):
+        token = tokens[index]
+        if token.kind == "EOF":
+            break
+        if token.kind == "IDENT" and token.value == "var":
+            local_names.update(_script_var_declaration_names(tokens, index + 1))
+        if token.kind == "IDENT":
+            name = token.value
+            previous_token = tokens[index - 1] if index > 0 else None
+            next_token = tokens[index + 1] if index + 1 < len(tokens) else None
+            if (
+                name not in local_names
+                and name not in _SCRIPT_ASSIGNMENT_SKIP_IDENTIFIERS
+                and (previous_token is None or previous_token.value != ".")
+                and _script_identifier_is_assigned(previous_token, next_token)
+            ):
+                assigned_names.add(name)
+        index += 1
+    return frozenset(assigned_names)
+
+
+def _script_identifier_is_assigned(previous_token: Token | None, next_token: Token | None) -> bool:
+    previous_value = previous_token.value if previous_token is not None else None
+    next_value = next_token.value if next_token is not None else None
+    return (
+        next_value in _SCRIPT_ASSIGNMENT_OPERATORS
+        or previous_value in {"++", "--"}
+    )
+
+
+def _script_var_declaration_names(tokens: Sequence[Token], start: int) -> set[str]:
+    names: set[str] = set()
+    index = start
+    depth = 0
+    expect_name = True
+    while index < len(tokens):
+        token = tokens[index]
+        value = token.value
+        kind = token.kind
+        if kind == "EOF":
+            break
+        if depth == 0 and value in {";", "\n"}:
+            break
+        if expect_name:
+            if kind == "IDENT":
+                names.add(str(value))
+                expect_name = False
+            index += 1
+            continue
+        if value in {"(", "[", "{"}:
+            depth += 1
+        elif value in {")", "]", "}"}:
+            if depth <= 0:
+                break
+            depth -= 1
+        elif depth == 0 and value == ",":
+            expect_name = True
+        index += 1
+    return names
+
+
+def _script_function_parameter_names(tokens: Sequence[Token]) -> set[str]:
+    names: set[str] = set()
+    index = 0
+    while index < len(tokens):
+        token = tokens[index]
+        if token.kind == "EOF":
+            break
+        if token.kind == "IDENT" and token.value == "function":
+            open_index = _next_token_value_index(tokens, index + 1, "(")
+            if open_index is not None:
+                close_index = _matching_token_index(tokens, open_index, "(", ")")
+                for parameter_index in range(open_index + 1, close_index):
+                    parameter = tokens[parameter_index]
+                    if parameter.kind == "IDENT":
+                        names.add(parameter.value)
+                index = close_index
+        index += 1
+    return names
+
+
+def _next_token_value_index(tokens: Sequence[Token], start: int, value: str) -> int | None:
+    for index in range(start, len(tokens)):
+        token = tokens[index]
+        if token.kind == "EOF":
+            return None
+        if token.value == value:
+            return index
+    return None
+
+
+def _matching_token_index(tokens: Sequence[Token], open_index: int, open_value: str, close_value: str) -> int:
+    depth = 0
+    for index in range(open_index, len(tokens)):
+        value = tokens[index].value
+        if value == open_value:
+            depth += 1
+        elif value == close_value:
+            depth -= 1
+            if depth == 0:
+                return index
+    return max(open_index, len(tokens) - 1)
+
+
+@dataclass(frozen=True)
+class _ProjectGMLSourceJob:
+    source: str
+
+
+@dataclass(frozen=True)
+class _ProjectGMLSourceSummary:
+    enum_declarations: tuple[_ProjectEnumDeclaration, ...] = ()
+    macro_declarations: tuple[_MacroDeclaration, ...] = ()
+    assigned_names: frozenset[str] = frozenset()
+
+
+_EMPTY_SOURCE_SUMMARY = _ProjectGMLSourceSummary()
+
+
+@dataclass(frozen=True)
+class ProjectGMLAnalysis:
+    """Project-wide facts gathered from one pass over every GML source.
+
+    The tables are shared by every converter of a conversion and handed to
+    transpile worker processes as they are, so callers must not mutate them.
+
+    ``assigned_names_by_path`` holds the bare names each source assigns,
+    before asset names are excluded, keyed by :func:`_source_path_key`.
+    """
+
+    enum_values: Mapping[str, Mapping[str, int]]
+    macro_values: Mapping[str, str]
+    script_assigned_names: frozenset[str]
+    assigned_names_by_path: Mapping[str, frozenset[str]]
+
+    def script_instance_variables(self, asset_names: Set[str]) -> frozenset[str]:
+        """Return bare script-assigned names that execute in caller instance scope."""
+        return self.script_assigned_names - asset_names
+
+    def source_assigned_names(self, filesystem_path: str) -> frozenset[str] | None:
+        """Return the names ``filesystem_path`` assigns, or None if not analyzed."""
+        return self.assigned_names_by_path.get(_source_path_key(filesystem_path))
+
+
+def _source_path_key(filesystem_path: str) -> str:
+    return os.path.normcase(os.path.realpath(filesystem_path))
+
+
+def _summarize_source(
+    tables: GMLTranspileTables,
+    job: _ProjectGMLSourceJob,
+) -> _ProjectGMLSourceSummary:
+    try:
+        tokens = _tokenize(
+            preprocess_gml_source(
+                job.source,
+                macro_configuration=tables.macro_configuration,
+            ).source
+        )
+    except GMLTranspileError:
+        # The owning converter reports malformed/unsupported source with its
+        # normal resource-level diagnostic. Discovery must not make unrelated
+        # resources unconvertible.
+        return _EMPTY_SOURCE_SUMMARY
+    return _ProjectGMLSourceSummary(
+        enum_declarations=_enum_declarations(tokens),
+        macro_declarations=_macro_declarations(
+            tokens,
+            macro_configuration=tables.macro_configuration,
+        ),
+        assigned_names=_assigned_instance_variable_names(tokens),
+    )
+
+
+def source_assigned_instance_variable_names(
+    source: str,
+    *,
+    macro_configuration: str | None = None,
+) -> frozenset[str]:
+    """Return the bare names ``source`` assigns outside locals and parameters."""
+    return _summarize_source(
+        GMLTranspileTables(macro_configuration=macro_configuration),
+        _ProjectGMLSourceJob(source),
+    ).assigned_names
+
+
+def analyze_project_gml(
+    gm_project_path: StrPath,
+    *,
+    macro_configuration: str | None = None,
+    max_workers: int | None = None,
+    conversion_running: ConversionRunning | None = None,
+) -> ProjectGMLAnalysis:
+    """Read, preprocess and tokenize every project GML source once.
+
+    Sources are summarized in worker processes for large projects and merged
+    in YYP order, so enums, macros and instance-variable assignments match a
+    sequential scan. During a conversion the result is shared by every
+    converter through the conversion scope's analysis store.
+    """
+    store = active_conversion_scope().gml_analysis
+    if store is not None:
+        return store.get(
+            gm_project_path,
+            macro_configuration=macro_configuration,
+            max_workers=max_workers,
+            conversion_running=conversion_running,
+        )
+    analysis, _complete = _analyze_project_gml(
+        gm_project_path,
+        macro_configuration=macro_configuration,
+        max_workers=max_workers,
+        conversion_running=conversion_running,
+    )
+    return analysis
+
+
+def _analyze_project_gml(
+    gm_project_path: StrPath,
+    *,
+    macro_configuration: str | None,
+    max_workers: int | None,
+    conversion_running: ConversionRunning | None,
+) -> tuple[ProjectGMLAnalysis, bool]:
+    source_paths = project_gml_source_paths(gm_project_path)
+    path_keys: list[str] = []
+    jobs_exhausted = False
+
+    def source_jobs() -> Iterator[_ProjectGMLSourceJob]:
+        nonlocal jobs_exhausted
+        for source_path in source_paths:
+            try:
+                with open(source_path.filesystem_path, "r", encoding="utf-8") as source_file:
+                    source = source_file.read()
+            except OSError:
+                continue
+            path_keys.append(_source_path_key(source_path.filesystem_path))
+            yield _ProjectGMLSourceJob(source)
+        jobs_exhausted = True
+
+    script_keys = {
+        _source_path_key(source_path.filesystem_path)
+        for source_path in source_paths
+        if source_path.source_path.casefold().startswith("scripts/")
+    }
+    enum_declarations: list[_ProjectEnumDeclaration] = []
+    macro_declarations: list[_MacroDeclaration] = []
+    script_assigned_names: set[str] = set()
+    assigned_names_by_path: dict[str, frozenset[str]] = {}
+    summarized = 0
+    with GMLTranspileEngine(
+        GMLTranspileTables(macro_configuration=macro_configuration),
+        max_workers=max_workers or 1,
+        conversion_running=conversion_running,
+    ) as engine:
+        for summarized, (_job, summary) in enumerate(
+            engine.map(_summarize_source, source_jobs()),
+            start=1,
+        ):
+            path_key = path_keys[summarized - 1]
+            enum_declarations.extend(summary.enum_declarations)
+            macro_declarations.extend(summary.macro_declarations)
+            assigned_names_by_path[path_key] = summary.assigned_names
+            if path_key in script_keys:
+                script_assigned_names.update(summary.assigned_names)
+
+    macro_values = _merge_macro_declarations(macro_declarations)
+    analysis = ProjectGMLAnalysis(
+        enum_values=_evaluate_project_enums(enum_declarations, macro_values),
+        macro_values=macro_values,
+        script_assigned_names=frozenset(script_assigned_names),
+        assigned_names_by_path=assigned_names_by_path,
+    )
+    return analysis, jobs_exhausted and summarized == len(path_keys)
+
+
+class ProjectGMLAnalysisStore:
+    """Conversion-scoped cache of :class:`ProjectGMLAnalysis` results.
+
+    Project sources do not change during a conversion, so objects, scripts and
+    later steps share one analysis per project root and macro configuration.
+    Analyses cut short by a stopped conversion are not kept.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._analyses: dict[tuple[str, str | None], ProjectGMLAnalysis] = {}
+
+    def get(
+        self,
+        gm_project_path: StrPath,
+        *,
+        macro_configuration: str | None = None,
+        max_workers: int | None = None,
+        conversion_running: ConversionRunning | None = None,
+    ) -> ProjectGMLAnalysis:
+        root: str = os.fspath(gm_project_path)
+        key = (os.path.normcase(os.path.realpath(root)), macro_configuration)
+        # Held while analyzing so concurrent callers wait for one pass
+        # instead of repeating it.
+        with self._lock:
+            analysis = self._analyses.get(key)
+            if analysis is not None:
+                return analysis
+            analysis, complete = _analyze_project_gml(
+                gm_project_path,
+                macro_configuration=macro_configuration,
+                max_workers=max_workers,
+                conversion_running=conversion_running,
+            )
+            if complete:
+                self._analyses[key] = analysis
+            return analysis
+
+
+__all__ = [
+    "ProjectGMLAnalysis",
+    "ProjectGMLAnalysisStore",
+    "analyze_project_gml",
+    "source_assigned_instance_variable_names",
+]
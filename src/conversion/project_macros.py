@@ -1,16 +1,14 @@
-# pyright: reportPrivateUsage=false
+# pyright: reportPrivateUsage=false, reportUnusedFunction=false
 from __future__ import annotations
 
 from collections.abc import Iterable, Sequence
+from dataclasses import dataclass
 
-from src.conversion.gml_transpiler_parts.preprocessor import preprocess_gml_source
-from src.conversion.gml_transpiler_parts.shared_models import GMLTranspileError, Token
-from src.conversion.gml_transpiler_parts.tokens import _tokenize
+from src.conversion.gml_transpiler_parts.shared_models import Token
 from src.conversion.gml_transpiler_parts.utils import (
     _macro_configuration_matches,
     _tokens_to_source,
 )
-from src.conversion.project_source_paths import project_gml_source_paths
 from src.conversion.type_defs import StrPath
 
 
@@ -25,71 +23,82 @@ def collect_project_macro_values(
     the selected configuration always takes precedence over an unqualified
     declaration, matching GameMaker's configuration override semantics.
     """
-    token_streams: list[list[Token]] = []
-    for source_path in project_gml_source_paths(gm_project_path):
-        try:
-            with open(source_path.filesystem_path, "r", encoding="utf-8") as source_file:
-                source = source_file.read()
-            preprocessed = preprocess_gml_source(
-                source,
-                macro_configuration=macro_configuration,
-            )
-            token_streams.append(_tokenize(preprocessed.source))
-        except (OSError, GMLTranspileError):
-            # The owning resource converter reports malformed/unsupported GML.
-            # Discovery should not prevent unrelated resources from converting.
-            continue
+    from src.conversion.project_gml_analysis import analyze_project_gml
 
-    return _collect_macro_values(
-        token_streams,
+    analysis = analyze_project_gml(
+        gm_project_path,
         macro_configuration=macro_configuration,
     )
-def _collect_macro_values(
-    token_streams: Iterable[Sequence[Token]],
+    return dict(analysis.macro_values)
+
+
+@dataclass(frozen=True)
+class _MacroDeclaration:
+    name: str
+    priority: int
+    value: str
+
+
+def _macro_declarations(
+    tokens: Sequence[Token],
     *,
     macro_configuration: str | None,
-) -> dict[str, str]:
-    values: dict[str, str] = {}
-    priorities: dict[str, int] = {}
-    for tokens in token_streams:
-        index = 0
-        while index < len(tokens):
-            token = tokens[index]
-            if token.kind != "DIRECTIVE" or token.value != "#macro":
-                index += 1
-                continue
+) -> tuple[_MacroDeclaration, ...]:
+    """Return the declarations of one source that apply to the configuration."""
+    declarations: list[_MacroDeclaration] = []
+    index = 0
+    while index < len(tokens):
+        token = tokens[index]
+        if token.kind != "DIRECTIVE" or token.value != "#macro":
+            index += 1
+            continue
+        index += 1
+        if index >= len(tokens) or tokens[index].kind != "IDENT":
+            continue
+
+        configuration_or_name = tokens[index].value
+        index += 1
+        configuration: str | None = None
+        name = configuration_or_name
+        if index < len(tokens) and tokens[index].value == ":":
+            configuration = configuration_or_name
             index += 1
             if index >= len(tokens) or tokens[index].kind != "IDENT":
                 continue
+            name = tokens[index].value
+            index += 1
 
-            configuration_or_name = tokens[index].value
+        value_tokens: list[Token] = []
+        while index < len(tokens) and tokens[index].kind not in {"NEWLINE", "EOF"}:
+            value_tokens.append(tokens[index])
             index += 1
-            configuration: str | None = None
-            name = configuration_or_name
-            if index < len(tokens) and tokens[index].value == ":":
-                configuration = configuration_or_name
-                index += 1
-                if index >= len(tokens) or tokens[index].kind != "IDENT":
-                    continue
-                name = tokens[index].value
-                index += 1
-
-            value_tokens: list[Token] = []
-            while index < len(tokens) and tokens[index].kind not in {"NEWLINE", "EOF"}:
-                value_tokens.append(tokens[index])
-                index += 1
-            if not value_tokens:
-                continue
-            if configuration is not None and not _macro_configuration_matches(
-                configuration,
-                macro_configuration,
-            ):
-                continue
+        if not value_tokens:
+            continue
+        if configuration is not None and not _macro_configuration_matches(
+            configuration,
+            macro_configuration,
+        ):
+            continue
 
-            priority = 1 if configuration is not None else 0
-            if priority >= priorities.get(name, -1):
-                values[name] = _tokens_to_source(value_tokens)
-                priorities[name] = priority
+        declarations.append(
+            _MacroDeclaration(
+                name=name,
+                priority=1 if configuration is not None else 0,
+                value=_tokens_to_source(value_tokens),
+            )
+        )
+    return tuple(declarations)
+
+
+def _merge_macro_declarations(
+    declarations: Iterable[_MacroDeclaration],
+) -> dict[str, str]:
+    values: dict[str, str] = {}
+    priorities: dict[str, int] = {}
+    for declaration in declarations:
+        if declaration.priority >= priorities.get(declaration.name, -1):
+            values[declaration.name] = declaration.value
+            priorities[declaration.name] = declaration.priority
     return values
 
 
@@ -6,6 +6,8 @@ import re
 from dataclasses import dataclass, field
 from typing import Callable, Iterable, Literal, Mapping, cast
 
+from src.conversion.conversion_scope import active_conversion_scope
+from src.conversion.project_snapshot import project_root_key
 from src.conversion.project_source_paths import (
     ProjectSourcePathError,
     resolve_project_filesystem_source_path,
@@ -13,6 +15,7 @@ from src.conversion.project_source_paths import (
     validate_project_resource_source_path,
 )
 from src.conversion.type_defs import JsonDict, JsonList
+from src.conversion.yy_documents import read_yy_document
 
 
 ProjectManifestSeverity = Literal["info", "warning", "error"]
@@ -222,6 +225,32 @@ def load_gamemaker_project_manifest(
     gm_project_path: str,
     *,
     target_platform: str | None = None,
+) -> GameMakerProjectManifest:
+    """Parse the project's ``.yyp`` and options into a manifest.
+
+    During a conversion the manifest is built once per project root and
+    target platform and shared through the active project snapshot.
+    """
+    snapshot = active_conversion_scope().project_snapshot
+    if snapshot is None:
+        return _load_gamemaker_project_manifest(
+            gm_project_path,
+            target_platform=target_platform,
+        )
+    return snapshot.get(
+        ("project_manifest", project_root_key(gm_project_path), target_platform),
+        gm_project_path,
+        lambda: _load_gamemaker_project_manifest(
+            gm_project_path,
+            target_platform=target_platform,
+        ),
+    )
+
+
+def _load_gamemaker_project_manifest(
+    gm_project_path: str,
+    *,
+    target_platform: str | None,
 ) -> GameMakerProjectManifest:
     diagnostics: list[ProjectManifestDiagnostic] = []
     yyp_path = _find_yyp_path(gm_project_path, diagnostics)
@@ -342,13 +371,10 @@ def _find_yyp_path(
 
 
 def _read_lenient_json_file(path: str) -> tuple[JsonDict | None, str]:
-    try:
-        with open(path, "r", encoding="utf-8") as file:
-            source = file.read()
-        data = json.loads(re.sub(r",\s*([}\]])", r"\1", source))
-        return (cast(JsonDict, data), source) if isinstance(data, dict) else (None, source)
-    except (OSError, json.JSONDecodeError, TypeError, ValueError):
+    document = read_yy_document(path, retain_source=True)
+    if document is None:
         return None, ""
+    return document.data, document.source or ""
 
 
 def _parse_resources(
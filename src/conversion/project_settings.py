@@ -1,4 +1,3 @@
-import json
 import os
 import shutil
 import re
@@ -17,6 +16,7 @@ from src.conversion.project_manifest import (
 )
 from src.conversion.project_godot import GodotProjectFile, atomic_rewrite_text, format_godot_string
 from src.conversion.type_defs import ConversionRunning, LogCallback, ProgressCallback
+from src.conversion.yy_documents import read_yy_document
 
 
 ProjectOperationState: TypeAlias = Literal["completed", "skipped", "failed"]
@@ -429,19 +429,13 @@ class ProjectSettingsConverter(BaseConverter):
             )
 
         for candidate_path in candidate_paths:
-            try:
-                with open(candidate_path, "r", encoding="utf-8") as options_file:
-                    source = options_file.read()
-            except OSError as error:
-                return ProjectOperationResult("failed", str(error))
-            try:
-                raw_data = json.loads(re.sub(r",\s*([}\]])", r"\1", source))
-            except (json.JSONDecodeError, TypeError, ValueError):
+            document = read_yy_document(candidate_path)
+            if document is None:
                 return ProjectOperationResult(
-                    "skipped",
-                    f"GameMaker options metadata is malformed: {candidate_path}",
+                    "failed",
+                    f"Could not read GameMaker options metadata: {candidate_path}",
                 )
-            if not isinstance(raw_data, dict):
+            if document.data is None:
                 return ProjectOperationResult(
                     "skipped",
                     f"GameMaker options metadata is malformed: {candidate_path}",
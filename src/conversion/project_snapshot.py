@@ -0,0 +1,126 @@
+from __future__ import annotations
+
+import os
+import threading
+from collections.abc import Callable, Hashable
+from dataclasses import dataclass
+from typing import TypeAlias, TypeVar, cast
+
+from src.conversion.type_defs import StrPath
+
+
+_T = TypeVar("_T")
+
+# ``(name, dev, ino, size, mtime_ns)`` of every top-level ``.yyp`` file.
+ProjectFingerprint: TypeAlias = tuple[tuple[str, int, int, int, int], ...]
+
+
+@dataclass(frozen=True)
+class ProjectSnapshotStats:
+    hits: int
+    misses: int
+    invalidations: int
+    entries: int
+
+
+def project_root_key(gm_project_path: StrPath) -> str:
+    """Return the identity used for ``gm_project_path`` in snapshot keys."""
+    return os.path.normcase(os.path.realpath(os.fspath(gm_project_path)))
+
+
+def project_fingerprint(gm_project_path: StrPath) -> ProjectFingerprint | None:
+    """Return the stat fingerprint of the project's ``.yyp`` files.
+
+    ``None`` means the project root could not be listed; such results are
+    never cached.
+    """
+    root: str = os.fspath(gm_project_path)
+    try:
+        names = sorted(name for name in os.listdir(root) if name.endswith(".yyp"))
+    except OSError:
+        return None
+    fingerprint: list[tuple[str, int, int, int, int]] = []
+    for name in names:
+        try:
+            stat_result = os.stat(os.path.join(root, name))
+        except OSError:
+            continue
+        fingerprint.append(
+            (
+                name,
+                stat_result.st_dev,
+                stat_result.st_ino,
+                stat_result.st_size,
+                stat_result.st_mtime_ns,
+            )
+        )
+    return tuple(fingerprint)
+
+
+def _always() -> bool:
+    return True
+
+
+class ProjectSnapshot:
+    """Conversion-scoped memo of values derived from the whole project.
+
+    The project manifest, asset-registry entries and output-path maps are
+    each built once per project root and settings, then shared as read-only
+    values by every converter. Each entry remembers the ``.yyp`` fingerprint
+    it was built from and is rebuilt when the fingerprint changes; edits to
+    individual resource ``.yy`` files are not tracked, as project sources do
+    not change during a conversion.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._entries: dict[Hashable, tuple[ProjectFingerprint, object]] = {}
+        self._hits = 0
+        self._misses = 0
+        self._invalidations = 0
+
+    def get(
+        self,
+        key: Hashable,
+        gm_project_path: StrPath,
+        build: Callable[[], _T],
+        *,
+        complete: Callable[[], bool] = _always,
+    ) -> _T:
+        """Return the value cached under ``key``, calling ``build`` on a miss.
+
+        Values are only kept when ``complete()`` still holds after building,
+        so a result cut short by a stopped conversion is rebuilt next time.
+        """
+        fingerprint = project_fingerprint(gm_project_path)
+        if fingerprint is None:
+            return build()
+        with self._lock:
+            cached = self._entries.get(key)
+            if cached is not None:
+                if cached[0] == fingerprint:
+                    self._hits += 1
+                    return cast(_T, cached[1])
+                self._invalidations += 1
+            self._misses += 1
+
+        value = build()
+        if complete():
+            with self._lock:
+                self._entries[key] = (fingerprint, value)
+        return value
+
+    def stats(self) -> ProjectSnapshotStats:
+        with self._lock:
+            return ProjectSnapshotStats(
+                hits=self._hits,
+                misses=self._misses,
+                invalidations=self._invalidations,
+                entries=len(self._entries),
+            )
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
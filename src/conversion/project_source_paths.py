@@ -1,16 +1,15 @@
 from __future__ import annotations
 
-import json
 import ntpath
 import os
 import posixpath
-import re
 from dataclasses import dataclass
 from typing import TYPE_CHECKING, Iterable, cast
 
 from src.conversion.event_mapping import is_input_event, map_event, map_input_event
 from src.conversion.events.base import EventMapping
 from src.conversion.type_defs import JsonDict, JsonList, StrPath
+from src.conversion.yy_documents import read_yy_json
 
 if TYPE_CHECKING:
     from src.conversion.project_manifest import ProjectResourceReference
@@ -388,13 +387,7 @@ def project_gml_source_paths(
 
 
 def _read_lenient_json_file(path: str) -> JsonDict | None:
-    try:
-        with open(path, "r", encoding="utf-8") as source_file:
-            source = source_file.read()
-        value = json.loads(re.sub(r",\s*([}\]])", r"\1", source))
-    except (OSError, json.JSONDecodeError, TypeError, ValueError):
-        return None
-    return cast(JsonDict, value) if isinstance(value, dict) else None
+    return read_yy_json(path)
 
 
 def _resource_gml_candidates(
@@ -25,6 +25,21 @@ from src.conversion.type_defs import (
 )
 
 
+_ROOM_SETTINGS_KEYS = (
+    "creationCodeFile",
+    "roomSettings",
+    "physicsSettings",
+    "viewSettings",
+    "views",
+    "instanceCreationOrder",
+    "parentRoom",
+    "inheritCode",
+    "inheritCreationOrder",
+    "inheritLayers",
+    "isDnd",
+)
+
+
 def _empty_json_dict() -> JsonDict:
     return cast(JsonDict, {})
 
@@ -103,11 +118,19 @@ class GameMakerResourceIndex(BaseConverter):
                  update_log_callback: LogCallback | None = None,
                  compact_logging: bool = False,
                  max_workers: int | None = None,
-                 diagnostics: DiagnosticCollector | None = None) -> None:
+                 diagnostics: DiagnosticCollector | None = None,
+                 index_room_layers: bool = True) -> None:
         super().__init__(gm_project_path, godot_project_path, log_callback,
                          progress_callback, conversion_running,
                          update_log_callback, compact_logging,
                          max_workers=max_workers, diagnostics=diagnostics)
+        # Callers that only need room settings skip decoding room layers,
+        # which hold the instance and tile arrays of large rooms. With
+        # index_room_layers=False, IndexedRoom.layers is empty and raw_data
+        # holds only _ROOM_SETTINGS_KEYS. The stream stops once those keys
+        # are read, so a room that is malformed later in the file is indexed
+        # instead of being skipped as malformed.
+        self.index_room_layers = index_room_layers
         self.yyp_path: str | None = None
         self.yyp_data: JsonDict | None = None
         self.project_manifest: GameMakerProjectManifest | None = None
@@ -522,7 +545,10 @@ class GameMakerResourceIndex(BaseConverter):
                 self.rooms[name] = room
 
     def _parse_room(self, resource: IndexedResource) -> IndexedRoom | None:
-        data = self._read_yy_file(resource.yy_path)
+        data = self._read_yy_file(
+            resource.yy_path,
+            None if self.index_room_layers else _ROOM_SETTINGS_KEYS,
+        )
         if data is None:
             self._safe_log(
                 f"Skipping malformed GameMaker room {resource.name}: {resource.yy_path}"
@@ -1,8 +1,6 @@
 from __future__ import annotations
 
-import json
 import os
-import re
 from dataclasses import dataclass, field
 from typing import Literal, cast
 
@@ -15,6 +13,7 @@ from src.conversion.project_source_paths import (
     validate_project_resource_source_path,
 )
 from src.conversion.type_defs import JsonDict, JsonList
+from src.conversion.yy_documents import read_yy_json
 
 
 ResourceModelSeverity = Literal["info", "warning", "error"]
@@ -457,13 +456,7 @@ def _base_kwargs(
 
 
 def _read_lenient_json_file(path: str) -> JsonDict | None:
-    try:
-        with open(path, "r", encoding="utf-8") as file:
-            source = file.read()
-        data = json.loads(re.sub(r",\s*([}\]])", r"\1", source))
-        return cast(JsonDict, data) if isinstance(data, dict) else None
-    except (OSError, json.JSONDecodeError, TypeError, ValueError):
-        return None
+    return read_yy_json(path)
 
 
 def _subfolder_from_raw_data(raw_data: JsonDict) -> str:
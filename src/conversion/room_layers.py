@@ -3,7 +3,13 @@ from __future__ import annotations
 import json
 import os
 import re
-from typing import NamedTuple, Protocol, cast
+import struct
+import sys
+from array import array
+from collections import Counter
+from collections.abc import Iterable, Iterator
+from functools import cache
+from typing import NamedTuple, Protocol, TextIO, cast
 
 from src.conversion.architecture_policy import layer_policy_metadata_lines
 from src.conversion.room_creation_code import (
@@ -11,6 +17,7 @@ from src.conversion.room_creation_code import (
     resolve_instance_creation_code,
 )
 from src.conversion.type_defs import JsonDict, JsonList, JsonValue, LogCallback
+from src.conversion.yy_documents import read_yy_json
 
 
 KNOWN_LAYER_TYPES = {
@@ -40,14 +47,10 @@ class GameMakerTile(NamedTuple):
     rotate: bool
 
 
-class GodotTileCell(NamedTuple):
-    x: int
-    y: int
-    source_id: int
-    atlas_x: int
-    atlas_y: int
-    alternative_tile: int
-    raw_value: int
+class GodotTileMapData(NamedTuple):
+    data: bytes
+    cell_count: int
+    transform_cell_count: int
 
 
 class RoomLayerRoom(Protocol):
@@ -97,12 +100,51 @@ def godot_value(value: JsonValue) -> str:
     return json.dumps(value)
 
 
+class SceneTextWriter:
+    """Write ``.tscn`` lines to a text stream as they are produced.
+
+    Lines are separated by newlines with none after the last one, matching
+    ``"\\n".join(lines)``.
+    """
+
+    def __init__(self, stream: TextIO) -> None:
+        self._stream = stream
+        self._separator = ""
+
+    def append(self, line: str) -> None:
+        self._stream.write(self._separator)
+        self._stream.write(line)
+        self._separator = "\n"
+
+    def extend(self, lines: Iterable[str]) -> None:
+        for line in lines:
+            self.append(line)
+
+    def append_joined(self, parts: Iterable[str]) -> None:
+        """Write one line assembled from ``parts`` without building it first."""
+        self._stream.write(self._separator)
+        for part in parts:
+            self._stream.write(part)
+        self._separator = "\n"
+
+
 class SerializedRoomLayers:
-    def __init__(
-        self, ext_resource_lines: list[str] | None = None, node_lines: list[str] | None = None
-    ) -> None:
-        self.ext_resource_lines = ext_resource_lines or []
-        self.node_lines = node_lines or []
+    """Room layer ``ext_resource`` headers and a writer for the layer nodes.
+
+    The headers are collected by a pass that only resolves resources, so the
+    scene header can be written before any node is serialized.
+    """
+
+    def __init__(self, context: RoomLayerSerializationContext) -> None:
+        self.context = context
+        self.ext_resource_lines = context.ext_resource_lines()
+
+    def write_nodes(self, out: SceneTextWriter) -> None:
+        out.extend(_camera_node_lines(self.context))
+        used_names: dict[str, int] = {}
+        for layer in self.context.room.layers:
+            if isinstance(layer, dict):
+                _serialize_layer(cast(JsonDict, layer), ".", used_names, out, self.context)
 
 
 class RoomLayerSerializationContext:
@@ -120,11 +162,18 @@ class RoomLayerSerializationContext:
         self.warn_callback = warn_callback
         self.creation_code_source_resolver = creation_code_source_resolver
         self.ext_resource_ids: dict[tuple[str, str], str] = {}
+        self.ext_resources_complete = False
         self.creation_order = _instance_creation_order(room)
+        self._existing_resource_paths: dict[tuple[str, str], str | None] = {}
 
     def ext_resource_id(self, resource_type: str, resource_path: str) -> str:
         key = (resource_type, resource_path)
         if key not in self.ext_resource_ids:
+            if self.ext_resources_complete:
+                raise RuntimeError(
+                    f"Room {self.room.name} references {resource_type} {resource_path} "
+                    "after its ext_resource headers were written."
+                )
             self.ext_resource_ids[key] = str(len(self.ext_resource_ids) + 1)
         return self.ext_resource_ids[key]
 
@@ -135,14 +184,7 @@ class RoomLayerSerializationContext:
         return self.ext_resource_id("PackedScene", scene_path)
 
     def object_scene_path(self, object_name: str | None) -> str | None:
-        if not object_name or self.resource_index is None:
-            return None
-        scene_path = self.resource_index.resolve_godot_path("objects", object_name)
-        if scene_path is None:
-            return None
-        if not self._scene_path_exists(scene_path):
-            return None
-        return scene_path
+        return self._existing_resource_path("objects", object_name)
 
     def sprite_scene_ext_resource_id(self, sprite_name: str | None) -> str | None:
         scene_path = self.sprite_scene_path(sprite_name)
@@ -151,14 +193,7 @@ class RoomLayerSerializationContext:
         return self.ext_resource_id("PackedScene", scene_path)
 
     def sprite_scene_path(self, sprite_name: str | None) -> str | None:
-        if not sprite_name or self.resource_index is None:
-            return None
-        scene_path = self.resource_index.resolve_godot_path("sprites", sprite_name)
-        if scene_path is None:
-            return None
-        if not self._scene_path_exists(scene_path):
-            return None
-        return scene_path
+        return self._existing_resource_path("sprites", sprite_name)
 
     def tileset_ext_resource_id(self, tileset_name: str | None) -> str | None:
         tileset_path = self.tileset_path(tileset_name)
@@ -167,14 +202,7 @@ class RoomLayerSerializationContext:
         return self.ext_resource_id("TileSet", tileset_path)
 
     def tileset_path(self, tileset_name: str | None) -> str | None:
-        if not tileset_name or self.resource_index is None:
-            return None
-        tileset_path = self.resource_index.resolve_godot_path("tilesets", tileset_name)
-        if tileset_path is None:
-            return None
-        if not self._resource_path_exists(tileset_path):
-            return None
-        return tileset_path
+        return self._existing_resource_path("tilesets", tileset_name)
 
     def warn(self, message: str) -> None:
         if self.warn_callback is not None:
@@ -190,8 +218,22 @@ class RoomLayerSerializationContext:
             for (resource_type, path), resource_id in self.ext_resource_ids.items()
         ]
 
-    def _scene_path_exists(self, scene_path: str) -> bool:
-        return self._resource_path_exists(scene_path)
+    def _existing_resource_path(self, kind: str, name: str | None) -> str | None:
+        """Return the generated resource for ``name`` if it exists on disk.
+
+        Answers are remembered for the room, so the header pass and the
+        node pass agree and large rooms do not stat the same scene per
+        instance.
+        """
+        if not name or self.resource_index is None:
+            return None
+        key = (kind, name)
+        if key not in self._existing_resource_paths:
+            resource_path = self.resource_index.resolve_godot_path(kind, name)
+            if resource_path is not None and not self._resource_path_exists(resource_path):
+                resource_path = None
+            self._existing_resource_paths[key] = resource_path
+        return self._existing_resource_paths[key]
 
     def _resource_path_exists(self, scene_path: str) -> bool:
         if not scene_path.startswith("res://"):
@@ -214,7 +256,11 @@ def serialize_room_layers(
     warn_callback: LogCallback | None = None,
     creation_code_source_resolver: CreationCodeSourceResolver | None = None,
 ) -> SerializedRoomLayers:
-    """Serialize GameMaker room layers and supported layer children."""
+    """Resolve the external resources of GameMaker room layers.
+
+    The returned value holds the ``ext_resource`` header lines; its
+    ``write_nodes`` streams the layer nodes and supported layer children.
+    """
     context = RoomLayerSerializationContext(
         room,
         gm_project_path,
@@ -222,20 +268,54 @@ def serialize_room_layers(
         warn_callback,
         creation_code_source_resolver,
     )
-    node_lines: list[str] = []
-    node_lines.extend(_camera_node_lines(context))
-    used_names: dict[str, int] = {}
     for layer in room.layers:
         if isinstance(layer, dict):
-            _serialize_layer(cast(JsonDict, layer), ".", used_names, node_lines, context)
-    return SerializedRoomLayers(context.ext_resource_lines(), node_lines)
+            _register_layer_ext_resources(cast(JsonDict, layer), context)
+    context.ext_resources_complete = True
+    return SerializedRoomLayers(context)
+
+
+def _register_layer_ext_resources(
+    layer: JsonDict,
+    context: RoomLayerSerializationContext,
+) -> None:
+    """Assign ext_resource ids in the order the node pass first uses them."""
+    resource_type = _layer_resource_type(layer)
+    if resource_type == "GMRBackgroundLayer":
+        context.sprite_scene_ext_resource_id(_background_sprite_name(layer))
+    elif resource_type == "GMRInstanceLayer":
+        instances = _dict_items(layer.get("instances"))
+        for instance, _order_index, _original_index in _ordered_instances(
+            instances, context.creation_order
+        ):
+            if instance.get("ignore") is True:
+                continue
+            object_name = _dict_value(instance.get("objectId")).get("name")
+            context.object_scene_ext_resource_id(
+                object_name if isinstance(object_name, str) else None
+            )
+    elif resource_type == "GMRTileLayer":
+        tileset_name = _dict_value(layer.get("tilesetId")).get("name")
+        context.tileset_ext_resource_id(
+            tileset_name if isinstance(tileset_name, str) else None
+        )
+    elif resource_type == "GMRAssetLayer":
+        for asset in _dict_items(layer.get("assets")):
+            if asset.get("ignore") is True or _asset_resource_type(asset) != "GMRSpriteGraphic":
+                continue
+            sprite_name = _dict_value(asset.get("spriteId")).get("name")
+            context.sprite_scene_ext_resource_id(
+                sprite_name if isinstance(sprite_name, str) else None
+            )
+    for child_layer in _child_layers(layer):
+        _register_layer_ext_resources(child_layer, context)
 
 
 def _serialize_layer(
     layer: JsonDict,
     parent_path: str,
     sibling_names: dict[str, int],
-    lines: list[str],
+    out: SceneTextWriter,
     context: RoomLayerSerializationContext,
 ) -> None:
     original_name = _layer_name(layer)
@@ -262,21 +342,21 @@ def _serialize_layer(
             )
         )
 
-    lines.extend(_layer_node_lines(layer, node_name, parent_path, original_name, resource_type))
+    out.extend(_layer_node_lines(layer, node_name, parent_path, original_name, resource_type))
 
     child_parent_path = node_name if parent_path == "." else f"{parent_path}/{node_name}"
 
     if resource_type == "GMRBackgroundLayer":
-        lines.extend(_background_visual_lines(layer, child_parent_path, original_name, context))
+        out.extend(_background_visual_lines(layer, child_parent_path, original_name, context))
 
     if resource_type == "GMRInstanceLayer":
-        lines.extend(_instance_node_lines(layer, child_parent_path, original_name, context))
+        _write_instance_nodes(layer, child_parent_path, original_name, context, out)
 
     if resource_type == "GMRTileLayer":
-        lines.extend(_tile_map_layer_lines(layer, child_parent_path, original_name, context))
+        _write_tile_map_layer(layer, child_parent_path, original_name, context, out)
 
     if resource_type == "GMRAssetLayer":
-        lines.extend(_asset_node_lines(layer, child_parent_path, original_name, context))
+        out.extend(_asset_node_lines(layer, child_parent_path, original_name, context))
 
     child_names: dict[str, int] = {}
     for child_layer in _child_layers(layer):
@@ -284,7 +364,7 @@ def _serialize_layer(
             child_layer,
             child_parent_path,
             child_names,
-            lines,
+            out,
             context,
         )
 
@@ -390,60 +470,99 @@ def decode_tile_compressed_data(
     tile_data_format: int = 1,
 ) -> list[int]:
     """Expand GameMaker TileCompressedData format 1 into a row-major cell array."""
+    return decode_tile_compressed_cells(
+        serialise_width,
+        serialise_height,
+        compressed_data,
+        tile_data_format,
+    ).tolist()
+
+
+def decode_tile_compressed_cells(
+    serialise_width: int,
+    serialise_height: int,
+    compressed_data: list[JsonValue],
+    tile_data_format: int = 1,
+) -> array[int]:
+    """Expand GameMaker tile data into a row-major ``array('q')`` of raw values.
+
+    Literal stretches and repeated runs are copied into the array in bulk;
+    runs are checked against the layer size before they are expanded.
+    """
     if tile_data_format not in (0, 1):
         raise ValueError(f"Unsupported GameMaker tile data format: {tile_data_format}")
     if serialise_width < 0 or serialise_height < 0:
         raise ValueError("GameMaker tile data dimensions must be non-negative")
 
     expected_length = serialise_width * serialise_height
+    values = _tile_value_array(compressed_data)
     if tile_data_format == 0:
-        decoded = [
-            _require_int(value, "TileCompressedData value")
-            for value in compressed_data
-        ]
-        if len(decoded) != expected_length:
-            raise ValueError(
-                "Malformed GameMaker tile data: decoded {actual} cells, expected {expected}".format(
-                    actual=len(decoded),
-                    expected=expected_length,
-                )
-            )
-        return decoded
-
-    decoded: list[int] = []
-    index = 0
-    while index < len(compressed_data):
-        value = _require_int(compressed_data[index], "TileCompressedData value")
-        if value < 0 and value != GAMEMAKER_EMPTY_TILE_SENTINEL:
-            if index + 1 >= len(compressed_data):
-                raise ValueError("Malformed GameMaker tile data: repeated run has no value")
-            repeat_value = _require_int(
-                compressed_data[index + 1], "TileCompressedData repeated value"
-            )
-            decoded.extend([repeat_value] * -value)
-            index += 2
-        else:
-            decoded.append(value)
-            index += 1
-
-        if len(decoded) > expected_length:
+        if len(values) != expected_length:
+            raise ValueError(_tile_length_error(len(values), expected_length))
+        return values
+
+    decoded = array("q")
+    literal_start = 0
+    for marker in [
+        index
+        for index, value in enumerate(values)
+        if value < 0 and value != GAMEMAKER_EMPTY_TILE_SENTINEL
+    ]:
+        if marker < literal_start:
+            # A negative repeated value, consumed by the previous run.
+            continue
+        _extend_tile_cells(decoded, values[literal_start:marker], expected_length)
+        if marker + 1 >= len(values):
+            raise ValueError("Malformed GameMaker tile data: repeated run has no value")
+        run_length = -values[marker]
+        if len(decoded) + run_length > expected_length:
             raise ValueError(
-                "Malformed GameMaker tile data: decoded {actual} cells, expected {expected}".format(
-                    actual=len(decoded),
-                    expected=expected_length,
-                )
+                _tile_length_error(len(decoded) + run_length, expected_length)
             )
+        decoded.extend(array("q", (values[marker + 1],)) * run_length)
+        literal_start = marker + 2
+    _extend_tile_cells(decoded, values[literal_start:], expected_length)
 
     if len(decoded) != expected_length:
-        raise ValueError(
-            "Malformed GameMaker tile data: decoded {actual} cells, expected {expected}".format(
-                actual=len(decoded),
-                expected=expected_length,
-            )
-        )
+        raise ValueError(_tile_length_error(len(decoded), expected_length))
     return decoded
 
 
+def _tile_value_array(compressed_data: list[JsonValue]) -> array[int]:
+    try:
+        return array("q", cast(list[int], compressed_data))
+    except TypeError:
+        pass
+    except OverflowError:
+        raise ValueError("TileCompressedData value is out of range") from None
+    try:
+        return array(
+            "q",
+            (
+                _require_int(value, "TileCompressedData value")
+                for value in compressed_data
+            ),
+        )
+    except OverflowError:
+        raise ValueError("TileCompressedData value is out of range") from None
+
+
+def _extend_tile_cells(
+    decoded: array[int], literals: array[int], expected_length: int
+) -> None:
+    if len(decoded) + len(literals) > expected_length:
+        # Report the first cell past the layer, as a cell-by-cell decode would.
+        raise ValueError(_tile_length_error(expected_length + 1, expected_length))
+    decoded.extend(literals)
+
+
+def _tile_length_error(actual: int, expected: int) -> str:
+    return "Malformed GameMaker tile data: decoded {actual} cells, expected {expected}".format(
+        actual=actual,
+        expected=expected,
+    )
+
+
 def is_empty_gamemaker_tile(raw_value: int) -> bool:
     if raw_value == GAMEMAKER_EMPTY_TILE_SENTINEL:
         return True
@@ -481,12 +600,31 @@ def gamemaker_tile_transform_to_godot(
     return alternative_tile
 
 
-def _tile_map_layer_lines(
+# Indexed by the GameMaker mirror, flip and rotate bits (28-30) as bits 0-2.
+_GODOT_ALTERNATIVE_TILE_BY_FLAGS = tuple(
+    gamemaker_tile_transform_to_godot(
+        mirror=bool(flags & 0b001),
+        flip=bool(flags & 0b010),
+        rotate=bool(flags & 0b100),
+    )
+    for flags in range(8)
+)
+# tile_map_data starts with a uint16 format version (0), then one record per cell.
+_TILE_MAP_HEADER = b"\x00\x00"
+_TILE_MAP_CELL_VALUES = 6
+# Cells rendered per text slice when streaming tile layers into a scene.
+_TILE_TEXT_SLICE_CELLS = 1 << 16
+_TILE_MAP_CELL_TAIL = struct.Struct("<4H")
+_UINT16 = struct.Struct("<H")
+
+
+def _write_tile_map_layer(
     layer: JsonDict,
     parent_path: str,
     layer_name: str,
     context: RoomLayerSerializationContext,
-) -> list[str]:
+    out: SceneTextWriter,
+) -> None:
     tileset_id = _dict_value(layer.get("tilesetId"))
     raw_tileset_name = tileset_id.get("name")
     tileset_name = raw_tileset_name if isinstance(raw_tileset_name, str) else None
@@ -500,7 +638,7 @@ def _tile_map_layer_lines(
                 tileset_name=tileset_name or "<missing>",
             )
         )
-        return []
+        return
 
     tiles = _dict_value(layer.get("tiles"))
     width = _coerce_int(tiles.get("SerialiseWidth", 0))
@@ -512,7 +650,7 @@ def _tile_map_layer_lines(
         compressed_data = cast(list[JsonValue], raw_compressed_data)
 
     try:
-        decoded_tiles = decode_tile_compressed_data(
+        decoded_tiles = decode_tile_compressed_cells(
             width,
             height,
             compressed_data,
@@ -527,17 +665,12 @@ def _tile_map_layer_lines(
                 error=error,
             )
         )
-        return []
+        return
 
     layout = _tileset_layout(context, tileset_name)
     columns = _tileset_columns(layout, decoded_tiles)
-    cells = _godot_tile_cells(decoded_tiles, width, columns)
-    tile_map_data = _format_godot_tile_map_data(cells)
-    transform_count = sum(
-        1 for cell in cells if decode_gamemaker_tile(cell.raw_value).mirror
-        or decode_gamemaker_tile(cell.raw_value).flip
-        or decode_gamemaker_tile(cell.raw_value).rotate
-    )
+    tile_map = encode_godot_tile_map_data(decoded_tiles, width, columns)
+    transform_count = tile_map.transform_cell_count
 
     if transform_count:
         context.warn(
@@ -548,15 +681,17 @@ def _tile_map_layer_lines(
             )
         )
 
-    lines = [
+    out.extend([
         f'[node name="TileMap" type="TileMapLayer" parent={godot_string(parent_path)}]',
         f"visible = {godot_value(bool(layer.get('visible', True)))}",
         "position = Vector2(0, 0)",
         f'tile_set = ExtResource("{ext_resource_id}")',
-    ]
-    if tile_map_data:
-        lines.append(f"tile_map_data = {tile_map_data}")
-    lines.extend([
+    ])
+    if tile_map.data:
+        out.append_joined(
+            ("tile_map_data = ", *_godot_tile_map_data_parts(tile_map.data))
+        )
+    out.extend([
         'metadata/gamemaker_layer_element_type = "tilemap"',
         "metadata/gamemaker_tile_layer = true",
         f"metadata/gamemaker_tileset = {godot_value(tileset_name)}",
@@ -564,20 +699,27 @@ def _tile_map_layer_lines(
         f"metadata/gamemaker_tile_height = {godot_value(height)}",
         f"metadata/gamemaker_tile_data_format = {godot_value(tile_data_format)}",
         f"metadata/gamemaker_tile_decoded_cell_count = {godot_value(len(decoded_tiles))}",
-        f"metadata/gamemaker_tile_non_empty_cell_count = {godot_value(len(cells))}",
+        f"metadata/gamemaker_tile_non_empty_cell_count = {godot_value(tile_map.cell_count)}",
         f"metadata/gamemaker_tile_transform_cell_count = {godot_value(transform_count)}",
         f"metadata/gamemaker_tile_empty_values = {godot_value([0, GAMEMAKER_EMPTY_TILE_SENTINEL])}",
-        "metadata/gamemaker_tile_raw_values = {values}".format(
-            values=godot_value(
-                [
-                    0 if value == GAMEMAKER_EMPTY_TILE_SENTINEL else value
-                    for value in decoded_tiles
-                ]
-            )
-        ),
     ])
-    lines.append("")
-    return lines
+    out.append_joined(
+        ("metadata/gamemaker_tile_raw_values = ", *_tile_raw_value_parts(decoded_tiles))
+    )
+    out.append("")
+
+
+def _tile_raw_value_parts(decoded_tiles: array[int]) -> Iterator[str]:
+    """Yield the JSON list of raw tile values, with empty cells as 0, in slices."""
+    yield "["
+    for start in range(0, len(decoded_tiles), _TILE_TEXT_SLICE_CELLS):
+        if start:
+            yield ", "
+        yield ", ".join(map(str, [
+            0 if value == GAMEMAKER_EMPTY_TILE_SENTINEL else value
+            for value in decoded_tiles[start:start + _TILE_TEXT_SLICE_CELLS]
+        ]))
+    yield "]"
 
 
 def _tileset_layout(
@@ -592,78 +734,97 @@ def _tileset_layout(
     return data or {}
 
 
-def _tileset_columns(layout: JsonDict, decoded_tiles: list[int]) -> int:
+def _tileset_columns(layout: JsonDict, decoded_tiles: array[int]) -> int:
     columns = _coerce_int(layout.get("out_columns", 0))
     if columns > 0:
         return columns
     tile_count = _coerce_int(layout.get("tile_count", 0))
     if tile_count > 0:
         return tile_count
-    max_index = max((decode_gamemaker_tile(value).tile_index for value in decoded_tiles), default=1)
+    max_index = max((value & GAMEMAKER_TILE_INDEX_MASK for value in decoded_tiles), default=1)
     return max(1, max_index)
 
 
-def _godot_tile_cells(
-    decoded_tiles: list[int], width: int, columns: int
-) -> list[GodotTileCell]:
-    cells: list[GodotTileCell] = []
+def encode_godot_tile_map_data(
+    decoded_tiles: array[int], width: int, columns: int
+) -> GodotTileMapData:
+    """Pack the non-empty cells of a decoded layer into Godot ``tile_map_data``.
+
+    Each cell is six little-endian uint16 values (x, y, source, atlas x,
+    atlas y, alternative) after a two-byte format header. The source, atlas
+    and alternative part is packed once per distinct raw tile value, so the
+    per-cell work is joining precomputed byte strings, one row at a time.
+    """
+    empty = GodotTileMapData(data=b"", cell_count=0, transform_cell_count=0)
     if width <= 0 or columns <= 0:
-        return cells
-    for index, raw_tile in enumerate(decoded_tiles):
-        if is_empty_gamemaker_tile(raw_tile):
+        return empty
+    raw_counts = Counter(decoded_tiles)
+    cell_tails: dict[int, bytes] = {}
+    cell_count = 0
+    transform_cell_count = 0
+    for raw_tile, count in raw_counts.items():
+        tile_index = raw_tile & GAMEMAKER_TILE_INDEX_MASK
+        if raw_tile == GAMEMAKER_EMPTY_TILE_SENTINEL or not tile_index:
             continue
-        tile = decode_gamemaker_tile(raw_tile)
-        atlas_index = max(0, tile.tile_index - 1)
-        alternative_tile = gamemaker_tile_transform_to_godot(
-            mirror=tile.mirror,
-            flip=tile.flip,
-            rotate=tile.rotate,
+        flags = (raw_tile >> 28) & 0b111
+        cell_count += count
+        if flags:
+            transform_cell_count += count
+        atlas_y, atlas_x = divmod(tile_index - 1, columns)
+        cell_tails[raw_tile] = _TILE_MAP_CELL_TAIL.pack(
+            0,
+            atlas_x & 0xFFFF,
+            atlas_y & 0xFFFF,
+            _GODOT_ALTERNATIVE_TILE_BY_FLAGS[flags],
         )
-        cells.append(
-            GodotTileCell(
-                x=index % width,
-                y=index // width,
-                source_id=0,
-                atlas_x=atlas_index % columns,
-                atlas_y=atlas_index // columns,
-                alternative_tile=alternative_tile,
-                raw_value=raw_tile,
-            )
-        )
-    return cells
+    if not cell_tails:
+        return empty
+
+    x_bytes = [_UINT16.pack(x & 0xFFFF) for x in range(width)]
+    data = bytearray(_TILE_MAP_HEADER)
+    for y, row_start in enumerate(range(0, len(decoded_tiles), width)):
+        y_bytes = _UINT16.pack(y & 0xFFFF)
+        data += b"".join([
+            x_bytes[x] + y_bytes + tail
+            for x, raw_tile in enumerate(decoded_tiles[row_start:row_start + width])
+            if (tail := cell_tails.get(raw_tile)) is not None
+        ])
+    return GodotTileMapData(
+        data=bytes(data),
+        cell_count=cell_count,
+        transform_cell_count=transform_cell_count,
+    )
 
 
-def _format_godot_tile_map_data(cells: list[GodotTileCell]) -> str:
-    if not cells:
+def format_godot_tile_map_data(data: bytes) -> str:
+    """Render packed ``tile_map_data`` as a ``PackedByteArray(...)`` literal."""
+    if not data:
         return ""
-    data: list[int] = [0, 0]
-    for cell in cells:
-        for value in (
-            cell.x,
-            cell.y,
-            cell.source_id,
-            cell.atlas_x,
-            cell.atlas_y,
-            cell.alternative_tile,
-        ):
-            data.extend(_encode_uint16(value))
-    return "PackedByteArray({values})".format(values=", ".join(str(value) for value in data))
-
-
-def _encode_uint16(value: int) -> list[int]:
-    unsigned = value & 0xFFFF
-    return [unsigned & 0xFF, (unsigned >> 8) & 0xFF]
+    return "".join(_godot_tile_map_data_parts(data))
+
+
+def _godot_tile_map_data_parts(data: bytes) -> Iterator[str]:
+    byte_decimals = _uint16_byte_decimals().__getitem__
+    values = memoryview(data).cast("H")
+    slice_values = _TILE_TEXT_SLICE_CELLS * _TILE_MAP_CELL_VALUES
+    yield "PackedByteArray("
+    for start in range(0, len(values), slice_values):
+        if start:
+            yield ", "
+        yield ", ".join(map(byte_decimals, values[start:start + slice_values]))
+    yield ")"
+
+
+@cache
+def _uint16_byte_decimals() -> tuple[str, ...]:
+    """Return the two decimal bytes of every native-order uint16 value."""
+    return tuple(
+        "{}, {}".format(*value.to_bytes(2, sys.byteorder)) for value in range(1 << 16)
+    )
 
 
 def _read_yy_json(path: str) -> JsonDict | None:
-    try:
-        with open(path, "r", encoding="utf-8") as f:
-            content = f.read()
-        cleaned = re.sub(r",\s*([}\]])", r"\1", content)
-        data = json.loads(cleaned)
-    except (OSError, json.JSONDecodeError):
-        return None
-    return cast(JsonDict, data) if isinstance(data, dict) else None
+    return read_yy_json(path)
 
 
 def _asset_node_lines(
@@ -1136,13 +1297,13 @@ def _format_color_component(value: float) -> str:
     return ("{:.6f}".format(value)).rstrip("0").rstrip(".")
 
 
-def _instance_node_lines(
+def _write_instance_nodes(
     layer: JsonDict,
     parent_path: str,
     layer_name: str,
     context: RoomLayerSerializationContext,
-) -> list[str]:
-    lines: list[str] = []
+    out: SceneTextWriter,
+) -> None:
     instances = _dict_items(layer.get("instances"))
     ordered_instances = _ordered_instances(instances, context.creation_order)
     sibling_names: dict[str, int] = {}
@@ -1177,7 +1338,7 @@ def _instance_node_lines(
                 )
             )
 
-        lines.extend(
+        out.extend(
             _instance_scene_lines(
                 instance,
                 node_name,
@@ -1189,7 +1350,6 @@ def _instance_node_lines(
                 context,
             )
         )
-    return lines
 
 
 def _instance_scene_lines(
@@ -4,9 +4,11 @@ import json
 import os
 import posixpath
 import re
-from concurrent.futures import ThreadPoolExecutor, as_completed
+import tempfile
+from collections.abc import Generator
+from contextlib import contextmanager
 from dataclasses import dataclass
-from typing import Literal, TypedDict, cast
+from typing import Literal, TextIO, TypedDict, cast
 
 from src.conversion.asset_registry import AssetRegistryConverter
 from src.conversion.base_converter import BaseConverter
@@ -16,7 +18,12 @@ from src.conversion.architecture_policy import (
     room_root_metadata_lines,
 )
 from src.conversion.diagnostics import DiagnosticCollector
-from src.conversion.gml_transpiler import GMLTranspileError, transpile_gml_code
+from src.conversion.gml_transpile_engine import (
+    GMLTranspileEngine,
+    GMLTranspileJob,
+    GMLTranspileTables,
+)
+from src.conversion.gml_transpiler import GMLTranspileError
 from src.conversion.project_godot import GodotProjectFile
 from src.conversion.project_source_paths import (
     ProjectSourcePathError,
@@ -31,7 +38,7 @@ from src.conversion.room_creation_code import (
     resolve_instance_creation_code,
     resolve_room_creation_code,
 )
-from src.conversion.room_layers import godot_string, serialize_room_layers
+from src.conversion.room_layers import SceneTextWriter, godot_string, serialize_room_layers
 from src.conversion.type_defs import ConversionRunning, JsonDict, LogCallback, ProgressCallback, StrPath
 
 ROOM_RUNTIME_SCRIPT_RELATIVE_PATH = os.path.join("gm2godot", "gml_room_node.gd")
@@ -77,6 +84,37 @@ def _gdscript_identifier_suffix(value: str, fallback: str) -> str:
     return identifier
 
 
+@contextmanager
+def _staged_text_output(output_path: str) -> Generator[TextIO, None, None]:
+    """Stream text to ``output_path`` without exposing a partial file.
+
+    The text goes to a temporary file next to ``output_path`` that replaces
+    it only once the ``with`` block succeeds; on failure the temporary file
+    is removed and any existing output is left untouched.
+    """
+    output_directory = os.path.dirname(output_path) or os.curdir
+    file_descriptor, staged_path = tempfile.mkstemp(
+        dir=output_directory,
+        prefix=f".{os.path.basename(output_path)}.",
+        suffix=".tmp",
+    )
+    staged_pending = True
+    try:
+        with os.fdopen(file_descriptor, "w", encoding="utf-8") as staged_file:
+            file_descriptor = -1
+            yield staged_file
+        os.replace(staged_path, output_path)
+        staged_pending = False
+    finally:
+        if file_descriptor >= 0:
+            os.close(file_descriptor)
+        if staged_pending:
+            try:
+                os.unlink(staged_path)
+            except FileNotFoundError:
+                pass
+
+
 def _dict_items(value: object) -> list[JsonDict]:
     if not isinstance(value, list):
         return []
@@ -170,6 +208,8 @@ class RoomConverter(BaseConverter):
         self.godot_rooms_path = os.path.join(self.godot_project_path, "rooms")
         self.resource_index = resource_index
         self._asset_names_cache: set[str] | None = None
+        # Shared by the room worker threads while convert_rooms() runs.
+        self._transpile_engine: GMLTranspileEngine | None = None
 
     def _build_resource_index(self) -> GameMakerResourceIndex:
         if self.resource_index is not None:
@@ -277,13 +317,19 @@ class RoomConverter(BaseConverter):
             )
         self._safe_log(message)
 
-    def _generate_room_scene(
+    def _write_room_scene(
         self,
+        scene_file: TextIO,
         room: IndexedRoom,
         resource_index: GameMakerResourceIndex | None = None,
         room_script_resource_path: str | None = None,
         source_resolver: CreationCodeSourceResolver | None = None,
-    ) -> str:
+    ) -> None:
+        """Stream the room scene into ``scene_file``.
+
+        Layer ``ext_resource`` headers are resolved first; nodes are then
+        written one at a time, so memory does not grow with the room.
+        """
         room_settings = room.room_settings
         physics_settings = room.physics_settings
         room_creation_code = resolve_room_creation_code(
@@ -302,6 +348,7 @@ class RoomConverter(BaseConverter):
         )
 
         script_resource_path = room_script_resource_path or ROOM_RUNTIME_SCRIPT_RESOURCE_PATH
+        out = SceneTextWriter(scene_file)
         if serialized_layers.ext_resource_lines:
             lines = [
                 f"[gd_scene format=3 load_steps={len(serialized_layers.ext_resource_lines) + 2}]",
@@ -359,8 +406,8 @@ class RoomConverter(BaseConverter):
         lines.extend(room_root_metadata_lines())
         lines.append("")
         lines.extend(gui_canvas_layer_node_lines())
-        lines.extend(serialized_layers.node_lines)
-        return "\n".join(lines)
+        out.extend(lines)
+        serialized_layers.write_nodes(out)
 
     def _room_output_path(self, room: IndexedRoom) -> str:
         if room.godot_path.startswith("res://"):
@@ -394,29 +441,33 @@ class RoomConverter(BaseConverter):
         )
         room_creation_body: str | None = None
         has_creation_code_blocker = False
+        jobs: list[GMLTranspileJob] = []
+        # (source path, event label, instance name or None for the room)
+        job_targets: list[tuple[str, str, str | None]] = []
         if room_creation_code.has_code:
+            label = "room creation code"
             try:
                 self._require_creation_code_source(
                     room_creation_code,
                     room_name=room.name,
-                    event="room creation code",
+                    event=label,
                     missing_message=(
                         "Warning: Missing GameMaker room creation code file for room "
                         f"{room.name}: {room_creation_code.source_path}"
                     ),
                 )
-                room_creation_body = self._transpile_creation_code(
-                    room_creation_code.source_path,
-                    room.name,
-                    "room creation code",
-                    asset_names=asset_names,
-                    top_level_global_scope=True,
+                jobs.append(
+                    self._creation_code_job(
+                        room_creation_code.source_path,
+                        room.name,
+                        label,
+                        top_level_global_scope=True,
+                    )
                 )
+                job_targets.append((room_creation_code.source_path, label, None))
             except _RoomCreationCodeBlocked:
                 has_creation_code_blocker = True
 
-        instance_methods: list[InstanceCreationCodeMethod] = []
-        used_method_names: dict[str, int] = {}
         for instance in _iter_room_instances(room.layers):
             creation_code = resolve_instance_creation_code(
                 room,
@@ -439,27 +490,56 @@ class RoomConverter(BaseConverter):
                         f"{creation_code.source_path}"
                     ),
                 )
-                body = self._transpile_creation_code(
-                    creation_code.source_path,
-                    room.name,
-                    event,
-                    asset_names=asset_names,
-                    self_expression="_gm_instance",
-                    other_expression="GMRuntime.gml_instance_noone()",
-                    instance_target="_gm_instance",
+                jobs.append(
+                    self._creation_code_job(
+                        creation_code.source_path,
+                        room.name,
+                        event,
+                        self_expression="_gm_instance",
+                        other_expression="GMRuntime.gml_instance_noone()",
+                        instance_target="_gm_instance",
+                    )
                 )
+                job_targets.append((creation_code.source_path, event, instance_name))
             except _RoomCreationCodeBlocked:
                 has_creation_code_blocker = True
+
+        instance_methods: list[InstanceCreationCodeMethod] = []
+        used_method_names: dict[str, int] = {}
+        engine = self._transpile_engine or GMLTranspileEngine(
+            GMLTranspileTables(asset_names=frozenset(asset_names))
+        )
+        transpiled = 0
+        for (source_path, label, instance_name), outcome in zip(
+            job_targets,
+            engine.transpile(jobs),
+        ):
+            transpiled += 1
+            if outcome.result is None:
+                assert outcome.error is not None
+                self._report_creation_code_transpile_failure(
+                    outcome.error,
+                    source_path,
+                    room.name,
+                    label,
+                )
+                has_creation_code_blocker = True
+                continue
+            if instance_name is None:
+                room_creation_body = outcome.result.code
                 continue
             method_name = self._unique_instance_creation_method_name(
                 instance_name,
                 used_method_names,
             )
             instance_methods.append({
-                "source_path": creation_code.source_path,
+                "source_path": source_path,
                 "method_name": method_name,
-                "body": body,
+                "body": outcome.result.code,
             })
+        if transpiled < len(jobs):
+            # Conversion was stopped while creation code was transpiling.
+            return None
 
         if has_creation_code_blocker:
             raise _RoomCreationCodeBlocked(
@@ -500,18 +580,17 @@ class RoomConverter(BaseConverter):
         self._safe_log(missing_message)
         raise _RoomCreationCodeBlocked(missing_message)
 
-    def _transpile_creation_code(
+    def _creation_code_job(
         self,
         source_path: str,
         room_name: str,
         label: str,
         *,
-        asset_names: set[str],
         top_level_global_scope: bool = False,
         self_expression: str = "self",
         other_expression: str = "other",
         instance_target: str | None = None,
-    ) -> str:
+    ) -> GMLTranspileJob:
         try:
             with open(source_path, "r", encoding="utf-8") as f:
                 source = f.read()
@@ -542,44 +621,50 @@ class RoomConverter(BaseConverter):
             self._safe_log(message)
             raise _RoomCreationCodeBlocked(message) from exc
 
-        try:
-            return transpile_gml_code(
-                source,
-                asset_names=asset_names,
-                top_level_global_scope=top_level_global_scope,
+        return GMLTranspileJob(
+            source,
+            options={
+                "top_level_global_scope": top_level_global_scope,
+                "source_path": source_path,
+                "event": label,
+                "preserve_source_comments": True,
+                "self_expression": self_expression,
+                "other_expression": other_expression,
+                "instance_target": instance_target,
+            },
+        )
+
+    def _report_creation_code_transpile_failure(
+        self,
+        exc: GMLTranspileError,
+        source_path: str,
+        room_name: str,
+        label: str,
+    ) -> None:
+        message = (
+            "Warning: Could not transpile GameMaker {label} for room {room}: {path}: {error}".format(
+                label=label,
+                room=room_name,
+                path=source_path,
+                error=exc,
+            )
+        )
+        if self.diagnostics is not None:
+            self.diagnostics.add_transpile_failure(
+                message,
                 source_path=source_path,
+                line=exc.line,
+                column=exc.column,
+                resource=room_name,
+                resource_type="room",
                 event=label,
-                preserve_source_comments=True,
-                self_expression=self_expression,
-                other_expression=other_expression,
-                instance_target=instance_target,
-            )
-        except GMLTranspileError as exc:
-            message = (
-                "Warning: Could not transpile GameMaker {label} for room {room}: {path}: {error}".format(
-                    label=label,
-                    room=room_name,
-                    path=source_path,
-                    error=exc,
-                )
+                workaround=(
+                    "Split or rewrite unsupported GML for this creation-code "
+                    "source, or add the missing runtime/API support tracked by "
+                    "the linked issue."
+                ),
             )
-            if self.diagnostics is not None:
-                self.diagnostics.add_transpile_failure(
-                    message,
-                    source_path=source_path,
-                    line=exc.line,
-                    column=exc.column,
-                    resource=room_name,
-                    resource_type="room",
-                    event=label,
-                    workaround=(
-                        "Split or rewrite unsupported GML for this creation-code "
-                        "source, or add the missing runtime/API support tracked by "
-                        "the linked issue."
-                    ),
-                )
-            self._safe_log(message)
-            raise _RoomCreationCodeBlocked(message) from exc
+        self._safe_log(message)
 
     def _render_room_script(
         self,
@@ -767,6 +852,8 @@ class RoomConverter(BaseConverter):
                 "height": height,
                 "scene_path": room.godot_path,
             }
+        if not self.conversion_running():
+            return None
         room_script_resource_path: str | None = None
         if room_script is not None:
             room_script_resource_path = _room_script_resource_path(room)
@@ -775,14 +862,13 @@ class RoomConverter(BaseConverter):
             with open(script_output_path, "w", encoding="utf-8") as f:
                 f.write(room_script)
         os.makedirs(os.path.dirname(output_path), exist_ok=True)
-        with open(output_path, "w", encoding="utf-8") as f:
-            f.write(
-                self._generate_room_scene(
-                    room,
-                    resource_index,
-                    room_script_resource_path,
-                    resolve_creation_code_source,
-                )
+        with _staged_text_output(output_path) as f:
+            self._write_room_scene(
+                f,
+                room,
+                resource_index,
+                room_script_resource_path,
+                resolve_creation_code_source,
             )
 
         return {
@@ -911,32 +997,44 @@ class RoomConverter(BaseConverter):
         processed = 0
         generated_scene_paths: dict[str, str] = {}
 
-        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
-            futures_map = {
-                executor.submit(self._process_room_with_outcome, room, index): room.name
-                for room in rooms
-            }
-            for future in as_completed(futures_map):
-                result = future.result()
-                if result is None:
-                    self.log_callback("Room conversion stopped.")
-                    return
-
-                processed += 1
-                if result["status"] == "completed":
-                    generated_scene_paths[result["name"]] = result["scene_path"]
-                    if self.compact_logging:
-                        self._safe_log_progress(result["name"], processed, total)
-                    else:
-                        self._safe_log(
-                            "Converted room: {name} ({width}x{height})".format(
-                                name=result["name"],
-                                width=result["width"],
-                                height=result["height"],
+        transpile_engine = GMLTranspileEngine(
+            GMLTranspileTables(asset_names=frozenset(self._asset_names(index))),
+            max_workers=self.max_workers,
+            conversion_running=self.conversion_running,
+        )
+        self._transpile_engine = transpile_engine
+        try:
+            with self._work_queue("rooms") as queue:
+                for _room, future in queue.map(
+                    lambda room: self._process_room_with_outcome(room, index),
+                    rooms,
+                ):
+                    result = future.result()
+                    if result is None:
+                        self.log_callback("Room conversion stopped.")
+                        return
+
+                    processed += 1
+                    if result["status"] == "completed":
+                        generated_scene_paths[result["name"]] = result["scene_path"]
+                        if self.compact_logging:
+                            self._safe_log_progress(result["name"], processed, total)
+                        else:
+                            self._safe_log(
+                                "Converted room: {name} ({width}x{height})".format(
+                                    name=result["name"],
+                                    width=result["width"],
+                                    height=result["height"],
+                                )
                             )
-                        )
 
-                self._safe_progress(int(processed / total * 100))
+                    self._safe_progress(int(processed / total * 100))
+                if queue.stopped:
+                    self.log_callback("Room conversion stopped.")
+                    return
+        finally:
+            self._transpile_engine = None
+            transpile_engine.close()
 
         self._set_startup_scene(index, generated_scene_paths)
         self.log_callback("Room conversion completed.")
@@ -5,14 +5,15 @@ import json
 import os
 import posixpath
 import tempfile
-from dataclasses import dataclass
-from typing import Iterable, Mapping
+from collections.abc import Iterable, Iterator, Mapping
+from dataclasses import dataclass, replace
 
 from src.localization import get_localized
 from src.conversion.asset_registry import AssetRegistryConverter, AssetRegistryEntry
 from src.conversion.base_converter import BaseConverter
 from src.conversion.diagnostics import DiagnosticCollector
 from src.conversion.gml_runtime import write_gml_runtime
+from src.conversion.gml_transpile_engine import GMLTranspileEngine, GMLTranspileTables
 from src.conversion.gml_transpiler import (
     EXTENSION_FUNCTION_MAPPING_FILENAME,
     GMLExtensionFunction,
@@ -38,8 +39,7 @@ from src.conversion.project_source_paths import (
     is_safe_project_source_component,
     validate_project_resource_source_path,
 )
-from src.conversion.project_enums import collect_project_enum_values
-from src.conversion.project_macros import collect_project_macro_values
+from src.conversion.project_gml_analysis import analyze_project_gml
 from src.conversion.script_functions import (
     ScriptFunctionDeclaration,
     modern_script_structure,
@@ -84,6 +84,22 @@ class _ScriptCallableNames:
     scoped_callable_accessor: str
 
 
+@dataclass(frozen=True)
+class _ScriptRenderJob:
+    entry: AssetRegistryEntry
+    source_path: str | None = None
+    source: str | None = None
+    read_error: str | None = None
+
+
+@dataclass(frozen=True)
+class _RenderedScript:
+    content: str = ""
+    registry_entries: tuple[ScriptRegistryEntry, ...] = ()
+    source_maps: tuple[GMLSourceMap, ...] = ()
+    error: GMLTranspileError | None = None
+
+
 @dataclass(frozen=True)
 class _DeclaredScriptResource:
     name: str
@@ -222,6 +238,381 @@ def render_script_registry_script(entries: Iterable[ScriptRegistryEntry]) -> str
     return "".join(lines)
 
 
+def _modern_function_body(
+    declaration: ScriptFunctionDeclaration,
+    *,
+    source_path: str,
+    macro_configuration: str | None,
+    asset_names: frozenset[str],
+    static_scope_prefix: str,
+    extension_functions: Mapping[str, GMLExtensionFunction],
+    extension_function_mappings: Mapping[str, GMLExtensionFunctionMapping],
+    enum_values: Mapping[str, Mapping[str, int]],
+    macro_values: Mapping[str, str],
+    generated_line_offset: int = 0,
+) -> tuple[str, GMLSourceMap, str | None]:
+    local_names = {parameter.name for parameter in declaration.parameters}
+    script_scope = (
+        _constructor_scope_context()
+        if declaration.is_constructor
+        else _script_scope_context()
+    )
+    lines: list[str] = [] if declaration.is_constructor else _script_scope_lines()
+    for parameter in declaration.parameters:
+        parameter_name = _sanitize_gdscript_identifier(parameter.name)
+        if parameter.default is None:
+            lines.append(f"\tif {parameter_name} == null: {parameter_name} = GMRuntime.gml_undefined()")
+            continue
+        default_value = transpile_gml_expression(
+            parameter.default,
+            local_names=local_names,
+            asset_names=asset_names,
+            scope_context=script_scope,
+            enum_values={
+                name: dict(members) for name, members in enum_values.items()
+            },
+            enum_names=enum_values,
+            macro_values=macro_values,
+            extension_functions=extension_functions,
+            extension_function_mappings=extension_function_mappings,
+        )
+        lines.append(
+            f"\tif {parameter_name} == null or GMRuntime.is_undefined({parameter_name}): "
+            f"{parameter_name} = {default_value}"
+        )
+    if declaration.parent_constructor is not None:
+        outer_scope = ScopeContext(
+            self_expression="self",
+            other_expression="self",
+            instance_target="self",
+            asset_names=frozenset(asset_names),
+            extension_functions=extension_functions,
+            extension_function_mappings=extension_function_mappings,
+        )
+        constructor_scope = ScopeContext(
+            self_expression="_gml_constructor_self",
+            other_expression="_gml_constructor_other",
+            instance_target="_gml_constructor_self",
+            asset_names=frozenset(asset_names),
+            extension_functions=extension_functions,
+            extension_function_mappings=extension_function_mappings,
+        )
+        parent_expression = _parse_gml_expression(
+            declaration.parent_constructor,
+            {name: dict(members) for name, members in enum_values.items()},
+            enum_values,
+            macro_values=macro_values,
+            scope_context=outer_scope,
+        )
+        lines.append(
+            "\t"
+            + _emit_constructor_inheritance_line(
+                parent_expression,
+                local_names,
+                constructor_scope,
+                outer_scope,
+            )
+        )
+    result = transpile_gml_code_with_source_map(
+        declaration.body,
+        return_depth=1,
+        asset_names=asset_names,
+        static_scope_prefix=static_scope_prefix,
+        self_expression=script_scope.self_expression,
+        other_expression=script_scope.other_expression,
+        instance_target=script_scope.instance_target,
+        local_names=local_names,
+        enum_values=enum_values,
+        macro_values=macro_values,
+        extension_functions=extension_functions,
+        extension_function_mappings=extension_function_mappings,
+        macro_configuration=macro_configuration,
+        source_path=source_path,
+        event=f"script:{declaration.name}",
+        preserve_source_comments=True,
+        generated_line_offset=generated_line_offset + len(lines),
+    )
+    lines.append(result.code)
+    return (
+        "\n".join(lines),
+        result.source_map.with_source_offset(
+            declaration.body_line_offset,
+            declaration.body_column_offset,
+        ),
+        result.static_scope_id,
+    )
+
+
+def _render_script(
+    entry: AssetRegistryEntry,
+    source: str,
+    *,
+    source_path: str,
+    macro_configuration: str | None,
+    asset_names: frozenset[str],
+    extension_functions: Mapping[str, GMLExtensionFunction],
+    extension_function_mappings: Mapping[str, GMLExtensionFunctionMapping],
+    enum_values: Mapping[str, Mapping[str, int]],
+    macro_values: Mapping[str, str],
+) -> tuple[str, tuple[ScriptRegistryEntry, ...], tuple[GMLSourceMap, ...]]:
+    header = render_gml_source_header(
+        source_path=source_path,
+        event=f"script:{entry.name}",
+        source=source,
+    )
+    modern_structure = modern_script_structure(
+        source,
+        macro_configuration=macro_configuration,
+    )
+    if modern_structure is not None:
+        modern_declarations = modern_structure.declarations
+        if not modern_declarations:
+            modern_declarations = (
+                ScriptFunctionDeclaration(
+                    name=entry.name,
+                    parameters=(),
+                    body="",
+                ),
+            )
+        chunks = [
+            "extends RefCounted\n\n",
+            f"{header}",
+            'const GMRuntime = preload("res://gm2godot/gml_runtime.gd")\n\n',
+        ]
+        registry_entries: list[ScriptRegistryEntry] = []
+        source_maps: list[GMLSourceMap] = []
+        for declaration_index, declaration in enumerate(modern_declarations):
+            use_default_names = declaration.name == entry.name
+            callable_names = _script_callable_names(
+                declaration.name,
+                use_default_names=use_default_names,
+            )
+            parameter_declarations = [
+                f"{_sanitize_gdscript_identifier(parameter.name)} = null"
+                for parameter in declaration.parameters
+            ]
+            constructor_value: str | None = None
+            if declaration.is_constructor:
+                constructor_suffix = _sanitize_gdscript_identifier(declaration.name)
+                constructor_value = f"_gm_constructor_{constructor_suffix}"
+                constructor_params = ", ".join(
+                    [
+                        "_gml_constructor_self = null",
+                        "_gml_constructor_other = null",
+                        *parameter_declarations,
+                    ]
+                )
+                function_prefix = (
+                    f"func {callable_names.call_method}({constructor_params}):\n"
+                )
+            else:
+                params = ", ".join(parameter_declarations)
+                scoped_params = ", ".join(
+                    [
+                        f"{_SCRIPT_SELF_PARAMETER} = null",
+                        f"{_SCRIPT_OTHER_PARAMETER} = null",
+                        *parameter_declarations,
+                    ]
+                )
+                function_prefix = (
+                    f"func {callable_names.call_method}({params}):\n"
+                    f"{_script_forward_call(declaration=declaration, scoped_call_method=callable_names.scoped_call_method)}\n"
+                    f"func {callable_names.scoped_call_method}({scoped_params}):\n"
+                )
+            body, source_map, static_scope_id = _modern_function_body(
+                declaration,
+                source_path=source_path,
+                macro_configuration=macro_configuration,
+                asset_names=asset_names,
+                static_scope_prefix=f"{entry.name}.{declaration.name}",
+                extension_functions=extension_functions,
+                extension_function_mappings=extension_function_mappings,
+                enum_values=enum_values,
+                macro_values=macro_values,
+                generated_line_offset=("".join(chunks) + function_prefix).count("\n"),
+            )
+            if declaration.is_constructor:
+                assert constructor_value is not None
+                constructor_scope_id = (
+                    static_scope_id
+                    or f"{entry.name}.{declaration.name}:constructor"
+                )
+                chunks.append(
+                    function_prefix
+                    + f"{body}\n"
+                    + "\treturn GMRuntime.gml_undefined()\n\n"
+                    + f"func {callable_names.callable_accessor}():\n"
+                    + f"\tvar {constructor_value} = GMRuntime.gml_receiver_constructor(\n"
+                    + "\t\tGMRuntime.gml_undefined(),\n"
+                    + "\t\tGMRuntime.gml_static_bind(\n"
+                    + f'\t\t\tCallable(self, "{callable_names.call_method}"),\n'
+                    + f"\t\t\t{json.dumps(constructor_scope_id)},\n"
+                    + f"\t\t\t{json.dumps(declaration.name)}\n"
+                    + "\t\t)\n"
+                    + "\t)\n"
+                    + f"\treturn {constructor_value}\n\n"
+                    + f"func {callable_names.scoped_callable_accessor}():\n"
+                    + f"\treturn {callable_names.callable_accessor}()\n\n"
+                )
+            else:
+                chunks.append(
+                    function_prefix
+                    + f"{body}\n"
+                    + "\treturn GMRuntime.gml_undefined()\n\n"
+                    + f"func {callable_names.callable_accessor}():\n"
+                    + f'\treturn GMRuntime.gml_method(self, Callable(self, "{callable_names.call_method}"))\n\n'
+                    + f"func {callable_names.scoped_callable_accessor}():\n"
+                    + "\treturn GMRuntime.gml_receiver_method(\n"
+                    + "\t\tGMRuntime.gml_undefined(),\n"
+                    + f'\t\tCallable(self, "{callable_names.scoped_call_method}")\n'
+                    + "\t)\n\n"
+                )
+            registry_entries.append(
+                ScriptRegistryEntry(
+                    # Replaced by the declared script asset id, when one
+                    # exists, in _resolve_registry_ids().
+                    id=f"{entry.name}:{declaration.name}",
+                    name=declaration.name,
+                    resource_path=entry.godot_path,
+                    legacy_arguments=False,
+                    callable_method=callable_names.callable_accessor,
+                    scoped_callable_method=callable_names.scoped_callable_accessor,
+                    is_constructor=declaration.is_constructor,
+                    initializer_method=(
+                        "gm2godot_initialize_top_level"
+                        if declaration_index == 0
+                        and modern_structure.top_level_statements
+                        else None
+                    ),
+                )
+            )
+            source_maps.append(source_map)
+        if modern_structure.top_level_statements:
+            initializer_prefix = "func gm2godot_initialize_top_level():\n"
+            initializer_result = transpile_gml_code_with_source_map(
+                render_script_top_level_source(
+                    source,
+                    modern_structure.top_level_statements,
+                ),
+                indent="\t",
+                top_level_global_scope=True,
+                asset_names=asset_names,
+                static_scope_prefix=f"{entry.name}.top_level",
+                enum_values=enum_values,
+                macro_values=macro_values,
+                extension_functions=extension_functions,
+                extension_function_mappings=extension_function_mappings,
+                macro_configuration=macro_configuration,
+                source_path=source_path,
+                event=f"script:{entry.name}:top-level",
+                self_expression="self",
+                other_expression="self",
+                instance_target="self",
+                generated_line_offset=(
+                    "".join(chunks) + initializer_prefix
+                ).count("\n"),
+            )
+            chunks.append(
+                initializer_prefix
+                + initializer_result.code.rstrip("\n")
+                + "\n"
+            )
+            source_maps.append(initializer_result.source_map)
+        return "".join(chunks).rstrip("\n") + "\n", tuple(registry_entries), tuple(source_maps)
+
+    prefix = (
+        "extends RefCounted\n\n"
+        f"{header}"
+        'const GMRuntime = preload("res://gm2godot/gml_runtime.gd")\n\n'
+        "func _gm_script_call():\n"
+        "\treturn _gm_script_call_scoped(self, self)\n\n"
+        f"func _gm_script_call_scoped({_SCRIPT_SELF_PARAMETER} = null, {_SCRIPT_OTHER_PARAMETER} = null):\n"
+    )
+    script_scope = _script_scope_context()
+    result = transpile_gml_code_with_source_map(
+        source,
+        return_depth=1,
+        asset_names=asset_names,
+        static_scope_prefix=f"{entry.name}.script",
+        self_expression=script_scope.self_expression,
+        other_expression=script_scope.other_expression,
+        instance_target=script_scope.instance_target,
+        enum_values=enum_values,
+        macro_values=macro_values,
+        extension_functions=extension_functions,
+        extension_function_mappings=extension_function_mappings,
+        macro_configuration=macro_configuration,
+        source_path=source_path,
+        event=f"script:{entry.name}",
+        preserve_source_comments=True,
+        generated_line_offset=prefix.count("\n") + len(_script_scope_lines()),
+    )
+    return (
+        prefix
+        + "\n".join(_script_scope_lines())
+        + "\n"
+        + f"{result.code}\n"
+        + "\treturn GMRuntime.gml_undefined()\n\n"
+        + "func gm2godot_callable():\n"
+        + '\treturn GMRuntime.gml_method(self, Callable(self, "_gm_script_call"))\n\n'
+        + "func gm2godot_scoped_callable():\n"
+        + "\treturn GMRuntime.gml_receiver_method(\n"
+        + "\t\tGMRuntime.gml_undefined(),\n"
+        + '\t\tCallable(self, "_gm_script_call_scoped")\n'
+        + "\t)\n",
+        (
+            ScriptRegistryEntry(
+                id=entry.id,
+                name=entry.name,
+                resource_path=entry.godot_path,
+                legacy_arguments=True,
+            ),
+        ),
+        (result.source_map,),
+    )
+
+
+def _render_script_job(tables: GMLTranspileTables, job: _ScriptRenderJob) -> _RenderedScript:
+    """Render one script wrapper; runs in a transpile worker process."""
+    if job.source is None or job.source_path is None:
+        return _RenderedScript()
+    try:
+        content, registry_entries, source_maps = _render_script(
+            job.entry,
+            job.source,
+            source_path=job.source_path,
+            macro_configuration=tables.macro_configuration,
+            asset_names=tables.asset_names or frozenset(),
+            extension_functions=tables.extension_functions or {},
+            extension_function_mappings=tables.extension_function_mappings or {},
+            enum_values=tables.enum_values or {},
+            macro_values=tables.macro_values or {},
+        )
+    except GMLTranspileError as error:
+        return _RenderedScript(error=error)
+    return _RenderedScript(content, registry_entries, source_maps)
+
+
+def _resolve_registry_ids(
+    registry_entries: tuple[ScriptRegistryEntry, ...],
+    script_entries_by_name: Mapping[str, AssetRegistryEntry],
+) -> tuple[ScriptRegistryEntry, ...]:
+    """Give function declarations the id of the script asset sharing their name."""
+    resolved: list[ScriptRegistryEntry] = []
+    for registry_entry in registry_entries:
+        script_entry = (
+            None
+            if registry_entry.legacy_arguments
+            else script_entries_by_name.get(registry_entry.name)
+        )
+        resolved.append(
+            registry_entry
+            if script_entry is None
+            else replace(registry_entry, id=script_entry.id)
+        )
+    return tuple(resolved)
+
+
 class ScriptConverter(BaseConverter):
     """Convert GameMaker script assets into callable Godot wrappers."""
 
@@ -506,337 +897,6 @@ class ScriptConverter(BaseConverter):
         relative_path = entry.godot_path[len("res://"):].replace("/", os.sep)
         return os.path.join(self.godot_project_path, relative_path)
 
-    def _modern_function_body(
-        self,
-        declaration: ScriptFunctionDeclaration,
-        *,
-        source_path: str,
-        asset_names: set[str],
-        static_scope_prefix: str,
-        extension_functions: dict[str, GMLExtensionFunction],
-        extension_function_mappings: dict[str, GMLExtensionFunctionMapping],
-        enum_values: Mapping[str, Mapping[str, int]],
-        macro_values: Mapping[str, str],
-        generated_line_offset: int = 0,
-    ) -> tuple[str, GMLSourceMap, str | None]:
-        local_names = {parameter.name for parameter in declaration.parameters}
-        script_scope = (
-            _constructor_scope_context()
-            if declaration.is_constructor
-            else _script_scope_context()
-        )
-        lines: list[str] = [] if declaration.is_constructor else _script_scope_lines()
-        for parameter in declaration.parameters:
-            parameter_name = _sanitize_gdscript_identifier(parameter.name)
-            if parameter.default is None:
-                lines.append(f"\tif {parameter_name} == null: {parameter_name} = GMRuntime.gml_undefined()")
-                continue
-            default_value = transpile_gml_expression(
-                parameter.default,
-                local_names=local_names,
-                asset_names=asset_names,
-                scope_context=script_scope,
-                enum_values={
-                    name: dict(members) for name, members in enum_values.items()
-                },
-                enum_names=enum_values,
-                macro_values=macro_values,
-                extension_functions=extension_functions,
-                extension_function_mappings=extension_function_mappings,
-            )
-            lines.append(
-                f"\tif {parameter_name} == null or GMRuntime.is_undefined({parameter_name}): "
-                f"{parameter_name} = {default_value}"
-            )
-        if declaration.parent_constructor is not None:
-            outer_scope = ScopeContext(
-                self_expression="self",
-                other_expression="self",
-                instance_target="self",
-                asset_names=frozenset(asset_names),
-                extension_functions=extension_functions,
-                extension_function_mappings=extension_function_mappings,
-            )
-            constructor_scope = ScopeContext(
-                self_expression="_gml_constructor_self",
-                other_expression="_gml_constructor_other",
-                instance_target="_gml_constructor_self",
-                asset_names=frozenset(asset_names),
-                extension_functions=extension_functions,
-                extension_function_mappings=extension_function_mappings,
-            )
-            parent_expression = _parse_gml_expression(
-                declaration.parent_constructor,
-                {name: dict(members) for name, members in enum_values.items()},
-                enum_values,
-                macro_values=macro_values,
-                scope_context=outer_scope,
-            )
-            lines.append(
-                "\t"
-                + _emit_constructor_inheritance_line(
-                    parent_expression,
-                    local_names,
-                    constructor_scope,
-                    outer_scope,
-                )
-            )
-        result = transpile_gml_code_with_source_map(
-            declaration.body,
-            return_depth=1,
-            asset_names=asset_names,
-            static_scope_prefix=static_scope_prefix,
-            self_expression=script_scope.self_expression,
-            other_expression=script_scope.other_expression,
-            instance_target=script_scope.instance_target,
-            local_names=local_names,
-            enum_values=enum_values,
-            macro_values=macro_values,
-            extension_functions=extension_functions,
-            extension_function_mappings=extension_function_mappings,
-            macro_configuration=self.macro_configuration,
-            source_path=source_path,
-            event=f"script:{declaration.name}",
-            preserve_source_comments=True,
-            generated_line_offset=generated_line_offset + len(lines),
-        )
-        lines.append(result.code)
-        return (
-            "\n".join(lines),
-            result.source_map.with_source_offset(
-                declaration.body_line_offset,
-                declaration.body_column_offset,
-            ),
-            result.static_scope_id,
-        )
-
-    def _render_script(
-        self,
-        entry: AssetRegistryEntry,
-        source: str,
-        *,
-        source_path: str,
-        asset_names: set[str],
-        script_entries_by_name: dict[str, AssetRegistryEntry],
-        extension_functions: dict[str, GMLExtensionFunction],
-        extension_function_mappings: dict[str, GMLExtensionFunctionMapping],
-        enum_values: Mapping[str, Mapping[str, int]],
-        macro_values: Mapping[str, str],
-    ) -> tuple[str, tuple[ScriptRegistryEntry, ...], tuple[GMLSourceMap, ...]]:
-        header = render_gml_source_header(
-            source_path=source_path,
-            event=f"script:{entry.name}",
-            source=source,
-        )
-        modern_structure = modern_script_structure(
-            source,
-            macro_configuration=self.macro_configuration,
-        )
-        if modern_structure is not None:
-            modern_declarations = modern_structure.declarations
-            if not modern_declarations:
-                modern_declarations = (
-                    ScriptFunctionDeclaration(
-                        name=entry.name,
-                        parameters=(),
-                        body="",
-                    ),
-                )
-            chunks = [
-                "extends RefCounted\n\n",
-                f"{header}",
-                'const GMRuntime = preload("res://gm2godot/gml_runtime.gd")\n\n',
-            ]
-            registry_entries: list[ScriptRegistryEntry] = []
-            source_maps: list[GMLSourceMap] = []
-            for declaration_index, declaration in enumerate(modern_declarations):
-                use_default_names = declaration.name == entry.name
-                callable_names = _script_callable_names(
-                    declaration.name,
-                    use_default_names=use_default_names,
-                )
-                parameter_declarations = [
-                    f"{_sanitize_gdscript_identifier(parameter.name)} = null"
-                    for parameter in declaration.parameters
-                ]
-                constructor_value: str | None = None
-                if declaration.is_constructor:
-                    constructor_suffix = _sanitize_gdscript_identifier(declaration.name)
-                    constructor_value = f"_gm_constructor_{constructor_suffix}"
-                    constructor_params = ", ".join(
-                        [
-                            "_gml_constructor_self = null",
-                            "_gml_constructor_other = null",
-                            *parameter_declarations,
-                        ]
-                    )
-                    function_prefix = (
-                        f"func {callable_names.call_method}({constructor_params}):\n"
-                    )
-                else:
-                    params = ", ".join(parameter_declarations)
-                    scoped_params = ", ".join(
-                        [
-                            f"{_SCRIPT_SELF_PARAMETER} = null",
-                            f"{_SCRIPT_OTHER_PARAMETER} = null",
-                            *parameter_declarations,
-                        ]
-                    )
-                    function_prefix = (
-                        f"func {callable_names.call_method}({params}):\n"
-                        f"{_script_forward_call(declaration=declaration, scoped_call_method=callable_names.scoped_call_method)}\n"
-                        f"func {callable_names.scoped_call_method}({scoped_params}):\n"
-                    )
-                body, source_map, static_scope_id = self._modern_function_body(
-                    declaration,
-                    source_path=source_path,
-                    asset_names=asset_names,
-                    static_scope_prefix=f"{entry.name}.{declaration.name}",
-                    extension_functions=extension_functions,
-                    extension_function_mappings=extension_function_mappings,
-                    enum_values=enum_values,
-                    macro_values=macro_values,
-                    generated_line_offset=("".join(chunks) + function_prefix).count("\n"),
-                )
-                if declaration.is_constructor:
-                    assert constructor_value is not None
-                    constructor_scope_id = (
-                        static_scope_id
-                        or f"{entry.name}.{declaration.name}:constructor"
-                    )
-                    chunks.append(
-                        function_prefix
-                        + f"{body}\n"
-                        + "\treturn GMRuntime.gml_undefined()\n\n"
-                        + f"func {callable_names.callable_accessor}():\n"
-                        + f"\tvar {constructor_value} = GMRuntime.gml_receiver_constructor(\n"
-                        + "\t\tGMRuntime.gml_undefined(),\n"
-                        + "\t\tGMRuntime.gml_static_bind(\n"
-                        + f'\t\t\tCallable(self, "{callable_names.call_method}"),\n'
-                        + f"\t\t\t{json.dumps(constructor_scope_id)},\n"
-                        + f"\t\t\t{json.dumps(declaration.name)}\n"
-                        + "\t\t)\n"
-                        + "\t)\n"
-                        + f"\treturn {constructor_value}\n\n"
-                        + f"func {callable_names.scoped_callable_accessor}():\n"
-                        + f"\treturn {callable_names.callable_accessor}()\n\n"
-                    )
-                else:
-                    chunks.append(
-                        function_prefix
-                        + f"{body}\n"
-                        + "\treturn GMRuntime.gml_undefined()\n\n"
-                        + f"func {callable_names.callable_accessor}():\n"
-                        + f'\treturn GMRuntime.gml_method(self, Callable(self, "{callable_names.call_method}"))\n\n'
-                        + f"func {callable_names.scoped_callable_accessor}():\n"
-                        + "\treturn GMRuntime.gml_receiver_method(\n"
-                        + "\t\tGMRuntime.gml_undefined(),\n"
-                        + f'\t\tCallable(self, "{callable_names.scoped_call_method}")\n'
-                        + "\t)\n\n"
-                    )
-                script_entry = script_entries_by_name.get(declaration.name)
-                registry_entries.append(
-                    ScriptRegistryEntry(
-                        id=script_entry.id if script_entry is not None else f"{entry.name}:{declaration.name}",
-                        name=declaration.name,
-                        resource_path=entry.godot_path,
-                        legacy_arguments=False,
-                        callable_method=callable_names.callable_accessor,
-                        scoped_callable_method=callable_names.scoped_callable_accessor,
-                        is_constructor=declaration.is_constructor,
-                        initializer_method=(
-                            "gm2godot_initialize_top_level"
-                            if declaration_index == 0
-                            and modern_structure.top_level_statements
-                            else None
-                        ),
-                    )
-                )
-                source_maps.append(source_map)
-            if modern_structure.top_level_statements:
-                initializer_prefix = "func gm2godot_initialize_top_level():\n"
-                initializer_result = transpile_gml_code_with_source_map(
-                    render_script_top_level_source(
-                        source,
-                        modern_structure.top_level_statements,
-                    ),
-                    indent="\t",
-                    top_level_global_scope=True,
-                    asset_names=asset_names,
-                    static_scope_prefix=f"{entry.name}.top_level",
-                    enum_values=enum_values,
-                    macro_values=macro_values,
-                    extension_functions=extension_functions,
-                    extension_function_mappings=extension_function_mappings,
-                    macro_configuration=self.macro_configuration,
-                    source_path=source_path,
-                    event=f"script:{entry.name}:top-level",
-                    self_expression="self",
-                    other_expression="self",
-                    instance_target="self",
-                    generated_line_offset=(
-                        "".join(chunks) + initializer_prefix
-                    ).count("\n"),
-                )
-                chunks.append(
-                    initializer_prefix
-                    + initializer_result.code.rstrip("\n")
-                    + "\n"
-                )
-                source_maps.append(initializer_result.source_map)
-            return "".join(chunks).rstrip("\n") + "\n", tuple(registry_entries), tuple(source_maps)
-
-        prefix = (
-            "extends RefCounted\n\n"
-            f"{header}"
-            'const GMRuntime = preload("res://gm2godot/gml_runtime.gd")\n\n'
-            "func _gm_script_call():\n"
-            "\treturn _gm_script_call_scoped(self, self)\n\n"
-            f"func _gm_script_call_scoped({_SCRIPT_SELF_PARAMETER} = null, {_SCRIPT_OTHER_PARAMETER} = null):\n"
-        )
-        script_scope = _script_scope_context()
-        result = transpile_gml_code_with_source_map(
-            source,
-            return_depth=1,
-            asset_names=asset_names,
-            static_scope_prefix=f"{entry.name}.script",
-            self_expression=script_scope.self_expression,
-            other_expression=script_scope.other_expression,
-            instance_target=script_scope.instance_target,
-            enum_values=enum_values,
-            macro_values=macro_values,
-            extension_functions=extension_functions,
-            extension_function_mappings=extension_function_mappings,
-            macro_configuration=self.macro_configuration,
-            source_path=source_path,
-            event=f"script:{entry.name}",
-            preserve_source_comments=True,
-            generated_line_offset=prefix.count("\n") + len(_script_scope_lines()),
-        )
-        return (
-            prefix
-            + "\n".join(_script_scope_lines())
-            + "\n"
-            + f"{result.code}\n"
-            + "\treturn GMRuntime.gml_undefined()\n\n"
-            + "func gm2godot_callable():\n"
-            + '\treturn GMRuntime.gml_method(self, Callable(self, "_gm_script_call"))\n\n'
-            + "func gm2godot_scoped_callable():\n"
-            + "\treturn GMRuntime.gml_receiver_method(\n"
-            + "\t\tGMRuntime.gml_undefined(),\n"
-            + '\t\tCallable(self, "_gm_script_call_scoped")\n'
-            + "\t)\n",
-            (
-                ScriptRegistryEntry(
-                    id=entry.id,
-                    name=entry.name,
-                    resource_path=entry.godot_path,
-                    legacy_arguments=True,
-                ),
-            ),
-            (result.source_map,),
-        )
-
     def _record_source_diagnostics(
         self, source: str, source_path: str, entry: AssetRegistryEntry
     ) -> None:
@@ -863,43 +923,45 @@ class ScriptConverter(BaseConverter):
                 ),
             )
 
+    def _script_render_job(self, entry: AssetRegistryEntry) -> _ScriptRenderJob:
+        source_path = self._source_gml_path(entry)
+        if source_path is None or self._output_path(entry) is None:
+            return _ScriptRenderJob(entry)
+        try:
+            with open(source_path, "r", encoding="utf-8") as source_file:
+                source = source_file.read()
+        except OSError as exc:
+            return _ScriptRenderJob(entry, source_path, read_error=str(exc))
+        return _ScriptRenderJob(entry, source_path, source)
+
+    def _script_render_jobs(
+        self, entries: Iterable[AssetRegistryEntry]
+    ) -> Iterator[_ScriptRenderJob]:
+        for entry in entries:
+            yield self._script_render_job(entry)
+
     def _write_script(
         self,
         entry: AssetRegistryEntry,
+        job: _ScriptRenderJob,
+        rendered: _RenderedScript,
         *,
-        asset_names: set[str],
         script_entries_by_name: dict[str, AssetRegistryEntry],
-        extension_functions: dict[str, GMLExtensionFunction],
-        extension_function_mappings: dict[str, GMLExtensionFunctionMapping],
-        enum_values: Mapping[str, Mapping[str, int]],
-        macro_values: Mapping[str, str],
     ) -> tuple[ScriptRegistryEntry, ...]:
-        source_path = self._source_gml_path(entry)
+        source_path = job.source_path
         output_path = self._output_path(entry)
         if source_path is None or output_path is None:
             return ()
-        try:
-            with open(source_path, "r", encoding="utf-8") as source_file:
-                source = source_file.read()
-            self._record_source_diagnostics(source, source_path, entry)
-            script_content, registry_entries, source_maps = self._render_script(
-                entry,
-                source,
-                source_path=source_path,
-                asset_names=asset_names,
-                script_entries_by_name=script_entries_by_name,
-                extension_functions=extension_functions,
-                extension_function_mappings=extension_function_mappings,
-                enum_values=enum_values,
-                macro_values=macro_values,
-            )
-        except (OSError, GMLTranspileError) as exc:
+        if job.source is not None:
+            self._record_source_diagnostics(job.source, source_path, entry)
+        exc = rendered.error
+        if job.read_error is not None or exc is not None:
             message = get_localized("Console_Convertor_Scripts_ParseError").format(
                 script_name=entry.name,
-                error=str(exc),
+                error=str(exc) if exc is not None else job.read_error,
             )
             if self.diagnostics is not None:
-                if isinstance(exc, GMLTranspileError):
+                if exc is not None:
                     self.diagnostics.add_transpile_failure(
                         message,
                         source_path=source_path,
@@ -923,12 +985,12 @@ class ScriptConverter(BaseConverter):
 
         os.makedirs(os.path.dirname(output_path), exist_ok=True)
         with open(output_path, "w", encoding="utf-8") as output_file:
-            output_file.write(script_content)
+            output_file.write(rendered.content)
         write_gml_source_map(
             output_path,
-            merge_gml_source_maps(source_maps, source_path=source_path, event=f"script:{entry.name}"),
+            merge_gml_source_maps(rendered.source_maps, source_path=source_path, event=f"script:{entry.name}"),
         )
-        return registry_entries
+        return _resolve_registry_ids(rendered.registry_entries, script_entries_by_name)
 
     def _extension_functions(self) -> dict[str, GMLExtensionFunction]:
         index = GameMakerResourceIndex(
@@ -938,6 +1000,7 @@ class ScriptConverter(BaseConverter):
             progress_callback=lambda _value: None,
             conversion_running=self.conversion_running,
             diagnostics=self.diagnostics,
+            index_room_layers=False,
         ).build()
         return {
             name: GMLExtensionFunction(
@@ -1011,45 +1074,67 @@ class ScriptConverter(BaseConverter):
         }
         extension_functions = self._extension_functions()
         extension_function_mappings = self._extension_function_mappings()
-        enum_values = collect_project_enum_values(
-            self.gm_project_path,
-            macro_configuration=self.macro_configuration,
-        )
-        macro_values = collect_project_macro_values(
+        project_gml = analyze_project_gml(
             self.gm_project_path,
             macro_configuration=self.macro_configuration,
+            max_workers=self.max_workers,
+            conversion_running=self.conversion_running,
         )
         registry_entries: list[ScriptRegistryEntry] = []
         successful_script_names: list[str] = []
         total = len(entries)
 
-        for index, entry in enumerate(entries, start=1):
-            if not self.conversion_running():
-                self.log_callback(get_localized("Console_Convertor_Scripts_Stopped"))
-                return None
-            self._resource_started(entry.name)
-            try:
-                converted_registry_entries = self._write_script(
-                    entry,
-                    asset_names=asset_names,
-                    script_entries_by_name=script_entries_by_name,
-                    extension_functions=extension_functions,
-                    extension_function_mappings=extension_function_mappings,
-                    enum_values=enum_values,
-                    macro_values=macro_values,
-                )
-            except Exception:
-                self._resource_failed(entry.name)
-                raise
-            if converted_registry_entries:
-                successful_script_names.append(entry.name)
-                registry_entries.extend(converted_registry_entries)
-                self._safe_log(
-                    get_localized("Console_Convertor_Scripts_Converted").format(script_name=entry.name)
-                )
-            else:
-                self._resource_skipped(entry.name)
-            self._safe_progress(int(index / total * 100))
+        tables = GMLTranspileTables(
+            asset_names=frozenset(asset_names),
+            enum_values=project_gml.enum_values,
+            macro_values=project_gml.macro_values,
+            macro_configuration=self.macro_configuration,
+            extension_functions=extension_functions,
+            extension_function_mappings=extension_function_mappings,
+        )
+
+        with GMLTranspileEngine(
+            tables,
+            max_workers=self.max_workers,
+            conversion_running=self.conversion_running,
+        ) as engine:
+            rendered_scripts = engine.map(
+                _render_script_job,
+                self._script_render_jobs(entries),
+            )
+            for index, entry in enumerate(entries, start=1):
+                if not self.conversion_running():
+                    self.log_callback(get_localized("Console_Convertor_Scripts_Stopped"))
+                    return None
+                try:
+                    rendered_script = next(rendered_scripts, None)
+                except Exception:
+                    self._resource_failed(entry.name)
+                    raise
+                if rendered_script is None:
+                    # Stopped before this script was rendered; it stays
+                    # requested and is finalized as skipped.
+                    self.log_callback(get_localized("Console_Convertor_Scripts_Stopped"))
+                    return None
+                self._resource_started(entry.name)
+                try:
+                    converted_registry_entries = self._write_script(
+                        entry,
+                        *rendered_script,
+                        script_entries_by_name=script_entries_by_name,
+                    )
+                except Exception:
+                    self._resource_failed(entry.name)
+                    raise
+                if converted_registry_entries:
+                    successful_script_names.append(entry.name)
+                    registry_entries.extend(converted_registry_entries)
+                    self._safe_log(
+                        get_localized("Console_Convertor_Scripts_Converted").format(script_name=entry.name)
+                    )
+                else:
+                    self._resource_skipped(entry.name)
+                self._safe_progress(int(index / total * 100))
 
         registry_path = os.path.join(self.godot_project_path, SCRIPT_REGISTRY_RELATIVE_PATH)
         self._atomic_write_text(
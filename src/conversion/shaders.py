@@ -2,7 +2,7 @@ from __future__ import annotations
 
 import os
 import tempfile
-from concurrent.futures import Future, ThreadPoolExecutor, as_completed
+from collections.abc import Mapping
 from dataclasses import dataclass
 
 from src.conversion.asset_output_paths import build_asset_output_paths, resource_filesystem_path
@@ -99,7 +99,7 @@ class ShaderConverter(BaseConverter):
                          update_log_callback, compact_logging, max_workers=max_workers,
                          diagnostics=diagnostics)
         self.godot_shaders_path = os.path.join(self.godot_project_path, 'shaders')
-        self._shader_output_paths: dict[str, str] = {}
+        self._shader_output_paths: Mapping[str, str] = {}
 
     def convert_shader(self, input_file: str, output_file: str) -> None:
         """Convert one legacy stage and publish it as a complete shader resource."""
@@ -740,12 +740,8 @@ class ShaderConverter(BaseConverter):
         if processed:
             self._safe_progress(int((processed / total) * 100))
 
-        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
-            futures_map: dict[Future[tuple[str, str] | None], _ShaderAsset] = {
-                executor.submit(self._process_shader_with_outcome, asset): asset
-                for asset in shader_assets
-            }
-            for future in as_completed(futures_map):
+        with self._work_queue("shaders") as queue:
+            for _asset, future in queue.map(self._process_shader_with_outcome, shader_assets):
                 result = future.result()
                 if result is None:
                     if not self.conversion_running():
@@ -765,5 +761,8 @@ class ShaderConverter(BaseConverter):
                         filename=filename, output_path=output_name))
 
                 self._safe_progress(int((processed / total) * 100))
+            if queue.stopped:
+                self.log_callback("Shader conversion stopped.")
+                return
 
         self.log_callback("Shader conversion complete.")
@@ -4,7 +4,7 @@ import json
 import math
 import os
 import shutil
-from concurrent.futures import Future, ThreadPoolExecutor, as_completed
+from collections.abc import Mapping
 from dataclasses import dataclass
 from typing import TypedDict, cast
 
@@ -67,7 +67,7 @@ class SoundConverter(BaseConverter):
                          diagnostics=diagnostics)
         self.godot_sounds_path = os.path.join(self.godot_project_path, 'sounds')
         self.organize_by_audio_group = bool(organize_by_audio_group)
-        self._sound_output_paths: dict[str, str] = {}
+        self._sound_output_paths: Mapping[str, str] = {}
 
     def _declared_sound_resources(
         self,
@@ -665,17 +665,11 @@ class SoundConverter(BaseConverter):
         audio_group_map: dict[str, str] = {}
         successful_outcome_keys: set[str] = set()
 
-        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
-            futures_map: dict[Future[SoundResult | None], tuple[str, str]] = {
-                executor.submit(
-                    self._process_sound_with_outcome,
-                    sound_file,
-                    outcome_key,
-                ): (sound_file, outcome_key)
-                for sound_file, outcome_key in sound_work
-            }
-            for future in as_completed(futures_map):
-                _sound_file, outcome_key = futures_map[future]
+        with self._work_queue("sounds") as queue:
+            for (_sound_file, outcome_key), future in queue.map(
+                lambda work: self._process_sound_with_outcome(*work),
+                sound_work,
+            ):
                 result = future.result()
                 if result is None:
                     self.log_callback(get_localized("Console_Convertor_Sounds_Stopped"))
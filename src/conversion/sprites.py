@@ -1,8 +1,13 @@
 from __future__ import annotations
 
 import os
-from concurrent.futures import Future, ThreadPoolExecutor, as_completed
-from PIL import Image
+import shutil
+import struct
+import threading
+import zlib
+from collections import OrderedDict
+from concurrent.futures import Future
+from PIL import Image, ImageChops
 from collections import defaultdict
 from dataclasses import dataclass
 from typing import TypedDict, cast
@@ -21,6 +26,18 @@ from src.conversion.type_defs import ConversionRunning, JsonDict, LogCallback, P
 
 
 _MAX_PRECISE_COLLISION_RECTANGLES = 16384
+_PNG_SIGNATURE = b"\x89PNG\r\n\x1a\n"
+# Bit depths allowed by the PNG specification for each IHDR colour type.
+_PNG_BIT_DEPTHS: dict[int, frozenset[int]] = {
+    0: frozenset({1, 2, 4, 8, 16}),
+    2: frozenset({8, 16}),
+    3: frozenset({1, 2, 4, 8}),
+    4: frozenset({8, 16}),
+    6: frozenset({8, 16}),
+}
+# Alpha planes kept between frame export and precise-mask generation. Frames
+# evicted past this budget are read back from the exported PNG instead.
+_FRAME_ALPHA_CACHE_BYTES = 64 * 1024 * 1024
 
 
 class CollisionData(TypedDict):
@@ -77,15 +94,94 @@ class _PreciseMaskError(ValueError):
     pass
 
 
+def _is_valid_png_header(path: str) -> bool:
+    """Return whether ``path`` starts with a PNG signature and a sound IHDR."""
+    try:
+        with open(path, "rb") as png_file:
+            header = png_file.read(len(_PNG_SIGNATURE) + 25)
+    except OSError:
+        return False
+    if len(header) != len(_PNG_SIGNATURE) + 25 or not header.startswith(_PNG_SIGNATURE):
+        return False
+    chunk = header[len(_PNG_SIGNATURE):]
+    length, chunk_type = struct.unpack(">I4s", chunk[:8])
+    if length != 13 or chunk_type != b"IHDR":
+        return False
+    width, height, bit_depth, color_type, compression, filter_method, interlace = (
+        struct.unpack(">IIBBBBB", chunk[8:21])
+    )
+    (crc,) = struct.unpack(">I", chunk[21:25])
+    return (
+        0 < width < 2**31
+        and 0 < height < 2**31
+        and bit_depth in _PNG_BIT_DEPTHS.get(color_type, frozenset())
+        and compression == 0
+        and filter_method == 0
+        and interlace in (0, 1)
+        and zlib.crc32(chunk[4:21]) == crc
+    )
+
+
+class _FrameAlphaCache:
+    """Bounded, thread-safe store of exported frame alpha planes.
+
+    Frame workers put the alpha channel of each frame they export; scene
+    generation takes it back once, so a precise-collision frame is decoded a
+    single time. The oldest planes are evicted when the byte budget is
+    exceeded.
+    """
+
+    def __init__(self, budget_bytes: int = _FRAME_ALPHA_CACHE_BYTES) -> None:
+        self.budget_bytes = budget_bytes
+        self._planes: OrderedDict[str, Image.Image] = OrderedDict()
+        self._byte_count = 0
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _key(path: str) -> str:
+        return os.path.normcase(os.path.abspath(path))
+
+    def put(self, path: str, alpha: Image.Image) -> None:
+        size = alpha.width * alpha.height
+        if size > self.budget_bytes:
+            return
+        key = self._key(path)
+        with self._lock:
+            previous = self._planes.pop(key, None)
+            if previous is not None:
+                self._byte_count -= previous.width * previous.height
+            self._planes[key] = alpha
+            self._byte_count += size
+            while self._byte_count > self.budget_bytes:
+                _evicted_key, evicted = self._planes.popitem(last=False)
+                self._byte_count -= evicted.width * evicted.height
+
+    def take(self, path: str) -> Image.Image | None:
+        with self._lock:
+            alpha = self._planes.pop(self._key(path), None)
+            if alpha is not None:
+                self._byte_count -= alpha.width * alpha.height
+            return alpha
+
+    def clear(self) -> None:
+        with self._lock:
+            self._planes.clear()
+            self._byte_count = 0
+
+
 class SpriteConverter(BaseConverter):
     def __init__(self, gm_project_path: StrPath, godot_project_path: StrPath, log_callback: LogCallback = print,
                  progress_callback: ProgressCallback | None = None, conversion_running: ConversionRunning | None = None,
                  update_log_callback: LogCallback | None = None, compact_logging: bool = False,
                  max_workers: int | None = None,
-                 diagnostics: DiagnosticCollector | None = None) -> None:
+                 diagnostics: DiagnosticCollector | None = None,
+                 normalize_png: bool = False) -> None:
         super().__init__(gm_project_path, godot_project_path, log_callback, progress_callback, conversion_running,
                          update_log_callback, compact_logging, max_workers=max_workers,
                          diagnostics=diagnostics)
+        # Single-layer PNG frames are copied byte for byte unless re-encoding
+        # is requested.
+        self.normalize_png = normalize_png
         self.godot_sprites_path = os.path.join(self.godot_project_path, 'sprites')
         self._sprite_path_suffixes: dict[str, str] = {}
         self._yyp_sprite_yy_paths: dict[str, str] = {}
@@ -93,6 +189,8 @@ class SpriteConverter(BaseConverter):
         self._sprite_owner_yy_paths: dict[str, str] = {}
         self._sprites_without_yy: set[str] = set()
         self._yyp_declared_sprites: dict[str, _DeclaredSpriteResource] = {}
+        self._frame_alpha_cache = _FrameAlphaCache()
+        self._precise_mask_sprites: frozenset[str] = frozenset()
 
     def _get_valid_sprite_names(
         self,
@@ -835,56 +933,48 @@ class SpriteConverter(BaseConverter):
         if frame_count <= 0:
             raise _PreciseMaskError("sprite has no converted frames")
 
-        masks: list[bytearray] = []
+        # Alpha is cropped and merged with Pillow's C operations, then mapped
+        # to 0 or 255 per pixel through a byte table instead of Python loops.
+        # The threshold is monotonic, so thresholding the merged alpha equals
+        # merging the thresholded frames.
+        bbox = (bbox_left, bbox_top, bbox_right + 1, bbox_bottom + 1)
+        threshold = bytes(tolerance + 1) + b"\xff" * (255 - tolerance)
+        per_frame = collision_data["collisionKind"] == 4 and frame_count > 1
+        masks: list[Image.Image] = []
         for frame_path in self._generated_frame_paths(
             sprite_name,
             frame_count,
             subfolder,
         ):
-            try:
-                with Image.open(frame_path) as image:
-                    rgba = image.convert("RGBA")
-                    if rgba.size != (width, height):
-                        raise _PreciseMaskError(
-                            "converted frame dimensions "
-                            f"{rgba.width}x{rgba.height} do not match sprite metadata "
-                            f"{width}x{height}"
-                        )
-                    alpha = rgba.getchannel("A").tobytes()
-            except _PreciseMaskError:
-                raise
-            except (OSError, ValueError) as error:
+            alpha = self._frame_alpha_cache.take(frame_path)
+            if alpha is None:
+                try:
+                    with Image.open(frame_path) as image:
+                        alpha = self._frame_alpha(image)
+                except (OSError, ValueError) as error:
+                    raise _PreciseMaskError(
+                        f"converted frame could not be read: {error}"
+                    ) from error
+            if alpha.size != (width, height):
                 raise _PreciseMaskError(
-                    f"converted frame could not be read: {error}"
-                ) from error
-
-            mask = bytearray(width * height)
-            for y in range(bbox_top, bbox_bottom + 1):
-                row_offset = y * width
-                for x in range(bbox_left, bbox_right + 1):
-                    index = row_offset + x
-                    if alpha[index] > tolerance:
-                        mask[index] = 1
-            masks.append(mask)
-
-        per_frame = collision_data["collisionKind"] == 4 and frame_count > 1
-        if not per_frame:
-            composite = bytearray(width * height)
-            for mask in masks:
-                for index, value in enumerate(mask):
-                    composite[index] |= value
-            masks = [composite]
+                    "converted frame dimensions "
+                    f"{alpha.width}x{alpha.height} do not match sprite metadata "
+                    f"{width}x{height}"
+                )
+            mask = alpha.crop(bbox)
+            if per_frame or not masks:
+                masks.append(mask)
+            else:
+                masks[0] = ImageChops.lighter(masks[0], mask)
 
         frame_rectangles: list[list[_MaskRectangle]] = []
         remaining_rectangles = _MAX_PRECISE_COLLISION_RECTANGLES
         for mask in masks:
             rectangles = self._mask_rectangles(
-                mask,
-                width,
+                mask.tobytes().translate(threshold),
+                bbox_right - bbox_left + 1,
                 bbox_left,
-                bbox_right,
                 bbox_top,
-                bbox_bottom,
                 max_rectangles=remaining_rectangles,
             )
             frame_rectangles.append(rectangles)
@@ -955,6 +1045,19 @@ class SpriteConverter(BaseConverter):
             precise_per_frame=per_frame,
         )
 
+    @staticmethod
+    def _frame_alpha(image: Image.Image) -> Image.Image:
+        rgba = image if image.mode == "RGBA" else image.convert("RGBA")
+        return rgba.getchannel("A")
+
+    def _retain_frame_alpha(self, frame_path: str, image: Image.Image) -> None:
+        """Keep the alpha plane of an exported frame for its precise mask."""
+        try:
+            alpha = self._frame_alpha(image)
+        except (OSError, ValueError):
+            return
+        self._frame_alpha_cache.put(frame_path, alpha)
+
     def _generated_frame_paths(
         self,
         sprite_name: str,
@@ -972,32 +1075,39 @@ class SpriteConverter(BaseConverter):
 
     @staticmethod
     def _mask_rectangles(
-        mask: bytearray,
-        width: int,
-        bbox_left: int,
-        bbox_right: int,
-        bbox_top: int,
-        bbox_bottom: int,
+        mask: bytes,
+        mask_width: int,
+        x_offset: int,
+        y_offset: int,
         *,
         max_rectangles: int = _MAX_PRECISE_COLLISION_RECTANGLES,
     ) -> list[_MaskRectangle]:
+        """Merge the runs of a 0/255 row-major mask into exact rectangles.
+
+        A run continues the rectangle above it when the previous row had a run
+        with the same extent. Rows identical to the previous one extend every
+        open rectangle without being rescanned.
+        """
         rectangles: list[_MaskRectangle] = []
+        heights: list[int] = []
         active: dict[tuple[int, int], int] = {}
+        previous_row: bytes | None = None
 
-        for y in range(bbox_top, bbox_bottom + 1):
-            spans: list[tuple[int, int]] = []
-            x = bbox_left
-            while x <= bbox_right:
-                if not mask[y * width + x]:
-                    x += 1
-                    continue
-                start = x
-                while x <= bbox_right and mask[y * width + x]:
-                    x += 1
-                spans.append((start, x - 1))
+        for row_start in range(0, len(mask), mask_width):
+            row = mask[row_start:row_start + mask_width]
+            if row == previous_row:
+                for rectangle_index in active.values():
+                    heights[rectangle_index] += 1
+                continue
+            previous_row = row
+            y = y_offset + row_start // mask_width
 
             next_active: dict[tuple[int, int], int] = {}
-            for start, end in spans:
+            start = row.find(255)
+            while start >= 0:
+                end = row.find(0, start)
+                if end < 0:
+                    end = mask_width
                 key = (start, end)
                 rectangle_index = active.get(key)
                 if rectangle_index is None:
@@ -1009,24 +1119,28 @@ class SpriteConverter(BaseConverter):
                     rectangle_index = len(rectangles)
                     rectangles.append(
                         _MaskRectangle(
-                            x=start,
+                            x=x_offset + start,
                             y=y,
-                            width=end - start + 1,
+                            width=end - start,
                             height=1,
                         )
                     )
+                    heights.append(1)
                 else:
-                    rectangle = rectangles[rectangle_index]
-                    rectangles[rectangle_index] = _MaskRectangle(
-                        x=rectangle.x,
-                        y=rectangle.y,
-                        width=rectangle.width,
-                        height=rectangle.height + 1,
-                    )
+                    heights[rectangle_index] += 1
                 next_active[key] = rectangle_index
+                start = row.find(255, end)
             active = next_active
 
-        return rectangles
+        return [
+            _MaskRectangle(
+                x=rectangle.x,
+                y=rectangle.y,
+                width=rectangle.width,
+                height=height,
+            )
+            for rectangle, height in zip(rectangles, heights)
+        ]
 
     def _report_precise_mask_fallback(
         self,
@@ -1395,9 +1509,21 @@ class SpriteConverter(BaseConverter):
         sprite_dir = self._sprite_output_directory(subfolder, sprite_name)
         godot_sprite_path = os.path.join(sprite_dir, new_filename)
 
-        if len(resolved_sprite_paths) == 1:
+        retain_alpha = sprite_name in self._precise_mask_sprites
+        if (
+            len(resolved_sprite_paths) == 1
+            and not self.normalize_png
+            and _is_valid_png_header(resolved_sprite_paths[0])
+        ):
+            shutil.copyfile(resolved_sprite_paths[0], godot_sprite_path)
+            if retain_alpha:
+                with Image.open(resolved_sprite_paths[0]) as img:
+                    self._retain_frame_alpha(godot_sprite_path, img)
+        elif len(resolved_sprite_paths) == 1:
             with Image.open(resolved_sprite_paths[0]) as img:
                 img.save(godot_sprite_path, 'PNG')
+                if retain_alpha:
+                    self._retain_frame_alpha(godot_sprite_path, img)
         else:
             composed = None
             for gm_sprite_path in resolved_sprite_paths:
@@ -1408,6 +1534,8 @@ class SpriteConverter(BaseConverter):
                 composed.alpha_composite(layer)
             assert composed is not None
             composed.save(godot_sprite_path, 'PNG')
+            if retain_alpha:
+                self._retain_frame_alpha(godot_sprite_path, composed)
 
         return (sprite_name, index, images_count, resolved_sprite_paths[0], new_filename)
 
@@ -1432,6 +1560,13 @@ class SpriteConverter(BaseConverter):
         )
 
     def convert_sprites(self) -> None:
+        try:
+            self._convert_sprite_resources()
+        finally:
+            self._frame_alpha_cache.clear()
+            self._precise_mask_sprites = frozenset()
+
+    def _convert_sprite_resources(self) -> None:
         os.makedirs(self.godot_sprites_path, exist_ok=True)
 
         valid_names = self._get_valid_sprite_names(
@@ -1580,10 +1715,20 @@ class SpriteConverter(BaseConverter):
             sprite_dir = self._sprite_output_directory(subfolder, sprite_name)
             os.makedirs(sprite_dir, exist_ok=True)
 
+        # Frame workers keep the alpha planes precise masks are built from.
+        self._precise_mask_sprites = frozenset(
+            sprite_name
+            for sprite_name in sprite_images
+            if (collision_data := self._parse_collision_data(sprite_name)) is not None
+            and collision_data["collisionKind"] in (0, 4)
+        )
+
         # Flatten all work items
         work_items: list[tuple[str, int, list[str], int, str]] = []
+        frame_counts: dict[str, int] = {}
         for sprite_name, images in sprite_images.items():
             ordered_images = self._build_ordered_frame_list(sprite_name, images)
+            frame_counts[sprite_name] = len(ordered_images)
             subfolder = sprite_subfolders.get(sprite_name, "")
             for index, gm_sprite_path in enumerate(ordered_images, start=1):
                 work_items.append((sprite_name, index, gm_sprite_path, len(ordered_images), subfolder))
@@ -1593,18 +1738,20 @@ class SpriteConverter(BaseConverter):
         cancelled = False
         failed_sprites: set[str] = set()
         first_error: Exception | None = None
+        frames_remaining = dict(frame_counts)
+        scene_futures: dict[str, Future[list[str] | None]] = {}
 
-        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
-            futures_map: dict[Future[SpriteProcessResult | None], tuple[str, int, list[str], int, str]] = {
-                executor.submit(self._process_requested_sprite, name, idx, path, count, sub):
-                    (name, idx, path, count, sub)
-                for name, idx, path, count, sub in work_items
-            }
-            for future in as_completed(futures_map):
+        with self._work_queue("sprites") as queue:
+            for work_item, future in queue.map(
+                lambda item: self._process_requested_sprite(*item),
+                work_items,
+            ):
+                frame_sprite_name = work_item[0]
+                frames_remaining[frame_sprite_name] -= 1
                 try:
                     result = future.result()
                 except Exception as error:
-                    failed_sprites.add(futures_map[future][0])
+                    failed_sprites.add(frame_sprite_name)
                     if first_error is None:
                         first_error = error
                     continue
@@ -1629,6 +1776,21 @@ class SpriteConverter(BaseConverter):
 
                 self._safe_progress(int(processed_images / total_images * 100))
 
+                # The scene is generated on the pool as soon as the sprite's
+                # last frame is exported; outcomes are applied in order below.
+                if (
+                    frames_remaining[sprite_name] == 0
+                    and sprite_name not in failed_sprites
+                    and not cancelled
+                ):
+                    scene_futures[sprite_name] = queue.submit(
+                        self._generate_converted_sprite_scene,
+                        sprite_name,
+                        frame_counts[sprite_name],
+                        sprite_subfolders.get(sprite_name, ""),
+                    )
+            cancelled = cancelled or queue.stopped
+
         for sprite_name in sorted(failed_sprites):
             self._resource_failed(sprite_name)
 
@@ -1638,41 +1800,22 @@ class SpriteConverter(BaseConverter):
                 raise first_error
             return
 
-        # Second pass: generate scenes for all sprites
-        for sprite_name, images in sprite_images.items():
-            if not self.conversion_running():
-                cancelled = True
-                break
-            if sprite_name in failed_sprites:
+        for sprite_name in sprite_images:
+            scene_future = scene_futures.get(sprite_name)
+            if scene_future is None:
                 continue
             try:
-                frame_count = len(self._build_ordered_frame_list(sprite_name, images))
-                collision_data = self._parse_collision_data(sprite_name)
-                animation_data = self._parse_animation_data(sprite_name)
-                if frame_count > 1 and animation_data is None:
-                    animation_data = self._fallback_animation_data(frame_count)
-                    self._safe_log(
-                        f"Warning: Sprite {sprite_name} has multiple frames but no "
-                        "readable animation metadata; using a looping 30 FPS fallback."
-                    )
-                subfolder = sprite_subfolders.get(sprite_name, "")
-
-                self._generate_sprite_scene(sprite_name, collision_data, frame_count, animation_data, subfolder)
-
-                self._safe_log(get_localized("Console_Convertor_Sprites_SceneGenerated").format(name=sprite_name))
-                if frame_count > 1 and animation_data is not None:
-                    godot_fps = self._compute_godot_fps(animation_data)
-                    self._safe_log(get_localized("Console_Convertor_Sprites_SceneAnimated").format(
-                        frame_count=frame_count, fps=godot_fps, loop=animation_data["loop"]))
-                    if animation_data["playbackSpeedType"] == 1:
-                        self._safe_log(
-                            get_localized("Console_Convertor_Sprites_SpeedTypeWarning").format(name=sprite_name)
-                        )
+                messages = scene_future.result()
             except Exception as error:
                 self._resource_failed(sprite_name)
                 if first_error is None:
                     first_error = error
                 continue
+            if messages is None:
+                cancelled = True
+                break
+            for message in messages:
+                self._safe_log(message)
             self._resource_completed(sprite_name)
 
         if first_error is not None:
@@ -1683,6 +1826,42 @@ class SpriteConverter(BaseConverter):
 
         self.log_callback(get_localized("Console_Convertor_Sprites_Complete"))
 
+    def _generate_converted_sprite_scene(
+        self,
+        sprite_name: str,
+        frame_count: int,
+        subfolder: str,
+    ) -> list[str] | None:
+        """Generate the scene of a sprite whose frames are all exported.
+
+        Returns the log lines reporting the scene, or None when the
+        conversion was stopped first.
+        """
+        if not self.conversion_running():
+            return None
+        messages: list[str] = []
+        collision_data = self._parse_collision_data(sprite_name)
+        animation_data = self._parse_animation_data(sprite_name)
+        if frame_count > 1 and animation_data is None:
+            animation_data = self._fallback_animation_data(frame_count)
+            messages.append(
+                f"Warning: Sprite {sprite_name} has multiple frames but no "
+                "readable animation metadata; using a looping 30 FPS fallback."
+            )
+
+        self._generate_sprite_scene(sprite_name, collision_data, frame_count, animation_data, subfolder)
+
+        messages.append(get_localized("Console_Convertor_Sprites_SceneGenerated").format(name=sprite_name))
+        if frame_count > 1 and animation_data is not None:
+            godot_fps = self._compute_godot_fps(animation_data)
+            messages.append(get_localized("Console_Convertor_Sprites_SceneAnimated").format(
+                frame_count=frame_count, fps=godot_fps, loop=animation_data["loop"]))
+            if animation_data["playbackSpeedType"] == 1:
+                messages.append(
+                    get_localized("Console_Convertor_Sprites_SpeedTypeWarning").format(name=sprite_name)
+                )
+        return messages
+
     def convert_all(self) -> None:
         self._reset_resource_outcomes()
         self.convert_sprites()
@@ -1,11 +1,10 @@
 from __future__ import annotations
 
 import os
-import re
 import json
 import shutil
 import posixpath
-from concurrent.futures import Future, ThreadPoolExecutor, as_completed
+from collections.abc import Mapping
 from dataclasses import dataclass
 from typing import Literal, NotRequired, TypedDict, cast
 
@@ -28,6 +27,7 @@ from src.conversion.project_source_paths import (
     validate_project_resource_source_path,
 )
 from src.conversion.type_defs import ConversionRunning, JsonDict, LogCallback, ProgressCallback, StrPath
+from src.conversion.yy_documents import load_yy_json
 
 
 class TilesetData(TypedDict):
@@ -87,7 +87,7 @@ class TileSetConverter(BaseConverter):
                          update_log_callback, compact_logging, max_workers=max_workers,
                          diagnostics=diagnostics)
         self.godot_tilesets_path = os.path.join(self.godot_project_path, 'tilesets')
-        self._tileset_output_paths: dict[str, str] = {}
+        self._tileset_output_paths: Mapping[str, str] = {}
         self._tileset_source_paths: dict[str, str] = {}
         self._yyp_declared_tilesets: dict[str, _DeclaredTilesetResource] = {}
 
@@ -304,10 +304,7 @@ class TileSetConverter(BaseConverter):
             return None
         yy_path = resolved_tileset.filesystem_path
         try:
-            with open(yy_path, 'r', encoding='utf-8') as f:
-                content = f.read()
-            cleaned = re.sub(r',\s*([}\]])', r'\1', content)
-            data = cast(JsonDict, json.loads(cleaned))
+            data = load_yy_json(yy_path)
 
             sprite_reference = self._resolve_sprite_reference(
                 tileset_name,
@@ -490,10 +487,7 @@ class TileSetConverter(BaseConverter):
         yy_path = resolved_sprite.filesystem_path
 
         try:
-            with open(yy_path, 'r', encoding='utf-8') as f:
-                content = f.read()
-            cleaned = re.sub(r',\s*([}\]])', r'\1', content)
-            data = cast(JsonDict, json.loads(cleaned))
+            data = load_yy_json(yy_path)
 
             # Get the first frame GUID
             raw_frames = data.get('frames', [])
@@ -1005,17 +999,15 @@ class TileSetConverter(BaseConverter):
         total_tilesets = len(tileset_names)
         processed_tilesets = 0
 
-        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
-            futures_map: dict[Future[TilesetResult | None], str] = {
-                executor.submit(
-                    self._process_tileset_with_outcome,
+        with self._work_queue("tilesets") as queue:
+            for _name, future in queue.map(
+                lambda name: self._process_tileset_with_outcome(
                     name,
                     tileset_subfolders.get(name, ""),
                     self._tileset_source_paths.get(name),
-                ): name
-                for name in tileset_names
-            }
-            for future in as_completed(futures_map):
+                ),
+                tileset_names,
+            ):
                 result = future.result()
                 if result is None:
                     self.log_callback(get_localized("Console_Convertor_Tilesets_Stopped"))
@@ -1036,6 +1028,9 @@ class TileSetConverter(BaseConverter):
                             tileHeight=td["tileHeight"]))
 
                 self._safe_progress(int(processed_tilesets / total_tilesets * 100))
+            if queue.stopped:
+                self.log_callback(get_localized("Console_Convertor_Tilesets_Stopped"))
+                return
 
         self.log_callback(get_localized("Console_Convertor_Tilesets_Complete"))
 
@@ -0,0 +1,174 @@
+from __future__ import annotations
+
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass
+from types import TracebackType
+from typing import Any, TypeVar, cast
+
+from src.conversion.type_defs import ConversionRunning
+
+
+_ItemT = TypeVar("_ItemT")
+_ResultT = TypeVar("_ResultT")
+
+# Futures admitted per worker thread: enough to keep every worker busy while
+# completed results are consumed, without queueing the whole project.
+DEFAULT_WORK_QUEUE_WINDOW_MULTIPLIER = 2
+
+
+@dataclass(frozen=True)
+class WorkQueueStats:
+    window: int
+    submitted: int
+    completed: int
+    cancelled: int
+    peak_depth: int
+
+
+class BoundedWorkQueue:
+    """Thread pool that admits at most ``window`` work items at a time.
+
+    Items are pulled from the input iterable only as earlier ones complete, so
+    bookkeeping stays proportional to the worker count rather than to the
+    project size. Once ``conversion_running()`` turns false no further items
+    are admitted and queued items that have not started are cancelled; only
+    the items already running are still reported. Leaving the ``with`` block
+    early cancels queued items instead of draining them; follow-up work added
+    with ``submit`` is still waited for, as with a plain executor.
+    """
+
+    def __init__(
+        self,
+        *,
+        max_workers: int,
+        conversion_running: ConversionRunning,
+        window: int | None = None,
+        on_close: Callable[[WorkQueueStats], None] | None = None,
+    ) -> None:
+        if max_workers < 1:
+            raise ValueError("max_workers must be at least one")
+        self.max_workers = max_workers
+        self.window = (
+            window
+            if window is not None
+            else max_workers * DEFAULT_WORK_QUEUE_WINDOW_MULTIPLIER
+        )
+        if self.window < 1:
+            raise ValueError("window must be at least one")
+        self._conversion_running = conversion_running
+        self._on_close = on_close
+        self._executor: ThreadPoolExecutor | None = None
+        self._pending: dict[Future[Any], object] = {}
+        self._stopped = False
+        self._input_exhausted = False
+        self._submitted = 0
+        self._completed = 0
+        self._cancelled = 0
+        self._peak_depth = 0
+
+    def __enter__(self) -> BoundedWorkQueue:
+        self._executor = ThreadPoolExecutor(max_workers=self.max_workers)
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        executor = self._executor
+        self._executor = None
+        self._cancel_pending()
+        if executor is not None:
+            executor.shutdown(wait=True)
+        if self._on_close is not None:
+            self._on_close(self.stats())
+
+    @property
+    def stopped(self) -> bool:
+        """Whether admission ended because the conversion was stopped."""
+        return self._stopped
+
+    @property
+    def finished(self) -> bool:
+        """Whether every input item was run and reported."""
+        return self._input_exhausted and not self._pending and not self._stopped
+
+    def submit(self, fn: Callable[..., _ResultT], /, *args: object) -> Future[_ResultT]:
+        """Run follow-up work on the pool outside the admission window."""
+        if self._executor is None:
+            raise RuntimeError("BoundedWorkQueue must be entered before submitting work")
+        return self._executor.submit(fn, *args)
+
+    def map(
+        self,
+        worker: Callable[[_ItemT], _ResultT],
+        items: Iterable[_ItemT],
+    ) -> Iterator[tuple[_ItemT, Future[_ResultT]]]:
+        """Run ``worker`` on each item, yielding ``(item, future)`` as they finish."""
+
+        def submit(executor: ThreadPoolExecutor, item: _ItemT) -> Future[_ResultT]:
+            return executor.submit(worker, item)
+
+        return self.submit_each(items, submit)
+
+    def submit_each(
+        self,
+        items: Iterable[_ItemT],
+        submit: Callable[[ThreadPoolExecutor, _ItemT], Future[_ResultT]],
+    ) -> Iterator[tuple[_ItemT, Future[_ResultT]]]:
+        """Like ``map`` with a caller-supplied ``submit(executor, item)``."""
+        executor = self._executor
+        if executor is None:
+            raise RuntimeError("BoundedWorkQueue must be entered before submitting work")
+        pending = self._pending
+        item_iterator = iter(items)
+        self._input_exhausted = False
+        while True:
+            while not self._stopped and not self._input_exhausted and len(pending) < self.window:
+                if not self._conversion_running():
+                    self._stop()
+                    break
+                try:
+                    item = next(item_iterator)
+                except StopIteration:
+                    self._input_exhausted = True
+                    break
+                pending[submit(executor, item)] = item
+                self._submitted += 1
+                self._peak_depth = max(self._peak_depth, len(pending))
+
+            if not pending:
+                return
+            done, _not_done = wait(tuple(pending), return_when=FIRST_COMPLETED)
+            # Report in submission order so results are deterministic when
+            # several futures finish together.
+            for future in [future for future in pending if future in done]:
+                item = cast(_ItemT, pending.pop(future))
+                if future.cancelled():
+                    continue
+                self._completed += 1
+                yield item, future
+
+    def stats(self) -> WorkQueueStats:
+        return WorkQueueStats(
+            window=self.window,
+            submitted=self._submitted,
+            completed=self._completed,
+            cancelled=self._cancelled,
+            peak_depth=self._peak_depth,
+        )
+
+    def _stop(self) -> None:
+        self._stopped = True
+        for future in tuple(self._pending):
+            if future.cancel():
+                del self._pending[future]
+                self._cancelled += 1
+
+    def _cancel_pending(self) -> None:
+        for future in self._pending:
+            if future.cancel():
+                self._cancelled += 1
+        self._pending.clear()
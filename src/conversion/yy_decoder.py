@@ -0,0 +1,218 @@
+"""Trailing-comma tolerant decoding of GameMaker ``.yy``/``.yyp`` metadata.
+
+``decode_yy`` is a regex scan for trailing commas followed by
+``json.loads``; it is not a one-pass replacement parser and decodes at
+about the speed of the old regex-then-``json.loads`` path. Unlike that
+path it leaves commas inside string literals alone and reports errors
+against the original text. The real saving is ``iter_yy_object_items``,
+which reads top-level members lazily and skips unwanted values, such as
+room layers, without decoding them.
+"""
+
+from __future__ import annotations
+
+import json
+import json.decoder
+import re
+from collections.abc import Callable, Collection, Iterator
+from typing import TypeAlias, cast
+
+from src.conversion.type_defs import JsonDict
+
+
+_ScanString: TypeAlias = Callable[[str, int], tuple[str, int]]
+
+# The C string scanner of the json module; typeshed does not declare it.
+_scanstring = cast(_ScanString, getattr(json.decoder, "scanstring"))
+
+_TRAILING_COMMA_CANDIDATE_RE = re.compile(r",\s*+[}\]]")
+_BRACKET_RE = re.compile(r"[\[\]{}]")
+_SCALAR_RE = re.compile(r"[^\s,}\]]+")
+_WHITESPACE_RE = re.compile(r"\s*")
+_CLOSERS = {"[": "]", "{": "}"}
+
+
+class YYDecodeError(json.JSONDecodeError):
+    """GameMaker metadata decode failure reported against the original text.
+
+    ``lineno``, ``colno`` and ``pos`` always refer to the undecoded source,
+    including any trailing commas that were accepted before the failure.
+    """
+
+
+def _quote_parity_flips(source: str, start: int, end: int) -> int:
+    """Return the number of unescaped double quotes in ``source[start:end]``."""
+    if source.find("\\", start, end) < 0:
+        return source.count('"', start, end)
+    flips = 0
+    index = start
+    while index < end:
+        quote = source.find('"', index, end)
+        if quote < 0:
+            break
+        backslashes = 0
+        cursor = quote - 1
+        while cursor >= start and source[cursor] == "\\":
+            backslashes += 1
+            cursor -= 1
+        if backslashes % 2 == 0:
+            flips += 1
+        index = quote + 1
+    return flips
+
+
+def _trailing_comma_positions(source: str, start: int = 0, end: int | None = None) -> list[int]:
+    """Return trailing-comma offsets outside string literals in one scan.
+
+    Candidates are found by a C-level regex; each one is then classified by
+    the parity of unescaped quotes since the previous candidate, so strings
+    such as ``"a,]"`` are never edited.
+    """
+    stop = len(source) if end is None else end
+    positions: list[int] = []
+    in_string = False
+    scanned = start
+    for match in _TRAILING_COMMA_CANDIDATE_RE.finditer(source, start, stop):
+        comma = match.start()
+        if _quote_parity_flips(source, scanned, comma) % 2:
+            in_string = not in_string
+        scanned = comma
+        if not in_string:
+            positions.append(comma)
+    return positions
+
+
+def _without_positions(source: str, positions: list[int], start: int, end: int) -> str:
+    if not positions:
+        return source[start:end]
+    pieces: list[str] = []
+    cursor = start
+    for position in positions:
+        pieces.append(source[cursor:position])
+        cursor = position + 1
+    pieces.append(source[cursor:end])
+    return "".join(pieces)
+
+
+def _original_position(cleaned_position: int, removed: list[int], start: int) -> int:
+    position = start + cleaned_position
+    for removed_position in removed:
+        if removed_position <= position:
+            position += 1
+        else:
+            break
+    return position
+
+
+def _decode_span(source: str, start: int, end: int) -> object:
+    removed = _trailing_comma_positions(source, start, end)
+    cleaned = _without_positions(source, removed, start, end)
+    try:
+        return json.loads(cleaned)
+    except json.JSONDecodeError as error:
+        raise YYDecodeError(
+            error.msg,
+            source,
+            _original_position(error.pos, removed, start),
+        ) from None
+
+
+def decode_yy(source: str) -> object:
+    """Decode GameMaker ``.yy``/``.yyp`` JSON, accepting trailing commas.
+
+    Trailing commas outside strings are removed and the remaining text is
+    passed to ``json.loads``. Errors are raised as :class:`YYDecodeError`
+    with line and column in ``source``.
+    """
+    return _decode_span(source, 0, len(source))
+
+
+def _skip_whitespace(source: str, index: int) -> int:
+    match = _WHITESPACE_RE.match(source, index)
+    return match.end() if match is not None else index
+
+
+def _value_end(source: str, index: int) -> int:
+    if index >= len(source):
+        raise YYDecodeError("Expecting value", source, index)
+    char = source[index]
+    if char == '"':
+        try:
+            return _scanstring(source, index + 1)[1]
+        except json.JSONDecodeError as error:
+            raise YYDecodeError(error.msg, source, error.pos) from None
+    if char in _CLOSERS:
+        stack: list[str] = []
+        in_string = False
+        scanned = index
+        for match in _BRACKET_RE.finditer(source, index):
+            bracket = match.start()
+            if _quote_parity_flips(source, scanned, bracket) % 2:
+                in_string = not in_string
+            scanned = bracket
+            if in_string:
+                continue
+            token = match.group()
+            if token in _CLOSERS:
+                stack.append(_CLOSERS[token])
+            elif not stack or stack.pop() != token:
+                raise YYDecodeError("Unbalanced bracket", source, bracket)
+            elif not stack:
+                return match.end()
+        raise YYDecodeError("Unterminated container", source, index)
+    match = _SCALAR_RE.match(source, index)
+    if match is None:
+        raise YYDecodeError("Expecting value", source, index)
+    return match.end()
+
+
+def iter_yy_object_items(
+    source: str,
+    keys: Collection[str] | None = None,
+) -> Iterator[tuple[str, object]]:
+    """Yield top-level ``(key, value)`` pairs of a GameMaker document lazily.
+
+    When ``keys`` is given, other members are skipped by bracket matching and
+    never decoded, so large ``layers`` arrays cost a scan instead of a parse.
+    Stopping iteration early leaves the rest of ``source`` unread.
+    """
+    index = _skip_whitespace(source, 0)
+    if not source.startswith("{", index):
+        raise YYDecodeError("Expecting '{'", source, index)
+    index = _skip_whitespace(source, index + 1)
+    while True:
+        if source.startswith("}", index):
+            return
+        if not source.startswith('"', index):
+            raise YYDecodeError(
+                "Expecting property name enclosed in double quotes",
+                source,
+                index,
+            )
+        try:
+            key, index = _scanstring(source, index + 1)
+        except json.JSONDecodeError as error:
+            raise YYDecodeError(error.msg, source, error.pos) from None
+        index = _skip_whitespace(source, index)
+        if not source.startswith(":", index):
+            raise YYDecodeError("Expecting ':' delimiter", source, index)
+        value_start = _skip_whitespace(source, index + 1)
+        value_end = _value_end(source, value_start)
+        if keys is None or key in keys:
+            yield key, _decode_span(source, value_start, value_end)
+        index = _skip_whitespace(source, value_end)
+        if source.startswith(",", index):
+            index = _skip_whitespace(source, index + 1)
+        elif not source.startswith("}", index):
+            raise YYDecodeError("Expecting ',' delimiter", source, index)
+
+
+def decode_yy_object_keys(source: str, keys: Collection[str]) -> JsonDict:
+    """Decode only ``keys`` from a top-level GameMaker object."""
+    wanted = frozenset(keys)
+    values: JsonDict = {}
+    for key, value in iter_yy_object_items(source, wanted):
+        values[key] = value
+        if len(values) == len(wanted):
+            break
+    return values
@@ -0,0 +1,359 @@
+from __future__ import annotations
+
+import json
+import os
+import threading
+from collections import OrderedDict
+from collections.abc import Collection
+from dataclasses import dataclass
+from typing import Any, NoReturn, TypeAlias, cast
+
+from src.conversion.conversion_scope import active_conversion_scope
+from src.conversion.type_defs import JsonDict, StrPath
+from src.conversion.yy_decoder import decode_yy, decode_yy_object_keys
+
+
+# Counted in source bytes; see YYDocument.cost_bytes.
+DEFAULT_YY_DOCUMENT_BUDGET_BYTES = 256 * 1024 * 1024
+
+YYDocumentFingerprint: TypeAlias = tuple[int, int, int, int]
+
+
+class YYDocumentError(ValueError):
+    """A GameMaker metadata file could not be read or is not a JSON object."""
+
+
+def _read_only(*_args: object, **_kwargs: object) -> NoReturn:
+    raise TypeError("Shared GameMaker .yy documents are read-only.")
+
+
+class ReadOnlyJsonDict(dict[str, Any]):
+    """Dict view of a shared parsed document that rejects mutation.
+
+    Copies (``dict(value)``, ``copy.copy`` and ``copy.deepcopy``) return plain
+    mutable containers so callers that need to edit metadata can still do so.
+    """
+
+    __slots__ = ()
+
+    __setitem__ = _read_only
+    __delitem__ = _read_only
+    __ior__ = _read_only
+    clear = _read_only
+    pop = _read_only
+    popitem = _read_only
+    setdefault = _read_only
+    update = _read_only
+
+    def __copy__(self) -> JsonDict:
+        return dict(self)
+
+    def __deepcopy__(self, memo: dict[int, object]) -> JsonDict:
+        return cast(JsonDict, thaw_json(self))
+
+    def __reduce__(self) -> tuple[type[dict[str, Any]], tuple[JsonDict]]:
+        return (dict, (dict(self),))
+
+
+class ReadOnlyJsonList(list[Any]):
+    """List view of a shared parsed document that rejects mutation."""
+
+    __slots__ = ()
+
+    __setitem__ = _read_only
+    __delitem__ = _read_only
+    __iadd__ = _read_only
+    __imul__ = _read_only
+    append = _read_only
+    clear = _read_only
+    extend = _read_only
+    insert = _read_only
+    pop = _read_only
+    remove = _read_only
+    reverse = _read_only
+    sort = _read_only
+
+    def __copy__(self) -> list[Any]:
+        return list(self)
+
+    def __deepcopy__(self, memo: dict[int, object]) -> list[Any]:
+        return cast(list[Any], thaw_json(self))
+
+    def __reduce__(self) -> tuple[type[list[Any]], tuple[list[Any]]]:
+        return (list, (list(self),))
+
+
+def _freeze_item(value: object) -> object:
+    value_type = type(value)
+    if value_type is dict or value_type is list:
+        return freeze_json(value)
+    return value
+
+
+def freeze_json(value: object) -> object:
+    """Return ``value`` with every dict and list replaced by a read-only view.
+
+    Only the plain ``dict``/``list`` containers produced by the JSON decoder
+    are converted; already frozen views are returned unchanged. Containers
+    without nested containers, such as tile data arrays, are copied in one
+    C-level call instead of item by item.
+    """
+    if type(value) is dict:
+        members = cast(dict[str, object], value)
+        if dict in map(type, members.values()) or list in map(type, members.values()):
+            return ReadOnlyJsonDict(
+                (key, _freeze_item(item)) for key, item in members.items()
+            )
+        return ReadOnlyJsonDict(members)
+    if type(value) is list:
+        items = cast(list[object], value)
+        if dict in map(type, items) or list in map(type, items):
+            return ReadOnlyJsonList(_freeze_item(item) for item in items)
+        return ReadOnlyJsonList(items)
+    return value
+
+
+def thaw_json(value: object) -> object:
+    """Return a plain mutable deep copy of a frozen or plain JSON value."""
+    if isinstance(value, dict):
+        return {
+            key: thaw_json(item)
+            for key, item in cast(dict[str, object], value).items()
+        }
+    if isinstance(value, list):
+        return [thaw_json(item) for item in cast(list[object], value)]
+    return value
+
+
+def _document_key(path: StrPath) -> str:
+    raw_path: str = os.fspath(path)
+    return os.path.abspath(raw_path)
+
+
+def parse_yy_text(source: str) -> object:
+    """Parse GameMaker ``.yy``/``.yyp`` JSON that may contain trailing commas."""
+    return decode_yy(source)
+
+
+@dataclass(frozen=True)
+class YYDocument:
+    """One parsed GameMaker metadata file and the identity it was read from."""
+
+    path: str
+    fingerprint: YYDocumentFingerprint
+    data: JsonDict | None
+    source: str | None = None
+
+    @property
+    def cost_bytes(self) -> int:
+        """Budget charge of this entry, measured in source bytes.
+
+        This is the file size, doubled when the text is retained. Parsed
+        Python objects usually take several times the source size, so the
+        store budget bounds cached source bytes rather than process memory.
+        """
+        size = self.fingerprint[2]
+        return size * 2 if self.source is not None else size
+
+
+@dataclass(frozen=True)
+class YYDocumentStoreStats:
+    hits: int
+    misses: int
+    evictions: int
+    entries: int
+    cached_bytes: int
+
+
+def _fingerprint(stat_result: os.stat_result) -> YYDocumentFingerprint:
+    return (
+        stat_result.st_dev,
+        stat_result.st_ino,
+        stat_result.st_size,
+        stat_result.st_mtime_ns,
+    )
+
+
+def _load_document(path: str, *, retain_source: bool) -> YYDocument | None:
+    try:
+        with open(path, "r", encoding="utf-8") as source_file:
+            fingerprint = _fingerprint(os.fstat(source_file.fileno()))
+            source = source_file.read()
+    except (OSError, UnicodeDecodeError):
+        return None
+    data: JsonDict | None = None
+    try:
+        value = parse_yy_text(source)
+    except (json.JSONDecodeError, RecursionError, TypeError, ValueError):
+        value = None
+    if isinstance(value, dict):
+        data = cast(JsonDict, freeze_json(cast(JsonDict, value)))
+    return YYDocument(
+        path=path,
+        fingerprint=fingerprint,
+        data=data,
+        source=source if retain_source else None,
+    )
+
+
+def _load_document_keys(path: str, keys: Collection[str]) -> JsonDict | None:
+    try:
+        with open(path, "r", encoding="utf-8") as source_file:
+            source = source_file.read()
+    except (OSError, UnicodeDecodeError):
+        return None
+    try:
+        values = decode_yy_object_keys(source, keys)
+    except (json.JSONDecodeError, RecursionError, TypeError, ValueError):
+        return None
+    return cast(JsonDict, freeze_json(values))
+
+
+class YYDocumentStore:
+    """Parse-once cache of GameMaker metadata documents for one conversion.
+
+    Entries are keyed on the absolute path and validated against the file's
+    ``(dev, ino, size, mtime_ns)`` fingerprint on every lookup, so an edited
+    source is re-read instead of served stale. Parsed documents are shared
+    read-only views; the least recently used ones are evicted once the cached
+    source bytes exceed ``budget_bytes``.
+    """
+
+    def __init__(self, budget_bytes: int = DEFAULT_YY_DOCUMENT_BUDGET_BYTES) -> None:
+        self.budget_bytes = max(0, budget_bytes)
+        self._lock = threading.Lock()
+        self._entries: OrderedDict[str, YYDocument] = OrderedDict()
+        self._cached_bytes = 0
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    def read(self, path: StrPath) -> JsonDict | None:
+        """Return the parsed top-level object of ``path``, or ``None``."""
+        document = self.read_document(path)
+        return document.data if document is not None else None
+
+    def read_document(
+        self,
+        path: StrPath,
+        *,
+        retain_source: bool = False,
+    ) -> YYDocument | None:
+        """Return the cached document for ``path``, parsing it on a miss.
+
+        ``retain_source`` keeps the decoded text alongside the parsed value for
+        callers that report source line numbers.
+        """
+        key = _document_key(path)
+        try:
+            fingerprint = _fingerprint(os.stat(key))
+        except OSError:
+            return None
+        with self._lock:
+            cached = self._entries.get(key)
+            if (
+                cached is not None
+                and cached.fingerprint == fingerprint
+                and (cached.source is not None or not retain_source)
+            ):
+                self._entries.move_to_end(key)
+                self._hits += 1
+                return cached
+            self._misses += 1
+
+        document = _load_document(key, retain_source=retain_source)
+        if document is None:
+            return None
+        self._store(key, document)
+        return document
+
+    def read_keys(self, path: StrPath, keys: Collection[str]) -> JsonDict | None:
+        """Return only the top-level ``keys`` of ``path``.
+
+        A cached full document answers directly; otherwise the file is
+        stream-decoded and unwanted members such as room ``layers`` are
+        skipped without being parsed. Partial results are not cached.
+        """
+        key = _document_key(path)
+        try:
+            fingerprint = _fingerprint(os.stat(key))
+        except OSError:
+            return None
+        with self._lock:
+            cached = self._entries.get(key)
+            if cached is not None and cached.fingerprint == fingerprint:
+                self._entries.move_to_end(key)
+                self._hits += 1
+                data = cached.data
+                if data is None:
+                    return None
+                return ReadOnlyJsonDict(
+                    (name, data[name]) for name in keys if name in data
+                )
+            self._misses += 1
+        return _load_document_keys(key, keys)
+
+    def _store(self, key: str, document: YYDocument) -> None:
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self._cached_bytes -= previous.cost_bytes
+            if document.cost_bytes > self.budget_bytes:
+                return
+            self._entries[key] = document
+            self._cached_bytes += document.cost_bytes
+            while self._cached_bytes > self.budget_bytes and self._entries:
+                _, evicted = self._entries.popitem(last=False)
+                self._cached_bytes -= evicted.cost_bytes
+                self._evictions += 1
+
+    def stats(self) -> YYDocumentStoreStats:
+        with self._lock:
+            return YYDocumentStoreStats(
+                hits=self._hits,
+                misses=self._misses,
+                evictions=self._evictions,
+                entries=len(self._entries),
+                cached_bytes=self._cached_bytes,
+            )
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._cached_bytes = 0
+
+
+def read_yy_document(
+    path: StrPath,
+    *,
+    retain_source: bool = False,
+) -> YYDocument | None:
+    """Read ``path`` through the conversion's store, or parse it directly."""
+    store = active_conversion_scope().yy_documents
+    if store is not None:
+        return store.read_document(path, retain_source=retain_source)
+    return _load_document(_document_key(path), retain_source=retain_source)
+
+
+def read_yy_json(path: StrPath) -> JsonDict | None:
+    """Return the read-only top-level object of a ``.yy`` file, or ``None``."""
+    document = read_yy_document(path)
+    return document.data if document is not None else None
+
+
+def read_yy_json_keys(path: StrPath, keys: Collection[str]) -> JsonDict | None:
+    """Return the read-only top-level ``keys`` of a ``.yy`` file, or ``None``."""
+    store = active_conversion_scope().yy_documents
+    if store is not None:
+        return store.read_keys(path, keys)
+    return _load_document_keys(_document_key(path), keys)
+
+
+def load_yy_json(path: StrPath) -> JsonDict:
+    """Return the top-level object of a ``.yy`` file or raise ``YYDocumentError``."""
+    document = read_yy_document(path)
+    if document is None:
+        raise YYDocumentError(f"Could not read GameMaker metadata: {os.fspath(path)}")
+    if document.data is None:
+        raise YYDocumentError(f"GameMaker metadata is malformed: {os.fspath(path)}")
+    return document.data
@@ -7,7 +7,7 @@ from PySide6.QtWidgets import (
 
 from src.gui.theme import THEME
 from src.gui.setting_value import SettingValue
-from src.conversion.converter import CONVERSION_CATEGORIES
+from src.conversion.conversion_plan import CONVERSION_CATEGORIES
 from src.localization import get_localized, get_localized_dict, get_localized_list
 
 
@@ -18,6 +18,7 @@ class SettingsDialog(QDialog):
         compact_logging: SettingValue,
         platform_value: str,
         max_workers: int,
+        transpile_cache: SettingValue | None = None,
         parent: QWidget | None = None,
     ) -> None:
         super().__init__(parent)
@@ -25,6 +26,7 @@ class SettingsDialog(QDialog):
         self._compact_logging = compact_logging
         self._platform = platform_value
         self._max_workers = max_workers
+        self._transpile_cache = transpile_cache
         self._checkboxes: dict[str, QCheckBox] = {}
         self._init_ui()
 
@@ -129,6 +131,12 @@ class SettingsDialog(QDialog):
 
         layout.addLayout(workers_row)
 
+        if self._transpile_cache is not None:
+            cache_cb = QCheckBox(get_localized("Settings_Performance_TranspileCache"))
+            cache_cb.setChecked(self._transpile_cache.get())
+            cache_cb.toggled.connect(self._transpile_cache.set)
+            layout.addWidget(cache_cb)
+
         # Buttons
         btn_row = QHBoxLayout()
         btn_row.addStretch()
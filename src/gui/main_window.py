@@ -22,7 +22,8 @@ from src.gui.dialogs.about_dialog import AboutDialog
 from src.gui.dialogs.release_notes_dialog import ReleaseNotesDialog
 from src.gui.dialogs.language_dialog import LanguageDialog
 from src.conversion.conversion_outcome import ConversionOutcome
-from src.conversion.converter import CONVERSION_CATEGORIES
+from src.conversion.conversion_plan import CONVERSION_CATEGORIES
+from src.conversion.gml_transpile_cache import default_transpile_cache_dir
 from src.conversion.project_godot import (
     GODOT_PROJECT_FILENAME,
     ConversionPreflightError,
@@ -88,6 +89,7 @@ class MainWindow(QMainWindow):
         self._conversion_settings["sound_group_folders"].set(False)
         self._compact_logging = SettingValue(True)
         self._max_workers = multiprocessing.cpu_count()
+        self._transpile_cache = SettingValue(False)
 
         match platform.system():
             case "Linux":
@@ -194,6 +196,7 @@ class MainWindow(QMainWindow):
             self._compact_logging,
             self._gm_platform,
             self._max_workers,
+            transpile_cache=self._transpile_cache,
             parent=self,
         )
         if dialog.exec():
@@ -295,6 +298,11 @@ class MainWindow(QMainWindow):
             self._compact_logging.get(),
             self._conversion_running,
             max_workers=self._max_workers,
+            transpile_cache_dir=(
+                default_transpile_cache_dir()
+                if self._transpile_cache.get()
+                else None
+            ),
         )
 
         self._conversion_thread = QThread()
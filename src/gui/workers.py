@@ -79,6 +79,7 @@ class ConversionWorker(QObject):
         compact_logging: bool,
         conversion_running: threading.Event,
         max_workers: int | None = None,
+        transpile_cache_dir: str | None = None,
     ) -> None:
         super().__init__()
         self._gm_path = gm_path
@@ -92,6 +93,7 @@ class ConversionWorker(QObject):
         self._compact_logging = compact_logging
         self._conversion_running = conversion_running
         self._max_workers = max_workers
+        self._transpile_cache_dir = transpile_cache_dir
 
     def run(self) -> None:
         converter: _ConverterProtocol | None = None
@@ -106,6 +108,7 @@ class ConversionWorker(QObject):
                     update_log_callback=self.update_log_message.emit,
                     compact_logging=self._compact_logging,
                     max_workers=self._max_workers,
+                    transpile_cache_dir=self._transpile_cache_dir,
                 ),
             )
             raw_outcome = cast(
@@ -1,46 +1,214 @@
 from __future__ import annotations
 
+from dataclasses import dataclass
 import json
 import os
+from string import Formatter
 import sys
+import threading
 from typing import Any, cast
 
+FALLBACK_LANGUAGE = 'eng'
+
+
 def get_base_path() -> str:
     if getattr(sys, 'frozen', False):
         return cast(str, getattr(sys, '_MEIPASS'))
     return os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 
-def _load_language_value(path: str, key: str) -> object | None:
-    with open(path, 'r', encoding='utf-8') as file:
-        data = cast(dict[str, Any], json.load(file))
-    return data.get(key)
 
+@dataclass(frozen=True)
+class LocalizationCacheStats:
+    hits: int
+    misses: int
+    reloads: int
 
-def _get_localized_raw(key: str) -> object | None:
-    base_path = get_base_path()
-    lang_file = os.path.join(base_path, 'Current Language')
-    with open(lang_file, 'r', encoding='utf-8') as file:
-        language = file.readline().strip()
 
-    json_path = os.path.join(base_path, 'Languages', f'{language}.json')
+@dataclass(frozen=True)
+class _FileStamp:
+    mtime_ns: int
+    size: int
+
+
+@dataclass(frozen=True)
+class _LocalizedTemplate:
+    text: str
+    has_fields: bool
+
+    def format(self, fields: dict[str, object]) -> str:
+        if not self.has_fields:
+            return self.text
+        return self.text.format_map(fields)
+
+
+@dataclass(frozen=True)
+class _LanguageCatalog:
+    stamp: _FileStamp | None
+    values: dict[str, object]
+    templates: dict[str, _LocalizedTemplate]
+
+
+def _file_stamp(path: str) -> _FileStamp | None:
     try:
-        value = _load_language_value(json_path, key)
-        if value is not None:
-            return value
-    except (OSError, json.JSONDecodeError, TypeError, ValueError):
-        pass
+        stat_result = os.stat(path)
+    except OSError:
+        return None
+    return _FileStamp(stat_result.st_mtime_ns, stat_result.st_size)
 
+
+def _template_has_fields(text: str) -> bool:
+    try:
+        return any(field_name is not None for _, field_name, _, _ in Formatter().parse(text))
+    except ValueError:
+        return False
+
+
+def _localized_template(text: str) -> _LocalizedTemplate:
+    if _template_has_fields(text):
+        return _LocalizedTemplate(text, True)
     try:
-        return _load_language_value(os.path.join(base_path, 'Languages', 'eng.json'), key)
+        # Resolve escaped braces once so formatting returns "{x}" for "{{x}}".
+        return _LocalizedTemplate(text.format_map({}), False)
+    except ValueError:
+        return _LocalizedTemplate(text, False)
+
+
+def _load_language_values(path: str) -> dict[str, object]:
+    try:
+        with open(path, 'r', encoding='utf-8') as file:
+            data = json.load(file)
     except (OSError, json.JSONDecodeError, TypeError, ValueError):
+        return {}
+    if not isinstance(data, dict):
+        return {}
+    return cast(dict[str, object], data)
+
+
+def _build_language_catalog(path: str, stamp: _FileStamp | None) -> _LanguageCatalog:
+    values = _load_language_values(path) if stamp is not None else {}
+    templates = {
+        key: _localized_template(value)
+        for key, value in values.items()
+        if isinstance(value, str)
+    }
+    return _LanguageCatalog(stamp, values, templates)
+
+
+class LocalizationCatalog:
+    """Process-wide language catalog loaded once and reloaded on file change.
+
+    The selected language and every ``Languages/<code>.json`` file are cached
+    with their modification stamp, so repeated lookups only stat the files.
+    """
+
+    def __init__(self, base_path: str | None = None) -> None:
+        self._base_path = base_path
+        self._lock = threading.Lock()
+        self._catalogs: dict[str, _LanguageCatalog] = {}
+        self._current_language: tuple[_FileStamp | None, str] | None = None
+        self._hits = 0
+        self._misses = 0
+        self._reloads = 0
+
+    def _resolved_base_path(self) -> str:
+        return self._base_path if self._base_path is not None else get_base_path()
+
+    def _language_path(self, language: str) -> str:
+        return os.path.join(self._resolved_base_path(), 'Languages', f'{language}.json')
+
+    def _selected_language(self) -> str:
+        lang_file = os.path.join(self._resolved_base_path(), 'Current Language')
+        stamp = _file_stamp(lang_file)
+        cached = self._current_language
+        if cached is not None and cached[0] == stamp:
+            return cached[1]
+        language = ''
+        if stamp is not None:
+            try:
+                with open(lang_file, 'r', encoding='utf-8') as file:
+                    language = file.readline().strip()
+            except OSError:
+                language = ''
+        self._current_language = (stamp, language or FALLBACK_LANGUAGE)
+        return self._current_language[1]
+
+    def _catalog(self, language: str) -> _LanguageCatalog:
+        path = self._language_path(language)
+        stamp = _file_stamp(path)
+        cached = self._catalogs.get(language)
+        if cached is not None and cached.stamp == stamp:
+            self._hits += 1
+            return cached
+        if cached is None:
+            self._misses += 1
+        else:
+            self._reloads += 1
+        catalog = _build_language_catalog(path, stamp)
+        self._catalogs[language] = catalog
+        return catalog
+
+    def _catalog_chain(self) -> tuple[_LanguageCatalog, ...]:
+        language = self._selected_language()
+        if language == FALLBACK_LANGUAGE:
+            return (self._catalog(language),)
+        return (self._catalog(language), self._catalog(FALLBACK_LANGUAGE))
+
+    def lookup(self, key: str) -> object | None:
+        with self._lock:
+            for catalog in self._catalog_chain():
+                value = catalog.values.get(key)
+                if value is not None:
+                    return value
+        return None
+
+    def template(self, key: str) -> _LocalizedTemplate | None:
+        with self._lock:
+            for catalog in self._catalog_chain():
+                if catalog.values.get(key) is not None:
+                    return catalog.templates.get(key)
         return None
 
+    def stats(self) -> LocalizationCacheStats:
+        with self._lock:
+            return LocalizationCacheStats(self._hits, self._misses, self._reloads)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._catalogs.clear()
+            self._current_language = None
+            self._hits = 0
+            self._misses = 0
+            self._reloads = 0
+
+
+_CATALOG = LocalizationCatalog()
+
+
+def localization_cache_stats() -> LocalizationCacheStats:
+    return _CATALOG.stats()
+
+
+def clear_localization_cache() -> None:
+    _CATALOG.clear()
+
+
+def _get_localized_raw(key: str) -> object | None:
+    return _CATALOG.lookup(key)
+
 
 def get_localized(key: str) -> str:
     value = _get_localized_raw(key)
     return value if isinstance(value, str) else ""
 
 
+def format_localized(key: str, /, **fields: Any) -> str:
+    """Return the localized template for ``key`` formatted with ``fields``."""
+    template = _CATALOG.template(key)
+    if template is None:
+        return ""
+    return template.format(fields)
+
+
 def get_localized_list(key: str) -> list[str]:
     value = _get_localized_raw(key)
     if isinstance(value, list):
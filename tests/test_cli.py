@@ -1307,6 +1307,47 @@ class TestCLIReports(unittest.TestCase):
         for filename in self._STATIC_REPORT_FILENAMES:
             self.assertTrue(os.path.isfile(os.path.join(static_report_root, filename)))
 
+    def test_convert_passes_performance_options_to_converter(self) -> None:
+        cache_dir = os.path.join(self.temp_dir, "transpile-cache")
+        font_index_path = os.path.join(self.temp_dir, "system-font-index.json")
+        converter_kwargs: list[dict[str, object]] = []
+
+        def converter_factory(**kwargs: object) -> _OutcomeConverterStub:
+            converter_kwargs.append(kwargs)
+            return _OutcomeConverterStub(_success_outcome())
+
+        with (
+            patch("src.cli.Converter", side_effect=converter_factory),
+            redirect_stdout(io.StringIO()),
+            redirect_stderr(io.StringIO()),
+        ):
+            self.assertEqual(cli.main(self._convert_args()), 0)
+            self.assertEqual(
+                cli.main(
+                    self._convert_args(
+                        "--transpile-cache-dir",
+                        cache_dir,
+                        "--system-font-index",
+                        font_index_path,
+                        "--reuse-file-digests",
+                        "--incremental",
+                        "--normalize-sprite-png",
+                    )
+                ),
+                0,
+            )
+
+        self.assertIsNone(converter_kwargs[0]["transpile_cache_dir"])
+        self.assertIsNone(converter_kwargs[0]["system_font_index_path"])
+        self.assertIs(converter_kwargs[0]["reuse_file_digests"], False)
+        self.assertIs(converter_kwargs[0]["incremental"], False)
+        self.assertIs(converter_kwargs[0]["normalize_sprite_png"], False)
+        self.assertEqual(converter_kwargs[1]["transpile_cache_dir"], cache_dir)
+        self.assertEqual(converter_kwargs[1]["system_font_index_path"], font_index_path)
+        self.assertIs(converter_kwargs[1]["reuse_file_digests"], True)
+        self.assertIs(converter_kwargs[1]["incremental"], True)
+        self.assertIs(converter_kwargs[1]["normalize_sprite_png"], True)
+
     def test_convert_static_report_commit_failure_cleans_temp_and_fails_outcome(
         self,
     ) -> None:
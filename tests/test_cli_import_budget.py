@@ -0,0 +1,129 @@
+from __future__ import annotations
+
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import unittest
+from collections.abc import Sequence
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+GM_PROJECT = os.path.join(PROJECT_ROOT, "tests", "fixtures", "golden", "basic_scripts")
+
+# Subsystems only `convert` (and `validate` with Godot validation) may load.
+CONVERSION_MODULES = (
+    "src.conversion.converter",
+    "src.conversion.conversion_manifest",
+    "src.conversion.gml_runtime",
+    "src.conversion.gml_transpile_engine",
+    "src.conversion.gml_transpiler",
+    "src.conversion.project_godot",
+    "src.conversion.sprites",
+    "PIL",
+)
+GODOT_VALIDATION_MODULE = "src.conversion.godot_validation"
+
+# Cumulative self time of the project's own modules, in milliseconds. The
+# budget is several times what these commands take today; loading the
+# converters alone exceeds it.
+IMPORT_BUDGET_MS = 250
+
+
+def _import_times(args: Sequence[str]) -> dict[str, int]:
+    """Run the CLI under ``-X importtime`` and return self time by module."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-m", "src.cli", *args],
+        capture_output=True,
+        text=True,
+        cwd=PROJECT_ROOT,
+        check=False,
+    )
+    if result.returncode not in (0, 2):
+        raise AssertionError(f"CLI {args!r} failed:\n{result.stderr}")
+    times: dict[str, int] = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        self_time, _cumulative, module_name = line.removeprefix("import time:").split("|")
+        if self_time.strip().isdigit():
+            times[module_name.strip()] = int(self_time)
+    return times
+
+
+class TestCLIImportBudget(unittest.TestCase):
+    def setUp(self) -> None:
+        self.temp_dir = tempfile.mkdtemp()
+
+    def tearDown(self) -> None:
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def assert_within_budget(
+        self,
+        args: Sequence[str],
+        *,
+        forbidden: Sequence[str] = CONVERSION_MODULES,
+        required: Sequence[str] = (),
+    ) -> None:
+        times = _import_times(args)
+        for module_name in forbidden:
+            with self.subTest(args=args, forbidden=module_name):
+                loaded = sorted(
+                    name
+                    for name in times
+                    if name == module_name or name.startswith(f"{module_name}.")
+                )
+                self.assertEqual(loaded, [])
+        for module_name in required:
+            with self.subTest(args=args, required=module_name):
+                self.assertIn(module_name, times)
+        project_time_ms = sum(
+            self_time
+            for name, self_time in times.items()
+            if name == "src" or name.startswith("src.")
+        ) / 1000
+        self.assertLessEqual(
+            project_time_ms,
+            IMPORT_BUDGET_MS,
+            f"CLI {args!r} spent {project_time_ms:.1f}ms importing project modules",
+        )
+
+    def test_version_and_list_converters_stay_within_budget(self) -> None:
+        self.assert_within_budget(["--version"])
+        self.assert_within_budget(["list-converters", "--format", "json"])
+
+    def test_report_and_analyze_stay_within_budget(self) -> None:
+        self.assert_within_budget(["report", "--report-dir", self.temp_dir])
+        self.assert_within_budget(
+            [
+                "analyze",
+                "--gm-project",
+                GM_PROJECT,
+                "--platform",
+                "linux",
+                "--report-dir",
+                self.temp_dir,
+            ]
+        )
+
+    def test_validate_loads_godot_validation_only_when_requested(self) -> None:
+        godot_dir = os.path.join(self.temp_dir, "godot")
+        os.makedirs(godot_dir)
+        self.assert_within_budget(
+            ["validate", "--godot-project", godot_dir, "--skip-godot-validation"],
+            forbidden=(*CONVERSION_MODULES, GODOT_VALIDATION_MODULE),
+        )
+        self.assert_within_budget(
+            [
+                "validate",
+                "--godot-project",
+                godot_dir,
+                "--godot-bin",
+                os.path.join(self.temp_dir, "missing-godot"),
+            ],
+            required=(GODOT_VALIDATION_MODULE,),
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -130,7 +130,7 @@ class TestConversionManifest(unittest.TestCase):
         )
         self.assertTrue(
             any(
-                generated["path"] == "scripts/game/scr_add.gd.gmlmap.json"
+                generated["path"] == "scripts/game/scr_add.gd.gdmap"
                 and generated["kind"] == "source_map"
                 for generated in generated_files
             )
@@ -29,7 +29,7 @@ from src.conversion.conversion_outcome import (
     ConversionStepResult,
 )
 from src.conversion.diagnostics import DIAGNOSTIC_REPORT_JSON_RELATIVE_PATH
-from src.conversion.generation_inventory import GenerationInventory
+from src.conversion.generation_inventory import GenerationDigestCache, GenerationInventory
 from src.conversion.project_godot import ConversionPreflightError
 
 
@@ -218,6 +218,34 @@ class TestConverterOutcomes(unittest.TestCase):
         self.assertIs(self.converter.last_outcome, outcome)
         self.assertIs(self.converter.diagnostics.outcome(), outcome)
 
+    def test_system_font_index_is_prefetched_only_for_font_lookups(self) -> None:
+        self.converter.system_font_index_path = "/cache/system-font-index.json"
+        runners: dict[str, Callable[[], object]] = {
+            "scripts": lambda: ConversionStepResult(),
+            "fonts": lambda: ConversionStepResult(),
+        }
+        with (
+            self._environment(runners),
+            patch("src.conversion.converter.prefetch_system_font_index") as prefetch,
+        ):
+            self.converter.convert("/gm", "windows", "/godot", self._settings("scripts"))
+            prefetch.assert_not_called()
+
+            self.converter.convert("/gm", "windows", "/godot", self._settings("scripts", "fonts"))
+            prefetch.assert_called_once_with("/cache/system-font-index.json")
+
+    def test_inventory_digests_are_reused_only_when_enabled(self) -> None:
+        settings = self._settings("scripts")
+        self.assertIsNone(
+            self.converter._create_context("/gm", "windows", "/godot", settings).generation_digests
+        )
+
+        self.converter.reuse_file_digests = True
+        self.assertIsInstance(
+            self.converter._create_context("/gm", "windows", "/godot", settings).generation_digests,
+            GenerationDigestCache,
+        )
+
     def test_initially_cancelled_skips_every_requested_converter(self) -> None:
         self.running.clear()
         scripts = MagicMock(return_value=ConversionStepResult())
@@ -7,6 +7,7 @@ import shutil
 import tempfile
 import threading
 import unittest
+from collections.abc import Mapping
 from typing import TypeAlias
 from unittest.mock import MagicMock, Mock, patch
 
@@ -14,7 +15,16 @@ PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 if PROJECT_ROOT not in sys.path:
     sys.path.insert(0, PROJECT_ROOT)
 
-from src.conversion.fonts import FontConverter, _find_system_font
+from src.conversion.fonts import (
+    FontConverter,
+    _find_system_font,
+    build_system_font_index,
+    load_system_font_index,
+    prefetch_system_font_index,
+    refresh_system_font_index,
+    system_font_index,
+    write_system_font_index,
+)
 from src.conversion.asset_output_paths import (
     build_asset_output_paths,
     resource_filesystem_path,
@@ -1226,6 +1236,86 @@ class TestFindSystemFont(unittest.TestCase):
         self.assertIsNone(result)
 
 
+class TestSystemFontIndex(unittest.TestCase):
+    def setUp(self) -> None:
+        self.font_dir = tempfile.mkdtemp()
+        self.other_font_dir = tempfile.mkdtemp()
+        self.cache_dir = tempfile.mkdtemp()
+        self.nested_dir = os.path.join(self.font_dir, "nested")
+        os.makedirs(self.nested_dir)
+        self.regular_font = self._write_font(self.font_dir, "Open Sans-Regular.ttf")
+        self.nested_font = self._write_font(self.nested_dir, "OpenSans.otf")
+        self.other_font = self._write_font(self.other_font_dir, "Other.woff2")
+        self._write_font(self.other_font_dir, "notes.txt")
+        self.font_dirs = [self.font_dir, self.other_font_dir]
+
+    def tearDown(self) -> None:
+        shutil.rmtree(self.font_dir)
+        shutil.rmtree(self.other_font_dir)
+        shutil.rmtree(self.cache_dir)
+
+    @staticmethod
+    def _write_font(directory: str, filename: str) -> str:
+        path = os.path.join(directory, filename)
+        with open(path, "wb") as font_file:
+            font_file.write(b"\x00" * 16)
+        return path
+
+    def test_index_matches_directory_search(self) -> None:
+        index = build_system_font_index(self.font_dirs)
+
+        self.assertEqual(index.find("Open Sans-Regular"), self.regular_font)
+        self.assertEqual(index.find("OTHER"), self.other_font)
+        self.assertIsNone(index.find("notes"))
+        with patch("src.conversion.fonts._get_system_font_dirs", return_value=self.font_dirs):
+            for name in ("opensans", "Open Sans", "Other", "notes", "Missing"):
+                with self.subTest(name=name):
+                    self.assertEqual(index.find(name), _find_system_font(name))
+
+    def test_persisted_index_is_reused_until_a_directory_changes(self) -> None:
+        path = os.path.join(self.cache_dir, "nested", "system-font-index.json")
+        index = build_system_font_index(self.font_dirs)
+        write_system_font_index(index, path)
+
+        loaded = load_system_font_index(path, self.font_dirs)
+        assert loaded is not None
+        self.assertEqual(dict(loaded.paths_by_name), dict(index.paths_by_name))
+        self.assertIsNone(load_system_font_index(path, [self.font_dir]))
+
+        self._write_font(self.nested_dir, "Added.ttf")
+        self.assertIsNone(load_system_font_index(path, self.font_dirs))
+
+        with open(path, "w", encoding="utf-8") as index_file:
+            index_file.write("{")
+        self.assertIsNone(load_system_font_index(path, self.font_dirs))
+        self.assertIsNone(load_system_font_index(os.path.join(self.cache_dir, "missing"), self.font_dirs))
+
+    def test_process_index_is_built_once_and_refreshed_on_changes(self) -> None:
+        with patch("src.conversion.fonts._get_system_font_dirs", return_value=self.font_dirs):
+            index = system_font_index()
+            self.assertIs(system_font_index(), index)
+            self.assertIs(refresh_system_font_index(), index)
+
+            added_font = self._write_font(self.nested_dir, "Added-Normal.ttf")
+            self.assertIsNone(_find_system_font("Added"))
+            self.assertEqual(refresh_system_font_index().find("Added"), added_font)
+            self.assertEqual(_find_system_font("Added"), added_font)
+        self.assertEqual(os.listdir(self.cache_dir), [])
+
+    def test_refresh_persists_the_index_only_to_a_given_path(self) -> None:
+        path = os.path.join(self.cache_dir, "system-font-index.json")
+        with patch("src.conversion.fonts._get_system_font_dirs", return_value=self.font_dirs):
+            refresh_system_font_index()
+            self._write_font(self.font_dir, "Added.ttf")
+            thread = prefetch_system_font_index(path)
+            thread.join(timeout=10)
+            self.assertFalse(thread.is_alive())
+
+        persisted = load_system_font_index(path, self.font_dirs)
+        assert persisted is not None
+        self.assertIsNotNone(persisted.find("Added"))
+
+
 class TestFontConverterCollisionSafeOutputs(unittest.TestCase):
     def setUp(self) -> None:
         self.gm_dir = tempfile.mkdtemp()
@@ -1247,7 +1337,7 @@ class TestFontConverterCollisionSafeOutputs(unittest.TestCase):
             max_workers=2,
         ).convert_all()
 
-    def _font_paths(self) -> dict[str, str]:
+    def _font_paths(self) -> Mapping[str, str]:
         return build_asset_output_paths(
             self.gm_dir,
             self.godot_dir,
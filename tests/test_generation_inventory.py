@@ -8,6 +8,7 @@ import stat
 import subprocess
 import sys
 import tempfile
+import time
 import unittest
 from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
@@ -21,6 +22,7 @@ from src.conversion.conversion_manifest import (
     CONVERSION_MANIFEST_RELATIVE_PATH,
 )
 from src.conversion.generation_inventory import (
+    GenerationDigestCache,
     GenerationInventory,
     GenerationInventoryEntry,
     GenerationInventoryOwner,
@@ -140,6 +142,132 @@ class TestGenerationInventory(unittest.TestCase):
             capture_generation_inventory(parallel).to_bytes(),
         )
 
+    def test_parallel_hashing_matches_sequential_capture(self) -> None:
+        destination = self.temp_dir / "project"
+        for index in range(24):
+            output = destination / "sprites" / f"group_{index % 3}" / f"{index}.png"
+            output.parent.mkdir(parents=True, exist_ok=True)
+            output.write_bytes(bytes([index]) * (index * 4097 + 1))
+
+        sequential = capture_generation_inventory(destination)
+        for workers in (None, 4):
+            with self.subTest(workers=workers):
+                self.assertEqual(
+                    capture_generation_inventory(
+                        destination,
+                        hash_workers=workers,
+                    ).to_bytes(),
+                    sequential.to_bytes(),
+                )
+
+    def test_digest_cache_reuses_digests_only_for_unchanged_fingerprints(
+        self,
+    ) -> None:
+        destination = self.temp_dir / "project"
+        (destination / "scripts").mkdir(parents=True)
+        unchanged = destination / "scripts" / "unchanged.gd"
+        mutated = destination / "scripts" / "mutated.gd"
+        unchanged.write_bytes(b"extends Node\n")
+        mutated.write_bytes(b"original bytes")
+        cache = GenerationDigestCache()
+        first = capture_generation_inventory(destination, digest_cache=cache)
+        self.assertEqual(first, capture_generation_inventory(destination))
+
+        with patch.object(
+            inventory_module.hashlib,
+            "sha256",
+            wraps=hashlib.sha256,
+        ) as sha256:
+            self.assertEqual(
+                capture_generation_inventory(destination, digest_cache=cache),
+                first,
+            )
+        self.assertEqual(sha256.call_count, 0)
+
+        original_stat = mutated.stat()
+        mutated.write_bytes(b"mutated! bytes")
+        os.utime(
+            mutated,
+            ns=(original_stat.st_atime_ns, original_stat.st_mtime_ns),
+        )
+        with patch.object(
+            inventory_module.hashlib,
+            "sha256",
+            wraps=hashlib.sha256,
+        ) as sha256:
+            trusted = capture_generation_inventory(
+                destination,
+                digest_cache=cache,
+                hash_workers=2,
+            )
+        self.assertEqual(sha256.call_count, 1)
+        self.assertEqual(trusted, capture_generation_inventory(destination))
+        self.assertNotEqual(
+            trusted.by_path()["scripts/mutated.gd"].sha256,
+            first.by_path()["scripts/mutated.gd"].sha256,
+        )
+
+    def test_digest_cache_keeps_unchanged_while_captured_checks(self) -> None:
+        destination = self.temp_dir / "project"
+        (destination / "scripts").mkdir(parents=True)
+        output = destination / "scripts" / "main.gd"
+        output.write_bytes(b"extends Node\n")
+        cache = GenerationDigestCache()
+        capture_generation_inventory(destination, digest_cache=cache)
+        real_lookup = cache.lookup
+
+        def lookup_then_mutate(
+            relative_path: str,
+            fingerprint: tuple[int, int, int, int, int],
+        ) -> tuple[int, str] | None:
+            recorded = real_lookup(relative_path, fingerprint)
+            with open(output, "ab") as appended:
+                appended.write(b"# late write\n")
+            return recorded
+
+        with patch.object(cache, "lookup", side_effect=lookup_then_mutate):
+            with self.assertRaisesRegex(OSError, "changed while hashing"):
+                capture_generation_inventory(destination, digest_cache=cache)
+
+    @unittest.skipUnless(
+        os.environ.get("GM2GODOT_REPORT_PERF") == "1",
+        "GM2GODOT_REPORT_PERF is not set",
+    )
+    def test_report_capture_timings(self) -> None:
+        destination = self.temp_dir / "project"
+        chunk = os.urandom(1024 * 1024)
+        for index in range(256):
+            output = destination / "sprites" / f"group_{index % 8}" / f"{index}.png"
+            output.parent.mkdir(parents=True, exist_ok=True)
+            output.write_bytes(chunk)
+
+        cache = GenerationDigestCache()
+        timings: dict[str, float] = {}
+        for label, capture in (
+            ("sequential", lambda: capture_generation_inventory(destination)),
+            (
+                "parallel",
+                lambda: capture_generation_inventory(destination, hash_workers=None),
+            ),
+            (
+                "cache_fill",
+                lambda: capture_generation_inventory(destination, digest_cache=cache),
+            ),
+            (
+                "cache_hit",
+                lambda: capture_generation_inventory(destination, digest_cache=cache),
+            ),
+        ):
+            started = time.perf_counter()
+            capture()
+            timings[label] = time.perf_counter() - started
+        print(
+            "256 MiB generation inventory: "
+            + "; ".join(
+                f"{label} {seconds * 1000:.1f} ms" for label, seconds in timings.items()
+            )
+        )
+
     def test_capture_is_complete_and_excludes_private_or_unrelated_state(
         self,
     ) -> None:
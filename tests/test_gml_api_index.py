@@ -0,0 +1,115 @@
+import os
+import subprocess
+import sys
+import tempfile
+import time
+import unittest
+from pathlib import Path
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if PROJECT_ROOT not in sys.path:
+    sys.path.insert(0, PROJECT_ROOT)
+
+from src.conversion.gml_transpiler_parts.gml_api_index import (
+    build_gml_api_index,
+    load_precompiled_gml_api_index,
+    write_gml_api_index,
+)
+
+_REGENERATE_HINT = (
+    "The committed GML API index is stale; regenerate it with "
+    "`python -m src.conversion.gml_transpiler_parts.gml_api_index`."
+)
+
+
+class TestGMLAPIIndex(unittest.TestCase):
+    def test_committed_index_matches_python_definitions(self):
+        precompiled = load_precompiled_gml_api_index()
+        self.assertIsNotNone(precompiled, _REGENERATE_HINT)
+        assert precompiled is not None
+        built = build_gml_api_index()
+
+        self.assertEqual(precompiled.source, "precompiled")
+        self.assertEqual(precompiled.api_entries, built.api_entries)
+        self.assertEqual(
+            list(precompiled.category_issue_numbers.items()),
+            list(built.category_issue_numbers.items()),
+        )
+        self.assertEqual(
+            list(precompiled.function_descriptors.items()),
+            list(built.function_descriptors.items()),
+        )
+
+    def test_stale_or_corrupt_index_falls_back_to_none(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            path = write_gml_api_index(Path(temp_dir) / "gml_api_index.pickle")
+            self.assertIsNotNone(load_precompiled_gml_api_index(path))
+
+            digest, _separator, body = path.read_bytes().partition(b"\n")
+            path.write_bytes(b"0" * len(digest) + b"\n" + body)
+            self.assertIsNone(load_precompiled_gml_api_index(path))
+
+            path.write_bytes(digest + b"\n" + body[: len(body) // 2])
+            self.assertIsNone(load_precompiled_gml_api_index(path))
+
+            self.assertIsNone(load_precompiled_gml_api_index(Path(temp_dir) / "missing"))
+
+    def test_lookups_do_not_evaluate_python_definitions(self):
+        script = (
+            "import sys\n"
+            "from src.conversion.gml_transpiler import get_gml_api_entry, "
+            "get_gml_function_descriptor\n"
+            "assert get_gml_api_entry('array_length') is not None\n"
+            "assert get_gml_function_descriptor('array_length') is not None\n"
+            "parts = 'src.conversion.gml_transpiler_parts.'\n"
+            "print(sorted(name for name in ("
+            "parts + 'gml_api_manifest_entries', parts + 'gml_function_dispatch_table'"
+            ") if name in sys.modules))\n"
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", script],
+            cwd=PROJECT_ROOT,
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+        self.assertEqual(result.stdout.strip(), "[]")
+
+
+@unittest.skipUnless(
+    os.environ.get("GM2GODOT_REPORT_PERF") == "1",
+    "GM2GODOT_REPORT_PERF is not set",
+)
+class TestGMLAPIIndexPerformance(unittest.TestCase):
+    def test_report_precompiled_and_python_index_load_time(self):
+        timings: dict[str, float] = {}
+        for label, call in (
+            ("precompiled", "load_precompiled_gml_api_index()"),
+            ("python", "build_gml_api_index()"),
+        ):
+            script = (
+                "import time\n"
+                "start = time.perf_counter()\n"
+                "from src.conversion.gml_transpiler_parts.gml_api_index import "
+                "build_gml_api_index, load_precompiled_gml_api_index\n"
+                f"{call}\n"
+                "print(time.perf_counter() - start)\n"
+            )
+            started = time.perf_counter()
+            result = subprocess.run(
+                [sys.executable, "-c", script],
+                cwd=PROJECT_ROOT,
+                capture_output=True,
+                text=True,
+                check=True,
+            )
+            timings[label] = float(result.stdout.strip())
+            timings[f"{label}_process"] = time.perf_counter() - started
+        print(
+            "GML API index load: "
+            + ", ".join(f"{name}={seconds * 1000:.1f}ms" for name, seconds in timings.items())
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,14 +1,24 @@
+# pyright: reportPrivateUsage=false
 import os
+import subprocess
 import sys
 import tempfile
 import unittest
 from dataclasses import dataclass
+from unittest.mock import patch
 
 PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 if PROJECT_ROOT not in sys.path:
     sys.path.insert(0, PROJECT_ROOT)
 
-from src.conversion.gml_runtime import GML_RUNTIME_RELATIVE_PATH, GML_RUNTIME_SCRIPT, write_gml_runtime
+from src.conversion.conversion_scope import ConversionScope, using_conversion_scope
+from src.conversion.gml_runtime import (
+    GML_RUNTIME_RELATIVE_PATH,
+    GML_RUNTIME_SCRIPT,
+    GMLRuntimeWrites,
+    write_gml_runtime,
+)
+from src.conversion.gml_runtime_parts import writer as runtime_writer
 from src.conversion.gml_transpiler import transpile_gml_expression
 
 
@@ -3297,6 +3307,56 @@ class TestGMLRuntimeScript(unittest.TestCase):
             with open(runtime_path, encoding="utf-8") as runtime_file:
                 self.assertEqual(runtime_file.read(), GML_RUNTIME_SCRIPT)
 
+    def test_write_gml_runtime_skips_files_whose_digest_matches(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            runtime_path = write_gml_runtime(tmpdir)
+            with patch.object(
+                runtime_writer,
+                "atomic_write_confined_generated_text",
+                wraps=runtime_writer.atomic_write_confined_generated_text,
+            ) as atomic_write:
+                write_gml_runtime(tmpdir)
+                self.assertEqual(atomic_write.call_count, 0)
+
+                with open(runtime_path, "a", encoding="utf-8") as runtime_file:
+                    runtime_file.write("# edited\n")
+                write_gml_runtime(tmpdir)
+
+            self.assertEqual(
+                [call.args[0] for call in atomic_write.call_args_list],
+                [runtime_path],
+            )
+            with open(runtime_path, encoding="utf-8") as runtime_file:
+                self.assertEqual(runtime_file.read(), GML_RUNTIME_SCRIPT)
+
+    def test_runtime_writes_write_each_output_root_once(self):
+        with tempfile.TemporaryDirectory() as first, tempfile.TemporaryDirectory() as second:
+            with patch.object(
+                runtime_writer,
+                "_write_gml_runtime_files",
+                wraps=runtime_writer._write_gml_runtime_files,
+            ) as write_files:
+                with using_conversion_scope(ConversionScope(gml_runtime_writes=GMLRuntimeWrites())):
+                    write_gml_runtime(first)
+                    write_gml_runtime(first)
+                    write_gml_runtime(second)
+                write_gml_runtime(first)
+
+            self.assertEqual(
+                [call.args[0] for call in write_files.call_args_list],
+                [first, second, first],
+            )
+
+    def test_importing_runtime_facade_does_not_read_segments(self):
+        probe = (
+            "import src.cli\n"
+            "from src.conversion.gml_runtime_parts import script\n"
+            "assert script._artifact is None\n"
+            "from src.conversion.gml_runtime import GML_RUNTIME_SCRIPT, gml_runtime_artifact\n"
+            "assert GML_RUNTIME_SCRIPT is gml_runtime_artifact().script\n"
+        )
+        subprocess.run([sys.executable, "-c", probe], cwd=PROJECT_ROOT, check=True)
+
 
 class TestGMLRuntimeParityFixtures(unittest.TestCase):
     def test_runtime_value_expression_fixtures(self):
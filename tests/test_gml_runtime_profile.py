@@ -0,0 +1,152 @@
+from __future__ import annotations
+
+import json
+import os
+import re
+import shutil
+import tempfile
+import threading
+import unittest
+from pathlib import Path
+
+from src.conversion.conversion_manifest import CONVERSION_MANIFEST_RELATIVE_PATH
+from src.conversion.converter import Converter
+from src.conversion.gml_runtime import (
+    GML_RUNTIME_PROFILE_RELATIVE_PATH,
+    GML_RUNTIME_RELATIVE_PATH,
+    GML_RUNTIME_SCRIPT,
+    apply_gml_runtime_profile,
+    load_gml_runtime_profile,
+    runtime_symbol_index,
+    write_gml_runtime,
+)
+from src.conversion.gml_runtime_parts.profile import (
+    render_minimal_runtime_script,
+    runtime_declarations,
+)
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+SCRIPT_FIXTURE_ROOT = PROJECT_ROOT / "tests" / "fixtures" / "golden" / "basic_scripts"
+_IDENTIFIER_RE = re.compile(r"[A-Za-z_][A-Za-z0-9_]*")
+
+
+class _Setting:
+    def __init__(self, value: bool) -> None:
+        self.value = value
+
+    def get(self) -> bool:
+        return self.value
+
+
+def _write(path: str, content: str) -> None:
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "w", encoding="utf-8") as output_file:
+        output_file.write(content)
+
+
+class RuntimeDeclarationTests(unittest.TestCase):
+    def test_declarations_reassemble_the_full_runtime(self) -> None:
+        declarations = runtime_declarations()
+
+        self.assertEqual("".join(declaration.text for declaration in declarations), GML_RUNTIME_SCRIPT)
+        declared = {declaration.name for declaration in declarations if declaration.name is not None}
+        self.assertTrue(set(runtime_symbol_index()) <= declared)
+
+    def test_minimal_runtime_defines_every_runtime_name_it_uses(self) -> None:
+        script, report = render_minimal_runtime_script({"gml_string_upper", "gml_array_length"})
+        declared = {
+            declaration.name
+            for declaration in runtime_declarations()
+            if declaration.name is not None
+        }
+        kept = {
+            declaration.name
+            for declaration in runtime_declarations()
+            if declaration.name is not None and declaration.text in script
+        }
+
+        self.assertIn("gml_string_upper", kept)
+        self.assertIn("gml_array_length", kept)
+        self.assertEqual(set(_IDENTIFIER_RE.findall(script)) & declared, kept)
+        self.assertTrue(script.startswith("extends RefCounted"))
+        self.assertLess(report.emitted_bytes, report.full_bytes)
+        self.assertEqual(report.kept_declaration_count, len(kept))
+        self.assertTrue(report.pruned_segments)
+        self.assertTrue(set(report.pruned_segments).isdisjoint(report.kept_segments))
+
+
+class ApplyRuntimeProfileTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self.godot_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.godot_dir)
+        self.runtime_path = os.path.join(self.godot_dir, GML_RUNTIME_RELATIVE_PATH)
+        self.profile_path = os.path.join(self.godot_dir, GML_RUNTIME_PROFILE_RELATIVE_PATH)
+        write_gml_runtime(self.godot_dir)
+        _write(
+            os.path.join(self.godot_dir, "scripts", "player.gd"),
+            'extends Node\nconst GMRuntime = preload("res://gm2godot/gml_runtime.gd")\n'
+            "func _ready():\n\tprint(GMRuntime.gml_string_upper(name))\n",
+        )
+
+    def test_minimal_profile_prunes_unreferenced_runtime(self) -> None:
+        report = apply_gml_runtime_profile(self.godot_dir, "minimal")
+
+        self.assertIsNotNone(report)
+        assert report is not None
+        runtime = Path(self.runtime_path).read_text(encoding="utf-8")
+        self.assertIn("static func gml_string_upper", runtime)
+        self.assertNotIn("static func gml_ds_map_create", runtime)
+        self.assertIn("gml_ds_map_create", report.pruned_declarations)
+        self.assertEqual(load_gml_runtime_profile(self.godot_dir), report.to_dict())
+
+    def test_full_profile_restores_a_pruned_runtime(self) -> None:
+        apply_gml_runtime_profile(self.godot_dir, "minimal")
+
+        self.assertIsNone(apply_gml_runtime_profile(self.godot_dir, "full"))
+
+        self.assertEqual(Path(self.runtime_path).read_text(encoding="utf-8"), GML_RUNTIME_SCRIPT)
+        self.assertFalse(os.path.exists(self.profile_path))
+        self.assertIsNone(load_gml_runtime_profile(self.godot_dir))
+
+    def test_missing_runtime_drops_the_profile_report(self) -> None:
+        apply_gml_runtime_profile(self.godot_dir, "minimal")
+        os.remove(self.runtime_path)
+
+        self.assertIsNone(apply_gml_runtime_profile(self.godot_dir, "minimal"))
+        self.assertFalse(os.path.exists(self.profile_path))
+
+
+class ConverterRuntimeProfileTests(unittest.TestCase):
+    def test_minimal_conversion_records_the_profile_in_the_manifest(self) -> None:
+        temp_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, temp_dir)
+        gm_dir = os.path.join(temp_dir, "gm")
+        godot_dir = os.path.join(temp_dir, "godot")
+        shutil.copytree(SCRIPT_FIXTURE_ROOT, gm_dir)
+        running = threading.Event()
+        running.set()
+        converter = Converter(
+            log_callback=lambda _message: None,
+            progress_callback=lambda _value: None,
+            status_callback=lambda _message: None,
+            conversion_running=running,
+            runtime_profile="minimal",
+        )
+
+        outcome = converter.convert(gm_dir, "windows", godot_dir, {"scripts": _Setting(True)})
+
+        self.assertEqual(outcome.state, "success")
+        runtime = Path(godot_dir, GML_RUNTIME_RELATIVE_PATH).read_text(encoding="utf-8")
+        self.assertLess(len(runtime), len(GML_RUNTIME_SCRIPT))
+        with open(os.path.join(godot_dir, CONVERSION_MANIFEST_RELATIVE_PATH), encoding="utf-8") as manifest_file:
+            manifest = json.load(manifest_file)
+        self.assertEqual(manifest["runtime_profile"]["profile"], "minimal")
+        self.assertEqual(manifest["runtime_profile"]["emitted_bytes"], len(runtime.encode("utf-8")))
+        self.assertIn(
+            GML_RUNTIME_PROFILE_RELATIVE_PATH.replace(os.sep, "/"),
+            {entry["path"] for entry in manifest["generated_files"]},
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,7 +1,9 @@
 from __future__ import annotations
 
+import json
 import os
 import sys
+import tempfile
 import unittest
 
 PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
@@ -9,10 +11,16 @@ if PROJECT_ROOT not in sys.path:
     sys.path.insert(0, PROJECT_ROOT)
 
 from src.conversion.gml_transpiler import (
+    GMLSourceMap,
+    GMLSourceMapEntry,
     GMLTranspileError,
     analyze_gml_source_identifiers,
+    gml_source_map_path,
+    merge_gml_source_maps,
+    read_gml_source_map,
     transpile_gml_code,
     transpile_gml_code_with_source_map,
+    write_gml_source_map,
 )
 
 
@@ -121,6 +129,144 @@ class TestGMLSourceMaps(unittest.TestCase):
         mapped_lines = {entry.source_line for entry in result.source_map.entries}
         self.assertTrue(mapped_lines.isdisjoint({2, 3, 4, 5}))
 
+    def test_each_statement_maps_to_its_own_token(self) -> None:
+        source = "\n".join(
+            [
+                "var a = 1; var b = 2;",
+                "if (a > b) {",
+                "    a = b;",
+                "} else if (b > 3) b = 4;",
+            ]
+        )
+
+        result = transpile_gml_code_with_source_map(source)
+
+        generated = result.code.split("\n")
+        locations = {
+            generated[entry.generated_line - 1].strip(): (entry.source_line, entry.source_column)
+            for entry in result.source_map.entries
+        }
+        self.assertEqual(locations["var a = 1"], (1, 1))
+        self.assertEqual(locations["var b = 2"], (1, 12))
+        self.assertEqual(locations["if GMRuntime.gml_gt(a, b):"], (2, 1))
+        self.assertEqual(locations["a = b"], (3, 5))
+        self.assertEqual(locations["elif GMRuntime.gml_gt(b, 3):"], (4, 8))
+        self.assertEqual(locations["b = 4"], (4, 19))
+        self.assertTrue(
+            all(
+                entry.source_text == source.split("\n")[entry.source_line - 1].strip()
+                for entry in result.source_map.entries
+            )
+        )
+
+    def test_statements_after_removed_comments_map_to_their_original_lines(self) -> None:
+        source = "\n".join(
+            [
+                "a = 1;",
+                "/* spans",
+                "   three lines */",
+                "var b = 2; // trailing",
+                "if (a) {",
+                "    a = 2;",
+                "} else {",
+                "    a = /* inline */ 3;",
+                "}",
+                "#macro STEP \\",
+                "    4",
+                "c = STEP; /* gap */ d = 5;",
+            ]
+        )
+
+        result = transpile_gml_code_with_source_map(source)
+
+        generated = result.code.split("\n")
+        locations = {
+            generated[entry.generated_line - 1].strip(): (entry.source_line, entry.source_column)
+            for entry in result.source_map.entries
+        }
+        self.assertEqual(locations["var b = 2"], (4, 1))
+        self.assertEqual(locations["if GMRuntime.gml_bool(a):"], (5, 1))
+        self.assertEqual(locations["else:"], (7, 3))
+        self.assertEqual(locations["a = 3"], (8, 5))
+        self.assertEqual(locations["c = 4"], (12, 1))
+        self.assertEqual(locations["d = 5"], (12, 21))
+        self.assertTrue(
+            all(
+                entry.source_text == source.split("\n")[entry.source_line - 1].strip()
+                for entry in result.source_map.entries
+            )
+        )
+
+    def test_written_map_is_compact_and_reads_back_locations(self) -> None:
+        scripts = [
+            transpile_gml_code_with_source_map(
+                "total = 1;\nif (total > 0) {\n    total -= 1;\n}",
+                source_path="objects/o_player/Step_0.gml",
+                event="_process",
+            ),
+            transpile_gml_code_with_source_map(
+                "visible = false;",
+                source_path="objects/o_player/Create_0.gml",
+                event="_ready",
+                generated_line_offset=9,
+            ),
+        ]
+        source_map = merge_gml_source_maps(result.source_map for result in scripts)
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            gdscript_path = os.path.join(temp_dir, "objects", "o_player.gd")
+            map_path = write_gml_source_map(gdscript_path, source_map)
+            with open(map_path, "r", encoding="utf-8") as map_file:
+                document = json.load(map_file)
+            read_back = read_gml_source_map(map_path)
+
+        self.assertEqual(map_path, gml_source_map_path(gdscript_path))
+        self.assertTrue(map_path.endswith("o_player.gd.gdmap"))
+        self.assertEqual(document["version"], 3)
+        self.assertEqual(document["file"], "o_player.gd")
+        self.assertEqual(
+            document["sources"],
+            ["objects/o_player/Step_0.gml", "objects/o_player/Create_0.gml"],
+        )
+        self.assertEqual(document["x_gm2godot_events"], ["_process", "_ready"])
+        self.assertEqual(
+            [
+                (entry.generated_line, entry.source_line, entry.source_column, entry.source_path, entry.event)
+                for entry in read_back.entries
+            ],
+            [
+                (entry.generated_line, entry.source_line, entry.source_column, entry.source_path, entry.event)
+                for entry in source_map.entries
+            ],
+        )
+
+    def test_reads_large_and_negative_location_deltas(self) -> None:
+        source_map = GMLSourceMap(
+            source_path=None,
+            event=None,
+            entries=tuple(
+                GMLSourceMapEntry(
+                    generated_line=generated_line,
+                    source_line=source_line,
+                    source_column=source_column,
+                    generated_text="",
+                    source_text="",
+                    source_path="scripts/scr_big.gml" if generated_line % 2 else None,
+                    event="script:scr_big",
+                )
+                for generated_line, source_line, source_column in (
+                    (1, 40_000, 3),
+                    (2, 1, 1),
+                    (7, 1_234, 513),
+                    (8, 17, 2),
+                )
+            ),
+        )
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            map_path = write_gml_source_map(os.path.join(temp_dir, "scr_big.gd"), source_map)
+            self.assertEqual(read_gml_source_map(map_path), source_map)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,115 @@
+# pyright: reportPrivateUsage=false
+from __future__ import annotations
+
+import os
+import time
+import unittest
+from typing import Any
+from unittest.mock import patch
+
+from src.conversion.gml_transpiler import transpile_gml_code
+from src.conversion.gml_transpiler_parts.shared_models import (
+    GMLExtensionFunction,
+    ScopeContext,
+)
+from src.conversion.gml_transpiler_parts.statement_parser import _StatementParser
+from src.conversion.gml_transpiler_parts.symbol_table import (
+    EMPTY_PROJECT_SYMBOL_TABLE,
+    project_symbol_table,
+)
+from src.conversion.gml_transpiler_parts.utils import _scope_context_with_global_names
+
+
+_NESTED_SOURCE = """
+globalvar score;
+var handler = function(value) {
+    switch (value) {
+        case 1:
+            with (obj_enemy) { hp -= 1; }
+            break;
+    }
+    return spr_player;
+};
+"""
+
+
+def _large_asset_names(count: int) -> frozenset[str]:
+    return frozenset(f"spr_asset_{index}" for index in range(count)) | {
+        "obj_enemy",
+        "spr_player",
+    }
+
+
+class ProjectSymbolTableTests(unittest.TestCase):
+    def test_equal_inputs_share_one_table(self) -> None:
+        functions = {"sdk_call": GMLExtensionFunction("sdk_call", "SDK")}
+        table = project_symbol_table(["obj_a", "spr_b"], functions)
+
+        self.assertIs(project_symbol_table(frozenset({"spr_b", "obj_a"}), dict(functions)), table)
+        self.assertIsNot(project_symbol_table(["obj_a"], functions), table)
+        self.assertIs(project_symbol_table(), EMPTY_PROJECT_SYMBOL_TABLE)
+        with self.assertRaises(TypeError):
+            table.extension_functions["other"] = GMLExtensionFunction("other")  # type: ignore[index]
+
+    def test_unchanged_scope_reuses_project_collections(self) -> None:
+        assets = _large_asset_names(100)
+        symbols = project_symbol_table(assets, ["sdk_call"])
+        scope = _scope_context_with_global_names(
+            ScopeContext(),
+            None,
+            asset_names=symbols.asset_names,
+            extension_functions=symbols.extension_functions,
+        )
+
+        nested = _scope_context_with_global_names(scope, {"score"}, asset_names=assets)
+
+        self.assertIs(nested.asset_names, assets)
+        self.assertIs(nested.extension_functions, symbols.extension_functions)
+        self.assertEqual(nested.global_names, frozenset({"score"}))
+        self.assertEqual(
+            _scope_context_with_global_names(nested, {"extra_asset"}, asset_names={"extra_asset"}).asset_names,
+            assets | {"extra_asset"},
+        )
+
+    def test_nested_parsers_reference_the_project_asset_set(self) -> None:
+        assets = _large_asset_names(1000)
+        scopes: list[ScopeContext] = []
+        original_init = _StatementParser.__init__
+
+        def record_init(parser: _StatementParser, *args: Any, **kwargs: Any) -> None:
+            original_init(parser, *args, **kwargs)
+            scopes.append(parser.scope_context)
+
+        with patch.object(_StatementParser, "__init__", record_init):
+            code = transpile_gml_code(_NESTED_SOURCE, asset_names=assets)
+
+        self.assertGreaterEqual(len(scopes), 3)
+        self.assertTrue(all(scope.asset_names is assets for scope in scopes))
+        self.assertEqual(code, transpile_gml_code(_NESTED_SOURCE, asset_names=set(assets)))
+
+    @unittest.skipUnless(
+        os.environ.get("GM2GODOT_REPORT_PERF") == "1",
+        "GM2GODOT_REPORT_PERF is not set",
+    )
+    def test_report_large_asset_table_timings(self) -> None:
+        assets = _large_asset_names(25_000)
+        symbols = project_symbol_table(assets)
+        started = time.perf_counter()
+        for _ in range(200):
+            transpile_gml_code(_NESTED_SOURCE, asset_names=assets)
+        transpile_seconds = time.perf_counter() - started
+
+        started = time.perf_counter()
+        hits = sum(
+            f"spr_asset_{index}" in symbols.asset_names
+            for index in range(0, 50_000, 2)
+        )
+        membership_seconds = time.perf_counter() - started
+        print(
+            f"200 nested transpiles with 25k assets: {transpile_seconds * 1000:.1f} ms; "
+            f"25k membership checks ({hits} hits): {membership_seconds * 1000:.2f} ms"
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,14 +1,51 @@
 # pyright: reportPrivateUsage=false
 from __future__ import annotations
 
+import os
+import re
+import time
 import unittest
+from pathlib import Path
+from unittest.mock import patch
 
+from src.conversion.gml_transpiler_parts import tokens as gml_tokens
+from src.conversion.gml_transpiler_parts.preprocessor import preprocess_gml_source
 from src.conversion.gml_transpiler_parts.tokens import (
     _line_column,
     _line_column_from_newline_positions,
     _tokenize,
 )
-from src.conversion.gml_transpiler_parts.shared_models import GMLTranspileError
+from src.conversion.gml_transpiler_parts.shared_models import GMLTranspileError, Token
+
+
+FIXTURE_ROOT = Path(__file__).resolve().parent / "fixtures"
+
+_EDGE_CASE_SOURCES = (
+    "",
+    "a\r\nb\rc\n\n",
+    "x ??= y <<= 2; z >>= 1; a := b ?? c",
+    "if (a <= b && c >= d || !e ^^ f) { i++; j--; }",
+    "begin score = 1; end",
+    "value = 1.5 + .25 + 3. + 1_000 + 0x1F + 0b101 + $ff + 12abc;",
+    "obj.field.5; arr[@ 0] = arr[# 1, 2]; c = #a1b2c3;",
+    "s = \"line\\n\" + 'single' + @\"multi\nline\" + $\"{a}b\";",
+    "#macro SPEED 4\nx = SPEED;",
+    "naïve = 1; café_2 = naïve;\u00a0\x1cend_value = 3",
+    "\t\f\v x\x0b=\x0c1",
+    "a" * 64 + " = 1",
+)
+
+
+def _per_character_tokenize(source: str) -> list[Token]:
+    with patch.object(gml_tokens, "_FAST_TOKEN_PATTERN", re.compile(r"(?!)")):
+        return _tokenize(source)
+
+
+def _fixture_sources() -> list[str]:
+    return [
+        preprocess_gml_source(path.read_text(encoding="utf-8")).source
+        for path in sorted(FIXTURE_ROOT.rglob("*.gml"))
+    ]
 
 
 def _legacy_line_column(source: str, index: int) -> tuple[int, int]:
@@ -82,5 +119,55 @@ class TestGMLTokenizerLineColumns(unittest.TestCase):
         self.assertIn("Unterminated verbatim string literal", str(raised.exception))
 
 
+class TestGMLTokenizerFastPath(unittest.TestCase):
+    def test_matches_per_character_reader_on_fixtures_and_edge_cases(self) -> None:
+        sources = [*_fixture_sources(), *_EDGE_CASE_SOURCES]
+        self.assertGreater(len(sources), len(_EDGE_CASE_SOURCES))
+
+        for position, source in enumerate(sources):
+            with self.subTest(source=position):
+                self.assertEqual(_tokenize(source), _per_character_tokenize(source))
+
+    def test_errors_match_per_character_reader(self) -> None:
+        for source in (
+            "ok\n  " + "b" * 65,
+            "x = 1__0",
+            "y = 0b102",
+            "z = 'open\n",
+            "a\n\tb ` c",
+        ):
+            with self.subTest(source=source):
+                with self.assertRaises(GMLTranspileError) as expected:
+                    _per_character_tokenize(source)
+                with self.assertRaises(GMLTranspileError) as raised:
+                    _tokenize(source)
+                self.assertEqual(str(raised.exception), str(expected.exception))
+                self.assertEqual(
+                    (raised.exception.line, raised.exception.column),
+                    (expected.exception.line, expected.exception.column),
+                )
+
+    @unittest.skipUnless(
+        os.environ.get("GM2GODOT_REPORT_PERF") == "1",
+        "GM2GODOT_REPORT_PERF is not set",
+    )
+    def test_report_fixture_corpus_tokenize_timings(self) -> None:
+        corpus = _fixture_sources()
+        timings: dict[str, float] = {}
+        for name, tokenize in (
+            ("table-driven", _tokenize),
+            ("per-character", _per_character_tokenize),
+        ):
+            started = time.perf_counter()
+            for _ in range(50):
+                for source in corpus:
+                    tokenize(source)
+            timings[name] = time.perf_counter() - started
+        print(
+            f"50 passes over {len(corpus)} fixture sources: "
+            + ", ".join(f"{name} {seconds * 1000:.1f} ms" for name, seconds in timings.items())
+        )
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,190 @@
+from __future__ import annotations
+
+# pyright: reportPrivateUsage=false
+import os
+from pathlib import Path
+import tempfile
+import unittest
+from unittest.mock import patch
+
+from src.conversion import gml_transpile_engine
+from src.conversion.conversion_scope import ConversionScope, active_conversion_scope, using_conversion_scope
+from src.conversion.gml_transpile_cache import (
+    GMLTranspileCache,
+    UncacheableValue,
+    content_digest,
+    transpile_cache_key,
+)
+from src.conversion.gml_transpile_engine import (
+    GMLTranspileEngine,
+    GMLTranspileJob,
+    GMLTranspileTables,
+    transpile_job,
+)
+from src.conversion.scripts import ScriptConverter
+from tests.test_gml_transpile_engine import SCRIPT_FIXTURE_ROOT, _read_tree
+
+
+_TABLES = GMLTranspileTables(
+    asset_names=frozenset({"obj_player", "spr_player", "snd_jump"}),
+    enum_values={"Direction": {"up": 1, "down": 2}},
+)
+_JOBS = (
+    GMLTranspileJob("hp = 10;\n", options={"source_path": "Create_0.gml"}, collect_instance_variables=True),
+    GMLTranspileJob("x += Direction.up;\n", options={"source_path": "Step_0.gml"}),
+    GMLTranspileJob("x = = ;\n", options={"source_path": "Broken.gml"}),
+)
+
+
+def _fail_transpile(*_args: object, **_kwargs: object) -> object:
+    raise AssertionError("cached jobs must not be transpiled again")
+
+
+class TranspileCacheKeyTests(unittest.TestCase):
+    def test_digest_ignores_set_and_mapping_order(self) -> None:
+        self.assertEqual(
+            content_digest({"b": frozenset({"x", "y", "z"}), "a": 1}),
+            content_digest({"a": 1, "b": frozenset({"z", "y", "x"})}),
+        )
+
+    def test_key_changes_with_source_options_and_tables(self) -> None:
+        tables_digest = content_digest(_TABLES)
+        job = _JOBS[0]
+        key = transpile_cache_key(transpile_job, tables_digest, job)
+
+        self.assertEqual(key, transpile_cache_key(transpile_job, tables_digest, GMLTranspileJob(
+            "hp = 10;\n",
+            options={"source_path": "Create_0.gml"},
+            collect_instance_variables=True,
+        )))
+        self.assertNotEqual(key, transpile_cache_key(transpile_job, tables_digest, GMLTranspileJob(
+            "hp = 11;\n",
+            options={"source_path": "Create_0.gml"},
+            collect_instance_variables=True,
+        )))
+        self.assertNotEqual(key, transpile_cache_key(transpile_job, tables_digest, GMLTranspileJob(
+            "hp = 10;\n",
+            options={"source_path": "Create_0.gml", "indent": "  "},
+            collect_instance_variables=True,
+        )))
+        self.assertNotEqual(
+            key,
+            transpile_cache_key(
+                transpile_job,
+                content_digest(GMLTranspileTables(asset_names=frozenset({"obj_player"}))),
+                job,
+            ),
+        )
+
+    def test_values_without_stable_encoding_are_uncacheable(self) -> None:
+        with self.assertRaises(UncacheableValue):
+            content_digest({"callback": object()})
+
+
+class GMLTranspileCacheTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self._temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self._temp_dir.cleanup)
+        self.cache_dir = Path(self._temp_dir.name) / "cache"
+
+    def _entry_paths(self) -> list[Path]:
+        return sorted(self.cache_dir.rglob("*.pickle"))
+
+    def test_put_get_roundtrip_and_counts(self) -> None:
+        cache = GMLTranspileCache(self.cache_dir)
+
+        self.assertIsNone(cache.get("ab" * 32))
+        cache.put("ab" * 32, ("value", frozenset({"hp"})))
+
+        self.assertEqual(cache.get("ab" * 32), ("value", frozenset({"hp"})))
+        stats = cache.stats()
+        self.assertEqual((stats.hits, stats.misses, stats.writes), (1, 1, 1))
+
+    def test_corrupt_entry_is_a_miss(self) -> None:
+        cache = GMLTranspileCache(self.cache_dir)
+        cache.put("cd" * 32, "value")
+        (entry_path,) = self._entry_paths()
+        entry_path.write_bytes(b"not a pickle")
+
+        self.assertIsNone(cache.get("cd" * 32))
+        self.assertEqual(cache.stats().misses, 1)
+
+    def test_prune_evicts_least_recently_used_entries(self) -> None:
+        cache = GMLTranspileCache(self.cache_dir)
+        keys = [f"{index:02x}" * 32 for index in range(3)]
+        for index, key in enumerate(keys):
+            cache.put(key, "x" * 1000)
+            entry_path = Path(cache._entry_path(key))
+            os.utime(entry_path, ns=(index * 10**9, index * 10**9))
+        entry_size = Path(cache._entry_path(keys[0])).stat().st_size
+
+        # Reading the oldest entry makes it the most recently used.
+        self.assertIsNotNone(cache.get(keys[0]))
+        cache.budget_bytes = entry_size * 2
+        cache.prune()
+
+        self.assertIsNotNone(cache.get(keys[0]))
+        self.assertIsNone(cache.get(keys[1]))
+        self.assertIsNotNone(cache.get(keys[2]))
+        self.assertEqual(cache.stats().evictions, 1)
+
+    def test_using_cache_installs_it_and_prunes_on_exit(self) -> None:
+        cache = GMLTranspileCache(self.cache_dir, budget_bytes=0)
+        cache.put("ef" * 32, "value")
+
+        with using_conversion_scope(ConversionScope(transpile_cache=cache)):
+            self.assertIs(active_conversion_scope().transpile_cache, cache)
+            self.assertIs(GMLTranspileEngine(_TABLES).cache, cache)
+
+        self.assertIsNone(active_conversion_scope().transpile_cache)
+        self.assertEqual(self._entry_paths(), [])
+
+    def test_engine_answers_repeated_jobs_from_the_cache(self) -> None:
+        first = list(GMLTranspileEngine(_TABLES, cache=GMLTranspileCache(self.cache_dir)).transpile(_JOBS))
+
+        cache = GMLTranspileCache(self.cache_dir)
+        with patch.object(gml_transpile_engine, "transpile_gml_code_with_source_map", _fail_transpile):
+            second = list(GMLTranspileEngine(_TABLES, cache=cache).transpile(_JOBS))
+
+        self.assertEqual([outcome.result for outcome in second], [outcome.result for outcome in first])
+        self.assertEqual(cache.stats().hits, len(_JOBS))
+        cached_error = second[2].error
+        assert cached_error is not None
+        self.assertEqual(str(cached_error), str(first[2].error))
+        self.assertEqual(cached_error.line, 1)
+        self.assertEqual(second[0].instance_variables, frozenset({"hp"}))
+
+    def test_engine_recomputes_when_tables_change(self) -> None:
+        list(GMLTranspileEngine(_TABLES, cache=GMLTranspileCache(self.cache_dir)).transpile(_JOBS))
+
+        cache = GMLTranspileCache(self.cache_dir)
+        list(GMLTranspileEngine(GMLTranspileTables(), cache=cache).transpile(_JOBS))
+
+        self.assertEqual(cache.stats().hits, 0)
+        self.assertEqual(cache.stats().writes, len(_JOBS))
+
+    def test_repeated_script_conversion_reuses_cached_results(self) -> None:
+        outputs: list[dict[str, bytes]] = []
+        caches: list[GMLTranspileCache] = []
+        for attempt in range(2):
+            output_root = Path(self._temp_dir.name) / f"output_{attempt}"
+            output_root.mkdir()
+            cache = GMLTranspileCache(self.cache_dir)
+            with using_conversion_scope(ConversionScope(transpile_cache=cache)):
+                ScriptConverter(
+                    SCRIPT_FIXTURE_ROOT,
+                    output_root,
+                    log_callback=lambda _message: None,
+                    progress_callback=lambda _value: None,
+                ).convert_all()
+            outputs.append(_read_tree(output_root))
+            caches.append(cache)
+
+        self.assertEqual(outputs[1], outputs[0])
+        self.assertGreater(caches[0].stats().writes, 0)
+        self.assertEqual(caches[1].stats().hits, caches[0].stats().writes)
+        self.assertEqual(caches[1].stats().misses, 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
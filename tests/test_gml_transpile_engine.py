@@ -0,0 +1,437 @@
+from __future__ import annotations
+
+# pyright: reportPrivateUsage=false
+from collections.abc import Callable
+from pathlib import Path
+import tempfile
+import threading
+import unittest
+from unittest.mock import patch
+
+from src.conversion import gml_transpile_engine
+from src.conversion.diagnostics import DiagnosticCollector
+from src.conversion.gml_transpile_engine import (
+    GMLTranspileEngine,
+    GMLTranspileJob,
+    GMLTranspileOutcome,
+    GMLTranspileTables,
+)
+from src.conversion.gml_transpiler import transpile_gml_code_with_source_map
+from src.conversion.objects import ObjectConverter
+from src.conversion.rooms import RoomConverter
+from src.conversion.scripts import ScriptConverter
+from tests.test_objects import _make_object_yy_content
+from tests.test_rooms import _make_object_yy, _make_room_yy, _make_yyp
+
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+SCRIPT_FIXTURE_ROOT = PROJECT_ROOT / "tests" / "fixtures" / "golden" / "basic_scripts"
+
+_SOURCES = (
+    "hp = 10;\nif (hp > max_hp) { hp = max_hp; }\n",
+    "speed = Direction.up * 2;\n",
+    "var total = 0;\nfor (var i = 0; i < 3; i++) { total += i; }\nscore = total;\n",
+    "x = = ;\n",
+)
+_TABLES = GMLTranspileTables(
+    asset_names=frozenset({"obj_player"}),
+    enum_values={"Direction": {"up": 1, "down": 2}},
+    macro_values={},
+)
+
+
+def _jobs() -> list[GMLTranspileJob]:
+    return [
+        GMLTranspileJob(
+            source,
+            options={"source_path": f"event_{index}.gml", "event": f"event_{index}"},
+            collect_instance_variables=True,
+        )
+        for index, source in enumerate(_SOURCES)
+    ]
+
+
+_OBJECT_EVENTS = [
+    {"eventType": 0, "eventNum": 0},
+    {"eventType": 3, "eventNum": 0},
+]
+_OBJECT_SOURCES = {
+    "o_player": {
+        "Create_0.gml": "hp = 10;\nspeed_bonus = 2;\n",
+        "Step_0.gml": "x += speed_bonus;\nif (hp <= 0) { instance_destroy(); }\n",
+    },
+    "o_enemy": {
+        "Create_0.gml": "// Enemy setup.\ntarget = noone;\n",
+        "Step_0.gml": "var dx = 1;\nx += dx;\n",
+    },
+}
+
+
+def _write_text(path: Path, content: str) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(content, encoding="utf-8")
+
+
+def _write_object_project(project_root: Path, sources: dict[str, dict[str, str]]) -> None:
+    for object_name, event_sources in sources.items():
+        object_root = project_root / "objects" / object_name
+        _write_text(
+            object_root / f"{object_name}.yy",
+            _make_object_yy_content(object_name, event_list=list(_OBJECT_EVENTS)),
+        )
+        for filename, source in event_sources.items():
+            _write_text(object_root / filename, source)
+
+
+def _instance_layer(*instance_names: str) -> dict[str, object]:
+    return {
+        "%Name": "Instances",
+        "resourceType": "GMRInstanceLayer",
+        "instances": [
+            {
+                "name": name,
+                "objectId": {"name": "o_player", "path": "objects/o_player/o_player.yy"},
+                "hasCreationCode": True,
+            }
+            for name in instance_names
+        ],
+    }
+
+
+def _write_room_project(project_root: Path, instance_sources: dict[str, str]) -> None:
+    _write_text(
+        project_root / "Test.yyp",
+        _make_yyp(["r_main"], extra_resources=[("objects", "o_player")]),
+    )
+    _write_text(project_root / "objects" / "o_player" / "o_player.yy", _make_object_yy("o_player"))
+    room_root = project_root / "rooms" / "r_main"
+    _write_text(room_root / "RoomCreationCode.gml", 'room_trace = "room creation";\n')
+    for instance_name, source in instance_sources.items():
+        _write_text(room_root / f"InstanceCreationCode_{instance_name}.gml", source)
+    _write_text(
+        room_root / "r_main.yy",
+        _make_room_yy(
+            "r_main",
+            creation_code_file="RoomCreationCode.gml",
+            layers=[_instance_layer(*instance_sources)],
+        ),
+    )
+
+
+def _write_object_scene(output_root: Path) -> None:
+    _write_text(
+        output_root / "objects" / "o_player" / "o_player.tscn",
+        '[gd_scene format=3]\n\n[node name="o_player" type="Node2D"]\n',
+    )
+
+
+def _cancelling_transpile_job(
+    running: threading.Event,
+) -> Callable[[GMLTranspileTables, GMLTranspileJob], GMLTranspileOutcome]:
+    """Return ``transpile_job`` wrapped to stop conversion after each job."""
+    transpile_job = gml_transpile_engine.transpile_job
+
+    def cancel_after_transpiling(
+        tables: GMLTranspileTables,
+        job: GMLTranspileJob,
+    ) -> GMLTranspileOutcome:
+        outcome = transpile_job(tables, job)
+        running.clear()
+        return outcome
+
+    return cancel_after_transpiling
+
+
+def _read_tree(root: Path) -> dict[str, bytes]:
+    return {
+        str(path.relative_to(root)): path.read_bytes()
+        for path in sorted(root.rglob("*"))
+        if path.is_file()
+    }
+
+
+class GMLTranspileEngineTests(unittest.TestCase):
+    def test_in_process_outcomes_match_direct_transpilation_in_order(self) -> None:
+        outcomes = list(GMLTranspileEngine(_TABLES).transpile(_jobs()))
+
+        self.assertEqual(len(outcomes), len(_SOURCES))
+        instance_variables: set[str] = set()
+        expected = transpile_gml_code_with_source_map(
+            _SOURCES[0],
+            instance_variables=instance_variables,
+            asset_names=_TABLES.asset_names,
+            enum_values=_TABLES.enum_values,
+            source_path="event_0.gml",
+            event="event_0",
+        )
+        self.assertEqual(outcomes[0].result, expected)
+        self.assertEqual(outcomes[0].instance_variables, frozenset(instance_variables))
+        self.assertIn("hp", outcomes[0].instance_variables)
+        self.assertEqual(outcomes[2].instance_variables, frozenset({"score"}))
+        self.assertIsNone(outcomes[3].result)
+        assert outcomes[3].error is not None
+        self.assertEqual(outcomes[3].error.line, 1)
+
+    def test_worker_processes_return_identical_outcomes(self) -> None:
+        in_process = list(GMLTranspileEngine(_TABLES).transpile(_jobs()))
+
+        with GMLTranspileEngine(
+            _TABLES,
+            max_workers=2,
+            parallel_source_bytes=0,
+        ) as engine:
+            pooled = list(engine.transpile(_jobs()))
+            self.assertTrue(engine.uses_worker_processes)
+
+        self.assertEqual([outcome.result for outcome in pooled], [outcome.result for outcome in in_process])
+        self.assertEqual(
+            [outcome.instance_variables for outcome in pooled],
+            [outcome.instance_variables for outcome in in_process],
+        )
+        pooled_error = pooled[3].error
+        assert pooled_error is not None
+        self.assertEqual(str(pooled_error), str(in_process[3].error))
+
+    def test_small_batches_stay_in_process(self) -> None:
+        with GMLTranspileEngine(_TABLES, max_workers=4) as engine:
+            list(engine.transpile(_jobs()))
+            self.assertFalse(engine.uses_worker_processes)
+
+    def test_stopped_conversion_ends_iteration_early(self) -> None:
+        running = True
+
+        def conversion_running() -> bool:
+            return running
+
+        engine = GMLTranspileEngine(_TABLES, conversion_running=conversion_running)
+        outcomes = engine.transpile(_jobs())
+        next(outcomes)
+        running = False
+
+        self.assertEqual(list(outcomes), [])
+        self.assertEqual(
+            list(GMLTranspileEngine(_TABLES, conversion_running=lambda: False).transpile(_jobs())),
+            [],
+        )
+
+
+class ParallelScriptConversionTests(unittest.TestCase):
+    def _convert(self, output_root: Path, *, max_workers: int) -> dict[str, bytes]:
+        output_root.mkdir()
+        converter = ScriptConverter(
+            SCRIPT_FIXTURE_ROOT,
+            output_root,
+            log_callback=lambda _message: None,
+            progress_callback=lambda _value: None,
+            max_workers=max_workers,
+        )
+        converter.convert_all()
+        return _read_tree(output_root)
+
+    def test_worker_process_conversion_output_matches_in_process_output(self) -> None:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            root = Path(temp_dir)
+            in_process = self._convert(root / "serial", max_workers=1)
+            with patch(
+                "src.conversion.gml_transpile_engine.DEFAULT_PARALLEL_SOURCE_BYTES",
+                0,
+            ):
+                pooled = self._convert(root / "pooled", max_workers=2)
+
+        self.assertTrue(any(name.endswith(".gd") for name in in_process))
+        self.assertEqual(pooled, in_process)
+
+
+class ParallelObjectConversionTests(unittest.TestCase):
+    def _converter(
+        self,
+        project_root: Path,
+        output_root: Path,
+        *,
+        max_workers: int,
+        conversion_running: threading.Event | None = None,
+        diagnostics: DiagnosticCollector | None = None,
+    ) -> ObjectConverter:
+        output_root.mkdir(exist_ok=True)
+        return ObjectConverter(
+            str(project_root),
+            str(output_root),
+            log_callback=lambda _message: None,
+            progress_callback=lambda _value: None,
+            conversion_running=(
+                conversion_running.is_set if conversion_running is not None else lambda: True
+            ),
+            max_workers=max_workers,
+            diagnostics=diagnostics,
+        )
+
+    def test_worker_process_conversion_output_matches_in_process_output(self) -> None:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            root = Path(temp_dir)
+            _write_object_project(root / "project", _OBJECT_SOURCES)
+            self._converter(root / "project", root / "serial", max_workers=1).convert_all()
+            in_process = _read_tree(root / "serial")
+            with patch.object(gml_transpile_engine, "DEFAULT_PARALLEL_SOURCE_BYTES", 0):
+                self._converter(root / "project", root / "pooled", max_workers=2).convert_all()
+            pooled = _read_tree(root / "pooled")
+
+        self.assertTrue(any(name.endswith("o_player.gd") for name in in_process))
+        self.assertEqual(pooled, in_process)
+
+    def test_every_failing_event_is_reported(self) -> None:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            root = Path(temp_dir)
+            _write_object_project(
+                root / "project",
+                {"o_broken": {"Create_0.gml": "hp = @;\n", "Step_0.gml": "x = = ;\n"}},
+            )
+            diagnostics = DiagnosticCollector()
+            converter = self._converter(
+                root / "project",
+                root / "output",
+                max_workers=1,
+                diagnostics=diagnostics,
+            )
+            converter.convert_all()
+            written = _read_tree(root / "output")
+
+        self.assertEqual(
+            sorted(
+                diagnostic.event or ""
+                for diagnostic in diagnostics.diagnostics()
+                if diagnostic.code == "GM2GD-GML-TRANSPILE"
+            ),
+            ["_on_step", "_ready"],
+        )
+        self.assertFalse(any(name.endswith("o_broken.gd") for name in written))
+
+    def test_stopping_during_transpilation_cancels_the_object(self) -> None:
+        running = threading.Event()
+        running.set()
+        with tempfile.TemporaryDirectory() as temp_dir:
+            root = Path(temp_dir)
+            _write_object_project(root / "project", {"o_player": _OBJECT_SOURCES["o_player"]})
+            converter = self._converter(
+                root / "project",
+                root / "output",
+                max_workers=1,
+                conversion_running=running,
+            )
+            with patch.object(
+                gml_transpile_engine,
+                "transpile_job",
+                _cancelling_transpile_job(running),
+            ):
+                converter.convert_all()
+            written = _read_tree(root / "output")
+
+        result = converter.conversion_step_result()
+        self.assertTrue(result.cancelled)
+        self.assertEqual(result.resources.completed, 0)
+        self.assertFalse(any(name.endswith("o_player.gd") for name in written))
+
+
+class ParallelRoomConversionTests(unittest.TestCase):
+    def _converter(
+        self,
+        project_root: Path,
+        output_root: Path,
+        *,
+        max_workers: int,
+        conversion_running: threading.Event | None = None,
+        diagnostics: DiagnosticCollector | None = None,
+    ) -> RoomConverter:
+        _write_object_scene(output_root)
+        return RoomConverter(
+            str(project_root),
+            str(output_root),
+            log_callback=lambda _message: None,
+            progress_callback=lambda _value: None,
+            conversion_running=(
+                conversion_running.is_set if conversion_running is not None else lambda: True
+            ),
+            max_workers=max_workers,
+            diagnostics=diagnostics,
+        )
+
+    def test_worker_process_conversion_output_matches_in_process_output(self) -> None:
+        instance_sources = {
+            "inst_a": "x = 42;\ncustom_value = \"a\";\n",
+            "inst_b": "hp = 3;\nvar twice = hp * 2;\ny = twice;\n",
+        }
+        with tempfile.TemporaryDirectory() as temp_dir:
+            root = Path(temp_dir)
+            _write_room_project(root / "project", instance_sources)
+            self._converter(root / "project", root / "serial", max_workers=1).convert_all()
+            in_process = _read_tree(root / "serial")
+            with patch.object(gml_transpile_engine, "DEFAULT_PARALLEL_SOURCE_BYTES", 0):
+                self._converter(root / "project", root / "pooled", max_workers=2).convert_all()
+            pooled = _read_tree(root / "pooled")
+
+        script = in_process[str(Path("rooms", "r_main", "r_main.gd"))].decode("utf-8")
+        self.assertIn("func _gm2godot_room_creation_code():", script)
+        self.assertIn('"custom_value", "a"', script)
+        self.assertEqual(pooled, in_process)
+
+    def test_every_failing_creation_code_is_reported(self) -> None:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            root = Path(temp_dir)
+            _write_room_project(
+                root / "project",
+                {"inst_a": "value = @;\n", "inst_b": "x = 1;\n", "inst_c": "y = = ;\n"},
+            )
+            diagnostics = DiagnosticCollector()
+            converter = self._converter(
+                root / "project",
+                root / "output",
+                max_workers=1,
+                diagnostics=diagnostics,
+            )
+            converter.convert_all()
+            written = _read_tree(root / "output")
+
+        self.assertEqual(
+            [
+                diagnostic.event
+                for diagnostic in diagnostics.diagnostics()
+                if diagnostic.code == "GM2GD-GML-TRANSPILE"
+            ],
+            [
+                "instance creation code for inst_a",
+                "instance creation code for inst_c",
+            ],
+        )
+        self.assertEqual(converter.conversion_step_result().resources.skipped, 1)
+        self.assertFalse(any(name.startswith("rooms") for name in written))
+
+    def test_stopping_during_transpilation_cancels_the_room(self) -> None:
+        running = threading.Event()
+        running.set()
+        with tempfile.TemporaryDirectory() as temp_dir:
+            root = Path(temp_dir)
+            _write_room_project(root / "project", {"inst_a": "x = 1;\n", "inst_b": "y = 2;\n"})
+            diagnostics = DiagnosticCollector()
+            converter = self._converter(
+                root / "project",
+                root / "output",
+                max_workers=1,
+                conversion_running=running,
+                diagnostics=diagnostics,
+            )
+            with patch.object(
+                gml_transpile_engine,
+                "transpile_job",
+                _cancelling_transpile_job(running),
+            ):
+                converter.convert_all()
+            written = _read_tree(root / "output")
+
+        result = converter.conversion_step_result()
+        self.assertTrue(result.cancelled)
+        self.assertEqual(result.resources.completed, 0)
+        self.assertEqual(list(diagnostics.diagnostics()), [])
+        self.assertFalse(any(name.startswith("rooms") for name in written))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -3,6 +3,7 @@ import json
 import os
 import sys
 import tempfile
+import time
 import unittest
 
 PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
@@ -20,8 +21,11 @@ from src.conversion.gml_transpiler import (
     transpile_gml_code,
     transpile_gml_expression,
 )
+from src.conversion.gml_transpiler_parts import emitter
 from src.conversion.gml_transpiler_parts.expression_models import (
     ArrayLiteral,
+    Binary,
+    Name,
     NumberLiteral,
     StringLiteral,
     StructLiteral,
@@ -5416,5 +5420,56 @@ class TestGMLStatementTranspiler(unittest.TestCase):
         )
 
 
+
+class TestGMLLongExpressions(unittest.TestCase):
+    @staticmethod
+    def _comparison_chain(term_count: int) -> str:
+        return " && ".join(
+            f"(hp{index} == noone || score{index} != {index})"
+            for index in range(term_count)
+        )
+
+    def test_long_boolean_chain_is_emitted_without_deep_recursion(self):
+        code = transpile_gml_expression(self._comparison_chain(2000))
+
+        self.assertEqual(code.count(") and ("), 1999)
+        self.assertTrue(
+            code.startswith(
+                "(GMRuntime.gml_eq(hp0, GMRuntime.gml_instance_noone()) "
+                "or GMRuntime.gml_ne(score0, 0)) and "
+            )
+        )
+
+    def test_equality_flags_are_computed_once_per_node(self):
+        shared = Binary(Name("a"), "+", Name("GMRuntime.gml_undefined()"))
+        comparison = Binary(Binary(shared, "==", Name("b")), "==", shared)
+
+        self.assertTrue(emitter._equality_flags(comparison) & emitter._CONTAINS_UNDEFINED)
+        self.assertEqual(emitter._equality_flags(NumberLiteral("1", False)), 0)
+        self.assertEqual(
+            emitter._equality_flags(Binary(Name("true"), "==", Name("INF"))),
+            0,
+        )
+        self.assertIn("_gml_equality_flags", vars(shared))
+        self.assertEqual(shared, Binary(Name("a"), "+", Name("GMRuntime.gml_undefined()")))
+
+    @unittest.skipUnless(
+        os.environ.get("GM2GODOT_REPORT_PERF") == "1",
+        "GM2GODOT_REPORT_PERF is not set",
+    )
+    def test_report_ten_thousand_term_expression_timings(self):
+        source = self._comparison_chain(10_000)
+        started = time.perf_counter()
+        transpile_gml_expression(source)
+        chain_seconds = time.perf_counter() - started
+        started = time.perf_counter()
+        transpile_gml_expression(f"({source}) == undefined")
+        compared_seconds = time.perf_counter() - started
+        print(
+            f"10k-term boolean chain: {chain_seconds * 1000:.1f} ms; "
+            f"compared with undefined: {compared_seconds * 1000:.1f} ms"
+        )
+
+
 if __name__ == "__main__":
     unittest.main()
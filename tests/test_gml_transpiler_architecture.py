@@ -77,6 +77,7 @@ EXPECTED_PUBLIC_FACADE_EXPORTS = (
     "gml_source_map_path",
     "merge_gml_source_maps",
     "preprocess_gml_source",
+    "read_gml_source_map",
     "render_gml_manual_scope_markdown",
     "render_gml_source_header",
     "transpile_gml_code",
@@ -196,6 +197,7 @@ EXPECTED_PUBLIC_FACADE_SIGNATURES: dict[str, str | None] = {
         "(maps: 'Iterable[GMLSourceMap]', *, source_path: 'str | None' = None, "
         "event: 'str | None' = None) -> 'GMLSourceMap'"
     ),
+    "read_gml_source_map": "(map_path: 'str') -> 'GMLSourceMap'",
     "preprocess_gml_source": (
         "(source: 'str', *, macro_configuration: 'str | None' = None, "
         "active_symbols: 'Iterable[str] | None' = None) -> 'GMLPreprocessResult'"
@@ -293,7 +295,10 @@ src.conversion.gml_transpiler_parts.expression_service|src.conversion.gml_transp
 src.conversion.gml_transpiler_parts.expression_service|src.conversion.gml_transpiler_parts.utils|_normalize_local_names,_normalize_scope_context,_scope_context_with_global_names
 src.conversion.gml_transpiler_parts.function_helpers|src.conversion.gml_transpiler_parts.emitter|_emit_expression
 src.conversion.gml_transpiler_parts.function_helpers|src.conversion.gml_transpiler_parts.expression_parser|_parse_gml_expression
-src.conversion.gml_transpiler_parts.gml_function_dispatch|src.conversion.gml_transpiler_parts.constants|_ARRAY_RUNTIME_FUNCTIONS,_ASSET_RUNTIME_FUNCTIONS,_ASYNC_RUNTIME_FUNCTIONS,_AUDIO_RUNTIME_FUNCTIONS,_BUFFER_RUNTIME_FUNCTIONS,_COLLISION_RUNTIME_FUNCTIONS,_DRAW_RUNTIME_FUNCTIONS,_DS_COLLECTIONS_FUNCTIONS,_DS_GRID_FUNCTIONS,_DS_MAP_RUNTIME_FUNCTIONS,_FILE_RUNTIME_FUNCTIONS,_FLEXPANEL_RUNTIME_FUNCTIONS,_INPUT_RUNTIME_FUNCTIONS,_INSTANCE_RUNTIME_FUNCTIONS,_LAYER_RUNTIME_FUNCTIONS,_MATH_RUNTIME_FUNCTIONS,_MOTION_RUNTIME_FUNCTIONS,_MP_GRID_RUNTIME_FUNCTIONS,_NETWORK_RUNTIME_FUNCTIONS,_OS_DEBUG_GC_RUNTIME_FUNCTIONS,_PATH_RUNTIME_FUNCTIONS,_PHYSICS_RUNTIME_FUNCTIONS,_PLATFORM_SERVICE_RUNTIME_FUNCTIONS,_ROOM_RUNTIME_FUNCTIONS,_RUNTIME_FUNCTIONS,_SEQUENCE_TIMELINE_RUNTIME_FUNCTIONS,_STRING_RUNTIME_FUNCTIONS,_STRUCT_RUNTIME_FUNCTIONS,_TIME_RUNTIME_FUNCTIONS,_VARIABLE_RUNTIME_FUNCTIONS
+src.conversion.gml_transpiler_parts.gml_api_index|src.conversion.gml_transpiler_parts.gml_api_manifest_entries|_CATEGORY_ISSUE_NUMBERS,_GML_API_ENTRIES
+src.conversion.gml_transpiler_parts.gml_api_index|src.conversion.gml_transpiler_parts.gml_function_dispatch_table|_build_function_descriptors
+src.conversion.gml_transpiler_parts.gml_function_dispatch_table|src.conversion.gml_transpiler_parts.constants|_ARRAY_RUNTIME_FUNCTIONS,_ASSET_RUNTIME_FUNCTIONS,_ASYNC_RUNTIME_FUNCTIONS,_AUDIO_RUNTIME_FUNCTIONS,_BUFFER_RUNTIME_FUNCTIONS,_COLLISION_RUNTIME_FUNCTIONS,_DRAW_RUNTIME_FUNCTIONS,_DS_COLLECTIONS_FUNCTIONS,_DS_GRID_FUNCTIONS,_DS_MAP_RUNTIME_FUNCTIONS,_FILE_RUNTIME_FUNCTIONS,_FLEXPANEL_RUNTIME_FUNCTIONS,_INPUT_RUNTIME_FUNCTIONS,_INSTANCE_RUNTIME_FUNCTIONS,_LAYER_RUNTIME_FUNCTIONS,_MATH_RUNTIME_FUNCTIONS,_MOTION_RUNTIME_FUNCTIONS,_MP_GRID_RUNTIME_FUNCTIONS,_NETWORK_RUNTIME_FUNCTIONS,_OS_DEBUG_GC_RUNTIME_FUNCTIONS,_PATH_RUNTIME_FUNCTIONS,_PHYSICS_RUNTIME_FUNCTIONS,_PLATFORM_SERVICE_RUNTIME_FUNCTIONS,_ROOM_RUNTIME_FUNCTIONS,_RUNTIME_FUNCTIONS,_SEQUENCE_TIMELINE_RUNTIME_FUNCTIONS,_STRING_RUNTIME_FUNCTIONS,_STRUCT_RUNTIME_FUNCTIONS,_TIME_RUNTIME_FUNCTIONS,_VARIABLE_RUNTIME_FUNCTIONS
+src.conversion.gml_transpiler_parts.gml_function_dispatch_table|src.conversion.gml_transpiler_parts.gml_api_manifest_entries|_GML_API_ENTRIES
 src.conversion.gml_transpiler_parts.identifiers|src.conversion.gml_transpiler_parts.constants|_GDSCRIPT_RESERVED_IDENTIFIERS,_GENERATED_IDENTIFIER_PREFIX,_GML_IDENTIFIER_MAX_LENGTH
 src.conversion.gml_transpiler_parts.preprocessor|src.conversion.gml_transpiler_parts.identifiers|_validate_gml_identifier
 src.conversion.gml_transpiler_parts.preprocessor|src.conversion.gml_transpiler_parts.lexical|_is_verbatim_string_start,_read_verbatim_string
@@ -303,6 +308,7 @@ src.conversion.gml_transpiler_parts.source_map|src.conversion.gml_transpiler_par
 src.conversion.gml_transpiler_parts.source_map|src.conversion.gml_transpiler_parts.identifiers|_sanitize_gdscript_identifier
 src.conversion.gml_transpiler_parts.source_map|src.conversion.gml_transpiler_parts.lexical|_is_verbatim_string_start,_read_ordinary_string,_read_verbatim_string
 src.conversion.gml_transpiler_parts.source_map|src.conversion.gml_transpiler_parts.tokens|_read_template_string
+src.conversion.gml_transpiler_parts.source_map|src.conversion.gml_transpiler_parts.utils|_line_origin
 src.conversion.gml_transpiler_parts.statement_parser|src.conversion.gml_transpiler_parts.constants|_BINARY_PRECEDENCE,_EOF
 src.conversion.gml_transpiler_parts.statement_parser|src.conversion.gml_transpiler_parts.emitter|_emit_instance_keyword_argument
 src.conversion.gml_transpiler_parts.statement_parser|src.conversion.gml_transpiler_parts.enum_helpers|_evaluate_enum_value_tokens
@@ -310,7 +316,7 @@ src.conversion.gml_transpiler_parts.statement_parser|src.conversion.gml_transpil
 src.conversion.gml_transpiler_parts.statement_parser|src.conversion.gml_transpiler_parts.identifiers|_reject_asset_identifier_name,_sanitize_gdscript_identifier,_validate_gml_identifier
 src.conversion.gml_transpiler_parts.statement_parser|src.conversion.gml_transpiler_parts.statements|_ControlFlowCapture,_control_flow_dispatch_lines,_transpile_statement
 src.conversion.gml_transpiler_parts.statement_parser|src.conversion.gml_transpiler_parts.static_declarations|_read_static_declaration_tokens
-src.conversion.gml_transpiler_parts.statement_parser|src.conversion.gml_transpiler_parts.utils|_indent_lines,_insert_lines_before_continue,_insert_until_check_before_continue,_macro_configuration_matches,_normalize_scope_context,_scope_context_with_global_names,_split_top_level_tokens,_tokens_to_source
+src.conversion.gml_transpiler_parts.statement_parser|src.conversion.gml_transpiler_parts.utils|_OriginLine,_indent_lines,_insert_lines_before_continue,_insert_until_check_before_continue,_line_origin,_macro_configuration_matches,_normalize_scope_context,_scope_context_with_global_names,_split_top_level_tokens,_tokens_to_source,_with_origin
 src.conversion.gml_transpiler_parts.statements|src.conversion.gml_transpiler_parts.constants|_BUILTIN_ARRAY_VARIABLES,_BUILTIN_GLOBAL_VARIABLES,_BUILTIN_INSTANCE_VARIABLES,_COMPOUND_RUNTIME_FUNCTIONS,_GML_LITERAL_IDENTIFIERS
 src.conversion.gml_transpiler_parts.statements|src.conversion.gml_transpiler_parts.emitter|_emit_expression,_emit_instance_keyword_argument,_is_alarm_array_access,_name_resolves_to_global,_uses_direct_builtin_instance_members,_uses_direct_member_access
 src.conversion.gml_transpiler_parts.statements|src.conversion.gml_transpiler_parts.enum_helpers|_reject_constant_assignment_target_name,_reject_constant_declaration_name,_reject_enum_assignment_target,_reject_readonly_builtin_assignment_target
@@ -320,7 +326,7 @@ src.conversion.gml_transpiler_parts.statements|src.conversion.gml_transpiler_par
 src.conversion.gml_transpiler_parts.statements|src.conversion.gml_transpiler_parts.utils|_cache_assignment_part,_indent_lines,_next_generated_name_from_counter,_normalize_scope_context,_split_assignment,_split_top_level,_unwrap_grouped_expression
 src.conversion.gml_transpiler_parts.static_declarations|src.conversion.gml_transpiler_parts.identifiers|_validate_gml_identifier
 src.conversion.gml_transpiler_parts.static_declarations|src.conversion.gml_transpiler_parts.utils|_split_assignment,_split_top_level,_tokens_to_source
-src.conversion.gml_transpiler_parts.tokens|src.conversion.gml_transpiler_parts.constants|_BLOCK_DELIMITER_REPLACEMENTS,_MULTI_CHAR_OPERATORS
+src.conversion.gml_transpiler_parts.tokens|src.conversion.gml_transpiler_parts.constants|_BLOCK_DELIMITER_REPLACEMENTS,_GML_IDENTIFIER_MAX_LENGTH,_MULTI_CHAR_OPERATORS
 src.conversion.gml_transpiler_parts.tokens|src.conversion.gml_transpiler_parts.identifiers|_validate_gml_identifier
 src.conversion.gml_transpiler_parts.tokens|src.conversion.gml_transpiler_parts.lexical|_is_verbatim_string_start,_read_ordinary_string,_read_verbatim_string
 src.conversion.gml_transpiler_parts.utils|src.conversion.gml_transpiler_parts.constants|_ASSIGNMENT_OPERATORS
@@ -329,24 +335,23 @@ src.conversion.gml_transpiler_parts.utils|src.conversion.gml_transpiler_parts.to
 """
 
 EXPECTED_PRODUCTION_IMPORT_GROUPS = """
-src.cli|src.conversion.gml_transpiler|generate_gml_api_compatibility_report,render_gml_manual_scope_markdown
+src.cli|src.conversion.gml_transpiler_parts.gml_api_manifest|generate_gml_api_compatibility_report
+src.cli|src.conversion.gml_transpiler_parts.gml_manual_scope|render_gml_manual_scope_markdown
 src.conversion.asset_registry|src.conversion.gml_transpiler|GMLTranspileError,transpile_gml_code
 src.conversion.extension_registry|src.conversion.gml_transpiler_parts.extension_functions|EXTENSION_FUNCTION_MAPPING_FILENAME,load_gml_extension_function_mappings
 src.conversion.gml_runtime_parts.manifest|src.conversion.gml_transpiler_parts.gml_api_manifest|iter_gml_api_entries
-src.conversion.objects|src.conversion.gml_transpiler|GMLSourceMap,GMLTranspileError,analyze_gml_source_identifiers,merge_gml_source_maps,transpile_gml_code_with_source_map,write_gml_source_map
-src.conversion.objects|src.conversion.gml_transpiler_parts.constants|_ASSIGNMENT_OPERATORS,_BUILTIN_GLOBAL_VARIABLES,_BUILTIN_INSTANCE_VARIABLES,_GDSCRIPT_NATIVE_INSTANCE_MEMBER_IDENTIFIERS,_GML_LITERAL_IDENTIFIERS
-src.conversion.objects|src.conversion.gml_transpiler_parts.shared_models|Token
-src.conversion.objects|src.conversion.gml_transpiler_parts.preprocessor|preprocess_gml_source
-src.conversion.objects|src.conversion.gml_transpiler_parts.tokens|_tokenize
+src.conversion.gml_transpile_engine|src.conversion.gml_transpiler|GMLExtensionFunction,GMLExtensionFunctionMapping,GMLTranspileError,GMLTranspileResult,transpile_gml_code_with_source_map
+src.conversion.objects|src.conversion.gml_transpiler|GMLSourceMap,analyze_gml_source_identifiers,merge_gml_source_maps,write_gml_source_map
+src.conversion.objects|src.conversion.gml_transpiler_parts.constants|_GDSCRIPT_NATIVE_INSTANCE_MEMBER_IDENTIFIERS
 src.conversion.project_enums|src.conversion.gml_transpiler_parts.enum_helpers|_evaluate_enum_value_tokens
 src.conversion.project_enums|src.conversion.gml_transpiler_parts.shared_models|GMLTranspileError,Token
-src.conversion.project_enums|src.conversion.gml_transpiler_parts.preprocessor|preprocess_gml_source
-src.conversion.project_enums|src.conversion.gml_transpiler_parts.tokens|_tokenize
-src.conversion.project_macros|src.conversion.gml_transpiler_parts.shared_models|GMLTranspileError,Token
-src.conversion.project_macros|src.conversion.gml_transpiler_parts.preprocessor|preprocess_gml_source
-src.conversion.project_macros|src.conversion.gml_transpiler_parts.tokens|_tokenize
+src.conversion.project_gml_analysis|src.conversion.gml_transpiler_parts.constants|_ASSIGNMENT_OPERATORS,_BUILTIN_GLOBAL_VARIABLES,_BUILTIN_INSTANCE_VARIABLES,_GML_LITERAL_IDENTIFIERS
+src.conversion.project_gml_analysis|src.conversion.gml_transpiler_parts.shared_models|GMLTranspileError,Token
+src.conversion.project_gml_analysis|src.conversion.gml_transpiler_parts.preprocessor|preprocess_gml_source
+src.conversion.project_gml_analysis|src.conversion.gml_transpiler_parts.tokens|_tokenize
+src.conversion.project_macros|src.conversion.gml_transpiler_parts.shared_models|Token
 src.conversion.project_macros|src.conversion.gml_transpiler_parts.utils|_macro_configuration_matches,_tokens_to_source
-src.conversion.rooms|src.conversion.gml_transpiler|GMLTranspileError,transpile_gml_code
+src.conversion.rooms|src.conversion.gml_transpiler|GMLTranspileError
 src.conversion.script_functions|src.conversion.gml_transpiler|GMLTranspileError
 src.conversion.script_functions|src.conversion.gml_transpiler_parts.identifiers|_validate_gml_identifier
 src.conversion.script_functions|src.conversion.gml_transpiler_parts.lexical|_is_verbatim_string_start,_read_verbatim_string
@@ -380,13 +385,15 @@ EXPECTED_PRODUCTION_IMPORTS = _parse_import_groups(EXPECTED_PRODUCTION_IMPORT_GR
 EXPECTED_ALL_IMPORTS = EXPECTED_INTERNAL_PRIVATE_IMPORTS | EXPECTED_PRODUCTION_IMPORTS
 
 
-# The six owner modules below contain shared data, language metadata, lexical
+# The eight owner modules below contain shared data, language metadata, lexical
 # operations, or semantic operations that the named child issue makes explicit.
 ALL_PRIVATE_NAMES_ARE_INTENDED_INTERNAL = frozenset(
     {
         f"{PARTS_PACKAGE}.constants",
         f"{PARTS_PACKAGE}.enum_helpers",
         f"{PARTS_PACKAGE}.function_helpers",
+        f"{PARTS_PACKAGE}.gml_api_manifest_entries",
+        f"{PARTS_PACKAGE}.gml_function_dispatch_table",
         f"{PARTS_PACKAGE}.identifiers",
         f"{PARTS_PACKAGE}.lexical",
         f"{PARTS_PACKAGE}.model",
@@ -415,6 +422,8 @@ INTENDED_INTERNAL_NAMES_BY_MIXED_OWNER: dict[str, frozenset[str]] = {
     ),
     f"{PARTS_PACKAGE}.utils": frozenset(
         {
+            "_OriginLine",
+            "_line_origin",
             "_macro_configuration_matches",
             "_normalize_local_names",
             "_normalize_scope_context",
@@ -424,6 +433,7 @@ INTENDED_INTERNAL_NAMES_BY_MIXED_OWNER: dict[str, frozenset[str]] = {
             "_strip_comments",
             "_tokens_to_source",
             "_unwrap_grouped_expression",
+            "_with_origin",
         }
     ),
 }
@@ -477,6 +487,8 @@ RETAINED_PACKAGE_INTERNAL_EXPORTS = frozenset(
 
 MIGRATION_STAGE_BY_OWNER: dict[str, int] = {
     f"{PARTS_PACKAGE}.constants": 817,
+    f"{PARTS_PACKAGE}.gml_api_manifest_entries": 817,
+    f"{PARTS_PACKAGE}.gml_function_dispatch_table": 817,
     f"{PARTS_PACKAGE}.identifiers": 817,
     f"{PARTS_PACKAGE}.lexical": 817,
     f"{PARTS_PACKAGE}.tokens": 817,
@@ -498,6 +510,7 @@ UTILS_STAGE_BY_CONSUMER: dict[str, int] = {
     f"{PARTS_PACKAGE}.expression_parser": 818,
     f"{PARTS_PACKAGE}.expression_service": 818,
     f"{PARTS_PACKAGE}.api": 819,
+    f"{PARTS_PACKAGE}.source_map": 819,
     f"{PARTS_PACKAGE}.statement_parser": 819,
     f"{PARTS_PACKAGE}.statements": 819,
     f"{PARTS_PACKAGE}.static_declarations": 819,
@@ -570,15 +583,20 @@ EXPECTED_PRIVATE_USAGE_SUPPRESSIONS = frozenset(
             "# pyright: reportPrivateUsage=false, reportUnusedFunction=false, reportUnusedClass=false",
         ),
         (
-            "src/conversion/gml_transpiler_parts/gml_api_manifest.py",
+            "src/conversion/gml_transpiler_parts/gml_api_index.py",
             1,
             "# pyright: reportPrivateUsage=false",
         ),
         (
-            "src/conversion/gml_transpiler_parts/gml_function_dispatch.py",
+            "src/conversion/gml_transpiler_parts/gml_api_manifest_entries.py",
             1,
             "# pyright: reportPrivateUsage=false",
         ),
+        (
+            "src/conversion/gml_transpiler_parts/gml_function_dispatch_table.py",
+            1,
+            "# pyright: reportPrivateUsage=false, reportUnusedFunction=false",
+        ),
         (
             "src/conversion/gml_transpiler_parts/identifiers.py",
             1,
@@ -794,8 +812,8 @@ import src.conversion.gml_transpiler_parts.api as phase_api
             actual_internal | actual_production,
         )
 
-        self.assertEqual(len(EXPECTED_INTERNAL_PRIVATE_IMPORTS), 209)
-        self.assertEqual(len(EXPECTED_PRODUCTION_IMPORTS), 60)
+        self.assertEqual(len(EXPECTED_INTERNAL_PRIVATE_IMPORTS), 218)
+        self.assertEqual(len(EXPECTED_PRODUCTION_IMPORTS), 58)
         self.assertEqual(
             actual_internal,
             EXPECTED_INTERNAL_PRIVATE_IMPORTS,
@@ -891,7 +909,7 @@ import src.conversion.gml_transpiler_parts.api as phase_api
 
     def test_transitional_private_usage_suppressions_are_exact(self) -> None:
         actual = _actual_private_usage_suppressions()
-        self.assertEqual(len(EXPECTED_PRIVATE_USAGE_SUPPRESSIONS), 17)
+        self.assertEqual(len(EXPECTED_PRIVATE_USAGE_SUPPRESSIONS), 18)
         self.assertEqual(actual, EXPECTED_PRIVATE_USAGE_SUPPRESSIONS)
 
 
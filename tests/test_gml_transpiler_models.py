@@ -56,6 +56,7 @@ from src.conversion.gml_transpiler_parts.shared_models import (
     GMLTranspileError,
     IncrementDelta,
     IncrementMode,
+    ProjectSymbolTable,
     ScopeContext,
     StaticDeclaration,
     Token,
@@ -75,6 +76,7 @@ EXPECTED_SHARED_MODEL_EXPORTS = (
     "GMLTranspileError",
     "IncrementDelta",
     "IncrementMode",
+    "ProjectSymbolTable",
     "ScopeContext",
     "StaticDeclaration",
     "Token",
@@ -152,6 +154,11 @@ class TestGMLTranspilerModels(unittest.TestCase):
             extension_functions={"sdk_call": extension_function},
             extension_function_mappings={"sdk_call": extension_mapping},
         )
+        symbols = ProjectSymbolTable(
+            asset_names=frozenset({"o_player"}),
+            extension_functions={"sdk_call": extension_function},
+            extension_function_mappings={"sdk_call": extension_mapping},
+        )
         declaration = StaticDeclaration("counter", "1")
 
         self.assertEqual(assignment_operator, "+=")
@@ -164,6 +171,8 @@ class TestGMLTranspilerModels(unittest.TestCase):
         self.assertEqual(metadata.subsystem, "transform")
         self.assertEqual(scope.extension_functions["sdk_call"], extension_function)
         self.assertEqual(scope.extension_function_mappings["sdk_call"], extension_mapping)
+        self.assertEqual(symbols.asset_names, scope.asset_names)
+        self.assertEqual(ProjectSymbolTable().extension_functions, {})
         self.assertEqual(declaration.value_source, "1")
         self.assertEqual(DEFAULT_SCOPE_CONTEXT, ScopeContext())
 
@@ -0,0 +1,178 @@
+from __future__ import annotations
+
+import os
+from pathlib import Path
+import shutil
+import tempfile
+import threading
+import unittest
+from unittest.mock import patch
+
+from src.conversion.converter import Converter
+from src.conversion.incremental_conversion import (
+    INCREMENTAL_STATE_RELATIVE_PATH,
+    step_source_fingerprints,
+)
+from src.conversion.scripts import ScriptConverter
+
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+SCRIPT_FIXTURE_ROOT = PROJECT_ROOT / "tests" / "fixtures" / "golden" / "basic_scripts"
+
+
+class _Setting:
+    def __init__(self, value: bool) -> None:
+        self.value = value
+
+    def get(self) -> bool:
+        return self.value
+
+
+def _fingerprints(gm_dir: str, **options: object) -> dict[str, str]:
+    return step_source_fingerprints(
+        gm_dir,
+        target_platform="windows",
+        enabled_converters=("sprites", "tilesets", "sounds", "asset_registry"),
+        options=options,
+    )
+
+
+def _write(path: str, content: str) -> None:
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "w", encoding="utf-8") as source_file:
+        source_file.write(content)
+
+
+def _generated_scripts(godot_dir: str) -> dict[str, bytes]:
+    root = Path(godot_dir) / "scripts"
+    return {
+        str(path.relative_to(root)): path.read_bytes()
+        for path in sorted(root.rglob("*"))
+        if path.is_file()
+    }
+
+
+class StepSourceFingerprintTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self.gm_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.gm_dir)
+        _write(os.path.join(self.gm_dir, "Game.yyp"), '{"%Name": "Game"}')
+        _write(os.path.join(self.gm_dir, "sprites", "spr_a", "spr_a.yy"), "{}")
+        _write(os.path.join(self.gm_dir, "sounds", "snd_a", "snd_a.yy"), "{}")
+
+    def test_source_change_invalidates_the_step_and_its_dependents(self) -> None:
+        before = _fingerprints(self.gm_dir)
+        _write(os.path.join(self.gm_dir, "sprites", "spr_a", "spr_a.yy"), '{"width": 2}')
+        after = _fingerprints(self.gm_dir)
+
+        changed = {key for key in before if before[key] != after[key]}
+        self.assertEqual(
+            changed,
+            {"sprites", "tilesets", "objects", "rooms", "asset_registry"},
+        )
+
+    def test_project_wide_inputs_invalidate_every_step(self) -> None:
+        before = _fingerprints(self.gm_dir)
+
+        self.assertNotEqual(
+            _fingerprints(self.gm_dir, group_sounds_by_audio_group=True)["sounds"],
+            before["sounds"],
+        )
+        _write(os.path.join(self.gm_dir, "Game.yyp"), '{"%Name": "Renamed"}')
+        after = _fingerprints(self.gm_dir)
+        self.assertTrue(all(before[key] != after[key] for key in before))
+
+    def test_unrelated_and_hidden_files_keep_fingerprints(self) -> None:
+        before = _fingerprints(self.gm_dir)
+        _write(os.path.join(self.gm_dir, ".git", "HEAD"), "ref: refs/heads/main\n")
+        _write(os.path.join(self.gm_dir, "sounds", "snd_b", "snd_b.yy"), "{}")
+        after = _fingerprints(self.gm_dir)
+
+        self.assertEqual(after["sprites"], before["sprites"])
+        self.assertNotEqual(after["sounds"], before["sounds"])
+
+
+class IncrementalConversionTests(unittest.TestCase):
+    def setUp(self) -> None:
+        temp_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, temp_dir)
+        self.gm_dir = os.path.join(temp_dir, "gm")
+        self.godot_dir = os.path.join(temp_dir, "godot")
+        shutil.copytree(SCRIPT_FIXTURE_ROOT, self.gm_dir)
+        self.logs: list[str] = []
+
+    def _convert(self, *, incremental: bool = True) -> Converter:
+        running = threading.Event()
+        running.set()
+        converter = Converter(
+            log_callback=self.logs.append,
+            progress_callback=lambda _value: None,
+            status_callback=lambda _message: None,
+            conversion_running=running,
+            incremental=incremental,
+        )
+        outcome = converter.convert(
+            self.gm_dir,
+            "windows",
+            self.godot_dir,
+            {"scripts": _Setting(True)},
+        )
+        self.assertEqual(outcome.state, "success")
+        self.assertEqual(outcome.steps.completed, ("scripts",))
+        return converter
+
+    def test_unchanged_step_is_skipped_and_keeps_its_output(self) -> None:
+        self._convert()
+        first_output = _generated_scripts(self.godot_dir)
+        self.assertTrue(
+            os.path.isfile(os.path.join(self.godot_dir, INCREMENTAL_STATE_RELATIVE_PATH))
+        )
+
+        with patch.object(
+            ScriptConverter,
+            "convert_all",
+            side_effect=AssertionError("unchanged scripts must not be converted"),
+        ):
+            self._convert()
+
+        self.assertEqual(_generated_scripts(self.godot_dir), first_output)
+        self.assertTrue(any("scripts" in message and "unchanged" in message for message in self.logs))
+
+    def test_changed_source_reconverts_the_step(self) -> None:
+        self._convert()
+        first_output = _generated_scripts(self.godot_dir)
+        source_path = os.path.join(self.gm_dir, "scripts", "scr_add", "scr_add.gml")
+        with open(source_path, "a", encoding="utf-8") as source_file:
+            source_file.write("\n// changed\n")
+
+        with patch.object(
+            ScriptConverter,
+            "convert_all",
+            autospec=True,
+            side_effect=ScriptConverter.convert_all,
+        ) as convert_all:
+            self._convert()
+
+        convert_all.assert_called_once()
+        self.assertNotEqual(_generated_scripts(self.godot_dir), first_output)
+
+    def test_full_conversion_drops_the_incremental_record(self) -> None:
+        self._convert()
+        self._convert(incremental=False)
+
+        self.assertFalse(
+            os.path.exists(os.path.join(self.godot_dir, INCREMENTAL_STATE_RELATIVE_PATH))
+        )
+        with patch.object(
+            ScriptConverter,
+            "convert_all",
+            autospec=True,
+            side_effect=ScriptConverter.convert_all,
+        ) as convert_all:
+            self._convert()
+
+        convert_all.assert_called_once()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,95 @@
+from __future__ import annotations
+
+import json
+import os
+from pathlib import Path
+import tempfile
+import unittest
+
+from src.localization import LocalizationCacheStats, LocalizationCatalog
+
+
+class LocalizationCatalogTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self._temp_dir = tempfile.TemporaryDirectory()
+        self.base_path = Path(self._temp_dir.name)
+        (self.base_path / "Languages").mkdir()
+        self._write_language("eng", {
+            "Greeting": "Hello {name}",
+            "Plain": "Plain {{braces}}",
+            "Only_English": "English only",
+            "Items": ["a", 1, "b"],
+        })
+        self._write_language("de", {"Greeting": "Hallo {name}"})
+        self._select_language("de")
+        self.catalog = LocalizationCatalog(str(self.base_path))
+
+    def tearDown(self) -> None:
+        self._temp_dir.cleanup()
+
+    def _write_language(self, language: str, values: dict[str, object]) -> Path:
+        path = self.base_path / "Languages" / f"{language}.json"
+        path.write_text(json.dumps(values), encoding="utf-8")
+        return path
+
+    def _select_language(self, language: str) -> None:
+        (self.base_path / "Current Language").write_text(language, encoding="utf-8")
+
+    def _bump_mtime(self, path: Path) -> None:
+        stat_result = path.stat()
+        os.utime(path, ns=(stat_result.st_atime_ns, stat_result.st_mtime_ns + 1_000_000_000))
+
+    def test_lookup_prefers_selected_language_and_falls_back_to_english(self) -> None:
+        self.assertEqual(self.catalog.lookup("Greeting"), "Hallo {name}")
+        self.assertEqual(self.catalog.lookup("Only_English"), "English only")
+        self.assertIsNone(self.catalog.lookup("Missing"))
+
+    def test_repeated_lookups_parse_each_language_once(self) -> None:
+        for _ in range(5):
+            self.catalog.lookup("Only_English")
+
+        self.assertEqual(self.catalog.stats(), LocalizationCacheStats(hits=8, misses=2, reloads=0))
+
+    def test_language_file_change_reloads_catalog(self) -> None:
+        self.assertEqual(self.catalog.lookup("Greeting"), "Hallo {name}")
+        path = self._write_language("de", {"Greeting": "Servus {name}"})
+        self._bump_mtime(path)
+
+        self.assertEqual(self.catalog.lookup("Greeting"), "Servus {name}")
+        self.assertEqual(self.catalog.stats().reloads, 1)
+
+    def test_selected_language_change_is_detected(self) -> None:
+        self.assertEqual(self.catalog.lookup("Greeting"), "Hallo {name}")
+        self._select_language("eng")
+        self._bump_mtime(self.base_path / "Current Language")
+
+        self.assertEqual(self.catalog.lookup("Greeting"), "Hello {name}")
+
+    def test_templates_are_pre_resolved_for_formatting(self) -> None:
+        greeting = self.catalog.template("Greeting")
+        plain = self.catalog.template("Plain")
+
+        self.assertIsNotNone(greeting)
+        self.assertIsNotNone(plain)
+        assert greeting is not None and plain is not None
+        self.assertTrue(greeting.has_fields)
+        self.assertFalse(plain.has_fields)
+        self.assertEqual(greeting.format({"name": "GM"}), "Hallo GM")
+        self.assertEqual(plain.format({}), "Plain {braces}")
+        self.assertIsNone(self.catalog.template("Items"))
+
+    def test_missing_language_files_fall_back_without_raising(self) -> None:
+        (self.base_path / "Current Language").unlink()
+        (self.base_path / "Languages" / "eng.json").unlink()
+
+        self.assertIsNone(self.catalog.lookup("Greeting"))
+
+    def test_clear_resets_cached_catalogs_and_counters(self) -> None:
+        self.catalog.lookup("Greeting")
+        self.catalog.clear()
+
+        self.assertEqual(self.catalog.stats(), LocalizationCacheStats(hits=0, misses=0, reloads=0))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -12,7 +12,8 @@ from dataclasses import dataclass
 from pathlib import Path
 from typing import Any, ClassVar, cast
 
-from src.conversion.converter import CONVERSION_CATEGORIES, Converter
+from src.conversion.conversion_plan import CONVERSION_CATEGORIES
+from src.conversion.converter import Converter
 from src.conversion.conversion_outcome import ConversionOutcome
 from src.conversion.diagnostics import DIAGNOSTIC_REPORT_JSON_RELATIVE_PATH
 from src.conversion.godot_validation import (
@@ -8,10 +8,10 @@ import tempfile
 import textwrap
 import unittest
 from pathlib import Path
-from typing import cast
 
 from src.conversion.asset_registry import AssetRegistryConverter
 from src.conversion.gml_runtime import write_gml_runtime
+from src.conversion.gml_transpiler import read_gml_source_map
 from src.conversion.script_functions import modern_script_function_declarations
 from src.conversion.scripts import ScriptConverter
 
@@ -106,29 +106,24 @@ class TestNamedConstructorInheritanceGodot(unittest.TestCase):
                 "_gml_constructor_self, _gml_constructor_other)",
                 generated_script,
             )
-            source_map = cast(
-                dict[str, object],
-                json.loads(
-                    (godot_dir / "scripts" / "scr_family.gd.gmlmap.json").read_text(
-                        encoding="utf-8"
-                    )
-                ),
+            source_map = read_gml_source_map(
+                str(godot_dir / "scripts" / "scr_family.gd.gdmap")
             )
-            mapped_entries = cast(list[dict[str, object]], source_map["entries"])
+            generated_lines = generated_script.splitlines()
             parent_entry = next(
                 entry
-                for entry in mapped_entries
-                if entry["event"] == "script:Parent"
-                and "parent_value" in cast(str, entry["source_text"])
+                for entry in source_map.entries
+                if entry.event == "script:Parent"
+                and "parent_value" in generated_lines[entry.generated_line - 1]
             )
             child_entry = next(
                 entry
-                for entry in mapped_entries
-                if entry["event"] == "script:Child"
-                and "child_value" in cast(str, entry["source_text"])
+                for entry in source_map.entries
+                if entry.event == "script:Child"
+                and "child_value" in generated_lines[entry.generated_line - 1]
             )
-            self.assertEqual(parent_entry["source_line"], 4)
-            self.assertEqual(child_entry["source_line"], 8)
+            self.assertEqual(parent_entry.source_line, 4)
+            self.assertEqual(child_entry.source_line, 8)
 
             _write_text(
                 godot_dir / "smoke.gd",
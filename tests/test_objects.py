@@ -20,6 +20,7 @@ from src.conversion.converter import Converter
 from src.conversion.diagnostics import DiagnosticCollector
 from src.conversion.events.base import EventMapping
 from src.conversion.event_mapping import is_input_event, map_event, map_input_event
+from src.conversion.gml_transpiler import read_gml_source_map
 from src.conversion.type_defs import JsonDict
 
 
@@ -1793,8 +1794,7 @@ class TestScriptGeneration(unittest.TestCase):
         gd_path = os.path.join(self.godot_dir, "objects", "o_test", "o_test.gd")
         with open(gd_path, 'r', encoding='utf-8') as f:
             content = f.read()
-        with open(f"{gd_path}.gmlmap.json", "r", encoding="utf-8") as f:
-            source_map = json.load(f)
+        source_map = read_gml_source_map(f"{gd_path}.gdmap")
 
         self.assertIn("func _ready():", content)
         self.assertIn(
@@ -1804,10 +1804,14 @@ class TestScriptGeneration(unittest.TestCase):
         self.assertIn("\tif GMRuntime.gml_is_nullish(score):\n\t\tscore = 0", content)
         self.assertIn("\tscore = GMRuntime.gml_add(score, GMRuntime.gml_int_div(speed, 2))", content)
         self.assertNotIn("\tpass", content)
-        self.assertTrue(source_map["entries"])
-        self.assertEqual(source_map["entries"][0]["source_path"], source_path)
-        self.assertEqual(source_map["entries"][0]["event"], "_ready")
-        self.assertEqual(source_map["entries"][0]["source_line"], 1)
+        self.assertTrue(source_map.entries)
+        self.assertEqual(source_map.entries[0].source_path, source_path)
+        self.assertEqual(source_map.entries[0].event, "_ready")
+        self.assertEqual(source_map.entries[0].source_line, 1)
+        self.assertEqual(
+            sorted({entry.source_column for entry in source_map.entries}),
+            [1, 29, 42],
+        )
 
     def test_script_transpiles_calls_to_modern_script_function_assets(self):
         self._setup_object("o_test", event_list=[{"eventType": 0, "eventNum": 0}])
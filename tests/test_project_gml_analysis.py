@@ -0,0 +1,146 @@
+# pyright: reportPrivateUsage=false
+from __future__ import annotations
+
+import json
+import os
+import tempfile
+import time
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+from src.conversion import project_gml_analysis
+from src.conversion.conversion_scope import ConversionScope, using_conversion_scope
+from src.conversion.project_gml_analysis import ProjectGMLAnalysisStore, analyze_project_gml
+
+
+def _write_project(project_dir: Path, sources: dict[str, str]) -> None:
+    entries: list[dict[str, object]] = []
+    for relative_source, source in sources.items():
+        kind, name, _file_name = relative_source.split("/")
+        relative_path = f"{kind}/{name}/{name}.yy"
+        if not (project_dir / relative_path).exists():
+            entries.append({"id": {"name": name, "path": relative_path}})
+            yy_data: dict[str, object] = {
+                "%Name": name,
+                "name": name,
+                "resourceType": "GMObject" if kind == "objects" else "GMScript",
+            }
+            if kind == "objects":
+                yy_data["eventList"] = [
+                    {"eventType": 0, "eventNum": 0},
+                    {"eventType": 3, "eventNum": 0},
+                ]
+            (project_dir / relative_path).parent.mkdir(parents=True, exist_ok=True)
+            (project_dir / relative_path).write_text(json.dumps(yy_data), encoding="utf-8")
+        (project_dir / relative_source).write_text(source, encoding="utf-8")
+    (project_dir / "Project.yyp").write_text(
+        json.dumps({"resources": entries, "RoomOrderNodes": [], "resourceType": "GMProject"}),
+        encoding="utf-8",
+    )
+
+
+_SOURCES = {
+    "scripts/scr_config/scr_config.gml": (
+        "#macro BASE 4\n"
+        "#macro Debug:BASE 9\n"
+        "enum State { idle, running }\n"
+        "function scr_config(amount) {\n"
+        "    var local_total = amount;\n"
+        "    health = local_total;\n"
+        "    spr_player = 1;\n"
+        "}\n"
+    ),
+    "objects/obj_player/Create_0.gml": "enum Speed { slow = BASE + State.running }\n",
+    "objects/obj_player/Step_0.gml": "if (",
+}
+
+
+class ProjectGMLAnalysisTests(unittest.TestCase):
+    def setUp(self) -> None:
+        temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(temp_dir.cleanup)
+        self.project_dir = Path(temp_dir.name)
+        _write_project(self.project_dir, _SOURCES)
+
+    def test_one_pass_collects_enums_macros_and_assignments(self) -> None:
+        analysis = analyze_project_gml(self.project_dir, macro_configuration="Debug")
+
+        self.assertEqual(dict(analysis.macro_values), {"BASE": "9"})
+        self.assertEqual(
+            {name: dict(members) for name, members in analysis.enum_values.items()},
+            {"State": {"idle": 0, "running": 1}, "Speed": {"slow": 10}},
+        )
+        self.assertEqual(
+            analysis.script_instance_variables({"spr_player"}),
+            frozenset({"health"}),
+        )
+        create_path = os.path.join(self.project_dir, "objects", "obj_player", "Create_0.gml")
+        step_path = os.path.join(self.project_dir, "objects", "obj_player", "Step_0.gml")
+        self.assertEqual(analysis.source_assigned_names(create_path), frozenset({"slow"}))
+        self.assertEqual(analysis.source_assigned_names(step_path), frozenset())
+        self.assertIsNone(analysis.source_assigned_names(os.path.join(self.project_dir, "missing.gml")))
+
+    def test_store_shares_one_analysis_per_configuration(self) -> None:
+        store = ProjectGMLAnalysisStore()
+        with (
+            patch.object(
+                project_gml_analysis,
+                "_summarize_source",
+                wraps=project_gml_analysis._summarize_source,
+            ) as summarize,
+            using_conversion_scope(ConversionScope(gml_analysis=store)),
+        ):
+            first = analyze_project_gml(self.project_dir)
+            self.assertIs(analyze_project_gml(str(self.project_dir)), first)
+            self.assertEqual(summarize.call_count, len(_SOURCES))
+            self.assertIsNot(
+                analyze_project_gml(self.project_dir, macro_configuration="Debug"),
+                first,
+            )
+        self.assertEqual(summarize.call_count, 2 * len(_SOURCES))
+        self.assertIsNot(analyze_project_gml(self.project_dir), first)
+
+    def test_stopped_analysis_is_not_shared(self) -> None:
+        store = ProjectGMLAnalysisStore()
+        with using_conversion_scope(ConversionScope(gml_analysis=store)):
+            stopped = analyze_project_gml(self.project_dir, conversion_running=lambda: False)
+            complete = analyze_project_gml(self.project_dir)
+
+        self.assertEqual(dict(stopped.enum_values), {})
+        self.assertEqual(dict(complete.macro_values), {"BASE": "4"})
+        self.assertIs(store.get(self.project_dir), complete)
+
+    @unittest.skipUnless(
+        os.environ.get("GM2GODOT_REPORT_PERF") == "1",
+        "GM2GODOT_REPORT_PERF is not set",
+    )
+    def test_report_large_project_analysis_timings(self) -> None:
+        sources = {
+            f"scripts/scr_{index}/scr_{index}.gml": (
+                f"#macro VALUE_{index} {index}\n"
+                f"enum E{index} {{ a = VALUE_{index}, b }}\n"
+                f"function scr_{index}(arg) {{\n"
+                "    var total = arg;\n"
+                "    for (var i = 0; i < 10; i++) { total += i; }\n"
+                f"    field_{index} = total;\n"
+                "}\n"
+            )
+            * 8
+            for index in range(400)
+        }
+        with tempfile.TemporaryDirectory() as temp_dir:
+            project_dir = Path(temp_dir)
+            _write_project(project_dir, sources)
+            for max_workers in (1, os.cpu_count() or 1):
+                started = time.perf_counter()
+                analysis = analyze_project_gml(project_dir, max_workers=max_workers)
+                elapsed = time.perf_counter() - started
+                print(
+                    f"analyzed {len(sources)} sources with {max_workers} worker(s): "
+                    f"{elapsed * 1000:.1f} ms, {len(analysis.enum_values)} enums"
+                )
+
+
+if __name__ == "__main__":
+    unittest.main()
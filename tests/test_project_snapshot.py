@@ -0,0 +1,128 @@
+from __future__ import annotations
+
+import os
+from pathlib import Path
+import shutil
+import tempfile
+import unittest
+
+from src.conversion.asset_output_paths import build_asset_output_paths
+from src.conversion.asset_registry import AssetRegistryConverter
+from src.conversion.conversion_scope import ConversionScope, active_conversion_scope, using_conversion_scope
+from src.conversion.diagnostics import DiagnosticCollector
+from src.conversion.project_manifest import load_gamemaker_project_manifest
+from src.conversion.project_snapshot import ProjectSnapshot
+
+FIXTURE_PROJECT = (
+    Path(__file__).resolve().parent / "fixtures" / "golden" / "basic_scripts"
+)
+
+
+class ProjectSnapshotTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self._temp_dir = tempfile.TemporaryDirectory()
+        root = Path(self._temp_dir.name)
+        self.gm_dir = str(root / "gm")
+        self.godot_dir = str(root / "godot")
+        shutil.copytree(FIXTURE_PROJECT, self.gm_dir)
+        os.makedirs(self.godot_dir)
+        self.yyp_path = Path(self.gm_dir) / "BasicScripts.yyp"
+
+    def tearDown(self) -> None:
+        self._temp_dir.cleanup()
+
+    def _touch_yyp_later(self) -> None:
+        stat_result = self.yyp_path.stat()
+        os.utime(
+            self.yyp_path,
+            ns=(stat_result.st_atime_ns, stat_result.st_mtime_ns + 1_000_000_000),
+        )
+
+    def _registry_converter(
+        self,
+        *,
+        diagnostics: DiagnosticCollector | None = None,
+    ) -> AssetRegistryConverter:
+        return AssetRegistryConverter(
+            self.gm_dir,
+            self.godot_dir,
+            log_callback=lambda _message: None,
+            progress_callback=lambda _value: None,
+            diagnostics=diagnostics,
+        )
+
+    def test_manifest_is_built_once_per_snapshot(self) -> None:
+        snapshot = ProjectSnapshot()
+        with using_conversion_scope(ConversionScope(project_snapshot=snapshot)):
+            first = load_gamemaker_project_manifest(self.gm_dir)
+            second = load_gamemaker_project_manifest(self.gm_dir + os.sep)
+            platform_manifest = load_gamemaker_project_manifest(
+                self.gm_dir,
+                target_platform="windows",
+            )
+
+        self.assertIs(first, second)
+        self.assertIsNot(first, platform_manifest)
+        self.assertEqual(first.resources, platform_manifest.resources)
+        stats = snapshot.stats()
+        self.assertEqual((stats.hits, stats.misses, stats.entries), (1, 2, 2))
+        self.assertIsNone(active_conversion_scope().project_snapshot)
+        self.assertIsNot(load_gamemaker_project_manifest(self.gm_dir), first)
+
+    def test_changed_yyp_fingerprint_rebuilds_manifest(self) -> None:
+        snapshot = ProjectSnapshot()
+        with using_conversion_scope(ConversionScope(project_snapshot=snapshot)):
+            first = load_gamemaker_project_manifest(self.gm_dir)
+            self._touch_yyp_later()
+            second = load_gamemaker_project_manifest(self.gm_dir)
+
+        self.assertIsNot(first, second)
+        self.assertEqual(first.resources, second.resources)
+        self.assertEqual(snapshot.stats().invalidations, 1)
+
+    def test_registry_entries_and_output_paths_are_shared_read_only_views(self) -> None:
+        with using_conversion_scope(ConversionScope(project_snapshot=ProjectSnapshot())):
+            entries = self._registry_converter().build_entries()
+            self.assertIs(self._registry_converter().build_entries(), entries)
+            paths = build_asset_output_paths(self.gm_dir, self.godot_dir)
+            self.assertIs(build_asset_output_paths(self.gm_dir, self.godot_dir), paths)
+
+        self.assertEqual(entries, self._registry_converter().build_entries())
+        self.assertEqual(
+            {kind: dict(names) for kind, names in paths.items()},
+            {
+                kind: dict(names)
+                for kind, names in build_asset_output_paths(
+                    self.gm_dir, self.godot_dir
+                ).items()
+            },
+        )
+        self.assertIn("scripts", paths)
+        with self.assertRaises(TypeError):
+            paths["scripts"]["scr_new"] = "res://scripts/scr_new.gd"  # type: ignore[index]
+        for entry in entries:
+            if entry.metadata:
+                with self.assertRaises(TypeError):
+                    entry.metadata["edited"] = True
+
+    def test_registry_with_diagnostics_or_stopped_conversion_is_not_cached(self) -> None:
+        snapshot = ProjectSnapshot()
+        with using_conversion_scope(ConversionScope(project_snapshot=snapshot)):
+            diagnostics = DiagnosticCollector()
+            first = self._registry_converter(diagnostics=diagnostics).build_entries()
+            second = self._registry_converter(diagnostics=diagnostics).build_entries()
+            self.assertIsNot(first, second)
+
+            stopped = AssetRegistryConverter(
+                self.gm_dir,
+                self.godot_dir,
+                log_callback=lambda _message: None,
+                progress_callback=lambda _value: None,
+                conversion_running=lambda: False,
+            )
+            self.assertEqual(stopped.build_entries(), ())
+            self.assertEqual(self._registry_converter().build_entries(), first)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,12 +1,16 @@
 from __future__ import annotations
 
+import io
 import json
 import os
 import shutil
+import struct
 import sys
 import tempfile
 import threading
+import time
 import unittest
+from array import array
 from typing import IO, Any, Callable, cast
 from unittest.mock import MagicMock, patch
 
@@ -28,8 +32,12 @@ from src.conversion.room_layers import (
     GODOT_TILE_TRANSFORM_FLIP_H,
     GODOT_TILE_TRANSFORM_FLIP_V,
     GODOT_TILE_TRANSFORM_TRANSPOSE,
+    SceneTextWriter,
     decode_gamemaker_tile,
+    decode_tile_compressed_cells,
     decode_tile_compressed_data,
+    encode_godot_tile_map_data,
+    format_godot_tile_map_data,
     gamemaker_tile_transform_to_godot,
     is_empty_gamemaker_tile,
 )
@@ -540,6 +548,32 @@ class TestRoomConverter(unittest.TestCase):
         self.assertEqual(self.progress[-1], 100)
         self.assertTrue(any("r_test" in log for log in self.logs))
 
+    def test_failed_scene_write_keeps_previous_scene(self):
+        self._write_yyp(["r_test"])
+        self._write_room("r_test")
+        self._make_converter().convert_all()
+        room_directory = os.path.join(self.godot_dir, "rooms", "r_test")
+        tscn_path = os.path.join(room_directory, "r_test.tscn")
+        with open(tscn_path, "r", encoding="utf-8") as f:
+            previous_scene = f.read()
+
+        def write_partial_scene(scene_file: IO[str], *_args: Any, **_kwargs: Any) -> None:
+            scene_file.write("[gd_scene format=3]\n")
+            raise RuntimeError("simulated scene failure")
+
+        converter = self._make_converter()
+        with patch.object(RoomConverter, "_write_room_scene", side_effect=write_partial_scene):
+            with self.assertRaisesRegex(RuntimeError, "simulated scene failure"):
+                converter.convert_all()
+
+        with open(tscn_path, "r", encoding="utf-8") as f:
+            self.assertEqual(f.read(), previous_scene)
+        self.assertEqual(
+            [name for name in os.listdir(room_directory) if name.endswith(".tmp")],
+            [],
+        )
+        self.assertEqual(converter.conversion_step_result().resources.failed, 1)
+
     def test_preserves_room_subfolders(self):
         self._write_yyp(["r_intro"])
         self._write_room("r_intro", parent_path="folders/Rooms/Game/Intro.yy")
@@ -849,6 +883,89 @@ class TestRoomConverter(unittest.TestCase):
                     alternative_tile,
                 )
 
+    def test_decoded_tile_runs_pack_into_godot_tile_map_data(self):
+        rotated = 5 | GAMEMAKER_TILE_ROTATE_BIT | GAMEMAKER_TILE_MIRROR_BIT
+        decoded = decode_tile_compressed_cells(
+            3,
+            2,
+            [-2, 1, GAMEMAKER_EMPTY_TILE_SENTINEL, -2, 0, rotated],
+        )
+
+        self.assertIsInstance(decoded, array)
+        self.assertEqual(decoded.tolist(), [1, 1, GAMEMAKER_EMPTY_TILE_SENTINEL, 0, 0, rotated])
+        tile_map = encode_godot_tile_map_data(decoded, 3, 2)
+        self.assertEqual(tile_map.cell_count, 3)
+        self.assertEqual(tile_map.transform_cell_count, 1)
+        self.assertEqual(
+            tile_map.data,
+            struct.pack(
+                "<H6H6H6H",
+                0,
+                0, 0, 0, 0, 0, 0,
+                1, 0, 0, 0, 0, 0,
+                2, 1, 0, 0, 2, GODOT_TILE_TRANSFORM_FLIP_H
+                | GODOT_TILE_TRANSFORM_FLIP_V
+                | GODOT_TILE_TRANSFORM_TRANSPOSE,
+            ),
+        )
+        self.assertEqual(encode_godot_tile_map_data(array("q", [0, 0]), 2, 2).data, b"")
+
+    def test_streamed_scene_text_matches_joined_lines(self):
+        decoded = array("q", [1, 2 | GAMEMAKER_TILE_FLIP_BIT] * 35000)
+        data = encode_godot_tile_map_data(decoded, 350, 4).data
+        self.assertEqual(
+            format_godot_tile_map_data(data),
+            "PackedByteArray({})".format(", ".join(str(value) for value in data)),
+        )
+
+        stream = io.StringIO()
+        writer = SceneTextWriter(stream)
+        writer.extend(["[gd_scene format=3]", ""])
+        writer.append_joined(["tile_map_data = ", "PackedByteArray(", "0, 0", ")"])
+        writer.append("")
+        self.assertEqual(
+            stream.getvalue(),
+            "\n".join(["[gd_scene format=3]", "", "tile_map_data = PackedByteArray(0, 0)", ""]),
+        )
+
+    def test_malformed_tile_runs_are_rejected_before_expanding(self):
+        with self.assertRaisesRegex(ValueError, "decoded 2000000000 cells, expected 4"):
+            decode_tile_compressed_cells(2, 2, [-2000000000, 1])
+        with self.assertRaisesRegex(ValueError, "decoded 5 cells, expected 4"):
+            decode_tile_compressed_cells(2, 2, [-3, 1, 2, 3, 4])
+        with self.assertRaisesRegex(ValueError, "repeated run has no value"):
+            decode_tile_compressed_cells(2, 2, [1, 2, -2])
+        with self.assertRaisesRegex(ValueError, "must be an integer"):
+            decode_tile_compressed_cells(2, 2, [1, "tile", 2, 3])
+        self.assertEqual(decode_tile_compressed_cells(2, 1, [1.0, "2"]).tolist(), [1, 2])
+
+    @unittest.skipUnless(
+        os.environ.get("GM2GODOT_REPORT_PERF") == "1",
+        "GM2GODOT_REPORT_PERF is not set",
+    )
+    def test_report_large_tile_layer_timings(self):
+        width = height = 2000
+        pattern = [0, 0, 3, 4 | GAMEMAKER_TILE_FLIP_BIT, GAMEMAKER_EMPTY_TILE_SENTINEL, 7]
+        compressed: list[Any] = []
+        for row in range(height):
+            compressed.extend([-(width // 2), row % 9])
+            compressed.extend(pattern * ((width // 2) // len(pattern)))
+            compressed.extend(pattern[: (width // 2) % len(pattern)])
+        started = time.perf_counter()
+        decoded = decode_tile_compressed_cells(width, height, compressed)
+        decoded_at = time.perf_counter()
+        tile_map = encode_godot_tile_map_data(decoded, width, 16)
+        encoded_at = time.perf_counter()
+        text = format_godot_tile_map_data(tile_map.data)
+        formatted_at = time.perf_counter()
+        print(
+            f"{width}x{height} tile layer ({tile_map.cell_count} cells): "
+            f"decode {(decoded_at - started) * 1000:.1f} ms, "
+            f"pack {(encoded_at - decoded_at) * 1000:.1f} ms, "
+            f"format {(formatted_at - encoded_at) * 1000:.1f} ms "
+            f"({len(text) // (1024 * 1024)} MiB)"
+        )
+
     def test_tile_layer_emits_tilemaplayer_with_decoded_cells(self):
         self._write_yyp(["r_tiles"], extra_resources=[("tilesets", "ts_ground")])
         self._write_tileset("ts_ground", tile_count=4, out_columns=2)
@@ -17,6 +17,8 @@ from src.conversion.asset_registry import (
 )
 from src.conversion.conversion_outcome import ConversionCounts
 from src.conversion.diagnostics import DiagnosticCollector
+from src.conversion.gml_transpiler import read_gml_source_map
+from src.conversion.resource_index import GameMakerResourceIndex
 from src.conversion.scripts import (
     SCRIPT_REGISTRY_RELATIVE_PATH,
     ScriptConverter,
@@ -26,6 +28,7 @@ from src.conversion.script_functions import (
     modern_script_structure,
 )
 from src.conversion.type_defs import JsonDict
+from src.localization import get_localized
 
 
 SNAP_BUFFER_READ_YAML_FIXTURE = (
@@ -172,8 +175,8 @@ class TestScriptConverter(unittest.TestCase):
         self.assertEqual(registry_path, str(self.godot_dir / SCRIPT_REGISTRY_RELATIVE_PATH))
         legacy_script = (self.godot_dir / "scripts" / "game" / "scr_add.gd").read_text(encoding="utf-8")
         modern_script = (self.godot_dir / "scripts" / "game" / "scr_modern.gd").read_text(encoding="utf-8")
-        legacy_source_map = json.loads(
-            (self.godot_dir / "scripts" / "game" / "scr_add.gd.gmlmap.json").read_text(encoding="utf-8")
+        legacy_source_map = read_gml_source_map(
+            str(self.godot_dir / "scripts" / "game" / "scr_add.gd.gdmap")
         )
         registry = (self.godot_dir / SCRIPT_REGISTRY_RELATIVE_PATH).read_text(encoding="utf-8")
 
@@ -186,13 +189,13 @@ class TestScriptConverter(unittest.TestCase):
         self.assertIn("# GM2Godot source:", legacy_script)
         self.assertIn("GMRuntime.gml_argument(0)", legacy_script)
         self.assertIn("GMRuntime.gml_argument(1)", legacy_script)
-        self.assertEqual(legacy_source_map["event"], "script:scr_add")
-        self.assertTrue(legacy_source_map["entries"])
+        self.assertEqual(legacy_source_map.event, "script:scr_add")
+        self.assertTrue(legacy_source_map.entries)
         self.assertEqual(
-            legacy_source_map["entries"][0]["source_path"],
+            legacy_source_map.entries[0].source_path,
             str(self.gm_dir / "scripts" / "scr_add" / "scr_add.gml"),
         )
-        self.assertEqual(legacy_source_map["entries"][0]["source_line"], 1)
+        self.assertEqual(legacy_source_map.entries[0].source_line, 1)
         self.assertIn("func gm2godot_callable():", modern_script)
         self.assertIn("func gm2godot_scoped_callable():", modern_script)
         self.assertIn("func _gm_script_call(a = null, b = null):", modern_script)
@@ -406,6 +409,25 @@ class TestScriptConverter(unittest.TestCase):
             ),
         )
 
+    def test_cancellation_before_script_render_leaves_script_unstarted(self) -> None:
+        self._write_project()
+        converter = self._converter()
+
+        with patch(
+            "src.conversion.scripts.GMLTranspileEngine.map",
+            return_value=iter(()),
+        ):
+            self.assertIsNone(converter.convert_all())
+
+        self.assertIn(get_localized("Console_Convertor_Scripts_Stopped"), self.logs)
+        self.assertEqual(
+            converter.conversion_step_result(cancelled=True).resources,
+            ConversionCounts(
+                requested=2,
+                skipped=2,
+            ),
+        )
+
     def test_later_script_exception_fails_prior_unpublished_script(self) -> None:
         self._write_project()
         converter = self._converter()
@@ -1054,16 +1076,8 @@ class TestScriptConverter(unittest.TestCase):
         script = (
             self.godot_dir / "scripts" / "game" / "scr_modern.gd"
         ).read_text(encoding="utf-8")
-        source_map = cast(
-            dict[str, object],
-            json.loads(
-                (
-                    self.godot_dir
-                    / "scripts"
-                    / "game"
-                    / "scr_modern.gd.gmlmap.json"
-                ).read_text(encoding="utf-8")
-            ),
+        source_map = read_gml_source_map(
+            str(self.godot_dir / "scripts" / "game" / "scr_modern.gd.gdmap")
         )
         first_assignment = script.index('"First"')
         first_new = script.index(
@@ -1082,21 +1096,16 @@ class TestScriptConverter(unittest.TestCase):
         )
         initializer_entries = [
             entry
-            for entry in cast(list[dict[str, object]], source_map["entries"])
-            if entry["event"] == "script:scr_modern:top-level"
+            for entry in source_map.entries
+            if entry.event == "script:scr_modern:top-level"
         ]
         self.assertTrue(initializer_entries)
         first_initializer_entry = initializer_entries[0]
-        self.assertEqual(first_initializer_entry["source_line"], 4)
+        self.assertEqual(first_initializer_entry.source_line, 4)
+        self.assertEqual(first_initializer_entry.source_column, 1)
         self.assertIn(
-            "global.First",
-            cast(str, first_initializer_entry["source_text"]),
-        )
-        self.assertEqual(
-            script.splitlines()[
-                cast(int, first_initializer_entry["generated_line"]) - 1
-            ].strip(),
-            first_initializer_entry["generated_text"],
+            '"First"',
+            script.splitlines()[first_initializer_entry.generated_line - 1],
         )
 
     def test_discovers_all_functions_in_snap_buffer_read_yaml_fixture(self) -> None:
@@ -1241,6 +1250,36 @@ class TestScriptConverter(unittest.TestCase):
         legacy_script = (self.godot_dir / "scripts" / "game" / "scr_add.gd").read_text(encoding="utf-8")
         self.assertIn('AdBridge.show_rewarded("zone_1")', legacy_script)
 
+    def test_extension_functions_index_rooms_without_decoding_layers(self) -> None:
+        self._write_project()
+        project_path = self.gm_dir / "ScriptTest.yyp"
+        project = json.loads(project_path.read_text(encoding="utf-8"))
+        resources = cast(list[object], project["resources"])
+        resources.append(_resource_entry("extensions", "AdSDK"))
+        resources.append(_resource_entry("rooms", "r_large"))
+        _write_json(project_path, project)
+        _write_json(self.gm_dir / "extensions" / "AdSDK" / "AdSDK.yy", _extension_yy("AdSDK"))
+        # Everything after roomSettings is unreadable; only a full layer
+        # decode would notice.
+        _write_text(
+            self.gm_dir / "rooms" / "r_large" / "r_large.yy",
+            '{"name": "r_large", "roomSettings": {"Width": 64, "Height": 64,},'
+            ' "creationCodeFile": "", "inheritCode": false, "inheritCreationOrder": false,'
+            ' "inheritLayers": false, "instanceCreationOrder": [], "isDnd": false,'
+            ' "parentRoom": null, "physicsSettings": {}, "viewSettings": {}, "views": [],'
+            ' "layers": [{"instances": [unterminated',
+        )
+
+        with patch(
+            "src.conversion.scripts.GameMakerResourceIndex",
+            wraps=GameMakerResourceIndex,
+        ) as resource_index:
+            functions = self._converter()._extension_functions()
+
+        self.assertEqual(resource_index.call_args.kwargs["index_room_layers"], False)
+        self.assertEqual(set(functions), {"ads_show_rewarded"})
+        self.assertEqual(functions["ads_show_rewarded"].extension_name, "AdSDK")
+
     def test_applies_macro_configuration_to_script_sources(self) -> None:
         self._write_project()
         _write_text(
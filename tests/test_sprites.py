@@ -2,24 +2,27 @@
 
 import json
 import os
+import random
 import sys
 import shutil
 import tempfile
 import threading
+import time
 import unittest
-from typing import cast
+from typing import Any, cast
 from unittest.mock import MagicMock, patch
 
 PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 if PROJECT_ROOT not in sys.path:
     sys.path.insert(0, PROJECT_ROOT)
 
-from PIL import Image
+from PIL import Image, PngImagePlugin
 from src.conversion.asset_registry import AssetRegistryConverter
 from src.conversion.conversion_outcome import ConversionCounts
 from src.conversion.converter import Converter
 from src.conversion.diagnostics import ConversionDiagnostic, DiagnosticCollector
 from src.conversion.resource_index import GameMakerResourceIndex
+from src.localization import get_localized
 from src.conversion.sprites import (
     AnimationData,
     CollisionData,
@@ -107,6 +110,93 @@ class TestSpriteConverterBasic(unittest.TestCase):
             ),
         )
 
+    def test_missing_animation_warning_is_logged_with_its_scene_messages(self):
+        layer_dir = os.path.join(
+            self.gm_dir, "sprites", "test_sprite", "layers",
+            "aaaaaaaa-bbbb-cccc-dddd-eeeeeeeeeeee",
+        )
+        Image.new("RGBA", (2, 2), "blue").save(os.path.join(layer_dir, "frame1.png"), "PNG")
+        logging_threads: dict[str, threading.Thread] = {}
+
+        def log(message: str) -> None:
+            self.logs.append(message)
+            logging_threads[message] = threading.current_thread()
+
+        SpriteConverter(
+            self.gm_dir, self.godot_dir,
+            log_callback=log,
+            progress_callback=lambda v: None,
+            conversion_running=lambda: True,
+        ).convert_all()
+
+        warning = (
+            "Warning: Sprite test_sprite has multiple frames but no readable "
+            "animation metadata; using a looping 30 FPS fallback."
+        )
+        scene_message = get_localized("Console_Convertor_Sprites_SceneGenerated").format(
+            name="test_sprite"
+        )
+        self.assertEqual(self.logs.count(warning), 1)
+        self.assertEqual(self.logs.index(scene_message), self.logs.index(warning) + 1)
+        # Applied with the sprite's other outcomes, not from the pool.
+        self.assertIs(logging_threads[warning], threading.current_thread())
+
+    def _source_frame_path(self) -> str:
+        return os.path.join(
+            self.gm_dir, "sprites", "test_sprite", "layers",
+            "aaaaaaaa-bbbb-cccc-dddd-eeeeeeeeeeee", "frame0.png",
+        )
+
+    def _exported_frame_bytes(self) -> bytes:
+        with open(
+            os.path.join(self.godot_dir, "sprites", "test_sprite", "test_sprite.png"),
+            "rb",
+        ) as frame_file:
+            return frame_file.read()
+
+    def _save_source_with_text_chunk(self) -> bytes:
+        info = PngImagePlugin.PngInfo()
+        info.add_text("Software", "GameMaker")
+        Image.new("RGBA", (2, 2), "red").save(self._source_frame_path(), "PNG", pnginfo=info)
+        with open(self._source_frame_path(), "rb") as source_file:
+            return source_file.read()
+
+    def test_single_layer_png_frame_is_copied_unchanged(self):
+        source = self._save_source_with_text_chunk()
+
+        self._make_converter().convert_all()
+
+        self.assertEqual(self._exported_frame_bytes(), source)
+
+    def test_normalize_png_reencodes_single_layer_frames(self):
+        source = self._save_source_with_text_chunk()
+        converter = SpriteConverter(
+            self.gm_dir, self.godot_dir,
+            log_callback=lambda msg: self.logs.append(msg),
+            progress_callback=lambda v: None,
+            conversion_running=lambda: True,
+            normalize_png=True,
+        )
+
+        converter.convert_all()
+
+        exported = self._exported_frame_bytes()
+        self.assertNotEqual(exported, source)
+        self.assertNotIn(b"GameMaker", exported)
+
+    def test_frame_with_invalid_png_header_is_reencoded(self):
+        Image.new("RGBA", (2, 2), "red").save(self._source_frame_path(), "BMP")
+
+        self._make_converter().convert_all()
+
+        exported = self._exported_frame_bytes()
+        self.assertTrue(exported.startswith(b"\x89PNG\r\n\x1a\n"))
+        with Image.open(
+            os.path.join(self.godot_dir, "sprites", "test_sprite", "test_sprite.png")
+        ) as image:
+            self.assertEqual(image.format, "PNG")
+            self.assertEqual(image.convert("RGBA").getpixel((0, 0)), (255, 0, 0, 255))
+
     def test_frame_without_output_fails_logical_sprite_and_omits_scene(self):
         converter = self._make_converter()
 
@@ -244,6 +334,76 @@ class TestSpriteConverterBasic(unittest.TestCase):
             ),
         )
 
+    def test_scene_is_generated_while_other_frames_are_pending(self):
+        late_layer_dir = os.path.join(
+            self.gm_dir,
+            "sprites",
+            "late_sprite",
+            "layers",
+            "bbbbbbbb-cccc-dddd-eeee-ffffffffffff",
+        )
+        os.makedirs(late_layer_dir)
+        Image.new("RGBA", (2, 2), "blue").save(
+            os.path.join(late_layer_dir, "frame0.png"),
+            "PNG",
+        )
+        converter = SpriteConverter(
+            self.gm_dir,
+            self.godot_dir,
+            log_callback=lambda msg: self.logs.append(msg),
+            progress_callback=lambda _value: None,
+            conversion_running=lambda: True,
+            max_workers=2,
+        )
+        scene_generated = threading.Event()
+        original_process_sprite = converter._process_sprite
+        original_generate_scene = converter._generate_sprite_scene
+
+        def process_sprite(
+            sprite_name: str,
+            index: int,
+            gm_sprite_paths: list[str],
+            images_count: int,
+            subfolder: str = "",
+        ) -> SpriteProcessResult | None:
+            if sprite_name == "late_sprite":
+                self.assertTrue(scene_generated.wait(timeout=10))
+            return original_process_sprite(
+                sprite_name,
+                index,
+                gm_sprite_paths,
+                images_count,
+                subfolder,
+            )
+
+        def generate_scene(sprite_name: str, *args: Any) -> None:
+            original_generate_scene(sprite_name, *args)
+            if sprite_name == "test_sprite":
+                scene_generated.set()
+
+        with (
+            patch.object(converter, "_process_sprite", side_effect=process_sprite),
+            patch.object(converter, "_generate_sprite_scene", side_effect=generate_scene),
+        ):
+            converter.convert_all()
+
+        self.assertTrue(scene_generated.is_set())
+        self.assertTrue(
+            os.path.isfile(
+                os.path.join(self.godot_dir, "sprites", "late_sprite", "late_sprite.tscn")
+            )
+        )
+        self.assertEqual(
+            converter.conversion_step_result(
+                finalize_unfinished_as=None,
+            ).resources,
+            ConversionCounts(
+                requested=2,
+                executed=2,
+                completed=2,
+            ),
+        )
+
     def test_scene_exception_fails_bad_sprite_after_safe_sibling_completes(self):
         bad_layer_dir = os.path.join(
             self.gm_dir,
@@ -2434,6 +2594,276 @@ class TestGenerateSpriteScene(unittest.TestCase):
         self.assertNotIn("metadata/gamemaker_precise_mask = true", content)
 
 
+def _legacy_mask_rectangles(
+    alpha_frames: list[bytes],
+    collision: CollisionData,
+    per_frame: bool,
+) -> list[list[tuple[int, int, int, int]]]:
+    """Reference per-pixel mask and span-merge implementation."""
+    width = collision["width"]
+    left, right = collision["bbox_left"], collision["bbox_right"]
+    top, bottom = collision["bbox_top"], collision["bbox_bottom"]
+    masks: list[bytearray] = []
+    for alpha in alpha_frames:
+        mask = bytearray(len(alpha))
+        for y in range(top, bottom + 1):
+            for x in range(left, right + 1):
+                if alpha[y * width + x] > collision["collisionTolerance"]:
+                    mask[y * width + x] = 1
+        masks.append(mask)
+    if not per_frame:
+        composite = bytearray(len(masks[0]))
+        for mask in masks:
+            for index, value in enumerate(mask):
+                composite[index] |= value
+        masks = [composite]
+
+    frames: list[list[tuple[int, int, int, int]]] = []
+    for mask in masks:
+        rectangles: list[list[int]] = []
+        active: dict[tuple[int, int], int] = {}
+        for y in range(top, bottom + 1):
+            next_active: dict[tuple[int, int], int] = {}
+            x = left
+            while x <= right:
+                if not mask[y * width + x]:
+                    x += 1
+                    continue
+                start = x
+                while x <= right and mask[y * width + x]:
+                    x += 1
+                key = (start, x - 1)
+                index = active.get(key)
+                if index is None:
+                    index = len(rectangles)
+                    rectangles.append([start, y, x - start, 1])
+                else:
+                    rectangles[index][3] += 1
+                next_active[key] = index
+            active = next_active
+        frames.append([(r[0], r[1], r[2], r[3]) for r in rectangles])
+    return frames
+
+
+class TestPreciseMaskExtraction(unittest.TestCase):
+    def setUp(self) -> None:
+        self.gm_dir = tempfile.mkdtemp()
+        self.godot_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.gm_dir)
+        self.addCleanup(shutil.rmtree, self.godot_dir)
+        self.converter = SpriteConverter(
+            self.gm_dir,
+            self.godot_dir,
+            log_callback=lambda _message: None,
+            progress_callback=lambda _value: None,
+            conversion_running=lambda: True,
+        )
+
+    @staticmethod
+    def _collision(
+        kind: int,
+        tolerance: int,
+        bbox: tuple[int, int, int, int],
+        size: tuple[int, int],
+    ) -> CollisionData:
+        return {
+            "collisionKind": kind,
+            "collisionTolerance": tolerance,
+            "bboxMode": 2,
+            "bbox_left": bbox[0],
+            "bbox_top": bbox[1],
+            "bbox_right": bbox[2],
+            "bbox_bottom": bbox[3],
+            "width": size[0],
+            "height": size[1],
+            "origin": 0,
+            "xorigin": 0,
+            "yorigin": 0,
+        }
+
+    @staticmethod
+    def _blob_alpha(rng: random.Random, width: int, height: int) -> bytes:
+        alpha = bytearray(width * height)
+        for _ in range(6):
+            x0, y0 = rng.randrange(width), rng.randrange(height)
+            x1, y1 = rng.randrange(x0, width), rng.randrange(y0, height)
+            value = rng.choice((40, 128, 129, 255))
+            for y in range(y0, y1 + 1):
+                alpha[y * width + x0:y * width + x1 + 1] = bytes([value]) * (x1 - x0 + 1)
+        for _ in range(20):
+            alpha[rng.randrange(width * height)] = rng.randrange(256)
+        return bytes(alpha)
+
+    def _write_frames(
+        self,
+        sprite_name: str,
+        alpha_frames: list[bytes],
+        size: tuple[int, int],
+    ) -> None:
+        sprite_dir = os.path.join(self.godot_dir, "sprites", sprite_name)
+        os.makedirs(sprite_dir, exist_ok=True)
+        for index, alpha in enumerate(alpha_frames, start=1):
+            image = Image.new("RGBA", size, (255, 0, 0, 0))
+            image.putalpha(Image.frombytes("L", size, alpha))
+            name = sprite_name if len(alpha_frames) == 1 else f"{sprite_name}_{index}"
+            image.save(os.path.join(sprite_dir, f"{name}.png"))
+
+    def _rectangles(
+        self,
+        sprite_name: str,
+        collision: CollisionData,
+        frame_count: int,
+    ) -> list[list[tuple[int, int, int, int]]]:
+        produced: list[list[tuple[int, int, int, int]]] = []
+        original = SpriteConverter._mask_rectangles
+
+        def record(*args: Any, **kwargs: Any) -> Any:
+            rectangles = original(*args, **kwargs)
+            produced.append([
+                (rectangle.x, rectangle.y, rectangle.width, rectangle.height)
+                for rectangle in rectangles
+            ])
+            return rectangles
+
+        with patch.object(SpriteConverter, "_mask_rectangles", side_effect=record):
+            self.converter._build_precise_collision_block(
+                sprite_name,
+                collision,
+                frame_count,
+                "",
+            )
+        return produced
+
+    def test_masks_match_the_per_pixel_reference(self) -> None:
+        rng = random.Random(705)
+        size = (37, 29)
+        cases = [
+            (0, 0, (0, 0, 36, 28), 1),
+            (0, 128, (3, 2, 30, 25), 3),
+            (4, 40, (1, 0, 35, 28), 3),
+            (4, 0, (5, 5, 5, 5), 2),
+        ]
+        for case_index, (kind, tolerance, bbox, frame_count) in enumerate(cases):
+            with self.subTest(kind=kind, tolerance=tolerance, bbox=bbox):
+                sprite_name = f"spr_reference_{case_index}"
+                alpha_frames = [
+                    self._blob_alpha(rng, *size) for _ in range(frame_count)
+                ]
+                self._write_frames(sprite_name, alpha_frames, size)
+                collision = self._collision(kind, tolerance, bbox, size)
+
+                self.assertEqual(
+                    self._rectangles(sprite_name, collision, frame_count),
+                    _legacy_mask_rectangles(
+                        alpha_frames,
+                        collision,
+                        per_frame=kind == 4 and frame_count > 1,
+                    ),
+                )
+
+    def test_identical_rows_extend_open_rectangles(self) -> None:
+        row = bytes([0, 255, 255, 0, 255])
+        rectangles = SpriteConverter._mask_rectangles(row * 3 + bytes(5) + row, 5, 2, 7)
+
+        self.assertEqual(
+            [(r.x, r.y, r.width, r.height) for r in rectangles],
+            [(3, 7, 2, 3), (6, 7, 1, 3), (3, 11, 2, 1), (6, 11, 1, 1)],
+        )
+
+    def _write_precise_sprite(self, sprite_name: str, alpha_frames: list[bytes]) -> None:
+        sprite_dir = os.path.join(self.gm_dir, "sprites", sprite_name)
+        layer_guid = "11111111-0000-0000-0000-000000000000"
+        frame_names = [f"frame{index}" for index in range(len(alpha_frames))]
+        layer_dir = os.path.join(sprite_dir, "layers", layer_guid)
+        os.makedirs(layer_dir)
+        for frame_name, alpha in zip(frame_names, alpha_frames):
+            image = Image.new("RGBA", (8, 8), (0, 0, 255, 0))
+            image.putalpha(Image.frombytes("L", (8, 8), alpha))
+            image.save(os.path.join(layer_dir, f"{frame_name}.png"))
+        with open(os.path.join(sprite_dir, f"{sprite_name}.yy"), "w", encoding="utf-8") as yy_file:
+            json.dump(
+                {
+                    "name": sprite_name,
+                    "resourceType": "GMSprite",
+                    "collisionKind": 4,
+                    "collisionTolerance": 0,
+                    "bboxMode": 0,
+                    "bbox_left": 0,
+                    "bbox_top": 0,
+                    "bbox_right": 7,
+                    "bbox_bottom": 7,
+                    "width": 8,
+                    "height": 8,
+                    "frames": [{"name": name} for name in frame_names],
+                    "layers": [{"name": layer_guid, "visible": True}],
+                },
+                yy_file,
+            )
+
+    def _convert_precise_sprite(self, *, cache_budget: int | None = None) -> tuple[str, list[str]]:
+        if cache_budget is not None:
+            self.converter._frame_alpha_cache.budget_bytes = cache_budget
+        opened: list[str] = []
+        original_open = Image.open
+
+        def record_open(path: str, *args: Any, **kwargs: Any) -> Image.Image:
+            opened.append(os.path.abspath(path))
+            return original_open(path, *args, **kwargs)
+
+        with patch("src.conversion.sprites.Image.open", side_effect=record_open):
+            self.converter.convert_all()
+        scene_path = os.path.join(self.godot_dir, "sprites", "spr_precise", "spr_precise.tscn")
+        with open(scene_path, encoding="utf-8") as scene_file:
+            scene = scene_file.read()
+        generated = os.path.abspath(self.godot_dir)
+        return scene, [path for path in opened if path.startswith(generated)]
+
+    def test_exported_frames_are_not_decoded_again_for_masks(self) -> None:
+        rng = random.Random(808)
+        self._write_precise_sprite("spr_precise", [self._blob_alpha(rng, 8, 8) for _ in range(3)])
+
+        scene, reopened = self._convert_precise_sprite()
+
+        self.assertEqual(reopened, [])
+        self.assertIn("metadata/gamemaker_precise_mask = true", scene)
+        self.assertEqual(self.converter._frame_alpha_cache.take(
+            os.path.join(self.godot_dir, "sprites", "spr_precise", "spr_precise_1.png")
+        ), None)
+
+    def test_evicted_frames_are_read_back_from_the_export(self) -> None:
+        rng = random.Random(809)
+        self._write_precise_sprite("spr_precise", [self._blob_alpha(rng, 8, 8) for _ in range(3)])
+        cached_scene, _reopened = self._convert_precise_sprite()
+
+        scene, reopened = self._convert_precise_sprite(cache_budget=8 * 8)
+
+        self.assertEqual(scene, cached_scene)
+        self.assertEqual(len(reopened), 2)
+
+    @unittest.skipUnless(
+        os.environ.get("GM2GODOT_REPORT_PERF") == "1",
+        "GM2GODOT_REPORT_PERF is not set",
+    )
+    def test_report_large_precise_mask_timings(self) -> None:
+        rng = random.Random(512)
+        size = (512, 512)
+        alpha_frames = [self._blob_alpha(rng, *size) for _ in range(60)]
+        self._write_frames("spr_large", alpha_frames, size)
+        collision = self._collision(0, 0, (0, 0, 511, 511), size)
+
+        started = time.perf_counter()
+        self.converter._build_precise_collision_block("spr_large", collision, 60, "")
+        pillow_seconds = time.perf_counter() - started
+        started = time.perf_counter()
+        _legacy_mask_rectangles(alpha_frames, collision, per_frame=False)
+        reference_seconds = time.perf_counter() - started
+        print(
+            "60 precise 512x512 frames: "
+            f"Pillow masks {pillow_seconds * 1000:.1f} ms; "
+            f"per-pixel reference {reference_seconds * 1000:.1f} ms"
+        )
+
+
 class TestParseAnimationData(unittest.TestCase):
     """Test _parse_animation_data() directly."""
 
@@ -51,7 +51,7 @@ class TestManagedResourceOutputPolicy(unittest.TestCase):
         )
         self.assertTrue(
             object_outputs.owns(
-                "objects/game/o_stale/o_stale.gd.gmlmap.json"
+                "objects/game/o_stale/o_stale.gd.gdmap"
             )
         )
 
@@ -384,7 +384,7 @@ class TestStaleManagedOutputInvalidation(unittest.TestCase):
         return (
             root / f"{self.OBJECT_NAME}.tscn",
             root / f"{self.OBJECT_NAME}.gd",
-            root / f"{self.OBJECT_NAME}.gd.gmlmap.json",
+            root / f"{self.OBJECT_NAME}.gd.gdmap",
         )
 
     def _room_outputs(self) -> tuple[Path, ...]:
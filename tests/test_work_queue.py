@@ -0,0 +1,137 @@
+from __future__ import annotations
+
+import threading
+import unittest
+from collections.abc import Iterator
+
+from src.conversion.base_converter import BaseConverter
+from src.conversion.work_queue import BoundedWorkQueue, WorkQueueStats
+
+
+class _QueueConverter(BaseConverter):
+    def convert_all(self) -> list[int]:
+        with self._work_queue("numbers") as queue:
+            return sorted(future.result() for _item, future in queue.map(abs, range(-50, 50)))
+
+
+class BoundedWorkQueueTests(unittest.TestCase):
+    def test_admission_is_bounded_by_the_window(self) -> None:
+        pulled = 0
+
+        def items() -> Iterator[int]:
+            nonlocal pulled
+            for item in range(1_000):
+                pulled += 1
+                yield item
+
+        def worker(item: int) -> int:
+            return item * 2
+
+        results: list[int] = []
+        with BoundedWorkQueue(
+            max_workers=3,
+            conversion_running=lambda: True,
+        ) as queue:
+            for item, future in queue.map(worker, items()):
+                self.assertLessEqual(pulled - len(results), queue.window)
+                self.assertEqual(future.result(), item * 2)
+                results.append(item)
+            self.assertTrue(queue.finished)
+
+        self.assertEqual(sorted(results), list(range(1_000)))
+        stats = queue.stats()
+        self.assertEqual((stats.window, stats.submitted, stats.completed), (6, 1_000, 1_000))
+        self.assertLessEqual(stats.peak_depth, 6)
+
+    def test_stop_cancels_queued_items_instead_of_draining_them(self) -> None:
+        running = threading.Event()
+        running.set()
+        release = threading.Event()
+        started: list[int] = []
+        lock = threading.Lock()
+
+        def worker(item: int) -> int:
+            with lock:
+                started.append(item)
+            if item and not release.wait(timeout=10):
+                raise TimeoutError("worker release timed out")
+            return item
+
+        reported: list[int] = []
+        with BoundedWorkQueue(
+            max_workers=2,
+            conversion_running=running.is_set,
+            window=8,
+        ) as queue:
+            for _item, future in queue.map(worker, range(10_000)):
+                reported.append(future.result())
+                if len(reported) == 1:
+                    running.clear()
+                release.set()
+            self.assertTrue(queue.stopped)
+            self.assertFalse(queue.finished)
+
+        stats = queue.stats()
+        self.assertEqual(stats.submitted, 8)
+        self.assertEqual(stats.completed + stats.cancelled, stats.submitted)
+        self.assertLessEqual(len(started), 8)
+        self.assertEqual(sorted(reported), sorted(set(reported)))
+        self.assertEqual(len(reported), stats.completed)
+
+    def test_leaving_early_cancels_queued_items(self) -> None:
+        release = threading.Event()
+
+        def worker(item: int) -> int:
+            if item:
+                release.wait(timeout=10)
+            return item
+
+        with BoundedWorkQueue(
+            max_workers=1,
+            conversion_running=lambda: True,
+            window=4,
+        ) as queue:
+            for _item, _future in queue.map(worker, range(100)):
+                release.set()
+                break
+
+        stats = queue.stats()
+        self.assertEqual(stats.submitted, 4)
+        self.assertEqual(stats.completed, 1)
+        self.assertGreaterEqual(stats.cancelled, 1)
+
+    def test_follow_up_work_is_waited_for(self) -> None:
+        with BoundedWorkQueue(max_workers=2, conversion_running=lambda: True) as queue:
+            follow_ups = [
+                queue.submit(pow, future.result(), 2)
+                for _item, future in queue.map(abs, range(-3, 0))
+            ]
+
+        self.assertEqual(sorted(future.result() for future in follow_ups), [1, 4, 9])
+
+    def test_converter_records_queue_metrics_by_phase(self) -> None:
+        converter = _QueueConverter("gm", "godot", log_callback=lambda _message: None, max_workers=2)
+
+        self.assertEqual(converter.convert_all(), sorted(abs(item) for item in range(-50, 50)))
+        self.assertEqual(
+            converter.work_queue_stats(),
+            {
+                "numbers": WorkQueueStats(
+                    window=4,
+                    submitted=100,
+                    completed=100,
+                    cancelled=0,
+                    peak_depth=4,
+                )
+            },
+        )
+
+    def test_rejects_empty_pool_or_window(self) -> None:
+        with self.assertRaises(ValueError):
+            BoundedWorkQueue(max_workers=0, conversion_running=lambda: True)
+        with self.assertRaises(ValueError):
+            BoundedWorkQueue(max_workers=1, conversion_running=lambda: True, window=0)
+
+
+if __name__ == "__main__":
+    unittest.main()
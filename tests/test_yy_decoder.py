@@ -0,0 +1,160 @@
+from __future__ import annotations
+
+import json
+import os
+import re
+import time
+import unittest
+from collections.abc import Callable
+
+from src.conversion.yy_decoder import (
+    YYDecodeError,
+    decode_yy,
+    decode_yy_object_keys,
+    iter_yy_object_items,
+)
+
+
+def _regex_decode(source: str) -> object:
+    return json.loads(re.sub(r",\s*([}\]])", r"\1", source))
+
+
+def _large_room_source(width: int, height: int, instance_count: int) -> str:
+    instances = ",\n".join(
+        '{"$GMRInstance":"v2","%Name":"inst_' + str(index) + '","colour":4294967295,'
+        '"imageSpeed":1.0,"inheritedItemId":null,"name":"inst_' + str(index) + '",'
+        '"objectId":{"name":"obj_wall","path":"objects/obj_wall/obj_wall.yy",},'
+        '"properties":[],"rotation":0.0,"scaleX":1.0,"scaleY":1.0,'
+        '"x":' + str(index * 32) + '.0,"y":64.0,}'
+        for index in range(instance_count)
+    )
+    tile_values = (-2147483648, 5, 0, 12, -3, 7)
+    tiles = ",".join(
+        str(tile_values[index % len(tile_values)])
+        for index in range(width * height)
+    )
+    return (
+        '{\n  "$GMRoom":"v1",\n  "%Name":"rm_large",\n'
+        '  "creationCodeFile":"",\n  "isDnd":false,\n'
+        '  "layers":[\n'
+        '    {"$GMRInstanceLayer":"","depth":0,"instances":[\n' + instances + ',\n    ],'
+        '"name":"Instances","properties":[],},\n'
+        '    {"$GMRTileLayer":"","depth":100,"name":"Tiles","tiles":{'
+        f'"SerialiseHeight":{height},"SerialiseWidth":{width},'
+        '"TileCompressedData":[' + tiles + '],"TileDataFormat":1,},},\n'
+        '  ],\n'
+        '  "parentRoom":null,\n'
+        '  "roomSettings":{"Height":768,"inheritRoomSettings":false,"persistent":false,"Width":1366,},\n'
+        '  "views":[{"hview":768,"visible":false,"wview":1366,},],\n'
+        '}\n'
+    )
+
+
+class YYDecoderTests(unittest.TestCase):
+    def test_trailing_commas_are_accepted_in_objects_and_arrays(self) -> None:
+        source = '{\n  "name": "spr_a",\n  "frames": [{"name": "f0",}, {"name": "f1",},],\n  "empty": [ ],\n}\n'
+
+        self.assertEqual(
+            decode_yy(source),
+            {"name": "spr_a", "frames": [{"name": "f0"}, {"name": "f1"}], "empty": []},
+        )
+
+    def test_string_literals_containing_comma_brackets_are_preserved(self) -> None:
+        source = r'{"text": "a,]", "escaped": "q\",}", "path": "C:\\dir\\", "tail": [1,],}'
+
+        self.assertEqual(
+            decode_yy(source),
+            {"text": "a,]", "escaped": 'q",}', "path": "C:\\dir\\", "tail": [1]},
+        )
+
+    def test_plain_json_matches_standard_decoder(self) -> None:
+        source = json.dumps({"a": [1, 2.5, None, True], "b": {"c": "d, ]"}}, indent=2)
+
+        self.assertEqual(decode_yy(source), json.loads(source))
+
+    def test_errors_report_line_and_column_in_original_source(self) -> None:
+        source = '{\n  "a": [1,],\n  "b": {"c": 1,},\n  "d": tru,\n}'
+
+        with self.assertRaises(YYDecodeError) as raised:
+            decode_yy(source)
+
+        self.assertEqual((raised.exception.lineno, raised.exception.colno), (4, 8))
+        self.assertEqual(source[raised.exception.pos:raised.exception.pos + 3], "tru")
+        self.assertIsInstance(raised.exception, json.JSONDecodeError)
+
+    def test_streaming_yields_top_level_items_in_order(self) -> None:
+        source = '{"a": 1, "b": {"x": [1,2,],}, "c": "s,}",}'
+
+        self.assertEqual(
+            list(iter_yy_object_items(source)),
+            [("a", 1), ("b", {"x": [1, 2]}), ("c", "s,}")],
+        )
+        self.assertEqual(list(iter_yy_object_items(source, {"c"})), [("c", "s,}")])
+
+    def test_streaming_skips_unwanted_members_without_decoding_them(self) -> None:
+        source = '{"layers": [{"name": "x", "bad": tru, "s": "]}",}], "roomSettings": {"Width": 10,},}'
+
+        self.assertEqual(
+            decode_yy_object_keys(source, ("roomSettings",)),
+            {"roomSettings": {"Width": 10}},
+        )
+        with self.assertRaises(YYDecodeError):
+            decode_yy(source)
+
+    def test_streaming_stops_after_the_requested_keys(self) -> None:
+        source = '{"roomSettings": {"Width": 10}, "layers": [unterminated'
+
+        self.assertEqual(
+            decode_yy_object_keys(source, ("roomSettings",)),
+            {"roomSettings": {"Width": 10}},
+        )
+
+    def test_streaming_reports_unbalanced_containers(self) -> None:
+        with self.assertRaises(YYDecodeError):
+            list(iter_yy_object_items('{"layers": [{"a": 1]}'))
+        with self.assertRaises(YYDecodeError):
+            list(iter_yy_object_items('["not", "an", "object"]'))
+
+
+class YYDecoderLargeRoomTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self.source = _large_room_source(width=600, height=600, instance_count=3000)
+
+    def test_large_room_decode_and_stream_match_regex_path(self) -> None:
+        regex_value = _regex_decode(self.source)
+
+        self.assertEqual(decode_yy(self.source), regex_value)
+        assert isinstance(regex_value, dict)
+        self.assertEqual(
+            decode_yy_object_keys(self.source, ("roomSettings", "views")),
+            {"roomSettings": regex_value["roomSettings"], "views": regex_value["views"]},
+        )
+
+    @unittest.skipUnless(
+        os.environ.get("GM2GODOT_REPORT_PERF") == "1",
+        "GM2GODOT_REPORT_PERF is not set",
+    )
+    def test_report_large_room_decode_timings(self) -> None:
+        def best_of(function: Callable[[], object], rounds: int = 3) -> float:
+            best = float("inf")
+            for _ in range(rounds):
+                started = time.perf_counter()
+                function()
+                best = min(best, time.perf_counter() - started)
+            return best
+
+        regex_seconds = best_of(lambda: _regex_decode(self.source))
+        decode_seconds = best_of(lambda: decode_yy(self.source))
+        settings_seconds = best_of(
+            lambda: decode_yy_object_keys(self.source, ("roomSettings", "views")),
+        )
+        print(
+            f"{len(self.source) / 1_000_000:.1f} MB room .yy: "
+            f"regex path {regex_seconds * 1000:.1f} ms; "
+            f"decode_yy {decode_seconds * 1000:.1f} ms; "
+            f"roomSettings stream {settings_seconds * 1000:.1f} ms"
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
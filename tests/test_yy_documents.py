@@ -0,0 +1,138 @@
+from __future__ import annotations
+
+import copy
+import os
+from pathlib import Path
+import pickle
+import tempfile
+import unittest
+
+from src.conversion.conversion_scope import ConversionScope, active_conversion_scope, using_conversion_scope
+from src.conversion.yy_documents import (
+    ReadOnlyJsonDict,
+    ReadOnlyJsonList,
+    YYDocumentError,
+    YYDocumentStore,
+    freeze_json,
+    load_yy_json,
+    read_yy_json,
+)
+
+
+class YYDocumentStoreTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self._temp_dir = tempfile.TemporaryDirectory()
+        self.root = Path(self._temp_dir.name)
+
+    def tearDown(self) -> None:
+        self._temp_dir.cleanup()
+
+    def _write(self, name: str, content: str) -> Path:
+        path = self.root / name
+        path.write_text(content, encoding="utf-8")
+        return path
+
+    def _touch_later(self, path: Path) -> None:
+        stat_result = path.stat()
+        os.utime(path, ns=(stat_result.st_atime_ns, stat_result.st_mtime_ns + 1_000_000_000))
+
+    def test_repeated_reads_parse_once_and_share_the_document(self) -> None:
+        path = self._write("spr_a.yy", '{"name": "spr_a", "frames": [{"name": "f0",},],}')
+        store = YYDocumentStore()
+
+        first = store.read(path)
+        second = store.read(str(path))
+
+        self.assertIs(first, second)
+        self.assertEqual(first, {"name": "spr_a", "frames": [{"name": "f0"}]})
+        stats = store.stats()
+        self.assertEqual((stats.hits, stats.misses, stats.entries), (1, 1, 1))
+
+    def test_changed_fingerprint_reloads_document(self) -> None:
+        path = self._write("obj_a.yy", '{"name": "obj_a"}')
+        store = YYDocumentStore()
+        self.assertEqual(store.read(path), {"name": "obj_a"})
+
+        path.write_text('{"name": "obj_b"}', encoding="utf-8")
+        self._touch_later(path)
+
+        self.assertEqual(store.read(path), {"name": "obj_b"})
+        self.assertEqual(store.stats().misses, 2)
+
+    def test_documents_are_read_only_and_copy_to_mutable_values(self) -> None:
+        path = self._write("rm_a.yy", '{"layers": [{"name": "Instances"}]}')
+        data = YYDocumentStore().read(path)
+        assert data is not None
+
+        self.assertIsInstance(data, ReadOnlyJsonDict)
+        self.assertIsInstance(data["layers"], ReadOnlyJsonList)
+        with self.assertRaises(TypeError):
+            data["name"] = "changed"
+        with self.assertRaises(TypeError):
+            data["layers"].append({})
+        with self.assertRaises(TypeError):
+            data["layers"][0].setdefault("depth", 0)
+
+        mutable = copy.deepcopy(data)
+        mutable["layers"][0]["depth"] = 100
+        self.assertEqual(type(mutable), dict)
+        self.assertEqual(type(mutable["layers"]), list)
+        self.assertEqual(pickle.loads(pickle.dumps(data)), data)
+
+    def test_freeze_converts_nested_containers_and_keeps_frozen_views(self) -> None:
+        frozen = freeze_json(
+            {"tiles": [1, 2, 3], "layers": [{"name": "a", "grid": [[0, 1]]}], "depth": 0}
+        )
+
+        assert isinstance(frozen, ReadOnlyJsonDict)
+        self.assertIsInstance(frozen["tiles"], ReadOnlyJsonList)
+        self.assertIsInstance(frozen["layers"][0], ReadOnlyJsonDict)
+        self.assertIsInstance(frozen["layers"][0]["grid"][0], ReadOnlyJsonList)
+        self.assertEqual(frozen["tiles"], [1, 2, 3])
+        self.assertIs(freeze_json(frozen), frozen)
+
+    def test_byte_budget_evicts_least_recently_used_documents(self) -> None:
+        first = self._write("a.yy", '{"name": "a"}')
+        second = self._write("b.yy", '{"name": "b"}')
+        third = self._write("c.yy", '{"name": "c"}')
+        store = YYDocumentStore(budget_bytes=first.stat().st_size * 2)
+
+        store.read(first)
+        store.read(second)
+        store.read(first)
+        store.read(third)
+
+        stats = store.stats()
+        self.assertEqual((stats.entries, stats.evictions), (2, 1))
+        store.read(first)
+        self.assertEqual(store.stats().hits, 2)
+
+    def test_malformed_and_missing_documents(self) -> None:
+        malformed = self._write("bad.yy", '{"name": ')
+        array = self._write("array.yy", "[1, 2,]")
+        store = YYDocumentStore()
+
+        self.assertIsNone(store.read(malformed))
+        self.assertIsNone(store.read(array))
+        self.assertIsNone(store.read(self.root / "missing.yy"))
+        with using_conversion_scope(ConversionScope(yy_documents=store)):
+            with self.assertRaises(YYDocumentError):
+                load_yy_json(malformed)
+            with self.assertRaises(YYDocumentError):
+                load_yy_json(self.root / "missing.yy")
+
+    def test_module_readers_use_the_active_store_only_inside_the_block(self) -> None:
+        path = self._write("snd_a.yy", '{"name": "snd_a",}')
+        store = YYDocumentStore()
+
+        with using_conversion_scope(ConversionScope(yy_documents=store)):
+            self.assertIs(active_conversion_scope().yy_documents, store)
+            self.assertIs(read_yy_json(path), read_yy_json(path))
+
+        self.assertIsNone(active_conversion_scope().yy_documents)
+        self.assertEqual(read_yy_json(path), {"name": "snd_a"})
+        self.assertEqual(store.stats().misses, 1)
+
+
+if __name__ == "__main__":
+    unittest.main()